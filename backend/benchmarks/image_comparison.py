@@ -0,0 +1,75 @@
+"""
+Latency and memory of the image comparison per megapixel of the source images.
+
+Run from the backend directory::
+
+    python -m benchmarks.image_comparison
+
+Every row compares a JPEG with a slightly changed copy of it. ``full`` lifts the working size above the size of the
+images, that's how images were compared before the working resolution was bounded. Memory is the peak of
+allocations traced by ``tracemalloc``, numpy and OpenCV arrays are included.
+"""
+
+import statistics
+import time
+import tracemalloc
+from typing import Final
+
+import cv2
+import numpy as np
+
+from pix_erase.infrastructure.adapters.image_converters.cv2_image_comparer_converter import Cv2ImageComparerConverter
+from pix_erase.setup.config.image_comparison import ImageComparisonConfig
+
+MEGAPIXELS: Final[tuple[int, ...]] = (1, 4, 12, 24)
+REPEATS: Final[int] = 5
+FULL_RESOLUTION_SIDE: Final[int] = 100_000
+
+
+def _image(megapixels: int) -> tuple[bytes, bytes]:
+    height: int = int((megapixels * 1_000_000 * 3 / 4) ** 0.5)
+    width: int = height * 4 // 3
+    rng: np.random.Generator = np.random.default_rng(42)
+    img: np.ndarray = cv2.resize(rng.integers(0, 256, (48, 64, 3), dtype=np.uint8), (width, height))
+    changed: np.ndarray = cv2.GaussianBlur(img, (5, 5), 2)
+    return cv2.imencode(".jpg", img)[1].tobytes(), cv2.imencode(".jpg", changed)[1].tobytes()
+
+
+def _measure(converter: Cv2ImageComparerConverter, first: bytes, second: bytes) -> tuple[float, float]:
+    timings: list[float] = []
+
+    for _ in range(REPEATS):
+        started: float = time.perf_counter()
+        converter.compare_by_histograms(first, second)
+        timings.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    converter.compare_by_histograms(first, second)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return statistics.median(timings) * 1000, peak / 2**20
+
+
+def main() -> None:
+    modes: dict[str, ImageComparisonConfig] = {
+        "full": ImageComparisonConfig.model_validate({"IMAGE_COMPARISON_MAX_SIDE": FULL_RESOLUTION_SIDE}),
+        "bounded": ImageComparisonConfig.model_validate({}),
+        "bounded+ms-ssim": ImageComparisonConfig.model_validate({"IMAGE_COMPARISON_MULTISCALE_SSIM": True}),
+    }
+
+    print(f"{'MP':>4} {'mode':>16} {'ms':>9} {'ms/MP':>8} {'peak MiB':>9} {'MiB/MP':>8}")  # noqa: T201
+
+    for megapixels in MEGAPIXELS:
+        first, second = _image(megapixels)
+
+        for name, config in modes.items():
+            latency, peak = _measure(Cv2ImageComparerConverter(config), first, second)
+            print(  # noqa: T201
+                f"{megapixels:>4} {name:>16} {latency:>9.1f} {latency / megapixels:>8.2f}"
+                f" {peak:>9.1f} {peak / megapixels:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
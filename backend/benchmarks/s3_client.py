@@ -0,0 +1,101 @@
+"""
+Latency S3 adds to a request of an image endpoint, with a client per request and with the shared client.
+
+Run from the backend directory::
+
+    python -m benchmarks.s3_client
+
+Every request reads metadata of an image with ``HEAD``, that's what checking an image costs before it's processed.
+``per-request`` builds a client for every request like the request scoped provider did, ``shared`` reuses the
+application scoped client and its pool of connections. S3 is a local stub answering at once, so the numbers are
+the cost of the client itself: endpoint resolution, a new connection pool and a TCP handshake for every request.
+"""
+
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from typing import Final
+
+from aioboto3 import Session
+from aiobotocore.client import AioBaseClient
+from aiohttp import web
+
+from pix_erase.infrastructure.persistence.provider import get_s3_client, get_s3_session
+from pix_erase.setup.config.s3 import S3Config
+
+HOST: Final[str] = "127.0.0.1"
+BUCKET: Final[str] = "images"
+REQUESTS: Final[int] = 200
+CONCURRENCY: Final[int] = 20
+
+
+async def _head(_: web.Request) -> web.Response:
+    return web.Response(headers={"ETag": '"abc"', "Content-Length": "1024", "Content-Type": "image/png"})
+
+
+async def _stub() -> web.AppRunner:
+    app: web.Application = web.Application()
+    app.router.add_route("HEAD", "/{tail:.*}", _head)
+    runner: web.AppRunner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, HOST, 0).start()
+    return runner
+
+
+async def _measure(request: Callable[[int], Awaitable[None]]) -> tuple[float, float]:
+    timings: list[float] = []
+
+    for number in range(REQUESTS):
+        started: float = time.perf_counter()
+        await request(number)
+        timings.append(time.perf_counter() - started)
+
+    semaphore: asyncio.Semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def limited(number: int) -> None:
+        async with semaphore:
+            await request(number)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(limited(number) for number in range(REQUESTS)))
+    elapsed: float = time.perf_counter() - started
+
+    return statistics.median(timings) * 1000, REQUESTS / elapsed
+
+
+async def main() -> None:
+    runner: web.AppRunner = await _stub()
+    port: int = runner.addresses[0][1]
+    s3_config: S3Config = S3Config.model_validate(
+        {
+            "MINIO_HOST": HOST,
+            "MINIO_PORT": port,
+            "MINIO_ROOT_USER": "benchmark",
+            "MINIO_ROOT_PASSWORD": "benchmark",
+            "MINIO_IMAGES_BUCKET": BUCKET,
+        },
+    )
+
+    async for session in get_s3_session(s3_config):
+
+        async def per_request(number: int, session: Session = session) -> None:
+            async with session.client("s3", endpoint_url=s3_config.uri, use_ssl=False) as client:
+                await client.head_object(Bucket=BUCKET, Key=f"images/{number}")
+
+        async for shared_client in get_s3_client(session, s3_config):
+
+            async def shared(number: int, client: AioBaseClient = shared_client) -> None:
+                await client.head_object(Bucket=BUCKET, Key=f"images/{number}")
+
+            print(f"{'client':>12} {'median ms':>10} {'req/s x' + str(CONCURRENCY):>12}")  # noqa: T201
+
+            for name, request in (("per-request", per_request), ("shared", shared)):
+                latency, throughput = await _measure(request)
+                print(f"{name:>12} {latency:>10.2f} {throughput:>12.0f}")  # noqa: T201
+
+    await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
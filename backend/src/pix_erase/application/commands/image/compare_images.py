@@ -5,17 +5,22 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Final, cast, final
 from uuid import UUID
 
+from pix_erase.application.common.ports.image.catalog_gateway import ImageCatalogGateway
+from pix_erase.application.common.ports.image.comparison_gateway import ImageComparisonGateway
 from pix_erase.application.common.ports.image.storage import ImageStorage
 from pix_erase.application.common.ports.scheduler.payloads.images import CompareImagesPayload
 from pix_erase.application.common.ports.scheduler.task_id import TaskID, TaskKey
 from pix_erase.application.common.ports.scheduler.task_scheduler import TaskScheduler
 from pix_erase.application.common.services.current_user import CurrentUserService
+from pix_erase.application.common.views.image.compare_image import CompareImagesResultView, CompareImageView
 from pix_erase.application.errors.image import ImageDoesntBelongToThisUserError, ImageNotFoundError
+from pix_erase.domain.image.values.comparison_id import ComparisonID, comparison_id_for
 
 if TYPE_CHECKING:
     from collections.abc import Coroutine
 
-    from pix_erase.domain.image.entities.image import Image
+    from pix_erase.application.common.query_models.image import ImageMetadataQueryModel
+    from pix_erase.domain.image.entities.image_comparison import ImageComparison
     from pix_erase.domain.image.values.image_id import ImageID
     from pix_erase.domain.user.entities.user import User
 
@@ -33,20 +38,25 @@ class CompareImageCommandHandler:
     """
     - Opens to everyone.
     - Async processing, non-blocking.
-    - Returns TaskID for tracking comparison progress.
+    - Returns the stored comparison when neither image changed since it was made.
+    - Otherwise returns TaskID for tracking comparison progress.
     """
 
     def __init__(
         self,
         current_user_service: CurrentUserService,
+        image_catalog_gateway: ImageCatalogGateway,
         image_storage: ImageStorage,
+        comparison_gateway: ImageComparisonGateway,
         scheduler: TaskScheduler,
     ) -> None:
         self._current_user_service: Final[CurrentUserService] = current_user_service
+        self._image_catalog_gateway: Final[ImageCatalogGateway] = image_catalog_gateway
         self._image_storage: Final[ImageStorage] = image_storage
+        self._comparison_gateway: Final[ImageComparisonGateway] = comparison_gateway
         self._task_scheduler: Final[TaskScheduler] = scheduler
 
-    async def __call__(self, data: CompareImageCommand) -> TaskID:
+    async def __call__(self, data: CompareImageCommand) -> CompareImagesResultView:
         logger.info(
             "Started comparing images. First image id: %s, second image id: %s",
             data.first_image,
@@ -60,31 +70,49 @@ class CompareImageCommandHandler:
         typed_first_image_id: ImageID = cast("ImageID", data.first_image)
         typed_second_image_id: ImageID = cast("ImageID", data.second_image)
 
-        if typed_first_image_id not in current_user.images:
+        if not await self._image_catalog_gateway.is_owned_by(image_id=typed_first_image_id, owner_id=current_user.id):
             msg = f"Image with id: {data.first_image} doesn't belong to this user."
             raise ImageDoesntBelongToThisUserError(msg)
 
-        if typed_second_image_id not in current_user.images:
+        if not await self._image_catalog_gateway.is_owned_by(image_id=typed_second_image_id, owner_id=current_user.id):
             msg = f"Image with id: {data.second_image} doesn't belong to this user."
             raise ImageDoesntBelongToThisUserError(msg)
 
-        first_image: Image | None = await self._image_storage.read_by_id(image_id=typed_first_image_id)
+        first_image: ImageMetadataQueryModel | None = await self._image_storage.read_metadata_by_id(
+            image_id=typed_first_image_id,
+        )
 
         if first_image is None:
             msg = f"Failed to found image with id: {data.first_image}"
             raise ImageNotFoundError(msg)
 
-        second_image: Image | None = await self._image_storage.read_by_id(image_id=typed_second_image_id)
+        second_image: ImageMetadataQueryModel | None = await self._image_storage.read_metadata_by_id(
+            image_id=typed_second_image_id,
+        )
 
         if second_image is None:
             msg = f"Failed to found image with id: {data.second_image}"
             raise ImageNotFoundError(msg)
 
-        # Create task ID from concatenated image IDs
-        task_id_value = f"{typed_first_image_id}_{typed_second_image_id}"
+        comparison_id: ComparisonID = comparison_id_for(typed_first_image_id, typed_second_image_id)
+        comparison: ImageComparison | None = await self._comparison_gateway.read_by_id(comparison_id)
+
+        if comparison is not None and comparison.is_up_to_date(first_image.updated_at, second_image.updated_at):
+            logger.info("Images weren't changed since comparison %s, returning it", comparison.id)
+
+            return CompareImagesResultView(
+                comparison=CompareImageView(
+                    scores=comparison.scores,
+                    different_names=comparison.different_names,
+                    different_width=comparison.different_width,
+                    different_height=comparison.different_height,
+                ),
+            )
+
+        # the same pair gets the same task in any order of images
         task_id: TaskID = self._task_scheduler.make_task_id(
             key=TaskKey("compare_images"),
-            value=task_id_value,
+            value=comparison_id,
         )
 
         background_tasks: set[Task] = set()
@@ -109,4 +137,4 @@ class CompareImageCommandHandler:
             task_id,
         )
 
-        return task_id
+        return CompareImagesResultView(task_id=task_id)
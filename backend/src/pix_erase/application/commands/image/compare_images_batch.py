@@ -0,0 +1,119 @@
+import asyncio
+import hashlib
+import logging
+from asyncio import Task
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Final, cast, final
+from uuid import UUID
+
+from pix_erase.application.common.ports.image.catalog_gateway import ImageCatalogGateway
+from pix_erase.application.common.ports.scheduler.payloads.images import CompareImagesBatchPayload
+from pix_erase.application.common.ports.scheduler.task_id import TaskID, TaskKey
+from pix_erase.application.common.ports.scheduler.task_scheduler import TaskScheduler
+from pix_erase.application.common.services.current_user import CurrentUserService
+from pix_erase.application.errors.image import BadImageComparisonBatchError, ImageDoesntBelongToThisUserError
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+    from pix_erase.domain.image.values.image_id import ImageID
+    from pix_erase.domain.user.entities.user import User
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+MIN_ALL_PAIRS_IMAGES: Final[int] = 2
+MAX_CANDIDATES: Final[int] = 1000
+MAX_ALL_PAIRS_IMAGES: Final[int] = 200
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CompareImagesBatchCommand:
+    """Compares the reference image with every image of the batch or, without it, every pair of the batch."""
+
+    image_ids: Sequence[UUID]
+    reference_image: UUID | None = None
+
+
+@final
+class CompareImagesBatchCommandHandler:
+    """
+    - Opens to everyone.
+    - Async processing, non-blocking.
+    - Returns TaskID for tracking comparison progress, the same batch gets the same TaskID.
+    """
+
+    def __init__(
+        self,
+        current_user_service: CurrentUserService,
+        image_catalog_gateway: ImageCatalogGateway,
+        scheduler: TaskScheduler,
+    ) -> None:
+        self._current_user_service: Final[CurrentUserService] = current_user_service
+        self._image_catalog_gateway: Final[ImageCatalogGateway] = image_catalog_gateway
+        self._task_scheduler: Final[TaskScheduler] = scheduler
+
+    async def __call__(self, data: CompareImagesBatchCommand) -> TaskID:
+        logger.info(
+            "Started batch comparison of %s images, reference image id: %s",
+            len(data.image_ids),
+            data.reference_image,
+        )
+
+        logger.info("Getting current user id")
+        current_user: User = await self._current_user_service.get_current_user()
+        logger.info("Successfully got current user id: %s", current_user.id)
+
+        reference_image_id: ImageID | None = cast("ImageID | None", data.reference_image)
+        image_ids: list[ImageID] = [
+            image_id
+            for image_id in dict.fromkeys(cast("Sequence[ImageID]", data.image_ids))
+            if image_id != reference_image_id
+        ]
+
+        self._validate_batch_size(image_ids, reference_image_id)
+
+        requested: list[ImageID] = [*image_ids, *([] if reference_image_id is None else [reference_image_id])]
+        owned: set[ImageID] = await self._image_catalog_gateway.read_owned_ids(current_user.id, requested)
+
+        for image_id in requested:
+            if image_id not in owned:
+                msg = f"Image with id: {image_id} doesn't belong to this user."
+                raise ImageDoesntBelongToThisUserError(msg)
+
+        task_id: TaskID = self._task_scheduler.make_task_id(
+            key=TaskKey("compare_images_batch"),
+            value=self._batch_digest(image_ids, reference_image_id),
+        )
+
+        background_tasks: set[Task] = set()
+
+        coroutine: Coroutine[Any, Any, None] = self._task_scheduler.schedule(
+            task_id=task_id,
+            payload=CompareImagesBatchPayload(image_ids=image_ids, reference_image_id=reference_image_id),
+        )
+
+        task: Task = asyncio.create_task(coroutine)
+        background_tasks.add(task)
+        task.add_done_callback(background_tasks.discard)
+
+        logger.info("Successfully sent %s images for batch comparison, task_id: %s", len(image_ids), task_id)
+
+        return task_id
+
+    @staticmethod
+    def _validate_batch_size(image_ids: Sequence["ImageID"], reference_image_id: "ImageID | None") -> None:
+        if reference_image_id is None:
+            if not MIN_ALL_PAIRS_IMAGES <= len(image_ids) <= MAX_ALL_PAIRS_IMAGES:
+                msg = f"All pairs comparison needs {MIN_ALL_PAIRS_IMAGES}..{MAX_ALL_PAIRS_IMAGES} different images."
+                raise BadImageComparisonBatchError(msg)
+            return
+
+        if not 1 <= len(image_ids) <= MAX_CANDIDATES:
+            msg = f"Comparison with the reference image needs 1..{MAX_CANDIDATES} other images."
+            raise BadImageComparisonBatchError(msg)
+
+    @staticmethod
+    def _batch_digest(image_ids: Sequence["ImageID"], reference_image_id: "ImageID | None") -> str:
+        members: list[str] = sorted(str(image_id) for image_id in image_ids)
+        return hashlib.sha256(f"{reference_image_id}|{','.join(members)}".encode()).hexdigest()
@@ -0,0 +1,107 @@
+import asyncio
+import logging
+from asyncio import Task
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Final, cast, final
+from uuid import UUID
+
+from pix_erase.application.common.ports.image.catalog_gateway import ImageCatalogGateway
+from pix_erase.application.common.ports.image.storage import ImageStorage
+from pix_erase.application.common.ports.scheduler.payloads.images import StoreUploadedImagePayload
+from pix_erase.application.common.ports.scheduler.task_id import TaskID, TaskKey
+from pix_erase.application.common.ports.scheduler.task_scheduler import TaskScheduler
+from pix_erase.application.common.ports.transaction_manager import TransactionManager
+from pix_erase.application.common.services.current_user import CurrentUserService
+from pix_erase.application.errors.image import ImageDoesntBelongToThisUserError, ImageNotFoundError
+from pix_erase.domain.image.values.image_name import ImageName
+from pix_erase.domain.user.services.user_service import UserService
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+    from pix_erase.domain.image.values.image_id import ImageID
+    from pix_erase.domain.user.entities.user import User
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CompleteImageUploadCommand:
+    image_id: UUID
+    filename: str
+
+
+@final
+class CompleteImageUploadCommandHandler:
+    """
+    - Opens to everyone
+    - Called by the client after it has uploaded an image with a link from the upload request
+    - The image is checked and its size is read in background, the API doesn't touch its bytes
+    - The id of the upload works as its key: it's random and known only to the client that requested it
+    """
+
+    def __init__(
+        self,
+        current_user_service: CurrentUserService,
+        image_storage: ImageStorage,
+        user_service: UserService,
+        scheduler: TaskScheduler,
+        transaction_manager: TransactionManager,
+        image_catalog_gateway: ImageCatalogGateway,
+    ) -> None:
+        self._current_user_service: Final[CurrentUserService] = current_user_service
+        self._image_storage: Final[ImageStorage] = image_storage
+        self._user_service: Final[UserService] = user_service
+        self._task_scheduler: Final[TaskScheduler] = scheduler
+        self._transaction_manager: Final[TransactionManager] = transaction_manager
+        self._image_catalog_gateway: Final[ImageCatalogGateway] = image_catalog_gateway
+
+    async def __call__(self, data: CompleteImageUploadCommand) -> TaskID:
+        logger.info("Started completing upload of image with id: %s", data.image_id)
+
+        image_name: ImageName = ImageName(data.filename)
+        typed_image_id: ImageID = cast("ImageID", data.image_id)
+
+        logger.info("Getting current user")
+        current_user: User = await self._current_user_service.get_current_user()
+        logger.info("Current user is: %s", current_user.id)
+
+        upload_size: int | None = await self._image_storage.read_upload_size(typed_image_id)
+
+        if upload_size is None:
+            msg = f"Nothing was uploaded for image with id: {data.image_id}"
+            raise ImageNotFoundError(msg)
+
+        logger.info("Found upload of image with id: %s, %s bytes", data.image_id, upload_size)
+
+        if not await self._image_catalog_gateway.is_owned_by(image_id=typed_image_id, owner_id=current_user.id):
+            # properties of the image are written when it's stored, an id taken by another user isn't added
+            await self._image_catalog_gateway.add(image_id=typed_image_id, owner_id=current_user.id)
+            await self._transaction_manager.flush()
+
+            if not await self._image_catalog_gateway.is_owned_by(image_id=typed_image_id, owner_id=current_user.id):
+                msg = f"Image with id: {data.image_id} doesn't belong to this user."
+                raise ImageDoesntBelongToThisUserError(msg)
+
+            self._user_service.add_image(user=current_user, image_id=typed_image_id)
+            await self._transaction_manager.commit()
+
+        task_id: TaskID = self._task_scheduler.make_task_id(
+            key=TaskKey("store_uploaded_image"),
+            value=typed_image_id,
+        )
+
+        background_tasks: set[Task] = set()
+
+        coroutine: Coroutine[Any, Any, None] = self._task_scheduler.schedule(
+            task_id=task_id,
+            payload=StoreUploadedImagePayload(image_id=typed_image_id, filename=image_name.value),
+        )
+
+        task: Task = asyncio.create_task(coroutine)
+        background_tasks.add(task)
+        task.add_done_callback(background_tasks.discard)
+
+        logger.info("Successfully send uploaded image for storing, image_id: %s, task_id: %s", data.image_id, task_id)
+
+        return task_id
@@ -1,20 +1,30 @@
+import asyncio
 import logging
+from asyncio import Task
+from collections.abc import AsyncIterable
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Final, final
+from typing import TYPE_CHECKING, Any, Final, final
 
-from pix_erase.application.common.ports.image.extractor import ImageInfo, ImageInfoExtractor
+from pix_erase.application.common.ports.image.catalog_gateway import ImageCatalogGateway
 from pix_erase.application.common.ports.image.storage import ImageStorage
+from pix_erase.application.common.ports.scheduler.payloads.images import (
+    GenerateImageRenditionsPayload,
+    IndexImagePayload,
+)
+from pix_erase.application.common.ports.scheduler.task_id import TaskID, TaskKey
+from pix_erase.application.common.ports.scheduler.task_scheduler import TaskScheduler
 from pix_erase.application.common.ports.transaction_manager import TransactionManager
-from pix_erase.application.common.ports.user.command_gateway import UserCommandGateway
 from pix_erase.application.common.services.current_user import CurrentUserService
 from pix_erase.application.common.views.image.create_image import CreateImageView
 from pix_erase.domain.image.services.image_service import ImageService
 from pix_erase.domain.image.values.image_name import ImageName
-from pix_erase.domain.image.values.image_size import ImageSize
 from pix_erase.domain.user.services.user_service import UserService
 
 if TYPE_CHECKING:
-    from pix_erase.domain.image.entities.image import Image
+    from collections.abc import Coroutine
+
+    from pix_erase.application.common.query_models.image import ImageMetadataQueryModel
+    from pix_erase.domain.image.values.image_id import ImageID
     from pix_erase.domain.user.entities.user import User
 
 logger: Final[logging.Logger] = logging.getLogger(__name__)
@@ -22,7 +32,7 @@ logger: Final[logging.Logger] = logging.getLogger(__name__)
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class CreateImageCommand:
-    data: bytes
+    stream: AsyncIterable[bytes]
     filename: str
 
 
@@ -32,25 +42,27 @@ class CreateImageCommandHandler:
     - Opens to everyone
     - Creates image in system for future processing
     - In first step we must save image and use index for here to processing
+    - The file is streamed into the storage, it's never held in memory as a whole
+    - Previews of the image are generated and the image is indexed for reverse search in background
     """
 
     def __init__(
         self,
         current_user_service: CurrentUserService,
         image_storage: ImageStorage,
-        image_extractor: ImageInfoExtractor,
         image_service: ImageService,
         user_service: UserService,
         transaction_manager: TransactionManager,
-        user_command_gateway: UserCommandGateway,
+        image_catalog_gateway: ImageCatalogGateway,
+        scheduler: TaskScheduler,
     ) -> None:
         self._current_user_service: Final[CurrentUserService] = current_user_service
         self._image_storage: Final[ImageStorage] = image_storage
-        self._image_extractor: Final[ImageInfoExtractor] = image_extractor
         self._image_service: Final[ImageService] = image_service
         self._user_service: Final[UserService] = user_service
         self._transaction_manager: Final[TransactionManager] = transaction_manager
-        self._user_command_gateway: Final[UserCommandGateway] = user_command_gateway
+        self._image_catalog_gateway: Final[ImageCatalogGateway] = image_catalog_gateway
+        self._task_scheduler: Final[TaskScheduler] = scheduler
 
     async def __call__(self, data: CreateImageCommand) -> CreateImageView:
         logger.info("Started creating new image in system with filename: %s", data.filename)
@@ -59,33 +71,45 @@ class CreateImageCommandHandler:
         current_user: User = await self._current_user_service.get_current_user()
         logger.info("Current user is: %s", current_user.id)
 
-        logger.info("Started getting metadata from image with name: %s", data.filename)
-        metadata_from_image: ImageInfo = await self._image_extractor.extract(data=data.data)
-        logger.info("Successfully got metadata from image with name: %s", data.filename)
+        image_name: ImageName = ImageName(data.filename)
+        image_id: ImageID = self._image_service.next_image_id()
+        logger.info("Got index for new image: %s with name: %s", image_id, image_name)
 
-        logger.info("Creating a new image entity with name: %s", data.filename)
-        new_image: Image = self._image_service.create(
-            image_name=ImageName(data.filename),
-            image_height=ImageSize(metadata_from_image.height),
-            image_width=ImageSize(metadata_from_image.width),
-            data=data.data,
-        )
-        logger.info("Got index for new image entity: %s with name: %s", new_image.id, new_image.name)
+        logger.info("Started streaming image with id: %s to storage", image_id)
+        await self._image_storage.add_stream(image_id=image_id, name=image_name, stream=data.stream)
+        logger.info("Successfully added into storage new image with id: %s", image_id)
 
-        logger.info("Started adding image with id: %s to storage", new_image.id)
-        await self._image_storage.add(image=new_image)
-        logger.info("Successfully added into storage new image entity with id: %s", new_image.id)
+        metadata: ImageMetadataQueryModel | None = await self._image_storage.read_metadata_by_id(image_id)
 
-        self._user_service.add_image(user=current_user, image=new_image)
+        self._user_service.add_image(user=current_user, image_id=image_id)
+        await self._image_catalog_gateway.add(image_id=image_id, owner_id=current_user.id, metadata=metadata)
 
-        logger.info("Added image to user: %s, images from this user: %s", current_user.id, current_user.images)
+        logger.info("Added image: %s to catalogue of user: %s", image_id, current_user.id)
 
-        await self._user_command_gateway.update(user=current_user)
         await self._transaction_manager.flush()
         await self._transaction_manager.commit()
 
-        view: CreateImageView = CreateImageView(image_id=new_image.id)
+        self._schedule(TaskKey("generate_image_renditions"), GenerateImageRenditionsPayload(image_id=image_id))
+        self._schedule(TaskKey("index_image"), IndexImagePayload(image_id=image_id))
+
+        view: CreateImageView = CreateImageView(image_id=image_id)
 
-        logger.info("Finished adding image with id: %s", new_image.id)
+        logger.info("Finished adding image with id: %s", image_id)
 
         return view
+
+    def _schedule(self, key: TaskKey, payload: GenerateImageRenditionsPayload | IndexImagePayload) -> None:
+        task_id: TaskID = self._task_scheduler.make_task_id(key=key, value=payload.image_id)
+
+        background_tasks: set[Task] = set()
+
+        coroutine: Coroutine[Any, Any, None] = self._task_scheduler.schedule(
+            task_id=task_id,
+            payload=payload,
+        )
+
+        task: Task = asyncio.create_task(coroutine)
+        background_tasks.add(task)
+        task.add_done_callback(background_tasks.discard)
+
+        logger.info("Scheduled %s of image with id: %s, task_id: %s", key, payload.image_id, task_id)
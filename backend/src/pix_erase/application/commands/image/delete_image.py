@@ -3,14 +3,15 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Final, cast, final
 from uuid import UUID
 
+from pix_erase.application.common.ports.image.catalog_gateway import ImageCatalogGateway
+from pix_erase.application.common.ports.image.perceptual_hash_gateway import ImagePerceptualHashGateway
 from pix_erase.application.common.ports.image.storage import ImageStorage
 from pix_erase.application.common.ports.transaction_manager import TransactionManager
-from pix_erase.application.common.ports.user.command_gateway import UserCommandGateway
 from pix_erase.application.common.services.current_user import CurrentUserService
 from pix_erase.application.errors.image import ImageDoesntBelongToThisUserError, ImageNotFoundError
 
 if TYPE_CHECKING:
-    from pix_erase.domain.image.entities.image import Image
+    from pix_erase.application.common.query_models.image import ImageMetadataQueryModel
     from pix_erase.domain.image.values.image_id import ImageID
     from pix_erase.domain.user.entities.user import User
 
@@ -28,13 +29,15 @@ class DeleteImageCommandHandler:
         self,
         current_user_service: CurrentUserService,
         image_storage: ImageStorage,
-        user_command_gateway: UserCommandGateway,
+        image_catalog_gateway: ImageCatalogGateway,
         transaction_manager: TransactionManager,
+        perceptual_hash_gateway: ImagePerceptualHashGateway,
     ) -> None:
         self._current_user_service: Final[CurrentUserService] = current_user_service
         self._image_storage: Final[ImageStorage] = image_storage
-        self._user_command_gateway: Final[UserCommandGateway] = user_command_gateway
+        self._image_catalog_gateway: Final[ImageCatalogGateway] = image_catalog_gateway
         self._transaction_manager: Final[TransactionManager] = transaction_manager
+        self._perceptual_hash_gateway: Final[ImagePerceptualHashGateway] = perceptual_hash_gateway
 
     async def __call__(self, data: DeleteImageCommand) -> None:
         logger.info(
@@ -49,24 +52,24 @@ class DeleteImageCommandHandler:
         typed_image_id: ImageID = cast("ImageID", data.image_id)
 
         logger.info("Started searching for image with id: %s", typed_image_id)
-        image: Image | None = await self._image_storage.read_by_id(typed_image_id)
+        metadata: ImageMetadataQueryModel | None = await self._image_storage.read_metadata_by_id(typed_image_id)
 
-        if image is None:
+        if metadata is None:
             msg = f"Image with id: {typed_image_id} not found"
             raise ImageNotFoundError(msg)
 
-        logger.info("Successfully found image with id: %s", image)
+        logger.info("Successfully found image with id: %s", typed_image_id)
 
-        if typed_image_id not in current_user.images:
+        if not await self._image_catalog_gateway.is_owned_by(image_id=typed_image_id, owner_id=current_user.id):
             msg = "Photo with id: %s doesn't belong to current user"
             raise ImageDoesntBelongToThisUserError(msg)
 
-        current_user.images.remove(typed_image_id)
         logger.info("Removing image with id: %s from image storage", typed_image_id)
         await self._image_storage.delete_by_id(typed_image_id)
         logger.info("Successfully removed image with id: %s from image storage", typed_image_id)
-        logger.info("Started deleting image: %s from user entity: %s", typed_image_id, current_user.id)
-        await self._user_command_gateway.update(current_user)
+        logger.info("Started deleting image: %s from catalogue of user: %s", typed_image_id, current_user.id)
+        await self._image_catalog_gateway.delete_by_id(typed_image_id)
+        await self._perceptual_hash_gateway.delete_by_id(typed_image_id)
 
         await self._transaction_manager.flush()
         await self._transaction_manager.commit()
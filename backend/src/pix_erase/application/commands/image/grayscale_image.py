@@ -5,17 +5,19 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Final, cast, final
 from uuid import UUID
 
+from pix_erase.application.common.ports.image.catalog_gateway import ImageCatalogGateway
 from pix_erase.application.common.ports.image.storage import ImageStorage
 from pix_erase.application.common.ports.scheduler.payloads.images import GrayScaleImagePayload
 from pix_erase.application.common.ports.scheduler.task_id import TaskID, TaskKey
 from pix_erase.application.common.ports.scheduler.task_scheduler import TaskScheduler
 from pix_erase.application.common.services.current_user import CurrentUserService
 from pix_erase.application.errors.image import ImageDoesntBelongToThisUserError, ImageNotFoundError
+from pix_erase.domain.image.values.image_encoding import ImageEncoding
 
 if TYPE_CHECKING:
     from collections.abc import Coroutine
 
-    from pix_erase.domain.image.entities.image import Image
+    from pix_erase.application.common.query_models.image import ImageMetadataQueryModel
     from pix_erase.domain.image.values.image_id import ImageID
     from pix_erase.domain.user.entities.user import User
 
@@ -25,6 +27,8 @@ logger: Final[logging.Logger] = logging.getLogger(__name__)
 @dataclass(frozen=True, slots=True, kw_only=True)
 class ConvertImageToGrayscaleCommand:
     image_id: UUID
+    output_format: str | None = None
+    output_quality: int | None = None
 
 
 @final
@@ -40,27 +44,31 @@ class GrayscaleImageCommandHandler:
         image_storage: ImageStorage,
         scheduler: TaskScheduler,
         current_user_service: CurrentUserService,
+        image_catalog_gateway: ImageCatalogGateway,
     ) -> None:
         self._image_storage: Final[ImageStorage] = image_storage
         self._scheduler: Final[TaskScheduler] = scheduler
         self._current_user_service: Final[CurrentUserService] = current_user_service
+        self._image_catalog_gateway: Final[ImageCatalogGateway] = image_catalog_gateway
 
     async def __call__(self, data: ConvertImageToGrayscaleCommand) -> TaskID:
         logger.info("Started converting image to grayscale, image_name: %s", data.image_id)
 
+        encoding: ImageEncoding = ImageEncoding(format=data.output_format, quality=data.output_quality)
+
         logger.info("Getting current user id")
         current_user: User = await self._current_user_service.get_current_user()
         logger.info("Successfully got current user id: %s", current_user.id)
 
         typed_image_id: ImageID = cast("ImageID", data.image_id)
 
-        if typed_image_id not in current_user.images:
+        if not await self._image_catalog_gateway.is_owned_by(image_id=typed_image_id, owner_id=current_user.id):
             msg = f"Image with id: {data.image_id} doesn't belong to this user."
             raise ImageDoesntBelongToThisUserError(msg)
 
-        image: Image | None = await self._image_storage.read_by_id(image_id=typed_image_id)
+        metadata: ImageMetadataQueryModel | None = await self._image_storage.read_metadata_by_id(typed_image_id)
 
-        if image is None:
+        if metadata is None:
             msg = f"Failed to found image with id: {data.image_id}"
             raise ImageNotFoundError(msg)
 
@@ -75,6 +83,7 @@ class GrayscaleImageCommandHandler:
             task_id=task_id,
             payload=GrayScaleImagePayload(
                 image_id=typed_image_id,
+                encoding=encoding,
             ),
         )
 
@@ -83,7 +92,9 @@ class GrayscaleImageCommandHandler:
         task.add_done_callback(background_tasks.discard)
 
         logger.info(
-            "Successfully send image for grayscaling in task manager, image_id: %s, task_id: %s", image.id, task_id
+            "Successfully send image for grayscaling in task manager, image_id: %s, task_id: %s",
+            typed_image_id,
+            task_id,
         )
 
         return task_id
@@ -0,0 +1,175 @@
+import asyncio
+import logging
+from asyncio import Task
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Final, Literal, cast, final
+from uuid import UUID
+
+from pix_erase.application.commands.image.remove_background_image import to_background_removal_model
+from pix_erase.application.common.ports.image.catalog_gateway import ImageCatalogGateway
+from pix_erase.application.common.ports.image.storage import ImageStorage
+from pix_erase.application.common.ports.scheduler.payloads.images import (
+    ImagePipelineStepPayload,
+    ProcessImagePipelinePayload,
+)
+from pix_erase.application.common.ports.scheduler.task_id import TaskID, TaskKey
+from pix_erase.application.common.ports.scheduler.task_scheduler import TaskScheduler
+from pix_erase.application.common.services.current_user import CurrentUserService
+from pix_erase.application.errors.image import (
+    BadImagePipelineError,
+    ImageDoesntBelongToThisUserError,
+    ImageNotFoundError,
+)
+from pix_erase.domain.image.values.image_encoding import ImageEncoding
+from pix_erase.domain.image.values.image_scale import ImageScale
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+    from pix_erase.application.common.query_models.image import ImageMetadataQueryModel
+    from pix_erase.domain.image.values.image_id import ImageID
+    from pix_erase.domain.user.entities.user import User
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+MAX_PIPELINE_OPERATIONS: Final[int] = 16
+MIN_QUALITY: Final[int] = 0
+MAX_QUALITY: Final[int] = 100
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ImagePipelineStep:
+    operation: Literal["rotate", "grayscale", "compress", "upscale", "remove_background", "remove_watermark"]
+    angle: int | None = None
+    quality: int | None = None
+    algorithm: Literal["AI", "NearestNeighbour"] | None = None
+    scale: int | None = None
+    model: str | None = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ProcessImagePipelineCommand:
+    image_id: UUID
+    operations: Sequence[ImagePipelineStep]
+    output_format: str | None = None
+
+
+def to_pipeline_step_payload(step: ImagePipelineStep) -> ImagePipelineStepPayload:
+    if step.operation == "rotate":
+        if step.angle is None:
+            msg = "Angle is required for rotate operation."
+            raise BadImagePipelineError(msg)
+
+        return ImagePipelineStepPayload(operation=step.operation, angle=step.angle)
+
+    if step.operation == "compress":
+        if step.quality is None or not MIN_QUALITY <= step.quality <= MAX_QUALITY:
+            msg = f"Quality between {MIN_QUALITY} and {MAX_QUALITY} is required for compress operation."
+            raise BadImagePipelineError(msg)
+
+        return ImagePipelineStepPayload(operation=step.operation, quality=step.quality)
+
+    if step.operation == "upscale":
+        if step.algorithm is None or step.scale is None:
+            msg = "Algorithm and scale are required for upscale operation."
+            raise BadImagePipelineError(msg)
+
+        return ImagePipelineStepPayload(
+            operation=step.operation,
+            algorithm=step.algorithm,
+            scale=ImageScale(step.scale),
+        )
+
+    if step.operation == "remove_background":
+        return ImagePipelineStepPayload(operation=step.operation, model=to_background_removal_model(step.model))
+
+    if step.operation in ("grayscale", "remove_watermark"):
+        return ImagePipelineStepPayload(operation=step.operation)
+
+    msg = f"Unknown operation for image pipeline: {step.operation}"
+    raise BadImagePipelineError(msg)
+
+
+def to_pipeline_payload(steps: Sequence[ImagePipelineStep]) -> list[ImagePipelineStepPayload]:
+    if not steps or len(steps) > MAX_PIPELINE_OPERATIONS:
+        msg = f"Pipeline must contain from 1 to {MAX_PIPELINE_OPERATIONS} operations."
+        raise BadImagePipelineError(msg)
+
+    return [to_pipeline_step_payload(step) for step in steps]
+
+
+@final
+class ProcessImagePipelineCommandHandler:
+    """
+    - Opens to everyone.
+    - Async processing photo that user uploaded before.
+    - Applies the operations in the given order, the image is downloaded, decoded, encoded and uploaded once.
+    """
+
+    def __init__(
+        self,
+        image_storage: ImageStorage,
+        task_scheduler: TaskScheduler,
+        current_user_service: CurrentUserService,
+        image_catalog_gateway: ImageCatalogGateway,
+    ) -> None:
+        self._image_storage: Final[ImageStorage] = image_storage
+        self._scheduler: Final[TaskScheduler] = task_scheduler
+        self._current_user_service: Final[CurrentUserService] = current_user_service
+        self._image_catalog_gateway: Final[ImageCatalogGateway] = image_catalog_gateway
+
+    async def __call__(self, data: ProcessImagePipelineCommand) -> TaskID:
+        logger.info(
+            "Started processing image pipeline with id: %s, operations: %s",
+            data.image_id,
+            [step.operation for step in data.operations],
+        )
+
+        operations: list[ImagePipelineStepPayload] = to_pipeline_payload(data.operations)
+
+        encoding: ImageEncoding = ImageEncoding(format=data.output_format)
+
+        logger.info("Getting current user id")
+        current_user: User = await self._current_user_service.get_current_user()
+        logger.info("Successfully got current user id: %s", current_user.id)
+
+        typed_image_id: ImageID = cast("ImageID", data.image_id)
+
+        if not await self._image_catalog_gateway.is_owned_by(image_id=typed_image_id, owner_id=current_user.id):
+            msg = f"Image with id: {data.image_id} doesn't belong to this user."
+            raise ImageDoesntBelongToThisUserError(msg)
+
+        metadata: ImageMetadataQueryModel | None = await self._image_storage.read_metadata_by_id(typed_image_id)
+
+        if metadata is None:
+            msg = f"Failed to found image with id: {data.image_id}"
+            raise ImageNotFoundError(msg)
+
+        logger.info("Sending task for processing image pipeline with id: %s", data.image_id)
+
+        task_id: TaskID = self._scheduler.make_task_id(
+            key=TaskKey("process_image_pipeline"),
+            value=typed_image_id,
+        )
+
+        background_tasks: set[Task] = set()
+
+        coroutine: Coroutine[Any, Any, None] = self._scheduler.schedule(
+            task_id=task_id,
+            payload=ProcessImagePipelinePayload(
+                image_id=typed_image_id,
+                operations=operations,
+                encoding=encoding,
+            ),
+        )
+
+        task: Task = asyncio.create_task(coroutine)
+        background_tasks.add(task)
+        task.add_done_callback(background_tasks.discard)
+
+        logger.info(
+            "Successfully send image pipeline in task manager, image_id: %s, task_id: %s", typed_image_id, task_id
+        )
+
+        return task_id
@@ -0,0 +1,96 @@
+import logging
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final, cast, final
+from uuid import UUID
+
+from pix_erase.application.commands.image.process_image_pipeline import ImagePipelineStep, to_pipeline_payload
+from pix_erase.application.common.ports.image.catalog_gateway import ImageCatalogGateway
+from pix_erase.application.common.ports.scheduler.payloads.images import ProcessImagePipelinePayload
+from pix_erase.application.common.ports.scheduler.task_id import TaskBatchID, TaskID, TaskKey
+from pix_erase.application.common.ports.scheduler.task_scheduler import TaskScheduler
+from pix_erase.application.common.services.current_user import CurrentUserService
+from pix_erase.application.errors.image import BadImageBatchError, ImageDoesntBelongToThisUserError
+from pix_erase.domain.image.values.image_encoding import ImageEncoding
+
+if TYPE_CHECKING:
+    from pix_erase.application.common.ports.scheduler.payloads.images import ImagePipelineStepPayload
+    from pix_erase.domain.image.values.image_id import ImageID
+    from pix_erase.domain.user.entities.user import User
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+MAX_BATCH_IMAGES: Final[int] = 500
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ProcessImagesBatchCommand:
+    image_ids: Sequence[UUID]
+    operations: Sequence[ImagePipelineStep]
+    output_format: str | None = None
+
+
+@final
+class ProcessImagesBatchCommandHandler:
+    """
+    - Opens to everyone.
+    - Async processing photos that user uploaded before.
+    - Applies the same operations to every image of the batch, every image is processed by its own task.
+    - Returns one batch ID, its status sums up progress of all tasks of the batch.
+    """
+
+    def __init__(
+        self,
+        task_scheduler: TaskScheduler,
+        current_user_service: CurrentUserService,
+        image_catalog_gateway: ImageCatalogGateway,
+    ) -> None:
+        self._scheduler: Final[TaskScheduler] = task_scheduler
+        self._current_user_service: Final[CurrentUserService] = current_user_service
+        self._image_catalog_gateway: Final[ImageCatalogGateway] = image_catalog_gateway
+
+    async def __call__(self, data: ProcessImagesBatchCommand) -> TaskBatchID:
+        logger.info(
+            "Started processing batch of %s images, operations: %s",
+            len(data.image_ids),
+            [step.operation for step in data.operations],
+        )
+
+        image_ids: list[ImageID] = list(dict.fromkeys(cast("Sequence[ImageID]", data.image_ids)))
+
+        if not image_ids or len(image_ids) > MAX_BATCH_IMAGES:
+            msg = f"Batch must contain from 1 to {MAX_BATCH_IMAGES} images."
+            raise BadImageBatchError(msg)
+
+        operations: list[ImagePipelineStepPayload] = to_pipeline_payload(data.operations)
+        encoding: ImageEncoding = ImageEncoding(format=data.output_format)
+
+        logger.info("Getting current user id")
+        current_user: User = await self._current_user_service.get_current_user()
+        logger.info("Successfully got current user id: %s", current_user.id)
+
+        # ownership of the whole batch is one query, missing objects in the storage fail their own tasks
+        owned: set[ImageID] = await self._image_catalog_gateway.read_owned_ids(current_user.id, image_ids)
+
+        if foreign := [image_id for image_id in image_ids if image_id not in owned]:
+            msg = f"Images with ids: {', '.join(map(str, foreign))} don't belong to this user."
+            raise ImageDoesntBelongToThisUserError(msg)
+
+        batch_uuid: UUID = uuid.uuid4()
+        batch_id: TaskBatchID = TaskBatchID(
+            self._scheduler.make_task_id(key=TaskKey("process_images_batch"), value=batch_uuid),
+        )
+        payloads: dict[TaskID, ProcessImagePipelinePayload] = {
+            self._scheduler.make_task_id(
+                key=TaskKey("process_image_pipeline"),
+                value=uuid.uuid5(batch_uuid, str(image_id)),
+            ): ProcessImagePipelinePayload(image_id=image_id, operations=operations, encoding=encoding)
+            for image_id in image_ids
+        }
+
+        await self._scheduler.schedule_batch(batch_id=batch_id, payloads=payloads, owner_id=current_user.id)
+
+        logger.info("Successfully sent batch of %s images in task manager, batch_id: %s", len(image_ids), batch_id)
+
+        return batch_id
@@ -5,17 +5,27 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Final, cast, final
 from uuid import UUID
 
+from pix_erase.application.common.ports.image.catalog_gateway import ImageCatalogGateway
 from pix_erase.application.common.ports.image.storage import ImageStorage
 from pix_erase.application.common.ports.scheduler.payloads.images import RemoveImageBackgroundPayload
 from pix_erase.application.common.ports.scheduler.task_id import TaskID, TaskKey
 from pix_erase.application.common.ports.scheduler.task_scheduler import TaskScheduler
 from pix_erase.application.common.services.current_user import CurrentUserService
-from pix_erase.application.errors.image import ImageDoesntBelongToThisUserError, ImageNotFoundError
+from pix_erase.application.errors.image import (
+    ImageDoesntBelongToThisUserError,
+    ImageNotFoundError,
+    UnknownBackgroundRemovalModelError,
+)
+from pix_erase.domain.image.ports.image_background_remove_converter import (
+    BACKGROUND_REMOVAL_MODELS,
+    BackgroundRemovalModel,
+)
+from pix_erase.domain.image.values.image_encoding import ImageEncoding
 
 if TYPE_CHECKING:
     from collections.abc import Coroutine
 
-    from pix_erase.domain.image.entities.image import Image
+    from pix_erase.application.common.query_models.image import ImageMetadataQueryModel
     from pix_erase.domain.image.values.image_id import ImageID
     from pix_erase.domain.user.entities.user import User
 
@@ -25,6 +35,21 @@ logger: Final[logging.Logger] = logging.getLogger(__name__)
 @dataclass(frozen=True, slots=True, kw_only=True)
 class RemoveBackgroundImageCommand:
     image_id: UUID
+    model: str | None = None
+    output_format: str | None = None
+    output_quality: int | None = None
+
+
+def to_background_removal_model(model: str | None) -> BackgroundRemovalModel | None:
+    if model is None:
+        return None
+
+    for known_model in BACKGROUND_REMOVAL_MODELS:
+        if model == known_model:
+            return known_model
+
+    msg = f"Unknown background removal model: {model}, expected one of: {', '.join(BACKGROUND_REMOVAL_MODELS)}"
+    raise UnknownBackgroundRemovalModelError(msg)
 
 
 @final
@@ -33,6 +58,7 @@ class RemoveBackgroundImageCommandHandler:
     - Opens to everyone.
     - Async processing, non-blocking.
     - Changes existing image.
+    - Model can be chosen: u2net (default, best edges), u2netp or silueta (lighter and faster).
     """
 
     def __init__(
@@ -40,13 +66,19 @@ class RemoveBackgroundImageCommandHandler:
         scheduler: TaskScheduler,
         image_storage: ImageStorage,
         current_user_service: CurrentUserService,
+        image_catalog_gateway: ImageCatalogGateway,
     ) -> None:
         self._image_storage: Final[ImageStorage] = image_storage
         self._scheduler: Final[TaskScheduler] = scheduler
         self._current_user_service: Final[CurrentUserService] = current_user_service
+        self._image_catalog_gateway: Final[ImageCatalogGateway] = image_catalog_gateway
 
     async def __call__(self, data: RemoveBackgroundImageCommand) -> TaskID:
-        logger.info("Started converting image to grayscale, image_name: %s", data.image_id)
+        logger.info("Started removing background, image_id: %s, model: %s", data.image_id, data.model)
+
+        model: BackgroundRemovalModel | None = to_background_removal_model(data.model)
+
+        encoding: ImageEncoding = ImageEncoding(format=data.output_format, quality=data.output_quality)
 
         logger.info("Getting current user id")
         current_user: User = await self._current_user_service.get_current_user()
@@ -54,13 +86,13 @@ class RemoveBackgroundImageCommandHandler:
 
         typed_image_id: ImageID = cast("ImageID", data.image_id)
 
-        if typed_image_id not in current_user.images:
+        if not await self._image_catalog_gateway.is_owned_by(image_id=typed_image_id, owner_id=current_user.id):
             msg = f"Image with id: {data.image_id} doesn't belong to this user."
             raise ImageDoesntBelongToThisUserError(msg)
 
-        image: Image | None = await self._image_storage.read_by_id(image_id=typed_image_id)
+        metadata: ImageMetadataQueryModel | None = await self._image_storage.read_metadata_by_id(typed_image_id)
 
-        if image is None:
+        if metadata is None:
             msg = f"Failed to found image with id: {data.image_id}"
             raise ImageNotFoundError(msg)
 
@@ -75,6 +107,8 @@ class RemoveBackgroundImageCommandHandler:
             task_id=task_id,
             payload=RemoveImageBackgroundPayload(
                 image_id=typed_image_id,
+                model=model,
+                encoding=encoding,
             ),
         )
 
@@ -83,7 +117,9 @@ class RemoveBackgroundImageCommandHandler:
         task.add_done_callback(background_tasks.discard)
 
         logger.info(
-            "Successfully send image for grayscaling in task manager, image_id: %s, task_id: %s", image.id, task_id
+            "Successfully send image for grayscaling in task manager, image_id: %s, task_id: %s",
+            typed_image_id,
+            task_id,
         )
 
         return task_id
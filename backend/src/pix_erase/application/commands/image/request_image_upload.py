@@ -0,0 +1,56 @@
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final, final
+
+from pix_erase.application.common.ports.image.url_signer import ImageUrlSigner
+from pix_erase.application.common.services.current_user import CurrentUserService
+from pix_erase.application.common.views.image.create_image import ImageUploadUrlView
+from pix_erase.application.errors.image import DirectImageAccessDisabledError
+from pix_erase.domain.image.services.image_service import ImageService
+
+if TYPE_CHECKING:
+    from pix_erase.application.common.query_models.image import PresignedUrlQueryModel
+    from pix_erase.domain.image.values.image_id import ImageID
+    from pix_erase.domain.user.entities.user import User
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RequestImageUploadCommand: ...
+
+
+@final
+class RequestImageUploadCommandHandler:
+    """
+    - Opens to everyone
+    - Returns a short-lived link for uploading a new image straight into the storage
+    - The image appears in the system after the upload is completed
+    - Works only when direct access to the storage is enabled
+    """
+
+    def __init__(
+        self,
+        current_user_service: CurrentUserService,
+        image_service: ImageService,
+        image_url_signer: ImageUrlSigner,
+    ) -> None:
+        self._current_user_service: Final[CurrentUserService] = current_user_service
+        self._image_service: Final[ImageService] = image_service
+        self._image_url_signer: Final[ImageUrlSigner] = image_url_signer
+
+    async def __call__(self, _: RequestImageUploadCommand) -> ImageUploadUrlView:
+        if not self._image_url_signer.is_enabled():
+            msg = "Direct uploads into the storage are disabled, upload the image through the API"
+            raise DirectImageAccessDisabledError(msg)
+
+        logger.info("Getting current user")
+        current_user: User = await self._current_user_service.get_current_user()
+        logger.info("Current user is: %s", current_user.id)
+
+        image_id: ImageID = self._image_service.next_image_id()
+        link: PresignedUrlQueryModel = await self._image_url_signer.sign_upload(image_id)
+
+        logger.info("Signed upload of image with id: %s for user: %s", image_id, current_user.id)
+
+        return ImageUploadUrlView(image_id=image_id, url=link.url, expires_at=link.expires_at)
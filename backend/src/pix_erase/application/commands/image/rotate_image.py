@@ -5,17 +5,19 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Final, cast, final
 from uuid import UUID
 
+from pix_erase.application.common.ports.image.catalog_gateway import ImageCatalogGateway
 from pix_erase.application.common.ports.image.storage import ImageStorage
 from pix_erase.application.common.ports.scheduler.payloads.images import RotateImagePayload
 from pix_erase.application.common.ports.scheduler.task_id import TaskID, TaskKey
 from pix_erase.application.common.ports.scheduler.task_scheduler import TaskScheduler
 from pix_erase.application.common.services.current_user import CurrentUserService
 from pix_erase.application.errors.image import ImageDoesntBelongToThisUserError, ImageNotFoundError
+from pix_erase.domain.image.values.image_encoding import ImageEncoding
 
 if TYPE_CHECKING:
     from collections.abc import Coroutine
 
-    from pix_erase.domain.image.entities.image import Image
+    from pix_erase.application.common.query_models.image import ImageMetadataQueryModel
     from pix_erase.domain.image.values.image_id import ImageID
     from pix_erase.domain.user.entities.user import User
 
@@ -26,6 +28,8 @@ logger: Final[logging.Logger] = logging.getLogger(__name__)
 class RotateImageCommand:
     image_id: UUID
     angle: int
+    output_format: str | None = None
+    output_quality: int | None = None
 
 
 @final
@@ -41,10 +45,12 @@ class RotateImageCommandHandler:
         image_storage: ImageStorage,
         task_scheduler: TaskScheduler,
         current_user_service: CurrentUserService,
+        image_catalog_gateway: ImageCatalogGateway,
     ) -> None:
         self._image_storage: Final[ImageStorage] = image_storage
         self._scheduler: Final[TaskScheduler] = task_scheduler
         self._current_user_service: Final[CurrentUserService] = current_user_service
+        self._image_catalog_gateway: Final[ImageCatalogGateway] = image_catalog_gateway
 
     async def __call__(self, data: RotateImageCommand) -> TaskID:
         logger.info(
@@ -53,19 +59,21 @@ class RotateImageCommandHandler:
             data.angle,
         )
 
+        encoding: ImageEncoding = ImageEncoding(format=data.output_format, quality=data.output_quality)
+
         logger.info("Getting current user id")
         current_user: User = await self._current_user_service.get_current_user()
         logger.info("Successfully got current user id: %s", current_user.id)
 
         typed_image_id: ImageID = cast("ImageID", data.image_id)
 
-        if typed_image_id not in current_user.images:
+        if not await self._image_catalog_gateway.is_owned_by(image_id=typed_image_id, owner_id=current_user.id):
             msg = f"Image with id: {data.image_id} doesn't belong to this user."
             raise ImageDoesntBelongToThisUserError(msg)
 
-        image: Image | None = await self._image_storage.read_by_id(image_id=typed_image_id)
+        metadata: ImageMetadataQueryModel | None = await self._image_storage.read_metadata_by_id(typed_image_id)
 
-        if image is None:
+        if metadata is None:
             msg = f"Failed to found image with id: {data.image_id}"
             raise ImageNotFoundError(msg)
 
@@ -85,6 +93,7 @@ class RotateImageCommandHandler:
             payload=RotateImagePayload(
                 image_id=typed_image_id,
                 angle=data.angle,
+                encoding=encoding,
             ),
         )
 
@@ -93,7 +102,7 @@ class RotateImageCommandHandler:
         task.add_done_callback(background_tasks.discard)
 
         logger.info(
-            "Successfully send image for rotating in task manager, image_id: %s, task_id: %s", image.id, task_id
+            "Successfully send image for rotating in task manager, image_id: %s, task_id: %s", typed_image_id, task_id
         )
 
         return task_id
@@ -0,0 +1,45 @@
+from abc import abstractmethod
+from collections.abc import Collection
+from typing import Protocol
+
+from pix_erase.application.common.query_models.image import ImageCatalogQueryModel, ImageMetadataQueryModel
+from pix_erase.application.common.query_params.image_cursor import ImageCatalogCursor
+from pix_erase.domain.image.values.image_id import ImageID
+from pix_erase.domain.user.values.user_id import UserID
+
+
+class ImageCatalogGateway(Protocol):
+    @abstractmethod
+    async def add(
+        self,
+        image_id: ImageID,
+        owner_id: UserID,
+        metadata: ImageMetadataQueryModel | None = None,
+    ) -> None:
+        """Adds the image to the catalogue of its owner, an image that is already in the catalogue is kept as it is."""
+
+    @abstractmethod
+    async def update_metadata(self, image_id: ImageID, metadata: ImageMetadataQueryModel) -> None:
+        """Writes properties of the stored image after it was stored or changed."""
+
+    @abstractmethod
+    async def delete_by_id(self, image_id: ImageID) -> None: ...
+
+    @abstractmethod
+    async def is_owned_by(self, image_id: ImageID, owner_id: UserID) -> bool: ...
+
+    @abstractmethod
+    async def read_owned_ids(self, owner_id: UserID, image_ids: Collection[ImageID]) -> set[ImageID]:
+        """Those of ``image_ids`` that belong to the owner."""
+
+    @abstractmethod
+    async def read_ids_by_owner(self, owner_id: UserID) -> set[ImageID]: ...
+
+    @abstractmethod
+    async def read_page_by_owner(
+        self,
+        owner_id: UserID,
+        limit: int,
+        after: ImageCatalogCursor | None = None,
+    ) -> list[ImageCatalogQueryModel]:
+        """Images of the owner from the newest one, ``after`` is the last image of the previous page."""
@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from collections.abc import Sequence
 from typing import Protocol
 
 from pix_erase.domain.image.entities.image_comparison import ImageComparison
@@ -9,7 +10,12 @@ from pix_erase.domain.image.values.image_id import ImageID
 class ImageComparisonGateway(Protocol):
     @abstractmethod
     async def add(self, comparison: ImageComparison) -> None:
-        """Save image comparison result."""
+        """Save image comparison result, a result for an already compared pair replaces the old one."""
+        ...
+
+    @abstractmethod
+    async def add_many(self, comparisons: Sequence[ImageComparison]) -> None:
+        """Save results of a batch in bulk, a result for an already compared pair replaces the old one."""
         ...
 
     @abstractmethod
@@ -114,3 +114,11 @@ class ImageInfo:
 class ImageInfoExtractor(Protocol):
     @abstractmethod
     async def extract(self, data: bytes) -> ImageInfo: ...
+
+    @abstractmethod
+    def metadata_size(self, head: bytes) -> int | None:
+        """
+        How many first bytes of the image ``extract`` needs, ``head`` is a prefix of the image.
+
+        ``None`` means the whole image is needed.
+        """
@@ -0,0 +1,14 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from pix_erase.domain.image.values.image_id import ImageID
+
+
+class ImageFeatureCache(Protocol):
+    """Comparison features of images, an ETag pins them to the content they were extracted from."""
+
+    @abstractmethod
+    async def get(self, image_id: ImageID, etag: str) -> bytes | None: ...
+
+    @abstractmethod
+    async def set(self, image_id: ImageID, etag: str, features: bytes) -> None: ...
@@ -0,0 +1,22 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from pix_erase.application.common.ports.image.perceptual_hasher import PerceptualHashes
+from pix_erase.domain.image.values.image_id import ImageID
+
+
+class ImagePerceptualHashGateway(Protocol):
+    @abstractmethod
+    async def add(self, image_id: ImageID, hashes: PerceptualHashes) -> None:
+        """Save hashes of the image, hashes of its previous content are replaced."""
+        ...
+
+    @abstractmethod
+    async def read_by_id(self, image_id: ImageID) -> PerceptualHashes | None:
+        """Read hashes of the image, ``None`` until the image is indexed."""
+        ...
+
+    @abstractmethod
+    async def delete_by_id(self, image_id: ImageID) -> None:
+        """Exclude the image from reverse image search."""
+        ...
@@ -0,0 +1,22 @@
+from abc import abstractmethod
+from dataclasses import dataclass
+from typing import Protocol
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PerceptualHashes:
+    """
+    64-bit hashes of how an image looks, images that look alike have hashes that differ in few bits.
+
+    ``phash`` keeps low frequencies of the image, it survives resizing, recompression and small edits.
+    ``dhash`` and ``ahash`` are cheaper and coarser, they break ties between images of the same ``phash`` distance.
+    """
+
+    phash: int
+    dhash: int
+    ahash: int
+
+
+class ImagePerceptualHasher(Protocol):
+    @abstractmethod
+    def compute(self, data: bytes) -> PerceptualHashes: ...
@@ -0,0 +1,27 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from pix_erase.application.common.query_models.image import ImageMetadataQueryModel, ImageStreamQueryModel
+from pix_erase.domain.image.entities.image import Image
+from pix_erase.domain.image.values.image_id import ImageID
+
+
+class ImageRenditionStorage(Protocol):
+    """
+    Reduced copies of images for previews.
+
+    Renditions belong to the content of an image, a changed image has none until they are generated again.
+    A read returns the smallest rendition that isn't smaller than the requested size.
+    """
+
+    @abstractmethod
+    async def add(self, image: Image) -> None:
+        """Generates renditions of the current content of the image that are missing."""
+
+    @abstractmethod
+    async def read_metadata_by_id(self, image_id: ImageID, size: int) -> ImageMetadataQueryModel | None:
+        """``None`` when there is no fitting rendition, the original should be read then."""
+
+    @abstractmethod
+    async def stream_by_id(self, image_id: ImageID, size: int) -> ImageStreamQueryModel | None:
+        """``None`` when there is no fitting rendition, the original should be read then."""
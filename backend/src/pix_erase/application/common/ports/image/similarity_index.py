@@ -0,0 +1,25 @@
+from abc import abstractmethod
+from collections.abc import Set as AbstractSet
+from typing import Protocol
+
+from pix_erase.application.common.ports.image.perceptual_hasher import PerceptualHashes
+from pix_erase.application.common.query_models.image import SimilarImageQueryModel
+from pix_erase.domain.image.values.image_id import ImageID
+
+
+class ImageSimilarityIndex(Protocol):
+    """Nearest neighbours of perceptual hashes by Hamming distance."""
+
+    @abstractmethod
+    async def search(
+        self,
+        hashes: PerceptualHashes,
+        max_distance: int,
+        limit: int,
+        among: AbstractSet[ImageID] | None = None,
+    ) -> list[SimilarImageQueryModel]:
+        """
+        Images whose ``phash`` differs from the given one in at most ``max_distance`` bits, the closest first.
+        ``among`` limits the search to these images, every indexed image is searched when it's ``None``.
+        """
+        ...
@@ -1,18 +1,39 @@
 from abc import abstractmethod
+from collections.abc import AsyncIterable
 from typing import Protocol
 
-from pix_erase.application.common.query_models.image import ImageStreamQueryModel
+from pix_erase.application.common.query_models.image import (
+    ImageByteRange,
+    ImageMetadataQueryModel,
+    ImageRangeQueryModel,
+    ImageStreamQueryModel,
+)
 from pix_erase.domain.image.entities.image import Image
 from pix_erase.domain.image.values.image_id import ImageID
+from pix_erase.domain.image.values.image_name import ImageName
 
 
 class ImageStorage(Protocol):
     @abstractmethod
     async def add(self, image: Image) -> None: ...
 
+    @abstractmethod
+    async def add_stream(self, image_id: ImageID, name: ImageName, stream: AsyncIterable[bytes]) -> None: ...
+
+    @abstractmethod
+    async def add_uploaded(self, image_id: ImageID, name: ImageName) -> None:
+        """Stores an image the client has uploaded with a presigned URL."""
+
+    @abstractmethod
+    async def read_upload_size(self, image_id: ImageID) -> int | None:
+        """Size of an image uploaded with a presigned URL and not stored yet, ``None`` if nothing was uploaded."""
+
     @abstractmethod
     async def read_by_id(self, image_id: ImageID) -> Image: ...
 
+    @abstractmethod
+    async def read_range(self, image_id: ImageID, offset: int, size: int) -> ImageRangeQueryModel | None: ...
+
     @abstractmethod
     async def delete_by_id(self, image_id: ImageID) -> None: ...
 
@@ -20,4 +41,11 @@ class ImageStorage(Protocol):
     async def update(self, image: Image) -> None: ...
 
     @abstractmethod
-    async def stream_by_id(self, image_id: ImageID) -> ImageStreamQueryModel | None: ...
+    async def read_metadata_by_id(self, image_id: ImageID) -> ImageMetadataQueryModel | None: ...
+
+    @abstractmethod
+    async def stream_by_id(
+        self,
+        image_id: ImageID,
+        byte_range: ImageByteRange | None = None,
+    ) -> ImageStreamQueryModel | None: ...
@@ -0,0 +1,20 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from pix_erase.application.common.query_models.image import PresignedUrlQueryModel
+from pix_erase.domain.image.values.image_id import ImageID
+
+
+class ImageUrlSigner(Protocol):
+    """Gives clients direct access to bytes of images in the storage, so they don't pass through the API."""
+
+    @abstractmethod
+    def is_enabled(self) -> bool: ...
+
+    @abstractmethod
+    async def sign_download(self, image_id: ImageID) -> PresignedUrlQueryModel | None:
+        """``None`` means the image is not found."""
+
+    @abstractmethod
+    async def sign_upload(self, image_id: ImageID) -> PresignedUrlQueryModel:
+        """The uploaded image is stored with ``ImageStorage.add_uploaded`` then."""
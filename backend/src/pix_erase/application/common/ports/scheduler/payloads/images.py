@@ -2,25 +2,46 @@ from dataclasses import dataclass
 from typing import Literal
 
 from pix_erase.application.common.ports.scheduler.payloads.base import TaskPayload
+from pix_erase.domain.image.ports.image_background_remove_converter import BackgroundRemovalModel
+from pix_erase.domain.image.values.image_encoding import ImageEncoding
 from pix_erase.domain.image.values.image_id import ImageID
 from pix_erase.domain.image.values.image_scale import ImageScale
 
 
+@dataclass(frozen=True)
+class StoreUploadedImagePayload(TaskPayload):
+    image_id: ImageID
+    filename: str
+
+
+@dataclass(frozen=True)
+class GenerateImageRenditionsPayload(TaskPayload):
+    image_id: ImageID
+
+
+@dataclass(frozen=True)
+class IndexImagePayload(TaskPayload):
+    image_id: ImageID
+
+
 @dataclass(frozen=True)
 class CompressImagePayload(TaskPayload):
     image_id: ImageID
     quality: int
+    encoding: ImageEncoding | None = None
 
 
 @dataclass(frozen=True)
 class GrayScaleImagePayload(TaskPayload):
     image_id: ImageID
+    encoding: ImageEncoding | None = None
 
 
 @dataclass(frozen=True)
 class RotateImagePayload(TaskPayload):
     image_id: ImageID
     angle: int
+    encoding: ImageEncoding | None = None
 
 
 @dataclass(frozen=True)
@@ -28,14 +49,40 @@ class UpscaleImagePayload(TaskPayload):
     image_id: ImageID
     algorithm: Literal["AI", "NearestNeighbour"]
     scale: ImageScale
+    encoding: ImageEncoding | None = None
 
 
 @dataclass(frozen=True)
 class RemoveImageBackgroundPayload(TaskPayload):
     image_id: ImageID
+    model: BackgroundRemovalModel | None = None
+    encoding: ImageEncoding | None = None
 
 
 @dataclass(frozen=True)
 class CompareImagesPayload(TaskPayload):
     first_image_id: ImageID
     second_image_id: ImageID
+
+
+@dataclass(frozen=True)
+class CompareImagesBatchPayload(TaskPayload):
+    image_ids: list[ImageID]
+    reference_image_id: ImageID | None = None
+
+
+@dataclass(frozen=True)
+class ImagePipelineStepPayload:
+    operation: Literal["rotate", "grayscale", "compress", "upscale", "remove_background", "remove_watermark"]
+    angle: int | None = None
+    quality: int | None = None
+    algorithm: Literal["AI", "NearestNeighbour"] | None = None
+    scale: ImageScale | None = None
+    model: BackgroundRemovalModel | None = None
+
+
+@dataclass(frozen=True)
+class ProcessImagePipelinePayload(TaskPayload):
+    image_id: ImageID
+    operations: list[ImagePipelineStepPayload]
+    encoding: ImageEncoding | None = None
@@ -2,10 +2,14 @@ from dataclasses import dataclass
 from enum import StrEnum
 from typing import NewType
 
+from pix_erase.domain.user.values.user_id import UserID
+
 TaskKey = NewType("TaskKey", str)
 
 TaskID = NewType("TaskID", str)
 
+TaskBatchID = NewType("TaskBatchID", str)
+
 
 class TaskInfoStatus(StrEnum):
     SUCCESS = "success"
@@ -13,6 +17,7 @@ class TaskInfoStatus(StrEnum):
     STARTED = "started"
     RETRYING = "retrying"
     PROCESSING = "processing"
+    QUEUED = "queued"
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -20,3 +25,10 @@ class TaskInfo:
     task_id: TaskID
     status: TaskInfoStatus
     description: str
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class TaskBatchInfo:
+    batch_id: TaskBatchID
+    owner_id: UserID
+    tasks: list[TaskInfo]
@@ -1,8 +1,16 @@
 from abc import abstractmethod
+from collections.abc import Mapping
 from typing import Any, Protocol
 
 from pix_erase.application.common.ports.scheduler.payloads.base import TaskPayload
-from pix_erase.application.common.ports.scheduler.task_id import TaskID, TaskInfo, TaskKey
+from pix_erase.application.common.ports.scheduler.task_id import (
+    TaskBatchID,
+    TaskBatchInfo,
+    TaskID,
+    TaskInfo,
+    TaskKey,
+)
+from pix_erase.domain.user.values.user_id import UserID
 
 
 class TaskScheduler(Protocol):
@@ -18,3 +26,18 @@ class TaskScheduler(Protocol):
 
     @abstractmethod
     async def read_task_info(self, task_id: TaskID) -> TaskInfo | None: ...
+
+    @abstractmethod
+    async def schedule_batch(
+        self,
+        batch_id: TaskBatchID,
+        payloads: Mapping[TaskID, TaskPayload],
+        owner_id: UserID,
+    ) -> None:
+        """Remembers tasks and the owner of the batch under its ID, then sends all of them at once."""
+        ...
+
+    @abstractmethod
+    async def read_batch_info(self, batch_id: TaskBatchID) -> TaskBatchInfo | None:
+        """Progress of every task of the batch, tasks that aren't taken by a worker yet are queued."""
+        ...
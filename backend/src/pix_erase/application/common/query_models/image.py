@@ -2,8 +2,37 @@ from collections.abc import AsyncGenerator
 from dataclasses import dataclass
 from datetime import datetime
 
+from pix_erase.domain.image.values.image_id import ImageID
 from pix_erase.domain.image.values.image_name import ImageName
 from pix_erase.domain.image.values.image_size import ImageSize
+from pix_erase.domain.user.values.user_id import UserID
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ImageByteRange:
+    """Bytes from ``start`` to ``end`` of an image, both inclusive as in HTTP ``Content-Range``."""
+
+    start: int
+    end: int
+
+    @property
+    def size(self) -> int:
+        return self.end - self.start + 1
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ImageMetadataQueryModel:
+    """Properties of a stored image read without its bytes, ``content_length`` is the size of the whole image."""
+
+    content_type: str
+    content_length: int
+    width: ImageSize
+    height: ImageSize
+    filename: ImageName
+    etag: str | None = None
+    blob_hash: str | None = None
+    created_at: datetime
+    updated_at: datetime
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -19,3 +48,51 @@ class ImageStreamQueryModel:
     etag: str | None = None
     created_at: datetime
     updated_at: datetime
+    # set when only a part of the image is streamed, ``content_length`` is the size of the part then
+    byte_range: ImageByteRange | None = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ImageRangeQueryModel:
+    """Part of the bytes of an image, ``total_size`` is the size of the whole image."""
+
+    data: bytes
+    total_size: int
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PresignedUrlQueryModel:
+    """A link that gives access to the storage without credentials until ``expires_at``."""
+
+    url: str
+    expires_at: datetime
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SimilarImageQueryModel:
+    """An image found by reverse image search, distances are counts of different bits of perceptual hashes."""
+
+    image_id: ImageID
+    phash_distance: int
+    dhash_distance: int
+    ahash_distance: int
+
+    @property
+    def distance(self) -> int:
+        return self.phash_distance + self.dhash_distance + self.ahash_distance
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ImageCatalogQueryModel:
+    """An image in the catalogue of its owner, properties of the stored image are ``None`` until it's stored."""
+
+    image_id: ImageID
+    owner_id: UserID
+    filename: ImageName | None = None
+    blob_hash: str | None = None
+    width: ImageSize | None = None
+    height: ImageSize | None = None
+    content_type: str | None = None
+    size: int | None = None
+    created_at: datetime
+    updated_at: datetime
@@ -0,0 +1,31 @@
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Self
+from uuid import UUID
+
+from pix_erase.application.errors.query_params import PaginationError
+from pix_erase.domain.image.values.image_id import ImageID
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ImageCatalogCursor:
+    """The last image of a page, the next page starts after it in the order of the catalogue."""
+
+    created_at: datetime
+    image_id: ImageID
+
+    def encode(self) -> str:
+        raw: str = f"{self.created_at.isoformat()}|{self.image_id!s}"
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, value: str) -> Self:
+        try:
+            raw: str = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)).decode()
+            created_at, image_id = raw.split("|")
+            return cls(created_at=datetime.fromisoformat(created_at), image_id=ImageID(UUID(image_id)))
+        except (binascii.Error, UnicodeDecodeError, ValueError) as error:
+            msg = f"Invalid cursor: {value}"
+            raise PaginationError(msg) from error
@@ -0,0 +1,161 @@
+import asyncio
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Final
+
+from pix_erase.application.common.ports.image.comparison_gateway import ImageComparisonGateway
+from pix_erase.application.common.ports.image.feature_cache import ImageFeatureCache
+from pix_erase.application.common.ports.image.storage import ImageStorage
+from pix_erase.application.common.ports.transaction_manager import TransactionManager
+from pix_erase.application.errors.image import ImageNotFoundError
+from pix_erase.domain.image.entities.image_comparison import ImageComparison
+from pix_erase.domain.image.ports.image_comparer_converter import ImageComparerConverter, ScoresDTO
+from pix_erase.domain.image.values.comparison_id import comparison_id_for
+from pix_erase.domain.image.values.image_id import ImageID
+from pix_erase.domain.image.values.image_name import ImageName
+from pix_erase.domain.image.values.image_size import ImageSize
+
+if TYPE_CHECKING:
+    from pix_erase.application.common.query_models.image import ImageMetadataQueryModel
+    from pix_erase.domain.image.entities.image import Image
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+# features of a few images are loaded at once, every load is a storage request and maybe a decode
+CONCURRENT_FEATURE_LOADS: Final[int] = 8
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class _ComparedImage:
+    id: ImageID
+    name: ImageName
+    width: ImageSize
+    height: ImageSize
+    updated_at: datetime
+    features: bytes
+
+
+class ImageBatchComparisonService:
+    """
+    Compares one image with many or every image with every other one.
+
+    Every image is decoded once into features which are cached by image ID and ETag, so an image compared again
+    in a later batch isn't even downloaded. Results of a batch are saved in bulk in one transaction.
+    """
+
+    def __init__(
+        self,
+        image_storage: ImageStorage,
+        image_comparer: ImageComparerConverter,
+        feature_cache: ImageFeatureCache,
+        comparison_gateway: ImageComparisonGateway,
+        transaction_manager: TransactionManager,
+    ) -> None:
+        self._image_storage: Final[ImageStorage] = image_storage
+        self._image_comparer: Final[ImageComparerConverter] = image_comparer
+        self._feature_cache: Final[ImageFeatureCache] = feature_cache
+        self._comparison_gateway: Final[ImageComparisonGateway] = comparison_gateway
+        self._transaction_manager: Final[TransactionManager] = transaction_manager
+
+    async def compare_one_to_many(self, reference_id: ImageID, candidate_ids: Sequence[ImageID]) -> int:
+        """Returns count of saved comparisons."""
+        images: list[_ComparedImage] = await self._load([reference_id, *candidate_ids])
+        comparisons: list[ImageComparison] = await self._compare(images[0], images[1:])
+
+        await self._save(comparisons)
+        return len(comparisons)
+
+    async def compare_all_pairs(self, image_ids: Sequence[ImageID]) -> int:
+        """Returns count of saved comparisons."""
+        images: list[_ComparedImage] = await self._load(image_ids)
+        # features of every image are sent to the comparer once instead of once per reference
+        scores: list[list[ScoresDTO]] = await asyncio.to_thread(
+            self._image_comparer.compare_features_pairwise,
+            [image.features for image in images],
+        )
+        comparisons: list[ImageComparison] = []
+
+        for index, (reference, reference_scores) in enumerate(zip(images, scores, strict=True)):
+            comparisons.extend(self._comparisons(reference, images[index + 1 :], reference_scores))
+
+        await self._save(comparisons)
+        return len(comparisons)
+
+    async def _load(self, image_ids: Sequence[ImageID]) -> list[_ComparedImage]:
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(CONCURRENT_FEATURE_LOADS)
+
+        async def load(image_id: ImageID) -> _ComparedImage:
+            async with semaphore:
+                return await self._load_one(image_id)
+
+        return list(await asyncio.gather(*(load(image_id) for image_id in image_ids)))
+
+    async def _load_one(self, image_id: ImageID) -> _ComparedImage:
+        metadata: ImageMetadataQueryModel | None = await self._image_storage.read_metadata_by_id(image_id)
+
+        if metadata is None:
+            msg = f"Image with id: {image_id} not found"
+            raise ImageNotFoundError(msg)
+
+        features: bytes | None = None
+
+        if metadata.etag is not None:
+            features = await self._feature_cache.get(image_id, metadata.etag)
+
+        if features is None:
+            image: Image | None = await self._image_storage.read_by_id(image_id)
+
+            if image is None:
+                msg = f"Image with id: {image_id} not found"
+                raise ImageNotFoundError(msg)
+
+            features = await asyncio.to_thread(self._image_comparer.extract_features, image.data)
+
+            if metadata.etag is not None:
+                await self._feature_cache.set(image_id, metadata.etag, features)
+
+        return _ComparedImage(
+            id=image_id,
+            name=metadata.filename,
+            width=metadata.width,
+            height=metadata.height,
+            updated_at=metadata.updated_at,
+            features=features,
+        )
+
+    async def _compare(self, reference: _ComparedImage, candidates: Sequence[_ComparedImage]) -> list[ImageComparison]:
+        scores: list[ScoresDTO] = await asyncio.to_thread(
+            self._image_comparer.compare_features,
+            reference.features,
+            [candidate.features for candidate in candidates],
+        )
+
+        return self._comparisons(reference, candidates, scores)
+
+    @staticmethod
+    def _comparisons(
+        reference: _ComparedImage,
+        candidates: Sequence[_ComparedImage],
+        scores: Sequence[ScoresDTO],
+    ) -> list[ImageComparison]:
+        return [
+            ImageComparison(
+                id=comparison_id_for(reference.id, candidate.id),
+                first_image_id=reference.id,
+                second_image_id=candidate.id,
+                scores=candidate_scores,
+                different_names=reference.name != candidate.name,
+                different_width=reference.width != candidate.width,
+                different_height=reference.height != candidate.height,
+                images_updated_at=max(reference.updated_at, candidate.updated_at),
+            )
+            for candidate, candidate_scores in zip(candidates, scores, strict=True)
+        ]
+
+    async def _save(self, comparisons: list[ImageComparison]) -> None:
+        await self._comparison_gateway.add_many(comparisons)
+        await self._transaction_manager.commit()
+
+        logger.info("Saved %s image comparisons", len(comparisons))
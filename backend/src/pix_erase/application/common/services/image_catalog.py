@@ -0,0 +1,38 @@
+import logging
+from typing import TYPE_CHECKING, Final
+
+from pix_erase.application.common.ports.image.catalog_gateway import ImageCatalogGateway
+from pix_erase.application.common.ports.image.storage import ImageStorage
+from pix_erase.application.common.ports.transaction_manager import TransactionManager
+
+if TYPE_CHECKING:
+    from pix_erase.application.common.query_models.image import ImageMetadataQueryModel
+    from pix_erase.domain.image.values.image_id import ImageID
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+
+class ImageCatalogService:
+    """Keeps properties of stored images in the catalogue of their owners, listings don't go to the storage."""
+
+    def __init__(
+        self,
+        image_storage: ImageStorage,
+        image_catalog_gateway: ImageCatalogGateway,
+        transaction_manager: TransactionManager,
+    ) -> None:
+        self._image_storage: Final[ImageStorage] = image_storage
+        self._image_catalog_gateway: Final[ImageCatalogGateway] = image_catalog_gateway
+        self._transaction_manager: Final[TransactionManager] = transaction_manager
+
+    async def refresh(self, image_id: "ImageID") -> None:
+        metadata: ImageMetadataQueryModel | None = await self._image_storage.read_metadata_by_id(image_id)
+
+        if metadata is None:
+            logger.warning("Image %s isn't in the storage, its catalogue entry is kept as it is", image_id)
+            return
+
+        await self._image_catalog_gateway.update_metadata(image_id, metadata)
+        await self._transaction_manager.commit()
+
+        logger.info("Refreshed catalogue entry of image %s", image_id)
@@ -0,0 +1,34 @@
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Final
+
+from pix_erase.application.common.ports.image.perceptual_hash_gateway import ImagePerceptualHashGateway
+from pix_erase.application.common.ports.image.perceptual_hasher import ImagePerceptualHasher, PerceptualHashes
+from pix_erase.application.common.ports.transaction_manager import TransactionManager
+
+if TYPE_CHECKING:
+    from pix_erase.domain.image.entities.image import Image
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+
+class ImageSearchIndexService:
+    """Keeps perceptual hashes of the current content of images, reverse image search looks through them."""
+
+    def __init__(
+        self,
+        hasher: ImagePerceptualHasher,
+        perceptual_hash_gateway: ImagePerceptualHashGateway,
+        transaction_manager: TransactionManager,
+    ) -> None:
+        self._hasher: Final[ImagePerceptualHasher] = hasher
+        self._perceptual_hash_gateway: Final[ImagePerceptualHashGateway] = perceptual_hash_gateway
+        self._transaction_manager: Final[TransactionManager] = transaction_manager
+
+    async def index(self, image: "Image") -> None:
+        hashes: PerceptualHashes = await asyncio.to_thread(self._hasher.compute, image.data)
+
+        await self._perceptual_hash_gateway.add(image.id, hashes)
+        await self._transaction_manager.commit()
+
+        logger.info("Indexed perceptual hashes of image %s for reverse image search", image.id)
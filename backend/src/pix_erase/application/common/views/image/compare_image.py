@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 
+from pix_erase.application.common.ports.scheduler.task_id import TaskID
 from pix_erase.domain.image.ports.image_comparer_converter import ScoresDTO
 
 
@@ -11,3 +12,11 @@ class CompareImageView:
     different_names: bool
     different_width: bool
     different_height: bool
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CompareImagesResultView:
+    """The stored comparison when neither image changed since it was made, otherwise the task making a new one."""
+
+    task_id: TaskID | None = None
+    comparison: CompareImageView | None = None
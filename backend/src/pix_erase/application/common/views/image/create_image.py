@@ -1,7 +1,15 @@
 from dataclasses import dataclass
+from datetime import datetime
 from uuid import UUID
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class CreateImageView:
     image_id: UUID
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ImageUploadUrlView:
+    image_id: UUID
+    url: str
+    expires_at: datetime
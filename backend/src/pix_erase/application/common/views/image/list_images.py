@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ImageCatalogItemView:
+    image_id: UUID
+    filename: str | None
+    width: int | None
+    height: int | None
+    content_type: str | None
+    size: int | None
+    created_at: datetime
+    updated_at: datetime
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ListImagesView:
+    """A page of images, ``next_cursor`` is ``None`` on the last page."""
+
+    images: list[ImageCatalogItemView]
+    next_cursor: str | None
@@ -4,6 +4,13 @@ from datetime import datetime
 from enum import StrEnum
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ContentRangeView:
+    start: int
+    end: int
+    total_size: int
+
+
 @dataclass(frozen=True, slots=True, kw_only=True)
 class ReadImageByIDView:
     data: AsyncGenerator[bytes, None]
@@ -15,6 +22,19 @@ class ReadImageByIDView:
     etag: str | None
     created_at: datetime
     updated_at: datetime
+    content_range: ContentRangeView | None = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ImageLinkView:
+    url: str
+    expires_at: datetime
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ImageNotModifiedView:
+    etag: str | None
+    updated_at: datetime
 
 
 class CameraOrientationView(StrEnum):
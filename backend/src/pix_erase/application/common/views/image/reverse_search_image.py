@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SimilarImageView:
+    image_id: UUID
+    distance: int
+    phash_distance: int
+    dhash_distance: int
+    ahash_distance: int
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ReverseImageSearchView:
+    images: list[SimilarImageView]
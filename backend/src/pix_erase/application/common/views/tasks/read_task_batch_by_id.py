@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ReadTaskBatchItemView:
+    task_id: str
+    status: str
+    description: str
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ReadTaskBatchByIDView:
+    status: str
+    total: int
+    succeeded: int
+    failed: int
+    in_progress: int
+    tasks: list[ReadTaskBatchItemView]
@@ -5,3 +5,24 @@ class ImageNotFoundError(ApplicationError): ...
 
 
 class ImageDoesntBelongToThisUserError(ApplicationError): ...
+
+
+class ImageRangeNotSatisfiableError(ApplicationError): ...
+
+
+class BadImagePipelineError(ApplicationError): ...
+
+
+class DirectImageAccessDisabledError(ApplicationError): ...
+
+
+class UnknownBackgroundRemovalModelError(ApplicationError): ...
+
+
+class ImageNotIndexedError(ApplicationError): ...
+
+
+class BadImageComparisonBatchError(ApplicationError): ...
+
+
+class BadImageBatchError(ApplicationError): ...
@@ -2,3 +2,6 @@ from pix_erase.application.errors.base import ApplicationError
 
 
 class TaskNotFoundError(ApplicationError): ...
+
+
+class TaskBatchDoesntBelongToThisUserError(ApplicationError): ...
@@ -0,0 +1,81 @@
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final, final
+
+from pix_erase.application.common.ports.image.catalog_gateway import ImageCatalogGateway
+from pix_erase.application.common.query_params.image_cursor import ImageCatalogCursor
+from pix_erase.application.common.services.current_user import CurrentUserService
+from pix_erase.application.common.views.image.list_images import ImageCatalogItemView, ListImagesView
+
+if TYPE_CHECKING:
+    from pix_erase.application.common.query_models.image import ImageCatalogQueryModel
+    from pix_erase.domain.user.entities.user import User
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+DEFAULT_LIMIT: Final[int] = 20
+MAX_LIMIT: Final[int] = 100
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ListImagesQuery:
+    limit: int = DEFAULT_LIMIT
+    cursor: str | None = None
+
+
+@final
+class ListImagesQueryHandler:
+    """
+    - Opens to everyone.
+    - Lists images of current user from the newest one.
+    - Pages are read by cursor, a page costs the same however far from the start it is.
+    """
+
+    def __init__(
+        self,
+        current_user_service: CurrentUserService,
+        image_catalog_gateway: ImageCatalogGateway,
+    ) -> None:
+        self._current_user_service: Final[CurrentUserService] = current_user_service
+        self._image_catalog_gateway: Final[ImageCatalogGateway] = image_catalog_gateway
+
+    async def __call__(self, data: ListImagesQuery) -> ListImagesView:
+        logger.info("Started listing images, limit: %s, cursor: %s", data.limit, data.cursor)
+
+        after: ImageCatalogCursor | None = None if data.cursor is None else ImageCatalogCursor.decode(data.cursor)
+        limit: int = min(max(data.limit, 1), MAX_LIMIT)
+
+        logger.info("Getting current user")
+        current_user: User = await self._current_user_service.get_current_user()
+        logger.info("Successfully got current user id: %s", current_user.id)
+
+        # one more image tells whether there is a next page
+        images: list[ImageCatalogQueryModel] = await self._image_catalog_gateway.read_page_by_owner(
+            current_user.id,
+            limit=limit + 1,
+            after=after,
+        )
+        page: list[ImageCatalogQueryModel] = images[:limit]
+        next_cursor: str | None = None
+
+        if len(images) > limit:
+            next_cursor = ImageCatalogCursor(created_at=page[-1].created_at, image_id=page[-1].image_id).encode()
+
+        logger.info("Listed %s images of user: %s", len(page), current_user.id)
+
+        return ListImagesView(
+            images=[
+                ImageCatalogItemView(
+                    image_id=image.image_id,
+                    filename=None if image.filename is None else image.filename.value,
+                    width=None if image.width is None else image.width.value,
+                    height=None if image.height is None else image.height.value,
+                    content_type=image.content_type,
+                    size=image.size,
+                    created_at=image.created_at,
+                    updated_at=image.updated_at,
+                )
+                for image in page
+            ],
+            next_cursor=next_cursor,
+        )
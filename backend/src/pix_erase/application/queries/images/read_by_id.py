@@ -1,25 +1,148 @@
 import logging
 from dataclasses import dataclass
+from datetime import datetime
 from typing import TYPE_CHECKING, Final, cast, final
 from uuid import UUID
 
+from pix_erase.application.common.ports.image.catalog_gateway import ImageCatalogGateway
+from pix_erase.application.common.ports.image.rendition_storage import ImageRenditionStorage
 from pix_erase.application.common.ports.image.storage import ImageStorage
+from pix_erase.application.common.ports.image.url_signer import ImageUrlSigner
+from pix_erase.application.common.query_models.image import (
+    ImageByteRange,
+    ImageMetadataQueryModel,
+    ImageStreamQueryModel,
+    PresignedUrlQueryModel,
+)
 from pix_erase.application.common.services.current_user import CurrentUserService
-from pix_erase.application.common.views.image.read_image import ReadImageByIDView
-from pix_erase.application.errors.image import ImageDoesntBelongToThisUserError, ImageNotFoundError
+from pix_erase.application.common.views.image.read_image import (
+    ContentRangeView,
+    ImageLinkView,
+    ImageNotModifiedView,
+    ReadImageByIDView,
+)
+from pix_erase.application.errors.image import (
+    ImageDoesntBelongToThisUserError,
+    ImageNotFoundError,
+    ImageRangeNotSatisfiableError,
+)
 from pix_erase.domain.user.values.user_role import UserRole
 
 if TYPE_CHECKING:
-    from pix_erase.application.common.query_models.image import ImageStreamQueryModel
     from pix_erase.domain.image.values.image_id import ImageID
     from pix_erase.domain.user.entities.user import User
 
 logger: Final[logging.Logger] = logging.getLogger(__name__)
+WEAK_ETAG_PREFIX: Final[str] = "W/"
+ANY_ETAG: Final[str] = "*"
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RequestedByteRange:
+    """
+    ``bytes=start-end`` of HTTP ``Range``, ``end`` is inclusive and may be omitted.
+
+    Without ``start`` the range is a suffix: the last ``end`` bytes of the image.
+    """
+
+    start: int | None = None
+    end: int | None = None
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class ReadImageByIDQuery:
     image_id: UUID
+    byte_range: RequestedByteRange | None = None
+    # validators of the copy the client already has
+    if_none_match: tuple[str, ...] = ()
+    if_modified_since: datetime | None = None
+    # the range is served only if the image is still the one the client started to download
+    if_range: str | datetime | None = None
+    # the longest side the client shows, a fitting rendition is served instead of the original
+    size: int | None = None
+
+    @property
+    def is_conditional(self) -> bool:
+        return self.byte_range is not None or self.has_validators
+
+    @property
+    def has_validators(self) -> bool:
+        return bool(self.if_none_match) or self.if_modified_since is not None
+
+
+def _opaque_tag(etag: str) -> str:
+    return etag.removeprefix(WEAK_ETAG_PREFIX).strip('"')
+
+
+def _is_not_modified(data: ReadImageByIDQuery, metadata: ImageMetadataQueryModel) -> bool:
+    """If-None-Match wins over If-Modified-Since, as RFC 9110 says. ETags are compared weakly here."""
+    if data.if_none_match:
+        if ANY_ETAG in data.if_none_match:
+            return True
+
+        return metadata.etag is not None and _opaque_tag(metadata.etag) in {
+            _opaque_tag(etag) for etag in data.if_none_match
+        }
+
+    if data.if_modified_since is not None:
+        # HTTP dates have no fractions of a second
+        return metadata.updated_at.replace(microsecond=0) <= data.if_modified_since
+
+    return False
+
+
+def _read_image_view(stream: ImageStreamQueryModel, content_range: ContentRangeView | None = None) -> ReadImageByIDView:
+    return ReadImageByIDView(
+        data=stream.stream,
+        name=stream.filename.value,
+        height=stream.height.value,
+        width=stream.width.value,
+        content_type=stream.content_type,
+        content_length=stream.content_length,
+        created_at=stream.created_at,
+        updated_at=stream.updated_at,
+        etag=stream.etag,
+        content_range=content_range,
+    )
+
+
+def _range_applies(if_range: str | datetime | None, metadata: ImageMetadataQueryModel) -> bool:
+    if if_range is None:
+        return True
+
+    if isinstance(if_range, datetime):
+        return metadata.updated_at.replace(microsecond=0) == if_range
+
+    # If-Range needs the strong comparison, a weak ETag never matches
+    return (
+        metadata.etag is not None
+        and not if_range.startswith(WEAK_ETAG_PREFIX)
+        and not metadata.etag.startswith(WEAK_ETAG_PREFIX)
+        and _opaque_tag(if_range) == _opaque_tag(metadata.etag)
+    )
+
+
+def _resolve_range(data: ReadImageByIDQuery, metadata: ImageMetadataQueryModel) -> ImageByteRange | None:
+    """Turns the requested range into offsets inside the image, ``None`` means the whole image is sent."""
+    if data.byte_range is None or not _range_applies(data.if_range, metadata):
+        return None
+
+    total_size: int = metadata.content_length
+    start: int | None = data.byte_range.start
+    end: int | None = data.byte_range.end
+
+    if start is None:
+        if not end or total_size == 0:
+            msg = f"Range of the last {end} bytes can't be served, size of the image is {total_size}"
+            raise ImageRangeNotSatisfiableError(msg)
+
+        return ImageByteRange(start=max(total_size - end, 0), end=total_size - 1)
+
+    if start < 0 or start >= total_size or (end is not None and end < start):
+        msg = f"Range {start}-{end if end is not None else ''} can't be served, size of the image is {total_size}"
+        raise ImageRangeNotSatisfiableError(msg)
+
+    return ImageByteRange(start=start, end=total_size - 1 if end is None else min(end, total_size - 1))
 
 
 @final
@@ -29,17 +152,27 @@ class ReadImageByIDQueryHandler:
     - Admins and Super Admins can read images from all users
     - Usual user can read only his images
     - Returns stream for better performance
+    - Supports ranges and conditional reads: a copy the client has is checked by metadata only
+    - With direct access to the storage enabled returns a short-lived link instead of bytes,
+      the storage serves ranges and conditional reads itself then
+    - With a size returns a reduced WebP copy of the image while it exists, ranges aren't served for it
     """
 
     def __init__(
         self,
         image_storage: ImageStorage,
         current_user_service: CurrentUserService,
+        image_catalog_gateway: ImageCatalogGateway,
+        image_url_signer: ImageUrlSigner,
+        image_rendition_storage: ImageRenditionStorage,
     ) -> None:
         self._image_storage: Final[ImageStorage] = image_storage
         self._current_user_service: Final[CurrentUserService] = current_user_service
+        self._image_catalog_gateway: Final[ImageCatalogGateway] = image_catalog_gateway
+        self._image_url_signer: Final[ImageUrlSigner] = image_url_signer
+        self._image_rendition_storage: Final[ImageRenditionStorage] = image_rendition_storage
 
-    async def __call__(self, data: ReadImageByIDQuery) -> ReadImageByIDView:
+    async def __call__(self, data: ReadImageByIDQuery) -> ReadImageByIDView | ImageNotModifiedView | ImageLinkView:
         logger.info("Started reading image by id, id of the image: %s", data.image_id)
 
         logger.info("Started getting current user for reading image by id: %s", data.image_id)
@@ -48,16 +181,55 @@ class ReadImageByIDQueryHandler:
 
         typed_image_id: ImageID = cast("ImageID", data.image_id)
 
-        if (
-            current_user.role not in (UserRole.ADMIN, UserRole.SUPER_ADMIN)
-            and typed_image_id not in current_user.images
-        ):
+        if current_user.role not in (
+            UserRole.ADMIN,
+            UserRole.SUPER_ADMIN,
+        ) and not await self._image_catalog_gateway.is_owned_by(image_id=typed_image_id, owner_id=current_user.id):
             msg = f"Image with id: {data.image_id}, doesn't belong to user with id: {current_user.id}"
             raise ImageDoesntBelongToThisUserError(msg)
 
-        logger.info("Started requesting stream for reading image by id: %s", data.image_id)
+        if data.size is not None:
+            rendition: ReadImageByIDView | ImageNotModifiedView | None = await self._read_rendition(
+                data,
+                typed_image_id,
+                data.size,
+            )
+
+            if rendition is not None:
+                return rendition
+
+            logger.info("No rendition of image by id: %s for size: %s, reading the original", data.image_id, data.size)
+
+        if self._image_url_signer.is_enabled():
+            link: PresignedUrlQueryModel | None = await self._image_url_signer.sign_download(typed_image_id)
+
+            if link is None:
+                msg = f"Image with id {data.image_id} not found"
+                raise ImageNotFoundError(msg)
+
+            logger.info("Returning link to image by id: %s, expires at: %s", data.image_id, link.expires_at)
+            return ImageLinkView(url=link.url, expires_at=link.expires_at)
+
+        byte_range: ImageByteRange | None = None
+        total_size: int | None = None
+
+        if data.is_conditional:
+            metadata: ImageMetadataQueryModel | None = await self._image_storage.read_metadata_by_id(typed_image_id)
+
+            if metadata is None:
+                msg = f"Image with id {data.image_id} not found"
+                raise ImageNotFoundError(msg)
+
+            if _is_not_modified(data, metadata):
+                logger.info("Image by id: %s is not modified, skipping its bytes", data.image_id)
+                return ImageNotModifiedView(etag=metadata.etag, updated_at=metadata.updated_at)
+
+            byte_range = _resolve_range(data, metadata)
+            total_size = metadata.content_length
 
-        stream: ImageStreamQueryModel | None = await self._image_storage.stream_by_id(typed_image_id)
+        logger.info("Started requesting stream for reading image by id: %s, range: %s", data.image_id, byte_range)
+
+        stream: ImageStreamQueryModel | None = await self._image_storage.stream_by_id(typed_image_id, byte_range)
 
         if stream is None:
             msg = f"Image with id {data.image_id} not found"
@@ -65,18 +237,45 @@ class ReadImageByIDQueryHandler:
 
         logger.info("Stream by image id: %s is not None, returning data to view", data.image_id)
 
-        view: ReadImageByIDView = ReadImageByIDView(
-            data=stream.stream,
-            name=stream.filename.value,
-            height=stream.height.value,
-            width=stream.width.value,
-            content_type=stream.content_type,
-            content_length=stream.content_length,
-            created_at=stream.created_at,
-            updated_at=stream.updated_at,
-            etag=stream.etag,
-        )
+        content_range: ContentRangeView | None = None
+
+        if stream.byte_range is not None and total_size is not None:
+            content_range = ContentRangeView(
+                start=stream.byte_range.start,
+                end=stream.byte_range.end,
+                total_size=total_size,
+            )
+
+        view: ReadImageByIDView = _read_image_view(stream, content_range)
 
         logger.info("Finished retrieving stream for reading image by id: %s", data.image_id)
 
         return view
+
+    async def _read_rendition(
+        self,
+        data: ReadImageByIDQuery,
+        image_id: "ImageID",
+        size: int,
+    ) -> ReadImageByIDView | ImageNotModifiedView | None:
+        if data.has_validators:
+            metadata: ImageMetadataQueryModel | None = await self._image_rendition_storage.read_metadata_by_id(
+                image_id,
+                size,
+            )
+
+            if metadata is None:
+                return None
+
+            if _is_not_modified(data, metadata):
+                logger.info("Rendition of image by id: %s is not modified, skipping its bytes", data.image_id)
+                return ImageNotModifiedView(etag=metadata.etag, updated_at=metadata.updated_at)
+
+        stream: ImageStreamQueryModel | None = await self._image_rendition_storage.stream_by_id(image_id, size)
+
+        if stream is None:
+            return None
+
+        logger.info("Returning rendition of image by id: %s for size: %s", data.image_id, size)
+
+        return _read_image_view(stream)
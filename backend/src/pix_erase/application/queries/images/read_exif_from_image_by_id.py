@@ -1,10 +1,10 @@
 import logging
-from collections import deque
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Final, cast, final
 from uuid import UUID
 
+from pix_erase.application.common.ports.image.catalog_gateway import ImageCatalogGateway
 from pix_erase.application.common.ports.image.extractor import ImageInfo, ImageInfoExtractor
 from pix_erase.application.common.ports.image.storage import ImageStorage
 from pix_erase.application.common.services.current_user import CurrentUserService
@@ -21,15 +21,17 @@ from pix_erase.application.common.views.image.read_image import (
     WhiteBalanceView,
 )
 from pix_erase.application.errors.image import ImageDoesntBelongToThisUserError, ImageNotFoundError
+from pix_erase.domain.image.values.image_id import ImageID
 from pix_erase.domain.user.values.user_role import UserRole
 
 if TYPE_CHECKING:
-    from pix_erase.application.common.query_models.image import ImageStreamQueryModel
-    from pix_erase.domain.image.values.image_id import ImageID
+    from pix_erase.application.common.query_models.image import ImageRangeQueryModel
     from pix_erase.domain.user.entities.user import User
 
 logger: Final[logging.Logger] = logging.getLogger(__name__)
 UNKNOWN_FIELD: Final[str] = "unknown"
+# EXIF of JPEG lives in its first kilobytes, the rest of the image is read only when the metadata goes beyond
+METADATA_PREFIX_SIZE: Final[int] = 64 * 1024
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -48,10 +50,12 @@ class ReadExifFromImageByIDQueryHandler:
     def __init__(
         self,
         current_user_service: CurrentUserService,
+        image_catalog_gateway: ImageCatalogGateway,
         image_storage: ImageStorage,
         image_extractor: ImageInfoExtractor,
     ) -> None:
         self._current_user_service: Final[CurrentUserService] = current_user_service
+        self._image_catalog_gateway: Final[ImageCatalogGateway] = image_catalog_gateway
         self._image_storage: Final[ImageStorage] = image_storage
         self._image_extractor: Final[ImageInfoExtractor] = image_extractor
 
@@ -67,26 +71,16 @@ class ReadExifFromImageByIDQueryHandler:
 
         typed_image_id: ImageID = cast("ImageID", data.image_id)
 
-        if (
-            current_user.role not in (UserRole.ADMIN, UserRole.SUPER_ADMIN)
-            and typed_image_id not in current_user.images
-        ):
+        if current_user.role not in (
+            UserRole.ADMIN,
+            UserRole.SUPER_ADMIN,
+        ) and not await self._image_catalog_gateway.is_owned_by(image_id=typed_image_id, owner_id=current_user.id):
             msg = f"Image with id: {data.image_id}, doesn't belong to user with id: {current_user.id}"
             raise ImageDoesntBelongToThisUserError(msg)
 
-        stream: ImageStreamQueryModel | None = await self._image_storage.stream_by_id(typed_image_id)
+        image_data: bytes = await self._read_metadata(typed_image_id)
 
-        if stream is None:
-            msg = f"Image with id {data.image_id} not found"
-            raise ImageNotFoundError(msg)
-
-        logger.debug("Started collecting chunks from image storage, image id: %s", data.image_id)
-        collected_chunks: deque[bytes] = deque()
-
-        async for chunk in stream.stream:
-            collected_chunks.append(chunk)
-
-        image_info_dto: ImageInfo = await self._image_extractor.extract(data=b"".join(collected_chunks))
+        image_info_dto: ImageInfo = await self._image_extractor.extract(data=image_data)
         logger.debug("Successfully got image info by id: %s", data.image_id)
 
         image_format: str = image_info_dto.format if image_info_dto.format is not None else UNKNOWN_FIELD
@@ -326,3 +320,27 @@ class ReadExifFromImageByIDQueryHandler:
             gps_info=gps_info,
             datetime_info=datetime_info,
         )
+
+    async def _read_metadata(self, image_id: ImageID) -> bytes:
+        """Reads a prefix of the image and extends it while the extractor needs more bytes."""
+        image_range: ImageRangeQueryModel | None = await self._image_storage.read_range(
+            image_id,
+            offset=0,
+            size=METADATA_PREFIX_SIZE,
+        )
+        head: bytes = b""
+
+        while image_range is not None:
+            head += image_range.data
+            required_size: int | None = self._image_extractor.metadata_size(head)
+
+            if len(head) >= image_range.total_size or (required_size is not None and required_size <= len(head)):
+                logger.debug("Read %s of %s bytes of image %s", len(head), image_range.total_size, image_id)
+                return head
+
+            # at least double the prefix, so a chain of long segments costs a few requests
+            size: int = image_range.total_size if required_size is None else max(required_size, 2 * len(head))
+            image_range = await self._image_storage.read_range(image_id, offset=len(head), size=size - len(head))
+
+        msg = f"Image with id {image_id} not found"
+        raise ImageNotFoundError(msg)
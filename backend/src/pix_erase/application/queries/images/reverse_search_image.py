@@ -1,8 +1,108 @@
+import logging
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final, cast, final
+from uuid import UUID
+
+from pix_erase.application.common.ports.image.catalog_gateway import ImageCatalogGateway
+from pix_erase.application.common.ports.image.perceptual_hash_gateway import ImagePerceptualHashGateway
+from pix_erase.application.common.ports.image.similarity_index import ImageSimilarityIndex
+from pix_erase.application.common.services.current_user import CurrentUserService
+from pix_erase.application.common.views.image.reverse_search_image import ReverseImageSearchView, SimilarImageView
+from pix_erase.application.errors.image import ImageDoesntBelongToThisUserError, ImageNotIndexedError
+from pix_erase.domain.user.values.user_role import UserRole
+
+if TYPE_CHECKING:
+    from collections.abc import Set as AbstractSet
+
+    from pix_erase.application.common.ports.image.perceptual_hasher import PerceptualHashes
+    from pix_erase.application.common.query_models.image import SimilarImageQueryModel
+    from pix_erase.domain.image.values.image_id import ImageID
+    from pix_erase.domain.user.entities.user import User
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+DEFAULT_MAX_DISTANCE: Final[int] = 10
+DEFAULT_LIMIT: Final[int] = 20
+# a larger distance matches unrelated images and makes the search walk most of the index
+MAX_DISTANCE: Final[int] = 32
+MAX_LIMIT: Final[int] = 100
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
-class ReverseImageSearchQuery: ...
+class ReverseImageSearchQuery:
+    image_id: UUID
+    max_distance: int = DEFAULT_MAX_DISTANCE
+    limit: int = DEFAULT_LIMIT
+
+
+@final
+class ReverseImageSearchQueryHandler:
+    """
+    - Finds images that look like the given one: resized, recompressed or slightly edited copies.
+    - Only current user can search by his images and finds only his images.
+    - Admins and super admins can search by every image through all images.
+    - Images are compared by perceptual hashes, an image is searchable a few seconds after it's stored.
+    """
+
+    def __init__(
+        self,
+        current_user_service: CurrentUserService,
+        image_catalog_gateway: ImageCatalogGateway,
+        perceptual_hash_gateway: ImagePerceptualHashGateway,
+        similarity_index: ImageSimilarityIndex,
+    ) -> None:
+        self._current_user_service: Final[CurrentUserService] = current_user_service
+        self._image_catalog_gateway: Final[ImageCatalogGateway] = image_catalog_gateway
+        self._perceptual_hash_gateway: Final[ImagePerceptualHashGateway] = perceptual_hash_gateway
+        self._similarity_index: Final[ImageSimilarityIndex] = similarity_index
+
+    async def __call__(self, data: ReverseImageSearchQuery) -> ReverseImageSearchView:
+        logger.info("Started reverse image search by image with id: %s", data.image_id)
+
+        logger.info("Getting current user id")
+        current_user: User = await self._current_user_service.get_current_user()
+        logger.info("Successfully got current user id: %s", current_user.id)
+
+        typed_image_id: ImageID = cast("ImageID", data.image_id)
+        is_admin: bool = current_user.role in (UserRole.ADMIN, UserRole.SUPER_ADMIN)
+
+        if not is_admin and not await self._image_catalog_gateway.is_owned_by(
+            image_id=typed_image_id, owner_id=current_user.id
+        ):
+            msg = f"Image with id: {data.image_id}, doesn't belong to user with id: {current_user.id}"
+            raise ImageDoesntBelongToThisUserError(msg)
+
+        hashes: PerceptualHashes | None = await self._perceptual_hash_gateway.read_by_id(typed_image_id)
+
+        if hashes is None:
+            msg = f"Image with id: {data.image_id} isn't indexed for search yet, try again later"
+            raise ImageNotIndexedError(msg)
+
+        among: AbstractSet[ImageID] | None = (
+            None if is_admin else await self._image_catalog_gateway.read_ids_by_owner(current_user.id)
+        )
+        max_distance: int = min(max(data.max_distance, 0), MAX_DISTANCE)
+        limit: int = min(max(data.limit, 1), MAX_LIMIT)
+        # the image itself is always found, it's dropped from the results
+        found: list[SimilarImageQueryModel] = await self._similarity_index.search(
+            hashes,
+            max_distance=max_distance,
+            limit=limit + 1,
+            among=among,
+        )
 
+        logger.info("Found %s images similar to image with id: %s", len(found), data.image_id)
 
-class ReverseImageSearchQueryHandler: ...
+        return ReverseImageSearchView(
+            images=[
+                SimilarImageView(
+                    image_id=image.image_id,
+                    distance=image.distance,
+                    phash_distance=image.phash_distance,
+                    dhash_distance=image.dhash_distance,
+                    ahash_distance=image.ahash_distance,
+                )
+                for image in found
+                if image.image_id != typed_image_id
+            ][:limit],
+        )
@@ -0,0 +1,72 @@
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final, final
+
+from pix_erase.application.common.ports.scheduler.task_id import TaskBatchID, TaskBatchInfo, TaskInfoStatus
+from pix_erase.application.common.ports.scheduler.task_scheduler import TaskScheduler
+from pix_erase.application.common.services.current_user import CurrentUserService
+from pix_erase.application.common.views.tasks.read_task_batch_by_id import (
+    ReadTaskBatchByIDView,
+    ReadTaskBatchItemView,
+)
+from pix_erase.application.errors.task import TaskBatchDoesntBelongToThisUserError, TaskNotFoundError
+from pix_erase.domain.user.values.user_role import UserRole
+
+if TYPE_CHECKING:
+    from pix_erase.domain.user.entities.user import User
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ReadTaskBatchByIDQuery:
+    batch_id: str
+
+
+@final
+class ReadTaskBatchByIDQueryHandler:
+    """
+    - Opens to the user who sent the batch and to admins.
+    - Get progress of every task of the batch and the status of the whole batch.
+    - The batch succeeds when all tasks succeed and fails when all tasks finish and some of them fail.
+    """
+
+    def __init__(self, scheduler: TaskScheduler, current_user_service: CurrentUserService) -> None:
+        self._scheduler: Final[TaskScheduler] = scheduler
+        self._current_user_service: Final[CurrentUserService] = current_user_service
+
+    async def __call__(self, data: ReadTaskBatchByIDQuery) -> ReadTaskBatchByIDView:
+        logger.info("Started reading task batch with id: %s", data.batch_id)
+
+        current_user: User = await self._current_user_service.get_current_user()
+
+        batch_info: TaskBatchInfo | None = await self._scheduler.read_batch_info(batch_id=TaskBatchID(data.batch_id))
+
+        if batch_info is None:
+            msg = f"task batch with id {data.batch_id} not found"
+            raise TaskNotFoundError(msg)
+
+        if current_user.role not in (UserRole.ADMIN, UserRole.SUPER_ADMIN) and batch_info.owner_id != current_user.id:
+            msg = f"Task batch with id: {data.batch_id}, doesn't belong to user with id: {current_user.id}"
+            raise TaskBatchDoesntBelongToThisUserError(msg)
+
+        succeeded: int = sum(task.status == TaskInfoStatus.SUCCESS for task in batch_info.tasks)
+        failed: int = sum(task.status == TaskInfoStatus.FAILURE for task in batch_info.tasks)
+        in_progress: int = len(batch_info.tasks) - succeeded - failed
+
+        status: TaskInfoStatus = TaskInfoStatus.PROCESSING
+
+        if in_progress == 0:
+            status = TaskInfoStatus.FAILURE if failed else TaskInfoStatus.SUCCESS
+
+        return ReadTaskBatchByIDView(
+            status=status,
+            total=len(batch_info.tasks),
+            succeeded=succeeded,
+            failed=failed,
+            in_progress=in_progress,
+            tasks=[
+                ReadTaskBatchItemView(task_id=task.task_id, status=task.status, description=task.description)
+                for task in batch_info.tasks
+            ],
+        )
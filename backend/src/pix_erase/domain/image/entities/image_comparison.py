@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import datetime
 
 from pix_erase.domain.common.entities.base_aggregate import BaseAggregateRoot
 from pix_erase.domain.image.ports.image_comparer_converter import ScoresDTO
@@ -16,3 +17,11 @@ class ImageComparison(BaseAggregateRoot[ComparisonID]):
     different_names: bool
     different_width: bool
     different_height: bool
+    images_updated_at: datetime | None = None
+
+    def is_up_to_date(self, first_image_updated_at: datetime, second_image_updated_at: datetime) -> bool:
+        """Whether the comparison was made of the current versions of both images."""
+        if self.images_updated_at is None:
+            return False
+
+        return self.images_updated_at >= max(first_image_updated_at, second_image_updated_at)
@@ -14,3 +14,9 @@ class UnknownImageUpscalerError(DomainError): ...
 
 
 class BadImageUpscaleAlgorithmError(DomainError): ...
+
+
+class EmptyImagePipelineError(DomainError): ...
+
+
+class BadImageEncodingError(DomainError): ...
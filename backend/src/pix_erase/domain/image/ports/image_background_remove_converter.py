@@ -1,7 +1,18 @@
 from abc import abstractmethod
-from typing import Protocol
+from typing import Final, Literal, Protocol, get_args
+
+from pix_erase.domain.image.values.image_encoding import ImageEncoding
+
+# u2net gives the best edges, u2netp and silueta are lighter and faster
+BackgroundRemovalModel = Literal["u2net", "u2netp", "silueta"]
+BACKGROUND_REMOVAL_MODELS: Final[tuple[BackgroundRemovalModel, ...]] = get_args(BackgroundRemovalModel)
 
 
 class ImageRemoveBackgroundConverter(Protocol):
     @abstractmethod
-    def convert(self, data: bytes) -> bytes: ...
+    def convert(
+        self,
+        data: bytes,
+        model: BackgroundRemovalModel | None = None,
+        encoding: ImageEncoding | None = None,
+    ) -> bytes: ...
@@ -1,5 +1,6 @@
 from abc import abstractmethod
-from typing import Protocol, TypedDict
+from collections.abc import Sequence
+from typing import NotRequired, Protocol, TypedDict
 
 
 class ScoresDTO(TypedDict):
@@ -10,8 +11,27 @@ class ScoresDTO(TypedDict):
     MSE: float  # Mean Squared Error
     PSNR: float  # Peak Signal-to-Noise Ratio
     SSIM: float  # Structural Similarity Index
+    MS_SSIM: NotRequired[float]  # Multi-Scale Structural Similarity Index
 
 
 class ImageComparerConverter(Protocol):
     @abstractmethod
     def compare_by_histograms(self, first_image: bytes, second_image: bytes) -> ScoresDTO: ...
+
+    @abstractmethod
+    def extract_features(self, image: bytes) -> bytes:
+        """
+        Decodes the image once into features for batch comparisons.
+        Features are opaque for callers: they are only cached and passed to ``compare_features``.
+        """
+
+    @abstractmethod
+    def compare_features(self, reference: bytes, candidates: Sequence[bytes]) -> list[ScoresDTO]:
+        """Compares features of one image with features of every candidate, scores go in order of candidates."""
+
+    @abstractmethod
+    def compare_features_pairwise(self, features: Sequence[bytes]) -> list[list[ScoresDTO]]:
+        """
+        Compares features of every image with features of every following one in a single call.
+        Item ``i`` holds scores of image ``i`` with images ``i + 1`` and on in their order, the last item is empty.
+        """
@@ -0,0 +1,69 @@
+from abc import abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Literal, Protocol
+
+from pix_erase.domain.image.ports.image_background_remove_converter import BackgroundRemovalModel
+from pix_erase.domain.image.values.image_encoding import ImageEncoding
+from pix_erase.domain.image.values.image_scale import ImageScale
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RotateImageOperation:
+    angle: int
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class GrayscaleImageOperation: ...
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CompressImageOperation:
+    quality: int
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UpscaleImageOperation:
+    algorithm: Literal["AI", "NearestNeighbour"]
+    scale: ImageScale
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RemoveBackgroundImageOperation:
+    model: BackgroundRemovalModel | None = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RemoveWatermarkImageOperation: ...
+
+
+type ImageOperation = (
+    RotateImageOperation
+    | GrayscaleImageOperation
+    | CompressImageOperation
+    | UpscaleImageOperation
+    | RemoveBackgroundImageOperation
+    | RemoveWatermarkImageOperation
+)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ProcessedImageDTO:
+    data: bytes
+    width: int
+    height: int
+
+
+class ImagePipelineConverter(Protocol):
+    @abstractmethod
+    def convert(
+        self,
+        data: bytes,
+        operations: Sequence[ImageOperation],
+        encoding: ImageEncoding | None = None,
+    ) -> ProcessedImageDTO:
+        """
+        Decodes ``data`` once, applies ``operations`` in the given order and encodes the result once.
+        Quality of a ``compress`` operation overrides the quality of ``encoding``.
+        """
+        ...
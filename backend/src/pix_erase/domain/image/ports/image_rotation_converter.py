@@ -1,7 +1,9 @@
 from abc import abstractmethod
 from typing import Protocol
 
+from pix_erase.domain.image.values.image_encoding import ImageEncoding
+
 
 class ImageRotationConverter(Protocol):
     @abstractmethod
-    def convert(self, data: bytes, angle: int = 90) -> bytes: ...
+    def convert(self, data: bytes, angle: int = 90, encoding: ImageEncoding | None = None) -> bytes: ...
@@ -1,7 +1,9 @@
 from abc import abstractmethod
 from typing import Protocol
 
+from pix_erase.domain.image.values.image_encoding import ImageEncoding
+
 
 class ImageWatermarkRemoverConverter(Protocol):
     @abstractmethod
-    def convert(self, data: bytes) -> bytes: ...
+    def convert(self, data: bytes, encoding: ImageEncoding | None = None) -> bytes: ...
@@ -7,12 +7,16 @@ from pix_erase.domain.image.entities.image import Image
 from pix_erase.domain.image.errors.image import UnknownImageUpscalerError
 from pix_erase.domain.image.events import ImageConvertedEvent
 from pix_erase.domain.image.ports.image_ai_upscaler_converter import ImageAIUpscaleConverter
-from pix_erase.domain.image.ports.image_background_remove_converter import ImageRemoveBackgroundConverter
+from pix_erase.domain.image.ports.image_background_remove_converter import (
+    BackgroundRemovalModel,
+    ImageRemoveBackgroundConverter,
+)
 from pix_erase.domain.image.ports.image_color_to_gray_converter import ImageColorToCrayScaleConverter
 from pix_erase.domain.image.ports.image_nearest_neighbour_upscale_converter import (
     ImageNearestNeighbourUpscalerConverter,
 )
 from pix_erase.domain.image.ports.image_watermark_remover_converter import ImageWatermarkRemoverConverter
+from pix_erase.domain.image.values.image_encoding import ImageEncoding
 from pix_erase.domain.image.values.image_scale import ImageScale
 
 logger: Final[logging.Logger] = logging.getLogger(__name__)
@@ -36,10 +40,10 @@ class ImageColorizationService(DomainService):
             image_nearest_upscale_converter
         )
 
-    def convert_color_to_gray(self, image: Image) -> None:
+    def convert_color_to_gray(self, image: Image, encoding: ImageEncoding | None = None) -> None:
         logger.debug("Started converting color to gray, image name: %s", image.name)
 
-        converted_data: bytes = self._colorization_converter.convert(data=image.data)
+        converted_data: bytes = self._colorization_converter.convert(data=image.data, encoding=encoding)
         image.data = converted_data
         image.updated_at = datetime.now(UTC)
 
@@ -52,13 +56,19 @@ class ImageColorizationService(DomainService):
             )
         )
 
-    def remove_background(self, image: Image) -> None:
+    def remove_background(
+        self,
+        image: Image,
+        model: BackgroundRemovalModel | None = None,
+        encoding: ImageEncoding | None = None,
+    ) -> None:
         logger.debug(
-            "Started removing background, image name: %s",
+            "Started removing background, image name: %s, model: %s",
             image.name,
+            model,
         )
 
-        converted_data: bytes = self._remove_converter.convert(data=image.data)
+        converted_data: bytes = self._remove_converter.convert(data=image.data, model=model, encoding=encoding)
 
         logger.debug("Successfully removed background, image name: %s", image.name)
         image.data = converted_data
@@ -73,10 +83,10 @@ class ImageColorizationService(DomainService):
             )
         )
 
-    def remove_watermark(self, image: Image) -> None:
+    def remove_watermark(self, image: Image, encoding: ImageEncoding | None = None) -> None:
         logger.debug("Started removing watermark, image name: %s", image.name)
 
-        converted_data: bytes = self._watermark_converter.convert(data=image.data)
+        converted_data: bytes = self._watermark_converter.convert(data=image.data, encoding=encoding)
 
         logger.debug("Successfully removed watermark, image name: %s", image.name)
 
@@ -93,7 +103,11 @@ class ImageColorizationService(DomainService):
         )
 
     def upscale(
-        self, image: Image, algorithm: Literal["AI", "NearestNeighbour"], scale: ImageScale | None = None
+        self,
+        image: Image,
+        algorithm: Literal["AI", "NearestNeighbour"],
+        scale: ImageScale | None = None,
+        encoding: ImageEncoding | None = None,
     ) -> None:
         if scale is None:
             scale = ImageScale(2)
@@ -103,11 +117,11 @@ class ImageColorizationService(DomainService):
 
         if algorithm == "NearestNeighbour":
             converted_data = self._image_nearest_upscale_converter.convert(
-                data=image.data, width=image.width.value, height=image.height.value, scale=scale
+                data=image.data, width=image.width.value, height=image.height.value, scale=scale, encoding=encoding
             )
         elif algorithm == "AI":
             converted_data = self._image_ai_upscale_converter.convert(
-                data=image.data, width=image.width.value, height=image.height.value, scale=scale
+                data=image.data, width=image.width.value, height=image.height.value, scale=scale, encoding=encoding
             )
         else:
             msg = "Unknown algorithm for upscaling."  # type: ignore[unreachable]
@@ -1,6 +1,6 @@
 import logging
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING, Final
+from typing import Final
 
 from pix_erase.domain.common.services.base import DomainService
 from pix_erase.domain.image.entities.image import Image
@@ -8,12 +8,10 @@ from pix_erase.domain.image.ports.id_generator import ImageIdGenerator
 from pix_erase.domain.image.ports.image_comparer_converter import ImageComparerConverter
 from pix_erase.domain.image.ports.image_resizer import ImageResizerConverter
 from pix_erase.domain.image.services.contracts import ImageComparisonResult
+from pix_erase.domain.image.values.image_id import ImageID
 from pix_erase.domain.image.values.image_name import ImageName
 from pix_erase.domain.image.values.image_size import ImageSize
 
-if TYPE_CHECKING:
-    from pix_erase.domain.image.values.image_id import ImageID
-
 logger: Final[logging.Logger] = logging.getLogger(__name__)
 
 
@@ -29,6 +27,10 @@ class ImageService(DomainService):
         self._image_resizer: Final[ImageResizerConverter] = image_resizer
         self._image_comparer: Final[ImageComparerConverter] = image_comparer
 
+    def next_image_id(self) -> ImageID:
+        """Identity of an image whose bytes are stored before the entity exists, like a streamed upload."""
+        return self._id_generator()
+
     def create(
         self,
         image_name: ImageName,
@@ -0,0 +1,61 @@
+import logging
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from typing import Final
+
+from pix_erase.domain.common.services.base import DomainService
+from pix_erase.domain.image.entities.image import Image
+from pix_erase.domain.image.errors.image import EmptyImagePipelineError
+from pix_erase.domain.image.events import ImageConvertedEvent
+from pix_erase.domain.image.ports.image_pipeline_converter import (
+    ImageOperation,
+    ImagePipelineConverter,
+    ProcessedImageDTO,
+)
+from pix_erase.domain.image.values.image_encoding import ImageEncoding
+from pix_erase.domain.image.values.image_size import ImageSize
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+
+class ImagePipelineService(DomainService):
+    def __init__(self, pipeline_converter: ImagePipelineConverter) -> None:
+        super().__init__()
+        self._pipeline_converter: Final[ImagePipelineConverter] = pipeline_converter
+
+    def process(
+        self,
+        image: Image,
+        operations: Sequence[ImageOperation],
+        encoding: ImageEncoding | None = None,
+    ) -> None:
+        """
+        Applies all operations to the image in one pass, so the image is decoded and encoded only once.
+        """
+        if not operations:
+            msg = "At least one operation must be provided for image processing."
+            raise EmptyImagePipelineError(msg)
+
+        logger.debug("Started processing image pipeline, image name: %s, operations: %s", image.name, len(operations))
+
+        processed_image: ProcessedImageDTO = self._pipeline_converter.convert(
+            data=image.data,
+            operations=operations,
+            encoding=encoding,
+        )
+
+        logger.debug("Successfully processed image pipeline, image name: %s", image.name)
+
+        image.data = processed_image.data
+        image.width = ImageSize(processed_image.width)
+        image.height = ImageSize(processed_image.height)
+        image.updated_at = datetime.now(UTC)
+
+        self._record_event(
+            ImageConvertedEvent(
+                name=image.name.value,
+                width=image.width.value,
+                height=image.height.value,
+                method="process_pipeline",
+            )
+        )
@@ -5,6 +5,7 @@ from typing import Final
 from pix_erase.domain.image.entities.image import Image
 from pix_erase.domain.image.ports.image_compress_converter import ImageCompressConverter
 from pix_erase.domain.image.ports.image_rotation_converter import ImageRotationConverter
+from pix_erase.domain.image.values.image_encoding import ImageEncoding
 
 logger: Final[logging.Logger] = logging.getLogger(__name__)
 
@@ -18,20 +19,20 @@ class ImageTransformationService:
         self._compress_converter: Final[ImageCompressConverter] = compress_converter
         self._rotation_converter: Final[ImageRotationConverter] = rotation_converter
 
-    def compress_image(self, image: Image, quality: int = 90) -> None:
+    def compress_image(self, image: Image, quality: int = 90, encoding: ImageEncoding | None = None) -> None:
         logger.debug("Started compressing image, image name: %s", image.name)
 
-        converted_data: bytes = self._compress_converter.convert(data=image.data, quality=quality)
+        converted_data: bytes = self._compress_converter.convert(data=image.data, quality=quality, encoding=encoding)
 
         logger.debug("Successfully compressed image, image name: %s", image.name)
 
         image.data = converted_data
         image.updated_at = datetime.now(UTC)
 
-    def rotate_image(self, image: Image, angle: int = 90) -> None:
+    def rotate_image(self, image: Image, angle: int = 90, encoding: ImageEncoding | None = None) -> None:
         logger.debug("Started rotating image, image name: %s", image.name)
 
-        converted_data: bytes = self._rotation_converter.convert(data=image.data, angle=angle)
+        converted_data: bytes = self._rotation_converter.convert(data=image.data, angle=angle, encoding=encoding)
 
         logger.debug("Successfully rotated image, image name: %s", image.name)
 
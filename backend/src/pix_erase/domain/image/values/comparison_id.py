@@ -1,4 +1,13 @@
+import uuid
 from typing import NewType
 from uuid import UUID
 
+from pix_erase.domain.image.values.image_id import ImageID
+
 ComparisonID = NewType("ComparisonID", UUID)
+
+
+def comparison_id_for(first_image_id: ImageID, second_image_id: ImageID) -> ComparisonID:
+    """The ID is derived from IDs of images, the same pair gets the same ID in any order."""
+    first, second = sorted((str(first_image_id), str(second_image_id)))
+    return ComparisonID(uuid.uuid5(uuid.NAMESPACE_DNS, f"{first}_{second}"))
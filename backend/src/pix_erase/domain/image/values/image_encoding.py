@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from typing import Final, Literal, get_args, override
+
+from pix_erase.domain.common.values.base import BaseValueObject
+from pix_erase.domain.image.errors.image import BadImageEncodingError
+
+ImageFormat = Literal["JPEG", "PNG", "WEBP"]
+IMAGE_FORMATS: Final[tuple[ImageFormat, ...]] = get_args(ImageFormat)
+MIN_QUALITY: Final[int] = 0
+MAX_QUALITY: Final[int] = 100
+
+
+@dataclass(frozen=True, eq=True, unsafe_hash=True)
+class ImageEncoding(BaseValueObject):
+    """
+    Output encoding of a converted image.
+
+    Missing format means the format of the source image, missing quality means the default of the format.
+    """
+
+    format: str | None = None
+    quality: int | None = None
+
+    @override
+    def _validate(self) -> None:
+        if self.format is not None and self.format not in IMAGE_FORMATS:
+            msg = f"Image format must be one of {', '.join(IMAGE_FORMATS)}, not {self.format}"
+            raise BadImageEncodingError(msg)
+
+        if self.quality is not None and not MIN_QUALITY <= self.quality <= MAX_QUALITY:
+            msg = f"Image quality must be between {MIN_QUALITY} and {MAX_QUALITY}, not {self.quality}"
+            raise BadImageEncodingError(msg)
+
+    @override
+    def __str__(self) -> str:
+        return f"{self.format or 'source format'}, quality: {self.quality if self.quality is not None else 'default'}"
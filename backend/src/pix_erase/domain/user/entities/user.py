@@ -3,7 +3,6 @@ from typing import Self, TypedDict
 from uuid import UUID
 
 from pix_erase.domain.common.entities.base_aggregate import BaseAggregateRoot
-from pix_erase.domain.image.values.image_id import ImageID
 from pix_erase.domain.user.values.hashed_password import HashedPassword
 from pix_erase.domain.user.values.user_email import UserEmail
 from pix_erase.domain.user.values.user_id import UserID
@@ -17,7 +16,6 @@ class SerializedUser(TypedDict):
     name: str
     role: str
     is_active: bool
-    images: list[str]
     password: bytes
 
 
@@ -41,7 +39,6 @@ class User(BaseAggregateRoot[UserID]):
     hashed_password: HashedPassword
     role: UserRole = field(default_factory=lambda: UserRole.USER)
     is_active: bool = field(default_factory=lambda: True)
-    images: list[ImageID] = field(default_factory=list)
 
     def serialize(self) -> SerializedUser:
         return {
@@ -50,7 +47,6 @@ class User(BaseAggregateRoot[UserID]):
             "name": str(self.name),
             "role": self.role,
             "is_active": self.is_active,
-            "images": [str(img_id) for img_id in self.images],
             "password": self.hashed_password.value,
         }
 
@@ -63,5 +59,4 @@ class User(BaseAggregateRoot[UserID]):
             hashed_password=HashedPassword(data["password"]),
             role=UserRole(data["role"]),
             is_active=data["is_active"],
-            images=[ImageID(UUID(img_id)) for img_id in data["images"]],
         )
@@ -2,7 +2,7 @@ from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Final
 
 from pix_erase.domain.common.services.base import DomainService
-from pix_erase.domain.image.entities.image import Image
+from pix_erase.domain.image.values.image_id import ImageID
 from pix_erase.domain.user.entities.user import User
 from pix_erase.domain.user.errors.user import RoleAssignmentNotPermittedError
 from pix_erase.domain.user.events import (
@@ -174,13 +174,11 @@ class UserService(DomainService):
 
         self._record_event(new_event)
 
-    def add_image(self, user: User, image: Image) -> None:
-        user.images.append(image.id)
-        user.updated_at = datetime.now(UTC)
-
+    def add_image(self, user: User, image_id: ImageID) -> None:
+        """Images of users are kept in their own catalogue, the user only records that it added one."""
         new_event: UserAddedPhotoEvent = UserAddedPhotoEvent(
             user_id=user.id,
-            photo_id=image.id,
+            photo_id=image_id,
         )
 
         self._record_event(new_event)
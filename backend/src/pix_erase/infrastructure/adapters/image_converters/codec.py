@@ -0,0 +1,173 @@
+"""
+Decoding and encoding shared by all converters.
+
+By default a converted image is written in the format of the source image, so PNG stays lossless and
+WebP stays small. Images with an alpha channel (after background removal) fall back to PNG when the
+source format can't keep transparency and the caller didn't ask for a format explicitly.
+
+Images are decoded as they are stored, with their alpha channel and 16-bit depth, steps that only work
+with 8-bit BGR convert the image with ``to_bgr`` themselves.
+"""
+
+from typing import Final, Literal
+
+import cv2
+import numpy as np
+
+from pix_erase.domain.image.values.image_encoding import ImageEncoding, ImageFormat
+from pix_erase.infrastructure.errors.image_converters import ImageDecodingError, ImageEncodingError
+
+type DetectedImageFormat = Literal["JPEG", "PNG", "GIF", "WEBP", "UNKNOWN"]
+
+# bump when encoding of converted images changes, cached transformation results depend on it
+CODEC_REVISION: Final[int] = 2
+CODEC_VERSION: Final[str] = f"{CODEC_REVISION}/opencv-{cv2.__version__}"
+
+DEFAULT_JPEG_QUALITY: Final[int] = 95
+DEFAULT_WEBP_QUALITY: Final[int] = 90
+# cv2 treats WebP quality above 100 as lossless, 100 itself is the best lossy quality
+MIN_WEBP_QUALITY: Final[int] = 1
+GRAYSCALE_DIMENSIONS: Final[int] = 2
+BGRA_CHANNELS: Final[int] = 4
+# 65535 / 255, maps 16-bit samples onto 8-bit ones
+SIXTEEN_TO_EIGHT_BITS: Final[int] = 257
+
+FORMAT_EXTENSIONS: Final[dict[ImageFormat, str]] = {
+    "JPEG": ".jpg",
+    "PNG": ".png",
+    "WEBP": ".webp",
+}
+CONTENT_TYPES: Final[dict[DetectedImageFormat, str]] = {
+    "JPEG": "image/jpeg",
+    "PNG": "image/png",
+    "GIF": "image/gif",
+    "WEBP": "image/webp",
+    "UNKNOWN": "application/octet-stream",
+}
+
+
+def detect_format(data: bytes) -> DetectedImageFormat:
+    """Определяет формат изображения по сигнатурам"""
+    if data.startswith(b"\xff\xd8\xff"):
+        return "JPEG"
+
+    if data.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "PNG"
+
+    if data.startswith(b"GIF8"):
+        return "GIF"
+
+    if data.startswith(b"RIFF") and data[8:12] == b"WEBP":
+        return "WEBP"
+
+    return "UNKNOWN"
+
+
+def content_type_for(data: bytes) -> str:
+    return CONTENT_TYPES[detect_format(data)]
+
+
+def decode_image(data: bytes) -> np.ndarray:
+    # JPEG has neither alpha nor 16-bit depth, IMREAD_COLOR also applies the EXIF orientation of photos
+    flags: int = cv2.IMREAD_COLOR if detect_format(data) == "JPEG" else cv2.IMREAD_UNCHANGED
+    img: np.ndarray | None = cv2.imdecode(np.frombuffer(data, np.uint8), flags)
+
+    if img is None:
+        msg = "Failed to decoding image"
+        raise ImageDecodingError(msg)
+
+    return img
+
+
+def _has_alpha(img: np.ndarray) -> bool:
+    return img.ndim > GRAYSCALE_DIMENSIONS and img.shape[2] == BGRA_CHANNELS
+
+
+def to_8bit(img: np.ndarray) -> np.ndarray:
+    if img.dtype == np.uint8:
+        return img
+
+    return (img // SIXTEEN_TO_EIGHT_BITS).astype(np.uint8)
+
+
+def to_bgr(img: np.ndarray) -> np.ndarray:
+    """Brings grayscale, transparent and 16-bit images to 8-bit BGR for steps that only support it."""
+    img = to_8bit(img)
+
+    if img.ndim == GRAYSCALE_DIMENSIONS:
+        return cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
+
+    if img.shape[2] == BGRA_CHANNELS:
+        return cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
+
+    return img
+
+
+def resolve_format(img: np.ndarray, source_format: DetectedImageFormat, encoding: ImageEncoding | None) -> ImageFormat:
+    if encoding is not None and encoding.format is not None:
+        return encoding.format  # type: ignore[return-value]
+
+    if _has_alpha(img) and source_format not in ("PNG", "WEBP"):
+        return "PNG"
+
+    match source_format:
+        case "PNG" | "WEBP" | "JPEG":
+            return source_format
+        case "GIF":
+            # cv2 can't write GIF, PNG keeps it lossless
+            return "PNG"
+        case _:
+            return "JPEG"
+
+
+def lossy_format(img: np.ndarray, source_format: DetectedImageFormat) -> ImageFormat:
+    """Format of compression without an explicit one, quality means nothing to PNG, so it's replaced."""
+    match source_format:
+        case "JPEG" | "WEBP":
+            return source_format
+        case _:
+            return "WEBP" if _has_alpha(img) else "JPEG"
+
+
+def _encode_params(image_format: ImageFormat, quality: int | None) -> list[int]:
+    match image_format:
+        case "JPEG":
+            return [cv2.IMWRITE_JPEG_QUALITY, DEFAULT_JPEG_QUALITY if quality is None else quality]
+        case "WEBP":
+            webp_quality: int = DEFAULT_WEBP_QUALITY if quality is None else max(quality, MIN_WEBP_QUALITY)
+            return [cv2.IMWRITE_WEBP_QUALITY, webp_quality]
+        case "PNG":
+            # PNG is lossless, quality has nothing to change there
+            return []
+
+
+def encode_image(
+    img: np.ndarray,
+    source_format: DetectedImageFormat,
+    encoding: ImageEncoding | None = None,
+) -> bytes:
+    image_format: ImageFormat = resolve_format(img, source_format, encoding)
+
+    if image_format != "PNG":
+        # only PNG keeps 16 bits per channel
+        img = to_8bit(img)
+
+    if image_format == "JPEG" and _has_alpha(img):
+        img = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
+
+    success, buffer = cv2.imencode(
+        FORMAT_EXTENSIONS[image_format],
+        img,
+        _encode_params(image_format, encoding.quality if encoding is not None else None),
+    )
+
+    if not success:
+        msg = f"Failed to encoding image to {image_format}"
+        raise ImageEncodingError(msg)
+
+    return buffer.tobytes()
+
+
+def reencode(data: bytes, img: np.ndarray, encoding: ImageEncoding | None = None) -> bytes:
+    """Encodes a converted image, ``data`` is the source image the format is taken from."""
+    return encode_image(img, detect_format(data), encoding)
@@ -1,40 +1,65 @@
 import logging
-from pathlib import Path
 from typing import Final, override
 
 import cv2
 import numpy as np
-from cv2 import dnn_superres
 
 from pix_erase.domain.image.ports.image_ai_upscaler_converter import ImageAIUpscaleConverter
+from pix_erase.domain.image.values.image_encoding import ImageEncoding
 from pix_erase.domain.image.values.image_scale import ImageScale
-from pix_erase.infrastructure.errors.image_converters import ImageDecodingError
+from pix_erase.infrastructure.adapters.image_converters.codec import decode_image, reencode, to_bgr
+from pix_erase.infrastructure.adapters.image_converters.super_resolution_registry import (
+    SuperResolutionModelRegistry,
+    get_super_resolution_registry,
+)
+from pix_erase.infrastructure.adapters.image_converters.super_resolution_tiling import (
+    TilingPlan,
+    plan_tiling,
+    upsample_tiled,
+)
+from pix_erase.setup.config.super_resolution import SuperResolutionConfig
 
 logger: Final[logging.Logger] = logging.getLogger(__name__)
 
 
-class Cv2EDSRImageUpscaleConverter(ImageAIUpscaleConverter):
-    def __init__(self) -> None:
-        self._model_path: str = str(Path(__file__).parent.resolve() / r"models/EDSR_x2.pb")
-        self._model_name: str = "edsr"
+def upsample_with_edsr(
+    img_bgr: cv2.typing.MatLike,
+    scale: ImageScale,
+    config: SuperResolutionConfig,
+) -> cv2.typing.MatLike:
+    """Upscales a BGR image, big images are split into tiles so that inference fits into the memory limit."""
+    registry: SuperResolutionModelRegistry = get_super_resolution_registry(config.models_path)
 
-    @override
-    def convert(self, data: bytes, width: int, height: int, scale: ImageScale) -> bytes:
-        cv2_image: cv2.typing.MatLike | None = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+    def upsample_tile(tile_bgr: np.ndarray) -> np.ndarray:
+        tile_rgb = cv2.cvtColor(tile_bgr, cv2.COLOR_BGR2RGB)
+        return cv2.cvtColor(registry.upsample(tile_rgb, scale), cv2.COLOR_RGB2BGR)
 
-        if cv2_image is None:
-            msg = "Failed to decoding image"
-            raise ImageDecodingError(msg)
+    plan: TilingPlan = plan_tiling(
+        scale.value,
+        tile_size=config.tile_size,
+        overlap=config.tile_overlap,
+        workers=config.tile_workers,
+        memory_limit_mb=config.job_memory_limit_mb,
+    )
 
-        image = cv2.cvtColor(cv2_image, cv2.COLOR_BGR2RGB)
+    return upsample_tiled(np.asarray(img_bgr), upsample_tile, scale.value, plan)
 
-        sr_model: dnn_superres.DnnSuperResImpl = dnn_superres.DnnSuperResImpl.create()
 
-        sr_model.readModel(self._model_path)
-        sr_model.setModel(self._model_name, 2)
+class Cv2EDSRImageUpscaleConverter(ImageAIUpscaleConverter):
+    def __init__(self, config: SuperResolutionConfig) -> None:
+        self._config: SuperResolutionConfig = config
 
-        upsampled_image = sr_model.upsample(image)
+    @override
+    def convert(
+        self,
+        data: bytes,
+        width: int,
+        height: int,
+        scale: ImageScale,
+        encoding: ImageEncoding | None = None,
+    ) -> bytes:
+        cv2_image: cv2.typing.MatLike = to_bgr(decode_image(data))
 
-        _, encoded_img = cv2.imencode(".jpg", upsampled_image)
+        upsampled_image = upsample_with_edsr(cv2_image, scale=scale, config=self._config)
 
-        return encoded_img.tobytes()
+        return reencode(data, np.asarray(upsampled_image), encoding)
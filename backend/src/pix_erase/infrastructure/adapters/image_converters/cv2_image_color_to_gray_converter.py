@@ -1,23 +1,36 @@
 from typing import override
 
 import cv2
-import numpy as np
 
 from pix_erase.domain.image.ports.image_color_to_gray_converter import ImageColorToCrayScaleConverter
-from pix_erase.infrastructure.errors.image_converters import ImageDecodingError
+from pix_erase.domain.image.values.image_encoding import ImageEncoding
+from pix_erase.infrastructure.adapters.image_converters.codec import (
+    BGRA_CHANNELS,
+    GRAYSCALE_DIMENSIONS,
+    decode_image,
+    reencode,
+)
 
 
-class Cv2ImageColorToCrayScaleConverter(ImageColorToCrayScaleConverter):
-    @override
-    def convert(self, data: bytes) -> bytes:
-        cv2_image: cv2.typing.MatLike | None = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+def to_grayscale(img: cv2.typing.MatLike) -> cv2.typing.MatLike:
+    """Transparent images stay transparent, their gray is written to every color channel."""
+    if img.ndim == GRAYSCALE_DIMENSIONS:
+        return img
+
+    if img.shape[2] != BGRA_CHANNELS:
+        return cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+
+    gray_image = cv2.cvtColor(cv2.cvtColor(img, cv2.COLOR_BGRA2GRAY), cv2.COLOR_GRAY2BGRA)
+    gray_image[:, :, 3] = img[:, :, 3]
 
-        if cv2_image is None:
-            msg = "Failed to decoding image"
-            raise ImageDecodingError(msg)
+    return gray_image
 
-        gray_image = cv2.cvtColor(cv2_image, cv2.COLOR_BGR2GRAY)
 
-        _, encoded_img = cv2.imencode(".jpg", gray_image)
+class Cv2ImageColorToCrayScaleConverter(ImageColorToCrayScaleConverter):
+    @override
+    def convert(self, data: bytes, encoding: ImageEncoding | None = None) -> bytes:
+        cv2_image: cv2.typing.MatLike = decode_image(data)
+
+        gray_image = to_grayscale(cv2_image)
 
-        return encoded_img.tobytes()
+        return reencode(data, gray_image, encoding)
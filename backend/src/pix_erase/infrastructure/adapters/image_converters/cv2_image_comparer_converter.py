@@ -1,133 +1,401 @@
-from typing import override
+"""
+Comparison of two images.
+
+Every image is decoded once, a large JPEG is reduced by the decoder itself, then both images are brought to one
+working size whose longest side is at most ``IMAGE_COMPARISON_MAX_SIDE``. All metrics share the planes of that size:
+histograms and SSIM use one grayscale plane per image, MSE and PSNR use the color ones. SSIM is computed in float32
+over a fixed set of buffers, so memory and time of a comparison don't grow with the size of the source images.
+
+Batch comparisons work on features instead: a normalized histogram and a square grayscale plane of
+``IMAGE_COMPARISON_FEATURE_SIDE`` pixels per image. Features are extracted once per image and cached, then one image
+is compared with a whole chunk of candidates at once: the planes of candidates are stacked as channels of one array,
+so each Gaussian blur of SSIM is a single call for the chunk. All pairs of a batch are compared in one call, each chunk
+is stacked once and compared with every image that comes before one of its candidates. MSE and PSNR of batches are
+computed over grayscale planes and multi-scale SSIM isn't computed for batches.
+"""
+
+import struct
+from collections.abc import Sequence
+from typing import Final, override
 
 import cv2
 import numpy as np
 
 from pix_erase.domain.image.ports.image_comparer_converter import ImageComparerConverter, ScoresDTO
+from pix_erase.infrastructure.adapters.image_converters.image_header import ImageHeader, probe_image_header
 from pix_erase.infrastructure.errors.image_converters import ImageDecodingError
+from pix_erase.setup.config.image_comparison import ImageComparisonConfig
 
+# libjpeg scales DCT blocks while decoding, it's much cheaper than decoding every pixel and resizing afterwards
+JPEG_DECODE_REDUCTIONS: Final[tuple[tuple[int, int, int], ...]] = (
+    (8, cv2.IMREAD_REDUCED_COLOR_8, cv2.IMREAD_REDUCED_GRAYSCALE_8),
+    (4, cv2.IMREAD_REDUCED_COLOR_4, cv2.IMREAD_REDUCED_GRAYSCALE_4),
+    (2, cv2.IMREAD_REDUCED_COLOR_2, cv2.IMREAD_REDUCED_GRAYSCALE_2),
+)
+HISTOGRAM_METHODS: Final[dict[str, int]] = {
+    "CORREL": cv2.HISTCMP_CORREL,
+    "CHISQR": cv2.HISTCMP_CHISQR,
+    "INTERSECT": cv2.HISTCMP_INTERSECT,
+    "BHATTACHARYYA": cv2.HISTCMP_BHATTACHARYYA,
+}
+MAX_PIXEL_VALUE: Final[float] = 255.0
+SSIM_WINDOW: Final[tuple[int, int]] = (11, 11)
+SSIM_SIGMA: Final[float] = 1.5
+SSIM_C1: Final[float] = (0.01 * MAX_PIXEL_VALUE) ** 2
+SSIM_C2: Final[float] = (0.03 * MAX_PIXEL_VALUE) ** 2
+# mu_x, mu_y, sigma_x, sigma_y, sigma_xy and one temporary plane
+SSIM_BUFFERS: Final[int] = 6
+# weights of scales from "Multi-scale structural similarity for image quality assessment" (Wang et al., 2003)
+MS_SSIM_WEIGHTS: Final[tuple[float, ...]] = (0.0448, 0.2856, 0.3001, 0.2363, 0.1333)
+HISTOGRAM_BINS: Final[int] = 256
+# version and side of the plane, the version changes with the layout of features
+FEATURES_HEADER: Final[struct.Struct] = struct.Struct("<BH")
+FEATURES_VERSION: Final[int] = 1
+# planes of candidates are channels of one array, OpenCV allows at most 512 channels
+CANDIDATES_PER_CHUNK: Final[int] = 64
 
-def _calculate_ssim(img1: cv2.typing.MatLike, img2: cv2.typing.MatLike) -> float:
-    """
-    Calculate Structural Similarity Index (SSIM) between two images.
-    SSIM measures the structural similarity between two images.
-    Returns a value between -1 and 1, where 1 means identical images.
-    """
-    # Convert to grayscale if needed
-    img1_gray = cv2.cvtColor(img1, cv2.COLOR_BGR2GRAY) if len(img1.shape) == 3 else img1
 
-    img2_gray = cv2.cvtColor(img2, cv2.COLOR_BGR2GRAY) if len(img2.shape) == 3 else img2
+def _fit(width: int, height: int, max_side: int) -> tuple[int, int]:
+    scale: float = min(1.0, max_side / max(width, height))
+    return max(1, round(width * scale)), max(1, round(height * scale))
 
-    # Resize images to same size if needed
-    if img1_gray.shape != img2_gray.shape:
-        img2_gray = cv2.resize(img2_gray, (img1_gray.shape[1], img1_gray.shape[0]))
 
-    # Constants for SSIM calculation
-    c1 = (0.01 * 255) ** 2
-    c2 = (0.03 * 255) ** 2
+def _decode_flag(header: ImageHeader | None, width: int, height: int, *, grayscale: bool = False) -> int:
+    """Picks the strongest reduction of the decoder that still leaves at least ``width`` x ``height`` pixels."""
+    full_flag: int = cv2.IMREAD_GRAYSCALE if grayscale else cv2.IMREAD_COLOR
 
-    # Calculate means
-    mu1 = cv2.GaussianBlur(img1_gray.astype(np.float64), (11, 11), 1.5)
-    mu2 = cv2.GaussianBlur(img2_gray.astype(np.float64), (11, 11), 1.5)
+    if header is None or header.format != "JPEG":
+        return full_flag
 
-    mu1_sq = mu1**2
-    mu2_sq = mu2**2
-    mu1_mu2 = mu1 * mu2
+    # the EXIF orientation may swap sides of the decoded image, so sides are compared sorted
+    long_side, short_side = max(header.width, header.height), min(header.width, header.height)
+
+    for factor, color_flag, grayscale_flag in JPEG_DECODE_REDUCTIONS:
+        if long_side // factor >= max(width, height) and short_side // factor >= min(width, height):
+            return grayscale_flag if grayscale else color_flag
+
+    return full_flag
+
+
+def _decode(data: bytes, flag: int, which: str) -> np.ndarray:
+    img: np.ndarray | None = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), flag)
+
+    if img is None:
+        msg = f"Failed to decoding {which} image"
+        raise ImageDecodingError(msg)
+
+    return img
+
+
+def _resize(img: np.ndarray, size: tuple[int, int]) -> np.ndarray:
+    if (img.shape[1], img.shape[0]) == size:
+        return img
+
+    return cv2.resize(img, size, interpolation=cv2.INTER_AREA)
+
+
+def _load_first(data: bytes, max_side: int) -> np.ndarray:
+    header: ImageHeader | None = probe_image_header(data)
+    flag: int = cv2.IMREAD_COLOR
+
+    if header is not None:
+        flag = _decode_flag(header, *_fit(header.width, header.height, max_side))
+
+    img: np.ndarray = _decode(data, flag, "first")
+    return _resize(img, _fit(img.shape[1], img.shape[0], max_side))
+
+
+def _load_second(data: bytes, size: tuple[int, int]) -> np.ndarray:
+    """The second image is brought to the working size of the first one, so planes can be compared pixel by pixel."""
+    img: np.ndarray = _decode(data, _decode_flag(probe_image_header(data), *size), "second")
+    return _resize(img, size)
 
-    # Calculate variances and covariance
-    sigma1_sq = cv2.GaussianBlur((img1_gray.astype(np.float64) - mu1) ** 2, (11, 11), 1.5)
-    sigma2_sq = cv2.GaussianBlur((img2_gray.astype(np.float64) - mu2) ** 2, (11, 11), 1.5)
-    sigma12 = cv2.GaussianBlur(
-        (img1_gray.astype(np.float64) - mu1) * (img2_gray.astype(np.float64) - mu2), (11, 11), 1.5
-    )
 
-    # Calculate SSIM
-    ssim_map = ((2 * mu1_mu2 + c1) * (2 * sigma12 + c2)) / ((mu1_sq + mu2_sq + c1) * (sigma1_sq + sigma2_sq + c2))
-    return float(np.mean(ssim_map))  # type: ignore[arg-type]
+def _histogram(gray: np.ndarray) -> np.ndarray:
+    hist: np.ndarray = cv2.calcHist([gray], [0], None, [256], [0, 256])
+    return cv2.normalize(hist, hist).flatten()
 
 
-def _calculate_mse(img1: cv2.typing.MatLike, img2: cv2.typing.MatLike) -> float:
+def _calculate_mse(img1: np.ndarray, img2: np.ndarray) -> float:
     """
-    Calculate Mean Squared Error (MSE) between two images.
+    Calculate Mean Squared Error (MSE) between two images of the same size.
     Lower values indicate more similar images.
     """
-    # Resize images to same size if needed
-    if img1.shape != img2.shape:
-        img2 = cv2.resize(img2, (img1.shape[1], img1.shape[0]))
+    # the sum of squared differences is accumulated in float64 by cv2, no float copies of images are made
+    return float(cv2.norm(img1, img2, cv2.NORM_L2SQR)) / img1.size
 
-    # Convert to same type and calculate MSE
-    img1_float = img1.astype(np.float64)
-    img2_float = img2.astype(np.float64)
 
-    mse = np.mean((img1_float - img2_float) ** 2)
-    return float(mse)
-
-
-def _calculate_psnr(img1: cv2.typing.MatLike, img2: cv2.typing.MatLike) -> float:
+def _calculate_psnr(mse: float) -> float:
     """
-    Calculate Peak Signal-to-Noise Ratio (PSNR) between two images.
+    Calculate Peak Signal-to-Noise Ratio (PSNR) from MSE.
     Higher values indicate more similar images.
     Returns infinity if images are identical (MSE = 0).
     """
-    mse = _calculate_mse(img1, img2)
     if mse == 0:
         return float("inf")
 
-    max_pixel_value = 255.0
-    psnr = 20 * np.log10(max_pixel_value / np.sqrt(mse))
-    return float(psnr)
+    return float(20 * np.log10(MAX_PIXEL_VALUE / np.sqrt(mse)))
 
 
-class Cv2ImageComparerConverter(ImageComparerConverter):
-    @override
-    def compare_by_histograms(self, first_image: bytes, second_image: bytes) -> ScoresDTO:
-        cv2_first_image: cv2.typing.MatLike | None = cv2.imdecode(
-            np.frombuffer(first_image, dtype=np.uint8), cv2.IMREAD_COLOR
-        )
+def _calculate_ssim(x: np.ndarray, y: np.ndarray, buffers: np.ndarray) -> tuple[float, float]:
+    """
+    Calculate Structural Similarity Index (SSIM) between two float32 grayscale planes.
+    Returns SSIM and its contrast-structure part, which multi-scale SSIM needs.
+
+    ``buffers`` holds ``SSIM_BUFFERS`` planes at least of the size of ``x``, they are overwritten.
+    """
+    height, width = x.shape
+    mu_x, mu_y, sigma_x, sigma_y, sigma_xy, tmp = (buffer[:height, :width] for buffer in buffers)
+
+    cv2.GaussianBlur(x, SSIM_WINDOW, SSIM_SIGMA, dst=mu_x)
+    cv2.GaussianBlur(y, SSIM_WINDOW, SSIM_SIGMA, dst=mu_y)
+    np.multiply(x, x, out=sigma_x)
+    cv2.GaussianBlur(sigma_x, SSIM_WINDOW, SSIM_SIGMA, dst=sigma_x)
+    np.multiply(y, y, out=sigma_y)
+    cv2.GaussianBlur(sigma_y, SSIM_WINDOW, SSIM_SIGMA, dst=sigma_y)
+    np.multiply(x, y, out=sigma_xy)
+    cv2.GaussianBlur(sigma_xy, SSIM_WINDOW, SSIM_SIGMA, dst=sigma_xy)
+
+    # sigma_xy = E[xy] - mu_x * mu_y, sigma_x = E[x^2] - mu_x^2, sigma_y = E[y^2] - mu_y^2
+    np.multiply(mu_x, mu_y, out=tmp)
+    sigma_xy -= tmp
+    np.square(mu_x, out=mu_x)
+    np.square(mu_y, out=mu_y)
+    sigma_x -= mu_x
+    sigma_y -= mu_y
+
+    # contrast-structure is (2 * sigma_xy + C2) over (sigma_x + sigma_y + C2)
+    sigma_xy *= 2
+    sigma_xy += SSIM_C2
+    sigma_x += sigma_y
+    sigma_x += SSIM_C2
+    np.divide(sigma_xy, sigma_x, out=sigma_xy)
+    cs: float = float(sigma_xy.mean(dtype=np.float64))
 
-        if cv2_first_image is None:
-            msg = "Failed to decoding first image"
-            raise ImageDecodingError(msg)
+    # luminance is (2 * mu_x * mu_y + C1) over (mu_x^2 + mu_y^2 + C1)
+    tmp *= 2
+    tmp += SSIM_C1
+    mu_x += mu_y
+    mu_x += SSIM_C1
+    np.divide(tmp, mu_x, out=tmp)
+    np.multiply(tmp, sigma_xy, out=tmp)
 
-        cv2_second_image: cv2.typing.MatLike | None = cv2.imdecode(
-            np.frombuffer(second_image, dtype=np.uint8), cv2.IMREAD_COLOR
-        )
+    return float(tmp.mean(dtype=np.float64)), cs
 
-        if cv2_second_image is None:
-            msg = "Failed to decoding second image"
-            raise ImageDecodingError(msg)
 
-        # Convert to grayscale for histogram comparison
-        gray1 = cv2.cvtColor(cv2_first_image, cv2.COLOR_BGR2GRAY)
-        gray2 = cv2.cvtColor(cv2_second_image, cv2.COLOR_BGR2GRAY)
+def _calculate_ms_ssim(x: np.ndarray, y: np.ndarray, buffers: np.ndarray, ssim: float, cs: float) -> float:
+    """
+    Calculate Multi-Scale SSIM, every next scale is a 2x2 average of the previous one.
+    ``ssim`` and ``cs`` are of the first scale, that's the plain SSIM computed already.
+    Small images get fewer scales, a scale must fit the Gaussian window.
+    """
+    scales: int = 1
+    while scales < len(MS_SSIM_WEIGHTS) and min(x.shape) >> scales >= SSIM_WINDOW[0]:
+        scales += 1
+
+    weights: tuple[float, ...] = MS_SSIM_WEIGHTS[:scales]
+    total_weight: float = sum(weights)
+    css: list[float] = [cs]
+
+    for _ in range(1, scales):
+        size: tuple[int, int] = (x.shape[1] // 2, x.shape[0] // 2)
+        x = cv2.resize(x, size, interpolation=cv2.INTER_AREA)
+        y = cv2.resize(y, size, interpolation=cv2.INTER_AREA)
+        ssim, cs = _calculate_ssim(x, y, buffers)
+        css.append(cs)
+
+    # contrast-structure of all scales but the last one, the last one contributes the whole SSIM
+    result: float = max(ssim, 0.0) ** (weights[-1] / total_weight)
+    for scale_cs, weight in zip(css[:-1], weights[:-1], strict=True):
+        result *= max(scale_cs, 0.0) ** (weight / total_weight)
+
+    return float(result)
+
+
+def _pack_features(histogram: np.ndarray, gray: np.ndarray) -> bytes:
+    return (
+        FEATURES_HEADER.pack(FEATURES_VERSION, gray.shape[0])
+        + histogram.astype(np.float32).tobytes()
+        + gray.astype(np.uint8).tobytes()
+    )
+
 
-        # Calculate histograms
-        hist1 = cv2.calcHist([gray1], [0], None, [256], [0, 256])
-        hist2 = cv2.calcHist([gray2], [0], None, [256], [0, 256])
+def _unpack_features(data: bytes) -> tuple[np.ndarray, np.ndarray]:
+    version, side = FEATURES_HEADER.unpack_from(data)
 
-        # Normalize histograms
-        hist1 = cv2.normalize(hist1, hist1).flatten()
-        hist2 = cv2.normalize(hist2, hist2).flatten()
+    if version != FEATURES_VERSION or len(data) != FEATURES_HEADER.size + HISTOGRAM_BINS * 4 + side * side:
+        msg = f"Unsupported features of version {version}"
+        raise ValueError(msg)
 
-        # Compare histograms
-        methods_and_scores: ScoresDTO = {
+    histogram: np.ndarray = np.frombuffer(data, np.float32, HISTOGRAM_BINS, FEATURES_HEADER.size)
+    gray: np.ndarray = np.frombuffer(data, np.uint8, offset=FEATURES_HEADER.size + HISTOGRAM_BINS * 4)
+    return histogram, gray.reshape(side, side)
+
+
+def _compare_histograms(reference: np.ndarray, candidates: np.ndarray) -> dict[str, np.ndarray]:
+    """The same formulas as ``cv2.compareHist`` with the reference as the first histogram, one row per candidate."""
+    h1: np.ndarray = reference.astype(np.float64)
+    h2: np.ndarray = candidates.astype(np.float64)
+
+    d1: np.ndarray = h1 - h1.mean()
+    d2: np.ndarray = h2 - h2.mean(axis=1, keepdims=True)
+    denominator: np.ndarray = (d1 @ d1) * np.einsum("ij,ij->i", d2, d2)
+    defined: np.ndarray = np.abs(denominator) > np.finfo(np.float64).eps
+    correl: np.ndarray = np.where(defined, (d2 @ d1) / np.sqrt(np.where(defined, denominator, 1.0)), 1.0)
+
+    nonzero: np.ndarray = np.abs(h1) > np.finfo(np.float64).eps
+    chisqr: np.ndarray = (((h1 - h2) ** 2)[:, nonzero] / h1[nonzero]).sum(axis=1)
+
+    totals: np.ndarray = h1.sum() * h2.sum(axis=1)
+    scale: np.ndarray = np.where(np.abs(totals) > np.finfo(np.float32).eps, totals, 1.0) ** -0.5
+    bhattacharyya: np.ndarray = np.sqrt(np.maximum(1.0 - np.sqrt(h1 * h2).sum(axis=1) * scale, 0.0))
+
+    return {
+        "CORREL": correl,
+        "CHISQR": chisqr,
+        "INTERSECT": np.minimum(h1, h2).sum(axis=1),
+        "BHATTACHARYYA": bhattacharyya,
+    }
+
+
+def _blur(planes: np.ndarray) -> np.ndarray:
+    # a single channel comes back from OpenCV as a 2D array
+    return cv2.GaussianBlur(planes, SSIM_WINDOW, SSIM_SIGMA).reshape(planes.shape)
+
+
+def _calculate_batch_ssim(x: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    """SSIM of the plane ``x`` with every channel of ``ys``, the same formula as ``_calculate_ssim``."""
+    x = x[:, :, np.newaxis]
+    mu_x: np.ndarray = _blur(x)
+    mu_y: np.ndarray = _blur(ys)
+    mu_xy: np.ndarray = mu_x * mu_y
+    mu_x_sq: np.ndarray = mu_x * mu_x
+    mu_y_sq: np.ndarray = mu_y * mu_y
+
+    sigma_x: np.ndarray = _blur(x * x) - mu_x_sq
+    sigma_y: np.ndarray = _blur(ys * ys) - mu_y_sq
+    sigma_xy: np.ndarray = _blur(ys * x) - mu_xy
+
+    ssim_map: np.ndarray = ((2 * mu_xy + SSIM_C1) * (2 * sigma_xy + SSIM_C2)) / (
+        (mu_x_sq + mu_y_sq + SSIM_C1) * (sigma_x + sigma_y + SSIM_C2)
+    )
+    return np.asarray(ssim_map.mean(axis=(0, 1), dtype=np.float64))
+
+
+def _stack_chunk(
+    unpacked: Sequence[tuple[np.ndarray, np.ndarray]],
+    shape: tuple[int, ...],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Histograms of a chunk as rows and its planes as channels of one array, the layout OpenCV blurs in one pass."""
+    if any(gray.shape != shape for _, gray in unpacked):
+        msg = "Features were extracted at different sizes"
+        raise ValueError(msg)
+
+    histograms: np.ndarray = np.stack([histogram for histogram, _ in unpacked])
+    ys: np.ndarray = np.stack([gray for _, gray in unpacked], axis=-1).astype(np.float32)
+    return histograms, ys
+
+
+def _compare_chunk(
+    reference: tuple[np.ndarray, np.ndarray],
+    histograms: np.ndarray,
+    ys: np.ndarray,
+) -> list[ScoresDTO]:
+    reference_histogram, reference_gray = reference
+    x: np.ndarray = reference_gray.astype(np.float32)
+    compared_histograms: dict[str, np.ndarray] = _compare_histograms(reference_histogram, histograms)
+    mse: np.ndarray = np.square(ys - x[:, :, np.newaxis]).mean(axis=(0, 1), dtype=np.float64)
+    ssim: np.ndarray = _calculate_batch_ssim(x, ys)
+
+    return [
+        {
+            "CORREL": float(compared_histograms["CORREL"][index]),
+            "CHISQR": float(compared_histograms["CHISQR"][index]),
+            "INTERSECT": float(compared_histograms["INTERSECT"][index]),
+            "BHATTACHARYYA": float(compared_histograms["BHATTACHARYYA"][index]),
+            "MSE": float(mse[index]),
+            "PSNR": _calculate_psnr(float(mse[index])),
+            "SSIM": float(ssim[index]),
+        }
+        for index in range(ys.shape[2])
+    ]
+
+
+class Cv2ImageComparerConverter(ImageComparerConverter):
+    def __init__(self, config: ImageComparisonConfig) -> None:
+        self._config: ImageComparisonConfig = config
+
+    @override
+    def compare_by_histograms(self, first_image: bytes, second_image: bytes) -> ScoresDTO:
+        first: np.ndarray = _load_first(first_image, self._config.working_max_side)
+        second: np.ndarray = _load_second(second_image, (first.shape[1], first.shape[0]))
+
+        first_gray: np.ndarray = cv2.cvtColor(first, cv2.COLOR_BGR2GRAY)
+        second_gray: np.ndarray = cv2.cvtColor(second, cv2.COLOR_BGR2GRAY)
+
+        first_hist: np.ndarray = _histogram(first_gray)
+        second_hist: np.ndarray = _histogram(second_gray)
+        mse: float = _calculate_mse(first, second)
+
+        x: np.ndarray = first_gray.astype(np.float32)
+        y: np.ndarray = second_gray.astype(np.float32)
+        buffers: np.ndarray = np.empty((SSIM_BUFFERS, *x.shape), dtype=np.float32)
+        ssim, cs = _calculate_ssim(x, y, buffers)
+
+        scores: ScoresDTO = {
             "CORREL": 0.0,
             "CHISQR": 0.0,
             "INTERSECT": 0.0,
             "BHATTACHARYYA": 0.0,
-            "MSE": 0.0,
-            "PSNR": 0.0,
-            "SSIM": 0.0,
+            "MSE": mse,
+            "PSNR": _calculate_psnr(mse),
+            "SSIM": ssim,
         }
 
-        # Calculate histogram comparison methods
-        for method in ["CORREL", "CHISQR", "INTERSECT", "BHATTACHARYYA"]:
-            score = cv2.compareHist(hist1, hist2, getattr(cv2, f"HISTCMP_{method}"))
-            methods_and_scores[method] = score  # type: ignore[literal-required]
+        for method, flag in HISTOGRAM_METHODS.items():
+            scores[method] = cv2.compareHist(first_hist, second_hist, flag)  # type: ignore[literal-required]
+
+        if self._config.multiscale_ssim:
+            scores["MS_SSIM"] = _calculate_ms_ssim(x, y, buffers, ssim, cs)
+
+        return scores
+
+    @override
+    def extract_features(self, image: bytes) -> bytes:
+        side: int = self._config.feature_side
+        flag: int = _decode_flag(probe_image_header(image), side, side, grayscale=True)
+        gray: np.ndarray = _resize(_decode(image, flag, "compared"), (side, side))
+        return _pack_features(_histogram(gray), gray)
+
+    @override
+    def compare_features(self, reference: bytes, candidates: Sequence[bytes]) -> list[ScoresDTO]:
+        unpacked_reference: tuple[np.ndarray, np.ndarray] = _unpack_features(reference)
+        scores: list[ScoresDTO] = []
+
+        for start in range(0, len(candidates), CANDIDATES_PER_CHUNK):
+            histograms, ys = _stack_chunk(
+                [_unpack_features(features) for features in candidates[start : start + CANDIDATES_PER_CHUNK]],
+                unpacked_reference[1].shape,
+            )
+            scores.extend(_compare_chunk(unpacked_reference, histograms, ys))
+
+        return scores
+
+    @override
+    def compare_features_pairwise(self, features: Sequence[bytes]) -> list[list[ScoresDTO]]:
+        unpacked: list[tuple[np.ndarray, np.ndarray]] = [_unpack_features(item) for item in features]
+        scores: list[list[ScoresDTO]] = [[] for _ in unpacked]
+
+        # every chunk is stacked once and compared with every image before its end, chunks go in order,
+        # so scores of an image stay in order of the following images
+        for start in range(1, len(unpacked), CANDIDATES_PER_CHUNK):
+            chunk: list[tuple[np.ndarray, np.ndarray]] = unpacked[start : start + CANDIDATES_PER_CHUNK]
+            histograms, ys = _stack_chunk(chunk, unpacked[0][1].shape)
 
-        # Calculate additional metrics
-        methods_and_scores["MSE"] = _calculate_mse(cv2_first_image, cv2_second_image)
-        methods_and_scores["PSNR"] = _calculate_psnr(cv2_first_image, cv2_second_image)
-        methods_and_scores["SSIM"] = _calculate_ssim(cv2_first_image, cv2_second_image)
+            for index in range(start + len(chunk) - 1):
+                first: int = max(index + 1 - start, 0)
+                scores[index].extend(
+                    _compare_chunk(unpacked[index], histograms[first:], np.ascontiguousarray(ys[:, :, first:])),
+                )
 
-        return methods_and_scores
+        return scores
@@ -1,23 +1,34 @@
 from typing import override
 
-import cv2
-import numpy as np
-
 from pix_erase.domain.image.ports.image_compress_converter import ImageCompressConverter
-from pix_erase.infrastructure.errors.image_converters import ImageDecodingError
+from pix_erase.domain.image.values.image_encoding import ImageEncoding
+from pix_erase.infrastructure.adapters.image_converters.codec import (
+    DetectedImageFormat,
+    decode_image,
+    detect_format,
+    encode_image,
+    lossy_format,
+)
 
 
 class Cv2ImageCompressConverter(ImageCompressConverter):
+    """
+    Without an explicit format PNG and GIF are compressed into JPEG, or WebP when they are transparent.
+    The source is returned as it is when compression doesn't make it smaller.
+    """
+
     @override
-    def convert(self, data: bytes, quality: int = 90) -> bytes:
-        np_arr: np.ndarray = np.frombuffer(data, np.uint8)
-        img = cv2.imdecode(np_arr, cv2.IMREAD_COLOR)
+    def convert(self, data: bytes, quality: int = 90, encoding: ImageEncoding | None = None) -> bytes:
+        img = decode_image(data)
+        source_format: DetectedImageFormat = detect_format(data)
 
-        if img is None:
-            msg = "Failed to decoding image"
-            raise ImageDecodingError(msg)
+        if encoding is not None and encoding.format is not None:
+            return encode_image(img, source_format, ImageEncoding(format=encoding.format, quality=quality))
 
-        encode_param = [int(cv2.IMWRITE_JPEG_QUALITY), quality]
-        _, buffer = cv2.imencode(".jpg", img, encode_param)
+        compressed: bytes = encode_image(
+            img,
+            source_format,
+            ImageEncoding(format=lossy_format(img, source_format), quality=quality),
+        )
 
-        return buffer.tobytes()
+        return compressed if len(compressed) < len(data) else data
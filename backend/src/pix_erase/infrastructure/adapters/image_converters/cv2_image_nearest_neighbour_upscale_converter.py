@@ -1,38 +1,62 @@
-import math
-from typing import override
+from typing import Final, override
 
-import cv2
 import numpy as np
 
 from pix_erase.domain.image.ports.image_nearest_neighbour_upscale_converter import (
     ImageNearestNeighbourUpscalerConverter,
 )
+from pix_erase.domain.image.values.image_encoding import ImageEncoding
 from pix_erase.domain.image.values.image_scale import ImageScale
-from pix_erase.infrastructure.errors.image_converters import ImageDecodingError
+from pix_erase.infrastructure.adapters.image_converters.codec import decode_image, reencode
 
+# Сколько байт результата заполняется за один шаг, ограничивает временные буферы на огромных изображениях
+TILE_SIZE_BYTES: Final[int] = 16 * 1024 * 1024
 
-class Cv2ImageNearestNeighbourUpscalerConverter(ImageNearestNeighbourUpscalerConverter):
-    @override
-    def convert(self, data: bytes, width: int, height: int, scale: ImageScale) -> bytes:
-        np_arr: np.ndarray = np.frombuffer(data, np.uint8)
-        # Декодируем изображение
-        img = cv2.imdecode(np_arr, cv2.IMREAD_COLOR)
 
-        if img is None:
-            msg = "Failed to decoding image"
-            raise ImageDecodingError(msg)
+def _build_index_map(size: int, resized_size: int) -> np.ndarray:
+    """
+    Source index for every index of the resized axis.
+
+    Repeats the formula ``ceil((i + 1) * size / resized_size) - 1`` in float64,
+    so the result is the same as the original per-pixel implementation.
+    """
+    ratio: float = size / resized_size
+    indexes: np.ndarray = np.ceil(np.arange(1, resized_size + 1, dtype=np.float64) * ratio).astype(np.intp) - 1
+    return np.clip(indexes, 0, size - 1)
+
 
-        resized_height: int = height * scale.value
-        resized_width: int = width * scale.value
-        resized: np.ndarray = np.zeros((resized_height, resized_width, 3), np.uint8)
+def upscale_nearest_neighbour(
+    img: np.ndarray,
+    scale: ImageScale,
+    tile_size_bytes: int = TILE_SIZE_BYTES,
+) -> np.ndarray:
+    height, width = img.shape[:2]
 
-        ratio_for_col: float = height / resized_height
-        ratio_for_row: float = width / resized_width
+    row_indexes: np.ndarray = _build_index_map(height, height * scale.value)
+    col_indexes: np.ndarray = _build_index_map(width, width * scale.value)
 
-        for x in range(resized_width):
-            for y in range(resized_height):
-                resized[y, x] = img[math.ceil((y + 1) * ratio_for_col) - 1, math.ceil((x + 1) * ratio_for_row) - 1]
+    resized: np.ndarray = np.empty((row_indexes.size, col_indexes.size, *img.shape[2:]), img.dtype)
+    tile_rows: int = max(1, tile_size_bytes // resized[0].nbytes)
 
-        _, encoded_img = cv2.imencode(".jpg", resized)
+    for start in range(0, row_indexes.size, tile_rows):
+        stop: int = start + tile_rows
+        np.take(img[row_indexes[start:stop]], col_indexes, axis=1, out=resized[start:stop])
 
-        return encoded_img.tobytes()
+    return resized
+
+
+class Cv2ImageNearestNeighbourUpscalerConverter(ImageNearestNeighbourUpscalerConverter):
+    @override
+    def convert(
+        self,
+        data: bytes,
+        width: int,
+        height: int,
+        scale: ImageScale,
+        encoding: ImageEncoding | None = None,
+    ) -> bytes:
+        img: np.ndarray = decode_image(data)
+
+        resized: np.ndarray = upscale_nearest_neighbour(img, scale)
+
+        return reencode(data, resized, encoding)
@@ -0,0 +1,79 @@
+"""
+Perceptual hashes of images for reverse image search.
+
+Hashes are computed from a grayscale image of a few dozens pixels, so a large JPEG is reduced by the decoder itself
+and the rest of its pixels is never decoded.
+"""
+
+from typing import Final, override
+
+import cv2
+import numpy as np
+
+from pix_erase.application.common.ports.image.perceptual_hasher import ImagePerceptualHasher, PerceptualHashes
+from pix_erase.infrastructure.adapters.image_converters.image_header import ImageHeader, probe_image_header
+from pix_erase.infrastructure.errors.image_converters import ImageDecodingError
+
+HASH_SIDE: Final[int] = 8
+# pHash takes the lowest 8x8 frequencies of the DCT of a 32x32 image
+PHASH_DCT_SIDE: Final[int] = 32
+# the decoded image stays several times larger than the largest hashed one, so averaging has pixels to work with
+DECODE_MIN_SIDE: Final[int] = 4 * PHASH_DCT_SIDE
+JPEG_DECODE_REDUCTIONS: Final[tuple[tuple[int, int], ...]] = (
+    (8, cv2.IMREAD_REDUCED_GRAYSCALE_8),
+    (4, cv2.IMREAD_REDUCED_GRAYSCALE_4),
+    (2, cv2.IMREAD_REDUCED_GRAYSCALE_2),
+)
+
+
+def _decode_flag(header: ImageHeader | None) -> int:
+    if header is None or header.format != "JPEG":
+        return cv2.IMREAD_GRAYSCALE
+
+    short_side: int = min(header.width, header.height)
+
+    for factor, flag in JPEG_DECODE_REDUCTIONS:
+        if short_side // factor >= DECODE_MIN_SIDE:
+            return flag
+
+    return cv2.IMREAD_GRAYSCALE
+
+
+def _to_int(bits: np.ndarray) -> int:
+    return int.from_bytes(np.packbits(bits.flatten()).tobytes(), "big")
+
+
+def _shrink(gray: np.ndarray, width: int, height: int) -> np.ndarray:
+    return cv2.resize(gray, (width, height), interpolation=cv2.INTER_AREA)
+
+
+def _average_hash(gray: np.ndarray) -> int:
+    pixels: np.ndarray = _shrink(gray, HASH_SIDE, HASH_SIDE)
+    return _to_int(pixels > pixels.mean())
+
+
+def _difference_hash(gray: np.ndarray) -> int:
+    pixels: np.ndarray = _shrink(gray, HASH_SIDE + 1, HASH_SIDE)
+    return _to_int(pixels[:, 1:] > pixels[:, :-1])
+
+
+def _dct_hash(gray: np.ndarray) -> int:
+    pixels: np.ndarray = _shrink(gray, PHASH_DCT_SIDE, PHASH_DCT_SIDE).astype(np.float32)
+    low_frequencies: np.ndarray = cv2.dct(pixels)[:HASH_SIDE, :HASH_SIDE]
+    return _to_int(low_frequencies > np.median(low_frequencies))
+
+
+class Cv2ImagePerceptualHasher(ImagePerceptualHasher):
+    @override
+    def compute(self, data: bytes) -> PerceptualHashes:
+        gray: np.ndarray | None = cv2.imdecode(np.frombuffer(data, np.uint8), _decode_flag(probe_image_header(data)))
+
+        if gray is None:
+            msg = "Failed to decoding image"
+            raise ImageDecodingError(msg)
+
+        return PerceptualHashes(
+            phash=_dct_hash(gray),
+            dhash=_difference_hash(gray),
+            ahash=_average_hash(gray),
+        )
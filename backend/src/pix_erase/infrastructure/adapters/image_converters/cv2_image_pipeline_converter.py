@@ -0,0 +1,120 @@
+import logging
+from collections.abc import Sequence
+from typing import Final, override
+
+import numpy as np
+
+from pix_erase.domain.image.ports.image_pipeline_converter import (
+    CompressImageOperation,
+    GrayscaleImageOperation,
+    ImageOperation,
+    ImagePipelineConverter,
+    ProcessedImageDTO,
+    RemoveBackgroundImageOperation,
+    RemoveWatermarkImageOperation,
+    RotateImageOperation,
+    UpscaleImageOperation,
+)
+from pix_erase.domain.image.values.image_encoding import ImageEncoding
+from pix_erase.infrastructure.adapters.image_converters.codec import (
+    decode_image,
+    detect_format,
+    lossy_format,
+    reencode,
+    to_bgr,
+)
+from pix_erase.infrastructure.adapters.image_converters.cv2_edsr_upscale_converter import upsample_with_edsr
+from pix_erase.infrastructure.adapters.image_converters.cv2_image_color_to_gray_converter import to_grayscale
+from pix_erase.infrastructure.adapters.image_converters.cv2_image_nearest_neighbour_upscale_converter import (
+    upscale_nearest_neighbour,
+)
+from pix_erase.infrastructure.adapters.image_converters.cv2_image_rotation_converter import rotate
+from pix_erase.infrastructure.adapters.image_converters.cv2_watermark_remover import remove_watermark
+from pix_erase.infrastructure.adapters.image_converters.rembg_image_remove_background_converter import (
+    remove_background,
+)
+from pix_erase.setup.config.background_removal import BackgroundRemovalConfig
+from pix_erase.setup.config.super_resolution import SuperResolutionConfig
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+
+def _apply_operation(
+    img: np.ndarray,
+    operation: ImageOperation,
+    super_resolution_config: SuperResolutionConfig,
+    background_removal_config: BackgroundRemovalConfig,
+) -> np.ndarray:
+    match operation:
+        case RotateImageOperation(angle=angle):
+            img = rotate(img, angle)
+        case GrayscaleImageOperation():
+            img = to_grayscale(img)
+        case UpscaleImageOperation(algorithm="NearestNeighbour", scale=scale):
+            img = upscale_nearest_neighbour(img, scale)
+        case UpscaleImageOperation(algorithm="AI", scale=scale):
+            img = upsample_with_edsr(to_bgr(img), scale=scale, config=super_resolution_config)
+        case RemoveBackgroundImageOperation(model=model):
+            img = remove_background(to_bgr(img), config=background_removal_config, model=model)
+        case RemoveWatermarkImageOperation():
+            img = remove_watermark(to_bgr(img))
+
+    return img
+
+
+class Cv2ImagePipelineConverter(ImagePipelineConverter):
+    """
+    Keeps the image decoded between the steps, so a chain of operations costs one decode and one encode.
+
+    ``compress`` doesn't touch pixels, it sets the quality of the final encoding.
+    The result is encoded in the source format unless another format is requested,
+    images with an alpha channel (after background removal) are encoded in PNG then to keep transparency.
+    With ``compress`` and no requested format a lossless source is encoded in JPEG, or WebP when transparent.
+    """
+
+    def __init__(
+        self,
+        super_resolution_config: SuperResolutionConfig,
+        background_removal_config: BackgroundRemovalConfig,
+    ) -> None:
+        self._super_resolution_config: SuperResolutionConfig = super_resolution_config
+        self._background_removal_config: BackgroundRemovalConfig = background_removal_config
+
+    @override
+    def convert(
+        self,
+        data: bytes,
+        operations: Sequence[ImageOperation],
+        encoding: ImageEncoding | None = None,
+    ) -> ProcessedImageDTO:
+        img: np.ndarray = decode_image(data)
+
+        image_format: str | None = encoding.format if encoding is not None else None
+        quality: int | None = encoding.quality if encoding is not None else None
+        compressed: bool = False
+
+        for operation in operations:
+            logger.debug("Applying operation: %s", operation)
+
+            if isinstance(operation, CompressImageOperation):
+                quality = operation.quality
+                compressed = True
+                continue
+
+            img = _apply_operation(
+                img,
+                operation,
+                self._super_resolution_config,
+                self._background_removal_config,
+            )
+
+        height, width = img.shape[:2]
+
+        if compressed and image_format is None:
+            image_format = lossy_format(img, detect_format(data))
+
+        return ProcessedImageDTO(
+            data=reencode(data, img, ImageEncoding(format=image_format, quality=quality)),
+            width=width,
+            height=height,
+        )
@@ -5,7 +5,8 @@ import cv2
 import numpy as np
 
 from pix_erase.domain.image.ports.image_watermark_remover_converter import ImageWatermarkRemoverConverter
-from pix_erase.infrastructure.errors.image_converters import ImageDecodingError
+from pix_erase.domain.image.values.image_encoding import ImageEncoding
+from pix_erase.infrastructure.adapters.image_converters.codec import decode_image, reencode, to_bgr
 
 logger: Final[logging.Logger] = logging.getLogger(__name__)
 
@@ -20,24 +21,23 @@ def create_adaptive_mask(img_rgb: np.ndarray) -> np.ndarray:
     return cv2.bitwise_or(mask_brightness, mask_dark)
 
 
-class Cv2ImageWatermarkRemover(ImageWatermarkRemoverConverter):
-    @override
-    def convert(self, data: bytes) -> bytes:
-        img_bgr = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+def remove_watermark(img_bgr: np.ndarray) -> np.ndarray:
+    img_rgb = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2RGB)
+
+    text_mask = create_adaptive_mask(img_rgb)
 
-        if img_bgr is None:
-            msg = "Failed to decoding image"
-            raise ImageDecodingError(msg)
+    kernel = np.ones((2, 2), np.uint8)
+    text_mask = cv2.morphologyEx(text_mask.astype(np.uint8), cv2.MORPH_CLOSE, kernel)
+    text_mask = cv2.morphologyEx(text_mask, cv2.MORPH_OPEN, kernel)
 
-        img_rgb = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2RGB)
+    return cv2.inpaint(img_bgr, text_mask, 3, cv2.INPAINT_TELEA)
 
-        text_mask = create_adaptive_mask(img_rgb)
 
-        kernel = np.ones((2, 2), np.uint8)
-        text_mask = cv2.morphologyEx(text_mask.astype(np.uint8), cv2.MORPH_CLOSE, kernel)
-        text_mask = cv2.morphologyEx(text_mask, cv2.MORPH_OPEN, kernel)
+class Cv2ImageWatermarkRemover(ImageWatermarkRemoverConverter):
+    @override
+    def convert(self, data: bytes, encoding: ImageEncoding | None = None) -> bytes:
+        img_bgr = to_bgr(decode_image(data))
 
-        result = cv2.inpaint(img_bgr, text_mask, 3, cv2.INPAINT_TELEA)
+        result = remove_watermark(img_bgr)
 
-        success, encoded = cv2.imencode(".jpg", result)
-        return encoded.tobytes() if success else data
+        return reencode(data, result, encoding)
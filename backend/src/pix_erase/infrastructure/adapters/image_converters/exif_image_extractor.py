@@ -1,12 +1,11 @@
+import asyncio
 import logging
 from collections.abc import Mapping, MutableMapping
 from datetime import UTC, datetime
 from fractions import Fraction
-from typing import Any, Final, Literal, cast, override
+from typing import Any, Final, cast, override
 
-import cv2
 import exif
-import numpy as np
 from exif import Image
 
 from pix_erase.application.common.ports.image.extractor import (
@@ -22,31 +21,44 @@ from pix_erase.application.common.ports.image.extractor import (
     Orientation,
     WhiteBalance,
 )
-from pix_erase.infrastructure.errors.image_converters import ImageDecodingError
+from pix_erase.infrastructure.adapters.image_converters.codec import decode_image, detect_format
+from pix_erase.infrastructure.adapters.image_converters.image_header import (
+    ImageHeader,
+    metadata_size,
+    probe_image_header,
+)
 
 logger: Final[logging.Logger] = logging.getLogger(__name__)
 
 
+def _decoded_dimensions(data: bytes) -> tuple[int, int]:
+    height, width = decode_image(data).shape[:2]
+    return width, height
+
+
 class ExifImageInfoExtractor(ImageInfoExtractor):
+    """
+    Size, format and animation are read from the header of the image, pixels are decoded
+    only for formats whose header isn't parsed.
+    """
+
     @override
     async def extract(self, data: bytes) -> ImageInfo:
-        # Декодируем изображение для получения размеров
-        buffer = np.frombuffer(data, np.uint8)
-        img = cv2.imdecode(buffer, cv2.IMREAD_COLOR)
-
-        if img is None:
-            msg = "Failed to decode image"
-            raise ImageDecodingError(msg)
-
-        height, width, _ = img.shape
+        header: ImageHeader | None = probe_image_header(data)
+
+        if header is not None:
+            width, height = header.width, header.height
+            format_type: str = header.format
+            is_animated: bool = header.is_animated
+        else:
+            logger.debug("Unknown image header, decoding the image to get its size")
+            width, height = await asyncio.to_thread(_decoded_dimensions, data)
+            format_type = detect_format(data)
+            is_animated = False
 
         # Извлекаем EXIF данные
         exif_data = self._safe_extract_exif(data)
 
-        # Определяем формат и анимацию
-        format_type = self._detect_format(data)
-        is_animated = self._check_if_animated(data)
-
         # Создаем структурированные объекты
         camera_settings = self._create_camera_settings(exif_data)
         exposure_settings = self._create_exposure_settings(exif_data)
@@ -66,6 +78,10 @@ class ExifImageInfoExtractor(ImageInfoExtractor):
             datetime_info=datetime_info,
         )
 
+    @override
+    def metadata_size(self, head: bytes) -> int | None:
+        return metadata_size(head)
+
     @staticmethod
     def _safe_extract_exif(data: bytes) -> Mapping[str, Any]:
         """Безопасно извлекает EXIF данные"""
@@ -227,23 +243,6 @@ class ExifImageInfoExtractor(ImageInfoExtractor):
         except (ValueError, TypeError):
             return None
 
-    @staticmethod
-    def _detect_format(data: bytes) -> Literal["JPEG", "PNG", "GIF", "WEBP", "UNKNOWN"]:
-        """Определяет формат изображения по сигнатурам"""
-        if data.startswith(b"\xff\xd8\xff"):
-            return "JPEG"
-
-        if data.startswith(b"\x89PNG\r\n\x1a\n"):
-            return "PNG"
-
-        if data.startswith(b"GIF8"):
-            return "GIF"
-
-        if data.startswith(b"RIFF") and data[8:12] == b"WEBP":
-            return "WEBP"
-
-        return "UNKNOWN"
-
     @staticmethod
     def _format_camera_make(data: str | None) -> str | None:
         if data is None:
@@ -256,19 +255,6 @@ class ExifImageInfoExtractor(ImageInfoExtractor):
             return None
         return data.strip()
 
-    def _check_if_animated(self, data: bytes) -> bool:
-        """Проверяет, является ли изображение анимированным"""
-        format_type = self._detect_format(data)
-
-        if format_type == "GIF":
-            return data.count(b"\x21\xf9\x04") > 1
-        if format_type == "PNG":
-            return b"acTL" in data
-        if format_type == "WEBP":
-            return b"ANIM" in data
-
-        return False
-
     @staticmethod
     def _format_exposure_time(value: tuple[int, int] | float | None | object) -> str | None:
         if value is None:
@@ -0,0 +1,393 @@
+"""
+Reading of image properties from the header of a file, without decoding pixels.
+
+Streamed uploads only keep their first part in memory, dimensions have to be known from it.
+The metadata extractor uses the same headers, a full decode is left for formats that aren't parsed here.
+"""
+
+import struct
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Final, Literal
+
+type HeaderImageFormat = Literal["JPEG", "PNG", "GIF", "WEBP", "TIFF", "BMP"]
+
+PNG_SIGNATURES: Final[tuple[bytes, ...]] = (b"\x89PNG\r\n\x1a\n",)
+GIF_SIGNATURES: Final[tuple[bytes, ...]] = (b"GIF87a", b"GIF89a")
+JPEG_SIGNATURES: Final[tuple[bytes, ...]] = (b"\xff\xd8",)
+WEBP_SIGNATURES: Final[tuple[bytes, ...]] = (b"RIFF",)
+TIFF_SIGNATURES: Final[tuple[bytes, ...]] = (b"II*\x00", b"MM\x00*")
+BMP_SIGNATURES: Final[tuple[bytes, ...]] = (b"BM",)
+
+PNG_CHUNKS_OFFSET: Final[int] = 8
+# channels of PNG color types: grayscale, RGB, palette, grayscale with alpha, RGBA
+PNG_COLOR_TYPE_CHANNELS: Final[dict[int, int]] = {0: 1, 2: 3, 3: 3, 4: 2, 6: 4}
+
+GIF_SCREEN_DESCRIPTOR_END: Final[int] = 13
+GIF_EXTENSION_INTRODUCER: Final[int] = 0x21
+GIF_IMAGE_SEPARATOR: Final[int] = 0x2C
+GIF_IMAGE_DESCRIPTOR_SIZE: Final[int] = 10
+GIF_COLOR_TABLE_FLAG: Final[int] = 0x80
+
+# SOF0-SOF15 except DHT (C4), JPG (C8) and DAC (CC), they hold the frame size
+JPEG_SOF_MARKERS: Final[frozenset[int]] = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+# markers without a length field
+JPEG_STANDALONE_MARKERS: Final[frozenset[int]] = frozenset({0x01, *range(0xD0, 0xD8)})
+JPEG_SOS_MARKER: Final[int] = 0xDA
+JPEG_SOF_SIZE: Final[int] = 10
+
+TIFF_WIDTH_TAG: Final[int] = 256
+TIFF_HEIGHT_TAG: Final[int] = 257
+TIFF_SAMPLES_PER_PIXEL_TAG: Final[int] = 277
+TIFF_TAGS: Final[frozenset[int]] = frozenset({TIFF_WIDTH_TAG, TIFF_HEIGHT_TAG, TIFF_SAMPLES_PER_PIXEL_TAG})
+TIFF_SHORT: Final[int] = 3
+TIFF_LONG: Final[int] = 4
+TIFF_HEADER_SIZE: Final[int] = 8
+TIFF_ENTRY_SIZE: Final[int] = 12
+
+BMP_HEADER_SIZE: Final[int] = 30
+BMP_BITS_WITH_ALPHA: Final[int] = 32
+
+VP8_FRAME_TAG: Final[bytes] = b"\x9d\x01\x2a"
+VP8L_SIGNATURE: Final[int] = 0x2F
+VP8L_ALPHA_BIT: Final[int] = 28
+VP8X_ALPHA_FLAG: Final[int] = 0x10
+VP8X_ANIMATION_FLAG: Final[int] = 0x02
+WEBP_PAYLOAD_SIZE: Final[int] = 10
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ImageHeader:
+    format: HeaderImageFormat
+    width: int
+    height: int
+    channels: int
+    is_animated: bool = False
+
+
+def _png_header(data: bytes) -> ImageHeader | None:
+    # IHDR is always the first chunk
+    if len(data) < 26 or data[12:16] != b"IHDR":
+        return None
+
+    width, height = struct.unpack(">II", data[16:24])
+
+    return ImageHeader(
+        format="PNG",
+        width=width,
+        height=height,
+        channels=PNG_COLOR_TYPE_CHANNELS.get(data[25], 3),
+        is_animated=_png_is_animated(data),
+    )
+
+
+def _png_is_animated(data: bytes) -> bool:
+    """APNG declares its frames in ``acTL`` before the first image data chunk."""
+    offset: int = PNG_CHUNKS_OFFSET
+
+    while offset + 8 <= len(data):
+        length, chunk_type = struct.unpack(">I4s", data[offset : offset + 8])
+
+        if chunk_type == b"acTL":
+            return True
+
+        if chunk_type == b"IDAT":
+            return False
+
+        # length, type and CRC around the chunk data
+        offset += length + 12
+
+    return False
+
+
+def _gif_header(data: bytes) -> ImageHeader | None:
+    if len(data) < GIF_SCREEN_DESCRIPTOR_END:
+        return None
+
+    width, height = struct.unpack("<HH", data[6:10])
+    return ImageHeader(format="GIF", width=width, height=height, channels=3, is_animated=_gif_frames(data) > 1)
+
+
+def _skip_gif_sub_blocks(data: bytes, offset: int) -> int:
+    while offset < len(data) and data[offset] != 0:
+        offset += data[offset] + 1
+
+    return offset + 1
+
+
+def _gif_color_table_size(flags: int) -> int:
+    if not flags & GIF_COLOR_TABLE_FLAG:
+        return 0
+
+    return 3 << ((flags & 0x07) + 1)
+
+
+def _gif_frames(data: bytes) -> int:
+    """Counts image descriptors, stops at the second one: only animation matters."""
+    offset: int = GIF_SCREEN_DESCRIPTOR_END + _gif_color_table_size(data[10])
+    frames: int = 0
+
+    while offset < len(data) and frames < 2:
+        block: int = data[offset]
+
+        if block == GIF_EXTENSION_INTRODUCER:
+            # introducer and label, then data sub-blocks
+            offset = _skip_gif_sub_blocks(data, offset + 2)
+        elif block == GIF_IMAGE_SEPARATOR and offset + GIF_IMAGE_DESCRIPTOR_SIZE <= len(data):
+            frames += 1
+            offset += GIF_IMAGE_DESCRIPTOR_SIZE + _gif_color_table_size(data[offset + 9])
+            # LZW minimum code size, then data sub-blocks
+            offset = _skip_gif_sub_blocks(data, offset + 1)
+        else:
+            break
+
+    return frames
+
+
+def _jpeg_header(data: bytes) -> ImageHeader | None:
+    offset: int = 2
+
+    while offset + 4 <= len(data):
+        if data[offset] != 0xFF:
+            return None
+
+        marker: int = data[offset + 1]
+
+        if marker == 0xFF:
+            # fill byte before a marker
+            offset += 1
+            continue
+
+        if marker in JPEG_STANDALONE_MARKERS:
+            offset += 2
+            continue
+
+        if marker in JPEG_SOF_MARKERS and offset + JPEG_SOF_SIZE <= len(data):
+            height, width = struct.unpack(">HH", data[offset + 5 : offset + 9])
+            return ImageHeader(format="JPEG", width=width, height=height, channels=data[offset + 9])
+
+        if marker in JPEG_SOF_MARKERS or marker == JPEG_SOS_MARKER:
+            # the frame header is cut off or entropy-coded data starts, a frame header can't follow it
+            return None
+
+        (length,) = struct.unpack(">H", data[offset + 2 : offset + 4])
+        offset += 2 + length
+
+    return None
+
+
+def _vp8_header(payload: bytes) -> ImageHeader | None:
+    if payload[3:6] != VP8_FRAME_TAG:
+        return None
+
+    width, height = struct.unpack("<HH", payload[6:10])
+    return ImageHeader(format="WEBP", width=width & 0x3FFF, height=height & 0x3FFF, channels=3)
+
+
+def _vp8l_header(payload: bytes) -> ImageHeader | None:
+    if payload[0] != VP8L_SIGNATURE:
+        return None
+
+    bits: int = int.from_bytes(payload[1:5], "little")
+    return ImageHeader(
+        format="WEBP",
+        width=(bits & 0x3FFF) + 1,
+        height=((bits >> 14) & 0x3FFF) + 1,
+        channels=4 if bits >> VP8L_ALPHA_BIT & 1 else 3,
+    )
+
+
+def _vp8x_header(payload: bytes) -> ImageHeader | None:
+    flags: int = payload[0]
+    return ImageHeader(
+        format="WEBP",
+        width=int.from_bytes(payload[4:7], "little") + 1,
+        height=int.from_bytes(payload[7:10], "little") + 1,
+        channels=4 if flags & VP8X_ALPHA_FLAG else 3,
+        is_animated=bool(flags & VP8X_ANIMATION_FLAG),
+    )
+
+
+WEBP_CHUNK_READERS: Final[dict[bytes, Callable[[bytes], ImageHeader | None]]] = {
+    b"VP8 ": _vp8_header,
+    b"VP8L": _vp8l_header,
+    b"VP8X": _vp8x_header,
+}
+
+
+def _webp_header(data: bytes) -> ImageHeader | None:
+    # RIFF container: the first chunk follows the 12 bytes of the file header
+    read_chunk = WEBP_CHUNK_READERS.get(data[12:16])
+    payload: bytes = data[20:30]
+
+    if data[8:12] != b"WEBP" or read_chunk is None or len(payload) < WEBP_PAYLOAD_SIZE:
+        return None
+
+    return read_chunk(payload)
+
+
+def _tiff_header(data: bytes) -> ImageHeader | None:
+    order: str = "<" if data.startswith(b"II") else ">"
+
+    if len(data) < TIFF_HEADER_SIZE:
+        return None
+
+    (ifd_offset,) = struct.unpack(f"{order}I", data[4:8])
+
+    if ifd_offset + 2 > len(data):
+        return None
+
+    (entries,) = struct.unpack(f"{order}H", data[ifd_offset : ifd_offset + 2])
+    # one sample per pixel unless the tag says otherwise
+    values: dict[int, int] = {TIFF_SAMPLES_PER_PIXEL_TAG: 1}
+
+    for index in range(entries):
+        start: int = ifd_offset + 2 + index * TIFF_ENTRY_SIZE
+        entry: bytes = data[start : start + TIFF_ENTRY_SIZE]
+
+        if len(entry) < TIFF_ENTRY_SIZE:
+            return None
+
+        tag, value_type = struct.unpack(f"{order}HH", entry[:4])
+
+        if tag not in TIFF_TAGS:
+            continue
+
+        if value_type == TIFF_SHORT:
+            (values[tag],) = struct.unpack(f"{order}H", entry[8:10])
+        elif value_type == TIFF_LONG:
+            (values[tag],) = struct.unpack(f"{order}I", entry[8:12])
+
+    if TIFF_WIDTH_TAG not in values or TIFF_HEIGHT_TAG not in values:
+        return None
+
+    return ImageHeader(
+        format="TIFF",
+        width=values[TIFF_WIDTH_TAG],
+        height=values[TIFF_HEIGHT_TAG],
+        channels=values[TIFF_SAMPLES_PER_PIXEL_TAG],
+    )
+
+
+def _bmp_header(data: bytes) -> ImageHeader | None:
+    if len(data) < BMP_HEADER_SIZE:
+        return None
+
+    # height is negative for images stored top-down
+    width, height, _, bits_per_pixel = struct.unpack("<iiHH", data[18:30])
+    return ImageHeader(
+        format="BMP",
+        width=abs(width),
+        height=abs(height),
+        channels=4 if bits_per_pixel == BMP_BITS_WITH_ALPHA else 3,
+    )
+
+
+HEADER_READERS: Final[tuple[tuple[tuple[bytes, ...], Callable[[bytes], ImageHeader | None]], ...]] = (
+    (PNG_SIGNATURES, _png_header),
+    (GIF_SIGNATURES, _gif_header),
+    (JPEG_SIGNATURES, _jpeg_header),
+    (WEBP_SIGNATURES, _webp_header),
+    (TIFF_SIGNATURES, _tiff_header),
+    (BMP_SIGNATURES, _bmp_header),
+)
+
+
+def _jpeg_metadata_size(data: bytes) -> int | None:
+    """EXIF (APP1) and the frame header come before the entropy-coded data, the size is the end of SOF."""
+    offset: int = 2
+
+    while True:
+        if offset + 4 > len(data):
+            # the next marker is cut off, its length is needed
+            return offset + 4
+
+        if data[offset] != 0xFF:
+            return None
+
+        marker: int = data[offset + 1]
+
+        if marker == 0xFF:
+            offset += 1
+            continue
+
+        if marker in JPEG_STANDALONE_MARKERS:
+            offset += 2
+            continue
+
+        if marker == JPEG_SOS_MARKER:
+            return None
+
+        (length,) = struct.unpack(">H", data[offset + 2 : offset + 4])
+        offset += 2 + length
+
+        if marker in JPEG_SOF_MARKERS:
+            return offset
+
+
+def _png_metadata_size(data: bytes) -> int | None:
+    """Chunks before the first image data hold the header, EXIF and the animation control."""
+    offset: int = PNG_CHUNKS_OFFSET
+
+    while offset + 8 <= len(data):
+        length, chunk_type = struct.unpack(">I4s", data[offset : offset + 8])
+
+        if chunk_type == b"IDAT":
+            return offset + 8
+
+        offset += length + 12
+
+    return offset + 8
+
+
+def _tiff_metadata_size(data: bytes) -> int | None:
+    """The first IFD can be anywhere in the file, its offset is in the file header."""
+    if len(data) < TIFF_HEADER_SIZE:
+        return TIFF_HEADER_SIZE
+
+    order: str = "<" if data.startswith(b"II") else ">"
+    ifd_offset: int = struct.unpack(f"{order}I", data[4:8])[0]
+
+    if ifd_offset + 2 > len(data):
+        return ifd_offset + 2
+
+    entries: int = struct.unpack(f"{order}H", data[ifd_offset : ifd_offset + 2])[0]
+    return ifd_offset + 2 + entries * TIFF_ENTRY_SIZE
+
+
+METADATA_SIZE_READERS: Final[tuple[tuple[tuple[bytes, ...], Callable[[bytes], int | None]], ...]] = (
+    (PNG_SIGNATURES, _png_metadata_size),
+    (JPEG_SIGNATURES, _jpeg_metadata_size),
+    (WEBP_SIGNATURES, lambda _: 12 + 8 + WEBP_PAYLOAD_SIZE),
+    (TIFF_SIGNATURES, _tiff_metadata_size),
+    (BMP_SIGNATURES, lambda _: BMP_HEADER_SIZE),
+)
+
+
+def metadata_size(data: bytes) -> int | None:
+    """
+    Returns how many first bytes of the image hold its header and EXIF, ``data`` is a prefix of the image.
+
+    The result may be bigger than ``data``: a segment goes beyond the prefix and a longer prefix is needed.
+    ``None`` means the whole image is needed: the format is unknown or the header of GIF,
+    which has to be scanned frame by frame to find out if it's animated.
+    """
+    for signatures, read_metadata_size in METADATA_SIZE_READERS:
+        if data.startswith(signatures):
+            return read_metadata_size(data)
+
+    return None
+
+
+def probe_image_header(data: bytes) -> ImageHeader | None:
+    """
+    Returns properties of the image read from its header.
+
+    ``None`` means the format is unknown or the header doesn't fit into ``data``,
+    the caller has to decode the image then.
+    """
+    for signatures, read_header in HEADER_READERS:
+        if data.startswith(signatures):
+            return read_header(data)
+
+    return None
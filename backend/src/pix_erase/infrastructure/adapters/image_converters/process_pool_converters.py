@@ -0,0 +1,216 @@
+"""
+Decorators that move image converters off the worker event loop into the image process pool.
+
+Every decorator keeps the port of the wrapped converter, so domain services don't know
+where the pixels are actually processed.
+"""
+
+from collections.abc import Callable, Sequence
+from typing import Any, Final, override
+
+from pix_erase.domain.image.ports.image_ai_upscaler_converter import ImageAIUpscaleConverter
+from pix_erase.domain.image.ports.image_background_remove_converter import (
+    BackgroundRemovalModel,
+    ImageRemoveBackgroundConverter,
+)
+from pix_erase.domain.image.ports.image_color_to_gray_converter import ImageColorToCrayScaleConverter
+from pix_erase.domain.image.ports.image_comparer_converter import ImageComparerConverter, ScoresDTO
+from pix_erase.domain.image.ports.image_compress_converter import ImageCompressConverter
+from pix_erase.domain.image.ports.image_crop_converter import ImageCropConverter
+from pix_erase.domain.image.ports.image_nearest_neighbour_upscale_converter import (
+    ImageNearestNeighbourUpscalerConverter,
+)
+from pix_erase.domain.image.ports.image_pipeline_converter import (
+    ImageOperation,
+    ImagePipelineConverter,
+    ProcessedImageDTO,
+)
+from pix_erase.domain.image.ports.image_resizer import ImageResizerConverter
+from pix_erase.domain.image.ports.image_rotation_converter import ImageRotationConverter
+from pix_erase.domain.image.ports.image_watermark_remover_converter import ImageWatermarkRemoverConverter
+from pix_erase.domain.image.values.image_encoding import ImageEncoding
+from pix_erase.domain.image.values.image_scale import ImageScale
+from pix_erase.infrastructure.adapters.image_converters.rembg_session_pool import (
+    RembgTiming,
+    call_with_rembg_timings,
+    observe_rembg_timings,
+)
+from pix_erase.infrastructure.processing.process_pool import ImageProcessPool
+
+
+def _call_with_rembg_timings[ResultT](
+    pool: ImageProcessPool,
+    convert: Callable[..., ResultT],
+    **kwargs: Any,  # noqa: ANN401
+) -> ResultT:
+    """Background removal runs in the pool process, its timings are observed here where metrics are scraped."""
+    processed: tuple[ResultT, list[RembgTiming]] = pool.call(call_with_rembg_timings, convert=convert, **kwargs)
+    result, timings = processed
+    observe_rembg_timings(timings)
+    return result
+
+
+class ProcessPoolImageColorToCrayScaleConverter(ImageColorToCrayScaleConverter):
+    def __init__(self, converter: ImageColorToCrayScaleConverter, pool: ImageProcessPool) -> None:
+        self._converter: Final[ImageColorToCrayScaleConverter] = converter
+        self._pool: Final[ImageProcessPool] = pool
+
+    @override
+    def convert(self, data: bytes, encoding: ImageEncoding | None = None) -> bytes:
+        return self._pool.call(self._converter.convert, data=data, encoding=encoding)
+
+
+class ProcessPoolImageCompressConverter(ImageCompressConverter):
+    def __init__(self, converter: ImageCompressConverter, pool: ImageProcessPool) -> None:
+        self._converter: Final[ImageCompressConverter] = converter
+        self._pool: Final[ImageProcessPool] = pool
+
+    @override
+    def convert(self, data: bytes, quality: int = 90, encoding: ImageEncoding | None = None) -> bytes:
+        return self._pool.call(self._converter.convert, data=data, quality=quality, encoding=encoding)
+
+
+class ProcessPoolImageComparerConverter(ImageComparerConverter):
+    def __init__(self, converter: ImageComparerConverter, pool: ImageProcessPool) -> None:
+        self._converter: Final[ImageComparerConverter] = converter
+        self._pool: Final[ImageProcessPool] = pool
+
+    @override
+    def compare_by_histograms(self, first_image: bytes, second_image: bytes) -> ScoresDTO:
+        return self._pool.call(
+            self._converter.compare_by_histograms,
+            first_image=first_image,
+            second_image=second_image,
+        )
+
+    @override
+    def extract_features(self, image: bytes) -> bytes:
+        return self._pool.call(self._converter.extract_features, image=image)
+
+    @override
+    def compare_features(self, reference: bytes, candidates: Sequence[bytes]) -> list[ScoresDTO]:
+        return self._pool.call(self._converter.compare_features, reference=reference, candidates=candidates)
+
+    @override
+    def compare_features_pairwise(self, features: Sequence[bytes]) -> list[list[ScoresDTO]]:
+        return self._pool.call(self._converter.compare_features_pairwise, features=features)
+
+
+class ProcessPoolImageCropConverter(ImageCropConverter):
+    def __init__(self, converter: ImageCropConverter, pool: ImageProcessPool) -> None:
+        self._converter: Final[ImageCropConverter] = converter
+        self._pool: Final[ImageProcessPool] = pool
+
+    @override
+    def convert(self, data: bytes, new_width: int, new_height: int) -> bytes:
+        return self._pool.call(self._converter.convert, data=data, new_width=new_width, new_height=new_height)
+
+
+class ProcessPoolImageRotationConverter(ImageRotationConverter):
+    def __init__(self, converter: ImageRotationConverter, pool: ImageProcessPool) -> None:
+        self._converter: Final[ImageRotationConverter] = converter
+        self._pool: Final[ImageProcessPool] = pool
+
+    @override
+    def convert(self, data: bytes, angle: int = 90, encoding: ImageEncoding | None = None) -> bytes:
+        return self._pool.call(self._converter.convert, data=data, angle=angle, encoding=encoding)
+
+
+class ProcessPoolImageWatermarkRemoverConverter(ImageWatermarkRemoverConverter):
+    def __init__(self, converter: ImageWatermarkRemoverConverter, pool: ImageProcessPool) -> None:
+        self._converter: Final[ImageWatermarkRemoverConverter] = converter
+        self._pool: Final[ImageProcessPool] = pool
+
+    @override
+    def convert(self, data: bytes, encoding: ImageEncoding | None = None) -> bytes:
+        return self._pool.call(self._converter.convert, data=data, encoding=encoding)
+
+
+class ProcessPoolImageNearestNeighbourUpscalerConverter(ImageNearestNeighbourUpscalerConverter):
+    def __init__(self, converter: ImageNearestNeighbourUpscalerConverter, pool: ImageProcessPool) -> None:
+        self._converter: Final[ImageNearestNeighbourUpscalerConverter] = converter
+        self._pool: Final[ImageProcessPool] = pool
+
+    @override
+    def convert(
+        self,
+        data: bytes,
+        width: int,
+        height: int,
+        scale: ImageScale,
+        encoding: ImageEncoding | None = None,
+    ) -> bytes:
+        return self._pool.call(
+            self._converter.convert,
+            data=data,
+            width=width,
+            height=height,
+            scale=scale,
+            encoding=encoding,
+        )
+
+
+class ProcessPoolImageAIUpscaleConverter(ImageAIUpscaleConverter):
+    def __init__(self, converter: ImageAIUpscaleConverter, pool: ImageProcessPool) -> None:
+        self._converter: Final[ImageAIUpscaleConverter] = converter
+        self._pool: Final[ImageProcessPool] = pool
+
+    @override
+    def convert(
+        self,
+        data: bytes,
+        width: int,
+        height: int,
+        scale: ImageScale,
+        encoding: ImageEncoding | None = None,
+    ) -> bytes:
+        return self._pool.call(
+            self._converter.convert,
+            data=data,
+            width=width,
+            height=height,
+            scale=scale,
+            encoding=encoding,
+        )
+
+
+class ProcessPoolImageRemoveBackgroundConverter(ImageRemoveBackgroundConverter):
+    def __init__(self, converter: ImageRemoveBackgroundConverter, pool: ImageProcessPool) -> None:
+        self._converter: Final[ImageRemoveBackgroundConverter] = converter
+        self._pool: Final[ImageProcessPool] = pool
+
+    @override
+    def convert(
+        self,
+        data: bytes,
+        model: BackgroundRemovalModel | None = None,
+        encoding: ImageEncoding | None = None,
+    ) -> bytes:
+        return _call_with_rembg_timings(self._pool, self._converter.convert, data=data, model=model, encoding=encoding)
+
+
+class ProcessPoolImageResizerConverter(ImageResizerConverter):
+    def __init__(self, converter: ImageResizerConverter, pool: ImageProcessPool) -> None:
+        self._converter: Final[ImageResizerConverter] = converter
+        self._pool: Final[ImageProcessPool] = pool
+
+    @override
+    def resize(self, data: bytes, image_width: int, image_height: int) -> bytes:
+        return self._pool.call(self._converter.resize, data=data, image_width=image_width, image_height=image_height)
+
+
+class ProcessPoolImagePipelineConverter(ImagePipelineConverter):
+    def __init__(self, converter: ImagePipelineConverter, pool: ImageProcessPool) -> None:
+        self._converter: Final[ImagePipelineConverter] = converter
+        self._pool: Final[ImageProcessPool] = pool
+
+    @override
+    def convert(
+        self,
+        data: bytes,
+        operations: Sequence[ImageOperation],
+        encoding: ImageEncoding | None = None,
+    ) -> ProcessedImageDTO:
+        return _call_with_rembg_timings(
+            self._pool, self._converter.convert, data=data, operations=operations, encoding=encoding
+        )
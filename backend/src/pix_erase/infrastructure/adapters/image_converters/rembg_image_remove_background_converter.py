@@ -1,25 +1,46 @@
-from typing import override
+from typing import Final, override
 
 import cv2
 import numpy as np
-from rembg import remove
 
-from pix_erase.domain.image.ports.image_background_remove_converter import ImageRemoveBackgroundConverter
-from pix_erase.infrastructure.errors.image_converters import ImageDecodingError
+from pix_erase.domain.image.ports.image_background_remove_converter import (
+    BackgroundRemovalModel,
+    ImageRemoveBackgroundConverter,
+)
+from pix_erase.domain.image.values.image_encoding import ImageEncoding
+from pix_erase.infrastructure.adapters.image_converters.codec import decode_image, reencode, to_bgr
+from pix_erase.infrastructure.adapters.image_converters.rembg_session_pool import get_rembg_session_pool
+from pix_erase.setup.config.background_removal import BackgroundRemovalConfig
+
+
+def remove_background(
+    img_bgr: np.ndarray, config: BackgroundRemovalConfig, model: BackgroundRemovalModel | None = None
+) -> np.ndarray:
+    """Returns BGRA image, where the removed background is transparent."""
+    # Конвертируем в RGB для работы
+    img_rgb = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2RGB)
+    cleared_from_background_image: np.ndarray = get_rembg_session_pool(
+        intra_op_threads=config.intra_op_threads,
+        inter_op_threads=config.inter_op_threads,
+    ).remove(img_rgb, model or config.default_model)
+
+    return cv2.cvtColor(cleared_from_background_image, cv2.COLOR_RGBA2BGRA)
 
 
 class RembgImageRemoveBackgroundConverter(ImageRemoveBackgroundConverter):
-    @override
-    def convert(self, data: bytes) -> bytes:
-        img_bgr = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+    def __init__(self, config: BackgroundRemovalConfig) -> None:
+        self._config: Final[BackgroundRemovalConfig] = config
 
-        if img_bgr is None:
-            msg = "Failed to decoding image"
-            raise ImageDecodingError(msg)
+    @override
+    def convert(
+        self,
+        data: bytes,
+        model: BackgroundRemovalModel | None = None,
+        encoding: ImageEncoding | None = None,
+    ) -> bytes:
+        img_bgr = to_bgr(decode_image(data))
 
-        # Конвертируем в RGB для работы
-        img_rgb = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2RGB)
-        cleared_from_background_image = remove(data=img_rgb)
-        _, buffer = cv2.imencode(".jpg", cleared_from_background_image)
+        cleared_from_background_image = remove_background(img_bgr, config=self._config, model=model)
 
-        return buffer.tobytes()
+        # Without an explicit format the transparent result is written as PNG
+        return reencode(data, cleared_from_background_image, encoding)
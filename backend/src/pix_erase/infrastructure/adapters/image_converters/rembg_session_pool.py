@@ -0,0 +1,175 @@
+"""
+rembg sessions that live as long as the process.
+
+Without a session ``rembg.remove`` resolves the model and creates an ONNX Runtime session on every call.
+Sessions are kept per process (the converter itself is pickled into the image process pool on every call),
+one session per model: ``InferenceSession.run`` is safe to call from several threads.
+
+Metrics of a pool process are never scraped, so there timings are collected instead of observed and are
+returned to the parent together with the result by ``call_with_rembg_timings``.
+"""
+
+import logging
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Final, Literal
+
+import numpy as np
+import onnxruntime as ort
+from prometheus_client import Histogram
+from rembg import new_session, remove
+from rembg.sessions import BaseSession, sessions_class
+
+from pix_erase.domain.image.ports.image_background_remove_converter import BackgroundRemovalModel
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+LATENCY_BUCKETS: Final[tuple[float, ...]] = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+BACKGROUND_REMOVAL_LATENCY: Final[Histogram] = Histogram(
+    "background_removal_inference_seconds",
+    "Time of background removal of one image",
+    ["model"],
+    buckets=LATENCY_BUCKETS,
+)
+BACKGROUND_REMOVAL_SESSION_LOAD: Final[Histogram] = Histogram(
+    "background_removal_session_load_seconds",
+    "Time of creating ONNX Runtime session for a background removal model",
+    ["model"],
+    buckets=LATENCY_BUCKETS,
+)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RembgTiming:
+    metric: Literal["inference", "session_load"]
+    model: BackgroundRemovalModel
+    seconds: float
+
+
+def observe_rembg_timings(timings: Iterable[RembgTiming]) -> None:
+    for timing in timings:
+        histogram: Histogram = (
+            BACKGROUND_REMOVAL_LATENCY if timing.metric == "inference" else BACKGROUND_REMOVAL_SESSION_LOAD
+        )
+        histogram.labels(timing.model).observe(timing.seconds)
+
+
+class RembgSessionPool:
+    def __init__(self, intra_op_threads: int | None, inter_op_threads: int | None) -> None:
+        self._intra_op_threads: Final[int | None] = intra_op_threads
+        self._inter_op_threads: Final[int | None] = inter_op_threads
+        self._sessions: dict[str, BaseSession] = {}
+        self._lock: Final[Lock] = Lock()
+        self._timings: list[RembgTiming] = []
+        self._timings_lock: Final[Lock] = Lock()
+
+    def get(self, model: BackgroundRemovalModel) -> BaseSession:
+        with self._lock:
+            if model not in self._sessions:
+                started_at: float = time.perf_counter()
+                self._sessions[model] = self._new_session(model)
+                load_seconds: float = time.perf_counter() - started_at
+
+                self._record(RembgTiming(metric="session_load", model=model, seconds=load_seconds))
+                logger.info("Created rembg session for model %s in %.3fs", model, load_seconds)
+
+            return self._sessions[model]
+
+    def remove(self, img_rgb: np.ndarray, model: BackgroundRemovalModel) -> np.ndarray:
+        session: BaseSession = self.get(model)
+
+        started_at: float = time.perf_counter()
+        result: np.ndarray = remove(data=img_rgb, session=session)
+        self._record(RembgTiming(metric="inference", model=model, seconds=time.perf_counter() - started_at))
+
+        return result
+
+    def drain_timings(self) -> list[RembgTiming]:
+        with self._timings_lock:
+            timings: list[RembgTiming] = self._timings
+            self._timings = []
+
+        return timings
+
+    def _record(self, timing: RembgTiming) -> None:
+        if not _collect_timings:
+            observe_rembg_timings((timing,))
+            return
+
+        with self._timings_lock:
+            self._timings.append(timing)
+
+    def _new_session(self, model: BackgroundRemovalModel) -> BaseSession:
+        if self._intra_op_threads is None and self._inter_op_threads is None:
+            return new_session(model)
+
+        # new_session builds SessionOptions itself from OMP_NUM_THREADS, so explicit settings need the session class
+        session_options: ort.SessionOptions = ort.SessionOptions()
+
+        if self._intra_op_threads is not None:
+            session_options.intra_op_num_threads = self._intra_op_threads
+
+        if self._inter_op_threads is not None:
+            session_options.inter_op_num_threads = self._inter_op_threads
+            session_options.execution_mode = ort.ExecutionMode.ORT_PARALLEL
+
+        session_class: type[BaseSession] = next(
+            session_class for session_class in sessions_class if session_class.name() == model
+        )
+        return session_class(model, session_options)
+
+
+_pool: RembgSessionPool | None = None
+_pool_lock: Final[Lock] = Lock()
+_collect_timings: bool = False
+
+
+def get_rembg_session_pool(
+    intra_op_threads: int | None = None,
+    inter_op_threads: int | None = None,
+) -> RembgSessionPool:
+    """Thread settings are applied by the first call in the process, they come from the same config anyway."""
+    global _pool  # noqa: PLW0603
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = RembgSessionPool(intra_op_threads=intra_op_threads, inter_op_threads=inter_op_threads)
+
+        return _pool
+
+
+def preload_rembg_sessions(
+    models: Iterable[BackgroundRemovalModel],
+    intra_op_threads: int | None = None,
+    inter_op_threads: int | None = None,
+) -> None:
+    """Creates sessions in the current process, used as the initializer of worker processes."""
+    pool: RembgSessionPool = get_rembg_session_pool(intra_op_threads, inter_op_threads)
+
+    for model in models:
+        try:
+            pool.get(model)
+        except Exception:
+            logger.exception("Failed to preload rembg session for model %s", model)
+
+
+def collect_rembg_timings() -> None:
+    """Makes sessions of the current process collect timings instead of observing them, used by pool processes."""
+    global _collect_timings  # noqa: PLW0603
+    _collect_timings = True
+
+
+def call_with_rembg_timings[ResultT](
+    convert: Callable[..., ResultT],
+    **kwargs: Any,  # noqa: ANN401
+) -> tuple[ResultT, list[RembgTiming]]:
+    """Runs ``convert`` in a pool process and returns timings collected since the previous call with the result."""
+    result: ResultT = convert(**kwargs)
+
+    with _pool_lock:
+        pool: RembgSessionPool | None = _pool
+
+    return result, [] if pool is None else pool.drain_timings()
@@ -0,0 +1,71 @@
+"""
+Reduced copies of an image for previews.
+
+The source is decoded once, every next smaller rendition is resized from the previous one with INTER_AREA,
+which averages pixels, so small previews stay sharp and each step works on fewer pixels. Renditions are
+WebP and keep transparency, an image is never enlarged.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Final
+
+import cv2
+import numpy as np
+
+from pix_erase.domain.image.values.image_encoding import ImageEncoding
+from pix_erase.infrastructure.adapters.image_converters.codec import (
+    GRAYSCALE_DIMENSIONS,
+    decode_image,
+    encode_image,
+    to_8bit,
+)
+
+RENDITION_CONTENT_TYPE: Final[str] = "image/webp"
+RENDITION_EXTENSION: Final[str] = ".webp"
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Rendition:
+    size: int
+    data: bytes
+    width: int
+    height: int
+
+
+def _decode(data: bytes) -> np.ndarray:
+    img: np.ndarray = to_8bit(decode_image(data))
+
+    if img.ndim == GRAYSCALE_DIMENSIONS:
+        img = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
+
+    return img
+
+
+def _fit(img: np.ndarray, size: int) -> np.ndarray:
+    height, width = img.shape[:2]
+    scale: float = size / max(height, width)
+
+    if scale >= 1:
+        return img
+
+    return cv2.resize(
+        img,
+        (max(1, round(width * scale)), max(1, round(height * scale))),
+        interpolation=cv2.INTER_AREA,
+    )
+
+
+def render_renditions(data: bytes, sizes: Iterable[int], quality: int) -> list[Rendition]:
+    img: np.ndarray = _decode(data)
+    encoding: ImageEncoding = ImageEncoding(format="WEBP", quality=quality)
+    renditions: list[Rendition] = []
+
+    for size in sorted(sizes, reverse=True):
+        img = _fit(img, size)
+        height, width = img.shape[:2]
+        renditions.append(
+            Rendition(size=size, data=encode_image(img, "WEBP", encoding), width=width, height=height),
+        )
+
+    return renditions
@@ -0,0 +1,197 @@
+"""
+Super resolution models that live as long as the process.
+
+The registry is process-global on purpose: converters are pickled into the image process pool
+on every call, so anything stored on a converter instance would be loaded again for every image.
+"""
+
+import logging
+import resource
+import time
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from queue import Empty, SimpleQueue
+from threading import Lock
+from types import MappingProxyType
+from typing import Final
+
+import numpy as np
+from cv2 import dnn_superres
+
+from pix_erase.domain.image.values.image_scale import ImageScale
+from pix_erase.infrastructure.errors.image_converters import SuperResolutionModelNotFoundError
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+DEFAULT_MODELS_PATH: Final[Path] = Path(__file__).parent.resolve() / "models"
+EDSR_MODEL_NAME: Final[str] = "edsr"
+WARM_UP_IMAGE_SIZE: Final[int] = 16
+# ru_maxrss is reported in kilobytes on Linux
+RSS_UNIT_BYTES: Final[int] = 1024
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SuperResolutionModelStats:
+    scale: int
+    path: str
+    file_size_bytes: int
+    peak_rss_growth_bytes: int
+    load_seconds: float
+    warm_up_seconds: float | None = None
+
+
+def _peak_rss_bytes() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * RSS_UNIT_BYTES
+
+
+class SuperResolutionModelRegistry:
+    """
+    Loads every EDSR model once per process and picks the model that matches the requested scale.
+
+    cv2 dnn networks aren't safe to run concurrently, so a network is borrowed by one thread at a time.
+    Extra instances of a model are created only when several tiles of an image are upscaled in parallel,
+    and they are kept for the next images.
+    """
+
+    def __init__(self, models_path: Path) -> None:
+        self._models_path: Final[Path] = models_path
+        self._idle_models: dict[int, SimpleQueue[dnn_superres.DnnSuperResImpl]] = {}
+        self._instances: dict[int, int] = {}
+        self._stats: dict[int, SuperResolutionModelStats] = {}
+        self._lock: Final[Lock] = Lock()
+
+    def model_path(self, scale: ImageScale) -> Path:
+        return self._models_path / f"EDSR_x{scale.value}.pb"
+
+    def load(self, scale: ImageScale, *, warm_up: bool = False) -> None:
+        with self._lock:
+            if scale.value in self._stats:
+                return
+
+            path: Path = self.model_path(scale)
+
+            if not path.is_file():
+                msg = f"Super resolution model for scale {scale} not found: {path}"
+                raise SuperResolutionModelNotFoundError(msg)
+
+            peak_rss_before: int = _peak_rss_bytes()
+            started_at: float = time.perf_counter()
+
+            model: dnn_superres.DnnSuperResImpl = self._create_model(path, scale)
+
+            load_seconds: float = time.perf_counter() - started_at
+            warm_up_seconds: float | None = None
+
+            if warm_up:
+                started_at = time.perf_counter()
+                model.upsample(np.zeros((WARM_UP_IMAGE_SIZE, WARM_UP_IMAGE_SIZE, 3), np.uint8))
+                warm_up_seconds = time.perf_counter() - started_at
+
+            stats: SuperResolutionModelStats = SuperResolutionModelStats(
+                scale=scale.value,
+                path=str(path),
+                file_size_bytes=path.stat().st_size,
+                peak_rss_growth_bytes=max(0, _peak_rss_bytes() - peak_rss_before),
+                load_seconds=load_seconds,
+                warm_up_seconds=warm_up_seconds,
+            )
+
+            self._idle_models[scale.value] = SimpleQueue()
+            self._idle_models[scale.value].put(model)
+            self._instances[scale.value] = 1
+            self._stats[scale.value] = stats
+
+            logger.info(
+                "Loaded super resolution model x%s in %.3fs (warm-up: %s), file size: %s bytes, "
+                "peak RSS growth: %s bytes, models in process: %s bytes",
+                scale,
+                stats.load_seconds,
+                stats.warm_up_seconds,
+                stats.file_size_bytes,
+                stats.peak_rss_growth_bytes,
+                self._memory_usage_bytes(),
+            )
+
+    def upsample(self, img_rgb: np.ndarray, scale: ImageScale) -> np.ndarray:
+        model: dnn_superres.DnnSuperResImpl = self._acquire(scale)
+
+        try:
+            return model.upsample(img_rgb)
+        finally:
+            self._idle_models[scale.value].put(model)
+
+    def stats(self) -> Mapping[int, SuperResolutionModelStats]:
+        with self._lock:
+            return MappingProxyType(dict(self._stats))
+
+    def memory_usage_bytes(self) -> int:
+        """Approximate memory held by loaded models: weights size or measured RSS growth, whichever is bigger."""
+        with self._lock:
+            return self._memory_usage_bytes()
+
+    def _memory_usage_bytes(self) -> int:
+        return sum(
+            max(stats.file_size_bytes, stats.peak_rss_growth_bytes) * self._instances[scale]
+            for scale, stats in self._stats.items()
+        )
+
+    def _acquire(self, scale: ImageScale) -> dnn_superres.DnnSuperResImpl:
+        self.load(scale)
+
+        try:
+            return self._idle_models[scale.value].get_nowait()
+        except Empty:
+            pass
+
+        with self._lock:
+            self._instances[scale.value] += 1
+            logger.info(
+                "Creating extra instance of super resolution model x%s, instances: %s",
+                scale,
+                self._instances[scale.value],
+            )
+
+        return self._create_model(self.model_path(scale), scale)
+
+    @staticmethod
+    def _create_model(path: Path, scale: ImageScale) -> dnn_superres.DnnSuperResImpl:
+        model: dnn_superres.DnnSuperResImpl = dnn_superres.DnnSuperResImpl.create()
+        model.readModel(str(path))
+        model.setModel(EDSR_MODEL_NAME, scale.value)
+        return model
+
+
+_registries: Final[dict[Path, SuperResolutionModelRegistry]] = {}
+_registries_lock: Final[Lock] = Lock()
+
+
+def get_super_resolution_registry(models_path: str | None = None) -> SuperResolutionModelRegistry:
+    path: Path = Path(models_path) if models_path is not None else DEFAULT_MODELS_PATH
+
+    with _registries_lock:
+        if path not in _registries:
+            _registries[path] = SuperResolutionModelRegistry(models_path=path)
+
+        return _registries[path]
+
+
+def preload_super_resolution_models(
+    scales: Iterable[int],
+    models_path: str | None = None,
+    *,
+    warm_up: bool = False,
+) -> None:
+    """
+    Loads models in the current process, used as the initializer of worker processes.
+
+    A missing model is only logged: it would otherwise break the whole process pool,
+    while the error is still raised for requests that actually need this model.
+    """
+    registry: SuperResolutionModelRegistry = get_super_resolution_registry(models_path)
+
+    for scale in scales:
+        try:
+            registry.load(ImageScale(scale), warm_up=warm_up)
+        except SuperResolutionModelNotFoundError:
+            logger.exception("Failed to preload super resolution model x%s", scale)
@@ -0,0 +1,151 @@
+"""
+Tiled super resolution.
+
+EDSR keeps several float32 feature maps with 256 channels per source pixel, so a 12 MP photo needs
+tens of gigabytes at once. The image is split into overlapping tiles that are upscaled by a bounded
+thread pool (cv2 dnn releases the GIL), and the overlaps are blended with a linear ramp to hide seams.
+"""
+
+import logging
+import math
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Final
+
+import numpy as np
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+EDSR_FEATURES: Final[int] = 256
+FLOAT32_BYTES: Final[int] = 4
+# input, output and residual of a block are alive at the same time, the upsampling tail adds scale ** 2 maps
+EDSR_LIVE_FEATURE_MAPS: Final[int] = 3
+MIN_TILE_SIZE: Final[int] = 32
+BYTES_IN_MEGABYTE: Final[int] = 1024 * 1024
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class TilingPlan:
+    tile_size: int
+    overlap: int
+    concurrency: int
+
+
+def estimate_tile_memory_bytes(tile_size: int, scale: int) -> int:
+    feature_map_bytes: int = tile_size * tile_size * EDSR_FEATURES * FLOAT32_BYTES
+    return feature_map_bytes * (EDSR_LIVE_FEATURE_MAPS + scale**2)
+
+
+def plan_tiling(
+    scale: int,
+    *,
+    tile_size: int,
+    overlap: int,
+    workers: int,
+    memory_limit_mb: int,
+) -> TilingPlan:
+    """Shrinks tiles until one fits into the limit, then runs as many tiles at once as the limit allows."""
+    memory_limit_bytes: int = memory_limit_mb * BYTES_IN_MEGABYTE
+    bytes_per_pixel: int = estimate_tile_memory_bytes(1, scale)
+    fitting_tile_size: int = math.isqrt(memory_limit_bytes // bytes_per_pixel)
+
+    if fitting_tile_size < tile_size:
+        tile_size = max(fitting_tile_size, MIN_TILE_SIZE, overlap * 2 + 1)
+        logger.info("Tile size reduced to %s to fit into %s MB for scale x%s", tile_size, memory_limit_mb, scale)
+
+    concurrency: int = max(1, min(workers, memory_limit_bytes // estimate_tile_memory_bytes(tile_size, scale)))
+
+    return TilingPlan(tile_size=tile_size, overlap=overlap, concurrency=concurrency)
+
+
+def split_axis(size: int, tile_size: int, overlap: int) -> list[tuple[int, int]]:
+    """Evenly spreads tiles over the axis, so every pair of neighbours overlaps by at least ``overlap``."""
+    if size <= tile_size:
+        return [(0, size)]
+
+    count: int = math.ceil((size - overlap) / (tile_size - overlap))
+    last_start: int = size - tile_size
+
+    return [(start, start + tile_size) for start in (round(i * last_start / (count - 1)) for i in range(count))]
+
+
+def _ramp(overlap: int, size: int) -> np.ndarray:
+    weights: np.ndarray = np.ones(size, dtype=np.float32)
+    weights[:overlap] = (np.arange(overlap, dtype=np.float32) + 0.5) / overlap
+    return weights
+
+
+def _blend_into(out: np.ndarray, tile: np.ndarray, y: int, x: int, top: int, left: int) -> None:
+    """
+    Writes ``tile`` at (y, x), fading it in over ``top`` rows and ``left`` columns.
+
+    Tiles are written in raster order, so the top and left overlaps already hold neighbour pixels.
+    """
+    height, width = tile.shape[:2]
+    region: np.ndarray = out[y : y + height, x : x + width]
+    region[top:, left:] = tile[top:, left:]
+
+    row_weights: np.ndarray = _ramp(top, height)
+    column_weights: np.ndarray = _ramp(left, width)
+
+    if top:
+        alpha: np.ndarray = np.outer(row_weights[:top], column_weights)[..., np.newaxis]
+        region[:top] = np.rint(region[:top] * (1 - alpha) + tile[:top] * alpha).astype(out.dtype)
+
+    if left:
+        alpha = column_weights[np.newaxis, :left, np.newaxis]
+        region[top:, :left] = np.rint(region[top:, :left] * (1 - alpha) + tile[top:, :left] * alpha).astype(out.dtype)
+
+
+def upsample_tiled(
+    img: np.ndarray,
+    upsample: Callable[[np.ndarray], np.ndarray],
+    scale: int,
+    plan: TilingPlan,
+) -> np.ndarray:
+    """
+    Upscales a 3-channel image tile by tile, at most ``plan.concurrency`` tiles are in flight.
+
+    ``upsample`` must be safe to call from several threads.
+    """
+    height, width = img.shape[:2]
+    rows: list[tuple[int, int]] = split_axis(height, plan.tile_size, plan.overlap)
+    columns: list[tuple[int, int]] = split_axis(width, plan.tile_size, plan.overlap)
+
+    if len(rows) == 1 and len(columns) == 1:
+        return upsample(img)
+
+    logger.debug("Upscaling %sx%s image with %s tiles, plan: %s", width, height, len(rows) * len(columns), plan)
+
+    out: np.ndarray = np.empty((height * scale, width * scale, img.shape[2]), dtype=img.dtype)
+    tiles: list[tuple[int, int, int, int]] = [
+        (
+            y0,
+            x0,
+            rows[row - 1][1] - y0 if row else 0,
+            columns[column - 1][1] - x0 if column else 0,
+        )
+        for row, (y0, _) in enumerate(rows)
+        for column, (x0, _) in enumerate(columns)
+    ]
+    pending: deque[tuple[tuple[int, int, int, int], Future[np.ndarray]]] = deque()
+
+    def blend_oldest() -> None:
+        (y0, x0, top, left), future = pending.popleft()
+        _blend_into(out, future.result(), y0 * scale, x0 * scale, top * scale, left * scale)
+
+    with ThreadPoolExecutor(max_workers=plan.concurrency, thread_name_prefix="super-resolution") as executor:
+        for tile in tiles:
+            y0, x0 = tile[:2]
+            tile_img: np.ndarray = np.ascontiguousarray(img[y0 : y0 + plan.tile_size, x0 : x0 + plan.tile_size])
+            pending.append((tile, executor.submit(upsample, tile_img)))
+
+            if len(pending) > plan.concurrency:
+                blend_oldest()
+
+        while pending:
+            blend_oldest()
+
+    return out
@@ -1,37 +1,166 @@
 # mypy: ignore-errors
 
+import asyncio
+import hashlib
 import io
 import logging
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterable, Awaitable, Callable
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import partial
 from typing import Any, Final, override
 
 from aiobotocore.client import AioBaseClient
 from botocore.exceptions import ClientError, EndpointConnectionError
+from redis.asyncio import Redis
+from redis.asyncio.lock import Lock
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from pix_erase.application.common.ports.image.storage import ImageStorage
-from pix_erase.application.common.query_models.image import ImageStreamQueryModel
+from pix_erase.application.common.query_models.image import (
+    ImageByteRange,
+    ImageMetadataQueryModel,
+    ImageRangeQueryModel,
+    ImageStreamQueryModel,
+)
 from pix_erase.domain.image.entities.image import Image
 from pix_erase.domain.image.values.image_id import ImageID
 from pix_erase.domain.image.values.image_name import ImageName
 from pix_erase.domain.image.values.image_size import ImageSize
+from pix_erase.infrastructure.adapters.image_converters.codec import content_type_for, decode_image
+from pix_erase.infrastructure.adapters.image_converters.image_header import ImageHeader, probe_image_header
 from pix_erase.infrastructure.adapters.persistence.constants import (
+    BLOB_HASH_METADATA_KEY,
+    BLOB_LOCK_BLOCKING_TIMEOUT_SECONDS,
+    BLOB_LOCK_PREFIX,
+    BLOB_LOCK_TIMEOUT_SECONDS,
+    BLOB_REFS_PREFIX,
     DELETE_FILE_FAILED,
     DOWNLOAD_FILE_FAILED,
+    NOT_FOUND_ERROR_CODES,
+    READ_METADATA_FAILED,
+    RENDITIONS_LIST_LIMIT,
+    SIZE_METADATA_KEY,
     STREAM_FILE_FAILED,
     UPLOAD_FILE_FAILED,
 )
+from pix_erase.infrastructure.adapters.persistence.s3_keys import blob_key, image_key, rendition_prefix, upload_key
 from pix_erase.infrastructure.errors.file_storage import FileStorageError
+from pix_erase.infrastructure.errors.image_converters import ImageDecodingError
 from pix_erase.setup.config.s3 import S3Config
 
 logger: Final[logging.Logger] = logging.getLogger(__name__)
 
+INVALID_RANGE_ERROR_CODE: Final[str] = "InvalidRange"
+
+
+def _blob_refs_prefix(blob_hash: str) -> str:
+    return f"{BLOB_REFS_PREFIX}{blob_hash}/"
+
+
+def _blob_ref_key(blob_hash: str, image_id: ImageID) -> str:
+    return f"{_blob_refs_prefix(blob_hash)}{image_id!s}"
+
+
+def _is_not_found(error: ClientError) -> bool:
+    return error.response["Error"]["Code"] in NOT_FOUND_ERROR_CODES
+
+
+def _total_size(response: dict[str, Any]) -> int:
+    """Size of the whole object from ``Content-Range: bytes 0-65535/1048576`` of a ranged response."""
+    content_range: str | None = response.get("ContentRange")
+
+    if content_range is None:
+        return response["ContentLength"]
+
+    return int(content_range.rsplit("/", 1)[1])
+
+
+def _image_metadata(
+    *,
+    name: ImageName,
+    width: ImageSize,
+    height: ImageSize,
+    created_at: datetime,
+    updated_at: datetime,
+    blob_hash: str,
+    size: int,
+) -> dict[str, str]:
+    return {
+        "original_filename": name.value,
+        "height": str(height.value),
+        "width": str(width.value),
+        "created_at": created_at.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+        "updated_at": updated_at.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+        BLOB_HASH_METADATA_KEY: blob_hash,
+        SIZE_METADATA_KEY: str(size),
+    }
+
+
+def _etag(metadata: dict[str, Any], response: dict[str, Any]) -> str | None:
+    """
+    ETag of the bytes of the image.
+
+    The image object of a blob is empty, its own ETag is the same for every image, so the hash of the blob
+    is used instead. It's known from the metadata alone, a HEAD request is enough to check a cached copy.
+    """
+    blob_hash: str | None = metadata.get(BLOB_HASH_METADATA_KEY)
+
+    if blob_hash is None:
+        return response.get("ETag")
+
+    return f'"{blob_hash}"'
+
+
+def _image_metadata_query_model(
+    image_id: ImageID,
+    metadata: dict[str, Any],
+    response: dict[str, Any],
+    content_length: int,
+) -> ImageMetadataQueryModel:
+    return ImageMetadataQueryModel(
+        content_type=response.get("ContentType", "application/octet-stream"),
+        content_length=content_length,
+        width=ImageSize(int(metadata.get("width"))),
+        height=ImageSize(int(metadata.get("height"))),
+        filename=ImageName(metadata.get("original_filename", str(image_id))),
+        etag=_etag(metadata, response),
+        blob_hash=metadata.get(BLOB_HASH_METADATA_KEY),
+        created_at=datetime.strptime(metadata.get("created_at"), "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=UTC),
+        updated_at=datetime.strptime(metadata.get("updated_at"), "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=UTC),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class _StagedUpload:
+    s3_key: str
+    # the first part of the upload, the whole image when it fits into one part
+    head: bytes
+    blob_hash: str
+    size: int
+
 
 class AiobotocoreS3ImageStorage(ImageStorage):
-    def __init__(self, client: AioBaseClient, s3_config: S3Config) -> None:
+    """
+    Content-addressed image storage.
+
+    Bytes of an image are stored once as ``blobs/{sha256}``, ``images/{id}`` is an empty object whose
+    metadata points to the blob, so uploading the same photo again costs only small metadata writes.
+    Every image that uses a blob has a marker ``blob-refs/{sha256}/{id}``, the blob is deleted with its
+    last marker. Changes of the markers of one blob are serialized with a Redis lock, so a delete can't
+    remove a blob that a concurrent upload has just started to use.
+
+    Images uploaded before keep their bytes in ``images/{id}`` and are still readable.
+
+    Streamed uploads are written part by part into ``uploads/{id}`` first, because the hash of the content
+    is known only at the end, and then copied into their blob on the S3 side.
+    """
+
+    def __init__(self, client: AioBaseClient, s3_config: S3Config, redis: Redis) -> None:
         self._client: Final[AioBaseClient] = client
         self._bucket_name: Final[str] = s3_config.images_bucket_name
+        self._part_size: Final[int] = s3_config.multipart_part_size
+        self._redis: Final[Redis] = redis
 
     @retry(
         stop=stop_after_attempt(3),
@@ -39,25 +168,11 @@ class AiobotocoreS3ImageStorage(ImageStorage):
     )
     @override
     async def add(self, image: Image) -> None:
-        try:
-            s3_key: str = f"images/{image.id!s}"
-            logger.debug("Build s3 key for storage: %s", s3_key)
+        s3_key: str = image_key(image.id)
+        logger.debug("Build s3 key for storage: %s", s3_key)
 
-            await self._client.upload_fileobj(
-                io.BytesIO(image.data),
-                self._bucket_name,
-                s3_key,
-                ExtraArgs={
-                    "Metadata": {
-                        "original_filename": image.name.value,
-                        "height": str(image.height.value),
-                        "width": str(image.width.value),
-                        "created_at": image.created_at.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
-                        "updated_at": image.updated_at.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
-                    },
-                    "ContentType": "application/octet-stream",
-                },
-            )
+        try:
+            await self._store_image(image)
 
         except EndpointConnectionError as e:
             logger.exception(UPLOAD_FILE_FAILED)
@@ -71,24 +186,96 @@ class AiobotocoreS3ImageStorage(ImageStorage):
             logger.exception(UPLOAD_FILE_FAILED)
             raise FileStorageError(UPLOAD_FILE_FAILED) from e
 
+    @override
+    async def add_stream(self, image_id: ImageID, name: ImageName, stream: AsyncIterable[bytes]) -> None:
+        """
+        Memory of one upload is bounded by the part size whatever the size of the image is.
+
+        Not retried: a consumed stream can't be read again.
+        """
+        s3_key: str = upload_key(image_id)
+        logger.debug("Build s3 key for staged upload: %s", s3_key)
+
+        try:
+            staged: _StagedUpload = await self._stage_upload(s3_key, stream)
+        except Exception as e:
+            logger.exception(UPLOAD_FILE_FAILED)
+            raise FileStorageError(UPLOAD_FILE_FAILED) from e
+
+        try:
+            await self._store_staged(image_id, name, staged)
+        finally:
+            await self._delete_staged(staged.s3_key)
+
+        logger.info("Stored streamed image %s, %s bytes, blob %s", image_id, staged.size, staged.blob_hash)
+
+    @override
+    async def add_uploaded(self, image_id: ImageID, name: ImageName) -> None:
+        """
+        The client has put the image into ``uploads/{id}`` with a presigned URL, it's hashed here and moved
+        into its blob like a streamed upload.
+
+        The upload is kept when storing fails for a reason other than a broken image, so the call can be retried.
+        Uploads that are never completed should be removed by a lifecycle rule of the bucket.
+        """
+        s3_key: str = upload_key(image_id)
+        logger.debug("Build s3 key for uploaded image: %s", s3_key)
+
+        try:
+            staged: _StagedUpload = await self._read_staged_upload(s3_key)
+        except Exception as e:
+            logger.exception(UPLOAD_FILE_FAILED)
+            raise FileStorageError(UPLOAD_FILE_FAILED) from e
+
+        try:
+            await self._store_staged(image_id, name, staged)
+        except ImageDecodingError:
+            await self._delete_staged(staged.s3_key)
+            raise
+
+        await self._delete_staged(staged.s3_key)
+        logger.info("Stored uploaded image %s, %s bytes, blob %s", image_id, staged.size, staged.blob_hash)
+
+    @override
+    async def read_upload_size(self, image_id: ImageID) -> int | None:
+        s3_key: str = upload_key(image_id)
+        logger.debug("Build s3 key for uploaded image: %s", s3_key)
+
+        try:
+            response: dict[str, Any] = await self._client.head_object(Bucket=self._bucket_name, Key=s3_key)
+
+        except ClientError as e:
+            if _is_not_found(e):
+                logger.warning("Upload not found in S3: %s", s3_key)
+                return None
+            logger.exception(READ_METADATA_FAILED)
+            raise FileStorageError(READ_METADATA_FAILED) from e
+        except EndpointConnectionError as e:
+            logger.exception(READ_METADATA_FAILED)
+            raise FileStorageError(READ_METADATA_FAILED) from e
+        except Exception as e:
+            logger.exception(READ_METADATA_FAILED)
+            raise FileStorageError(READ_METADATA_FAILED) from e
+        else:
+            return response["ContentLength"]
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=30),
     )
     @override
     async def read_by_id(self, image_id: ImageID) -> Image | None:
-        s3_key: str = f"images/{image_id!s}"
+        s3_key: str = image_key(image_id)
         logger.debug("Build s3 key for storage: %s", s3_key)
 
         try:
-            response = await self._client.get_object(Bucket=self._bucket_name, Key=s3_key)
-            metadata: dict[str, Any] = response.get("Metadata", {})
+            metadata, response = await self._get_image_object(s3_key)
             original_filename: str = metadata.get("original_filename", s3_key.split("/")[-1])
 
             file_data = await response["Body"].read()
 
         except ClientError as e:
-            if e.response["Error"]["Code"] == "NoSuchKey":
+            if _is_not_found(e):
                 logger.warning("File not found in S3: %s", s3_key)
                 return None
             logger.exception(DOWNLOAD_FILE_FAILED)
@@ -110,21 +297,58 @@ class AiobotocoreS3ImageStorage(ImageStorage):
                 height=ImageSize(int(metadata.get("height"))),
             )
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=30),
+    )
+    @override
+    async def read_range(self, image_id: ImageID, offset: int, size: int) -> ImageRangeQueryModel | None:
+        """Reads ``size`` bytes from ``offset`` with an HTTP range request, less at the end of the image."""
+        s3_key: str = image_key(image_id)
+        logger.debug("Build s3 key for storage: %s", s3_key)
+
+        try:
+            _, response = await self._get_image_range(s3_key, ImageByteRange(start=offset, end=offset + size - 1))
+            data: bytes = await response["Body"].read()
+
+        except ClientError as e:
+            if _is_not_found(e):
+                logger.warning("File not found in S3: %s", s3_key)
+                return None
+            if e.response["Error"]["Code"] == INVALID_RANGE_ERROR_CODE:
+                # the range starts at the end of the image or after it
+                return ImageRangeQueryModel(data=b"", total_size=offset)
+            logger.exception(DOWNLOAD_FILE_FAILED)
+            raise FileStorageError(DOWNLOAD_FILE_FAILED) from e
+        except EndpointConnectionError as e:
+            logger.exception(DOWNLOAD_FILE_FAILED)
+            raise FileStorageError(DOWNLOAD_FILE_FAILED) from e
+        except Exception as e:
+            logger.exception(DOWNLOAD_FILE_FAILED)
+            raise FileStorageError(DOWNLOAD_FILE_FAILED) from e
+        else:
+            return ImageRangeQueryModel(data=data, total_size=_total_size(response))
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=30),
     )
     @override
     async def delete_by_id(self, image_id: ImageID) -> None:
-        s3_key: str = f"images/{image_id}"
+        s3_key: str = image_key(image_id)
         logger.debug("Build s3 key for storage: %s", s3_key)
 
         try:
+            blob_hash: str | None = await self._read_blob_hash(s3_key)
             await self._client.delete_object(Bucket=self._bucket_name, Key=s3_key)
+
+            if blob_hash is not None:
+                await self._release_blob(blob_hash, image_id)
+
             logger.info("File successfully deleted from S3: %s", s3_key)
 
         except ClientError as e:
-            if e.response["Error"]["Code"] == "NoSuchKey":
+            if _is_not_found(e):
                 logger.warning("File not found in S3: %s", s3_key)
                 return
             logger.exception(DELETE_FILE_FAILED)
@@ -142,32 +366,22 @@ class AiobotocoreS3ImageStorage(ImageStorage):
     )
     @override
     async def update(self, image: Image) -> None:
-        s3_key: str = f"images/{image.id}"
+        s3_key: str = image_key(image.id)
         logger.debug("Build s3 key for storage: %s", s3_key)
 
         try:
-            await self._client.upload_fileobj(
-                io.BytesIO(image.data),
-                self._bucket_name,
-                s3_key,
-                ExtraArgs={
-                    "Metadata": {
-                        "original_filename": image.name.value,
-                        "height": str(image.height.value),
-                        "width": str(image.width.value),
-                        "created_at": image.created_at.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
-                        "updated_at": image.updated_at.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
-                    },
-                    "ContentType": "application/octet-stream",
-                },
-            )
+            previous_blob_hash: str | None = await self._read_blob_hash(s3_key)
+            blob_hash: str = await self._store_image(image, previous_blob_hash)
+
+            if previous_blob_hash is not None and previous_blob_hash != blob_hash:
+                await self._release_blob(previous_blob_hash, image.id)
 
         except EndpointConnectionError as e:
             logger.exception(UPLOAD_FILE_FAILED)
             raise FileStorageError(UPLOAD_FILE_FAILED) from e
 
         except ClientError as e:
-            if e.response["Error"]["Code"] == "NoSuchKey":
+            if _is_not_found(e):
                 logger.warning("File not found in S3: %s", s3_key)
                 return
             logger.exception(UPLOAD_FILE_FAILED)
@@ -182,24 +396,53 @@ class AiobotocoreS3ImageStorage(ImageStorage):
         wait=wait_exponential(multiplier=1, min=2, max=30),
     )
     @override
-    async def stream_by_id(self, image_id: ImageID) -> ImageStreamQueryModel | None:
-        s3_key: str = f"images/{image_id!s}"
+    async def read_metadata_by_id(self, image_id: ImageID) -> ImageMetadataQueryModel | None:
+        """Only HEAD requests, bytes of the image aren't read."""
+        s3_key: str = image_key(image_id)
         logger.debug("Build s3 key for storage: %s", s3_key)
 
         try:
-            # Получаем объект из S3
-            response = await self._client.get_object(Bucket=self._bucket_name, Key=s3_key)
-
-            # Извлекаем метаданные
+            response: dict[str, Any] = await self._client.head_object(Bucket=self._bucket_name, Key=s3_key)
             metadata: dict[str, Any] = response.get("Metadata", {})
-            original_filename: ImageName = ImageName(metadata.get("original_filename", str(image_id)))
-            content_length = response["ContentLength"]
-            content_type = response.get("ContentType", "application/octet-stream")
-            etag = response.get("ETag")
-            width = ImageSize(int(metadata.get("width")))
-            height = ImageSize(int(metadata.get("height")))
-            created_at = datetime.strptime(metadata.get("created_at"), "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=UTC)
-            updated_at = datetime.strptime(metadata.get("updated_at"), "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=UTC)
+            content_length: int = await self._content_length(metadata, response)
+
+        except ClientError as e:
+            if _is_not_found(e):
+                logger.warning("File not found in S3: %s", s3_key)
+                return None
+            logger.exception(READ_METADATA_FAILED)
+            raise FileStorageError(READ_METADATA_FAILED) from e
+        except EndpointConnectionError as e:
+            logger.exception(READ_METADATA_FAILED)
+            raise FileStorageError(READ_METADATA_FAILED) from e
+        except Exception as e:
+            logger.exception(READ_METADATA_FAILED)
+            raise FileStorageError(READ_METADATA_FAILED) from e
+        else:
+            return _image_metadata_query_model(image_id, metadata, response, content_length)
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=30),
+    )
+    @override
+    async def stream_by_id(
+        self,
+        image_id: ImageID,
+        byte_range: ImageByteRange | None = None,
+    ) -> ImageStreamQueryModel | None:
+        s3_key: str = image_key(image_id)
+        logger.debug("Build s3 key for storage: %s, range: %s", s3_key, byte_range)
+
+        try:
+            # Получаем объект из S3
+            metadata, response = await self._get_image_object(s3_key, byte_range)
+            image_metadata: ImageMetadataQueryModel = _image_metadata_query_model(
+                image_id,
+                metadata,
+                response,
+                response["ContentLength"],
+            )
 
             # Создаем асинхронный генератор для стриминга
             async def chunk_generator() -> AsyncGenerator[bytes, None]:
@@ -218,7 +461,7 @@ class AiobotocoreS3ImageStorage(ImageStorage):
                     raise
 
         except ClientError as e:
-            if e.response["Error"]["Code"] == "NoSuchKey":
+            if _is_not_found(e):
                 logger.warning("File not found in S3 for streaming: %s", s3_key)
                 return None
             logger.exception(STREAM_FILE_FAILED)
@@ -233,12 +476,367 @@ class AiobotocoreS3ImageStorage(ImageStorage):
         else:
             return ImageStreamQueryModel(
                 stream=chunk_generator(),
-                content_type=content_type,
-                content_length=content_length,
-                filename=original_filename,
-                etag=etag,
-                created_at=created_at,
-                updated_at=updated_at,
-                width=width,
-                height=height,
+                content_type=image_metadata.content_type,
+                content_length=image_metadata.content_length,
+                filename=image_metadata.filename,
+                etag=image_metadata.etag,
+                created_at=image_metadata.created_at,
+                updated_at=image_metadata.updated_at,
+                width=image_metadata.width,
+                height=image_metadata.height,
+                byte_range=byte_range,
             )
+
+    async def _content_length(self, metadata: dict[str, Any], response: dict[str, Any]) -> int:
+        blob_hash: str | None = metadata.get(BLOB_HASH_METADATA_KEY)
+
+        if blob_hash is None:
+            return response["ContentLength"]
+
+        if SIZE_METADATA_KEY in metadata:
+            return int(metadata[SIZE_METADATA_KEY])
+
+        # images stored before their size was kept in the metadata
+        blob: dict[str, Any] = await self._client.head_object(Bucket=self._bucket_name, Key=blob_key(blob_hash))
+        return blob["ContentLength"]
+
+    async def _get_image_object(
+        self,
+        s3_key: str,
+        byte_range: ImageByteRange | None = None,
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Returns metadata of the image and the response whose body holds its bytes, or their range."""
+        if byte_range is not None:
+            return await self._get_image_range(s3_key, byte_range)
+
+        response: dict[str, Any] = await self._client.get_object(Bucket=self._bucket_name, Key=s3_key)
+        metadata: dict[str, Any] = response.get("Metadata", {})
+        blob_hash: str | None = metadata.get(BLOB_HASH_METADATA_KEY)
+
+        if blob_hash is None:
+            return metadata, response
+
+        # the image object itself is empty, reading it releases the connection
+        await response["Body"].read()
+
+        return metadata, await self._client.get_object(Bucket=self._bucket_name, Key=blob_key(blob_hash))
+
+    async def _get_image_range(
+        self,
+        s3_key: str,
+        byte_range: ImageByteRange,
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        # the image object of a blob is empty, a range of it isn't satisfiable, so only its metadata is read
+        head: dict[str, Any] = await self._client.head_object(Bucket=self._bucket_name, Key=s3_key)
+        metadata: dict[str, Any] = head.get("Metadata", {})
+        blob_hash: str | None = metadata.get(BLOB_HASH_METADATA_KEY)
+        source_key: str = s3_key if blob_hash is None else blob_key(blob_hash)
+
+        response: dict[str, Any] = await self._client.get_object(
+            Bucket=self._bucket_name,
+            Key=source_key,
+            Range=f"bytes={byte_range.start}-{byte_range.end}",
+        )
+        return metadata, response
+
+    async def _read_blob_hash(self, s3_key: str) -> str | None:
+        try:
+            response: dict[str, Any] = await self._client.head_object(Bucket=self._bucket_name, Key=s3_key)
+        except ClientError as e:
+            if _is_not_found(e):
+                return None
+            raise
+
+        return response.get("Metadata", {}).get(BLOB_HASH_METADATA_KEY)
+
+    async def _put_image_object(self, image_id: ImageID, metadata: dict[str, str], content_type: str) -> None:
+        await self._client.put_object(
+            Bucket=self._bucket_name,
+            Key=image_key(image_id),
+            Body=b"",
+            Metadata=metadata,
+            ContentType=content_type,
+        )
+
+    async def _put_image(self, image: Image, blob_hash: str) -> None:
+        metadata: dict[str, str] = _image_metadata(
+            name=image.name,
+            width=image.width,
+            height=image.height,
+            created_at=image.created_at,
+            updated_at=image.updated_at,
+            blob_hash=blob_hash,
+            size=len(image.data),
+        )
+        await self._put_image_object(image.id, metadata, content_type_for(image.data))
+
+    async def _store_image(self, image: Image, previous_blob_hash: str | None = None) -> str:
+        """Stores the bytes of the image unless the same bytes are stored already, then the image pointing to them."""
+        blob_hash: str = hashlib.sha256(image.data).hexdigest()
+
+        await self._reference_blob(
+            blob_hash,
+            image.id,
+            partial(
+                self._client.upload_fileobj,
+                io.BytesIO(image.data),
+                self._bucket_name,
+                blob_key(blob_hash),
+                ExtraArgs={"ContentType": content_type_for(image.data)},
+            ),
+            partial(self._put_image, image, blob_hash),
+            referenced=blob_hash == previous_blob_hash,
+        )
+
+        return blob_hash
+
+    async def _reference_blob(
+        self,
+        blob_hash: str,
+        image_id: ImageID,
+        store_blob: Callable[[], Awaitable[Any]],
+        put_image: Callable[[], Awaitable[Any]],
+        *,
+        referenced: bool = False,
+    ) -> None:
+        """
+        References the blob from the image, ``store_blob`` is called only when the blob doesn't exist yet.
+
+        Only the marker and the check are done under the lock, the blob is written after it's released:
+        a delete keeps a blob while it has markers, and the lock would expire during a long write.
+        Concurrent uploads of the same new content may both write the blob, the bytes are the same.
+
+        When the blob or the image can't be written the marker is dropped again, otherwise it would keep
+        the blob forever. ``referenced`` images used the blob before, their marker stays.
+        """
+        async with self._blob_lock(blob_hash):
+            await self._client.put_object(
+                Bucket=self._bucket_name,
+                Key=_blob_ref_key(blob_hash, image_id),
+                Body=b"",
+            )
+            blob_exists: bool = await self._blob_exists(blob_hash)
+
+        try:
+            if blob_exists:
+                logger.info("Image %s has the same content as stored blob %s, upload skipped", image_id, blob_hash)
+            else:
+                await store_blob()
+                logger.debug("Stored new blob %s for image %s", blob_hash, image_id)
+
+            await put_image()
+        except BaseException:
+            if not referenced:
+                await self._drop_reference(blob_hash, image_id)
+            raise
+
+    async def _drop_reference(self, blob_hash: str, image_id: ImageID) -> None:
+        try:
+            await self._release_blob(blob_hash, image_id)
+        except Exception:
+            logger.exception("Failed to drop reference of image %s to blob %s", image_id, blob_hash)
+
+    async def _stage_upload(self, s3_key: str, stream: AsyncIterable[bytes]) -> _StagedUpload:
+        """
+        Writes the stream into ``s3_key`` hashing it on the way.
+
+        Chunks are collected into parts of the configured size, an upload that fits into one part
+        is written with a single ``PutObject``.
+        """
+        digest = hashlib.sha256()
+        buffer: bytearray = bytearray()
+        head: bytes | None = None
+        size: int = 0
+        upload_id: str | None = None
+        parts: list[dict[str, Any]] = []
+
+        try:
+            async for chunk in stream:
+                digest.update(chunk)
+                size += len(chunk)
+                buffer += chunk
+
+                while len(buffer) >= self._part_size:
+                    part: bytes = bytes(buffer[: self._part_size])
+                    del buffer[: self._part_size]
+
+                    if upload_id is None:
+                        head = part
+                        upload_id = await self._create_multipart_upload(s3_key, content_type_for(part))
+
+                    parts.append(await self._upload_part(s3_key, upload_id, len(parts) + 1, part))
+
+            if upload_id is None:
+                head = bytes(buffer)
+                await self._client.put_object(
+                    Bucket=self._bucket_name,
+                    Key=s3_key,
+                    Body=head,
+                    ContentType=content_type_for(head),
+                )
+            else:
+                if buffer:
+                    parts.append(await self._upload_part(s3_key, upload_id, len(parts) + 1, bytes(buffer)))
+
+                await self._client.complete_multipart_upload(
+                    Bucket=self._bucket_name,
+                    Key=s3_key,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
+
+        except BaseException:
+            if upload_id is not None:
+                await self._abort_multipart_upload(s3_key, upload_id)
+            raise
+
+        logger.debug("Staged upload %s of %s bytes in %s parts", s3_key, size, max(len(parts), 1))
+
+        return _StagedUpload(s3_key=s3_key, head=head, blob_hash=digest.hexdigest(), size=size)
+
+    async def _read_staged_upload(self, s3_key: str) -> _StagedUpload:
+        """Hashes an object uploaded by the client, reading it by parts of the configured size."""
+        response: dict[str, Any] = await self._client.get_object(Bucket=self._bucket_name, Key=s3_key)
+        digest = hashlib.sha256()
+        head: bytes | None = None
+        size: int = 0
+
+        while chunk := await response["Body"].read(self._part_size):
+            if head is None:
+                head = chunk
+            digest.update(chunk)
+            size += len(chunk)
+
+        return _StagedUpload(s3_key=s3_key, head=head or b"", blob_hash=digest.hexdigest(), size=size)
+
+    async def _store_staged(self, image_id: ImageID, name: ImageName, staged: _StagedUpload) -> None:
+        width, height = await self._read_dimensions(staged)
+        uploaded_at: datetime = datetime.now(UTC)
+        metadata: dict[str, str] = _image_metadata(
+            name=name,
+            width=ImageSize(width),
+            height=ImageSize(height),
+            created_at=uploaded_at,
+            updated_at=uploaded_at,
+            blob_hash=staged.blob_hash,
+            size=staged.size,
+        )
+
+        try:
+            await self._reference_blob(
+                staged.blob_hash,
+                image_id,
+                partial(self._copy_to_blob, staged.s3_key, staged.blob_hash),
+                partial(self._put_image_object, image_id, metadata, content_type_for(staged.head)),
+            )
+
+        except EndpointConnectionError as e:
+            logger.exception(UPLOAD_FILE_FAILED)
+            raise FileStorageError(UPLOAD_FILE_FAILED) from e
+
+        except ClientError as e:
+            logger.exception(UPLOAD_FILE_FAILED)
+            raise FileStorageError(UPLOAD_FILE_FAILED) from e
+
+    async def _create_multipart_upload(self, s3_key: str, content_type: str) -> str:
+        response: dict[str, Any] = await self._client.create_multipart_upload(
+            Bucket=self._bucket_name,
+            Key=s3_key,
+            ContentType=content_type,
+        )
+        return response["UploadId"]
+
+    async def _upload_part(self, s3_key: str, upload_id: str, part_number: int, part: bytes) -> dict[str, Any]:
+        response: dict[str, Any] = await self._client.upload_part(
+            Bucket=self._bucket_name,
+            Key=s3_key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=part,
+        )
+        return {"ETag": response["ETag"], "PartNumber": part_number}
+
+    async def _abort_multipart_upload(self, s3_key: str, upload_id: str) -> None:
+        try:
+            await self._client.abort_multipart_upload(Bucket=self._bucket_name, Key=s3_key, UploadId=upload_id)
+        except Exception:
+            logger.exception("Failed to abort multipart upload %s of %s", upload_id, s3_key)
+
+    async def _read_dimensions(self, staged: _StagedUpload) -> tuple[int, int]:
+        header: ImageHeader | None = probe_image_header(staged.head)
+
+        if header is not None:
+            return header.width, header.height
+
+        data: bytes = staged.head
+
+        if len(staged.head) < staged.size:
+            logger.warning("Header of %s has no dimensions, reading the whole upload to decode it", staged.s3_key)
+            response: dict[str, Any] = await self._client.get_object(Bucket=self._bucket_name, Key=staged.s3_key)
+            data = await response["Body"].read()
+
+        height, width = (await asyncio.to_thread(decode_image, data)).shape[:2]
+        return width, height
+
+    async def _copy_to_blob(self, s3_key: str, blob_hash: str) -> None:
+        # the content type of the staged object is copied with it
+        await self._client.copy_object(
+            Bucket=self._bucket_name,
+            Key=blob_key(blob_hash),
+            CopySource={"Bucket": self._bucket_name, "Key": s3_key},
+        )
+
+    async def _delete_staged(self, s3_key: str) -> None:
+        try:
+            await self._client.delete_object(Bucket=self._bucket_name, Key=s3_key)
+        except Exception:
+            logger.exception("Failed to delete staged upload %s", s3_key)
+
+    async def _release_blob(self, blob_hash: str, image_id: ImageID) -> None:
+        async with self._blob_lock(blob_hash):
+            await self._client.delete_object(Bucket=self._bucket_name, Key=_blob_ref_key(blob_hash, image_id))
+
+            response: dict[str, Any] = await self._client.list_objects_v2(
+                Bucket=self._bucket_name,
+                Prefix=_blob_refs_prefix(blob_hash),
+                MaxKeys=1,
+            )
+
+            if response.get("KeyCount", 0) > 0:
+                return
+
+            await self._client.delete_object(Bucket=self._bucket_name, Key=blob_key(blob_hash))
+            logger.info("Deleted blob %s, no images reference it anymore", blob_hash)
+
+            await self._delete_renditions(blob_hash)
+
+    async def _delete_renditions(self, blob_hash: str) -> None:
+        """Renditions are addressed by the blob, nothing can read them once it's gone."""
+        try:
+            response: dict[str, Any] = await self._client.list_objects_v2(
+                Bucket=self._bucket_name,
+                Prefix=rendition_prefix(blob_hash),
+                MaxKeys=RENDITIONS_LIST_LIMIT,
+            )
+
+            for item in response.get("Contents", []):
+                await self._client.delete_object(Bucket=self._bucket_name, Key=item["Key"])
+        except Exception:
+            logger.exception("Failed to delete renditions of blob %s", blob_hash)
+
+    async def _blob_exists(self, blob_hash: str) -> bool:
+        try:
+            await self._client.head_object(Bucket=self._bucket_name, Key=blob_key(blob_hash))
+        except ClientError as e:
+            if _is_not_found(e):
+                return False
+            raise
+
+        return True
+
+    def _blob_lock(self, blob_hash: str) -> Lock:
+        return self._redis.lock(
+            f"{BLOB_LOCK_PREFIX}{blob_hash}",
+            timeout=BLOB_LOCK_TIMEOUT_SECONDS,
+            blocking_timeout=BLOB_LOCK_BLOCKING_TIMEOUT_SECONDS,
+        )
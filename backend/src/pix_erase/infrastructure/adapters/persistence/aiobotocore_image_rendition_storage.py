@@ -0,0 +1,240 @@
+# mypy: ignore-errors
+
+import asyncio
+import hashlib
+import logging
+from collections.abc import AsyncGenerator
+from datetime import UTC, datetime
+from pathlib import PurePath
+from typing import Any, Final, override
+
+from aiobotocore.client import AioBaseClient
+from botocore.exceptions import ClientError, EndpointConnectionError
+
+from pix_erase.application.common.ports.image.rendition_storage import ImageRenditionStorage
+from pix_erase.application.common.query_models.image import ImageMetadataQueryModel, ImageStreamQueryModel
+from pix_erase.domain.image.entities.image import Image
+from pix_erase.domain.image.values.image_id import ImageID
+from pix_erase.domain.image.values.image_name import ImageName
+from pix_erase.domain.image.values.image_size import ImageSize
+from pix_erase.infrastructure.adapters.image_converters.renditions import (
+    RENDITION_CONTENT_TYPE,
+    RENDITION_EXTENSION,
+    Rendition,
+    render_renditions,
+)
+from pix_erase.infrastructure.adapters.persistence.constants import (
+    BLOB_HASH_METADATA_KEY,
+    NOT_FOUND_ERROR_CODES,
+    READ_METADATA_FAILED,
+    RENDITIONS_LIST_LIMIT,
+    STREAM_FILE_FAILED,
+    UPLOAD_FILE_FAILED,
+)
+from pix_erase.infrastructure.adapters.persistence.s3_keys import image_key, rendition_key, rendition_prefix
+from pix_erase.infrastructure.errors.file_storage import FileStorageError
+from pix_erase.setup.config.image_renditions import ImageRenditionConfig
+from pix_erase.setup.config.s3 import S3Config
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+METADATA_DATETIME_FORMAT: Final[str] = "%Y-%m-%dT%H:%M:%S.%fZ"
+CHUNK_SIZE: Final[int] = 64 * 1024
+
+
+def _is_not_found(error: ClientError) -> bool:
+    return error.response["Error"]["Code"] in NOT_FOUND_ERROR_CODES
+
+
+def _rendition_name(image_id: ImageID, metadata: dict[str, Any]) -> ImageName:
+    original_filename: str = metadata.get("original_filename", str(image_id))
+    return ImageName(f"{PurePath(original_filename).stem or image_id}{RENDITION_EXTENSION}")
+
+
+def _rendition_metadata_query_model(
+    image_id: ImageID,
+    image_metadata: dict[str, Any],
+    rendition_response: dict[str, Any],
+) -> ImageMetadataQueryModel:
+    rendition_metadata: dict[str, Any] = rendition_response.get("Metadata", {})
+
+    return ImageMetadataQueryModel(
+        content_type=rendition_response.get("ContentType") or RENDITION_CONTENT_TYPE,
+        content_length=rendition_response["ContentLength"],
+        width=ImageSize(int(rendition_metadata["width"])),
+        height=ImageSize(int(rendition_metadata["height"])),
+        filename=_rendition_name(image_id, image_metadata),
+        etag=rendition_response.get("ETag"),
+        created_at=datetime.strptime(image_metadata["created_at"], METADATA_DATETIME_FORMAT).replace(tzinfo=UTC),
+        updated_at=datetime.strptime(image_metadata["updated_at"], METADATA_DATETIME_FORMAT).replace(tzinfo=UTC),
+    )
+
+
+async def _chunks(body: Any) -> AsyncGenerator[bytes, None]:  # noqa: ANN401
+    while chunk := await body.read(CHUNK_SIZE):
+        yield chunk
+
+
+class AiobotocoreS3ImageRenditionStorage(ImageRenditionStorage):
+    """
+    Renditions are kept as ``renditions/{sha256}/{size}`` next to the blob of the image.
+
+    They are addressed by the content of the image, so an updated image never gets renditions of its old
+    content, and they are deleted together with their blob. Images that share a blob share its renditions.
+    Images stored before content addressing have no renditions, their originals are served.
+    """
+
+    def __init__(self, client: AioBaseClient, s3_config: S3Config, config: ImageRenditionConfig) -> None:
+        self._client: Final[AioBaseClient] = client
+        self._bucket_name: Final[str] = s3_config.images_bucket_name
+        self._enabled: Final[bool] = config.enabled
+        self._sizes: Final[tuple[int, ...]] = config.sizes
+        self._quality: Final[int] = config.quality
+
+    @override
+    async def add(self, image: Image) -> None:
+        if not self._enabled:
+            return
+
+        try:
+            blob_hash: str = await asyncio.to_thread(lambda: hashlib.sha256(image.data).hexdigest())
+
+            # the image may have been changed again while it was transformed, its newer content gets renditions
+            if await self._read_blob_hash(image.id) != blob_hash:
+                logger.info("Image %s doesn't hold this content anymore, skip its renditions", image.id)
+                return
+
+            existing_sizes: set[int] = await self._existing_sizes(blob_hash)
+            missing_sizes: list[int] = [size for size in self._sizes if size not in existing_sizes]
+
+            if not missing_sizes:
+                logger.debug("Renditions of blob %s exist already", blob_hash)
+                return
+
+            renditions: list[Rendition] = await asyncio.to_thread(
+                render_renditions,
+                image.data,
+                missing_sizes,
+                self._quality,
+            )
+
+            for rendition in renditions:
+                await self._client.put_object(
+                    Bucket=self._bucket_name,
+                    Key=rendition_key(blob_hash, rendition.size),
+                    Body=rendition.data,
+                    ContentType=RENDITION_CONTENT_TYPE,
+                    Metadata={"width": str(rendition.width), "height": str(rendition.height)},
+                )
+
+        except (ClientError, EndpointConnectionError) as e:
+            logger.exception(UPLOAD_FILE_FAILED)
+            raise FileStorageError(UPLOAD_FILE_FAILED) from e
+
+        logger.info("Stored renditions %s of image %s", missing_sizes, image.id)
+
+    @override
+    async def read_metadata_by_id(self, image_id: ImageID, size: int) -> ImageMetadataQueryModel | None:
+        rendition_size: int | None = self._fitting_size(size)
+
+        if rendition_size is None:
+            return None
+
+        try:
+            image_metadata: dict[str, Any] = await self._read_image_metadata(image_id)
+            blob_hash: str | None = image_metadata.get(BLOB_HASH_METADATA_KEY)
+
+            if blob_hash is None:
+                return None
+
+            response: dict[str, Any] = await self._client.head_object(
+                Bucket=self._bucket_name,
+                Key=rendition_key(blob_hash, rendition_size),
+            )
+
+        except ClientError as e:
+            if _is_not_found(e):
+                logger.debug("No rendition %s of image %s", rendition_size, image_id)
+                return None
+            logger.exception(READ_METADATA_FAILED)
+            raise FileStorageError(READ_METADATA_FAILED) from e
+        except EndpointConnectionError as e:
+            logger.exception(READ_METADATA_FAILED)
+            raise FileStorageError(READ_METADATA_FAILED) from e
+
+        return _rendition_metadata_query_model(image_id, image_metadata, response)
+
+    @override
+    async def stream_by_id(self, image_id: ImageID, size: int) -> ImageStreamQueryModel | None:
+        rendition_size: int | None = self._fitting_size(size)
+
+        if rendition_size is None:
+            return None
+
+        try:
+            image_metadata: dict[str, Any] = await self._read_image_metadata(image_id)
+            blob_hash: str | None = image_metadata.get(BLOB_HASH_METADATA_KEY)
+
+            if blob_hash is None:
+                return None
+
+            response: dict[str, Any] = await self._client.get_object(
+                Bucket=self._bucket_name,
+                Key=rendition_key(blob_hash, rendition_size),
+            )
+
+        except ClientError as e:
+            if _is_not_found(e):
+                logger.debug("No rendition %s of image %s", rendition_size, image_id)
+                return None
+            logger.exception(STREAM_FILE_FAILED)
+            raise FileStorageError(STREAM_FILE_FAILED) from e
+        except EndpointConnectionError as e:
+            logger.exception(STREAM_FILE_FAILED)
+            raise FileStorageError(STREAM_FILE_FAILED) from e
+
+        metadata: ImageMetadataQueryModel = _rendition_metadata_query_model(image_id, image_metadata, response)
+
+        return ImageStreamQueryModel(
+            stream=_chunks(response["Body"]),
+            content_type=metadata.content_type,
+            content_length=metadata.content_length,
+            width=metadata.width,
+            height=metadata.height,
+            filename=metadata.filename,
+            etag=metadata.etag,
+            created_at=metadata.created_at,
+            updated_at=metadata.updated_at,
+        )
+
+    def _fitting_size(self, size: int) -> int | None:
+        """The smallest rendition that is enough for ``size``, a larger size gets the original."""
+        if not self._enabled:
+            return None
+
+        return next((rendition_size for rendition_size in self._sizes if rendition_size >= size), None)
+
+    async def _read_image_metadata(self, image_id: ImageID) -> dict[str, Any]:
+        response: dict[str, Any] = await self._client.head_object(Bucket=self._bucket_name, Key=image_key(image_id))
+        return response.get("Metadata", {})
+
+    async def _read_blob_hash(self, image_id: ImageID) -> str | None:
+        try:
+            metadata: dict[str, Any] = await self._read_image_metadata(image_id)
+        except ClientError as e:
+            if _is_not_found(e):
+                return None
+            raise
+
+        return metadata.get(BLOB_HASH_METADATA_KEY)
+
+    async def _existing_sizes(self, blob_hash: str) -> set[int]:
+        prefix: str = rendition_prefix(blob_hash)
+        response: dict[str, Any] = await self._client.list_objects_v2(
+            Bucket=self._bucket_name,
+            Prefix=prefix,
+            MaxKeys=RENDITIONS_LIST_LIMIT,
+        )
+        return {
+            int(size) for item in response.get("Contents", []) if (size := item["Key"].removeprefix(prefix)).isdigit()
+        }
@@ -0,0 +1,91 @@
+# mypy: ignore-errors
+
+import logging
+from datetime import UTC, datetime, timedelta
+from typing import Any, Final, override
+
+from aiobotocore.client import AioBaseClient
+from botocore.exceptions import ClientError, EndpointConnectionError
+
+from pix_erase.application.common.ports.image.url_signer import ImageUrlSigner
+from pix_erase.application.common.query_models.image import PresignedUrlQueryModel
+from pix_erase.domain.image.values.image_id import ImageID
+from pix_erase.infrastructure.adapters.persistence.constants import (
+    BLOB_HASH_METADATA_KEY,
+    NOT_FOUND_ERROR_CODES,
+    SIGN_URL_FAILED,
+)
+from pix_erase.infrastructure.adapters.persistence.s3_keys import blob_key, image_key, upload_key
+from pix_erase.infrastructure.errors.file_storage import FileStorageError
+from pix_erase.setup.config.s3 import S3Config
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+
+class AiobotocoreS3ImageUrlSigner(ImageUrlSigner):
+    """
+    Presigned S3 URLs, signing is local, only the download needs a HEAD request to find the blob of the image.
+
+    A download link points to the blob, so its bytes, ranges and conditional requests are served by S3.
+    An upload link lets the client put the image into ``uploads/{id}``, ``ImageStorage.add_uploaded`` stores it.
+    """
+
+    def __init__(self, client: AioBaseClient, s3_config: S3Config) -> None:
+        self._client: Final[AioBaseClient] = client
+        self._bucket_name: Final[str] = s3_config.images_bucket_name
+        self._enabled: Final[bool] = s3_config.presigned_urls_enabled
+        self._expires_in: Final[int] = s3_config.presigned_url_expires_seconds
+
+    @override
+    def is_enabled(self) -> bool:
+        return self._enabled
+
+    @override
+    async def sign_download(self, image_id: ImageID) -> PresignedUrlQueryModel | None:
+        s3_key: str = image_key(image_id)
+        logger.debug("Build s3 key for signing download: %s", s3_key)
+
+        try:
+            response: dict[str, Any] = await self._client.head_object(Bucket=self._bucket_name, Key=s3_key)
+            metadata: dict[str, Any] = response.get("Metadata", {})
+            blob_hash: str | None = metadata.get(BLOB_HASH_METADATA_KEY)
+            filename: str = metadata.get("original_filename", str(image_id))
+
+            return await self._sign(
+                "get_object",
+                {
+                    "Key": s3_key if blob_hash is None else blob_key(blob_hash),
+                    "ResponseContentDisposition": f'inline; filename="{filename}"',
+                    "ResponseContentType": response.get("ContentType", "application/octet-stream"),
+                },
+            )
+
+        except ClientError as e:
+            if e.response["Error"]["Code"] in NOT_FOUND_ERROR_CODES:
+                logger.warning("File not found in S3: %s", s3_key)
+                return None
+            logger.exception(SIGN_URL_FAILED)
+            raise FileStorageError(SIGN_URL_FAILED) from e
+        except EndpointConnectionError as e:
+            logger.exception(SIGN_URL_FAILED)
+            raise FileStorageError(SIGN_URL_FAILED) from e
+
+    @override
+    async def sign_upload(self, image_id: ImageID) -> PresignedUrlQueryModel:
+        s3_key: str = upload_key(image_id)
+        logger.debug("Build s3 key for signing upload: %s", s3_key)
+
+        try:
+            return await self._sign("put_object", {"Key": s3_key})
+        except ClientError as e:
+            logger.exception(SIGN_URL_FAILED)
+            raise FileStorageError(SIGN_URL_FAILED) from e
+
+    async def _sign(self, operation: str, params: dict[str, str]) -> PresignedUrlQueryModel:
+        signed_at: datetime = datetime.now(UTC)
+        url: str = await self._client.generate_presigned_url(
+            operation,
+            Params={"Bucket": self._bucket_name, **params},
+            ExpiresIn=self._expires_in,
+        )
+        return PresignedUrlQueryModel(url=url, expires_at=signed_at + timedelta(seconds=self._expires_in))
@@ -0,0 +1,155 @@
+from collections.abc import Collection
+from typing import Any, Final, override
+
+from sqlalchemy import Delete, Row, Select, Update, delete, literal, select, tuple_, update
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pix_erase.application.common.ports.image.catalog_gateway import ImageCatalogGateway
+from pix_erase.application.common.query_models.image import ImageCatalogQueryModel, ImageMetadataQueryModel
+from pix_erase.application.common.query_params.image_cursor import ImageCatalogCursor
+from pix_erase.domain.image.values.image_id import ImageID
+from pix_erase.domain.image.values.image_name import ImageName
+from pix_erase.domain.image.values.image_size import ImageSize
+from pix_erase.domain.user.values.user_id import UserID
+from pix_erase.infrastructure.adapters.persistence.constants import DB_QUERY_FAILED
+from pix_erase.infrastructure.errors.transaction_manager import RepoError
+from pix_erase.infrastructure.persistence.models.images import images_table
+
+
+def _metadata_values(metadata: ImageMetadataQueryModel) -> dict[str, Any]:
+    return {
+        "filename": metadata.filename.value,
+        "blob_hash": metadata.blob_hash,
+        "width": metadata.width.value,
+        "height": metadata.height.value,
+        "content_type": metadata.content_type,
+        "size": metadata.content_length,
+    }
+
+
+def _catalog_query_model(row: Row[Any]) -> ImageCatalogQueryModel:
+    return ImageCatalogQueryModel(
+        image_id=row.id,
+        owner_id=row.owner_id,
+        filename=None if row.filename is None else ImageName(row.filename),
+        blob_hash=row.blob_hash,
+        width=None if row.width is None else ImageSize(row.width),
+        height=None if row.height is None else ImageSize(row.height),
+        content_type=row.content_type,
+        size=row.size,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+    )
+
+
+class SqlAlchemyImageCatalogGateway(ImageCatalogGateway):
+    def __init__(self, session: AsyncSession) -> None:
+        self._session: Final[AsyncSession] = session
+
+    @override
+    async def add(
+        self,
+        image_id: ImageID,
+        owner_id: UserID,
+        metadata: ImageMetadataQueryModel | None = None,
+    ) -> None:
+        insert_stmt: Insert = (
+            insert(images_table)
+            .values(id=image_id, owner_id=owner_id, **({} if metadata is None else _metadata_values(metadata)))
+            .on_conflict_do_nothing(index_elements=[images_table.c.id])
+        )
+
+        try:
+            await self._session.execute(insert_stmt)
+        except SQLAlchemyError as error:
+            raise RepoError(DB_QUERY_FAILED) from error
+
+    @override
+    async def update_metadata(self, image_id: ImageID, metadata: ImageMetadataQueryModel) -> None:
+        update_stmt: Update = (
+            update(images_table).where(images_table.c.id == image_id).values(**_metadata_values(metadata))
+        )
+
+        try:
+            await self._session.execute(update_stmt)
+        except SQLAlchemyError as error:
+            raise RepoError(DB_QUERY_FAILED) from error
+
+    @override
+    async def delete_by_id(self, image_id: ImageID) -> None:
+        delete_stmt: Delete = delete(images_table).where(images_table.c.id == image_id)
+
+        try:
+            await self._session.execute(delete_stmt)
+        except SQLAlchemyError as error:
+            raise RepoError(DB_QUERY_FAILED) from error
+
+    @override
+    async def is_owned_by(self, image_id: ImageID, owner_id: UserID) -> bool:
+        select_stmt: Select[tuple[ImageID]] = select(images_table.c.id).where(
+            images_table.c.id == image_id,
+            images_table.c.owner_id == owner_id,
+        )
+
+        try:
+            found: ImageID | None = (await self._session.execute(select_stmt)).scalar_one_or_none()
+        except SQLAlchemyError as error:
+            raise RepoError(DB_QUERY_FAILED) from error
+
+        return found is not None
+
+    @override
+    async def read_owned_ids(self, owner_id: UserID, image_ids: Collection[ImageID]) -> set[ImageID]:
+        if not image_ids:
+            return set()
+
+        select_stmt: Select[tuple[ImageID]] = select(images_table.c.id).where(
+            images_table.c.id.in_(image_ids),
+            images_table.c.owner_id == owner_id,
+        )
+
+        try:
+            return set((await self._session.execute(select_stmt)).scalars().all())
+        except SQLAlchemyError as error:
+            raise RepoError(DB_QUERY_FAILED) from error
+
+    @override
+    async def read_ids_by_owner(self, owner_id: UserID) -> set[ImageID]:
+        select_stmt: Select[tuple[ImageID]] = select(images_table.c.id).where(images_table.c.owner_id == owner_id)
+
+        try:
+            return set((await self._session.execute(select_stmt)).scalars().all())
+        except SQLAlchemyError as error:
+            raise RepoError(DB_QUERY_FAILED) from error
+
+    @override
+    async def read_page_by_owner(
+        self,
+        owner_id: UserID,
+        limit: int,
+        after: ImageCatalogCursor | None = None,
+    ) -> list[ImageCatalogQueryModel]:
+        select_stmt: Select[Any] = (
+            select(images_table)
+            .where(images_table.c.owner_id == owner_id)
+            .order_by(images_table.c.created_at.desc(), images_table.c.id.desc())
+            .limit(limit)
+        )
+
+        if after is not None:
+            select_stmt = select_stmt.where(
+                tuple_(images_table.c.created_at, images_table.c.id)
+                < tuple_(
+                    literal(after.created_at, images_table.c.created_at.type),
+                    literal(after.image_id, images_table.c.id.type),
+                ),
+            )
+
+        try:
+            rows: list[Row[Any]] = list((await self._session.execute(select_stmt)).all())
+        except SQLAlchemyError as error:
+            raise RepoError(DB_QUERY_FAILED) from error
+
+        return [_catalog_query_model(row) for row in rows]
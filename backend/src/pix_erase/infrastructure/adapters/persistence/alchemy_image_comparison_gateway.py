@@ -1,6 +1,8 @@
+from collections.abc import Sequence
 from typing import Final, override
 
-from sqlalchemy import Select, and_, or_, select
+from sqlalchemy import Select, and_, func, or_, select
+from sqlalchemy.dialects.postgresql import Insert, insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -10,6 +12,7 @@ from pix_erase.domain.image.values.comparison_id import ComparisonID
 from pix_erase.domain.image.values.image_id import ImageID
 from pix_erase.infrastructure.adapters.persistence.constants import DB_QUERY_FAILED
 from pix_erase.infrastructure.errors.transaction_manager import RepoError
+from pix_erase.infrastructure.persistence.models.image_comparisons import image_comparisons_table
 
 
 class SqlAlchemyImageComparisonGateway(ImageComparisonGateway):
@@ -18,8 +21,44 @@ class SqlAlchemyImageComparisonGateway(ImageComparisonGateway):
 
     @override
     async def add(self, comparison: ImageComparison) -> None:
+        await self.add_many([comparison])
+
+    @override
+    async def add_many(self, comparisons: Sequence[ImageComparison]) -> None:
+        if not comparisons:
+            return
+
+        # rows are sent as one multi-row INSERT per batch instead of one statement per comparison
+        insert_stmt: Insert = insert(image_comparisons_table)
+        upsert_stmt: Insert = insert_stmt.on_conflict_do_update(
+            index_elements=[image_comparisons_table.c.id],
+            set_={
+                "scores": insert_stmt.excluded.scores,
+                "different_names": insert_stmt.excluded.different_names,
+                "different_width": insert_stmt.excluded.different_width,
+                "different_height": insert_stmt.excluded.different_height,
+                "images_updated_at": insert_stmt.excluded.images_updated_at,
+                "updated_at": func.now(),
+            },
+        )
+
         try:
-            self._session.add(comparison)
+            await self._session.execute(
+                upsert_stmt,
+                [
+                    {
+                        "id": comparison.id,
+                        "first_image_id": comparison.first_image_id,
+                        "second_image_id": comparison.second_image_id,
+                        "scores": comparison.scores,
+                        "different_names": comparison.different_names,
+                        "different_width": comparison.different_width,
+                        "different_height": comparison.different_height,
+                        "images_updated_at": comparison.images_updated_at,
+                    }
+                    for comparison in comparisons
+                ],
+            )
         except SQLAlchemyError as error:
             raise RepoError(DB_QUERY_FAILED) from error
 
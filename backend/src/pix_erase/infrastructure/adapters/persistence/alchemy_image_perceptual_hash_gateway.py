@@ -0,0 +1,85 @@
+from typing import Final, override
+
+from sqlalchemy import Row, Select, Update, func, select, update
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pix_erase.application.common.ports.image.perceptual_hash_gateway import ImagePerceptualHashGateway
+from pix_erase.application.common.ports.image.perceptual_hasher import PerceptualHashes
+from pix_erase.domain.image.values.image_id import ImageID
+from pix_erase.infrastructure.adapters.persistence.constants import DB_QUERY_FAILED
+from pix_erase.infrastructure.errors.transaction_manager import RepoError
+from pix_erase.infrastructure.persistence.models.image_perceptual_hashes import (
+    from_bigint,
+    image_hash_revisions,
+    image_perceptual_hashes_table,
+    to_bigint,
+)
+
+
+class SqlAlchemyImagePerceptualHashGateway(ImagePerceptualHashGateway):
+    def __init__(self, session: AsyncSession) -> None:
+        self._session: Final[AsyncSession] = session
+
+    @override
+    async def add(self, image_id: ImageID, hashes: PerceptualHashes) -> None:
+        insert_stmt: Insert = insert(image_perceptual_hashes_table).values(
+            image_id=image_id,
+            phash=to_bigint(hashes.phash),
+            dhash=to_bigint(hashes.dhash),
+            ahash=to_bigint(hashes.ahash),
+            deleted=False,
+        )
+        upsert_stmt: Insert = insert_stmt.on_conflict_do_update(
+            index_elements=[image_perceptual_hashes_table.c.image_id],
+            set_={
+                "phash": insert_stmt.excluded.phash,
+                "dhash": insert_stmt.excluded.dhash,
+                "ahash": insert_stmt.excluded.ahash,
+                "deleted": False,
+                "revision": image_hash_revisions.next_value(),
+                "updated_at": func.now(),
+            },
+        )
+
+        try:
+            await self._session.execute(upsert_stmt)
+        except SQLAlchemyError as error:
+            raise RepoError(DB_QUERY_FAILED) from error
+
+    @override
+    async def read_by_id(self, image_id: ImageID) -> PerceptualHashes | None:
+        select_stmt: Select[tuple[int, int, int]] = select(
+            image_perceptual_hashes_table.c.phash,
+            image_perceptual_hashes_table.c.dhash,
+            image_perceptual_hashes_table.c.ahash,
+        ).where(
+            image_perceptual_hashes_table.c.image_id == image_id,
+            image_perceptual_hashes_table.c.deleted.is_(False),
+        )
+
+        try:
+            row: Row[tuple[int, int, int]] | None = (await self._session.execute(select_stmt)).one_or_none()
+        except SQLAlchemyError as error:
+            raise RepoError(DB_QUERY_FAILED) from error
+
+        if row is None:
+            return None
+
+        return PerceptualHashes(
+            phash=from_bigint(row.phash), dhash=from_bigint(row.dhash), ahash=from_bigint(row.ahash)
+        )
+
+    @override
+    async def delete_by_id(self, image_id: ImageID) -> None:
+        update_stmt: Update = (
+            update(image_perceptual_hashes_table)
+            .where(image_perceptual_hashes_table.c.image_id == image_id)
+            .values(deleted=True, revision=image_hash_revisions.next_value(), updated_at=func.now())
+        )
+
+        try:
+            await self._session.execute(update_stmt)
+        except SQLAlchemyError as error:
+            raise RepoError(DB_QUERY_FAILED) from error
@@ -0,0 +1,155 @@
+"""
+Reverse image search over a BK-tree that every process keeps in memory.
+
+Every change of ``image_perceptual_hashes`` takes the next revision, a search first reads rows changed since
+the last read revision, at most once per ``IMAGE_SEARCH_REFRESH_INTERVAL_SECONDS``. A transaction that gets its
+revision early and commits after later ones would be skipped by this feed, so the last ``REVISION_OVERLAP``
+revisions are read again and the whole index is loaded anew once per ``IMAGE_SEARCH_REBUILD_INTERVAL_SECONDS``.
+"""
+
+import asyncio
+import heapq
+import logging
+import time
+from collections.abc import Set as AbstractSet
+from typing import Final, override
+
+from sqlalchemy import Row, Select, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pix_erase.application.common.ports.image.perceptual_hasher import PerceptualHashes
+from pix_erase.application.common.ports.image.similarity_index import ImageSimilarityIndex
+from pix_erase.application.common.query_models.image import SimilarImageQueryModel
+from pix_erase.domain.image.values.image_id import ImageID
+from pix_erase.infrastructure.adapters.persistence.constants import DB_QUERY_FAILED
+from pix_erase.infrastructure.adapters.persistence.perceptual_hash_tree import HashMatch, PerceptualHashTree
+from pix_erase.infrastructure.errors.transaction_manager import RepoError
+from pix_erase.infrastructure.persistence.models.image_perceptual_hashes import (
+    from_bigint,
+    image_perceptual_hashes_table,
+)
+from pix_erase.setup.config.image_search import ImageSearchConfig
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+REVISION_OVERLAP: Final[int] = 1000
+
+type HashRow = Row[tuple[ImageID, int, int, int, bool, int]]
+
+
+class PerceptualHashIndex:
+    """The tree of one process and its position in the change feed, shared by all requests of the process."""
+
+    def __init__(self) -> None:
+        self.tree: PerceptualHashTree = PerceptualHashTree()
+        self.revision: int = 0
+        self.refreshed_at: float | None = None
+        self.rebuilt_at: float | None = None
+        self.lock: Final[asyncio.Lock] = asyncio.Lock()
+
+
+class SqlAlchemyImageSimilarityIndex(ImageSimilarityIndex):
+    def __init__(self, index: PerceptualHashIndex, session: AsyncSession, config: ImageSearchConfig) -> None:
+        self._index: Final[PerceptualHashIndex] = index
+        self._session: Final[AsyncSession] = session
+        self._config: Final[ImageSearchConfig] = config
+
+    @override
+    async def search(
+        self,
+        hashes: PerceptualHashes,
+        max_distance: int,
+        limit: int,
+        among: AbstractSet[ImageID] | None = None,
+    ) -> list[SimilarImageQueryModel]:
+        await self._refresh()
+
+        matches: list[HashMatch] = self._index.tree.search(hashes.phash, max_distance)
+        similar_images: list[SimilarImageQueryModel] = [
+            SimilarImageQueryModel(
+                image_id=match.image_id,
+                phash_distance=match.phash_distance,
+                dhash_distance=(match.hashes.dhash ^ hashes.dhash).bit_count(),
+                ahash_distance=(match.hashes.ahash ^ hashes.ahash).bit_count(),
+            )
+            for match in matches
+            if among is None or match.image_id in among
+        ]
+
+        return heapq.nsmallest(limit, similar_images, key=lambda image: (image.phash_distance, image.distance))
+
+    def _is_fresh(self) -> bool:
+        refreshed_at: float | None = self._index.refreshed_at
+        return refreshed_at is not None and time.monotonic() - refreshed_at < self._config.refresh_interval_seconds
+
+    async def _refresh(self) -> None:
+        # a loaded index is searched as it is while another request reads changes into it
+        if self._is_fresh() or (self._index.lock.locked() and self._index.rebuilt_at is not None):
+            return
+
+        async with self._index.lock:
+            if self._is_fresh():
+                return
+
+            rebuilt_at: float | None = self._index.rebuilt_at
+
+            if rebuilt_at is None or time.monotonic() - rebuilt_at >= self._config.rebuild_interval_seconds:
+                await self._rebuild()
+            else:
+                after: int = max(0, self._index.revision - REVISION_OVERLAP)
+                self._index.revision = max(self._index.revision, await self._read_changes(self._index.tree, after))
+
+            self._index.refreshed_at = time.monotonic()
+
+    async def _rebuild(self) -> None:
+        """Loads the index into a new tree, searches use the old one until it's ready."""
+        started_at: float = time.monotonic()
+        tree: PerceptualHashTree = PerceptualHashTree()
+        revision: int = await self._read_changes(tree, after=0, only_live=True)
+
+        self._index.tree = tree
+        self._index.revision = revision
+        self._index.rebuilt_at = started_at
+
+        logger.info("Loaded %s perceptual hashes into the index in %.3f s", len(tree), time.monotonic() - started_at)
+
+    async def _read_changes(self, tree: PerceptualHashTree, after: int, *, only_live: bool = False) -> int:
+        """Applies rows with revisions after ``after`` to the tree, returns the last applied revision."""
+        table = image_perceptual_hashes_table
+        revision: int = after
+
+        while True:
+            select_stmt: Select[tuple[ImageID, int, int, int, bool, int]] = (
+                select(table.c.image_id, table.c.phash, table.c.dhash, table.c.ahash, table.c.deleted, table.c.revision)
+                .where(table.c.revision > revision)
+                .order_by(table.c.revision)
+                .limit(self._config.batch_size)
+            )
+
+            if only_live:
+                select_stmt = select_stmt.where(table.c.deleted.is_(False))
+
+            try:
+                rows: list[HashRow] = list((await self._session.execute(select_stmt)).all())
+            except SQLAlchemyError as error:
+                raise RepoError(DB_QUERY_FAILED) from error
+
+            for row in rows:
+                if row.deleted:
+                    tree.discard(row.image_id)
+                else:
+                    tree.put(
+                        row.image_id,
+                        PerceptualHashes(
+                            phash=from_bigint(row.phash),
+                            dhash=from_bigint(row.dhash),
+                            ahash=from_bigint(row.ahash),
+                        ),
+                    )
+
+            if rows:
+                revision = rows[-1].revision
+
+            if len(rows) < self._config.batch_size:
+                return revision
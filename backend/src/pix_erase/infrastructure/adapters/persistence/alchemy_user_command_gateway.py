@@ -66,7 +66,6 @@ class SqlAlchemyUserCommandGateway(UserCommandGateway):
                 hashed_password=user.hashed_password,
                 role=user.role,
                 is_active=user.is_active,
-                images=user.images,
                 updated_at=user.updated_at,
             )
         )
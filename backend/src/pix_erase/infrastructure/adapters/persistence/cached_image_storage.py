@@ -0,0 +1,151 @@
+import json
+import logging
+from collections.abc import AsyncIterable
+from datetime import datetime
+from typing import Any, Final, override
+
+from pix_erase.application.common.ports.image.storage import ImageStorage
+from pix_erase.application.common.query_models.image import (
+    ImageByteRange,
+    ImageMetadataQueryModel,
+    ImageRangeQueryModel,
+    ImageStreamQueryModel,
+)
+from pix_erase.domain.image.entities.image import Image
+from pix_erase.domain.image.values.image_id import ImageID
+from pix_erase.domain.image.values.image_name import ImageName
+from pix_erase.domain.image.values.image_size import ImageSize
+from pix_erase.infrastructure.cache.cache_store import CacheStore
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+
+def _metadata_key(image_id: ImageID) -> str:
+    return f"image_metadata:{image_id!s}"
+
+
+def _serialize_metadata(metadata: ImageMetadataQueryModel) -> bytes:
+    data: dict[str, Any] = {
+        "content_type": metadata.content_type,
+        "content_length": metadata.content_length,
+        "width": metadata.width.value,
+        "height": metadata.height.value,
+        "filename": metadata.filename.value,
+        "etag": metadata.etag,
+        "blob_hash": metadata.blob_hash,
+        "created_at": metadata.created_at.isoformat(),
+        "updated_at": metadata.updated_at.isoformat(),
+    }
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def _deserialize_metadata(data: bytes) -> ImageMetadataQueryModel:
+    raw: dict[str, Any] = json.loads(data.decode("utf-8"))
+    return ImageMetadataQueryModel(
+        content_type=raw["content_type"],
+        content_length=raw["content_length"],
+        width=ImageSize(raw["width"]),
+        height=ImageSize(raw["height"]),
+        filename=ImageName(raw["filename"]),
+        etag=raw["etag"],
+        blob_hash=raw.get("blob_hash"),
+        created_at=datetime.fromisoformat(raw["created_at"]),
+        updated_at=datetime.fromisoformat(raw["updated_at"]),
+    )
+
+
+class CachedImageStorage(ImageStorage):
+    """
+    Caches metadata of stored images, so checking that an image exists doesn't go to S3 every time.
+
+    Every write of an image drops its metadata before and after the write, a read that started before
+    the write may still put the old metadata back, ``METADATA_TTL`` bounds how long it's served.
+    Errors of the cache are logged, the storage is used as if nothing was cached.
+    Missing images aren't cached, an image becomes visible as soon as it's stored.
+    """
+
+    METADATA_TTL: Final[int] = 60
+
+    def __init__(self, image_storage: ImageStorage, cache_store: CacheStore) -> None:
+        self._image_storage: Final[ImageStorage] = image_storage
+        self._cache_store: Final[CacheStore] = cache_store
+
+    @override
+    async def add(self, image: Image) -> None:
+        await self._invalidate(image.id)
+        await self._image_storage.add(image)
+        await self._invalidate(image.id)
+
+    @override
+    async def add_stream(self, image_id: ImageID, name: ImageName, stream: AsyncIterable[bytes]) -> None:
+        await self._invalidate(image_id)
+        await self._image_storage.add_stream(image_id, name, stream)
+        await self._invalidate(image_id)
+
+    @override
+    async def add_uploaded(self, image_id: ImageID, name: ImageName) -> None:
+        await self._invalidate(image_id)
+        await self._image_storage.add_uploaded(image_id, name)
+        await self._invalidate(image_id)
+
+    @override
+    async def read_upload_size(self, image_id: ImageID) -> int | None:
+        return await self._image_storage.read_upload_size(image_id)
+
+    @override
+    async def read_by_id(self, image_id: ImageID) -> Image:
+        return await self._image_storage.read_by_id(image_id)
+
+    @override
+    async def read_range(self, image_id: ImageID, offset: int, size: int) -> ImageRangeQueryModel | None:
+        return await self._image_storage.read_range(image_id, offset, size)
+
+    @override
+    async def delete_by_id(self, image_id: ImageID) -> None:
+        await self._invalidate(image_id)
+        await self._image_storage.delete_by_id(image_id)
+        await self._invalidate(image_id)
+
+    @override
+    async def update(self, image: Image) -> None:
+        await self._invalidate(image.id)
+        await self._image_storage.update(image)
+        await self._invalidate(image.id)
+
+    @override
+    async def read_metadata_by_id(self, image_id: ImageID) -> ImageMetadataQueryModel | None:
+        cache_key: str = _metadata_key(image_id)
+
+        try:
+            cached_data: bytes | None = await self._cache_store.get(cache_key)
+        except Exception:
+            logger.exception("Failed to read cached metadata of image %s", image_id)
+            return await self._image_storage.read_metadata_by_id(image_id)
+
+        if cached_data is not None:
+            logger.debug("Metadata of image %s found in cache", image_id)
+            return _deserialize_metadata(cached_data)
+
+        metadata: ImageMetadataQueryModel | None = await self._image_storage.read_metadata_by_id(image_id)
+
+        if metadata is not None:
+            try:
+                await self._cache_store.set(cache_key, _serialize_metadata(metadata), self.METADATA_TTL)
+            except Exception:
+                logger.exception("Failed to cache metadata of image %s", image_id)
+
+        return metadata
+
+    @override
+    async def stream_by_id(
+        self,
+        image_id: ImageID,
+        byte_range: ImageByteRange | None = None,
+    ) -> ImageStreamQueryModel | None:
+        return await self._image_storage.stream_by_id(image_id, byte_range)
+
+    async def _invalidate(self, image_id: ImageID) -> None:
+        try:
+            await self._cache_store.delete(_metadata_key(image_id))
+        except Exception:
+            logger.exception("Failed to drop cached metadata of image %s", image_id)
@@ -0,0 +1,43 @@
+from typing import Final, override
+
+from pix_erase.application.common.ports.user.command_gateway import UserCommandGateway
+from pix_erase.domain.user.entities.user import User
+from pix_erase.domain.user.values.user_email import UserEmail
+from pix_erase.domain.user.values.user_id import UserID
+from pix_erase.infrastructure.cache.user_cache import UserCache
+
+
+class CachedUserCommandGateway(UserCommandGateway):
+    """
+    Marks users written by statements of the gateway as changed, they are dropped from the cache after the commit.
+
+    Changes of loaded users are found by the transaction manager when they are flushed,
+    ``update`` and ``delete_by_id`` are statements the session doesn't track.
+    """
+
+    def __init__(self, user_command_gateway: UserCommandGateway, user_cache: UserCache) -> None:
+        self._user_command_gateway: Final[UserCommandGateway] = user_command_gateway
+        self._user_cache: Final[UserCache] = user_cache
+
+    @override
+    async def add(self, user: User) -> None:
+        await self._user_command_gateway.add(user)
+        self._user_cache.mark_changed([user.id])
+
+    @override
+    async def read_by_id(self, user_id: UserID) -> User | None:
+        return await self._user_command_gateway.read_by_id(user_id)
+
+    @override
+    async def read_by_email(self, email: UserEmail) -> User | None:
+        return await self._user_command_gateway.read_by_email(email)
+
+    @override
+    async def delete_by_id(self, user_id: UserID) -> None:
+        await self._user_command_gateway.delete_by_id(user_id)
+        self._user_cache.mark_changed([user_id])
+
+    @override
+    async def update(self, user: User) -> None:
+        await self._user_command_gateway.update(user)
+        self._user_cache.mark_changed([user.id])
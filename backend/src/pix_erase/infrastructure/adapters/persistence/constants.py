@@ -14,3 +14,19 @@ UPLOAD_FILE_FAILED: Final[str] = "upload for file was failed"
 DOWNLOAD_FILE_FAILED: Final[str] = "download for file was failed"
 DELETE_FILE_FAILED: Final[str] = "delete for file was failed"
 STREAM_FILE_FAILED: Final[str] = "stream file failed"
+READ_METADATA_FAILED: Final[str] = "read metadata of file failed"
+SIGN_URL_FAILED: Final[str] = "sign url for file failed"
+NOT_FOUND_ERROR_CODES: Final[frozenset[str]] = frozenset({"404", "NoSuchKey", "NotFound"})
+
+IMAGES_PREFIX: Final[str] = "images/"
+BLOBS_PREFIX: Final[str] = "blobs/"
+UPLOADS_PREFIX: Final[str] = "uploads/"
+BLOB_REFS_PREFIX: Final[str] = "blob-refs/"
+BLOB_HASH_METADATA_KEY: Final[str] = "blob_sha256"
+SIZE_METADATA_KEY: Final[str] = "size"
+BLOB_LOCK_PREFIX: Final[str] = "image_blob_lock:"
+BLOB_LOCK_TIMEOUT_SECONDS: Final[int] = 60
+BLOB_LOCK_BLOCKING_TIMEOUT_SECONDS: Final[int] = 30
+RENDITIONS_PREFIX: Final[str] = "renditions/"
+# S3 returns at most 1000 keys per listing
+RENDITIONS_LIST_LIMIT: Final[int] = 1000
@@ -0,0 +1,127 @@
+"""
+In-memory BK-tree of perceptual hashes.
+
+Children of a node are kept by their Hamming distance to it. By the triangle inequality, a search for hashes within
+``r`` bits of a query descends only into children at distances ``d - r .. d + r`` of a node at distance ``d``, so
+a near-duplicate search looks at a small part of the tree. An image is added in O(depth) and nodes never move:
+a deleted or changed image only leaves its node, an empty node keeps routing searches. The tree is built again
+once half of its nodes are empty.
+"""
+
+from dataclasses import dataclass, field
+from typing import Final
+
+from pix_erase.application.common.ports.image.perceptual_hasher import PerceptualHashes
+from pix_erase.domain.image.values.image_id import ImageID
+
+COMPACTION_RATIO: Final[int] = 2
+
+
+@dataclass(slots=True, eq=False)
+class _Node:
+    phash: int
+    image_ids: set[ImageID] = field(default_factory=set)
+    children: dict[int, "_Node"] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class HashMatch:
+    image_id: ImageID
+    hashes: PerceptualHashes
+    phash_distance: int
+
+
+class PerceptualHashTree:
+    def __init__(self) -> None:
+        self._root: _Node | None = None
+        self._entries: dict[ImageID, PerceptualHashes] = {}
+        self._nodes_by_image: dict[ImageID, _Node] = {}
+        self._nodes: int = 0
+        self._empty_nodes: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def put(self, image_id: ImageID, hashes: PerceptualHashes) -> None:
+        if self._entries.get(image_id) == hashes:
+            return
+
+        self.discard(image_id)
+
+        node: _Node = self._node_for(hashes.phash)
+
+        if not node.image_ids:
+            self._empty_nodes -= 1
+
+        node.image_ids.add(image_id)
+        self._entries[image_id] = hashes
+        self._nodes_by_image[image_id] = node
+
+    def discard(self, image_id: ImageID) -> None:
+        node: _Node | None = self._nodes_by_image.pop(image_id, None)
+
+        if node is None:
+            return
+
+        del self._entries[image_id]
+        node.image_ids.discard(image_id)
+
+        if not node.image_ids:
+            self._empty_nodes += 1
+
+        if self._empty_nodes * COMPACTION_RATIO > self._nodes:
+            self._compact()
+
+    def search(self, phash: int, max_distance: int) -> list[HashMatch]:
+        matches: list[HashMatch] = []
+        stack: list[_Node] = [] if self._root is None else [self._root]
+
+        while stack:
+            node: _Node = stack.pop()
+            distance: int = (node.phash ^ phash).bit_count()
+
+            if distance <= max_distance:
+                matches.extend(
+                    HashMatch(image_id=image_id, hashes=self._entries[image_id], phash_distance=distance)
+                    for image_id in node.image_ids
+                )
+
+            low, high = distance - max_distance, distance + max_distance
+            stack.extend(child for child_distance, child in node.children.items() if low <= child_distance <= high)
+
+        return matches
+
+    def _node_for(self, phash: int) -> _Node:
+        """Finds the node of the hash, a new empty node is added when the hash isn't in the tree yet."""
+        if self._root is None:
+            self._root = self._new_node(phash)
+            return self._root
+
+        node: _Node = self._root
+
+        while (distance := (node.phash ^ phash).bit_count()) != 0:
+            child: _Node | None = node.children.get(distance)
+
+            if child is None:
+                child = node.children[distance] = self._new_node(phash)
+                return child
+
+            node = child
+
+        return node
+
+    def _new_node(self, phash: int) -> _Node:
+        self._nodes += 1
+        self._empty_nodes += 1
+        return _Node(phash=phash)
+
+    def _compact(self) -> None:
+        entries: dict[ImageID, PerceptualHashes] = self._entries
+        self._root = None
+        self._entries = {}
+        self._nodes_by_image = {}
+        self._nodes = 0
+        self._empty_nodes = 0
+
+        for image_id, hashes in entries.items():
+            self.put(image_id, hashes)
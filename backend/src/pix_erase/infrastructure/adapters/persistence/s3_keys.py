@@ -0,0 +1,27 @@
+from pix_erase.domain.image.values.image_id import ImageID
+from pix_erase.infrastructure.adapters.persistence.constants import (
+    BLOBS_PREFIX,
+    IMAGES_PREFIX,
+    RENDITIONS_PREFIX,
+    UPLOADS_PREFIX,
+)
+
+
+def image_key(image_id: ImageID) -> str:
+    return f"{IMAGES_PREFIX}{image_id!s}"
+
+
+def upload_key(image_id: ImageID) -> str:
+    return f"{UPLOADS_PREFIX}{image_id!s}"
+
+
+def blob_key(blob_hash: str) -> str:
+    return f"{BLOBS_PREFIX}{blob_hash}"
+
+
+def rendition_prefix(blob_hash: str) -> str:
+    return f"{RENDITIONS_PREFIX}{blob_hash}/"
+
+
+def rendition_key(blob_hash: str, size: int) -> str:
+    return f"{rendition_prefix(blob_hash)}{size}"
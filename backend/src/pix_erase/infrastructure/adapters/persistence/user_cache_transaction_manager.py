@@ -0,0 +1,53 @@
+import logging
+from itertools import chain
+from typing import Final, override
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, UOWTransaction
+
+from pix_erase.application.common.ports.transaction_manager import TransactionManager
+from pix_erase.domain.user.entities.user import User
+from pix_erase.infrastructure.cache.user_cache import UserCache
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+
+class UserCacheTransactionManager(TransactionManager):
+    """
+    Drops users changed by the transaction from the cache once it's committed.
+
+    Users added, changed or deleted through the session are collected before every flush,
+    so changes flushed early by a handler are dropped as well. A rolled back transaction drops nothing.
+    """
+
+    def __init__(self, transaction_manager: TransactionManager, session: AsyncSession, user_cache: UserCache) -> None:
+        self._transaction_manager: Final[TransactionManager] = transaction_manager
+        self._user_cache: Final[UserCache] = user_cache
+        event.listen(session.sync_session, "before_flush", self._collect_changed_users)
+
+    @override
+    async def commit(self) -> None:
+        try:
+            await self._transaction_manager.commit()
+        except Exception:
+            self._user_cache.forget_changed()
+            raise
+
+        await self._user_cache.invalidate_changed()
+
+    @override
+    async def flush(self) -> None:
+        await self._transaction_manager.flush()
+
+    @override
+    async def rollback(self) -> None:
+        self._user_cache.forget_changed()
+        await self._transaction_manager.rollback()
+
+    def _collect_changed_users(self, session: Session, _: UOWTransaction, __: object) -> None:
+        self._user_cache.mark_changed(
+            instance.id
+            for instance in chain(session.new, session.dirty, session.deleted)
+            if isinstance(instance, User) and (instance not in session.dirty or session.is_modified(instance))
+        )
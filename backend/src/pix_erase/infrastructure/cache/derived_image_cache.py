@@ -0,0 +1,45 @@
+import hashlib
+import json
+from abc import abstractmethod
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+from pix_erase.domain.image.values.image_size import ImageSize
+from pix_erase.infrastructure.adapters.image_converters.codec import CODEC_VERSION
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DerivedImageKey:
+    """Identifies a transformation result: the same source, operation and parameters give the same bytes."""
+
+    source_hash: str
+    operation: str
+    params: Mapping[str, Any]
+    codec_version: str = CODEC_VERSION
+
+    @classmethod
+    def for_source(cls, source: bytes, operation: str, params: Mapping[str, Any]) -> "DerivedImageKey":
+        return cls(source_hash=hashlib.sha256(source).hexdigest(), operation=operation, params=params)
+
+    @property
+    def digest(self) -> str:
+        serialized_params: str = json.dumps(self.params, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(
+            f"{self.source_hash}:{self.operation}:{serialized_params}:{self.codec_version}".encode(),
+        ).hexdigest()
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DerivedImage:
+    data: bytes
+    width: ImageSize
+    height: ImageSize
+
+
+class DerivedImageCache(Protocol):
+    @abstractmethod
+    async def get(self, key: DerivedImageKey) -> DerivedImage | None: ...
+
+    @abstractmethod
+    async def set(self, key: DerivedImageKey, image: DerivedImage) -> None: ...
@@ -0,0 +1,53 @@
+import logging
+from typing import Final, override
+
+from prometheus_client import Counter
+
+from pix_erase.application.common.ports.image.feature_cache import ImageFeatureCache
+from pix_erase.domain.image.values.image_id import ImageID
+from pix_erase.infrastructure.cache.cache_store import CacheStore
+from pix_erase.setup.config.image_comparison import ImageComparisonConfig
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+IMAGE_FEATURE_CACHE_LOOKUPS: Final[Counter] = Counter(
+    "image_feature_cache_lookups",
+    "Lookups of comparison features of images in the cache",
+    ["result"],
+)
+
+
+class RedisImageFeatureCache(ImageFeatureCache):
+    """
+    Keeps features as ``image_features:{image_id}:{etag}:{side}``.
+
+    A changed image gets a new ETag, so its old features are never read again and just expire.
+    Errors of the cache are logged and treated as misses, features are extracted again then.
+    """
+
+    def __init__(self, cache_store: CacheStore, config: ImageComparisonConfig) -> None:
+        self._cache_store: Final[CacheStore] = cache_store
+        self._side: Final[int] = config.feature_side
+        self._ttl: Final[int] = config.feature_cache_ttl_seconds
+
+    def _key(self, image_id: ImageID, etag: str) -> str:
+        return f"image_features:{image_id}:{etag.strip('"')}:{self._side}"
+
+    @override
+    async def get(self, image_id: ImageID, etag: str) -> bytes | None:
+        features: bytes | None = None
+
+        try:
+            features = await self._cache_store.get(self._key(image_id, etag))
+        except Exception:
+            logger.exception("Failed to read cached features of image %s", image_id)
+
+        IMAGE_FEATURE_CACHE_LOOKUPS.labels("miss" if features is None else "hit").inc()
+        return features
+
+    @override
+    async def set(self, image_id: ImageID, etag: str, features: bytes) -> None:
+        try:
+            await self._cache_store.set(self._key(image_id, etag), features, self._ttl)
+        except Exception:
+            logger.exception("Failed to cache features of image %s", image_id)
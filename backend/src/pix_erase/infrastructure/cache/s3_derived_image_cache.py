@@ -0,0 +1,150 @@
+import logging
+import time
+from typing import Any, Final, override
+
+from aiobotocore.client import AioBaseClient
+from botocore.exceptions import ClientError
+from prometheus_client import Counter
+from redis.asyncio import Redis
+
+from pix_erase.domain.image.values.image_size import ImageSize
+from pix_erase.infrastructure.cache.derived_image_cache import DerivedImage, DerivedImageCache, DerivedImageKey
+from pix_erase.setup.config.derived_image_cache import DerivedImageCacheConfig
+from pix_erase.setup.config.s3 import S3Config
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+DERIVED_IMAGES_PREFIX: Final[str] = "derived/"
+LRU_INDEX_KEY: Final[str] = "derived_images:lru"
+SIZES_KEY: Final[str] = "derived_images:sizes"
+TOTAL_SIZE_KEY: Final[str] = "derived_images:total_bytes"
+BYTES_IN_MEGABYTE: Final[int] = 1024 * 1024
+NOT_FOUND_ERROR_CODES: Final[frozenset[str]] = frozenset({"404", "NoSuchKey", "NotFound"})
+
+DERIVED_IMAGE_CACHE_LOOKUPS: Final[Counter] = Counter(
+    "derived_image_cache_lookups",
+    "Lookups of transformation results in the cache",
+    ["operation", "result"],
+)
+DERIVED_IMAGE_CACHE_EVICTIONS: Final[Counter] = Counter(
+    "derived_image_cache_evictions",
+    "Transformation results evicted from the cache",
+)
+
+
+class S3DerivedImageCache(DerivedImageCache):
+    """
+    Keeps transformation results in S3 as ``derived/{digest}`` and indexes them in Redis.
+
+    The Redis sorted set orders results by the time of the last hit, results that weren't used the longest
+    are evicted when the total size goes over the limit. Errors of the cache are logged and treated as misses,
+    so a broken cache only makes tasks do the work again.
+    """
+
+    def __init__(
+        self,
+        client: AioBaseClient,
+        redis: Redis,
+        s3_config: S3Config,
+        config: DerivedImageCacheConfig,
+    ) -> None:
+        self._client: Final[AioBaseClient] = client
+        self._redis: Final[Redis] = redis
+        self._bucket_name: Final[str] = s3_config.images_bucket_name
+        self._enabled: Final[bool] = config.enabled
+        self._max_size_bytes: Final[int] = config.max_size_mb * BYTES_IN_MEGABYTE
+
+    @override
+    async def get(self, key: DerivedImageKey) -> DerivedImage | None:
+        if not self._enabled:
+            return None
+
+        image: DerivedImage | None = None
+
+        try:
+            image = await self._read(key.digest)
+        except Exception:
+            logger.exception("Failed to read cached result of %s", key.operation)
+
+        DERIVED_IMAGE_CACHE_LOOKUPS.labels(key.operation, "miss" if image is None else "hit").inc()
+        logger.debug("Cache %s for %s of %s", "miss" if image is None else "hit", key.operation, key.source_hash)
+
+        return image
+
+    @override
+    async def set(self, key: DerivedImageKey, image: DerivedImage) -> None:
+        if not self._enabled or len(image.data) > self._max_size_bytes:
+            return
+
+        try:
+            await self._write(key.digest, image)
+            await self._evict()
+        except Exception:
+            logger.exception("Failed to cache result of %s", key.operation)
+
+    async def _read(self, digest: str) -> DerivedImage | None:
+        # XX updates the score of present members only, CH makes it return whether the member was there
+        if not await self._redis.zadd(LRU_INDEX_KEY, {digest: time.time()}, xx=True, ch=True):
+            return None
+
+        try:
+            response: dict[str, Any] = await self._client.get_object(
+                Bucket=self._bucket_name,
+                Key=f"{DERIVED_IMAGES_PREFIX}{digest}",
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] not in NOT_FOUND_ERROR_CODES:
+                raise
+
+            await self._forget(digest)
+            return None
+
+        metadata: dict[str, str] = response.get("Metadata", {})
+
+        return DerivedImage(
+            data=await response["Body"].read(),
+            width=ImageSize(int(metadata["width"])),
+            height=ImageSize(int(metadata["height"])),
+        )
+
+    async def _write(self, digest: str, image: DerivedImage) -> None:
+        await self._client.put_object(
+            Bucket=self._bucket_name,
+            Key=f"{DERIVED_IMAGES_PREFIX}{digest}",
+            Body=image.data,
+            Metadata={"width": str(image.width.value), "height": str(image.height.value)},
+        )
+
+        created: int = await self._redis.hset(SIZES_KEY, digest, str(len(image.data)))  # type: ignore[misc]
+        await self._redis.zadd(LRU_INDEX_KEY, {digest: time.time()})
+
+        if created:
+            await self._redis.incrby(TOTAL_SIZE_KEY, len(image.data))
+
+    async def _evict(self) -> None:
+        total_size: int = int(await self._redis.get(TOTAL_SIZE_KEY) or 0)
+
+        while total_size > self._max_size_bytes:
+            # ZPOPMIN is atomic, so concurrent evictions never pick the same result
+            popped: list[tuple[bytes, float]] = await self._redis.zpopmin(LRU_INDEX_KEY)
+
+            if not popped:
+                return
+
+            digest: str = popped[0][0].decode()
+            await self._client.delete_object(Bucket=self._bucket_name, Key=f"{DERIVED_IMAGES_PREFIX}{digest}")
+            total_size = await self._forget(digest)
+
+            DERIVED_IMAGE_CACHE_EVICTIONS.inc()
+            logger.debug("Evicted cached result %s, cache size: %s bytes", digest, total_size)
+
+    async def _forget(self, digest: str) -> int:
+        """Removes the result from the index, returns the cache size left."""
+        await self._redis.zrem(LRU_INDEX_KEY, digest)
+        size: bytes | None = await self._redis.hget(SIZES_KEY, digest)  # type: ignore[misc]
+
+        # only the caller that actually removed the entry accounts for its size
+        if size is not None and await self._redis.hdel(SIZES_KEY, digest):  # type: ignore[misc]
+            return int(await self._redis.decrby(TOTAL_SIZE_KEY, int(size)))
+
+        return int(await self._redis.get(TOTAL_SIZE_KEY) or 0)
@@ -0,0 +1,156 @@
+import hashlib
+import logging
+import uuid
+from collections.abc import Iterable
+from typing import Final, Literal
+
+from prometheus_client import Counter
+
+from pix_erase.application.common.query_params.user_filters import UserListParams
+from pix_erase.domain.user.entities.user import User
+from pix_erase.domain.user.values.user_id import UserID
+from pix_erase.infrastructure.cache.cache_store import CacheStore
+from pix_erase.infrastructure.cache.user_codec import (
+    USER_CODEC_VERSION,
+    decode_user,
+    decode_users,
+    encode_user,
+    encode_users,
+)
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+USERS_PREFIX: Final[str] = f"users:v{USER_CODEC_VERSION}"
+LIST_GENERATION_KEY: Final[str] = f"{USERS_PREFIX}:list_generation"
+
+USER_CACHE_LOOKUPS: Final[Counter] = Counter(
+    "user_cache_lookups",
+    "Lookups of users in the cache, hit ratio is hits of all lookups",
+    ["kind", "result"],
+)
+USER_CACHE_INVALIDATIONS: Final[Counter] = Counter(
+    "user_cache_invalidations",
+    "Users dropped from the cache after their changes were committed",
+)
+
+type UserLookupKind = Literal["user", "list"]
+
+
+def user_key(user_id: UserID) -> str:
+    return f"{USERS_PREFIX}:user:{user_id}"
+
+
+def list_key(generation: str, user_list_params: UserListParams) -> str:
+    params: str = "|".join(
+        (
+            str(user_list_params.pagination.limit),
+            str(user_list_params.pagination.offset),
+            user_list_params.sorting.sorting_field,
+            user_list_params.sorting.sorting_order,
+        ),
+    )
+    return f"{USERS_PREFIX}:list:{generation}:{hashlib.sha256(params.encode()).hexdigest()[:32]}"
+
+
+class UserCache:
+    """
+    Users shared by every process through the cache store.
+
+    Keys don't depend on the process, a user is ``users:v{codec}:user:{id}``, a page of users is keyed by
+    a digest of its params and the list generation. Lists can't be found by a changed user, so any change
+    starts a new generation and old pages just expire.
+
+    Changed users are collected during the request by ``mark_changed`` and dropped by ``invalidate_changed``
+    after the commit, dropping them before it lets a concurrent read cache the old user again.
+    Errors of the cache are logged and treated as misses.
+    """
+
+    USER_TTL: Final[int] = 300
+    LIST_TTL: Final[int] = 60
+    LIST_GENERATION_TTL: Final[int] = 24 * 60 * 60
+
+    def __init__(self, cache_store: CacheStore) -> None:
+        self._cache_store: Final[CacheStore] = cache_store
+        self._changed: Final[set[UserID]] = set()
+
+    async def read_user(self, user_id: UserID) -> User | None:
+        user: User | None = None
+
+        try:
+            data: bytes | None = await self._cache_store.get(user_key(user_id))
+            user = None if data is None else decode_user(data)
+        except Exception:
+            logger.exception("Failed to read cached user %s", user_id)
+            self._count("user", "error")
+            return None
+
+        self._count("user", "miss" if user is None else "hit")
+        return user
+
+    async def store_user(self, user: User) -> None:
+        try:
+            await self._cache_store.set(user_key(user.id), encode_user(user), self.USER_TTL)
+        except Exception:
+            logger.exception("Failed to cache user %s", user.id)
+
+    async def read_list(self, user_list_params: UserListParams) -> list[User] | None:
+        users: list[User] | None = None
+
+        try:
+            data: bytes | None = await self._cache_store.get(list_key(await self._generation(), user_list_params))
+            users = None if data is None else decode_users(data)
+        except Exception:
+            logger.exception("Failed to read cached users for params: %s", user_list_params)
+            self._count("list", "error")
+            return None
+
+        self._count("list", "miss" if users is None else "hit")
+        return users
+
+    async def store_list(self, user_list_params: UserListParams, users: list[User]) -> None:
+        try:
+            key: str = list_key(await self._generation(), user_list_params)
+            await self._cache_store.set(key, encode_users(users), self.LIST_TTL)
+        except Exception:
+            logger.exception("Failed to cache users for params: %s", user_list_params)
+
+    def mark_changed(self, user_ids: Iterable[UserID]) -> None:
+        self._changed.update(user_ids)
+
+    def forget_changed(self) -> None:
+        self._changed.clear()
+
+    async def invalidate_changed(self) -> None:
+        if not self._changed:
+            return
+
+        changed: list[UserID] = list(self._changed)
+        self._changed.clear()
+
+        try:
+            for user_id in changed:
+                await self._cache_store.delete(user_key(user_id))
+            await self._new_generation()
+        except Exception:
+            logger.exception("Failed to drop cached users: %s", changed)
+            return
+
+        USER_CACHE_INVALIDATIONS.inc(len(changed))
+        logger.debug("Dropped cached users: %s", changed)
+
+    async def _generation(self) -> str:
+        generation: bytes | None = await self._cache_store.get(LIST_GENERATION_KEY)
+
+        if generation is None:
+            return await self._new_generation()
+
+        return generation.decode()
+
+    async def _new_generation(self) -> str:
+        generation: str = uuid.uuid4().hex
+        await self._cache_store.set(LIST_GENERATION_KEY, generation.encode(), self.LIST_GENERATION_TTL)
+        return generation
+
+    @staticmethod
+    def _count(kind: UserLookupKind, result: Literal["hit", "miss", "error"]) -> None:
+        USER_CACHE_LOOKUPS.labels(kind, result).inc()
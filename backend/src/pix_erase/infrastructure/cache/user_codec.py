@@ -0,0 +1,116 @@
+"""
+Binary format of cached users.
+
+A user is ``!16s?BHHH`` (id, is_active and lengths of role, email, name and password hash) followed by the
+UTF-8 role, email and name and the raw password hash. A list is the number of users followed by the users.
+Every value starts with ``USER_CODEC_VERSION``, a value of another version can't be decoded and is a miss.
+"""
+
+import struct
+from collections.abc import Sequence
+from typing import Final
+from uuid import UUID
+
+from pix_erase.domain.user.entities.user import SerializedUser, User
+
+USER_CODEC_VERSION: Final[int] = 1
+
+_VERSION: Final[struct.Struct] = struct.Struct("!B")
+_COUNT: Final[struct.Struct] = struct.Struct("!I")
+_USER_HEADER: Final[struct.Struct] = struct.Struct("!16s?BHHH")
+
+
+class UserCodecError(ValueError): ...
+
+
+def _encode_user(user: User) -> bytes:
+    serialized: SerializedUser = user.serialize()
+    role: bytes = serialized["role"].encode()
+    email: bytes = serialized["email"].encode()
+    name: bytes = serialized["name"].encode()
+    password: bytes = serialized["password"]
+    header: bytes = _USER_HEADER.pack(
+        user.id.bytes,
+        serialized["is_active"],
+        len(role),
+        len(email),
+        len(name),
+        len(password),
+    )
+    return b"".join((header, role, email, name, password))
+
+
+def _decode_user(data: memoryview, offset: int) -> tuple[User, int]:
+    user_id, is_active, role_length, email_length, name_length, password_length = _USER_HEADER.unpack_from(
+        data,
+        offset,
+    )
+    offset += _USER_HEADER.size
+    fields: list[bytes] = []
+
+    for length in (role_length, email_length, name_length, password_length):
+        if offset + length > len(data):
+            msg = "Cached user is truncated"
+            raise UserCodecError(msg)
+        fields.append(bytes(data[offset : offset + length]))
+        offset += length
+
+    role, email, name, password = fields
+    user: User = User.deserialize(
+        SerializedUser(
+            id=str(UUID(bytes=user_id)),
+            email=email.decode(),
+            name=name.decode(),
+            role=role.decode(),
+            is_active=is_active,
+            password=password,
+        ),
+    )
+    return user, offset
+
+
+def _check_version(data: memoryview) -> int:
+    (version,) = _VERSION.unpack_from(data)
+
+    if version != USER_CODEC_VERSION:
+        msg = f"Cached user has version {version}, expected {USER_CODEC_VERSION}"
+        raise UserCodecError(msg)
+
+    return _VERSION.size
+
+
+def encode_user(user: User) -> bytes:
+    return _VERSION.pack(USER_CODEC_VERSION) + _encode_user(user)
+
+
+def decode_user(data: bytes) -> User:
+    try:
+        view: memoryview = memoryview(data)
+        user, _ = _decode_user(view, _check_version(view))
+    except struct.error as error:
+        msg = "Cached user is truncated"
+        raise UserCodecError(msg) from error
+    else:
+        return user
+
+
+def encode_users(users: Sequence[User]) -> bytes:
+    return b"".join((_VERSION.pack(USER_CODEC_VERSION), _COUNT.pack(len(users)), *map(_encode_user, users)))
+
+
+def decode_users(data: bytes) -> list[User]:
+    try:
+        view: memoryview = memoryview(data)
+        offset: int = _check_version(view)
+        (count,) = _COUNT.unpack_from(view, offset)
+        offset += _COUNT.size
+        users: list[User] = []
+
+        for _ in range(count):
+            user, offset = _decode_user(view, offset)
+            users.append(user)
+    except struct.error as error:
+        msg = "Cached users are truncated"
+        raise UserCodecError(msg) from error
+    else:
+        return users
@@ -2,3 +2,9 @@ from pix_erase.infrastructure.errors.base import InfrastructureError
 
 
 class ImageDecodingError(InfrastructureError): ...
+
+
+class ImageEncodingError(InfrastructureError): ...
+
+
+class SuperResolutionModelNotFoundError(InfrastructureError): ...
@@ -0,0 +1,69 @@
+"""
+httpx transport that reports the state of its connection pool.
+
+httpx doesn't expose its pool, the transport owns it, so the transport is where connections are counted.
+``active`` and ``idle`` connections are read when metrics are scraped. Every request is counted by the
+connection it's expected to get: an available connection to the same origin (``reused``), a new one
+(``new``) or a connection released by another request once the pool is full (``waited``).
+"""
+
+from typing import Final, Literal, override
+
+import httpcore
+import httpx
+from prometheus_client import Counter, Gauge
+
+DEFAULT_PORTS: Final[dict[str, int]] = {"http": 80, "https": 443}
+
+HTTP_CLIENT_POOL_CONNECTIONS: Final[Gauge] = Gauge(
+    "http_client_pool_connections",
+    "Connections of the pool of the outgoing HTTP client",
+    ["pool", "state"],
+)
+HTTP_CLIENT_POOL_REQUESTS: Final[Counter] = Counter(
+    "http_client_pool_requests",
+    "Requests of the outgoing HTTP client by the connection they got",
+    ["pool", "connection"],
+)
+
+type PoolConnection = Literal["reused", "new", "waited"]
+
+
+def _origin(url: httpx.URL) -> httpcore.Origin:
+    port: int = url.port if url.port is not None else DEFAULT_PORTS.get(url.scheme, DEFAULT_PORTS["https"])
+    return httpcore.Origin(scheme=url.raw_scheme, host=url.raw_host, port=port)
+
+
+class PooledHttpTransport(httpx.AsyncHTTPTransport):
+    def __init__(self, name: str, limits: httpx.Limits, **kwargs: object) -> None:
+        super().__init__(limits=limits, **kwargs)  # type: ignore[arg-type]
+        self._name: Final[str] = name
+        self._max_connections: Final[int | None] = limits.max_connections
+
+        HTTP_CLIENT_POOL_CONNECTIONS.labels(name, "active").set_function(lambda: self.connections("active"))
+        HTTP_CLIENT_POOL_CONNECTIONS.labels(name, "idle").set_function(lambda: self.connections("idle"))
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def connections(self, state: Literal["active", "idle"]) -> int:
+        return sum(connection.is_idle() == (state == "idle") for connection in self._pool.connections)
+
+    @override
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        HTTP_CLIENT_POOL_REQUESTS.labels(self._name, self._expected_connection(request)).inc()
+        return await super().handle_async_request(request)
+
+    def _expected_connection(self, request: httpx.Request) -> PoolConnection:
+        origin: httpcore.Origin = _origin(request.url)
+        connections: list[httpcore.AsyncConnectionInterface] = self._pool.connections
+
+        for connection in connections:
+            if connection.can_handle_request(origin) and connection.is_available():
+                return "reused"
+
+        if self._max_connections is not None and len(connections) >= self._max_connections:
+            return "waited"
+
+        return "new"
@@ -1,11 +1,32 @@
+import logging
 from collections.abc import AsyncIterator
+from typing import Final
 
 import httpx
 
+from pix_erase.infrastructure.http.pooled_transport import PooledHttpTransport
 from pix_erase.setup.config.http import HttpClientConfig
 
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+SHARED_POOL_NAME: Final[str] = "shared"
+
 
 async def get_httpx_client(http_client_config: HttpClientConfig) -> AsyncIterator[httpx.AsyncClient]:
+    """Creates the HTTP client shared by every request and task of the process.
+
+    Args:
+        http_client_config: HTTP client configuration
+
+    Yields:
+        httpx.AsyncClient: HTTP client with long-lived pools of connections
+
+    Note:
+        - Connections are kept alive between requests, a repeated lookup skips TCP and TLS handshakes
+        - With ``http2`` requests to the same host are multiplexed over one connection
+        - Every host of ``dedicated_pool_hosts`` has its own pool with the same limits, others share one pool
+        - Pools are closed when the application stops
+    """
     cert: str | tuple[str, str] | None
     if http_client_config.client_cert_path and http_client_config.client_key_path:
         cert = (http_client_config.client_cert_path, http_client_config.client_key_path)
@@ -20,14 +41,25 @@ async def get_httpx_client(http_client_config: HttpClientConfig) -> AsyncIterato
         keepalive_expiry=http_client_config.keepalive_expiry,
     )
 
+    def transport(name: str) -> PooledHttpTransport:
+        return PooledHttpTransport(
+            name,
+            limits,
+            verify=http_client_config.verify,
+            cert=cert,
+            http2=http_client_config.http2,
+            proxy=http_client_config.proxy,
+            trust_env=False,
+        )
+
     async with httpx.AsyncClient(
         timeout=http_client_config.default_timeout,
-        verify=http_client_config.verify,
-        cert=cert,
         follow_redirects=http_client_config.follow_redirects,
-        http2=http_client_config.http2,
-        proxy=http_client_config.proxy,
-        limits=limits,
+        transport=transport(SHARED_POOL_NAME),
+        mounts={f"all://{host}": transport(host) for host in http_client_config.dedicated_pool_hosts},
         trust_env=False,
     ) as client:
+        logger.debug("HTTP client created with pools for: %s", http_client_config.dedicated_pool_hosts)
         yield client
+        logger.debug("Closing HTTP client.")
+    logger.debug("HTTP client closed.")
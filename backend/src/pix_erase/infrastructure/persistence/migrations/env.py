@@ -3,6 +3,8 @@ from logging.config import fileConfig
 from alembic import context
 from sqlalchemy import engine_from_config, pool
 
+# tables without mapped entities are added to the metadata by importing them
+from pix_erase.infrastructure.persistence.models import image_perceptual_hashes, images  # noqa: F401
 from pix_erase.infrastructure.persistence.models.base import metadata
 from pix_erase.setup.bootstrap import setup_configs, setup_map_tables
 
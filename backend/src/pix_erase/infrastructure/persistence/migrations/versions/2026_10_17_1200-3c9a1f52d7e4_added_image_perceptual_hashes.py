@@ -0,0 +1,48 @@
+"""Added perceptual hashes of images for reverse image search
+
+Revision ID: 3c9a1f52d7e4
+Revises: 7307e5d7342c
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c9a1f52d7e4"
+down_revision: str | Sequence[str] | None = "7307e5d7342c"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(sa.schema.CreateSequence(sa.Sequence("image_perceptual_hashes_revision_seq")))
+    op.create_table(
+        "image_perceptual_hashes",
+        sa.Column("image_id", sa.UUID(), nullable=False),
+        sa.Column("phash", sa.BigInteger(), nullable=False),
+        sa.Column("dhash", sa.BigInteger(), nullable=False),
+        sa.Column("ahash", sa.BigInteger(), nullable=False),
+        sa.Column("deleted", sa.Boolean(), server_default=sa.false(), nullable=False),
+        sa.Column(
+            "revision",
+            sa.BigInteger(),
+            server_default=sa.text("nextval('image_perceptual_hashes_revision_seq')"),
+            nullable=False,
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.PrimaryKeyConstraint("image_id", name=op.f("pk_image_perceptual_hashes")),
+    )
+    op.create_index(op.f("ix_image_perceptual_hashes_revision"), "image_perceptual_hashes", ["revision"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_image_perceptual_hashes_revision"), table_name="image_perceptual_hashes")
+    op.drop_table("image_perceptual_hashes")
+    op.execute(sa.schema.DropSequence(sa.Sequence("image_perceptual_hashes_revision_seq")))
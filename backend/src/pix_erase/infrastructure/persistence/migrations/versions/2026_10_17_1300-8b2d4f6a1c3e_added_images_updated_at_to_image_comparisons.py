@@ -0,0 +1,28 @@
+"""Added images_updated_at to image_comparisons
+
+Revision ID: 8b2d4f6a1c3e
+Revises: 3c9a1f52d7e4
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8b2d4f6a1c3e"
+down_revision: str | Sequence[str] | None = "3c9a1f52d7e4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("image_comparisons", sa.Column("images_updated_at", sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("image_comparisons", "images_updated_at")
@@ -0,0 +1,83 @@
+"""Moved images of users from users.image_ids into the images table
+
+Revision ID: 6d1e8b4f2a7c
+Revises: 8b2d4f6a1c3e
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6d1e8b4f2a7c"
+down_revision: str | Sequence[str] | None = "8b2d4f6a1c3e"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "images",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("owner_id", sa.UUID(), nullable=False),
+        sa.Column("filename", sa.String(length=255), nullable=True),
+        sa.Column("blob_hash", sa.String(length=64), nullable=True),
+        sa.Column("width", sa.Integer(), nullable=True),
+        sa.Column("height", sa.Integer(), nullable=True),
+        sa.Column("content_type", sa.String(length=100), nullable=True),
+        sa.Column("size", sa.BigInteger(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["owner_id"],
+            ["users.id"],
+            name=op.f("fk_images_owner_id_users"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_images")),
+    )
+    op.create_index(op.f("ix_images_blob_hash"), "images", ["blob_hash"], unique=False)
+    op.create_index("ix_images_owner_id_created_at_id", "images", ["owner_id", "created_at", "id"], unique=False)
+
+    # the array kept images in the order they were added, a microsecond per position keeps it for the listing,
+    # properties of already stored images are filled in when the images are processed next time
+    op.execute(
+        """
+        INSERT INTO images (id, owner_id, created_at, updated_at)
+        SELECT owned.image_id, users.id, owned.added_at, owned.added_at
+        FROM users
+        CROSS JOIN LATERAL (
+            SELECT image_id, users.created_at + position * interval '1 microsecond' AS added_at
+            FROM unnest(users.image_ids) WITH ORDINALITY AS image (image_id, position)
+        ) AS owned
+        ON CONFLICT (id) DO NOTHING
+        """
+    )
+    op.drop_column("users", "image_ids")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column(
+        "users",
+        sa.Column("image_ids", sa.ARRAY(sa.UUID()), server_default="{}", nullable=False),
+    )
+    op.execute(
+        """
+        UPDATE users
+        SET image_ids = owned.image_ids
+        FROM (
+            SELECT owner_id, array_agg(id ORDER BY created_at, id) AS image_ids
+            FROM images
+            GROUP BY owner_id
+        ) AS owned
+        WHERE users.id = owned.owner_id
+        """
+    )
+    op.drop_index("ix_images_owner_id_created_at_id", table_name="images")
+    op.drop_index(op.f("ix_images_blob_hash"), table_name="images")
+    op.drop_table("images")
@@ -14,6 +14,7 @@ image_comparisons_table: sa.Table = sa.Table(
     sa.Column("different_names", sa.Boolean, nullable=False),
     sa.Column("different_width", sa.Boolean, nullable=False),
     sa.Column("different_height", sa.Boolean, nullable=False),
+    sa.Column("images_updated_at", sa.DateTime(timezone=True), nullable=True),
     sa.Column(
         "created_at",
         sa.DateTime(timezone=True),
@@ -50,6 +51,7 @@ def map_image_comparisons_table() -> None:
             "different_names": image_comparisons_table.c.different_names,
             "different_width": image_comparisons_table.c.different_width,
             "different_height": image_comparisons_table.c.different_height,
+            "images_updated_at": image_comparisons_table.c.images_updated_at,
             "created_at": image_comparisons_table.c.created_at,
             "updated_at": image_comparisons_table.c.updated_at,
         },
@@ -0,0 +1,57 @@
+from typing import Final
+
+import sqlalchemy as sa
+
+from pix_erase.infrastructure.persistence.models.base import mapper_registry
+
+UINT64_SIGN_BIT: Final[int] = 1 << 63
+UINT64_MODULUS: Final[int] = 1 << 64
+
+# every change of a row takes the next revision, so an in-memory index reads only rows changed since its last read
+image_hash_revisions: Final[sa.Sequence] = sa.Sequence(
+    "image_perceptual_hashes_revision_seq",
+    metadata=mapper_registry.metadata,
+)
+
+image_perceptual_hashes_table: sa.Table = sa.Table(
+    "image_perceptual_hashes",
+    mapper_registry.metadata,
+    sa.Column("image_id", sa.UUID(as_uuid=True), primary_key=True),
+    sa.Column("phash", sa.BigInteger, nullable=False),
+    sa.Column("dhash", sa.BigInteger, nullable=False),
+    sa.Column("ahash", sa.BigInteger, nullable=False),
+    # a deleted image stays as a tombstone, indexes of other processes learn about the deletion from it
+    sa.Column("deleted", sa.Boolean, nullable=False, default=False, server_default=sa.false()),
+    sa.Column(
+        "revision",
+        sa.BigInteger,
+        image_hash_revisions,
+        server_default=image_hash_revisions.next_value(),
+        nullable=False,
+        index=True,
+    ),
+    sa.Column(
+        "created_at",
+        sa.DateTime(timezone=True),
+        default=sa.func.now(),
+        server_default=sa.func.now(),
+        nullable=False,
+    ),
+    sa.Column(
+        "updated_at",
+        sa.DateTime(timezone=True),
+        default=sa.func.now(),
+        server_default=sa.func.now(),
+        onupdate=sa.func.now(),
+        nullable=True,
+    ),
+)
+
+
+def to_bigint(value: int) -> int:
+    """Hashes are unsigned 64-bit numbers, Postgres keeps them in signed BIGINT with the same bits."""
+    return value - UINT64_MODULUS if value >= UINT64_SIGN_BIT else value
+
+
+def from_bigint(value: int) -> int:
+    return value + UINT64_MODULUS if value < 0 else value
@@ -0,0 +1,34 @@
+import sqlalchemy as sa
+
+from pix_erase.infrastructure.persistence.models.base import mapper_registry
+
+images_table: sa.Table = sa.Table(
+    "images",
+    mapper_registry.metadata,
+    sa.Column("id", sa.UUID(as_uuid=True), primary_key=True),
+    sa.Column("owner_id", sa.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+    # properties of the stored image stay empty until the image is stored, uploads are stored in background
+    sa.Column("filename", sa.String(255), nullable=True),
+    sa.Column("blob_hash", sa.String(64), nullable=True, index=True),
+    sa.Column("width", sa.Integer, nullable=True),
+    sa.Column("height", sa.Integer, nullable=True),
+    sa.Column("content_type", sa.String(100), nullable=True),
+    sa.Column("size", sa.BigInteger, nullable=True),
+    sa.Column(
+        "created_at",
+        sa.DateTime(timezone=True),
+        default=sa.func.now(),
+        server_default=sa.func.now(),
+        nullable=False,
+    ),
+    sa.Column(
+        "updated_at",
+        sa.DateTime(timezone=True),
+        default=sa.func.now(),
+        server_default=sa.func.now(),
+        onupdate=sa.func.now(),
+        nullable=False,
+    ),
+    # images of an owner newest first, the order of the keyset pagination
+    sa.Index("ix_images_owner_id_created_at_id", "owner_id", "created_at", "id"),
+)
@@ -17,13 +17,6 @@ users_table: sa.Table = sa.Table(
     sa.Column("hashed_password", sa.LargeBinary(), nullable=False),
     sa.Column("role", sa.Enum(UserRole), nullable=False),
     sa.Column("is_active", sa.Boolean, nullable=False),
-    sa.Column(
-        "image_ids",  # Новое поле - массив UUID
-        sa.ARRAY(sa.UUID(as_uuid=True)),
-        nullable=False,
-        default=[],
-        server_default="{}",
-    ),
     sa.Column(
         "created_at",
         sa.DateTime(timezone=True),
@@ -53,7 +46,6 @@ def map_users_table() -> None:
             "hashed_password": composite(HashedPassword, users_table.c.hashed_password),
             "role": users_table.c.role,
             "is_active": users_table.c.is_active,
-            "images": users_table.c.image_ids,
             "created_at": users_table.c.created_at,
             "updated_at": users_table.c.updated_at,
         },
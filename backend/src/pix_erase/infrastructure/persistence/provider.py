@@ -4,6 +4,7 @@ from typing import Final
 
 from aioboto3 import Session
 from aiobotocore.client import AioBaseClient
+from aiobotocore.config import AioConfig
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -126,5 +127,31 @@ async def get_s3_session(s3_config: S3Config) -> AsyncIterator[Session]:
 
 
 async def get_s3_client(session: Session, s3_config: S3Config) -> AsyncIterator[AioBaseClient]:
-    async with session.client("s3", endpoint_url=s3_config.uri, use_ssl=False) as s3:
+    """Creates the S3 client shared by every request and task of the process.
+
+    Args:
+        session: aioboto3 session holding the credentials
+        s3_config: S3 configuration
+
+    Yields:
+        AioBaseClient: S3 client with its own pool of connections
+
+    Note:
+        - Connections are reused between requests, a request doesn't pay for a new connection
+        - The pool holds ``max_pool_connections`` connections, requests above it wait for a free one
+        - Failed requests are retried by botocore according to ``retry_mode`` and ``max_attempts``
+        - The pool is closed when the application stops
+    """
+    config: AioConfig = AioConfig(
+        max_pool_connections=s3_config.max_pool_connections,
+        connect_timeout=s3_config.connect_timeout_seconds,
+        read_timeout=s3_config.read_timeout_seconds,
+        retries={"total_max_attempts": s3_config.max_attempts, "mode": s3_config.retry_mode},
+        connector_args={"keepalive_timeout": s3_config.keepalive_timeout_seconds},
+    )
+
+    async with session.client("s3", endpoint_url=s3_config.uri, use_ssl=False, config=config) as s3:
+        logger.debug("S3 client created with pool of %s connections", s3_config.max_pool_connections)
         yield s3
+        logger.debug("Closing S3 client.")
+    logger.debug("S3 client closed.")
@@ -0,0 +1,115 @@
+import logging
+import os
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Final
+
+import cv2
+
+from pix_erase.setup.config.image_processing import ImageProcessingConfig
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+NATIVE_THREADS_ENV_VARIABLES: Final[tuple[str, ...]] = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+)
+
+
+def _configure_process(threads_per_process: int, initializers: Sequence[Callable[[], object]]) -> None:
+    """
+    Limits native thread pools of the pool process and runs extra initializers (e.g. model preloading).
+
+    OpenCV uses its own pool, ONNX Runtime sessions created by rembg read ``OMP_NUM_THREADS``.
+    Without the limit every process spawns a thread per core and the CPU is oversubscribed.
+    """
+    for variable in NATIVE_THREADS_ENV_VARIABLES:
+        os.environ[variable] = str(threads_per_process)
+
+    cv2.setNumThreads(threads_per_process)
+
+    for initializer in initializers:
+        initializer()
+
+
+def _call_with_shared_buffers[ResultT](
+    func: Callable[..., ResultT],
+    shared_kwargs: Mapping[str, tuple[str, int]],
+    kwargs: dict[str, Any],
+) -> ResultT:
+    segments: list[SharedMemory] = []
+
+    try:
+        for argument, (segment_name, size) in shared_kwargs.items():
+            segment: SharedMemory = SharedMemory(name=segment_name)
+            segments.append(segment)
+            kwargs[argument] = bytes(segment.buf[:size])
+
+        return func(**kwargs)
+    finally:
+        for segment in segments:
+            segment.close()
+
+
+class ImageProcessPool:
+    """
+    Process pool for CPU-bound image converters.
+
+    Image bytes are passed to the processes through shared memory instead of being pickled and written
+    through the pool pipe, which keeps large images out of the pipe but still costs two copies: into the
+    segment in the caller and out of it in the pool process, converters take ``bytes`` and the segment is
+    closed when the call returns. Other arguments and the result are pickled as usual.
+    """
+
+    def __init__(
+        self,
+        config: ImageProcessingConfig,
+        initializers: Sequence[Callable[[], object]] = (),
+    ) -> None:
+        self._executor: Final[ProcessPoolExecutor] = ProcessPoolExecutor(
+            max_workers=config.workers,
+            mp_context=get_context("spawn"),
+            initializer=_configure_process,
+            initargs=(config.threads_per_process, tuple(initializers)),
+            max_tasks_per_child=config.max_tasks_per_child,
+        )
+        logger.info(
+            "Image process pool created with %s processes, %s threads per process",
+            config.workers,
+            config.threads_per_process,
+        )
+
+    def call[ResultT](self, func: Callable[..., ResultT], /, **kwargs: Any) -> ResultT:  # noqa: ANN401
+        """Runs ``func`` in the pool and blocks the calling thread until it's done."""
+        segments: list[SharedMemory] = []
+        shared_kwargs: dict[str, tuple[str, int]] = {}
+
+        try:
+            for argument, value in tuple(kwargs.items()):
+                if not isinstance(value, bytes) or not value:
+                    continue
+
+                segment: SharedMemory = SharedMemory(create=True, size=len(value))
+                segments.append(segment)
+                segment.buf[: len(value)] = value
+                shared_kwargs[argument] = (segment.name, len(value))
+                del kwargs[argument]
+
+            future: Future[ResultT] = self._executor.submit(
+                _call_with_shared_buffers,
+                func,
+                shared_kwargs,
+                kwargs,
+            )
+            return future.result()
+        finally:
+            for segment in segments:
+                segment.close()
+                segment.unlink()
+
+    def shutdown(self) -> None:
+        logger.info("Shutting down image process pool")
+        self._executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,49 @@
+from collections.abc import Callable, Iterator
+from functools import partial
+
+from pix_erase.infrastructure.adapters.image_converters.rembg_session_pool import (
+    collect_rembg_timings,
+    preload_rembg_sessions,
+)
+from pix_erase.infrastructure.adapters.image_converters.super_resolution_registry import (
+    preload_super_resolution_models,
+)
+from pix_erase.infrastructure.processing.process_pool import ImageProcessPool
+from pix_erase.setup.config.background_removal import BackgroundRemovalConfig
+from pix_erase.setup.config.image_processing import ImageProcessingConfig
+from pix_erase.setup.config.super_resolution import SuperResolutionConfig
+
+
+def get_image_process_pool(
+    image_processing_config: ImageProcessingConfig,
+    super_resolution_config: SuperResolutionConfig,
+    background_removal_config: BackgroundRemovalConfig,
+) -> Iterator[ImageProcessPool]:
+    # metrics of pool processes aren't scraped, their rembg timings are observed by the parent
+    initializers: list[Callable[[], object]] = [collect_rembg_timings]
+
+    if super_resolution_config.preload_scales:
+        initializers.append(
+            partial(
+                preload_super_resolution_models,
+                scales=super_resolution_config.preload_scales,
+                models_path=super_resolution_config.models_path,
+                warm_up=super_resolution_config.warm_up,
+            )
+        )
+
+    if background_removal_config.preload_models:
+        initializers.append(
+            partial(
+                preload_rembg_sessions,
+                models=background_removal_config.preload_models,
+                intra_op_threads=background_removal_config.intra_op_threads,
+                inter_op_threads=background_removal_config.inter_op_threads,
+            )
+        )
+
+    pool: ImageProcessPool = ImageProcessPool(config=image_processing_config, initializers=initializers)
+    try:
+        yield pool
+    finally:
+        pool.shutdown()
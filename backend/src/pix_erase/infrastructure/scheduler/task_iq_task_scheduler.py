@@ -1,19 +1,53 @@
+import asyncio
+import json
 import logging
-from typing import TYPE_CHECKING, Any, Final, override
+from collections.abc import Mapping
+from typing import Any, Final, override
+from uuid import UUID
 
 from redis.asyncio import Redis
-from taskiq import AsyncBroker, ScheduleSource
+from taskiq import AsyncBroker, AsyncTaskiqDecoratedTask, ScheduleSource
 from taskiq.depends.progress_tracker import TaskProgress, TaskState
 
 from pix_erase.application.common.ports.scheduler.payloads.base import TaskPayload
-from pix_erase.application.common.ports.scheduler.task_id import TaskID, TaskInfo, TaskInfoStatus, TaskKey
+from pix_erase.application.common.ports.scheduler.task_id import (
+    TaskBatchID,
+    TaskBatchInfo,
+    TaskID,
+    TaskInfo,
+    TaskInfoStatus,
+    TaskKey,
+)
 from pix_erase.application.common.ports.scheduler.task_scheduler import TaskScheduler
-
-if TYPE_CHECKING:
-    from collections.abc import Mapping
+from pix_erase.domain.user.values.user_id import UserID
 
 logger: Final[logging.Logger] = logging.getLogger(__name__)
 
+# a batch outlives results of its tasks, they expire in ``result_ex_time`` of the result backend
+BATCH_TTL_SECONDS: Final[int] = 86_400
+FINISHED_STATUSES: Final[frozenset[TaskInfoStatus]] = frozenset({TaskInfoStatus.SUCCESS, TaskInfoStatus.FAILURE})
+
+
+def _batch_key(batch_id: TaskBatchID) -> str:
+    return f"task_batch:{batch_id}"
+
+
+def _batch_finished_key(batch_id: TaskBatchID) -> str:
+    return f"task_batch:{batch_id}:finished"
+
+
+def _batch_owner_key(batch_id: TaskBatchID) -> str:
+    return f"task_batch:{batch_id}:owner"
+
+
+def _encode_finished(info: TaskInfo) -> str:
+    return json.dumps([info.status, info.description])
+
+
+def _decode_finished(task_id: TaskID, data: bytes) -> TaskInfo:
+    status, description = json.loads(data)
+    return TaskInfo(task_id=task_id, status=TaskInfoStatus(status), description=description)
+
 
 class TaskIQTaskScheduler(TaskScheduler):
     def __init__(self, broker: AsyncBroker, schedule_source: ScheduleSource, redis: Redis) -> None:
@@ -27,17 +61,80 @@ class TaskIQTaskScheduler(TaskScheduler):
         task_id: TaskID,
         payload: TaskPayload,
     ) -> None:
-        task_name = task_id.split(":")[0]
+        await self._task_for(task_id).kicker().with_task_id(task_id).kiq(payload)
+        logger.info("Schedule task at %s", task_id)
 
-        logger.info("All tasks: %s", self._broker.get_all_tasks())
+    @override
+    async def schedule_batch(
+        self,
+        batch_id: TaskBatchID,
+        payloads: Mapping[TaskID, TaskPayload],
+        owner_id: UserID,
+    ) -> None:
+        tasks: dict[TaskID, AsyncTaskiqDecoratedTask[Any, Any]] = {
+            task_id: self._task_for(task_id) for task_id in payloads
+        }
 
-        if task := self._broker.get_all_tasks().get(task_name):
-            await task.kicker().with_task_id(task_id).kiq(payload)
-            logger.info("Schedule task at %s", task_id)
-            return
+        # members are saved first, so a batch is readable even before its tasks are sent
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.delete(_batch_key(batch_id), _batch_finished_key(batch_id), _batch_owner_key(batch_id))
+            pipe.rpush(_batch_key(batch_id), *payloads)
+            pipe.expire(_batch_key(batch_id), BATCH_TTL_SECONDS)
+            pipe.set(_batch_owner_key(batch_id), owner_id.bytes, ex=BATCH_TTL_SECONDS)
+            await pipe.execute()
 
-        msg = f"No task registered for {task_name}"
-        raise ValueError(msg)
+        await asyncio.gather(
+            *(task.kicker().with_task_id(task_id).kiq(payloads[task_id]) for task_id, task in tasks.items())
+        )
+
+        logger.info("Scheduled batch %s of %s tasks", batch_id, len(payloads))
+
+    @override
+    async def read_batch_info(self, batch_id: TaskBatchID) -> TaskBatchInfo | None:
+        members: list[bytes] = await self._redis.lrange(_batch_key(batch_id), 0, -1)  # type: ignore[misc]
+
+        owner: bytes | None = await self._redis.get(_batch_owner_key(batch_id))
+
+        # a batch without its owner can't be checked, it's treated as expired
+        if not members or owner is None:
+            return None
+
+        task_ids: list[TaskID] = [TaskID(task_id.decode()) for task_id in members]
+        stored: dict[bytes, bytes] = await self._redis.hgetall(_batch_finished_key(batch_id))  # type: ignore[misc]
+        finished: dict[TaskID, TaskInfo] = {
+            TaskID(task_id.decode()): _decode_finished(TaskID(task_id.decode()), info)
+            for task_id, info in stored.items()
+        }
+        unfinished: list[TaskID] = [task_id for task_id in task_ids if task_id not in finished]
+
+        # progress of a task expires with its result, finished tasks are kept with the batch instead
+        read: list[TaskInfo | None] = await asyncio.gather(*(self.read_task_info(task_id) for task_id in unfinished))
+        newly_finished: dict[TaskID, TaskInfo] = {}
+
+        for task_id, info in zip(unfinished, read, strict=True):
+            if info is not None and info.status in FINISHED_STATUSES:
+                newly_finished[task_id] = info
+
+            finished[task_id] = info or TaskInfo(
+                task_id=task_id,
+                status=TaskInfoStatus.QUEUED,
+                description="Waiting for a worker",
+            )
+
+        if newly_finished:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.hset(
+                    _batch_finished_key(batch_id),
+                    mapping={task_id: _encode_finished(info) for task_id, info in newly_finished.items()},
+                )
+                pipe.expire(_batch_finished_key(batch_id), BATCH_TTL_SECONDS)
+                await pipe.execute()
+
+        return TaskBatchInfo(
+            batch_id=batch_id,
+            owner_id=UserID(UUID(bytes=owner)),
+            tasks=[finished[task_id] for task_id in task_ids],
+        )
 
     @override
     async def read_task_info(self, task_id: TaskID) -> TaskInfo | None:
@@ -66,3 +163,12 @@ class TaskIQTaskScheduler(TaskScheduler):
     @override
     def make_task_id(self, key: TaskKey, value: Any) -> TaskID:
         return TaskID(f"{key}:{value}")
+
+    def _task_for(self, task_id: TaskID) -> AsyncTaskiqDecoratedTask[Any, Any]:
+        task_name = task_id.split(":")[0]
+
+        if task := self._broker.get_all_tasks().get(task_name):
+            return task
+
+        msg = f"No task registered for {task_name}"
+        raise ValueError(msg)
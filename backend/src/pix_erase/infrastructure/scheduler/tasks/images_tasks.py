@@ -1,6 +1,9 @@
+import asyncio
 import logging
-import uuid
-from typing import TYPE_CHECKING, Annotated, Final
+from collections.abc import Awaitable, Callable, Mapping
+from datetime import UTC, datetime
+from functools import partial
+from typing import TYPE_CHECKING, Annotated, Any, Final
 
 from dishka import FromDishka
 from dishka.integrations.taskiq import inject
@@ -8,20 +11,45 @@ from taskiq import AsyncBroker, Context, TaskiqDepends
 from taskiq.depends.progress_tracker import ProgressTracker, TaskState
 
 from pix_erase.application.common.ports.image.comparison_gateway import ImageComparisonGateway
+from pix_erase.application.common.ports.image.rendition_storage import ImageRenditionStorage
 from pix_erase.application.common.ports.image.storage import ImageStorage
+from pix_erase.application.common.ports.transaction_manager import TransactionManager
+from pix_erase.application.common.services.image_batch_comparison import ImageBatchComparisonService
+from pix_erase.application.common.services.image_catalog import ImageCatalogService
+from pix_erase.application.common.services.image_search_index import ImageSearchIndexService
+from pix_erase.application.errors.image import ImageNotFoundError
 from pix_erase.domain.image.entities.image_comparison import ImageComparison
+from pix_erase.domain.image.ports.image_pipeline_converter import (
+    CompressImageOperation,
+    GrayscaleImageOperation,
+    ImageOperation,
+    RemoveBackgroundImageOperation,
+    RemoveWatermarkImageOperation,
+    RotateImageOperation,
+    UpscaleImageOperation,
+)
 from pix_erase.domain.image.services.colorization_service import ImageColorizationService
 from pix_erase.domain.image.services.image_service import ImageService
+from pix_erase.domain.image.services.pipeline_service import ImagePipelineService
 from pix_erase.domain.image.services.transformation_service import ImageTransformationService
-from pix_erase.domain.image.values.comparison_id import ComparisonID
+from pix_erase.domain.image.values.comparison_id import ComparisonID, comparison_id_for
+from pix_erase.domain.image.values.image_name import ImageName
+from pix_erase.infrastructure.cache.derived_image_cache import DerivedImage, DerivedImageCache, DerivedImageKey
 from pix_erase.infrastructure.scheduler.tasks.schemas import (
+    CompareImagesBatchSchemaRequestTask,
     CompareImagesSchemaRequestTask,
     CompressImageSchemaRequestTask,
+    GenerateImageRenditionsSchemaRequestTask,
     GrayscaleImageSchemaRequestTask,
+    ImagePipelineStepSchemaRequestTask,
+    IndexImageSchemaRequestTask,
+    ProcessImagePipelineSchemaRequestTask,
     RemoveBackgroundImageSchemaRequestTask,
     RotateImageSchemaRequestTask,
+    StoreUploadedImageSchemaRequestTask,
     UpscaleImageSchemaRequestTask,
 )
+from pix_erase.setup.config.background_removal import BackgroundRemovalConfig
 
 if TYPE_CHECKING:
     from pix_erase.domain.image.entities.image import Image
@@ -29,11 +57,198 @@ if TYPE_CHECKING:
 logger: Final[logging.Logger] = logging.getLogger(__name__)
 
 
+async def _transform_with_cache(
+    image: "Image",
+    derived_image_cache: DerivedImageCache,
+    operation: str,
+    params: Mapping[str, Any],
+    transform: Callable[[], None],
+) -> None:
+    """Takes the result of the same transformation of the same bytes from the cache, otherwise runs ``transform``."""
+    key: DerivedImageKey = await asyncio.to_thread(DerivedImageKey.for_source, image.data, operation, params)
+    cached_image: DerivedImage | None = await derived_image_cache.get(key)
+
+    if cached_image is not None:
+        image.data = cached_image.data
+        image.width = cached_image.width
+        image.height = cached_image.height
+        image.updated_at = datetime.now(UTC)
+        return
+
+    await asyncio.to_thread(transform)
+    await derived_image_cache.set(key, DerivedImage(data=image.data, width=image.width, height=image.height))
+
+
+async def _best_effort(operation: Awaitable[object], failure_message: str, image: "Image") -> None:
+    """Runs a follow-up of an already stored image, its failure is logged with ``failure_message`` and swallowed."""
+    try:
+        await operation
+    except Exception:
+        logger.exception(failure_message, image.id)
+
+
+async def _add_renditions(image: "Image", image_rendition_storage: ImageRenditionStorage) -> None:
+    """
+    Renditions of the new content of an updated image, the old ones aren't served for it anymore.
+
+    The task isn't retried for previews, reads get the original until renditions are generated.
+    """
+    await _best_effort(image_rendition_storage.add(image), "Failed to generate renditions of image %s", image)
+
+
+async def _index_for_search(image: "Image", image_search_index: ImageSearchIndexService) -> None:
+    """
+    Hashes of the new content of an image for reverse search.
+
+    Indexing is best-effort: until it succeeds the image is only missing from search results,
+    and it's indexed again on the next update of the image.
+    """
+    await _best_effort(image_search_index.index(image), "Failed to index image %s for reverse image search", image)
+
+
+async def _refresh_catalog(image: "Image", image_catalog: ImageCatalogService) -> None:
+    """
+    Properties of the new content of an image for listings.
+
+    A stale catalogue row only shows old dimensions and size in listings, the image itself is read
+    from the storage, so the task isn't failed for it and the row is refreshed on the next update.
+    """
+    await _best_effort(image_catalog.refresh(image.id), "Failed to refresh catalogue entry of image %s", image)
+
+
+@inject(patch_module=True)
+async def generate_image_renditions_task(
+    request_schema: GenerateImageRenditionsSchemaRequestTask,
+    file_storage: FromDishka[ImageStorage],
+    image_rendition_storage: FromDishka[ImageRenditionStorage],
+    context: Annotated[Context, TaskiqDepends()],
+    progress_tracker: Annotated[ProgressTracker, TaskiqDepends()],
+) -> None:
+    await progress_tracker.set_progress(
+        state=TaskState.STARTED, meta=f"Started generating renditions of image with id {request_schema.image_id}"
+    )
+
+    logger.info(
+        "Running task: %s with id: %s",
+        context.message.task_name,
+        context.message.task_id,
+    )
+
+    image: Image | None = await file_storage.read_by_id(image_id=request_schema.image_id)
+
+    if image is None:
+        msg = f"image with id: {request_schema.image_id} not found"
+        logger.error(msg)
+
+        await progress_tracker.set_progress(state=TaskState.FAILURE, meta=msg)
+
+        context.reject()
+
+    await image_rendition_storage.add(image)  # type: ignore[arg-type]
+
+    logger.info(
+        "Finished task: %s with id: %s",
+        context.message.task_name,
+        context.message.task_id,
+    )
+
+    await progress_tracker.set_progress(state=TaskState.SUCCESS)
+
+
+@inject(patch_module=True)
+async def index_image_task(
+    request_schema: IndexImageSchemaRequestTask,
+    file_storage: FromDishka[ImageStorage],
+    image_search_index: FromDishka[ImageSearchIndexService],
+    context: Annotated[Context, TaskiqDepends()],
+    progress_tracker: Annotated[ProgressTracker, TaskiqDepends()],
+) -> None:
+    await progress_tracker.set_progress(
+        state=TaskState.STARTED, meta=f"Started indexing image with id {request_schema.image_id} for search"
+    )
+
+    logger.info(
+        "Running task: %s with id: %s",
+        context.message.task_name,
+        context.message.task_id,
+    )
+
+    image: Image | None = await file_storage.read_by_id(image_id=request_schema.image_id)
+
+    if image is None:
+        msg = f"image with id: {request_schema.image_id} not found"
+        logger.error(msg)
+
+        await progress_tracker.set_progress(state=TaskState.FAILURE, meta=msg)
+
+        context.reject()
+        return
+
+    await image_search_index.index(image)
+
+    logger.info(
+        "Finished task: %s with id: %s",
+        context.message.task_name,
+        context.message.task_id,
+    )
+
+    await progress_tracker.set_progress(state=TaskState.SUCCESS)
+
+
+@inject(patch_module=True)
+async def store_uploaded_image_task(
+    request_schema: StoreUploadedImageSchemaRequestTask,
+    file_storage: FromDishka[ImageStorage],
+    image_rendition_storage: FromDishka[ImageRenditionStorage],
+    image_search_index: FromDishka[ImageSearchIndexService],
+    image_catalog: FromDishka[ImageCatalogService],
+    context: Annotated[Context, TaskiqDepends()],
+    progress_tracker: Annotated[ProgressTracker, TaskiqDepends()],
+) -> None:
+    await progress_tracker.set_progress(
+        state=TaskState.STARTED, meta=f"Started storing uploaded image with id {request_schema.image_id}"
+    )
+
+    logger.info(
+        "Running task: %s with id: %s",
+        context.message.task_name,
+        context.message.task_id,
+    )
+
+    await file_storage.add_uploaded(image_id=request_schema.image_id, name=ImageName(request_schema.filename))
+    image: Image | None = await file_storage.read_by_id(image_id=request_schema.image_id)
+
+    if image is None:
+        msg = f"image with id: {request_schema.image_id} not found"
+        logger.error(msg)
+
+        await progress_tracker.set_progress(state=TaskState.FAILURE, meta=msg)
+
+        context.reject()
+        return
+
+    await _refresh_catalog(image, image_catalog)
+    await _add_renditions(image, image_rendition_storage)
+    await _index_for_search(image, image_search_index)
+
+    logger.info(
+        "Finished task: %s with id: %s",
+        context.message.task_name,
+        context.message.task_id,
+    )
+
+    await progress_tracker.set_progress(state=TaskState.SUCCESS)
+
+
 @inject(patch_module=True)
 async def convert_to_grayscale_task(
     request_schema: GrayscaleImageSchemaRequestTask,
     colorization_service: FromDishka[ImageColorizationService],
     file_storage: FromDishka[ImageStorage],
+    image_rendition_storage: FromDishka[ImageRenditionStorage],
+    image_search_index: FromDishka[ImageSearchIndexService],
+    image_catalog: FromDishka[ImageCatalogService],
+    derived_image_cache: FromDishka[DerivedImageCache],
     context: Annotated[Context, TaskiqDepends()],
     progress_tracker: Annotated[ProgressTracker, TaskiqDepends()],
 ) -> None:
@@ -57,8 +272,21 @@ async def convert_to_grayscale_task(
 
         context.reject()
 
-    colorization_service.convert_color_to_gray(image=image)  # type: ignore[arg-type]
+    await _transform_with_cache(
+        image,  # type: ignore[arg-type]
+        derived_image_cache,
+        operation="grayscale",
+        params={"encoding": request_schema.encoding},
+        transform=partial(
+            colorization_service.convert_color_to_gray,
+            image=image,  # type: ignore[arg-type]
+            encoding=request_schema.encoding,
+        ),
+    )
     await file_storage.update(image=image)  # type: ignore[arg-type]
+    await _refresh_catalog(image, image_catalog)  # type: ignore[arg-type]
+    await _add_renditions(image, image_rendition_storage)  # type: ignore[arg-type]
+    await _index_for_search(image, image_search_index)  # type: ignore[arg-type]
 
     logger.info(
         "Finished task: %s with id: %s",
@@ -73,7 +301,11 @@ async def convert_to_grayscale_task(
 async def rotate_image_task(
     request_schema: RotateImageSchemaRequestTask,
     file_storage: FromDishka[ImageStorage],
+    image_rendition_storage: FromDishka[ImageRenditionStorage],
+    image_search_index: FromDishka[ImageSearchIndexService],
+    image_catalog: FromDishka[ImageCatalogService],
     image_transformation_service: FromDishka[ImageTransformationService],
+    derived_image_cache: FromDishka[DerivedImageCache],
     context: Annotated[Context, TaskiqDepends()],
     progress_tracker: Annotated[ProgressTracker, TaskiqDepends()],
 ) -> None:
@@ -97,12 +329,23 @@ async def rotate_image_task(
 
         context.reject()
 
-    image_transformation_service.rotate_image(
-        image=image,  # type: ignore[arg-type]
-        angle=request_schema.angle,
+    await _transform_with_cache(
+        image,  # type: ignore[arg-type]
+        derived_image_cache,
+        operation="rotate",
+        params={"angle": request_schema.angle, "encoding": request_schema.encoding},
+        transform=partial(
+            image_transformation_service.rotate_image,
+            image=image,  # type: ignore[arg-type]
+            angle=request_schema.angle,
+            encoding=request_schema.encoding,
+        ),
     )
 
     await file_storage.update(image=image)  # type: ignore[arg-type]
+    await _refresh_catalog(image, image_catalog)  # type: ignore[arg-type]
+    await _add_renditions(image, image_rendition_storage)  # type: ignore[arg-type]
+    await _index_for_search(image, image_search_index)  # type: ignore[arg-type]
 
     await progress_tracker.set_progress(
         state=TaskState.SUCCESS, meta=f"Converted image to grayscale with id {request_schema.image_id}"
@@ -119,6 +362,10 @@ async def compress_image_task(
     request_schema: CompressImageSchemaRequestTask,
     image_transformation_service: FromDishka[ImageTransformationService],
     file_storage: FromDishka[ImageStorage],
+    image_rendition_storage: FromDishka[ImageRenditionStorage],
+    image_search_index: FromDishka[ImageSearchIndexService],
+    image_catalog: FromDishka[ImageCatalogService],
+    derived_image_cache: FromDishka[DerivedImageCache],
     context: Annotated[Context, TaskiqDepends()],
     progress_tracker: Annotated[ProgressTracker, TaskiqDepends()],
 ) -> None:
@@ -142,12 +389,23 @@ async def compress_image_task(
 
         context.reject()
 
-    image_transformation_service.compress_image(
-        image=image,  # type: ignore[arg-type]
-        quality=request_schema.quality,
+    await _transform_with_cache(
+        image,  # type: ignore[arg-type]
+        derived_image_cache,
+        operation="compress",
+        params={"quality": request_schema.quality, "encoding": request_schema.encoding},
+        transform=partial(
+            image_transformation_service.compress_image,
+            image=image,  # type: ignore[arg-type]
+            quality=request_schema.quality,
+            encoding=request_schema.encoding,
+        ),
     )
 
     await file_storage.update(image=image)  # type: ignore[arg-type]
+    await _refresh_catalog(image, image_catalog)  # type: ignore[arg-type]
+    await _add_renditions(image, image_rendition_storage)  # type: ignore[arg-type]
+    await _index_for_search(image, image_search_index)  # type: ignore[arg-type]
 
     await progress_tracker.set_progress(
         state=TaskState.SUCCESS, meta=f"Compressed image with id {request_schema.image_id}"
@@ -165,6 +423,10 @@ async def upscale_image_task(
     request_schema: UpscaleImageSchemaRequestTask,
     image_colorization_service: FromDishka[ImageColorizationService],
     file_storage: FromDishka[ImageStorage],
+    image_rendition_storage: FromDishka[ImageRenditionStorage],
+    image_search_index: FromDishka[ImageSearchIndexService],
+    image_catalog: FromDishka[ImageCatalogService],
+    derived_image_cache: FromDishka[DerivedImageCache],
     context: Annotated[Context, TaskiqDepends()],
     progress_tracker: Annotated[ProgressTracker, TaskiqDepends()],
 ) -> None:
@@ -188,13 +450,28 @@ async def upscale_image_task(
 
         context.reject()
 
-    image_colorization_service.upscale(
-        image=image,  # type: ignore[arg-type]
-        algorithm=request_schema.algorithm,
-        scale=request_schema.scale,
+    await _transform_with_cache(
+        image,  # type: ignore[arg-type]
+        derived_image_cache,
+        operation="upscale",
+        params={
+            "algorithm": request_schema.algorithm,
+            "scale": request_schema.scale,
+            "encoding": request_schema.encoding,
+        },
+        transform=partial(
+            image_colorization_service.upscale,
+            image=image,  # type: ignore[arg-type]
+            algorithm=request_schema.algorithm,
+            scale=request_schema.scale,
+            encoding=request_schema.encoding,
+        ),
     )
 
     await file_storage.update(image=image)  # type: ignore[arg-type]
+    await _refresh_catalog(image, image_catalog)  # type: ignore[arg-type]
+    await _add_renditions(image, image_rendition_storage)  # type: ignore[arg-type]
+    await _index_for_search(image, image_search_index)  # type: ignore[arg-type]
 
     await progress_tracker.set_progress(
         state=TaskState.SUCCESS, meta=f"Successfully upscaled image with id: {request_schema.image_id}"
@@ -212,6 +489,11 @@ async def remove_background_task(
     request_schema: RemoveBackgroundImageSchemaRequestTask,
     colorization_service: FromDishka[ImageColorizationService],
     file_storage: FromDishka[ImageStorage],
+    image_rendition_storage: FromDishka[ImageRenditionStorage],
+    image_search_index: FromDishka[ImageSearchIndexService],
+    image_catalog: FromDishka[ImageCatalogService],
+    derived_image_cache: FromDishka[DerivedImageCache],
+    background_removal_config: FromDishka[BackgroundRemovalConfig],
     context: Annotated[Context, TaskiqDepends()],
     progress_tracker: Annotated[ProgressTracker, TaskiqDepends()],
 ) -> None:
@@ -231,8 +513,25 @@ async def remove_background_task(
 
         context.reject()
 
-    colorization_service.remove_background(image=image)  # type: ignore[arg-type]
+    await _transform_with_cache(
+        image,  # type: ignore[arg-type]
+        derived_image_cache,
+        operation="remove_background",
+        params={
+            "model": request_schema.model or background_removal_config.default_model,
+            "encoding": request_schema.encoding,
+        },
+        transform=partial(
+            colorization_service.remove_background,
+            image=image,  # type: ignore[arg-type]
+            model=request_schema.model,
+            encoding=request_schema.encoding,
+        ),
+    )
     await file_storage.update(image=image)  # type: ignore[arg-type]
+    await _refresh_catalog(image, image_catalog)  # type: ignore[arg-type]
+    await _add_renditions(image, image_rendition_storage)  # type: ignore[arg-type]
+    await _index_for_search(image, image_search_index)  # type: ignore[arg-type]
 
     await progress_tracker.set_progress(
         state=TaskState.SUCCESS, meta=f"Successfully removed background image with id: {request_schema.image_id}"
@@ -251,6 +550,7 @@ async def compare_images_task(
     image_service: FromDishka[ImageService],
     file_storage: FromDishka[ImageStorage],
     comparison_gateway: FromDishka[ImageComparisonGateway],
+    transaction_manager: FromDishka[TransactionManager],
     context: Annotated[Context, TaskiqDepends()],
     progress_tracker: Annotated[ProgressTracker, TaskiqDepends()],
 ) -> None:
@@ -297,17 +597,26 @@ async def compare_images_task(
         context.reject()
         return
 
-    comparison_result = image_service.compare_images(
+    comparison_id: ComparisonID = comparison_id_for(request_schema.first_image_id, request_schema.second_image_id)
+    stored_comparison: ImageComparison | None = await comparison_gateway.read_by_id(comparison_id)
+
+    # a repeated task of the same pair finds the result of the first one
+    if stored_comparison is not None and stored_comparison.is_up_to_date(
+        first_image.updated_at,
+        second_image.updated_at,
+    ):
+        await progress_tracker.set_progress(
+            state=TaskState.SUCCESS,
+            meta=f"Images {request_schema.first_image_id} and {request_schema.second_image_id} are already compared",
+        )
+        return
+
+    comparison_result = await asyncio.to_thread(
+        image_service.compare_images,
         first_image=first_image,
         second_image=second_image,
     )
 
-    # Create comparison ID from concatenated image IDs (deterministic)
-    # Sort IDs to ensure consistent comparison ID regardless of order
-    sorted_ids = sorted([str(request_schema.first_image_id), str(request_schema.second_image_id)])
-    comparison_id_str = f"{sorted_ids[0]}_{sorted_ids[1]}"
-    comparison_id = ComparisonID(uuid.uuid5(uuid.NAMESPACE_DNS, comparison_id_str))
-
     comparison = ImageComparison(
         id=comparison_id,
         first_image_id=request_schema.first_image_id,
@@ -316,9 +625,11 @@ async def compare_images_task(
         different_names=comparison_result.different_names,
         different_width=comparison_result.different_width,
         different_height=comparison_result.different_height,
+        images_updated_at=max(first_image.updated_at, second_image.updated_at),
     )
 
     await comparison_gateway.add(comparison)
+    await transaction_manager.commit()
 
     await progress_tracker.set_progress(
         state=TaskState.SUCCESS,
@@ -332,9 +643,162 @@ async def compare_images_task(
     )
 
 
+@inject(patch_module=True)
+async def compare_images_batch_task(
+    request_schema: CompareImagesBatchSchemaRequestTask,
+    batch_comparison_service: FromDishka[ImageBatchComparisonService],
+    context: Annotated[Context, TaskiqDepends()],
+    progress_tracker: Annotated[ProgressTracker, TaskiqDepends()],
+) -> None:
+    await progress_tracker.set_progress(
+        state=TaskState.STARTED,
+        meta=f"Started batch comparison of {len(request_schema.image_ids)} images",
+    )
+
+    logger.info(
+        "Running task: %s with id: %s",
+        context.message.task_name,
+        context.message.task_id,
+    )
+
+    try:
+        if request_schema.reference_image_id is None:
+            compared: int = await batch_comparison_service.compare_all_pairs(request_schema.image_ids)
+        else:
+            compared = await batch_comparison_service.compare_one_to_many(
+                request_schema.reference_image_id,
+                request_schema.image_ids,
+            )
+    except ImageNotFoundError as error:
+        msg = str(error)
+        logger.exception(msg)
+
+        await progress_tracker.set_progress(state=TaskState.FAILURE, meta=msg)
+
+        context.reject()
+        return
+
+    await progress_tracker.set_progress(state=TaskState.SUCCESS, meta=f"Compared {compared} pairs of images")
+
+    logger.info(
+        "Finished task: %s with id: %s",
+        context.message.task_name,
+        context.message.task_id,
+    )
+
+
+def _to_image_operation(step: ImagePipelineStepSchemaRequestTask) -> ImageOperation:
+    # Параметры шагов уже проверены в обработчике команды перед постановкой задачи
+    match step.operation:
+        case "rotate":
+            return RotateImageOperation(angle=step.angle)  # type: ignore[arg-type]
+        case "grayscale":
+            return GrayscaleImageOperation()
+        case "compress":
+            return CompressImageOperation(quality=step.quality)  # type: ignore[arg-type]
+        case "upscale":
+            return UpscaleImageOperation(algorithm=step.algorithm, scale=step.scale)  # type: ignore[arg-type]
+        case "remove_background":
+            return RemoveBackgroundImageOperation(model=step.model)
+        case "remove_watermark":
+            return RemoveWatermarkImageOperation()
+
+
+def _pipeline_step_params(step: ImagePipelineStepSchemaRequestTask, default_model: str) -> dict[str, Any]:
+    params: dict[str, Any] = step.model_dump(mode="json", exclude_none=True)
+
+    # the cached result must not outlive a change of the default model
+    if step.operation == "remove_background":
+        params["model"] = step.model or default_model
+
+    return params
+
+
+@inject(patch_module=True)
+async def process_image_pipeline_task(
+    request_schema: ProcessImagePipelineSchemaRequestTask,
+    image_pipeline_service: FromDishka[ImagePipelineService],
+    file_storage: FromDishka[ImageStorage],
+    image_rendition_storage: FromDishka[ImageRenditionStorage],
+    image_search_index: FromDishka[ImageSearchIndexService],
+    image_catalog: FromDishka[ImageCatalogService],
+    derived_image_cache: FromDishka[DerivedImageCache],
+    background_removal_config: FromDishka[BackgroundRemovalConfig],
+    context: Annotated[Context, TaskiqDepends()],
+    progress_tracker: Annotated[ProgressTracker, TaskiqDepends()],
+) -> None:
+    await progress_tracker.set_progress(
+        state=TaskState.STARTED, meta=f"Started processing image pipeline with id: {request_schema.image_id}"
+    )
+
+    logger.info(
+        "Running task: %s with id: %s",
+        context.message.task_name,
+        context.message.task_id,
+    )
+
+    image: Image | None = await file_storage.read_by_id(image_id=request_schema.image_id)
+
+    if image is None:
+        msg = f"image with id: {request_schema.image_id} not found"
+        logger.error(msg)
+
+        await progress_tracker.set_progress(state=TaskState.FAILURE, meta=msg)
+
+        context.reject()
+
+    await _transform_with_cache(
+        image,  # type: ignore[arg-type]
+        derived_image_cache,
+        operation="process_image_pipeline",
+        params={
+            "operations": [
+                _pipeline_step_params(step, background_removal_config.default_model)
+                for step in request_schema.operations
+            ],
+            "encoding": request_schema.encoding,
+        },
+        transform=partial(
+            image_pipeline_service.process,
+            image=image,  # type: ignore[arg-type]
+            operations=[_to_image_operation(step) for step in request_schema.operations],
+            encoding=request_schema.encoding,
+        ),
+    )
+
+    await file_storage.update(image=image)  # type: ignore[arg-type]
+    await _refresh_catalog(image, image_catalog)  # type: ignore[arg-type]
+    await _add_renditions(image, image_rendition_storage)  # type: ignore[arg-type]
+    await _index_for_search(image, image_search_index)  # type: ignore[arg-type]
+
+    await progress_tracker.set_progress(
+        state=TaskState.SUCCESS, meta=f"Successfully processed image pipeline with id: {request_schema.image_id}"
+    )
+
+    logger.info(
+        "Finished task: %s with id: %s",
+        context.message.task_name,
+        context.message.task_id,
+    )
+
+
 def setup_images_task(broker: AsyncBroker) -> None:
     logger.info("Setup tasks")
 
+    broker.register_task(
+        func=generate_image_renditions_task,
+        retry_on_error=True,
+        max_retries=3,
+        delay=15,
+        task_name="generate_image_renditions",
+    )
+
+    broker.register_task(func=index_image_task, retry_on_error=True, max_retries=3, delay=15, task_name="index_image")
+
+    broker.register_task(
+        func=store_uploaded_image_task, retry_on_error=True, max_retries=3, delay=15, task_name="store_uploaded_image"
+    )
+
     broker.register_task(
         func=convert_to_grayscale_task, retry_on_error=True, max_retries=3, delay=15, task_name="grayscale_image"
     )
@@ -356,3 +820,19 @@ def setup_images_task(broker: AsyncBroker) -> None:
     broker.register_task(
         func=compare_images_task, retry_on_error=True, max_retries=3, delay=15, task_name="compare_images"
     )
+
+    broker.register_task(
+        func=compare_images_batch_task,
+        retry_on_error=True,
+        max_retries=3,
+        delay=15,
+        task_name="compare_images_batch",
+    )
+
+    broker.register_task(
+        func=process_image_pipeline_task,
+        retry_on_error=True,
+        max_retries=3,
+        delay=15,
+        task_name="process_image_pipeline",
+    )
@@ -2,34 +2,75 @@ from typing import Literal
 
 from pydantic import BaseModel
 
+from pix_erase.domain.image.ports.image_background_remove_converter import BackgroundRemovalModel
+from pix_erase.domain.image.values.image_encoding import ImageEncoding
 from pix_erase.domain.image.values.image_id import ImageID
 from pix_erase.domain.image.values.image_scale import ImageScale
 
 
+class StoreUploadedImageSchemaRequestTask(BaseModel):
+    image_id: ImageID
+    filename: str
+
+
+class GenerateImageRenditionsSchemaRequestTask(BaseModel):
+    image_id: ImageID
+
+
+class IndexImageSchemaRequestTask(BaseModel):
+    image_id: ImageID
+
+
 class GrayscaleImageSchemaRequestTask(BaseModel):
     image_id: ImageID
+    encoding: ImageEncoding | None = None
 
 
 class RotateImageSchemaRequestTask(BaseModel):
     image_id: ImageID
     angle: int
+    encoding: ImageEncoding | None = None
 
 
 class CompressImageSchemaRequestTask(BaseModel):
     image_id: ImageID
     quality: int
+    encoding: ImageEncoding | None = None
 
 
 class UpscaleImageSchemaRequestTask(BaseModel):
     image_id: ImageID
     algorithm: Literal["AI", "NearestNeighbour"]
     scale: ImageScale
+    encoding: ImageEncoding | None = None
 
 
 class RemoveBackgroundImageSchemaRequestTask(BaseModel):
     image_id: ImageID
+    model: BackgroundRemovalModel | None = None
+    encoding: ImageEncoding | None = None
 
 
 class CompareImagesSchemaRequestTask(BaseModel):
     first_image_id: ImageID
     second_image_id: ImageID
+
+
+class CompareImagesBatchSchemaRequestTask(BaseModel):
+    image_ids: list[ImageID]
+    reference_image_id: ImageID | None = None
+
+
+class ImagePipelineStepSchemaRequestTask(BaseModel):
+    operation: Literal["rotate", "grayscale", "compress", "upscale", "remove_background", "remove_watermark"]
+    angle: int | None = None
+    quality: int | None = None
+    algorithm: Literal["AI", "NearestNeighbour"] | None = None
+    scale: ImageScale | None = None
+    model: BackgroundRemovalModel | None = None
+
+
+class ProcessImagePipelineSchemaRequestTask(BaseModel):
+    image_id: ImageID
+    operations: list[ImagePipelineStepSchemaRequestTask]
+    encoding: ImageEncoding | None = None
@@ -1,12 +1,19 @@
+from collections.abc import AsyncIterable
 from typing import Final, override
 
 from opentelemetry import trace
 from opentelemetry.trace import SpanKind, Status, StatusCode, Tracer
 
 from pix_erase.application.common.ports.image.storage import ImageStorage
-from pix_erase.application.common.query_models.image import ImageStreamQueryModel
+from pix_erase.application.common.query_models.image import (
+    ImageByteRange,
+    ImageMetadataQueryModel,
+    ImageRangeQueryModel,
+    ImageStreamQueryModel,
+)
 from pix_erase.domain.image.entities.image import Image
 from pix_erase.domain.image.values.image_id import ImageID
+from pix_erase.domain.image.values.image_name import ImageName
 
 tracer: Final[Tracer] = trace.get_tracer(__name__)
 
@@ -29,6 +36,54 @@ class TraceableFileStorage(ImageStorage):
                 span.set_status(Status(StatusCode.ERROR))
                 raise
 
+    @override
+    async def add_stream(self, image_id: ImageID, name: ImageName, stream: AsyncIterable[bytes]) -> None:
+        span_name = "image.storage.add_stream"
+        with tracer.start_as_current_span(span_name, kind=SpanKind.INTERNAL) as span:
+            span.set_attribute("image.storage.operation", "add_stream")
+            span.set_attribute("image.id", str(image_id))
+            span.set_attribute("image.name", str(name))
+            try:
+                await self._image_storage.add_stream(image_id, name, stream)
+                span.set_status(Status(StatusCode.OK))
+            except Exception as exc:
+                span.record_exception(exc)
+                span.set_status(Status(StatusCode.ERROR))
+                raise
+
+    @override
+    async def add_uploaded(self, image_id: ImageID, name: ImageName) -> None:
+        span_name = "image.storage.add_uploaded"
+        with tracer.start_as_current_span(span_name, kind=SpanKind.INTERNAL) as span:
+            span.set_attribute("image.storage.operation", "add_uploaded")
+            span.set_attribute("image.id", str(image_id))
+            span.set_attribute("image.name", name.value)
+            try:
+                await self._image_storage.add_uploaded(image_id, name)
+                span.set_status(Status(StatusCode.OK))
+            except Exception as exc:
+                span.record_exception(exc)
+                span.set_status(Status(StatusCode.ERROR))
+                raise
+
+    @override
+    async def read_upload_size(self, image_id: ImageID) -> int | None:
+        span_name = "image.storage.read_upload_size"
+        with tracer.start_as_current_span(span_name, kind=SpanKind.INTERNAL) as span:
+            span.set_attribute("image.storage.operation", "read_upload_size")
+            span.set_attribute("image.id", str(image_id))
+            try:
+                upload_size = await self._image_storage.read_upload_size(image_id)
+                if upload_size is not None:
+                    span.set_attribute("image.size", upload_size)
+                span.set_status(Status(StatusCode.OK))
+            except Exception as exc:
+                span.record_exception(exc)
+                span.set_status(Status(StatusCode.ERROR))
+                raise
+            else:
+                return upload_size
+
     @override
     async def read_by_id(self, image_id: ImageID) -> Image:
         span_name = "image.storage.read_by_id"
@@ -46,6 +101,26 @@ class TraceableFileStorage(ImageStorage):
             else:
                 return image
 
+    @override
+    async def read_range(self, image_id: ImageID, offset: int, size: int) -> ImageRangeQueryModel | None:
+        span_name = "image.storage.read_range"
+        with tracer.start_as_current_span(span_name, kind=SpanKind.INTERNAL) as span:
+            span.set_attribute("image.storage.operation", "read_range")
+            span.set_attribute("image.id", str(image_id))
+            span.set_attribute("image.range.offset", offset)
+            span.set_attribute("image.range.size", size)
+            try:
+                image_range = await self._image_storage.read_range(image_id, offset, size)
+                if image_range is not None:
+                    span.set_attribute("image.size", image_range.total_size)
+                span.set_status(Status(StatusCode.OK))
+            except Exception as exc:
+                span.record_exception(exc)
+                span.set_status(Status(StatusCode.ERROR))
+                raise
+            else:
+                return image_range
+
     @override
     async def delete_by_id(self, image_id: ImageID) -> None:
         span_name = "image.storage.delete_by_id"
@@ -75,13 +150,37 @@ class TraceableFileStorage(ImageStorage):
                 raise
 
     @override
-    async def stream_by_id(self, image_id: ImageID) -> ImageStreamQueryModel | None:
+    async def read_metadata_by_id(self, image_id: ImageID) -> ImageMetadataQueryModel | None:
+        span_name = "image.storage.read_metadata_by_id"
+        with tracer.start_as_current_span(span_name, kind=SpanKind.INTERNAL) as span:
+            span.set_attribute("image.storage.operation", "read_metadata_by_id")
+            span.set_attribute("image.id", str(image_id))
+            try:
+                metadata = await self._image_storage.read_metadata_by_id(image_id)
+                span.set_attribute("image.exists", metadata is not None)
+                span.set_status(Status(StatusCode.OK))
+            except Exception as exc:
+                span.record_exception(exc)
+                span.set_status(Status(StatusCode.ERROR))
+                raise
+            else:
+                return metadata
+
+    @override
+    async def stream_by_id(
+        self,
+        image_id: ImageID,
+        byte_range: ImageByteRange | None = None,
+    ) -> ImageStreamQueryModel | None:
         span_name = "image.storage.stream_by_id"
         with tracer.start_as_current_span(span_name, kind=SpanKind.INTERNAL) as span:
             span.set_attribute("image.storage.operation", "stream_by_id")
             span.set_attribute("image.id", str(image_id))
+            if byte_range is not None:
+                span.set_attribute("image.range.offset", byte_range.start)
+                span.set_attribute("image.range.size", byte_range.size)
             try:
-                stream = await self._image_storage.stream_by_id(image_id)
+                stream = await self._image_storage.stream_by_id(image_id, byte_range)
                 if stream is not None:
                     span.set_attribute("image.stream.exists", True)
                 else:
@@ -107,4 +107,3 @@ def _set_user_attributes(span: trace.Span, user: User) -> None:
     span.set_attribute("user.name", str(user.name))
     span.set_attribute("user.role", user.role)
     span.set_attribute("user.is_active", user.is_active)
-    span.set_attribute("user.images.count", len(user.images))
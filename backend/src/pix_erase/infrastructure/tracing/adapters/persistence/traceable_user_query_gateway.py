@@ -66,7 +66,6 @@ def _set_user_attributes(span: trace.Span, user: User) -> None:
     span.set_attribute("user.name", str(user.name))
     span.set_attribute("user.role", user.role)
     span.set_attribute("user.is_active", user.is_active)
-    span.set_attribute("user.images.count", len(user.images))
 
 
 def _set_user_list_params_attributes(span: trace.Span, user_list_params: UserListParams) -> None:
@@ -23,51 +23,78 @@ _sym_db = _symbol_database.Default()
 
 
 from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0ev1/image.proto\x12\x0cpix_erase.v1\x1a\x1bgoogle/protobuf/empty.proto\":\n\x12\x43reateImageRequest\x12\x12\n\nimage_data\x18\x01 \x01(\x0c\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\"\'\n\x13\x43reateImageResponse\x12\x10\n\x08image_id\x18\x01 \x01(\t\"$\n\x10ReadImageRequest\x12\x10\n\x08image_id\x18\x01 \x01(\t\"\x1e\n\x0eReadImageChunk\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\"&\n\x12\x44\x65leteImageRequest\x12\x10\n\x08image_id\x18\x01 \x01(\t\"(\n\x14ReadImageExifRequest\x12\x10\n\x08image_id\x18\x01 \x01(\t\"\xa5\x01\n\x12\x43\x61meraSettingsExif\x12\x0c\n\x04make\x18\x01 \x01(\t\x12\r\n\x05model\x18\x02 \x01(\t\x12\x13\n\x0borientation\x18\x03 \x01(\t\x12\x14\n\x0c\x66ocal_length\x18\x04 \x01(\t\x12\x19\n\x11\x66ocal_length_35mm\x18\x05 \x01(\t\x12\x14\n\x0cmax_aperture\x18\x06 \x01(\t\x12\x16\n\x0e\x61perture_value\x18\x07 \x01(\t\"\x8d\x01\n\x10\x45xposureSettings\x12\x15\n\rexposure_time\x18\x01 \x01(\t\x12\x10\n\x08\x61perture\x18\x02 \x01(\t\x12\x0b\n\x03iso\x18\x03 \x01(\x05\x12\x15\n\rexposure_bias\x18\x04 \x01(\t\x12\x15\n\rmetering_mode\x18\x05 \x01(\t\x12\x15\n\rwhite_balance\x18\x06 \x01(\t\"s\n\tFlashInfo\x12\r\n\x05\x66ired\x18\x01 \x01(\x08\x12\x0c\n\x04mode\x18\x02 \x01(\t\x12\x14\n\x0creturn_light\x18\x03 \x01(\x08\x12\x18\n\x10\x66unction_present\x18\x04 \x01(\x08\x12\x19\n\x11red_eye_reduction\x18\x05 \x01(\x08\"m\n\x07GPSInfo\x12\x10\n\x08latitude\x18\x01 \x01(\x01\x12\x11\n\tlongitude\x18\x02 \x01(\x01\x12\x10\n\x08\x61ltitude\x18\x03 \x01(\x01\x12\x14\n\x0clatitude_ref\x18\x04 \x01(\t\x12\x15\n\rlongitude_ref\x18\x05 \x01(\t\"D\n\x0c\x44\x61teTimeInfo\x12\x0f\n\x07\x63reated\x18\x01 \x01(\t\x12\x11\n\tdigitized\x18\x02 \x01(\t\x12\x10\n\x08original\x18\x03 \x01(\t\"\xda\x02\n\x15ReadImageExifResponse\x12\r\n\x05width\x18\x01 \x01(\x05\x12\x0e\n\x06height\x18\x02 \x01(\x05\x12\x0e\n\x06\x66ormat\x18\x03 \x01(\t\x12\x13\n\x0bis_animated\x18\x04 \x01(\x08\x12\x39\n\x0f\x63\x61mera_settings\x18\x05 \x01(\x0b\x32 .pix_erase.v1.CameraSettingsExif\x12\x39\n\x11\x65xposure_settings\x18\x06 \x01(\x0b\x32\x1e.pix_erase.v1.ExposureSettings\x12+\n\nflash_info\x18\x07 \x01(\x0b\x32\x17.pix_erase.v1.FlashInfo\x12\'\n\x08gps_info\x18\x08 \x01(\x0b\x32\x15.pix_erase.v1.GPSInfo\x12\x31\n\rdatetime_info\x18\t \x01(\x0b\x32\x1a.pix_erase.v1.DateTimeInfo\"9\n\x14\x43ompressImageRequest\x12\x10\n\x08image_id\x18\x01 \x01(\t\x12\x0f\n\x07quality\x18\x02 \x01(\x05\")\n\x15GrayscaleImageRequest\x12\x10\n\x08image_id\x18\x01 \x01(\t\"+\n\x17RemoveBackgroundRequest\x12\x10\n\x08image_id\x18\x01 \x01(\t\"5\n\x12RotateImageRequest\x12\x10\n\x08image_id\x18\x01 \x01(\t\x12\r\n\x05\x61ngle\x18\x02 \x01(\x05\"I\n\x13UpscaleImageRequest\x12\x10\n\x08image_id\x18\x01 \x01(\t\x12\x11\n\talgorithm\x18\x02 \x01(\t\x12\r\n\x05scale\x18\x03 \x01(\x05\"\x1f\n\x0cTaskResponse\x12\x0f\n\x07task_id\x18\x01 \x01(\t2\xe9\x05\n\x0cImageService\x12R\n\x0b\x43reateImage\x12 .pix_erase.v1.CreateImageRequest\x1a!.pix_erase.v1.CreateImageResponse\x12K\n\tReadImage\x12\x1e.pix_erase.v1.ReadImageRequest\x1a\x1c.pix_erase.v1.ReadImageChunk0\x01\x12G\n\x0b\x44\x65leteImage\x12 .pix_erase.v1.DeleteImageRequest\x1a\x16.google.protobuf.Empty\x12X\n\rReadImageExif\x12\".pix_erase.v1.ReadImageExifRequest\x1a#.pix_erase.v1.ReadImageExifResponse\x12O\n\rCompressImage\x12\".pix_erase.v1.CompressImageRequest\x1a\x1a.pix_erase.v1.TaskResponse\x12Q\n\x0eGrayscaleImage\x12#.pix_erase.v1.GrayscaleImageRequest\x1a\x1a.pix_erase.v1.TaskResponse\x12U\n\x10RemoveBackground\x12%.pix_erase.v1.RemoveBackgroundRequest\x1a\x1a.pix_erase.v1.TaskResponse\x12K\n\x0bRotateImage\x12 .pix_erase.v1.RotateImageRequest\x1a\x1a.pix_erase.v1.TaskResponse\x12M\n\x0cUpscaleImage\x12!.pix_erase.v1.UpscaleImageRequest\x1a\x1a.pix_erase.v1.TaskResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0ev1/image.proto\x12\x0cpix_erase.v1\x1a\x1bgoogle/protobuf/empty.proto\x1a\x1fgoogle/protobuf/timestamp.proto\":\n\x12\x43reateImageRequest\x12\x12\n\nimage_data\x18\x01 \x01(\x0c\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\"2\n\x10\x43reateImageChunk\x12\x10\n\x08\x66ilename\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x02 \x01(\x0c\"\'\n\x13\x43reateImageResponse\x12\x10\n\x08image_id\x18\x01 \x01(\t\"\x8d\x02\n\x10ReadImageRequest\x12\x10\n\x08image_id\x18\x01 \x01(\t\x12\x13\n\x06offset\x18\x02 \x01(\x03H\x00\x88\x01\x01\x12\x13\n\x06length\x18\x03 \x01(\x03H\x01\x88\x01\x01\x12\x15\n\rif_none_match\x18\x04 \x03(\t\x12:\n\x11if_modified_since\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x02\x88\x01\x01\x12\x15\n\x08if_range\x18\x06 \x01(\tH\x03\x88\x01\x01\x12\x11\n\x04size\x18\x07 \x01(\x05H\x04\x88\x01\x01\x42\t\n\x07_offsetB\t\n\x07_lengthB\x14\n\x12_if_modified_sinceB\x0b\n\t_if_rangeB\x07\n\x05_size\"\x1e\n\x0eReadImageChunk\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\"&\n\x12\x44\x65leteImageRequest\x12\x10\n\x08image_id\x18\x01 \x01(\t\"(\n\x14ReadImageExifRequest\x12\x10\n\x08image_id\x18\x01 \x01(\t\"\xa5\x01\n\x12\x43\x61meraSettingsExif\x12\x0c\n\x04make\x18\x01 \x01(\t\x12\r\n\x05model\x18\x02 \x01(\t\x12\x13\n\x0borientation\x18\x03 \x01(\t\x12\x14\n\x0c\x66ocal_length\x18\x04 \x01(\t\x12\x19\n\x11\x66ocal_length_35mm\x18\x05 \x01(\t\x12\x14\n\x0cmax_aperture\x18\x06 \x01(\t\x12\x16\n\x0e\x61perture_value\x18\x07 \x01(\t\"\x8d\x01\n\x10\x45xposureSettings\x12\x15\n\rexposure_time\x18\x01 \x01(\t\x12\x10\n\x08\x61perture\x18\x02 \x01(\t\x12\x0b\n\x03iso\x18\x03 \x01(\x05\x12\x15\n\rexposure_bias\x18\x04 \x01(\t\x12\x15\n\rmetering_mode\x18\x05 \x01(\t\x12\x15\n\rwhite_balance\x18\x06 \x01(\t\"s\n\tFlashInfo\x12\r\n\x05\x66ired\x18\x01 \x01(\x08\x12\x0c\n\x04mode\x18\x02 \x01(\t\x12\x14\n\x0creturn_light\x18\x03 \x01(\x08\x12\x18\n\x10\x66unction_present\x18\x04 \x01(\x08\x12\x19\n\x11red_eye_reduction\x18\x05 \x01(\x08\"m\n\x07GPSInfo\x12\x10\n\x08latitude\x18\x01 \x01(\x01\x12\x11\n\tlongitude\x18\x02 \x01(\x01\x12\x10\n\x08\x61ltitude\x18\x03 \x01(\x01\x12\x14\n\x0clatitude_ref\x18\x04 \x01(\t\x12\x15\n\rlongitude_ref\x18\x05 \x01(\t\"D\n\x0c\x44\x61teTimeInfo\x12\x0f\n\x07\x63reated\x18\x01 \x01(\t\x12\x11\n\tdigitized\x18\x02 \x01(\t\x12\x10\n\x08original\x18\x03 \x01(\t\"\xda\x02\n\x15ReadImageExifResponse\x12\r\n\x05width\x18\x01 \x01(\x05\x12\x0e\n\x06height\x18\x02 \x01(\x05\x12\x0e\n\x06\x66ormat\x18\x03 \x01(\t\x12\x13\n\x0bis_animated\x18\x04 \x01(\x08\x12\x39\n\x0f\x63\x61mera_settings\x18\x05 \x01(\x0b\x32 .pix_erase.v1.CameraSettingsExif\x12\x39\n\x11\x65xposure_settings\x18\x06 \x01(\x0b\x32\x1e.pix_erase.v1.ExposureSettings\x12+\n\nflash_info\x18\x07 \x01(\x0b\x32\x17.pix_erase.v1.FlashInfo\x12\'\n\x08gps_info\x18\x08 \x01(\x0b\x32\x15.pix_erase.v1.GPSInfo\x12\x31\n\rdatetime_info\x18\t \x01(\x0b\x32\x1a.pix_erase.v1.DateTimeInfo\"g\n\x14\x43ompressImageRequest\x12\x10\n\x08image_id\x18\x01 \x01(\t\x12\x0f\n\x07quality\x18\x02 \x01(\x05\x12\x1a\n\routput_format\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\x10\n\x0e_output_format\"\x87\x01\n\x15GrayscaleImageRequest\x12\x10\n\x08image_id\x18\x01 \x01(\t\x12\x1a\n\routput_format\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x1b\n\x0eoutput_quality\x18\x03 \x01(\x05H\x01\x88\x01\x01\x42\x10\n\x0e_output_formatB\x11\n\x0f_output_quality\"\xa7\x01\n\x17RemoveBackgroundRequest\x12\x10\n\x08image_id\x18\x01 \x01(\t\x12\x12\n\x05model\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x1a\n\routput_format\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x1b\n\x0eoutput_quality\x18\x04 \x01(\x05H\x02\x88\x01\x01\x42\x08\n\x06_modelB\x10\n\x0e_output_formatB\x11\n\x0f_output_quality\"\x93\x01\n\x12RotateImageRequest\x12\x10\n\x08image_id\x18\x01 \x01(\t\x12\r\n\x05\x61ngle\x18\x02 \x01(\x05\x12\x1a\n\routput_format\x18\x03 \x01(\tH\x00\x88\x01\x01\x12\x1b\n\x0eoutput_quality\x18\x04 \x01(\x05H\x01\x88\x01\x01\x42\x10\n\x0e_output_formatB\x11\n\x0f_output_quality\"\xa7\x01\n\x13UpscaleImageRequest\x12\x10\n\x08image_id\x18\x01 \x01(\t\x12\x11\n\talgorithm\x18\x02 \x01(\t\x12\r\n\x05scale\x18\x03 \x01(\x05\x12\x1a\n\routput_format\x18\x04 \x01(\tH\x00\x88\x01\x01\x12\x1b\n\x0eoutput_quality\x18\x05 \x01(\x05H\x01\x88\x01\x01\x42\x10\n\x0e_output_formatB\x11\n\x0f_output_quality\"\xcd\x01\n\x16ImagePipelineOperation\x12\x11\n\toperation\x18\x01 \x01(\t\x12\x12\n\x05\x61ngle\x18\x02 \x01(\x05H\x00\x88\x01\x01\x12\x14\n\x07quality\x18\x03 \x01(\x05H\x01\x88\x01\x01\x12\x16\n\talgorithm\x18\x04 \x01(\tH\x02\x88\x01\x01\x12\x12\n\x05scale\x18\x05 \x01(\x05H\x03\x88\x01\x01\x12\x12\n\x05model\x18\x06 \x01(\tH\x04\x88\x01\x01\x42\x08\n\x06_angleB\n\n\x08_qualityB\x0c\n\n_algorithmB\x08\n\x06_scaleB\x08\n\x06_model\"\x97\x01\n\x1bProcessImagePipelineRequest\x12\x10\n\x08image_id\x18\x01 \x01(\t\x12\x38\n\noperations\x18\x02 \x03(\x0b\x32$.pix_erase.v1.ImagePipelineOperation\x12\x1a\n\routput_format\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\x10\n\x0e_output_format\"\x1f\n\x0cTaskResponse\x12\x0f\n\x07task_id\x18\x01 \x01(\t\"\x96\x01\n\x19ProcessImagesBatchRequest\x12\x11\n\timage_ids\x18\x01 \x03(\t\x12\x38\n\noperations\x18\x02 \x03(\x0b\x32$.pix_erase.v1.ImagePipelineOperation\x12\x1a\n\routput_format\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\x10\n\x0e_output_format\"%\n\x11TaskBatchResponse\x12\x10\n\x08\x62\x61tch_id\x18\x01 \x01(\t\"g\n\x16ImageUploadUrlResponse\x12\x10\n\x08image_id\x18\x01 \x01(\t\x12\x0b\n\x03url\x18\x02 \x01(\t\x12.\n\nexpires_at\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"@\n\x1a\x43ompleteImageUploadRequest\x12\x10\n\x08image_id\x18\x01 \x01(\t\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\"x\n\x1aSearchSimilarImagesRequest\x12\x10\n\x08image_id\x18\x01 \x01(\t\x12\x19\n\x0cmax_distance\x18\x02 \x01(\x05H\x00\x88\x01\x01\x12\x12\n\x05limit\x18\x03 \x01(\x05H\x01\x88\x01\x01\x42\x0f\n\r_max_distanceB\x08\n\x06_limit\"z\n\x0cSimilarImage\x12\x10\n\x08image_id\x18\x01 \x01(\t\x12\x10\n\x08\x64istance\x18\x02 \x01(\x05\x12\x16\n\x0ephash_distance\x18\x03 \x01(\x05\x12\x16\n\x0e\x64hash_distance\x18\x04 \x01(\x05\x12\x16\n\x0e\x61hash_distance\x18\x05 \x01(\x05\"I\n\x1bSearchSimilarImagesResponse\x12*\n\x06images\x18\x01 \x03(\x0b\x32\x1a.pix_erase.v1.SimilarImage\"Q\n\x11ListImagesRequest\x12\x12\n\x05limit\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x13\n\x06\x63ursor\x18\x02 \x01(\tH\x01\x88\x01\x01\x42\x08\n\x06_limitB\t\n\x07_cursor\"\xaa\x02\n\x0c\x43\x61talogImage\x12\x10\n\x08image_id\x18\x01 \x01(\t\x12\x15\n\x08\x66ilename\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x12\n\x05width\x18\x03 \x01(\x05H\x01\x88\x01\x01\x12\x13\n\x06height\x18\x04 \x01(\x05H\x02\x88\x01\x01\x12\x19\n\x0c\x63ontent_type\x18\x05 \x01(\tH\x03\x88\x01\x01\x12\x11\n\x04size\x18\x06 \x01(\x03H\x04\x88\x01\x01\x12.\n\ncreated_at\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.TimestampB\x0b\n\t_filenameB\x08\n\x06_widthB\t\n\x07_heightB\x0f\n\r_content_typeB\x07\n\x05_size\"j\n\x12ListImagesResponse\x12*\n\x06images\x18\x01 \x03(\x0b\x32\x1a.pix_erase.v1.CatalogImage\x12\x18\n\x0bnext_cursor\x18\x02 \x01(\tH\x00\x88\x01\x01\x42\x0e\n\x0c_next_cursor2\xf0\n\n\x0cImageService\x12R\n\x0b\x43reateImage\x12 .pix_erase.v1.CreateImageRequest\x1a!.pix_erase.v1.CreateImageResponse\x12X\n\x11\x43reateImageStream\x12\x1e.pix_erase.v1.CreateImageChunk\x1a!.pix_erase.v1.CreateImageResponse(\x01\x12K\n\tReadImage\x12\x1e.pix_erase.v1.ReadImageRequest\x1a\x1c.pix_erase.v1.ReadImageChunk0\x01\x12G\n\x0b\x44\x65leteImage\x12 .pix_erase.v1.DeleteImageRequest\x1a\x16.google.protobuf.Empty\x12X\n\rReadImageExif\x12\".pix_erase.v1.ReadImageExifRequest\x1a#.pix_erase.v1.ReadImageExifResponse\x12O\n\rCompressImage\x12\".pix_erase.v1.CompressImageRequest\x1a\x1a.pix_erase.v1.TaskResponse\x12Q\n\x0eGrayscaleImage\x12#.pix_erase.v1.GrayscaleImageRequest\x1a\x1a.pix_erase.v1.TaskResponse\x12U\n\x10RemoveBackground\x12%.pix_erase.v1.RemoveBackgroundRequest\x1a\x1a.pix_erase.v1.TaskResponse\x12K\n\x0bRotateImage\x12 .pix_erase.v1.RotateImageRequest\x1a\x1a.pix_erase.v1.TaskResponse\x12M\n\x0cUpscaleImage\x12!.pix_erase.v1.UpscaleImageRequest\x1a\x1a.pix_erase.v1.TaskResponse\x12]\n\x14ProcessImagePipeline\x12).pix_erase.v1.ProcessImagePipelineRequest\x1a\x1a.pix_erase.v1.TaskResponse\x12^\n\x12ProcessImagesBatch\x12\'.pix_erase.v1.ProcessImagesBatchRequest\x1a\x1f.pix_erase.v1.TaskBatchResponse\x12R\n\x12RequestImageUpload\x12\x16.google.protobuf.Empty\x1a$.pix_erase.v1.ImageUploadUrlResponse\x12[\n\x13\x43ompleteImageUpload\x12(.pix_erase.v1.CompleteImageUploadRequest\x1a\x1a.pix_erase.v1.TaskResponse\x12j\n\x13SearchSimilarImages\x12(.pix_erase.v1.SearchSimilarImagesRequest\x1a).pix_erase.v1.SearchSimilarImagesResponse\x12O\n\nListImages\x12\x1f.pix_erase.v1.ListImagesRequest\x1a .pix_erase.v1.ListImagesResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'v1.image_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
-  _globals['_CREATEIMAGEREQUEST']._serialized_start=61
-  _globals['_CREATEIMAGEREQUEST']._serialized_end=119
-  _globals['_CREATEIMAGERESPONSE']._serialized_start=121
-  _globals['_CREATEIMAGERESPONSE']._serialized_end=160
-  _globals['_READIMAGEREQUEST']._serialized_start=162
-  _globals['_READIMAGEREQUEST']._serialized_end=198
-  _globals['_READIMAGECHUNK']._serialized_start=200
-  _globals['_READIMAGECHUNK']._serialized_end=230
-  _globals['_DELETEIMAGEREQUEST']._serialized_start=232
-  _globals['_DELETEIMAGEREQUEST']._serialized_end=270
-  _globals['_READIMAGEEXIFREQUEST']._serialized_start=272
-  _globals['_READIMAGEEXIFREQUEST']._serialized_end=312
-  _globals['_CAMERASETTINGSEXIF']._serialized_start=315
-  _globals['_CAMERASETTINGSEXIF']._serialized_end=480
-  _globals['_EXPOSURESETTINGS']._serialized_start=483
-  _globals['_EXPOSURESETTINGS']._serialized_end=624
-  _globals['_FLASHINFO']._serialized_start=626
-  _globals['_FLASHINFO']._serialized_end=741
-  _globals['_GPSINFO']._serialized_start=743
-  _globals['_GPSINFO']._serialized_end=852
-  _globals['_DATETIMEINFO']._serialized_start=854
-  _globals['_DATETIMEINFO']._serialized_end=922
-  _globals['_READIMAGEEXIFRESPONSE']._serialized_start=925
-  _globals['_READIMAGEEXIFRESPONSE']._serialized_end=1271
-  _globals['_COMPRESSIMAGEREQUEST']._serialized_start=1273
-  _globals['_COMPRESSIMAGEREQUEST']._serialized_end=1330
-  _globals['_GRAYSCALEIMAGEREQUEST']._serialized_start=1332
-  _globals['_GRAYSCALEIMAGEREQUEST']._serialized_end=1373
-  _globals['_REMOVEBACKGROUNDREQUEST']._serialized_start=1375
-  _globals['_REMOVEBACKGROUNDREQUEST']._serialized_end=1418
-  _globals['_ROTATEIMAGEREQUEST']._serialized_start=1420
-  _globals['_ROTATEIMAGEREQUEST']._serialized_end=1473
-  _globals['_UPSCALEIMAGEREQUEST']._serialized_start=1475
-  _globals['_UPSCALEIMAGEREQUEST']._serialized_end=1548
-  _globals['_TASKRESPONSE']._serialized_start=1550
-  _globals['_TASKRESPONSE']._serialized_end=1581
-  _globals['_IMAGESERVICE']._serialized_start=1584
-  _globals['_IMAGESERVICE']._serialized_end=2329
+  _globals['_CREATEIMAGEREQUEST']._serialized_start=94
+  _globals['_CREATEIMAGEREQUEST']._serialized_end=152
+  _globals['_CREATEIMAGECHUNK']._serialized_start=154
+  _globals['_CREATEIMAGECHUNK']._serialized_end=204
+  _globals['_CREATEIMAGERESPONSE']._serialized_start=206
+  _globals['_CREATEIMAGERESPONSE']._serialized_end=245
+  _globals['_READIMAGEREQUEST']._serialized_start=248
+  _globals['_READIMAGEREQUEST']._serialized_end=517
+  _globals['_READIMAGECHUNK']._serialized_start=519
+  _globals['_READIMAGECHUNK']._serialized_end=549
+  _globals['_DELETEIMAGEREQUEST']._serialized_start=551
+  _globals['_DELETEIMAGEREQUEST']._serialized_end=589
+  _globals['_READIMAGEEXIFREQUEST']._serialized_start=591
+  _globals['_READIMAGEEXIFREQUEST']._serialized_end=631
+  _globals['_CAMERASETTINGSEXIF']._serialized_start=634
+  _globals['_CAMERASETTINGSEXIF']._serialized_end=799
+  _globals['_EXPOSURESETTINGS']._serialized_start=802
+  _globals['_EXPOSURESETTINGS']._serialized_end=943
+  _globals['_FLASHINFO']._serialized_start=945
+  _globals['_FLASHINFO']._serialized_end=1060
+  _globals['_GPSINFO']._serialized_start=1062
+  _globals['_GPSINFO']._serialized_end=1171
+  _globals['_DATETIMEINFO']._serialized_start=1173
+  _globals['_DATETIMEINFO']._serialized_end=1241
+  _globals['_READIMAGEEXIFRESPONSE']._serialized_start=1244
+  _globals['_READIMAGEEXIFRESPONSE']._serialized_end=1590
+  _globals['_COMPRESSIMAGEREQUEST']._serialized_start=1592
+  _globals['_COMPRESSIMAGEREQUEST']._serialized_end=1695
+  _globals['_GRAYSCALEIMAGEREQUEST']._serialized_start=1698
+  _globals['_GRAYSCALEIMAGEREQUEST']._serialized_end=1833
+  _globals['_REMOVEBACKGROUNDREQUEST']._serialized_start=1836
+  _globals['_REMOVEBACKGROUNDREQUEST']._serialized_end=2003
+  _globals['_ROTATEIMAGEREQUEST']._serialized_start=2006
+  _globals['_ROTATEIMAGEREQUEST']._serialized_end=2153
+  _globals['_UPSCALEIMAGEREQUEST']._serialized_start=2156
+  _globals['_UPSCALEIMAGEREQUEST']._serialized_end=2323
+  _globals['_IMAGEPIPELINEOPERATION']._serialized_start=2326
+  _globals['_IMAGEPIPELINEOPERATION']._serialized_end=2531
+  _globals['_PROCESSIMAGEPIPELINEREQUEST']._serialized_start=2534
+  _globals['_PROCESSIMAGEPIPELINEREQUEST']._serialized_end=2685
+  _globals['_TASKRESPONSE']._serialized_start=2687
+  _globals['_TASKRESPONSE']._serialized_end=2718
+  _globals['_PROCESSIMAGESBATCHREQUEST']._serialized_start=2721
+  _globals['_PROCESSIMAGESBATCHREQUEST']._serialized_end=2871
+  _globals['_TASKBATCHRESPONSE']._serialized_start=2873
+  _globals['_TASKBATCHRESPONSE']._serialized_end=2910
+  _globals['_IMAGEUPLOADURLRESPONSE']._serialized_start=2912
+  _globals['_IMAGEUPLOADURLRESPONSE']._serialized_end=3015
+  _globals['_COMPLETEIMAGEUPLOADREQUEST']._serialized_start=3017
+  _globals['_COMPLETEIMAGEUPLOADREQUEST']._serialized_end=3081
+  _globals['_SEARCHSIMILARIMAGESREQUEST']._serialized_start=3083
+  _globals['_SEARCHSIMILARIMAGESREQUEST']._serialized_end=3203
+  _globals['_SIMILARIMAGE']._serialized_start=3205
+  _globals['_SIMILARIMAGE']._serialized_end=3327
+  _globals['_SEARCHSIMILARIMAGESRESPONSE']._serialized_start=3329
+  _globals['_SEARCHSIMILARIMAGESRESPONSE']._serialized_end=3402
+  _globals['_LISTIMAGESREQUEST']._serialized_start=3404
+  _globals['_LISTIMAGESREQUEST']._serialized_end=3485
+  _globals['_CATALOGIMAGE']._serialized_start=3488
+  _globals['_CATALOGIMAGE']._serialized_end=3786
+  _globals['_LISTIMAGESRESPONSE']._serialized_start=3788
+  _globals['_LISTIMAGESRESPONSE']._serialized_end=3894
+  _globals['_IMAGESERVICE']._serialized_start=3897
+  _globals['_IMAGESERVICE']._serialized_end=5289
 # @@protoc_insertion_point(module_scope)
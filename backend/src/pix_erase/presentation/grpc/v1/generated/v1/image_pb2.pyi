@@ -1,7 +1,11 @@
+import datetime
+
 from google.protobuf import empty_pb2 as _empty_pb2
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from google.protobuf.internal import containers as _containers
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
-from collections.abc import Mapping as _Mapping
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
 from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
 
 DESCRIPTOR: _descriptor.FileDescriptor
@@ -14,6 +18,14 @@ class CreateImageRequest(_message.Message):
     filename: str
     def __init__(self, image_data: _Optional[bytes] = ..., filename: _Optional[str] = ...) -> None: ...
 
+class CreateImageChunk(_message.Message):
+    __slots__ = ("filename", "data")
+    FILENAME_FIELD_NUMBER: _ClassVar[int]
+    DATA_FIELD_NUMBER: _ClassVar[int]
+    filename: str
+    data: bytes
+    def __init__(self, filename: _Optional[str] = ..., data: _Optional[bytes] = ...) -> None: ...
+
 class CreateImageResponse(_message.Message):
     __slots__ = ("image_id",)
     IMAGE_ID_FIELD_NUMBER: _ClassVar[int]
@@ -21,10 +33,22 @@ class CreateImageResponse(_message.Message):
     def __init__(self, image_id: _Optional[str] = ...) -> None: ...
 
 class ReadImageRequest(_message.Message):
-    __slots__ = ("image_id",)
+    __slots__ = ("image_id", "offset", "length", "if_none_match", "if_modified_since", "if_range", "size")
     IMAGE_ID_FIELD_NUMBER: _ClassVar[int]
+    OFFSET_FIELD_NUMBER: _ClassVar[int]
+    LENGTH_FIELD_NUMBER: _ClassVar[int]
+    IF_NONE_MATCH_FIELD_NUMBER: _ClassVar[int]
+    IF_MODIFIED_SINCE_FIELD_NUMBER: _ClassVar[int]
+    IF_RANGE_FIELD_NUMBER: _ClassVar[int]
+    SIZE_FIELD_NUMBER: _ClassVar[int]
     image_id: str
-    def __init__(self, image_id: _Optional[str] = ...) -> None: ...
+    offset: int
+    length: int
+    if_none_match: _containers.RepeatedScalarFieldContainer[str]
+    if_modified_since: _timestamp_pb2.Timestamp
+    if_range: str
+    size: int
+    def __init__(self, image_id: _Optional[str] = ..., offset: _Optional[int] = ..., length: _Optional[int] = ..., if_none_match: _Optional[_Iterable[str]] = ..., if_modified_since: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., if_range: _Optional[str] = ..., size: _Optional[int] = ...) -> None: ...
 
 class ReadImageChunk(_message.Message):
     __slots__ = ("data",)
@@ -139,45 +163,191 @@ class ReadImageExifResponse(_message.Message):
     def __init__(self, width: _Optional[int] = ..., height: _Optional[int] = ..., format: _Optional[str] = ..., is_animated: bool = ..., camera_settings: _Optional[_Union[CameraSettingsExif, _Mapping]] = ..., exposure_settings: _Optional[_Union[ExposureSettings, _Mapping]] = ..., flash_info: _Optional[_Union[FlashInfo, _Mapping]] = ..., gps_info: _Optional[_Union[GPSInfo, _Mapping]] = ..., datetime_info: _Optional[_Union[DateTimeInfo, _Mapping]] = ...) -> None: ...
 
 class CompressImageRequest(_message.Message):
-    __slots__ = ("image_id", "quality")
+    __slots__ = ("image_id", "quality", "output_format")
     IMAGE_ID_FIELD_NUMBER: _ClassVar[int]
     QUALITY_FIELD_NUMBER: _ClassVar[int]
+    OUTPUT_FORMAT_FIELD_NUMBER: _ClassVar[int]
     image_id: str
     quality: int
-    def __init__(self, image_id: _Optional[str] = ..., quality: _Optional[int] = ...) -> None: ...
+    output_format: str
+    def __init__(self, image_id: _Optional[str] = ..., quality: _Optional[int] = ..., output_format: _Optional[str] = ...) -> None: ...
 
 class GrayscaleImageRequest(_message.Message):
-    __slots__ = ("image_id",)
+    __slots__ = ("image_id", "output_format", "output_quality")
     IMAGE_ID_FIELD_NUMBER: _ClassVar[int]
+    OUTPUT_FORMAT_FIELD_NUMBER: _ClassVar[int]
+    OUTPUT_QUALITY_FIELD_NUMBER: _ClassVar[int]
     image_id: str
-    def __init__(self, image_id: _Optional[str] = ...) -> None: ...
+    output_format: str
+    output_quality: int
+    def __init__(self, image_id: _Optional[str] = ..., output_format: _Optional[str] = ..., output_quality: _Optional[int] = ...) -> None: ...
 
 class RemoveBackgroundRequest(_message.Message):
-    __slots__ = ("image_id",)
+    __slots__ = ("image_id", "model", "output_format", "output_quality")
     IMAGE_ID_FIELD_NUMBER: _ClassVar[int]
+    MODEL_FIELD_NUMBER: _ClassVar[int]
+    OUTPUT_FORMAT_FIELD_NUMBER: _ClassVar[int]
+    OUTPUT_QUALITY_FIELD_NUMBER: _ClassVar[int]
     image_id: str
-    def __init__(self, image_id: _Optional[str] = ...) -> None: ...
+    model: str
+    output_format: str
+    output_quality: int
+    def __init__(self, image_id: _Optional[str] = ..., model: _Optional[str] = ..., output_format: _Optional[str] = ..., output_quality: _Optional[int] = ...) -> None: ...
 
 class RotateImageRequest(_message.Message):
-    __slots__ = ("image_id", "angle")
+    __slots__ = ("image_id", "angle", "output_format", "output_quality")
     IMAGE_ID_FIELD_NUMBER: _ClassVar[int]
     ANGLE_FIELD_NUMBER: _ClassVar[int]
+    OUTPUT_FORMAT_FIELD_NUMBER: _ClassVar[int]
+    OUTPUT_QUALITY_FIELD_NUMBER: _ClassVar[int]
     image_id: str
     angle: int
-    def __init__(self, image_id: _Optional[str] = ..., angle: _Optional[int] = ...) -> None: ...
+    output_format: str
+    output_quality: int
+    def __init__(self, image_id: _Optional[str] = ..., angle: _Optional[int] = ..., output_format: _Optional[str] = ..., output_quality: _Optional[int] = ...) -> None: ...
 
 class UpscaleImageRequest(_message.Message):
-    __slots__ = ("image_id", "algorithm", "scale")
+    __slots__ = ("image_id", "algorithm", "scale", "output_format", "output_quality")
     IMAGE_ID_FIELD_NUMBER: _ClassVar[int]
     ALGORITHM_FIELD_NUMBER: _ClassVar[int]
     SCALE_FIELD_NUMBER: _ClassVar[int]
+    OUTPUT_FORMAT_FIELD_NUMBER: _ClassVar[int]
+    OUTPUT_QUALITY_FIELD_NUMBER: _ClassVar[int]
     image_id: str
     algorithm: str
     scale: int
-    def __init__(self, image_id: _Optional[str] = ..., algorithm: _Optional[str] = ..., scale: _Optional[int] = ...) -> None: ...
+    output_format: str
+    output_quality: int
+    def __init__(self, image_id: _Optional[str] = ..., algorithm: _Optional[str] = ..., scale: _Optional[int] = ..., output_format: _Optional[str] = ..., output_quality: _Optional[int] = ...) -> None: ...
+
+class ImagePipelineOperation(_message.Message):
+    __slots__ = ("operation", "angle", "quality", "algorithm", "scale", "model")
+    OPERATION_FIELD_NUMBER: _ClassVar[int]
+    ANGLE_FIELD_NUMBER: _ClassVar[int]
+    QUALITY_FIELD_NUMBER: _ClassVar[int]
+    ALGORITHM_FIELD_NUMBER: _ClassVar[int]
+    SCALE_FIELD_NUMBER: _ClassVar[int]
+    MODEL_FIELD_NUMBER: _ClassVar[int]
+    operation: str
+    angle: int
+    quality: int
+    algorithm: str
+    scale: int
+    model: str
+    def __init__(self, operation: _Optional[str] = ..., angle: _Optional[int] = ..., quality: _Optional[int] = ..., algorithm: _Optional[str] = ..., scale: _Optional[int] = ..., model: _Optional[str] = ...) -> None: ...
+
+class ProcessImagePipelineRequest(_message.Message):
+    __slots__ = ("image_id", "operations", "output_format")
+    IMAGE_ID_FIELD_NUMBER: _ClassVar[int]
+    OPERATIONS_FIELD_NUMBER: _ClassVar[int]
+    OUTPUT_FORMAT_FIELD_NUMBER: _ClassVar[int]
+    image_id: str
+    operations: _containers.RepeatedCompositeFieldContainer[ImagePipelineOperation]
+    output_format: str
+    def __init__(self, image_id: _Optional[str] = ..., operations: _Optional[_Iterable[_Union[ImagePipelineOperation, _Mapping]]] = ..., output_format: _Optional[str] = ...) -> None: ...
 
 class TaskResponse(_message.Message):
     __slots__ = ("task_id",)
     TASK_ID_FIELD_NUMBER: _ClassVar[int]
     task_id: str
     def __init__(self, task_id: _Optional[str] = ...) -> None: ...
+
+class ProcessImagesBatchRequest(_message.Message):
+    __slots__ = ("image_ids", "operations", "output_format")
+    IMAGE_IDS_FIELD_NUMBER: _ClassVar[int]
+    OPERATIONS_FIELD_NUMBER: _ClassVar[int]
+    OUTPUT_FORMAT_FIELD_NUMBER: _ClassVar[int]
+    image_ids: _containers.RepeatedScalarFieldContainer[str]
+    operations: _containers.RepeatedCompositeFieldContainer[ImagePipelineOperation]
+    output_format: str
+    def __init__(self, image_ids: _Optional[_Iterable[str]] = ..., operations: _Optional[_Iterable[_Union[ImagePipelineOperation, _Mapping]]] = ..., output_format: _Optional[str] = ...) -> None: ...
+
+class TaskBatchResponse(_message.Message):
+    __slots__ = ("batch_id",)
+    BATCH_ID_FIELD_NUMBER: _ClassVar[int]
+    batch_id: str
+    def __init__(self, batch_id: _Optional[str] = ...) -> None: ...
+
+class ImageUploadUrlResponse(_message.Message):
+    __slots__ = ("image_id", "url", "expires_at")
+    IMAGE_ID_FIELD_NUMBER: _ClassVar[int]
+    URL_FIELD_NUMBER: _ClassVar[int]
+    EXPIRES_AT_FIELD_NUMBER: _ClassVar[int]
+    image_id: str
+    url: str
+    expires_at: _timestamp_pb2.Timestamp
+    def __init__(self, image_id: _Optional[str] = ..., url: _Optional[str] = ..., expires_at: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
+
+class CompleteImageUploadRequest(_message.Message):
+    __slots__ = ("image_id", "filename")
+    IMAGE_ID_FIELD_NUMBER: _ClassVar[int]
+    FILENAME_FIELD_NUMBER: _ClassVar[int]
+    image_id: str
+    filename: str
+    def __init__(self, image_id: _Optional[str] = ..., filename: _Optional[str] = ...) -> None: ...
+
+class SearchSimilarImagesRequest(_message.Message):
+    __slots__ = ("image_id", "max_distance", "limit")
+    IMAGE_ID_FIELD_NUMBER: _ClassVar[int]
+    MAX_DISTANCE_FIELD_NUMBER: _ClassVar[int]
+    LIMIT_FIELD_NUMBER: _ClassVar[int]
+    image_id: str
+    max_distance: int
+    limit: int
+    def __init__(self, image_id: _Optional[str] = ..., max_distance: _Optional[int] = ..., limit: _Optional[int] = ...) -> None: ...
+
+class SimilarImage(_message.Message):
+    __slots__ = ("image_id", "distance", "phash_distance", "dhash_distance", "ahash_distance")
+    IMAGE_ID_FIELD_NUMBER: _ClassVar[int]
+    DISTANCE_FIELD_NUMBER: _ClassVar[int]
+    PHASH_DISTANCE_FIELD_NUMBER: _ClassVar[int]
+    DHASH_DISTANCE_FIELD_NUMBER: _ClassVar[int]
+    AHASH_DISTANCE_FIELD_NUMBER: _ClassVar[int]
+    image_id: str
+    distance: int
+    phash_distance: int
+    dhash_distance: int
+    ahash_distance: int
+    def __init__(self, image_id: _Optional[str] = ..., distance: _Optional[int] = ..., phash_distance: _Optional[int] = ..., dhash_distance: _Optional[int] = ..., ahash_distance: _Optional[int] = ...) -> None: ...
+
+class SearchSimilarImagesResponse(_message.Message):
+    __slots__ = ("images",)
+    IMAGES_FIELD_NUMBER: _ClassVar[int]
+    images: _containers.RepeatedCompositeFieldContainer[SimilarImage]
+    def __init__(self, images: _Optional[_Iterable[_Union[SimilarImage, _Mapping]]] = ...) -> None: ...
+
+class ListImagesRequest(_message.Message):
+    __slots__ = ("limit", "cursor")
+    LIMIT_FIELD_NUMBER: _ClassVar[int]
+    CURSOR_FIELD_NUMBER: _ClassVar[int]
+    limit: int
+    cursor: str
+    def __init__(self, limit: _Optional[int] = ..., cursor: _Optional[str] = ...) -> None: ...
+
+class CatalogImage(_message.Message):
+    __slots__ = ("image_id", "filename", "width", "height", "content_type", "size", "created_at", "updated_at")
+    IMAGE_ID_FIELD_NUMBER: _ClassVar[int]
+    FILENAME_FIELD_NUMBER: _ClassVar[int]
+    WIDTH_FIELD_NUMBER: _ClassVar[int]
+    HEIGHT_FIELD_NUMBER: _ClassVar[int]
+    CONTENT_TYPE_FIELD_NUMBER: _ClassVar[int]
+    SIZE_FIELD_NUMBER: _ClassVar[int]
+    CREATED_AT_FIELD_NUMBER: _ClassVar[int]
+    UPDATED_AT_FIELD_NUMBER: _ClassVar[int]
+    image_id: str
+    filename: str
+    width: int
+    height: int
+    content_type: str
+    size: int
+    created_at: _timestamp_pb2.Timestamp
+    updated_at: _timestamp_pb2.Timestamp
+    def __init__(self, image_id: _Optional[str] = ..., filename: _Optional[str] = ..., width: _Optional[int] = ..., height: _Optional[int] = ..., content_type: _Optional[str] = ..., size: _Optional[int] = ..., created_at: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., updated_at: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
+
+class ListImagesResponse(_message.Message):
+    __slots__ = ("images", "next_cursor")
+    IMAGES_FIELD_NUMBER: _ClassVar[int]
+    NEXT_CURSOR_FIELD_NUMBER: _ClassVar[int]
+    images: _containers.RepeatedCompositeFieldContainer[CatalogImage]
+    next_cursor: str
+    def __init__(self, images: _Optional[_Iterable[_Union[CatalogImage, _Mapping]]] = ..., next_cursor: _Optional[str] = ...) -> None: ...
@@ -40,6 +40,11 @@ class ImageServiceStub(object):
                 request_serializer=v1_dot_image__pb2.CreateImageRequest.SerializeToString,
                 response_deserializer=v1_dot_image__pb2.CreateImageResponse.FromString,
                 _registered_method=True)
+        self.CreateImageStream = channel.stream_unary(
+                '/pix_erase.v1.ImageService/CreateImageStream',
+                request_serializer=v1_dot_image__pb2.CreateImageChunk.SerializeToString,
+                response_deserializer=v1_dot_image__pb2.CreateImageResponse.FromString,
+                _registered_method=True)
         self.ReadImage = channel.unary_stream(
                 '/pix_erase.v1.ImageService/ReadImage',
                 request_serializer=v1_dot_image__pb2.ReadImageRequest.SerializeToString,
@@ -80,6 +85,36 @@ class ImageServiceStub(object):
                 request_serializer=v1_dot_image__pb2.UpscaleImageRequest.SerializeToString,
                 response_deserializer=v1_dot_image__pb2.TaskResponse.FromString,
                 _registered_method=True)
+        self.ProcessImagePipeline = channel.unary_unary(
+                '/pix_erase.v1.ImageService/ProcessImagePipeline',
+                request_serializer=v1_dot_image__pb2.ProcessImagePipelineRequest.SerializeToString,
+                response_deserializer=v1_dot_image__pb2.TaskResponse.FromString,
+                _registered_method=True)
+        self.ProcessImagesBatch = channel.unary_unary(
+                '/pix_erase.v1.ImageService/ProcessImagesBatch',
+                request_serializer=v1_dot_image__pb2.ProcessImagesBatchRequest.SerializeToString,
+                response_deserializer=v1_dot_image__pb2.TaskBatchResponse.FromString,
+                _registered_method=True)
+        self.RequestImageUpload = channel.unary_unary(
+                '/pix_erase.v1.ImageService/RequestImageUpload',
+                request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+                response_deserializer=v1_dot_image__pb2.ImageUploadUrlResponse.FromString,
+                _registered_method=True)
+        self.CompleteImageUpload = channel.unary_unary(
+                '/pix_erase.v1.ImageService/CompleteImageUpload',
+                request_serializer=v1_dot_image__pb2.CompleteImageUploadRequest.SerializeToString,
+                response_deserializer=v1_dot_image__pb2.TaskResponse.FromString,
+                _registered_method=True)
+        self.SearchSimilarImages = channel.unary_unary(
+                '/pix_erase.v1.ImageService/SearchSimilarImages',
+                request_serializer=v1_dot_image__pb2.SearchSimilarImagesRequest.SerializeToString,
+                response_deserializer=v1_dot_image__pb2.SearchSimilarImagesResponse.FromString,
+                _registered_method=True)
+        self.ListImages = channel.unary_unary(
+                '/pix_erase.v1.ImageService/ListImages',
+                request_serializer=v1_dot_image__pb2.ListImagesRequest.SerializeToString,
+                response_deserializer=v1_dot_image__pb2.ListImagesResponse.FromString,
+                _registered_method=True)
 
 
 class ImageServiceServicer(object):
@@ -91,6 +126,12 @@ class ImageServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def CreateImageStream(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def ReadImage(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -139,6 +180,42 @@ class ImageServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def ProcessImagePipeline(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ProcessImagesBatch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def RequestImageUpload(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CompleteImageUpload(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SearchSimilarImages(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ListImages(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_ImageServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -147,6 +224,11 @@ def add_ImageServiceServicer_to_server(servicer, server):
                     request_deserializer=v1_dot_image__pb2.CreateImageRequest.FromString,
                     response_serializer=v1_dot_image__pb2.CreateImageResponse.SerializeToString,
             ),
+            'CreateImageStream': grpc.stream_unary_rpc_method_handler(
+                    servicer.CreateImageStream,
+                    request_deserializer=v1_dot_image__pb2.CreateImageChunk.FromString,
+                    response_serializer=v1_dot_image__pb2.CreateImageResponse.SerializeToString,
+            ),
             'ReadImage': grpc.unary_stream_rpc_method_handler(
                     servicer.ReadImage,
                     request_deserializer=v1_dot_image__pb2.ReadImageRequest.FromString,
@@ -187,6 +269,36 @@ def add_ImageServiceServicer_to_server(servicer, server):
                     request_deserializer=v1_dot_image__pb2.UpscaleImageRequest.FromString,
                     response_serializer=v1_dot_image__pb2.TaskResponse.SerializeToString,
             ),
+            'ProcessImagePipeline': grpc.unary_unary_rpc_method_handler(
+                    servicer.ProcessImagePipeline,
+                    request_deserializer=v1_dot_image__pb2.ProcessImagePipelineRequest.FromString,
+                    response_serializer=v1_dot_image__pb2.TaskResponse.SerializeToString,
+            ),
+            'ProcessImagesBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.ProcessImagesBatch,
+                    request_deserializer=v1_dot_image__pb2.ProcessImagesBatchRequest.FromString,
+                    response_serializer=v1_dot_image__pb2.TaskBatchResponse.SerializeToString,
+            ),
+            'RequestImageUpload': grpc.unary_unary_rpc_method_handler(
+                    servicer.RequestImageUpload,
+                    request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                    response_serializer=v1_dot_image__pb2.ImageUploadUrlResponse.SerializeToString,
+            ),
+            'CompleteImageUpload': grpc.unary_unary_rpc_method_handler(
+                    servicer.CompleteImageUpload,
+                    request_deserializer=v1_dot_image__pb2.CompleteImageUploadRequest.FromString,
+                    response_serializer=v1_dot_image__pb2.TaskResponse.SerializeToString,
+            ),
+            'SearchSimilarImages': grpc.unary_unary_rpc_method_handler(
+                    servicer.SearchSimilarImages,
+                    request_deserializer=v1_dot_image__pb2.SearchSimilarImagesRequest.FromString,
+                    response_serializer=v1_dot_image__pb2.SearchSimilarImagesResponse.SerializeToString,
+            ),
+            'ListImages': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListImages,
+                    request_deserializer=v1_dot_image__pb2.ListImagesRequest.FromString,
+                    response_serializer=v1_dot_image__pb2.ListImagesResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'pix_erase.v1.ImageService', rpc_method_handlers)
@@ -225,6 +337,33 @@ class ImageService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def CreateImageStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/pix_erase.v1.ImageService/CreateImageStream',
+            v1_dot_image__pb2.CreateImageChunk.SerializeToString,
+            v1_dot_image__pb2.CreateImageResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def ReadImage(request,
             target,
@@ -440,3 +579,165 @@ class ImageService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def ProcessImagePipeline(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pix_erase.v1.ImageService/ProcessImagePipeline',
+            v1_dot_image__pb2.ProcessImagePipelineRequest.SerializeToString,
+            v1_dot_image__pb2.TaskResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ProcessImagesBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pix_erase.v1.ImageService/ProcessImagesBatch',
+            v1_dot_image__pb2.ProcessImagesBatchRequest.SerializeToString,
+            v1_dot_image__pb2.TaskBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def RequestImageUpload(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pix_erase.v1.ImageService/RequestImageUpload',
+            google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            v1_dot_image__pb2.ImageUploadUrlResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def CompleteImageUpload(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pix_erase.v1.ImageService/CompleteImageUpload',
+            v1_dot_image__pb2.CompleteImageUploadRequest.SerializeToString,
+            v1_dot_image__pb2.TaskResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SearchSimilarImages(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pix_erase.v1.ImageService/SearchSimilarImages',
+            v1_dot_image__pb2.SearchSimilarImagesRequest.SerializeToString,
+            v1_dot_image__pb2.SearchSimilarImagesResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ListImages(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pix_erase.v1.ImageService/ListImages',
+            v1_dot_image__pb2.ListImagesRequest.SerializeToString,
+            v1_dot_image__pb2.ListImagesResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
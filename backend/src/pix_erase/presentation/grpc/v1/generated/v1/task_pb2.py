@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rv1/task.proto\x12\x0cpix_erase.v1\"&\n\x13ReadTaskByIDRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t\";\n\x14ReadTaskByIDResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t2d\n\x0bTaskService\x12U\n\x0cReadTaskByID\x12!.pix_erase.v1.ReadTaskByIDRequest\x1a\".pix_erase.v1.ReadTaskByIDResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rv1/task.proto\x12\x0cpix_erase.v1\"&\n\x13ReadTaskByIDRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t\";\n\x14ReadTaskByIDResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\",\n\x18ReadTaskBatchByIDRequest\x12\x10\n\x08\x62\x61tch_id\x18\x01 \x01(\t\"E\n\rTaskBatchItem\x12\x0f\n\x07task_id\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\"\x9e\x01\n\x19ReadTaskBatchByIDResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\r\n\x05total\x18\x02 \x01(\x05\x12\x11\n\tsucceeded\x18\x03 \x01(\x05\x12\x0e\n\x06\x66\x61iled\x18\x04 \x01(\x05\x12\x13\n\x0bin_progress\x18\x05 \x01(\x05\x12*\n\x05tasks\x18\x06 \x03(\x0b\x32\x1b.pix_erase.v1.TaskBatchItem2\xca\x01\n\x0bTaskService\x12U\n\x0cReadTaskByID\x12!.pix_erase.v1.ReadTaskByIDRequest\x1a\".pix_erase.v1.ReadTaskByIDResponse\x12\x64\n\x11ReadTaskBatchByID\x12&.pix_erase.v1.ReadTaskBatchByIDRequest\x1a\'.pix_erase.v1.ReadTaskBatchByIDResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -35,6 +35,12 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_READTASKBYIDREQUEST']._serialized_end=69
   _globals['_READTASKBYIDRESPONSE']._serialized_start=71
   _globals['_READTASKBYIDRESPONSE']._serialized_end=130
-  _globals['_TASKSERVICE']._serialized_start=132
-  _globals['_TASKSERVICE']._serialized_end=232
+  _globals['_READTASKBATCHBYIDREQUEST']._serialized_start=132
+  _globals['_READTASKBATCHBYIDREQUEST']._serialized_end=176
+  _globals['_TASKBATCHITEM']._serialized_start=178
+  _globals['_TASKBATCHITEM']._serialized_end=247
+  _globals['_READTASKBATCHBYIDRESPONSE']._serialized_start=250
+  _globals['_READTASKBATCHBYIDRESPONSE']._serialized_end=408
+  _globals['_TASKSERVICE']._serialized_start=411
+  _globals['_TASKSERVICE']._serialized_end=613
 # @@protoc_insertion_point(module_scope)
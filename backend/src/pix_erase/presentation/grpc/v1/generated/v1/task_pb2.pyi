@@ -1,6 +1,8 @@
+from google.protobuf.internal import containers as _containers
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
-from typing import ClassVar as _ClassVar, Optional as _Optional
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
@@ -17,3 +19,35 @@ class ReadTaskByIDResponse(_message.Message):
     status: str
     description: str
     def __init__(self, status: _Optional[str] = ..., description: _Optional[str] = ...) -> None: ...
+
+class ReadTaskBatchByIDRequest(_message.Message):
+    __slots__ = ("batch_id",)
+    BATCH_ID_FIELD_NUMBER: _ClassVar[int]
+    batch_id: str
+    def __init__(self, batch_id: _Optional[str] = ...) -> None: ...
+
+class TaskBatchItem(_message.Message):
+    __slots__ = ("task_id", "status", "description")
+    TASK_ID_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    task_id: str
+    status: str
+    description: str
+    def __init__(self, task_id: _Optional[str] = ..., status: _Optional[str] = ..., description: _Optional[str] = ...) -> None: ...
+
+class ReadTaskBatchByIDResponse(_message.Message):
+    __slots__ = ("status", "total", "succeeded", "failed", "in_progress", "tasks")
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_FIELD_NUMBER: _ClassVar[int]
+    SUCCEEDED_FIELD_NUMBER: _ClassVar[int]
+    FAILED_FIELD_NUMBER: _ClassVar[int]
+    IN_PROGRESS_FIELD_NUMBER: _ClassVar[int]
+    TASKS_FIELD_NUMBER: _ClassVar[int]
+    status: str
+    total: int
+    succeeded: int
+    failed: int
+    in_progress: int
+    tasks: _containers.RepeatedCompositeFieldContainer[TaskBatchItem]
+    def __init__(self, status: _Optional[str] = ..., total: _Optional[int] = ..., succeeded: _Optional[int] = ..., failed: _Optional[int] = ..., in_progress: _Optional[int] = ..., tasks: _Optional[_Iterable[_Union[TaskBatchItem, _Mapping]]] = ...) -> None: ...
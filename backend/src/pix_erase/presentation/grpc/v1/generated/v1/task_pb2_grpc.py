@@ -39,6 +39,11 @@ class TaskServiceStub(object):
                 request_serializer=v1_dot_task__pb2.ReadTaskByIDRequest.SerializeToString,
                 response_deserializer=v1_dot_task__pb2.ReadTaskByIDResponse.FromString,
                 _registered_method=True)
+        self.ReadTaskBatchByID = channel.unary_unary(
+                '/pix_erase.v1.TaskService/ReadTaskBatchByID',
+                request_serializer=v1_dot_task__pb2.ReadTaskBatchByIDRequest.SerializeToString,
+                response_deserializer=v1_dot_task__pb2.ReadTaskBatchByIDResponse.FromString,
+                _registered_method=True)
 
 
 class TaskServiceServicer(object):
@@ -50,6 +55,12 @@ class TaskServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def ReadTaskBatchByID(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_TaskServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -58,6 +69,11 @@ def add_TaskServiceServicer_to_server(servicer, server):
                     request_deserializer=v1_dot_task__pb2.ReadTaskByIDRequest.FromString,
                     response_serializer=v1_dot_task__pb2.ReadTaskByIDResponse.SerializeToString,
             ),
+            'ReadTaskBatchByID': grpc.unary_unary_rpc_method_handler(
+                    servicer.ReadTaskBatchByID,
+                    request_deserializer=v1_dot_task__pb2.ReadTaskBatchByIDRequest.FromString,
+                    response_serializer=v1_dot_task__pb2.ReadTaskBatchByIDResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'pix_erase.v1.TaskService', rpc_method_handlers)
@@ -95,3 +111,30 @@ class TaskService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def ReadTaskBatchByID(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pix_erase.v1.TaskService/ReadTaskBatchByID',
+            v1_dot_task__pb2.ReadTaskBatchByIDRequest.SerializeToString,
+            v1_dot_task__pb2.ReadTaskBatchByIDResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -7,10 +7,22 @@ import grpc.aio
 
 from pix_erase.application.errors.auth import AlreadyAuthenticatedError, AuthenticationError
 from pix_erase.application.errors.base import ApplicationError
+from pix_erase.application.errors.image import (
+    BadImageBatchError,
+    BadImageComparisonBatchError,
+    BadImagePipelineError,
+    DirectImageAccessDisabledError,
+    ImageNotIndexedError,
+    ImageRangeNotSatisfiableError,
+    UnknownBackgroundRemovalModelError,
+)
+from pix_erase.application.errors.task import TaskBatchDoesntBelongToThisUserError
 from pix_erase.application.errors.user import UserNotFoundByEmailError, UserNotFoundByIDError
 from pix_erase.domain.common.errors.base import AppError, DomainError, DomainFieldError
+from pix_erase.domain.image.errors.image import BadImageEncodingError, BadImageScaleError
 from pix_erase.domain.user.errors.access_service import AuthorizationError
 from pix_erase.infrastructure.errors.base import InfrastructureError
+from pix_erase.infrastructure.errors.image_converters import ImageDecodingError
 from pix_erase.infrastructure.errors.transaction_manager import RepoError, RollbackError
 
 logger: Final[logging.Logger] = logging.getLogger(__name__)
@@ -18,9 +30,20 @@ logger: Final[logging.Logger] = logging.getLogger(__name__)
 ERROR_TO_GRPC_STATUS: Final[MappingProxyType[type[Exception], grpc.StatusCode]] = MappingProxyType(
     {
         DomainFieldError: grpc.StatusCode.INVALID_ARGUMENT,
+        BadImageScaleError: grpc.StatusCode.INVALID_ARGUMENT,
+        BadImageEncodingError: grpc.StatusCode.INVALID_ARGUMENT,
+        BadImagePipelineError: grpc.StatusCode.INVALID_ARGUMENT,
+        BadImageBatchError: grpc.StatusCode.INVALID_ARGUMENT,
+        BadImageComparisonBatchError: grpc.StatusCode.INVALID_ARGUMENT,
+        UnknownBackgroundRemovalModelError: grpc.StatusCode.INVALID_ARGUMENT,
+        ImageDecodingError: grpc.StatusCode.INVALID_ARGUMENT,
+        ImageRangeNotSatisfiableError: grpc.StatusCode.OUT_OF_RANGE,
+        DirectImageAccessDisabledError: grpc.StatusCode.UNIMPLEMENTED,
+        ImageNotIndexedError: grpc.StatusCode.FAILED_PRECONDITION,
         AuthenticationError: grpc.StatusCode.UNAUTHENTICATED,
         AuthorizationError: grpc.StatusCode.PERMISSION_DENIED,
         AlreadyAuthenticatedError: grpc.StatusCode.PERMISSION_DENIED,
+        TaskBatchDoesntBelongToThisUserError: grpc.StatusCode.PERMISSION_DENIED,
         UserNotFoundByIDError: grpc.StatusCode.NOT_FOUND,
         UserNotFoundByEmailError: grpc.StatusCode.NOT_FOUND,
         DomainError: grpc.StatusCode.INTERNAL,
@@ -61,6 +84,9 @@ class ExceptionInterceptor(grpc.aio.ServerInterceptor):
 
             handler.unary_unary = wrapped_unary_unary
 
+        if handler.stream_unary:
+            handler.stream_unary = self._wrap_stream_unary(handler.stream_unary, handler_call_details)
+
         if handler.unary_stream:
             original_stream = handler.unary_stream
 
@@ -78,6 +104,18 @@ class ExceptionInterceptor(grpc.aio.ServerInterceptor):
 
         return handler
 
+    def _wrap_stream_unary(self, original: Any, handler_call_details: grpc.HandlerCallDetails) -> Any:  # noqa: ANN401
+        async def wrapped_stream_unary(
+            request_iterator: Any,  # noqa: ANN401
+            context: grpc.aio.ServicerContext,
+        ) -> Any:  # noqa: ANN401
+            try:
+                return await original(request_iterator, context)
+            except Exception as exc:  # noqa: BLE001
+                await self._handle_exception(exc, handler_call_details, context)
+
+        return wrapped_stream_unary
+
     @staticmethod
     async def _handle_exception(
         exc: Exception,
@@ -1,11 +1,17 @@
 from collections.abc import AsyncIterator
+from datetime import UTC, datetime
 from uuid import UUID
 
 import grpc.aio
 from dishka import FromDishka
 from dishka.integrations.grpcio import inject
 from google.protobuf.empty_pb2 import Empty
+from google.protobuf.timestamp_pb2 import Timestamp
 
+from pix_erase.application.commands.image.complete_image_upload import (
+    CompleteImageUploadCommand,
+    CompleteImageUploadCommandHandler,
+)
 from pix_erase.application.commands.image.compress_image import CompressImageCommand, CompressImageCommandHandler
 from pix_erase.application.commands.image.create_image import CreateImageCommand, CreateImageCommandHandler
 from pix_erase.application.commands.image.delete_image import DeleteImageCommand, DeleteImageCommandHandler
@@ -13,20 +19,114 @@ from pix_erase.application.commands.image.grayscale_image import (
     ConvertImageToGrayscaleCommand,
     GrayscaleImageCommandHandler,
 )
+from pix_erase.application.commands.image.process_image_pipeline import (
+    ImagePipelineStep,
+    ProcessImagePipelineCommand,
+    ProcessImagePipelineCommandHandler,
+)
+from pix_erase.application.commands.image.process_images_batch import (
+    ProcessImagesBatchCommand,
+    ProcessImagesBatchCommandHandler,
+)
 from pix_erase.application.commands.image.remove_background_image import (
     RemoveBackgroundImageCommand,
     RemoveBackgroundImageCommandHandler,
 )
+from pix_erase.application.commands.image.request_image_upload import (
+    RequestImageUploadCommand,
+    RequestImageUploadCommandHandler,
+)
 from pix_erase.application.commands.image.rotate_image import RotateImageCommand, RotateImageCommandHandler
 from pix_erase.application.commands.image.upscale_image import UpscaleImageCommand, UpscaleImageCommandHandler
-from pix_erase.application.queries.images.read_by_id import ReadImageByIDQuery, ReadImageByIDQueryHandler
+from pix_erase.application.common.views.image.read_image import (
+    ImageLinkView,
+    ImageNotModifiedView,
+    ReadImageByIDView,
+)
+from pix_erase.application.queries.images.list_images import DEFAULT_LIMIT as DEFAULT_LIST_LIMIT
+from pix_erase.application.queries.images.list_images import ListImagesQuery, ListImagesQueryHandler
+from pix_erase.application.queries.images.read_by_id import (
+    ReadImageByIDQuery,
+    ReadImageByIDQueryHandler,
+    RequestedByteRange,
+)
 from pix_erase.application.queries.images.read_exif_from_image_by_id import (
     ReadExifFromImageByIDQuery,
     ReadExifFromImageByIDQueryHandler,
 )
+from pix_erase.application.queries.images.reverse_search_image import (
+    DEFAULT_LIMIT,
+    DEFAULT_MAX_DISTANCE,
+    ReverseImageSearchQuery,
+    ReverseImageSearchQueryHandler,
+)
 from pix_erase.presentation.grpc.v1.generated.v1 import image_pb2, image_pb2_grpc
 
 
+async def _single_chunk(data: bytes) -> AsyncIterator[bytes]:
+    yield data
+
+
+async def _image_chunks(
+    first: image_pb2.CreateImageChunk | None,
+    rest: AsyncIterator[image_pb2.CreateImageChunk],
+) -> AsyncIterator[bytes]:
+    if first is None:
+        return
+
+    yield first.data
+
+    async for chunk in rest:
+        yield chunk.data
+
+
+def _timestamp(value: datetime) -> Timestamp:
+    timestamp = Timestamp()
+    timestamp.FromDatetime(value)
+    return timestamp
+
+
+def _requested_range(request: image_pb2.ReadImageRequest) -> RequestedByteRange | None:
+    if not request.HasField("offset"):
+        return RequestedByteRange(end=request.length) if request.HasField("length") else None
+
+    end: int | None = request.offset + request.length - 1 if request.HasField("length") else None
+    return RequestedByteRange(start=request.offset, end=end)
+
+
+def _read_image_query(request: image_pb2.ReadImageRequest) -> ReadImageByIDQuery:
+    return ReadImageByIDQuery(
+        image_id=UUID(request.image_id),
+        byte_range=_requested_range(request),
+        if_none_match=tuple(request.if_none_match),
+        if_modified_since=(
+            request.if_modified_since.ToDatetime(tzinfo=UTC) if request.HasField("if_modified_since") else None
+        ),
+        if_range=request.if_range if request.HasField("if_range") else None,
+        size=request.size if request.HasField("size") else None,
+    )
+
+
+def _read_image_metadata(
+    view: ReadImageByIDView | ImageNotModifiedView | ImageLinkView,
+) -> tuple[tuple[str, str], ...]:
+    if isinstance(view, ImageLinkView):
+        return (("location", view.url), ("expires-at", view.expires_at.isoformat()))
+
+    metadata: list[tuple[str, str]] = [("last-modified", view.updated_at.isoformat())]
+
+    if view.etag is not None:
+        metadata.append(("etag", view.etag))
+
+    if isinstance(view, ImageNotModifiedView):
+        metadata.append(("image-not-modified", "true"))
+    elif view.content_range is not None:
+        start, end, total_size = view.content_range.start, view.content_range.end, view.content_range.total_size
+        metadata.append(("content-range", f"bytes {start}-{end}/{total_size}"))
+
+    return tuple(metadata)
+
+
 class ImageServiceServicer(image_pb2_grpc.ImageServiceServicer):
     @inject
     async def CreateImage(  # noqa: N802
@@ -35,7 +135,22 @@ class ImageServiceServicer(image_pb2_grpc.ImageServiceServicer):
         context: grpc.aio.ServicerContext,  # noqa: ARG002
         handler: FromDishka[CreateImageCommandHandler],
     ) -> image_pb2.CreateImageResponse:
-        command = CreateImageCommand(data=request.image_data, filename=request.filename)
+        command = CreateImageCommand(stream=_single_chunk(request.image_data), filename=request.filename)
+        view = await handler(command)
+        return image_pb2.CreateImageResponse(image_id=str(view.image_id))
+
+    @inject
+    async def CreateImageStream(  # noqa: N802
+        self,
+        request_iterator: AsyncIterator[image_pb2.CreateImageChunk],
+        context: grpc.aio.ServicerContext,  # noqa: ARG002
+        handler: FromDishka[CreateImageCommandHandler],
+    ) -> image_pb2.CreateImageResponse:
+        first: image_pb2.CreateImageChunk | None = await anext(request_iterator, None)
+        command = CreateImageCommand(
+            stream=_image_chunks(first, request_iterator),
+            filename=first.filename if first is not None else "",
+        )
         view = await handler(command)
         return image_pb2.CreateImageResponse(image_id=str(view.image_id))
 
@@ -43,11 +158,15 @@ class ImageServiceServicer(image_pb2_grpc.ImageServiceServicer):
     async def ReadImage(  # noqa: N802
         self,
         request: image_pb2.ReadImageRequest,
-        context: grpc.aio.ServicerContext,  # noqa: ARG002
+        context: grpc.aio.ServicerContext,
         handler: FromDishka[ReadImageByIDQueryHandler],
     ) -> AsyncIterator[image_pb2.ReadImageChunk]:
-        query = ReadImageByIDQuery(image_id=UUID(request.image_id))
-        view = await handler(query)
+        view = await handler(_read_image_query(request))
+        await context.send_initial_metadata(_read_image_metadata(view))
+
+        if isinstance(view, ImageNotModifiedView | ImageLinkView):
+            return
+
         async for chunk in view.data:
             yield image_pb2.ReadImageChunk(data=chunk)
 
@@ -121,7 +240,11 @@ class ImageServiceServicer(image_pb2_grpc.ImageServiceServicer):
         context: grpc.aio.ServicerContext,  # noqa: ARG002
         handler: FromDishka[CompressImageCommandHandler],
     ) -> image_pb2.TaskResponse:
-        command = CompressImageCommand(image_id=UUID(request.image_id), quality=request.quality)
+        command = CompressImageCommand(
+            image_id=UUID(request.image_id),
+            quality=request.quality,
+            output_format=request.output_format if request.HasField("output_format") else None,
+        )
         task_id = await handler(command)
         return image_pb2.TaskResponse(task_id=str(task_id))
 
@@ -132,7 +255,11 @@ class ImageServiceServicer(image_pb2_grpc.ImageServiceServicer):
         context: grpc.aio.ServicerContext,  # noqa: ARG002
         handler: FromDishka[GrayscaleImageCommandHandler],
     ) -> image_pb2.TaskResponse:
-        command = ConvertImageToGrayscaleCommand(image_id=UUID(request.image_id))
+        command = ConvertImageToGrayscaleCommand(
+            image_id=UUID(request.image_id),
+            output_format=request.output_format if request.HasField("output_format") else None,
+            output_quality=request.output_quality if request.HasField("output_quality") else None,
+        )
         task_id = await handler(command)
         return image_pb2.TaskResponse(task_id=str(task_id))
 
@@ -143,7 +270,12 @@ class ImageServiceServicer(image_pb2_grpc.ImageServiceServicer):
         context: grpc.aio.ServicerContext,  # noqa: ARG002
         handler: FromDishka[RemoveBackgroundImageCommandHandler],
     ) -> image_pb2.TaskResponse:
-        command = RemoveBackgroundImageCommand(image_id=UUID(request.image_id))
+        command = RemoveBackgroundImageCommand(
+            image_id=UUID(request.image_id),
+            model=request.model if request.HasField("model") else None,
+            output_format=request.output_format if request.HasField("output_format") else None,
+            output_quality=request.output_quality if request.HasField("output_quality") else None,
+        )
         task_id = await handler(command)
         return image_pb2.TaskResponse(task_id=str(task_id))
 
@@ -154,7 +286,12 @@ class ImageServiceServicer(image_pb2_grpc.ImageServiceServicer):
         context: grpc.aio.ServicerContext,  # noqa: ARG002
         handler: FromDishka[RotateImageCommandHandler],
     ) -> image_pb2.TaskResponse:
-        command = RotateImageCommand(image_id=UUID(request.image_id), angle=request.angle)
+        command = RotateImageCommand(
+            image_id=UUID(request.image_id),
+            angle=request.angle,
+            output_format=request.output_format if request.HasField("output_format") else None,
+            output_quality=request.output_quality if request.HasField("output_quality") else None,
+        )
         task_id = await handler(command)
         return image_pb2.TaskResponse(task_id=str(task_id))
 
@@ -169,6 +306,136 @@ class ImageServiceServicer(image_pb2_grpc.ImageServiceServicer):
             image_id=UUID(request.image_id),
             algorithm=request.algorithm,
             scale=request.scale,
+            output_format=request.output_format if request.HasField("output_format") else None,
+            output_quality=request.output_quality if request.HasField("output_quality") else None,
+        )
+        task_id = await handler(command)
+        return image_pb2.TaskResponse(task_id=str(task_id))
+
+    @inject
+    async def ProcessImagePipeline(  # noqa: N802
+        self,
+        request: image_pb2.ProcessImagePipelineRequest,
+        context: grpc.aio.ServicerContext,  # noqa: ARG002
+        handler: FromDishka[ProcessImagePipelineCommandHandler],
+    ) -> image_pb2.TaskResponse:
+        command = ProcessImagePipelineCommand(
+            image_id=UUID(request.image_id),
+            operations=[
+                ImagePipelineStep(
+                    operation=operation.operation,
+                    angle=operation.angle if operation.HasField("angle") else None,
+                    quality=operation.quality if operation.HasField("quality") else None,
+                    algorithm=operation.algorithm if operation.HasField("algorithm") else None,
+                    scale=operation.scale if operation.HasField("scale") else None,
+                    model=operation.model if operation.HasField("model") else None,
+                )
+                for operation in request.operations
+            ],
+            output_format=request.output_format if request.HasField("output_format") else None,
         )
         task_id = await handler(command)
         return image_pb2.TaskResponse(task_id=str(task_id))
+
+    @inject
+    async def ProcessImagesBatch(  # noqa: N802
+        self,
+        request: image_pb2.ProcessImagesBatchRequest,
+        context: grpc.aio.ServicerContext,  # noqa: ARG002
+        handler: FromDishka[ProcessImagesBatchCommandHandler],
+    ) -> image_pb2.TaskBatchResponse:
+        command = ProcessImagesBatchCommand(
+            image_ids=[UUID(image_id) for image_id in request.image_ids],
+            operations=[
+                ImagePipelineStep(
+                    operation=operation.operation,
+                    angle=operation.angle if operation.HasField("angle") else None,
+                    quality=operation.quality if operation.HasField("quality") else None,
+                    algorithm=operation.algorithm if operation.HasField("algorithm") else None,
+                    scale=operation.scale if operation.HasField("scale") else None,
+                    model=operation.model if operation.HasField("model") else None,
+                )
+                for operation in request.operations
+            ],
+            output_format=request.output_format if request.HasField("output_format") else None,
+        )
+        batch_id = await handler(command)
+        return image_pb2.TaskBatchResponse(batch_id=str(batch_id))
+
+    @inject
+    async def RequestImageUpload(  # noqa: N802
+        self,
+        request: Empty,  # noqa: ARG002
+        context: grpc.aio.ServicerContext,  # noqa: ARG002
+        handler: FromDishka[RequestImageUploadCommandHandler],
+    ) -> image_pb2.ImageUploadUrlResponse:
+        view = await handler(RequestImageUploadCommand())
+        expires_at = Timestamp()
+        expires_at.FromDatetime(view.expires_at)
+        return image_pb2.ImageUploadUrlResponse(image_id=str(view.image_id), url=view.url, expires_at=expires_at)
+
+    @inject
+    async def CompleteImageUpload(  # noqa: N802
+        self,
+        request: image_pb2.CompleteImageUploadRequest,
+        context: grpc.aio.ServicerContext,  # noqa: ARG002
+        handler: FromDishka[CompleteImageUploadCommandHandler],
+    ) -> image_pb2.TaskResponse:
+        command = CompleteImageUploadCommand(image_id=UUID(request.image_id), filename=request.filename)
+        task_id = await handler(command)
+        return image_pb2.TaskResponse(task_id=str(task_id))
+
+    @inject
+    async def SearchSimilarImages(  # noqa: N802
+        self,
+        request: image_pb2.SearchSimilarImagesRequest,
+        context: grpc.aio.ServicerContext,  # noqa: ARG002
+        handler: FromDishka[ReverseImageSearchQueryHandler],
+    ) -> image_pb2.SearchSimilarImagesResponse:
+        query = ReverseImageSearchQuery(
+            image_id=UUID(request.image_id),
+            max_distance=request.max_distance if request.HasField("max_distance") else DEFAULT_MAX_DISTANCE,
+            limit=request.limit if request.HasField("limit") else DEFAULT_LIMIT,
+        )
+        view = await handler(query)
+        return image_pb2.SearchSimilarImagesResponse(
+            images=[
+                image_pb2.SimilarImage(
+                    image_id=str(image.image_id),
+                    distance=image.distance,
+                    phash_distance=image.phash_distance,
+                    dhash_distance=image.dhash_distance,
+                    ahash_distance=image.ahash_distance,
+                )
+                for image in view.images
+            ],
+        )
+
+    @inject
+    async def ListImages(  # noqa: N802
+        self,
+        request: image_pb2.ListImagesRequest,
+        context: grpc.aio.ServicerContext,  # noqa: ARG002
+        handler: FromDishka[ListImagesQueryHandler],
+    ) -> image_pb2.ListImagesResponse:
+        query = ListImagesQuery(
+            limit=request.limit if request.HasField("limit") else DEFAULT_LIST_LIMIT,
+            cursor=request.cursor if request.HasField("cursor") else None,
+        )
+        view = await handler(query)
+        return image_pb2.ListImagesResponse(
+            images=[
+                image_pb2.CatalogImage(
+                    image_id=str(image.image_id),
+                    filename=image.filename,
+                    width=image.width,
+                    height=image.height,
+                    content_type=image.content_type,
+                    size=image.size,
+                    created_at=_timestamp(image.created_at),
+                    updated_at=_timestamp(image.updated_at),
+                )
+                for image in view.images
+            ],
+            next_cursor=view.next_cursor,
+        )
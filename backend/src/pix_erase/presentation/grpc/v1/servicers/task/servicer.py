@@ -2,6 +2,10 @@ import grpc.aio
 from dishka import FromDishka
 from dishka.integrations.grpcio import inject
 
+from pix_erase.application.queries.tasks.read_task_batch_by_id import (
+    ReadTaskBatchByIDQuery,
+    ReadTaskBatchByIDQueryHandler,
+)
 from pix_erase.application.queries.tasks.read_task_by_id import ReadTaskByIDQuery, ReadTaskByIDQueryHandler
 from pix_erase.presentation.grpc.v1.generated.v1 import task_pb2, task_pb2_grpc
 
@@ -20,3 +24,24 @@ class TaskServiceServicer(task_pb2_grpc.TaskServiceServicer):
             status=view.status,
             description=view.description,
         )
+
+    @inject
+    async def ReadTaskBatchByID(  # noqa: N802
+        self,
+        request: task_pb2.ReadTaskBatchByIDRequest,
+        context: grpc.aio.ServicerContext,  # noqa: ARG002
+        handler: FromDishka[ReadTaskBatchByIDQueryHandler],
+    ) -> task_pb2.ReadTaskBatchByIDResponse:
+        query = ReadTaskBatchByIDQuery(batch_id=request.batch_id)
+        view = await handler(query)
+        return task_pb2.ReadTaskBatchByIDResponse(
+            status=view.status,
+            total=view.total,
+            succeeded=view.succeeded,
+            failed=view.failed,
+            in_progress=view.in_progress,
+            tasks=[
+                task_pb2.TaskBatchItem(task_id=task.task_id, status=task.status, description=task.description)
+                for task in view.tasks
+            ],
+        )
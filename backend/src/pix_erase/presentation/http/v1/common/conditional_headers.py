@@ -0,0 +1,75 @@
+"""
+Parsing of headers of range and conditional requests (RFC 9110).
+
+A header that can't be parsed is ignored, as the RFC allows, so the client gets the whole image.
+"""
+
+import re
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Final
+
+from pix_erase.application.queries.images.read_by_id import RequestedByteRange
+
+SINGLE_BYTE_RANGE: Final[re.Pattern[str]] = re.compile(r"^bytes=(\d*)-(\d*)$")
+ETAG_SEPARATOR: Final[str] = ","
+
+
+def parse_range(value: str | None) -> RequestedByteRange | None:
+    """Only one range is served, a request of several ranges gets the whole image."""
+    if value is None:
+        return None
+
+    match: re.Match[str] | None = SINGLE_BYTE_RANGE.match(value.strip())
+
+    if match is None:
+        return None
+
+    start, end = match.groups()
+
+    if not start and not end:
+        return None
+
+    if start and end and int(end) < int(start):
+        return None
+
+    return RequestedByteRange(
+        start=int(start) if start else None,
+        end=int(end) if end else None,
+    )
+
+
+def parse_etags(value: str | None) -> tuple[str, ...]:
+    if value is None:
+        return ()
+
+    return tuple(etag.strip() for etag in value.split(ETAG_SEPARATOR) if etag.strip())
+
+
+def parse_http_date(value: str | None) -> datetime | None:
+    if value is None:
+        return None
+
+    try:
+        parsed: datetime = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=UTC)
+
+
+def parse_if_range(value: str | None) -> str | datetime | None:
+    """If-Range holds either an ETag or a date of the last modification."""
+    if value is None:
+        return None
+
+    value = value.strip()
+
+    if value.startswith(('"', "W/")):
+        return value
+
+    return parse_http_date(value)
+
+
+def format_http_date(value: datetime) -> str:
+    return format_datetime(value.astimezone(UTC), usegmt=True)
@@ -11,16 +11,31 @@ from fastapi.responses import ORJSONResponse
 
 from pix_erase.application.errors.auth import AlreadyAuthenticatedError, AuthenticationError
 from pix_erase.application.errors.base import ApplicationError
-from pix_erase.application.errors.image import ImageDoesntBelongToThisUserError, ImageNotFoundError
+from pix_erase.application.errors.image import (
+    BadImageBatchError,
+    BadImageComparisonBatchError,
+    BadImagePipelineError,
+    DirectImageAccessDisabledError,
+    ImageDoesntBelongToThisUserError,
+    ImageNotFoundError,
+    ImageNotIndexedError,
+    ImageRangeNotSatisfiableError,
+    UnknownBackgroundRemovalModelError,
+)
 from pix_erase.application.errors.query_params import PaginationError, SortingError
-from pix_erase.application.errors.task import TaskNotFoundError
+from pix_erase.application.errors.task import TaskBatchDoesntBelongToThisUserError, TaskNotFoundError
 from pix_erase.application.errors.user import UserAlreadyExistsError, UserNotFoundByEmailError, UserNotFoundByIDError
 from pix_erase.domain.common.errors.base import (
     AppError,
     DomainError,
     DomainFieldError,
 )
-from pix_erase.domain.image.errors.image import BadImageNameError, BadImageSizeError
+from pix_erase.domain.image.errors.image import (
+    BadImageEncodingError,
+    BadImageNameError,
+    BadImageScaleError,
+    BadImageSizeError,
+)
 from pix_erase.domain.internet_protocol.errors.internet_protocol import (
     BadPackageSizeError,
     BadTimeOutError,
@@ -87,6 +102,12 @@ class ExceptionHandler:
             TooSmallUserAccountNameError: status.HTTP_400_BAD_REQUEST,
             BadImageNameError: status.HTTP_400_BAD_REQUEST,
             BadImageSizeError: status.HTTP_400_BAD_REQUEST,
+            BadImageScaleError: status.HTTP_400_BAD_REQUEST,
+            BadImageEncodingError: status.HTTP_400_BAD_REQUEST,
+            BadImagePipelineError: status.HTTP_400_BAD_REQUEST,
+            BadImageBatchError: status.HTTP_400_BAD_REQUEST,
+            BadImageComparisonBatchError: status.HTTP_400_BAD_REQUEST,
+            UnknownBackgroundRemovalModelError: status.HTTP_400_BAD_REQUEST,
             EmptyPasswordWasProvidedError: status.HTTP_400_BAD_REQUEST,
             WeakPasswordWasProvidedError: status.HTTP_400_BAD_REQUEST,
             WrongUserAccountEmailFormatError: status.HTTP_400_BAD_REQUEST,
@@ -109,6 +130,7 @@ class ExceptionHandler:
             RoleAssignmentNotPermittedError: status.HTTP_403_FORBIDDEN,
             AlreadyAuthenticatedError: status.HTTP_403_FORBIDDEN,
             ImageDoesntBelongToThisUserError: status.HTTP_403_FORBIDDEN,
+            TaskBatchDoesntBelongToThisUserError: status.HTTP_403_FORBIDDEN,
             # 415
             ImageDecodingError: status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
             # 404
@@ -124,6 +146,9 @@ class ExceptionHandler:
             SortingError: status.HTTP_409_CONFLICT,
             EntityAddError: status.HTTP_409_CONFLICT,
             UserAlreadyExistsError: status.HTTP_409_CONFLICT,
+            ImageNotIndexedError: status.HTTP_409_CONFLICT,
+            # 416
+            ImageRangeNotSatisfiableError: status.HTTP_416_RANGE_NOT_SATISFIABLE,
             # 422
             pydantic.ValidationError: status.HTTP_422_UNPROCESSABLE_CONTENT,
             PaginationError: status.HTTP_422_UNPROCESSABLE_CONTENT,
@@ -144,6 +169,8 @@ class ExceptionHandler:
             PortScanNetworkError: status.HTTP_500_INTERNAL_SERVER_ERROR,
             PortScanConnectionError: status.HTTP_500_INTERNAL_SERVER_ERROR,
             PortScanCancelledError: status.HTTP_500_INTERNAL_SERVER_ERROR,
+            # 501
+            DirectImageAccessDisabledError: status.HTTP_501_NOT_IMPLEMENTED,
             # 503
             RepoError: status.HTTP_503_SERVICE_UNAVAILABLE,
             RollbackError: status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -0,0 +1,27 @@
+from typing import Annotated
+
+from pydantic import Field
+
+from pix_erase.domain.image.values.image_encoding import MAX_QUALITY, MIN_QUALITY, ImageFormat
+
+OutputFormat = Annotated[
+    ImageFormat | None,
+    Field(
+        title="Output format",
+        description="Format of the converted image. When not set, the format of the source image is kept, "
+        "images with transparency are saved in PNG if the source format can't keep it",
+        examples=["JPEG", "PNG", "WEBP"],
+    ),
+]
+
+OutputQuality = Annotated[
+    int | None,
+    Field(
+        title="Output quality",
+        description="Quality of JPEG and WebP result in percents, ignored for PNG. "
+        "When not set, the default quality of the format is used",
+        examples=[75, 90],
+        ge=MIN_QUALITY,
+        le=MAX_QUALITY,
+    ),
+]
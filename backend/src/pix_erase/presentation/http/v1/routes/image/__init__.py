@@ -8,9 +8,14 @@ from pix_erase.presentation.http.v1.routes.image.create_image.handlers import cr
 from pix_erase.presentation.http.v1.routes.image.delete_image.handlers import delete_image_router
 from pix_erase.presentation.http.v1.routes.image.exif_image.handlers import exif_image_router
 from pix_erase.presentation.http.v1.routes.image.grayscale_image.handlers import grayscale_image_router
+from pix_erase.presentation.http.v1.routes.image.list_images.handlers import list_images_router
+from pix_erase.presentation.http.v1.routes.image.process_image_pipeline.handlers import process_image_pipeline_router
+from pix_erase.presentation.http.v1.routes.image.process_images_batch.handlers import process_images_batch_router
 from pix_erase.presentation.http.v1.routes.image.read_image.handlers import read_image_router
 from pix_erase.presentation.http.v1.routes.image.remove_background.handlers import remove_background_router
+from pix_erase.presentation.http.v1.routes.image.reverse_search_image.handlers import reverse_search_image_router
 from pix_erase.presentation.http.v1.routes.image.rotate_image.handlers import rotate_image_router
+from pix_erase.presentation.http.v1.routes.image.upload_image.handlers import upload_image_router
 from pix_erase.presentation.http.v1.routes.image.upscale_image.handlers import upscale_image_router
 
 image_router: Final[APIRouter] = APIRouter(
@@ -22,12 +27,17 @@ sub_routers: Final[Iterable[APIRouter]] = (
     rotate_image_router,
     compress_image_router,
     create_image_router,
+    upload_image_router,
     grayscale_image_router,
     delete_image_router,
     read_image_router,
     exif_image_router,
+    reverse_search_image_router,
+    list_images_router,
     remove_background_router,
     upscale_image_router,
+    process_image_pipeline_router,
+    process_images_batch_router,
 )
 
 for sub_router in sub_routers:
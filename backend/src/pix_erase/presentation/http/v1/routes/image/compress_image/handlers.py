@@ -59,6 +59,10 @@ async def compress_image_handler(
     request_schema: CompressImageRequestSchema,
     interactor: FromDishka[CompressImageCommandHandler],
 ) -> CompressImageResponseSchema:
-    command: CompressImageCommand = CompressImageCommand(image_id=image_id, quality=request_schema.quality)
+    command: CompressImageCommand = CompressImageCommand(
+        image_id=image_id,
+        quality=request_schema.quality,
+        output_format=request_schema.output_format,
+    )
     task_id: str = await interactor(command)
     return CompressImageResponseSchema(task_id=task_id)
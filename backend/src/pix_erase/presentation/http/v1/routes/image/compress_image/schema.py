@@ -2,6 +2,8 @@ from typing import Annotated
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from pix_erase.presentation.http.v1.common.image_encoding import OutputFormat
+
 
 class CompressImageRequestSchema(BaseModel):
     model_config = ConfigDict(frozen=True)
@@ -16,6 +18,7 @@ class CompressImageRequestSchema(BaseModel):
             le=100,
         ),
     ]
+    output_format: OutputFormat = None
 
 
 class CompressImageResponseSchema(BaseModel):
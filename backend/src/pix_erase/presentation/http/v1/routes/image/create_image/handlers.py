@@ -1,5 +1,6 @@
 import random
 import string
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 from inspect import getdoc
 from typing import TYPE_CHECKING, Annotated, Final
@@ -26,6 +27,14 @@ create_image_router: Final[APIRouter] = APIRouter(
 )
 tracer: Final[Tracer] = trace.get_tracer(__name__)
 
+# starlette spools the uploaded file to disk, it's read back by chunks of this size
+UPLOAD_CHUNK_SIZE: Final[int] = 1024 * 1024
+
+
+async def _read_chunks(file: UploadFile) -> AsyncIterator[bytes]:
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        yield chunk
+
 
 @create_image_router.post(
     "/",
@@ -69,11 +78,10 @@ async def create_image_handler(
     letters: str = string.ascii_lowercase
     result_str: str = "".join(random.choice(letters) for _ in range(20))  # nosec B311
 
-    content: bytes = await image.read()
     filename: str = image.filename if image.filename is not None else result_str
 
     command: CreateImageCommand = CreateImageCommand(
-        data=content,
+        stream=_read_chunks(image),
         filename=filename,
     )
 
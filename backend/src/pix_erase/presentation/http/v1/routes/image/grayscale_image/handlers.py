@@ -6,7 +6,7 @@ from uuid import UUID
 from asgi_monitor.tracing import span
 from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
-from fastapi import APIRouter, Path, status
+from fastapi import APIRouter, Depends, Path, status
 from opentelemetry import trace
 from opentelemetry.trace import Tracer
 
@@ -15,7 +15,10 @@ from pix_erase.application.commands.image.grayscale_image import (
     GrayscaleImageCommandHandler,
 )
 from pix_erase.presentation.http.v1.common.exception_handler import ExceptionSchema, ExceptionSchemaRich
-from pix_erase.presentation.http.v1.routes.image.grayscale_image.schemas import GrayScaleImageSchemaResponse
+from pix_erase.presentation.http.v1.routes.image.grayscale_image.schemas import (
+    GrayScaleImageSchemaRequest,
+    GrayScaleImageSchemaResponse,
+)
 
 grayscale_image_router: Final[APIRouter] = APIRouter(route_class=DishkaRoute, tags=["Image"])
 tracer: Final[Tracer] = trace.get_tracer(__name__)
@@ -56,10 +59,13 @@ ImageIDPathParameter = Path(
 )
 async def grayscale_image_handler(
     image_id: Annotated[UUID, ImageIDPathParameter],
+    schema_request: Annotated[GrayScaleImageSchemaRequest, Depends()],
     interactor: FromDishka[GrayscaleImageCommandHandler],
 ) -> GrayScaleImageSchemaResponse:
     command: ConvertImageToGrayscaleCommand = ConvertImageToGrayscaleCommand(
         image_id=image_id,
+        output_format=schema_request.output_format,
+        output_quality=schema_request.output_quality,
     )
 
     task_id: str = await interactor(command)
@@ -2,6 +2,15 @@ from typing import Annotated
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from pix_erase.presentation.http.v1.common.image_encoding import OutputFormat, OutputQuality
+
+
+class GrayScaleImageSchemaRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    output_format: OutputFormat = None
+    output_quality: OutputQuality = None
+
 
 class GrayScaleImageSchemaResponse(BaseModel):
     model_config = ConfigDict(frozen=True)
@@ -0,0 +1,92 @@
+from datetime import UTC, datetime
+from inspect import getdoc
+from typing import TYPE_CHECKING, Annotated, Final
+
+from asgi_monitor.tracing import span
+from dishka import FromDishka
+from dishka.integrations.fastapi import DishkaRoute
+from fastapi import APIRouter, Query, status
+from opentelemetry import trace
+from opentelemetry.trace import Tracer
+
+from pix_erase.application.queries.images.list_images import (
+    DEFAULT_LIMIT,
+    MAX_LIMIT,
+    ListImagesQuery,
+    ListImagesQueryHandler,
+)
+from pix_erase.presentation.http.v1.common.exception_handler import ExceptionSchema, ExceptionSchemaRich
+from pix_erase.presentation.http.v1.routes.image.list_images.schemas import (
+    ImageCatalogItemSchemaResponse,
+    ListImagesSchemaResponse,
+)
+
+if TYPE_CHECKING:
+    from pix_erase.application.common.views.image.list_images import ListImagesView
+
+list_images_router: Final[APIRouter] = APIRouter(
+    tags=["Image"],
+    route_class=DishkaRoute,
+)
+tracer: Final[Tracer] = trace.get_tracer(__name__)
+
+LimitQueryParameter = Query(
+    title="Limit",
+    description="Max count of returned images",
+    examples=[20],
+    ge=1,
+    le=MAX_LIMIT,
+)
+CursorQueryParameter = Query(
+    title="Cursor",
+    description="Cursor of the page from the previous response, the first page is read without it",
+)
+
+
+@list_images_router.get(
+    "/",
+    status_code=status.HTTP_200_OK,
+    summary="List images of current user",
+    description=getdoc(ListImagesQueryHandler),
+    response_model=ListImagesSchemaResponse,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ExceptionSchema},
+        status.HTTP_422_UNPROCESSABLE_CONTENT: {"model": ExceptionSchemaRich},
+    },
+)
+@span(
+    tracer=tracer,
+    name="span image list http",
+    attributes={
+        "http.request.method": "GET",
+        "url.path": "/image/",
+        "http.route": "/image/",
+        "feature": "image",
+        "action": "list",
+        "time": datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S"),
+    },
+)
+async def list_images_handler(
+    interactor: FromDishka[ListImagesQueryHandler],
+    limit: Annotated[int, LimitQueryParameter] = DEFAULT_LIMIT,
+    cursor: Annotated[str | None, CursorQueryParameter] = None,
+) -> ListImagesSchemaResponse:
+    view: ListImagesView = await interactor(ListImagesQuery(limit=limit, cursor=cursor))
+
+    return ListImagesSchemaResponse(
+        images=[
+            ImageCatalogItemSchemaResponse(
+                image_id=image.image_id,
+                filename=image.filename,
+                width=image.width,
+                height=image.height,
+                content_type=image.content_type,
+                size=image.size,
+                created_at=image.created_at,
+                updated_at=image.updated_at,
+            )
+            for image in view.images
+        ],
+        next_cursor=view.next_cursor,
+    )
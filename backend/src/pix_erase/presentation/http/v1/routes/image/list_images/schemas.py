@@ -0,0 +1,28 @@
+from datetime import datetime
+from typing import Annotated
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ImageCatalogItemSchemaResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    image_id: Annotated[UUID, Field(description="ID of the image")]
+    filename: Annotated[str | None, Field(description="Name of the uploaded file, empty until the image is stored")]
+    width: Annotated[int | None, Field(description="Width in pixels, empty until the image is stored")]
+    height: Annotated[int | None, Field(description="Height in pixels, empty until the image is stored")]
+    content_type: Annotated[str | None, Field(description="MIME type of the image, empty until the image is stored")]
+    size: Annotated[int | None, Field(description="Size of the image in bytes, empty until the image is stored")]
+    created_at: Annotated[datetime, Field(description="When the image was added")]
+    updated_at: Annotated[datetime, Field(description="When the image was changed last time")]
+
+
+class ListImagesSchemaResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    images: Annotated[list[ImageCatalogItemSchemaResponse], Field(description="Images, the newest first")]
+    next_cursor: Annotated[
+        str | None,
+        Field(description="Cursor of the next page, empty on the last page"),
+    ]
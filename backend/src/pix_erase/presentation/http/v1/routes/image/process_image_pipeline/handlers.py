@@ -0,0 +1,74 @@
+from datetime import UTC, datetime
+from inspect import getdoc
+from typing import Annotated, Final
+from uuid import UUID
+
+from asgi_monitor.tracing import span
+from dishka import FromDishka
+from dishka.integrations.fastapi import DishkaRoute
+from fastapi import APIRouter, Path, status
+from opentelemetry import trace
+from opentelemetry.trace import Tracer
+
+from pix_erase.application.commands.image.process_image_pipeline import (
+    ImagePipelineStep,
+    ProcessImagePipelineCommand,
+    ProcessImagePipelineCommandHandler,
+)
+from pix_erase.presentation.http.v1.common.exception_handler import ExceptionSchema, ExceptionSchemaRich
+from pix_erase.presentation.http.v1.routes.image.process_image_pipeline.schemas import (
+    ProcessImagePipelineRequestSchema,
+    ProcessImagePipelineResponseSchema,
+)
+
+process_image_pipeline_router: Final[APIRouter] = APIRouter(route_class=DishkaRoute, tags=["Image"])
+tracer: Final[Tracer] = trace.get_tracer(__name__)
+
+ImageIDPathParameter = Path(
+    title="The ID of the image that was upload",
+    description="The ID of the image. We using UUID id's",
+    examples=["19178bf6-8f84-406e-b213-102ec84fab9f", "75079971-fb0e-4e04-bf07-ceb57faebe84"],
+)
+
+
+@process_image_pipeline_router.patch(
+    "/id/{image_id}/pipeline/",
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Apply several operations to an image in one task",
+    description=getdoc(ProcessImagePipelineCommandHandler),
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema},
+        status.HTTP_403_FORBIDDEN: {"model": ExceptionSchema},
+        status.HTTP_400_BAD_REQUEST: {"model": ExceptionSchema},
+        status.HTTP_404_NOT_FOUND: {"model": ExceptionSchema},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ExceptionSchema},
+        status.HTTP_422_UNPROCESSABLE_CONTENT: {"model": ExceptionSchemaRich},
+    },
+    response_model=ProcessImagePipelineResponseSchema,
+)
+@span(
+    tracer=tracer,
+    name="span image process pipeline http",
+    attributes={
+        "http.request.method": "PATCH",
+        "url.path": "/image/id/{image_id}/pipeline/",
+        "http.route": "/image/id/{image_id}/pipeline/",
+        "feature": "image",
+        "action": "process_pipeline",
+        "time": datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S"),
+    },
+)
+async def process_image_pipeline_handler(
+    image_id: Annotated[UUID, ImageIDPathParameter],
+    schema_request: ProcessImagePipelineRequestSchema,
+    interactor: FromDishka[ProcessImagePipelineCommandHandler],
+) -> ProcessImagePipelineResponseSchema:
+    command: ProcessImagePipelineCommand = ProcessImagePipelineCommand(
+        image_id=image_id,
+        operations=[ImagePipelineStep(**step.model_dump()) for step in schema_request.operations],
+        output_format=schema_request.output_format,
+    )
+
+    task_id: str = await interactor(command)
+
+    return ProcessImagePipelineResponseSchema(task_id=task_id)
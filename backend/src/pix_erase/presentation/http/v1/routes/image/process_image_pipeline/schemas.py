@@ -0,0 +1,105 @@
+from typing import Annotated, Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from pix_erase.domain.image.ports.image_background_remove_converter import BackgroundRemovalModel
+from pix_erase.presentation.http.v1.common.image_encoding import OutputFormat
+
+
+class RotateImageStepSchema(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    operation: Literal["rotate"]
+    angle: Annotated[
+        int,
+        Field(
+            title="Angle for rotating",
+            description="The angle value for rotating image",
+            examples=[0, 360, 120, 180, -120],
+        ),
+    ]
+
+
+class GrayscaleImageStepSchema(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    operation: Literal["grayscale"]
+
+
+class CompressImageStepSchema(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    operation: Literal["compress"]
+    quality: Annotated[
+        int,
+        Field(
+            title="Quality of image in percents",
+            description="The quality of the encoded result in percents, value must be positive",
+            examples=[0, 30, 60, 90],
+            ge=0,
+            le=100,
+        ),
+    ]
+
+
+class UpscaleImageStepSchema(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    operation: Literal["upscale"]
+    algorithm: Literal["AI", "NearestNeighbour"]
+    scale: Annotated[int, Field(ge=2, le=4)]
+
+
+class RemoveBackgroundImageStepSchema(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    operation: Literal["remove_background"]
+    model: BackgroundRemovalModel | None = None
+
+
+class RemoveWatermarkImageStepSchema(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    operation: Literal["remove_watermark"]
+
+
+ImagePipelineStepSchema = Annotated[
+    RotateImageStepSchema
+    | GrayscaleImageStepSchema
+    | CompressImageStepSchema
+    | UpscaleImageStepSchema
+    | RemoveBackgroundImageStepSchema
+    | RemoveWatermarkImageStepSchema,
+    Field(discriminator="operation"),
+]
+
+
+class ProcessImagePipelineRequestSchema(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    operations: Annotated[
+        list[ImagePipelineStepSchema],
+        Field(
+            title="Operations",
+            description="Operations that are applied to the image in the given order",
+            examples=[[{"operation": "rotate", "angle": 90}, {"operation": "compress", "quality": 80}]],
+            min_length=1,
+            max_length=16,
+        ),
+    ]
+    output_format: OutputFormat = None
+
+
+class ProcessImagePipelineResponseSchema(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    task_id: Annotated[
+        str,
+        Field(
+            title="Task ID",
+            description="The unique task id that process request from user",
+            examples=["process_image_pipeline:75079971-fb0e-4e04-bf07-ceb57faebe84"],
+            min_length=1,
+            pattern=r"^process_image_pipeline:[a-fA-F0-9]{8}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{12}$",
+        ),
+    ]
@@ -0,0 +1,65 @@
+from datetime import UTC, datetime
+from inspect import getdoc
+from typing import Final
+
+from asgi_monitor.tracing import span
+from dishka import FromDishka
+from dishka.integrations.fastapi import DishkaRoute
+from fastapi import APIRouter, status
+from opentelemetry import trace
+from opentelemetry.trace import Tracer
+
+from pix_erase.application.commands.image.process_image_pipeline import ImagePipelineStep
+from pix_erase.application.commands.image.process_images_batch import (
+    ProcessImagesBatchCommand,
+    ProcessImagesBatchCommandHandler,
+)
+from pix_erase.presentation.http.v1.common.exception_handler import ExceptionSchema, ExceptionSchemaRich
+from pix_erase.presentation.http.v1.routes.image.process_images_batch.schemas import (
+    ProcessImagesBatchRequestSchema,
+    ProcessImagesBatchResponseSchema,
+)
+
+process_images_batch_router: Final[APIRouter] = APIRouter(route_class=DishkaRoute, tags=["Image"])
+tracer: Final[Tracer] = trace.get_tracer(__name__)
+
+
+@process_images_batch_router.patch(
+    "/batch/pipeline/",
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Apply the same operations to several images",
+    description=getdoc(ProcessImagesBatchCommandHandler),
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema},
+        status.HTTP_403_FORBIDDEN: {"model": ExceptionSchema},
+        status.HTTP_400_BAD_REQUEST: {"model": ExceptionSchema},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ExceptionSchema},
+        status.HTTP_422_UNPROCESSABLE_CONTENT: {"model": ExceptionSchemaRich},
+    },
+    response_model=ProcessImagesBatchResponseSchema,
+)
+@span(
+    tracer=tracer,
+    name="span image process batch http",
+    attributes={
+        "http.request.method": "PATCH",
+        "url.path": "/image/batch/pipeline/",
+        "http.route": "/image/batch/pipeline/",
+        "feature": "image",
+        "action": "process_batch",
+        "time": datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S"),
+    },
+)
+async def process_images_batch_handler(
+    schema_request: ProcessImagesBatchRequestSchema,
+    interactor: FromDishka[ProcessImagesBatchCommandHandler],
+) -> ProcessImagesBatchResponseSchema:
+    command: ProcessImagesBatchCommand = ProcessImagesBatchCommand(
+        image_ids=schema_request.image_ids,
+        operations=[ImagePipelineStep(**step.model_dump()) for step in schema_request.operations],
+        output_format=schema_request.output_format,
+    )
+
+    batch_id: str = await interactor(command)
+
+    return ProcessImagesBatchResponseSchema(batch_id=batch_id)
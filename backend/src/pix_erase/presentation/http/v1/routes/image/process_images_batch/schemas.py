@@ -0,0 +1,49 @@
+from typing import Annotated
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from pix_erase.application.commands.image.process_images_batch import MAX_BATCH_IMAGES
+from pix_erase.presentation.http.v1.common.image_encoding import OutputFormat
+from pix_erase.presentation.http.v1.routes.image.process_image_pipeline.schemas import ImagePipelineStepSchema
+
+
+class ProcessImagesBatchRequestSchema(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    image_ids: Annotated[
+        list[UUID],
+        Field(
+            title="Image IDs",
+            description="IDs of images of the user that are processed with the same operations",
+            examples=[["19178bf6-8f84-406e-b213-102ec84fab9f", "75079971-fb0e-4e04-bf07-ceb57faebe84"]],
+            min_length=1,
+            max_length=MAX_BATCH_IMAGES,
+        ),
+    ]
+    operations: Annotated[
+        list[ImagePipelineStepSchema],
+        Field(
+            title="Operations",
+            description="Operations that are applied to every image in the given order",
+            examples=[[{"operation": "grayscale"}, {"operation": "compress", "quality": 80}]],
+            min_length=1,
+            max_length=16,
+        ),
+    ]
+    output_format: OutputFormat = None
+
+
+class ProcessImagesBatchResponseSchema(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    batch_id: Annotated[
+        str,
+        Field(
+            title="Batch ID",
+            description="The unique id of the batch, its status sums up progress of all tasks of the batch",
+            examples=["process_images_batch:75079971-fb0e-4e04-bf07-ceb57faebe84"],
+            min_length=1,
+            pattern=r"^process_images_batch:[a-fA-F0-9]{8}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{12}$",
+        ),
+    ]
@@ -6,12 +6,20 @@ from uuid import UUID
 from asgi_monitor.tracing import span
 from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
-from fastapi import APIRouter, Path, status
+from fastapi import APIRouter, Header, Path, Query, status
 from opentelemetry import trace
 from opentelemetry.trace import Tracer
-from starlette.responses import StreamingResponse
+from starlette.responses import RedirectResponse, Response, StreamingResponse
 
+from pix_erase.application.common.views.image.read_image import ImageLinkView, ImageNotModifiedView
 from pix_erase.application.queries.images.read_by_id import ReadImageByIDQuery, ReadImageByIDQueryHandler
+from pix_erase.presentation.http.v1.common.conditional_headers import (
+    format_http_date,
+    parse_etags,
+    parse_http_date,
+    parse_if_range,
+    parse_range,
+)
 from pix_erase.presentation.http.v1.common.exception_handler import ExceptionSchema, ExceptionSchemaRich
 
 if TYPE_CHECKING:
@@ -28,6 +36,12 @@ ImageIDPathParameter = Path(
     description="The ID of the image. We using UUID id's",
     examples=["19178bf6-8f84-406e-b213-102ec84fab9f", "75079971-fb0e-4e04-bf07-ceb57faebe84"],
 )
+SizeQueryParameter = Query(
+    title="Size of the preview",
+    description="The longest side in pixels the client shows, a reduced WebP copy is returned when it exists",
+    examples=[128, 512],
+    gt=0,
+)
 
 
 @read_image_router.get(
@@ -37,10 +51,14 @@ ImageIDPathParameter = Path(
     summary="Streaming image by image id",
     description=getdoc(ReadImageByIDQueryHandler),
     responses={
+        status.HTTP_206_PARTIAL_CONTENT: {"description": "Requested range of the image"},
+        status.HTTP_304_NOT_MODIFIED: {"description": "The copy of the client is up to date"},
+        status.HTTP_307_TEMPORARY_REDIRECT: {"description": "Short-lived link to the image in the storage"},
         status.HTTP_400_BAD_REQUEST: {"model": ExceptionSchema},
         status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema},
         status.HTTP_403_FORBIDDEN: {"model": ExceptionSchema},
         status.HTTP_404_NOT_FOUND: {"model": ExceptionSchema},
+        status.HTTP_416_RANGE_NOT_SATISFIABLE: {"model": ExceptionSchema},
         status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ExceptionSchema},
         status.HTTP_422_UNPROCESSABLE_CONTENT: {"model": ExceptionSchemaRich},
     },
@@ -58,22 +76,60 @@ ImageIDPathParameter = Path(
     },
 )
 async def read_image_by_id_handler(
-    image_id: Annotated[UUID, ImageIDPathParameter], interactor: FromDishka[ReadImageByIDQueryHandler]
-) -> StreamingResponse:
+    image_id: Annotated[UUID, ImageIDPathParameter],
+    interactor: FromDishka[ReadImageByIDQueryHandler],
+    range_header: Annotated[str | None, Header(alias="Range")] = None,
+    if_none_match: Annotated[str | None, Header()] = None,
+    if_modified_since: Annotated[str | None, Header()] = None,
+    if_range: Annotated[str | None, Header()] = None,
+    size: Annotated[int | None, SizeQueryParameter] = None,
+) -> Response:
     query: ReadImageByIDQuery = ReadImageByIDQuery(
         image_id=image_id,
+        byte_range=parse_range(range_header),
+        if_none_match=parse_etags(if_none_match),
+        if_modified_since=parse_http_date(if_modified_since),
+        if_range=parse_if_range(if_range),
+        size=size,
     )
 
-    view: ReadImageByIDView = await interactor(query)
+    view: ReadImageByIDView | ImageNotModifiedView | ImageLinkView = await interactor(query)
+
+    if isinstance(view, ImageLinkView):
+        # the link expires soon, so the redirect itself must not be cached
+        return RedirectResponse(
+            url=view.url,
+            status_code=status.HTTP_307_TEMPORARY_REDIRECT,
+            headers={"Cache-Control": "no-store"},
+        )
+
+    if isinstance(view, ImageNotModifiedView):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={
+                "Last-Modified": format_http_date(view.updated_at),
+                "ETag": view.etag or "",
+                "Cache-Control": "public, max-age=3600",
+            },
+        )
+
+    headers: dict[str, str] = {
+        "Content-Length": str(view.content_length),
+        "Content-Disposition": f'inline; filename="{view.name}"',
+        "Last-Modified": format_http_date(view.updated_at),
+        "ETag": view.etag or "",
+        "Cache-Control": "public, max-age=3600",
+        "Accept-Ranges": "bytes",
+    }
+
+    if view.content_range is not None:
+        headers["Content-Range"] = (
+            f"bytes {view.content_range.start}-{view.content_range.end}/{view.content_range.total_size}"
+        )
 
     return StreamingResponse(
         content=view.data,
+        status_code=status.HTTP_200_OK if view.content_range is None else status.HTTP_206_PARTIAL_CONTENT,
         media_type=view.content_type,
-        headers={
-            "Content-Length": str(view.content_length),
-            "Content-Disposition": f'inline; filename="{view.name}"',
-            "Last-Modified": view.updated_at.strftime("%a, %d %b %Y %H:%M:%S GMT"),
-            "ETag": view.etag or "",
-            "Cache-Control": "public, max-age=3600",
-        },
+        headers=headers,
     )
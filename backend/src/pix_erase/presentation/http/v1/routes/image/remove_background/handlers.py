@@ -6,7 +6,7 @@ from uuid import UUID
 from asgi_monitor.tracing import span
 from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
-from fastapi import APIRouter, Path, status
+from fastapi import APIRouter, Depends, Path, status
 from opentelemetry import trace
 from opentelemetry.trace import Tracer
 
@@ -15,7 +15,10 @@ from pix_erase.application.commands.image.remove_background_image import (
     RemoveBackgroundImageCommandHandler,
 )
 from pix_erase.presentation.http.v1.common.exception_handler import ExceptionSchema, ExceptionSchemaRich
-from pix_erase.presentation.http.v1.routes.image.remove_background.schemas import RemoveBackgroundSchemaResponse
+from pix_erase.presentation.http.v1.routes.image.remove_background.schemas import (
+    RemoveBackgroundSchemaRequest,
+    RemoveBackgroundSchemaResponse,
+)
 
 remove_background_router: Final[APIRouter] = APIRouter(
     tags=["Image"],
@@ -58,10 +61,15 @@ ImageIDPathParameter = Path(
     },
 )
 async def remove_background_handler(
-    image_id: Annotated[UUID, ImageIDPathParameter], interactor: FromDishka[RemoveBackgroundImageCommandHandler]
+    image_id: Annotated[UUID, ImageIDPathParameter],
+    schema_request: Annotated[RemoveBackgroundSchemaRequest, Depends()],
+    interactor: FromDishka[RemoveBackgroundImageCommandHandler],
 ) -> RemoveBackgroundSchemaResponse:
     command: RemoveBackgroundImageCommand = RemoveBackgroundImageCommand(
         image_id=image_id,
+        model=schema_request.model,
+        output_format=schema_request.output_format,
+        output_quality=schema_request.output_quality,
     )
 
     task_id: str = await interactor(command)
@@ -2,6 +2,25 @@ from typing import Annotated
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from pix_erase.domain.image.ports.image_background_remove_converter import BackgroundRemovalModel
+from pix_erase.presentation.http.v1.common.image_encoding import OutputFormat, OutputQuality
+
+
+class RemoveBackgroundSchemaRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    model: Annotated[
+        BackgroundRemovalModel | None,
+        Field(
+            title="Model",
+            description="rembg model: u2net gives the best edges, u2netp and silueta are faster. "
+            "When not set, the default model of the server is used",
+            examples=["u2net", "u2netp", "silueta"],
+        ),
+    ] = None
+    output_format: OutputFormat = None
+    output_quality: OutputQuality = None
+
 
 class RemoveBackgroundSchemaResponse(BaseModel):
     model_config = ConfigDict(frozen=True)
@@ -0,0 +1,108 @@
+from datetime import UTC, datetime
+from inspect import getdoc
+from typing import TYPE_CHECKING, Annotated, Final
+from uuid import UUID
+
+from asgi_monitor.tracing import span
+from dishka import FromDishka
+from dishka.integrations.fastapi import DishkaRoute
+from fastapi import APIRouter, Path, Query, status
+from opentelemetry import trace
+from opentelemetry.trace import Tracer
+
+from pix_erase.application.queries.images.reverse_search_image import (
+    DEFAULT_LIMIT,
+    DEFAULT_MAX_DISTANCE,
+    MAX_DISTANCE,
+    MAX_LIMIT,
+    ReverseImageSearchQuery,
+    ReverseImageSearchQueryHandler,
+)
+from pix_erase.presentation.http.v1.common.exception_handler import ExceptionSchema, ExceptionSchemaRich
+from pix_erase.presentation.http.v1.routes.image.reverse_search_image.schemas import (
+    ReverseImageSearchSchemaResponse,
+    SimilarImageSchemaResponse,
+)
+
+if TYPE_CHECKING:
+    from pix_erase.application.common.views.image.reverse_search_image import ReverseImageSearchView
+
+reverse_search_image_router: Final[APIRouter] = APIRouter(
+    tags=["Image"],
+    route_class=DishkaRoute,
+)
+tracer: Final[Tracer] = trace.get_tracer(__name__)
+
+ImageIDPathParameter = Path(
+    title="The ID of the image that was upload",
+    description="The ID of the image. We using UUID id's",
+    examples=["19178bf6-8f84-406e-b213-102ec84fab9f", "75079971-fb0e-4e04-bf07-ceb57faebe84"],
+)
+MaxDistanceQueryParameter = Query(
+    title="Max distance",
+    description="How many bits of DCT hashes may differ, copies usually differ in less than 10 bits",
+    examples=[4, 10],
+    ge=0,
+    le=MAX_DISTANCE,
+)
+LimitQueryParameter = Query(
+    title="Limit",
+    description="Max count of returned images",
+    examples=[20],
+    ge=1,
+    le=MAX_LIMIT,
+)
+
+
+@reverse_search_image_router.get(
+    "/id/{image_id}/similar/",
+    status_code=status.HTTP_200_OK,
+    summary="Find images similar to image by id",
+    description=getdoc(ReverseImageSearchQueryHandler),
+    response_model=ReverseImageSearchSchemaResponse,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema},
+        status.HTTP_403_FORBIDDEN: {"model": ExceptionSchema},
+        status.HTTP_409_CONFLICT: {"model": ExceptionSchema},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ExceptionSchema},
+        status.HTTP_422_UNPROCESSABLE_CONTENT: {"model": ExceptionSchemaRich},
+    },
+)
+@span(
+    tracer=tracer,
+    name="span image reverse_search http",
+    attributes={
+        "http.request.method": "GET",
+        "url.path": "/image/id/{image_id}/similar/",
+        "http.route": "/image/id/{image_id}/similar/",
+        "feature": "image",
+        "action": "reverse_search",
+        "time": datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S"),
+    },
+)
+async def reverse_search_image_handler(
+    image_id: Annotated[UUID, ImageIDPathParameter],
+    interactor: FromDishka[ReverseImageSearchQueryHandler],
+    max_distance: Annotated[int, MaxDistanceQueryParameter] = DEFAULT_MAX_DISTANCE,
+    limit: Annotated[int, LimitQueryParameter] = DEFAULT_LIMIT,
+) -> ReverseImageSearchSchemaResponse:
+    query: ReverseImageSearchQuery = ReverseImageSearchQuery(
+        image_id=image_id,
+        max_distance=max_distance,
+        limit=limit,
+    )
+
+    view: ReverseImageSearchView = await interactor(query)
+
+    return ReverseImageSearchSchemaResponse(
+        images=[
+            SimilarImageSchemaResponse(
+                image_id=image.image_id,
+                distance=image.distance,
+                phash_distance=image.phash_distance,
+                dhash_distance=image.dhash_distance,
+                ahash_distance=image.ahash_distance,
+            )
+            for image in view.images
+        ],
+    )
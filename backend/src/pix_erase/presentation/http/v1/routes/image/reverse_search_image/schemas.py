@@ -0,0 +1,23 @@
+from typing import Annotated
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class SimilarImageSchemaResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    image_id: Annotated[UUID, Field(description="ID of the similar image")]
+    distance: Annotated[int, Field(description="Count of different bits of all hashes, lower is more similar", ge=0)]
+    phash_distance: Annotated[int, Field(description="Count of different bits of DCT hashes", ge=0, le=64)]
+    dhash_distance: Annotated[int, Field(description="Count of different bits of gradient hashes", ge=0, le=64)]
+    ahash_distance: Annotated[int, Field(description="Count of different bits of average hashes", ge=0, le=64)]
+
+
+class ReverseImageSearchSchemaResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    images: Annotated[
+        list[SimilarImageSchemaResponse],
+        Field(description="Similar images, the most similar first"),
+    ]
@@ -62,6 +62,8 @@ async def rotate_image_handler(
     command: RotateImageCommand = RotateImageCommand(
         image_id=image_id,
         angle=request_schema.angle,
+        output_format=request_schema.output_format,
+        output_quality=request_schema.output_quality,
     )
 
     task_id: str = await interactor(command)
@@ -2,6 +2,8 @@ from typing import Annotated
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from pix_erase.presentation.http.v1.common.image_encoding import OutputFormat, OutputQuality
+
 
 class RotateImageSchemaRequest(BaseModel):
     model_config = ConfigDict(frozen=True)
@@ -14,6 +16,8 @@ class RotateImageSchemaRequest(BaseModel):
             examples=[0, 360, 120, 180, -120],
         ),
     ]
+    output_format: OutputFormat = None
+    output_quality: OutputQuality = None
 
 
 class RotateImageSchemaResponse(BaseModel):
@@ -0,0 +1,115 @@
+from datetime import UTC, datetime
+from inspect import getdoc
+from typing import TYPE_CHECKING, Annotated, Final
+from uuid import UUID
+
+from asgi_monitor.tracing import span
+from dishka import FromDishka
+from dishka.integrations.fastapi import DishkaRoute
+from fastapi import APIRouter, Path, Security, status
+from opentelemetry import trace
+from opentelemetry.trace import Tracer
+
+from pix_erase.application.commands.image.complete_image_upload import (
+    CompleteImageUploadCommand,
+    CompleteImageUploadCommandHandler,
+)
+from pix_erase.application.commands.image.request_image_upload import (
+    RequestImageUploadCommand,
+    RequestImageUploadCommandHandler,
+)
+from pix_erase.presentation.http.v1.common.exception_handler import ExceptionSchema, ExceptionSchemaRich
+from pix_erase.presentation.http.v1.common.fastapi_openapi_markers import cookie_scheme
+from pix_erase.presentation.http.v1.routes.image.upload_image.schemas import (
+    CompleteImageUploadSchemaRequest,
+    CompleteImageUploadSchemaResponse,
+    ImageUploadUrlSchemaResponse,
+)
+
+if TYPE_CHECKING:
+    from pix_erase.application.common.views.image.create_image import ImageUploadUrlView
+
+upload_image_router: Final[APIRouter] = APIRouter(
+    route_class=DishkaRoute,
+    tags=["Image"],
+)
+tracer: Final[Tracer] = trace.get_tracer(__name__)
+
+ImageIDPathParameter = Path(
+    title="The ID of the image that was upload",
+    description="The ID of the image from the upload url request",
+    examples=["19178bf6-8f84-406e-b213-102ec84fab9f", "75079971-fb0e-4e04-bf07-ceb57faebe84"],
+)
+
+
+@upload_image_router.post(
+    "/upload-url/",
+    status_code=status.HTTP_201_CREATED,
+    response_model=ImageUploadUrlSchemaResponse,
+    summary="Link for uploading image straight into the storage",
+    description=getdoc(RequestImageUploadCommandHandler),
+    dependencies=[Security(cookie_scheme)],
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema},
+        status.HTTP_501_NOT_IMPLEMENTED: {"model": ExceptionSchema},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ExceptionSchema},
+    },
+)
+@span(
+    tracer=tracer,
+    name="span image upload url http",
+    attributes={
+        "http.request.method": "POST",
+        "url.path": "/image/upload-url/",
+        "http.route": "/image/upload-url/",
+        "feature": "image",
+        "action": "upload_url",
+        "time": datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S"),
+    },
+)
+async def request_image_upload_handler(
+    interactor: FromDishka[RequestImageUploadCommandHandler],
+) -> ImageUploadUrlSchemaResponse:
+    view: ImageUploadUrlView = await interactor(RequestImageUploadCommand())
+
+    return ImageUploadUrlSchemaResponse(image_id=view.image_id, url=view.url, expires_at=view.expires_at)
+
+
+@upload_image_router.post(
+    "/id/{image_id}/upload-complete/",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=CompleteImageUploadSchemaResponse,
+    summary="Complete upload of image straight into the storage",
+    description=getdoc(CompleteImageUploadCommandHandler),
+    dependencies=[Security(cookie_scheme)],
+    responses={
+        status.HTTP_400_BAD_REQUEST: {"model": ExceptionSchema},
+        status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema},
+        status.HTTP_404_NOT_FOUND: {"model": ExceptionSchema},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ExceptionSchema},
+        status.HTTP_422_UNPROCESSABLE_CONTENT: {"model": ExceptionSchemaRich},
+    },
+)
+@span(
+    tracer=tracer,
+    name="span image upload complete http",
+    attributes={
+        "http.request.method": "POST",
+        "url.path": "/image/id/{image_id}/upload-complete/",
+        "http.route": "/image/id/{image_id}/upload-complete/",
+        "feature": "image",
+        "action": "upload_complete",
+        "time": datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S"),
+    },
+)
+async def complete_image_upload_handler(
+    image_id: Annotated[UUID, ImageIDPathParameter],
+    request_schema: CompleteImageUploadSchemaRequest,
+    interactor: FromDishka[CompleteImageUploadCommandHandler],
+) -> CompleteImageUploadSchemaResponse:
+    command: CompleteImageUploadCommand = CompleteImageUploadCommand(
+        image_id=image_id,
+        filename=request_schema.filename,
+    )
+    task_id: str = await interactor(command)
+    return CompleteImageUploadSchemaResponse(task_id=task_id)
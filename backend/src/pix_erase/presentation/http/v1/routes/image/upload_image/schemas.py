@@ -0,0 +1,42 @@
+from datetime import datetime
+from typing import Annotated
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ImageUploadUrlSchemaResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    image_id: Annotated[UUID, Field(description="ID for new image, it's used to complete the upload")]
+    url: Annotated[str, Field(description="Link for uploading the image with a PUT request straight into the storage")]
+    expires_at: Annotated[datetime, Field(description="The link stops working after this moment")]
+
+
+class CompleteImageUploadSchemaRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    filename: Annotated[
+        str,
+        Field(
+            title="Filename",
+            description="Name of the uploaded image",
+            examples=["photo.jpg"],
+            min_length=1,
+        ),
+    ]
+
+
+class CompleteImageUploadSchemaResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    task_id: Annotated[
+        str,
+        Field(
+            title="Task ID",
+            description="The unique task id that stores the uploaded image",
+            examples=["store_uploaded_image:75079971-fb0e-4e04-bf07-ceb57faebe84"],
+            min_length=1,
+            pattern=r"^store_uploaded_image:[a-fA-F0-9]{8}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{12}$",
+        ),
+    ]
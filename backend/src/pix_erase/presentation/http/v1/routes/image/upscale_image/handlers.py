@@ -63,6 +63,8 @@ async def upscale_image_handler(
         image_id=image_id,
         algorithm=schema_request.algorithm,
         scale=schema_request.scale,
+        output_format=schema_request.output_format,
+        output_quality=schema_request.output_quality,
     )
 
     task_id: str = await interactor(command)
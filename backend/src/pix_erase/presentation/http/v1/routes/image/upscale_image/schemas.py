@@ -2,12 +2,16 @@ from typing import Annotated, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from pix_erase.presentation.http.v1.common.image_encoding import OutputFormat, OutputQuality
+
 
 class UpscaleImageRequestSchema(BaseModel):
     model_config = ConfigDict(frozen=True)
 
     algorithm: Literal["AI", "NearestNeighbour"]
     scale: Annotated[int, Field(ge=2, le=8)]
+    output_format: OutputFormat = None
+    output_quality: OutputQuality = None
 
 
 class UpscaleImageSchemeResponse(BaseModel):
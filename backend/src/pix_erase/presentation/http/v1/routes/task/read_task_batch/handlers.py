@@ -0,0 +1,50 @@
+from dataclasses import asdict
+from inspect import getdoc
+from typing import TYPE_CHECKING, Annotated, Final
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import DishkaRoute
+from fastapi import APIRouter, Path, status
+
+from pix_erase.application.queries.tasks.read_task_batch_by_id import (
+    ReadTaskBatchByIDQuery,
+    ReadTaskBatchByIDQueryHandler,
+)
+from pix_erase.presentation.http.v1.common.exception_handler import ExceptionSchema, ExceptionSchemaRich
+from pix_erase.presentation.http.v1.routes.task.read_task_batch.schemas import TaskBatchSchemaResponse
+
+if TYPE_CHECKING:
+    from pix_erase.application.common.views.tasks.read_task_batch_by_id import ReadTaskBatchByIDView
+
+read_task_batch_router: Final[APIRouter] = APIRouter(route_class=DishkaRoute, tags=["Task"])
+
+TaskBatchIDPath = Path(
+    title="The ID of the batch returned before",
+    description="The ID of the batch of tasks",
+    examples=["process_images_batch:19178bf6-8f84-406e-b213-102ec84fab9f"],
+    pattern=r"^[a-zA-Z_]+:[a-fA-F0-9]{8}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{12}$",
+)
+
+
+@read_task_batch_router.get(
+    "/batch/{batch_id}/",
+    status_code=status.HTTP_200_OK,
+    summary="Reads batch of tasks by id and gets progress of all its tasks",
+    description=getdoc(ReadTaskBatchByIDQueryHandler),
+    responses={
+        status.HTTP_400_BAD_REQUEST: {"model": ExceptionSchema},
+        status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema},
+        status.HTTP_403_FORBIDDEN: {"model": ExceptionSchema},
+        status.HTTP_404_NOT_FOUND: {"model": ExceptionSchema},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ExceptionSchema},
+        status.HTTP_422_UNPROCESSABLE_CONTENT: {"model": ExceptionSchemaRich},
+    },
+)
+async def read_task_batch_by_id_handler(
+    batch_id: Annotated[str, TaskBatchIDPath], interactor: FromDishka[ReadTaskBatchByIDQueryHandler]
+) -> TaskBatchSchemaResponse:
+    query: ReadTaskBatchByIDQuery = ReadTaskBatchByIDQuery(
+        batch_id=batch_id,
+    )
+    view: ReadTaskBatchByIDView = await interactor(query)
+    return TaskBatchSchemaResponse.model_validate(asdict(view))
@@ -0,0 +1,22 @@
+from typing import Annotated, Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class TaskBatchItemSchemaResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    task_id: Annotated[str, Field(min_length=1, description="ID of the task of one image of the batch")]
+    status: Literal["success", "failure", "started", "retrying", "processing", "queued"]
+    description: Annotated[str, Field(description="Description of the task")]
+
+
+class TaskBatchSchemaResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    status: Literal["success", "failure", "processing"]
+    total: Annotated[int, Field(ge=0, description="Count of tasks in the batch")]
+    succeeded: Annotated[int, Field(ge=0, description="Count of successfully finished tasks")]
+    failed: Annotated[int, Field(ge=0, description="Count of failed tasks")]
+    in_progress: Annotated[int, Field(ge=0, description="Count of queued and running tasks")]
+    tasks: list[TaskBatchItemSchemaResponse]
@@ -0,0 +1,59 @@
+from typing import Any, Final
+
+from pydantic import BaseModel, Field, field_validator
+
+from pix_erase.domain.image.ports.image_background_remove_converter import BackgroundRemovalModel
+
+ONNX_THREADS_MIN: Final[int] = 1
+
+
+class BackgroundRemovalConfig(BaseModel):
+    """Configuration container for rembg background removal.
+
+    Attributes:
+        default_model: Model that is used when a request doesn't choose one.
+        preload_models: Models whose ONNX sessions are created when a worker process starts,
+            other sessions are created on the first request.
+        intra_op_threads: Threads ONNX Runtime uses inside one operator.
+            When not set, rembg takes ``OMP_NUM_THREADS`` of the process.
+        inter_op_threads: Threads ONNX Runtime uses to run independent operators in parallel.
+    """
+
+    default_model: BackgroundRemovalModel = Field(
+        alias="BACKGROUND_REMOVAL_DEFAULT_MODEL",
+        default="u2net",
+        description="rembg model used by default.",
+        validate_default=True,
+    )
+    preload_models: tuple[BackgroundRemovalModel, ...] = Field(
+        alias="BACKGROUND_REMOVAL_PRELOAD_MODELS",
+        default=(),
+        description="Comma separated models that are loaded at worker startup, e.g. 'u2net,u2netp'.",
+        validate_default=True,
+    )
+    intra_op_threads: int | None = Field(
+        alias="BACKGROUND_REMOVAL_INTRA_OP_THREADS",
+        default=None,
+        description="ONNX Runtime intra-op thread count.",
+        validate_default=True,
+    )
+    inter_op_threads: int | None = Field(
+        alias="BACKGROUND_REMOVAL_INTER_OP_THREADS",
+        default=None,
+        description="ONNX Runtime inter-op thread count.",
+        validate_default=True,
+    )
+
+    @field_validator("preload_models", mode="before")
+    @classmethod
+    def split_preload_models(cls, v: Any) -> Any:  # noqa: ANN401
+        if isinstance(v, str):
+            return tuple(model.strip() for model in v.split(",") if model.strip())
+        return v
+
+    @field_validator("intra_op_threads", "inter_op_threads")
+    @classmethod
+    def validate_threads(cls, v: int | None) -> int | None:
+        if v is not None and v < ONNX_THREADS_MIN:
+            raise ValueError(f"ONNX Runtime thread count must be at least {ONNX_THREADS_MIN}, got {v}.")
+        return v
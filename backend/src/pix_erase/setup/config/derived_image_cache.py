@@ -0,0 +1,34 @@
+from typing import Final
+
+from pydantic import BaseModel, Field, field_validator
+
+CACHE_SIZE_MIN_MB: Final[int] = 1
+
+
+class DerivedImageCacheConfig(BaseModel):
+    """Configuration container for the cache of transformation results.
+
+    Attributes:
+        enabled: Whether image tasks look up and store their results in the cache.
+        max_size_mb: Total size of cached results, least recently used results are evicted above it.
+    """
+
+    enabled: bool = Field(
+        alias="DERIVED_IMAGE_CACHE_ENABLED",
+        default=True,
+        description="Cache results of image transformations.",
+        validate_default=True,
+    )
+    max_size_mb: int = Field(
+        alias="DERIVED_IMAGE_CACHE_MAX_SIZE_MB",
+        default=2048,
+        description="Size limit of cached results in megabytes.",
+        validate_default=True,
+    )
+
+    @field_validator("max_size_mb")
+    @classmethod
+    def validate_max_size_mb(cls, v: int) -> int:
+        if v < CACHE_SIZE_MIN_MB:
+            raise ValueError(f"DERIVED_IMAGE_CACHE_MAX_SIZE_MB must be at least {CACHE_SIZE_MIN_MB}, got {v}.")
+        return v
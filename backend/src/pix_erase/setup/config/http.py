@@ -21,6 +21,19 @@ class HttpClientConfig(BaseModel):
     max_connections: int = Field(alias="DEFAULT_HTTP_MAX_CONNECTIONS", default=100, validate_default=True)
     max_keepalive_connections: int = Field(alias="DEFAULT_HTTP_MAX_KEEPALIVE", default=20, validate_default=True)
     keepalive_expiry: float = Field(alias="DEFAULT_HTTP_KEEPALIVE_EXPIRY", default=5.0, validate_default=True)
+    dedicated_pool_hosts: list[str] = Field(
+        alias="DEFAULT_HTTP_DEDICATED_POOL_HOSTS",
+        default=["ip-api.com", "crt.sh"],
+        description="Hosts with their own pool of connections, comma separated. "
+        "Other hosts share one pool, a slow host there can take connections of the others.",
+    )
+
+    @field_validator("dedicated_pool_hosts", mode="before")
+    @classmethod
+    def split_dedicated_pool_hosts(cls, v: object) -> object:
+        if isinstance(v, str):
+            return [host.strip() for host in v.split(",") if host.strip()]
+        return v
 
     @field_validator("default_timeout")
     @classmethod
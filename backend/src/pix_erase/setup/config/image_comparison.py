@@ -0,0 +1,70 @@
+from typing import Final
+
+from pydantic import BaseModel, Field, field_validator
+
+WORKING_SIDE_MIN: Final[int] = 64
+FEATURE_SIDE_MIN: Final[int] = 32
+FEATURE_SIDE_MAX: Final[int] = 512
+FEATURE_CACHE_TTL_MIN: Final[int] = 1
+
+
+class ImageComparisonConfig(BaseModel):
+    """Configuration container for the comparison of two images.
+
+    Attributes:
+        working_max_side: Longest side in pixels both images are reduced to before metrics are computed.
+            Memory and time of a comparison stay bounded for any size of the source images.
+        multiscale_ssim: Compute multi-scale SSIM (``MS_SSIM``) in addition to the plain one.
+        feature_side: Side in pixels of the square grayscale plane kept per image for batch comparisons.
+        feature_cache_ttl_seconds: How long features of an image are kept in the cache.
+    """
+
+    working_max_side: int = Field(
+        alias="IMAGE_COMPARISON_MAX_SIDE",
+        default=1024,
+        description="Longest side in pixels of images at which metrics are computed.",
+        validate_default=True,
+    )
+    multiscale_ssim: bool = Field(
+        alias="IMAGE_COMPARISON_MULTISCALE_SSIM",
+        default=False,
+        description="Compute multi-scale SSIM of compared images.",
+        validate_default=True,
+    )
+    feature_side: int = Field(
+        alias="IMAGE_COMPARISON_FEATURE_SIDE",
+        default=128,
+        description="Side in pixels of the grayscale plane of an image in batch comparisons.",
+        validate_default=True,
+    )
+    feature_cache_ttl_seconds: int = Field(
+        alias="IMAGE_COMPARISON_FEATURE_CACHE_TTL_SECONDS",
+        default=86_400,
+        description="Seconds features of an image are kept in the cache.",
+        validate_default=True,
+    )
+
+    @field_validator("working_max_side")
+    @classmethod
+    def validate_working_max_side(cls, v: int) -> int:
+        if v < WORKING_SIDE_MIN:
+            raise ValueError(f"IMAGE_COMPARISON_MAX_SIDE must be at least {WORKING_SIDE_MIN}, got {v}.")
+        return v
+
+    @field_validator("feature_side")
+    @classmethod
+    def validate_feature_side(cls, v: int) -> int:
+        if not FEATURE_SIDE_MIN <= v <= FEATURE_SIDE_MAX:
+            raise ValueError(
+                f"IMAGE_COMPARISON_FEATURE_SIDE must be between {FEATURE_SIDE_MIN} and {FEATURE_SIDE_MAX}, got {v}."
+            )
+        return v
+
+    @field_validator("feature_cache_ttl_seconds")
+    @classmethod
+    def validate_feature_cache_ttl_seconds(cls, v: int) -> int:
+        if v < FEATURE_CACHE_TTL_MIN:
+            raise ValueError(
+                f"IMAGE_COMPARISON_FEATURE_CACHE_TTL_SECONDS must be at least {FEATURE_CACHE_TTL_MIN}, got {v}."
+            )
+        return v
@@ -0,0 +1,81 @@
+import os
+from typing import Final
+
+from pydantic import BaseModel, Field, field_validator
+
+POOL_SIZE_MIN: Final[int] = 1
+THREADS_PER_PROCESS_MIN: Final[int] = 1
+MAX_TASKS_PER_CHILD_MIN: Final[int] = 1
+
+
+class ImageProcessingConfig(BaseModel):
+    """Configuration container for the CPU-bound image processing pool of the worker.
+
+    Attributes:
+        pool_size: Count of worker processes that run image converters.
+            When not set, it's derived from the CPU count and threads per process.
+        threads_per_process: Count of native threads (OpenCV, OpenMP, ONNX Runtime)
+            that every process of the pool may use.
+        max_tasks_per_child: Count of jobs after which a process of the pool is restarted.
+            Useful to give memory back to the OS after huge images.
+    """
+
+    pool_enabled: bool = Field(
+        alias="IMAGE_PROCESSING_POOL_ENABLED",
+        default=True,
+        description="Run image converters in separate processes of the worker.",
+        validate_default=True,
+    )
+    pool_size: int | None = Field(
+        alias="IMAGE_PROCESSING_POOL_SIZE",
+        default=None,
+        description="Count of processes in the image processing pool.",
+        validate_default=True,
+    )
+    threads_per_process: int = Field(
+        alias="IMAGE_PROCESSING_THREADS_PER_PROCESS",
+        default=1,
+        description="Count of native threads that every process of the pool may use.",
+        validate_default=True,
+    )
+    max_tasks_per_child: int | None = Field(
+        alias="IMAGE_PROCESSING_MAX_TASKS_PER_CHILD",
+        default=None,
+        description="Count of jobs after which a process of the pool is restarted.",
+        validate_default=True,
+    )
+
+    @field_validator("pool_size")
+    @classmethod
+    def validate_pool_size(cls, v: int | None) -> int | None:
+        if v is not None and v < POOL_SIZE_MIN:
+            raise ValueError(
+                f"IMAGE_PROCESSING_POOL_SIZE must be at least {POOL_SIZE_MIN}, got {v}."
+            )
+        return v
+
+    @field_validator("threads_per_process")
+    @classmethod
+    def validate_threads_per_process(cls, v: int) -> int:
+        if v < THREADS_PER_PROCESS_MIN:
+            raise ValueError(
+                f"IMAGE_PROCESSING_THREADS_PER_PROCESS must be at least {THREADS_PER_PROCESS_MIN}, got {v}."
+            )
+        return v
+
+    @field_validator("max_tasks_per_child")
+    @classmethod
+    def validate_max_tasks_per_child(cls, v: int | None) -> int | None:
+        if v is not None and v < MAX_TASKS_PER_CHILD_MIN:
+            raise ValueError(
+                f"IMAGE_PROCESSING_MAX_TASKS_PER_CHILD must be at least {MAX_TASKS_PER_CHILD_MIN}, got {v}."
+            )
+        return v
+
+    @property
+    def workers(self) -> int:
+        """Count of pool processes, so that processes * threads doesn't oversubscribe the CPU."""
+        if self.pool_size is not None:
+            return self.pool_size
+
+        return max(POOL_SIZE_MIN, (os.cpu_count() or 1) // self.threads_per_process)
@@ -0,0 +1,63 @@
+from typing import Any, Final
+
+from pydantic import BaseModel, Field, field_validator
+
+RENDITION_SIZE_MIN: Final[int] = 16
+RENDITION_QUALITY_MIN: Final[int] = 1
+RENDITION_QUALITY_MAX: Final[int] = 100
+
+
+class ImageRenditionConfig(BaseModel):
+    """Configuration container for reduced copies of images that are served to previews.
+
+    Attributes:
+        enabled: Whether renditions are generated and served to reads that ask for a size.
+        sizes: The longest side of every rendition in pixels.
+        quality: WebP quality of renditions.
+    """
+
+    enabled: bool = Field(
+        alias="IMAGE_RENDITIONS_ENABLED",
+        default=True,
+        description="Generate reduced copies of images for previews.",
+        validate_default=True,
+    )
+    sizes: tuple[int, ...] = Field(
+        alias="IMAGE_RENDITION_SIZES",
+        default=(128, 512, 1024),
+        description="Comma separated longest sides of renditions in pixels, e.g. '128,512,1024'.",
+        validate_default=True,
+    )
+    quality: int = Field(
+        alias="IMAGE_RENDITION_QUALITY",
+        default=80,
+        description="WebP quality of renditions.",
+        validate_default=True,
+    )
+
+    @field_validator("sizes", mode="before")
+    @classmethod
+    def split_sizes(cls, v: Any) -> Any:  # noqa: ANN401
+        if isinstance(v, str):
+            return tuple(size.strip() for size in v.split(",") if size.strip())
+        return v
+
+    @field_validator("sizes")
+    @classmethod
+    def validate_sizes(cls, v: tuple[int, ...]) -> tuple[int, ...]:
+        if not v:
+            raise ValueError("IMAGE_RENDITION_SIZES must contain at least one size.")
+
+        if min(v) < RENDITION_SIZE_MIN:
+            raise ValueError(f"IMAGE_RENDITION_SIZES must be at least {RENDITION_SIZE_MIN}, got {min(v)}.")
+
+        return tuple(sorted(set(v)))
+
+    @field_validator("quality")
+    @classmethod
+    def validate_quality(cls, v: int) -> int:
+        if not RENDITION_QUALITY_MIN <= v <= RENDITION_QUALITY_MAX:
+            raise ValueError(
+                f"IMAGE_RENDITION_QUALITY must be between {RENDITION_QUALITY_MIN} and {RENDITION_QUALITY_MAX}, got {v}."
+            )
+        return v
@@ -0,0 +1,64 @@
+from typing import Final
+
+from pydantic import BaseModel, Field, field_validator
+
+REFRESH_INTERVAL_MIN: Final[float] = 0.0
+REBUILD_INTERVAL_MIN: Final[int] = 60
+BATCH_SIZE_MIN: Final[int] = 100
+
+
+class ImageSearchConfig(BaseModel):
+    """Configuration container for the in-memory index of reverse image search.
+
+    Every process keeps its own index of perceptual hashes and reads changes of them from the database.
+
+    Attributes:
+        refresh_interval_seconds: How long a search may use the index without reading new changes.
+        rebuild_interval_seconds: How often the index is loaded from the database anew,
+            it picks changes whose transactions were committed too late for the change feed.
+        batch_size: Count of rows read from the database at once.
+    """
+
+    refresh_interval_seconds: float = Field(
+        alias="IMAGE_SEARCH_REFRESH_INTERVAL_SECONDS",
+        default=1.0,
+        description="Seconds a search may use the index without reading new changes.",
+        validate_default=True,
+    )
+    rebuild_interval_seconds: int = Field(
+        alias="IMAGE_SEARCH_REBUILD_INTERVAL_SECONDS",
+        default=3600,
+        description="Seconds after which the index is loaded from the database anew.",
+        validate_default=True,
+    )
+    batch_size: int = Field(
+        alias="IMAGE_SEARCH_BATCH_SIZE",
+        default=10_000,
+        description="Count of rows read from the database at once.",
+        validate_default=True,
+    )
+
+    @field_validator("refresh_interval_seconds")
+    @classmethod
+    def validate_refresh_interval_seconds(cls, v: float) -> float:
+        if v < REFRESH_INTERVAL_MIN:
+            raise ValueError(
+                f"IMAGE_SEARCH_REFRESH_INTERVAL_SECONDS must be at least {REFRESH_INTERVAL_MIN}, got {v}."
+            )
+        return v
+
+    @field_validator("rebuild_interval_seconds")
+    @classmethod
+    def validate_rebuild_interval_seconds(cls, v: int) -> int:
+        if v < REBUILD_INTERVAL_MIN:
+            raise ValueError(
+                f"IMAGE_SEARCH_REBUILD_INTERVAL_SECONDS must be at least {REBUILD_INTERVAL_MIN}, got {v}."
+            )
+        return v
+
+    @field_validator("batch_size")
+    @classmethod
+    def validate_batch_size(cls, v: int) -> int:
+        if v < BATCH_SIZE_MIN:
+            raise ValueError(f"IMAGE_SEARCH_BATCH_SIZE must be at least {BATCH_SIZE_MIN}, got {v}.")
+        return v
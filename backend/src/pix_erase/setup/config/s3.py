@@ -1,7 +1,20 @@
+from typing import Final, Literal
+
 from pydantic import BaseModel, Field, field_validator
 
 from pix_erase.setup.config.consts import PORT_MAX, PORT_MIN
 
+# limits of S3 multipart upload, the last part may be smaller
+MULTIPART_PART_SIZE_MIN_MB: Final[int] = 5
+MULTIPART_PART_SIZE_MAX_MB: Final[int] = 5120
+# S3 signs URLs for a week at most
+PRESIGNED_URL_EXPIRES_MIN_SECONDS: Final[int] = 1
+PRESIGNED_URL_EXPIRES_MAX_SECONDS: Final[int] = 7 * 24 * 60 * 60
+MAX_POOL_CONNECTIONS_MIN: Final[int] = 1
+MAX_POOL_CONNECTIONS_MAX: Final[int] = 1000
+MAX_ATTEMPTS_MIN: Final[int] = 1
+MAX_ATTEMPTS_MAX: Final[int] = 10
+
 
 class S3Config(BaseModel):
     host: str = Field(..., alias="MINIO_HOST")
@@ -12,6 +25,44 @@ class S3Config(BaseModel):
     region_name: str = "us-east-1"
 
     images_bucket_name: str = Field(..., alias="MINIO_IMAGES_BUCKET")
+    multipart_part_size_mb: int = Field(
+        alias="S3_MULTIPART_PART_SIZE_MB",
+        default=8,
+        description="Size of parts of streamed uploads, memory of one upload is bounded by it.",
+        validate_default=True,
+    )
+    presigned_urls_enabled: bool = Field(
+        alias="S3_PRESIGNED_URLS_ENABLED",
+        default=False,
+        description="Images are read and uploaded by clients directly from S3 with presigned URLs, "
+        "MINIO_HOST must be reachable by clients then.",
+    )
+    presigned_url_expires_seconds: int = Field(
+        alias="S3_PRESIGNED_URL_EXPIRES_SECONDS",
+        default=300,
+        validate_default=True,
+    )
+    max_pool_connections: int = Field(
+        alias="S3_MAX_POOL_CONNECTIONS",
+        default=50,
+        description="Connections to S3 kept by the client, the client is shared by every request of a process.",
+        validate_default=True,
+    )
+    keepalive_timeout_seconds: float = Field(
+        alias="S3_KEEPALIVE_TIMEOUT_SECONDS",
+        default=12.0,
+        gt=0,
+        description="How long an idle connection to S3 is kept open for the next request.",
+    )
+    connect_timeout_seconds: float = Field(alias="S3_CONNECT_TIMEOUT_SECONDS", default=5.0, gt=0)
+    read_timeout_seconds: float = Field(alias="S3_READ_TIMEOUT_SECONDS", default=60.0, gt=0)
+    max_attempts: int = Field(
+        alias="S3_MAX_ATTEMPTS",
+        default=3,
+        description="Attempts of a request to S3, the first one included.",
+        validate_default=True,
+    )
+    retry_mode: Literal["legacy", "standard", "adaptive"] = Field(alias="S3_RETRY_MODE", default="standard")
 
     @field_validator("port")
     @classmethod
@@ -22,6 +73,47 @@ class S3Config(BaseModel):
             )
         return v
 
+    @field_validator("multipart_part_size_mb")
+    @classmethod
+    def validate_multipart_part_size_mb(cls, v: int) -> int:
+        if not MULTIPART_PART_SIZE_MIN_MB <= v <= MULTIPART_PART_SIZE_MAX_MB:
+            raise ValueError(
+                f"S3_MULTIPART_PART_SIZE_MB must be between {MULTIPART_PART_SIZE_MIN_MB} and "
+                f"{MULTIPART_PART_SIZE_MAX_MB}, got {v}."
+            )
+        return v
+
+    @field_validator("presigned_url_expires_seconds")
+    @classmethod
+    def validate_presigned_url_expires_seconds(cls, v: int) -> int:
+        if not PRESIGNED_URL_EXPIRES_MIN_SECONDS <= v <= PRESIGNED_URL_EXPIRES_MAX_SECONDS:
+            raise ValueError(
+                f"S3_PRESIGNED_URL_EXPIRES_SECONDS must be between {PRESIGNED_URL_EXPIRES_MIN_SECONDS} and "
+                f"{PRESIGNED_URL_EXPIRES_MAX_SECONDS}, got {v}."
+            )
+        return v
+
+    @field_validator("max_pool_connections")
+    @classmethod
+    def validate_max_pool_connections(cls, v: int) -> int:
+        if not MAX_POOL_CONNECTIONS_MIN <= v <= MAX_POOL_CONNECTIONS_MAX:
+            raise ValueError(
+                f"S3_MAX_POOL_CONNECTIONS must be between {MAX_POOL_CONNECTIONS_MIN} and "
+                f"{MAX_POOL_CONNECTIONS_MAX}, got {v}."
+            )
+        return v
+
+    @field_validator("max_attempts")
+    @classmethod
+    def validate_max_attempts(cls, v: int) -> int:
+        if not MAX_ATTEMPTS_MIN <= v <= MAX_ATTEMPTS_MAX:
+            raise ValueError(f"S3_MAX_ATTEMPTS must be between {MAX_ATTEMPTS_MIN} and {MAX_ATTEMPTS_MAX}, got {v}.")
+        return v
+
+    @property
+    def multipart_part_size(self) -> int:
+        return self.multipart_part_size_mb * 1024 * 1024
+
     @property
     def uri(self) -> str:
         return f"http://{self.host}:{self.port}"
@@ -4,14 +4,21 @@ from dotenv import load_dotenv
 from pydantic import BaseModel, Field
 
 from pix_erase.setup.config.asgi import ASGIConfig
+from pix_erase.setup.config.background_removal import BackgroundRemovalConfig
 from pix_erase.setup.config.cache import RedisConfig
 from pix_erase.setup.config.database import PostgresConfig, SQLAlchemyConfig
+from pix_erase.setup.config.derived_image_cache import DerivedImageCacheConfig
 from pix_erase.setup.config.grpc import GrpcConfig
 from pix_erase.setup.config.http import HttpClientConfig
+from pix_erase.setup.config.image_processing import ImageProcessingConfig
+from pix_erase.setup.config.image_comparison import ImageComparisonConfig
+from pix_erase.setup.config.image_renditions import ImageRenditionConfig
+from pix_erase.setup.config.image_search import ImageSearchConfig
 from pix_erase.setup.config.obversability import ObservabilityConfig
 from pix_erase.setup.config.rabbit import RabbitConfig
 from pix_erase.setup.config.s3 import S3Config
 from pix_erase.setup.config.security import SecurityConfig, AuthSettings, CookiesSettings, PasswordSettings
+from pix_erase.setup.config.super_resolution import SuperResolutionConfig
 from pix_erase.setup.config.worker import TaskIQWorkerConfig
 
 
@@ -66,3 +73,31 @@ class AppConfig(BaseModel):
         default_factory=lambda: GrpcConfig(**os.environ),
         description="gRPC settings",
     )
+    image_processing: ImageProcessingConfig = Field(
+        default_factory=lambda: ImageProcessingConfig(**os.environ),
+        description="Image processing settings",
+    )
+    super_resolution: SuperResolutionConfig = Field(
+        default_factory=lambda: SuperResolutionConfig(**os.environ),
+        description="Super resolution settings",
+    )
+    background_removal: BackgroundRemovalConfig = Field(
+        default_factory=lambda: BackgroundRemovalConfig(**os.environ),
+        description="Background removal settings",
+    )
+    derived_image_cache: DerivedImageCacheConfig = Field(
+        default_factory=lambda: DerivedImageCacheConfig(**os.environ),
+        description="Transformation results cache settings",
+    )
+    image_renditions: ImageRenditionConfig = Field(
+        default_factory=lambda: ImageRenditionConfig(**os.environ),
+        description="Image renditions settings",
+    )
+    image_comparison: ImageComparisonConfig = Field(
+        default_factory=lambda: ImageComparisonConfig(**os.environ),
+        description="Image comparison settings",
+    )
+    image_search: ImageSearchConfig = Field(
+        default_factory=lambda: ImageSearchConfig(**os.environ),
+        description="Reverse image search settings",
+    )
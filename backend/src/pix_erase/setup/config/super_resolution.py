@@ -0,0 +1,125 @@
+from typing import Any, Final, Self
+
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+SUPPORTED_SCALES: Final[tuple[int, ...]] = (2, 3, 4)
+TILE_SIZE_MIN: Final[int] = 32
+TILE_WORKERS_MIN: Final[int] = 1
+JOB_MEMORY_LIMIT_MB_MIN: Final[int] = 64
+
+
+class SuperResolutionConfig(BaseModel):
+    """Configuration container for the AI (EDSR) upscaling models.
+
+    Attributes:
+        models_path: Directory with ``EDSR_x2.pb``, ``EDSR_x3.pb`` and ``EDSR_x4.pb``.
+            When not set, the directory next to the converter is used.
+        preload_scales: Scales whose models are loaded when a worker process starts,
+            other models are loaded on the first request.
+        warm_up: Run one inference on a small image after loading a model,
+            so the first real request doesn't pay for lazy backend initialization.
+        tile_size: Side of a square tile (in source pixels) that is upscaled at once.
+            It's shrunk automatically when a tile doesn't fit into ``job_memory_limit_mb``.
+        tile_overlap: Count of source pixels shared by neighbour tiles, seams are blended there.
+        tile_workers: Count of tiles of one image that are upscaled concurrently.
+        job_memory_limit_mb: Ceiling for inference tensors of all concurrent tiles of one image.
+            The upscaled image itself isn't counted.
+    """
+
+    models_path: str | None = Field(
+        alias="SUPER_RESOLUTION_MODELS_PATH",
+        default=None,
+        description="Directory with EDSR models.",
+        validate_default=True,
+    )
+    preload_scales: tuple[int, ...] = Field(
+        alias="SUPER_RESOLUTION_PRELOAD_SCALES",
+        default=(),
+        description="Comma separated scales of models that are loaded at worker startup, e.g. '2,4'.",
+        validate_default=True,
+    )
+    warm_up: bool = Field(
+        alias="SUPER_RESOLUTION_WARM_UP",
+        default=False,
+        description="Run warm-up inference after loading a model.",
+        validate_default=True,
+    )
+
+    tile_size: int = Field(
+        alias="SUPER_RESOLUTION_TILE_SIZE",
+        default=192,
+        description="Side of a tile in source pixels.",
+        validate_default=True,
+    )
+    tile_overlap: int = Field(
+        alias="SUPER_RESOLUTION_TILE_OVERLAP",
+        default=12,
+        description="Count of source pixels shared by neighbour tiles.",
+        validate_default=True,
+    )
+    tile_workers: int = Field(
+        alias="SUPER_RESOLUTION_TILE_WORKERS",
+        default=2,
+        description="Count of tiles upscaled concurrently.",
+        validate_default=True,
+    )
+    job_memory_limit_mb: int = Field(
+        alias="SUPER_RESOLUTION_JOB_MEMORY_LIMIT_MB",
+        default=2048,
+        description="Memory ceiling for inference of one image in megabytes.",
+        validate_default=True,
+    )
+
+    @field_validator("preload_scales", mode="before")
+    @classmethod
+    def split_preload_scales(cls, v: Any) -> Any:  # noqa: ANN401
+        if isinstance(v, str):
+            return tuple(scale.strip() for scale in v.split(",") if scale.strip())
+        return v
+
+    @field_validator("preload_scales")
+    @classmethod
+    def validate_preload_scales(cls, v: tuple[int, ...]) -> tuple[int, ...]:
+        for scale in v:
+            if scale not in SUPPORTED_SCALES:
+                raise ValueError(
+                    f"SUPER_RESOLUTION_PRELOAD_SCALES must contain only {SUPPORTED_SCALES}, got {scale}."
+                )
+        return v
+
+    @field_validator("tile_size")
+    @classmethod
+    def validate_tile_size(cls, v: int) -> int:
+        if v < TILE_SIZE_MIN:
+            raise ValueError(f"SUPER_RESOLUTION_TILE_SIZE must be at least {TILE_SIZE_MIN}, got {v}.")
+        return v
+
+    @field_validator("tile_overlap")
+    @classmethod
+    def validate_tile_overlap(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError(f"SUPER_RESOLUTION_TILE_OVERLAP must be non-negative, got {v}.")
+        return v
+
+    @field_validator("tile_workers")
+    @classmethod
+    def validate_tile_workers(cls, v: int) -> int:
+        if v < TILE_WORKERS_MIN:
+            raise ValueError(f"SUPER_RESOLUTION_TILE_WORKERS must be at least {TILE_WORKERS_MIN}, got {v}.")
+        return v
+
+    @field_validator("job_memory_limit_mb")
+    @classmethod
+    def validate_job_memory_limit_mb(cls, v: int) -> int:
+        if v < JOB_MEMORY_LIMIT_MB_MIN:
+            raise ValueError(
+                f"SUPER_RESOLUTION_JOB_MEMORY_LIMIT_MB must be at least {JOB_MEMORY_LIMIT_MB_MIN}, got {v}."
+            )
+        return v
+
+    @model_validator(mode="after")
+    def validate_tile_overlap_fits_tile(self) -> Self:
+        if self.tile_overlap * 2 >= self.tile_size:
+            msg = "SUPER_RESOLUTION_TILE_OVERLAP must be less than half of SUPER_RESOLUTION_TILE_SIZE."
+            raise ValueError(msg)
+        return self
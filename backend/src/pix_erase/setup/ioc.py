@@ -14,12 +14,18 @@ from pix_erase.application.auth.log_in import LogInHandler
 from pix_erase.application.auth.log_out import LogOutHandler
 from pix_erase.application.auth.read_current_user import ReadCurrentUserHandler
 from pix_erase.application.auth.sign_up import SignUpHandler
+from pix_erase.application.commands.image.compare_images import CompareImageCommandHandler
+from pix_erase.application.commands.image.compare_images_batch import CompareImagesBatchCommandHandler
+from pix_erase.application.commands.image.complete_image_upload import CompleteImageUploadCommandHandler
 from pix_erase.application.commands.image.compress_image import CompressImageCommandHandler
 from pix_erase.application.commands.image.create_image import CreateImageCommandHandler
 from pix_erase.application.commands.image.delete_image import DeleteImageCommandHandler
 from pix_erase.application.commands.image.grayscale_image import GrayscaleImageCommandHandler
+from pix_erase.application.commands.image.process_image_pipeline import ProcessImagePipelineCommandHandler
+from pix_erase.application.commands.image.process_images_batch import ProcessImagesBatchCommandHandler
 from pix_erase.application.commands.image.remove_background_image import RemoveBackgroundImageCommandHandler
 from pix_erase.application.commands.image.remove_watermark_from_image import RemoveWatermarkFromImageCommandHandler
+from pix_erase.application.commands.image.request_image_upload import RequestImageUploadCommandHandler
 from pix_erase.application.commands.image.rotate_image import RotateImageCommandHandler
 from pix_erase.application.commands.image.upscale_image import UpscaleImageCommandHandler
 from pix_erase.application.commands.user.activate_user import ActivateUserCommandHandler
@@ -33,17 +39,29 @@ from pix_erase.application.commands.user.revoke_admin_by_id import RevokeAdminBy
 from pix_erase.application.common.ports.access_revoker import AccessRevoker
 from pix_erase.application.common.ports.event_bus import EventBus
 from pix_erase.application.common.ports.identity_provider import IdentityProvider
+from pix_erase.application.common.ports.image.catalog_gateway import ImageCatalogGateway
 from pix_erase.application.common.ports.image.comparison_gateway import ImageComparisonGateway
 from pix_erase.application.common.ports.image.extractor import ImageInfoExtractor
+from pix_erase.application.common.ports.image.feature_cache import ImageFeatureCache
+from pix_erase.application.common.ports.image.perceptual_hash_gateway import ImagePerceptualHashGateway
+from pix_erase.application.common.ports.image.perceptual_hasher import ImagePerceptualHasher
+from pix_erase.application.common.ports.image.rendition_storage import ImageRenditionStorage
+from pix_erase.application.common.ports.image.similarity_index import ImageSimilarityIndex
 from pix_erase.application.common.ports.image.storage import ImageStorage
+from pix_erase.application.common.ports.image.url_signer import ImageUrlSigner
 from pix_erase.application.common.ports.scheduler.task_scheduler import TaskScheduler
 from pix_erase.application.common.ports.transaction_manager import TransactionManager
 from pix_erase.application.common.ports.user.command_gateway import UserCommandGateway
 from pix_erase.application.common.ports.user.query_gateway import UserQueryGateway
 from pix_erase.application.common.services.auth_session import AuthSessionService
 from pix_erase.application.common.services.current_user import CurrentUserService
+from pix_erase.application.common.services.image_batch_comparison import ImageBatchComparisonService
+from pix_erase.application.common.services.image_catalog import ImageCatalogService
+from pix_erase.application.common.services.image_search_index import ImageSearchIndexService
+from pix_erase.application.queries.images.list_images import ListImagesQueryHandler
 from pix_erase.application.queries.images.read_by_id import ReadImageByIDQueryHandler
 from pix_erase.application.queries.images.read_exif_from_image_by_id import ReadExifFromImageByIDQueryHandler
+from pix_erase.application.queries.images.reverse_search_image import ReverseImageSearchQueryHandler
 from pix_erase.application.queries.internet_protocol.analyze_domain_info import AnalyzeDomainQueryHandler
 from pix_erase.application.queries.internet_protocol.ping_internet_protocol import PingInternetProtocolQueryHandler
 from pix_erase.application.queries.internet_protocol.read_ip_info import ReadIPInfoQueryHandler
@@ -51,6 +69,7 @@ from pix_erase.application.queries.internet_protocol.scan_common_ports import Sc
 from pix_erase.application.queries.internet_protocol.scan_port import ScanPortQueryHandler
 from pix_erase.application.queries.internet_protocol.scan_port_range import ScanPortRangeQueryHandler
 from pix_erase.application.queries.internet_protocol.scan_ports import ScanPortsQueryHandler
+from pix_erase.application.queries.tasks.read_task_batch_by_id import ReadTaskBatchByIDQueryHandler
 from pix_erase.application.queries.tasks.read_task_by_id import ReadTaskByIDQueryHandler
 from pix_erase.application.queries.users.read_all import ReadAllUsersQueryHandler
 from pix_erase.application.queries.users.read_by_id import ReadUserByIDQueryHandler
@@ -64,11 +83,13 @@ from pix_erase.domain.image.ports.image_crop_converter import ImageCropConverter
 from pix_erase.domain.image.ports.image_nearest_neighbour_upscale_converter import (
     ImageNearestNeighbourUpscalerConverter,
 )
+from pix_erase.domain.image.ports.image_pipeline_converter import ImagePipelineConverter
 from pix_erase.domain.image.ports.image_resizer import ImageResizerConverter
 from pix_erase.domain.image.ports.image_rotation_converter import ImageRotationConverter
 from pix_erase.domain.image.ports.image_watermark_remover_converter import ImageWatermarkRemoverConverter
 from pix_erase.domain.image.services.colorization_service import ImageColorizationService
 from pix_erase.domain.image.services.image_service import ImageService
+from pix_erase.domain.image.services.pipeline_service import ImagePipelineService
 from pix_erase.domain.image.services.transformation_service import ImageTransformationService
 from pix_erase.domain.internet_protocol.ports import IPInfoServicePort, PortScanServicePort
 from pix_erase.domain.internet_protocol.ports.certificate_transparency_port import CertificateTransparencyPort
@@ -105,10 +126,25 @@ from pix_erase.infrastructure.adapters.image_converters.cv2_image_crop_converter
 from pix_erase.infrastructure.adapters.image_converters.cv2_image_nearest_neighbour_upscale_converter import (
     Cv2ImageNearestNeighbourUpscalerConverter,
 )
+from pix_erase.infrastructure.adapters.image_converters.cv2_image_perceptual_hasher import Cv2ImagePerceptualHasher
+from pix_erase.infrastructure.adapters.image_converters.cv2_image_pipeline_converter import Cv2ImagePipelineConverter
 from pix_erase.infrastructure.adapters.image_converters.cv2_image_resizer_converter import Cv2ImageResizerConverter
 from pix_erase.infrastructure.adapters.image_converters.cv2_image_rotation_converter import Cv2ImageRotationConverter
 from pix_erase.infrastructure.adapters.image_converters.cv2_watermark_remover import Cv2ImageWatermarkRemover
 from pix_erase.infrastructure.adapters.image_converters.exif_image_extractor import ExifImageInfoExtractor
+from pix_erase.infrastructure.adapters.image_converters.process_pool_converters import (
+    ProcessPoolImageAIUpscaleConverter,
+    ProcessPoolImageColorToCrayScaleConverter,
+    ProcessPoolImageComparerConverter,
+    ProcessPoolImageCompressConverter,
+    ProcessPoolImageCropConverter,
+    ProcessPoolImageNearestNeighbourUpscalerConverter,
+    ProcessPoolImagePipelineConverter,
+    ProcessPoolImageRemoveBackgroundConverter,
+    ProcessPoolImageResizerConverter,
+    ProcessPoolImageRotationConverter,
+    ProcessPoolImageWatermarkRemoverConverter,
+)
 from pix_erase.infrastructure.adapters.image_converters.rembg_image_remove_background_converter import (
     RembgImageRemoveBackgroundConverter,
 )
@@ -121,19 +157,34 @@ from pix_erase.infrastructure.adapters.internet_protocol.ip_api_service_port imp
 from pix_erase.infrastructure.adapters.internet_protocol.raw_socket_ping_service_port import RawSocketPingServicePort
 from pix_erase.infrastructure.adapters.internet_protocol.socket_port_scan_service_port import SocketPortScanServicePort
 from pix_erase.infrastructure.adapters.persistence.aiobotocore_file_storage import AiobotocoreS3ImageStorage
+from pix_erase.infrastructure.adapters.persistence.aiobotocore_image_rendition_storage import (
+    AiobotocoreS3ImageRenditionStorage,
+)
+from pix_erase.infrastructure.adapters.persistence.aiobotocore_image_url_signer import AiobotocoreS3ImageUrlSigner
 from pix_erase.infrastructure.adapters.persistence.alchemy_auth_session_command_gateway import (
     SQLAlchemyAuthSessionCommandGateway,
 )
 from pix_erase.infrastructure.adapters.persistence.alchemy_auth_transaction_manager import (
     SqlaAuthSessionTransactionManager,
 )
+from pix_erase.infrastructure.adapters.persistence.alchemy_image_catalog_gateway import SqlAlchemyImageCatalogGateway
 from pix_erase.infrastructure.adapters.persistence.alchemy_image_comparison_gateway import (
     SqlAlchemyImageComparisonGateway,
 )
+from pix_erase.infrastructure.adapters.persistence.alchemy_image_perceptual_hash_gateway import (
+    SqlAlchemyImagePerceptualHashGateway,
+)
+from pix_erase.infrastructure.adapters.persistence.alchemy_image_similarity_index import (
+    PerceptualHashIndex,
+    SqlAlchemyImageSimilarityIndex,
+)
 from pix_erase.infrastructure.adapters.persistence.alchemy_main_transaction_manager import SqlAlchemyTransactionManager
 from pix_erase.infrastructure.adapters.persistence.alchemy_user_command_gateway import SqlAlchemyUserCommandGateway
 from pix_erase.infrastructure.adapters.persistence.alchemy_user_query_gateway import SqlAlchemyUserQueryGateway
+from pix_erase.infrastructure.adapters.persistence.cached_image_storage import CachedImageStorage
+from pix_erase.infrastructure.adapters.persistence.cached_user_command_gateway import CachedUserCommandGateway
 from pix_erase.infrastructure.adapters.persistence.cached_user_query_gateway import CachedUserQueryGateway
+from pix_erase.infrastructure.adapters.persistence.user_cache_transaction_manager import UserCacheTransactionManager
 from pix_erase.infrastructure.auth.cookie_params import CookieParams
 from pix_erase.infrastructure.auth.session.id_generator import AuthSessionIDGenerator
 from pix_erase.infrastructure.auth.session.ports.gateway import AuthSessionGateway
@@ -145,8 +196,12 @@ from pix_erase.infrastructure.auth.session.timer_utc import (
     UtcAuthSessionTimer,
 )
 from pix_erase.infrastructure.cache.cache_store import CacheStore
+from pix_erase.infrastructure.cache.derived_image_cache import DerivedImageCache
 from pix_erase.infrastructure.cache.provider import get_redis, get_redis_pool
 from pix_erase.infrastructure.cache.redis_cache_store import RedisCacheStore
+from pix_erase.infrastructure.cache.redis_image_feature_cache import RedisImageFeatureCache
+from pix_erase.infrastructure.cache.s3_derived_image_cache import S3DerivedImageCache
+from pix_erase.infrastructure.cache.user_cache import UserCache
 from pix_erase.infrastructure.http.base import HttpClient
 from pix_erase.infrastructure.http.httpx_client import HttpxHttpClient
 from pix_erase.infrastructure.http.provider import get_httpx_client
@@ -157,12 +212,21 @@ from pix_erase.infrastructure.persistence.provider import (
     get_session,
     get_sessionmaker,
 )
+from pix_erase.infrastructure.processing.process_pool import ImageProcessPool
+from pix_erase.infrastructure.processing.provider import get_image_process_pool
 from pix_erase.infrastructure.scheduler.task_iq_task_scheduler import TaskIQTaskScheduler
 from pix_erase.setup.bootstrap import setup_schedule_source
 from pix_erase.setup.config.asgi import ASGIConfig
+from pix_erase.setup.config.background_removal import BackgroundRemovalConfig
 from pix_erase.setup.config.database import PostgresConfig
+from pix_erase.setup.config.derived_image_cache import DerivedImageCacheConfig
 from pix_erase.setup.config.http import HttpClientConfig
+from pix_erase.setup.config.image_comparison import ImageComparisonConfig
+from pix_erase.setup.config.image_processing import ImageProcessingConfig
+from pix_erase.setup.config.image_renditions import ImageRenditionConfig
+from pix_erase.setup.config.image_search import ImageSearchConfig
 from pix_erase.setup.config.s3 import S3Config
+from pix_erase.setup.config.super_resolution import SuperResolutionConfig
 
 
 def configs_provider() -> Provider:
@@ -178,6 +242,12 @@ def configs_provider() -> Provider:
     provider.from_context(provides=S3Config)
     provider.from_context(provides=AsyncBroker)
     provider.from_context(provides=HttpClientConfig)
+    provider.from_context(provides=SuperResolutionConfig)
+    provider.from_context(provides=BackgroundRemovalConfig)
+    provider.from_context(provides=DerivedImageCacheConfig)
+    provider.from_context(provides=ImageRenditionConfig)
+    provider.from_context(provides=ImageComparisonConfig)
+    provider.from_context(provides=ImageSearchConfig)
     return provider
 
 
@@ -190,7 +260,7 @@ def db_provider() -> Provider:
 
 
 def s3_provider() -> Provider:
-    provider: Final[Provider] = Provider(scope=Scope.REQUEST)
+    provider: Final[Provider] = Provider(scope=Scope.APP)
     provider.provide(get_s3_session)
     provider.provide(get_s3_client)
     return provider
@@ -201,7 +271,13 @@ def cache_provider() -> Provider:
     provider.provide(get_redis_pool, scope=Scope.APP)
     provider.provide(get_redis, provides=Redis)
     provider.provide(source=RedisCacheStore, provides=CacheStore)
+    provider.provide(source=S3DerivedImageCache, provides=DerivedImageCache)
+    provider.provide(source=RedisImageFeatureCache, provides=ImageFeatureCache)
+    provider.provide(source=UserCache)
     provider.decorate(source=CachedUserQueryGateway, provides=UserQueryGateway)
+    provider.decorate(source=CachedUserCommandGateway, provides=UserCommandGateway)
+    provider.decorate(source=UserCacheTransactionManager, provides=TransactionManager)
+    provider.decorate(source=CachedImageStorage, provides=ImageStorage)
     return provider
 
 
@@ -244,6 +320,7 @@ def domain_ports_provider() -> Provider:
     provider.provide(source=Cv2EDSRImageUpscaleConverter, provides=ImageAIUpscaleConverter)
     provider.provide(source=RembgImageRemoveBackgroundConverter, provides=ImageRemoveBackgroundConverter)
     provider.provide(source=Cv2ImageResizerConverter, provides=ImageResizerConverter)
+    provider.provide(source=Cv2ImagePipelineConverter, provides=ImagePipelineConverter)
     provider.provide(source=RawSocketPingServicePort, provides=PingServicePort)
     provider.provide(source=IPAPIServicePort, provides=IPInfoServicePort)
     provider.provide(source=HttpTitleFetcher, provides=HttpTitleFetcherPort)
@@ -255,11 +332,32 @@ def domain_ports_provider() -> Provider:
     provider.provide(source=ImageService)
     provider.provide(source=ImageTransformationService)
     provider.provide(source=ImageColorizationService)
+    provider.provide(source=ImagePipelineService)
     provider.provide(source=InternetProtocolService)
     provider.provide(source=InternetDomainService)
     return provider
 
 
+def image_processing_provider() -> Provider:
+    provider: Final[Provider] = Provider(scope=Scope.REQUEST)
+    provider.from_context(provides=ImageProcessingConfig, scope=Scope.APP)
+    provider.provide(get_image_process_pool, provides=ImageProcessPool, scope=Scope.APP)
+    provider.decorate(ProcessPoolImageColorToCrayScaleConverter, provides=ImageColorToCrayScaleConverter)
+    provider.decorate(ProcessPoolImageCompressConverter, provides=ImageCompressConverter)
+    provider.decorate(ProcessPoolImageComparerConverter, provides=ImageComparerConverter)
+    provider.decorate(ProcessPoolImageCropConverter, provides=ImageCropConverter)
+    provider.decorate(ProcessPoolImageRotationConverter, provides=ImageRotationConverter)
+    provider.decorate(ProcessPoolImageWatermarkRemoverConverter, provides=ImageWatermarkRemoverConverter)
+    provider.decorate(
+        ProcessPoolImageNearestNeighbourUpscalerConverter, provides=ImageNearestNeighbourUpscalerConverter
+    )
+    provider.decorate(ProcessPoolImageAIUpscaleConverter, provides=ImageAIUpscaleConverter)
+    provider.decorate(ProcessPoolImageRemoveBackgroundConverter, provides=ImageRemoveBackgroundConverter)
+    provider.decorate(ProcessPoolImageResizerConverter, provides=ImageResizerConverter)
+    provider.decorate(ProcessPoolImagePipelineConverter, provides=ImagePipelineConverter)
+    return provider
+
+
 def gateways_provider() -> Provider:
     provider: Final[Provider] = Provider(scope=Scope.REQUEST)
     provider.provide(source=SQLAlchemyAuthSessionCommandGateway, provides=AuthSessionGateway)
@@ -268,13 +366,19 @@ def gateways_provider() -> Provider:
     provider.provide(source=SqlAlchemyUserCommandGateway, provides=UserCommandGateway)
     provider.provide(source=SqlAlchemyUserQueryGateway, provides=UserQueryGateway)
     provider.provide(source=AiobotocoreS3ImageStorage, provides=ImageStorage)
+    provider.provide(source=AiobotocoreS3ImageUrlSigner, provides=ImageUrlSigner)
+    provider.provide(source=AiobotocoreS3ImageRenditionStorage, provides=ImageRenditionStorage)
     provider.provide(source=SqlAlchemyImageComparisonGateway, provides=ImageComparisonGateway)
+    provider.provide(source=SqlAlchemyImagePerceptualHashGateway, provides=ImagePerceptualHashGateway)
+    provider.provide(source=SqlAlchemyImageCatalogGateway, provides=ImageCatalogGateway)
+    provider.provide(source=PerceptualHashIndex, scope=Scope.APP)
+    provider.provide(source=SqlAlchemyImageSimilarityIndex, provides=ImageSimilarityIndex)
     return provider
 
 
 def http_client_provider() -> Provider:
     provider: Final[Provider] = Provider(scope=Scope.REQUEST)
-    provider.provide(get_httpx_client)
+    provider.provide(get_httpx_client, scope=Scope.APP)
     provider.provide(source=HttpxHttpClient, provides=HttpClient)
     return provider
 
@@ -289,6 +393,10 @@ def application_ports_provider() -> Provider:
     provider.provide(source=setup_schedule_source, scope=Scope.APP)
     provider.provide(source=TaskIQTaskScheduler, provides=TaskScheduler)
     provider.provide(source=ExifImageInfoExtractor, provides=ImageInfoExtractor)
+    provider.provide(source=Cv2ImagePerceptualHasher, provides=ImagePerceptualHasher)
+    provider.provide(source=ImageSearchIndexService)
+    provider.provide(source=ImageCatalogService)
+    provider.provide(source=ImageBatchComparisonService)
     return provider
 
 
@@ -322,14 +430,23 @@ def interactors_provider() -> Provider:
         ReadUserByIDQueryHandler,
         CompressImageCommandHandler,
         CreateImageCommandHandler,
+        RequestImageUploadCommandHandler,
+        CompleteImageUploadCommandHandler,
         RemoveWatermarkFromImageCommandHandler,
         RotateImageCommandHandler,
         DeleteImageCommandHandler,
         ReadImageByIDQueryHandler,
         UpscaleImageCommandHandler,
+        ProcessImagePipelineCommandHandler,
+        ProcessImagesBatchCommandHandler,
+        CompareImageCommandHandler,
+        CompareImagesBatchCommandHandler,
         ReadExifFromImageByIDQueryHandler,
+        ReverseImageSearchQueryHandler,
+        ListImagesQueryHandler,
         RemoveBackgroundImageCommandHandler,
         ReadTaskByIDQueryHandler,
+        ReadTaskBatchByIDQueryHandler,
         PingInternetProtocolQueryHandler,
         ReadIPInfoQueryHandler,
         ScanPortRangeQueryHandler,
@@ -372,3 +489,10 @@ def setup_grpc_providers() -> Iterable[Provider]:
         application_ports_provider(),
         http_client_provider(),
     )
+
+
+def setup_worker_providers(image_processing_config: ImageProcessingConfig) -> Iterable[Provider]:
+    if not image_processing_config.pool_enabled:
+        return setup_providers()
+
+    return (*setup_providers(), image_processing_provider())
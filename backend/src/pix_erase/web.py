@@ -28,10 +28,16 @@ from pix_erase.setup.bootstrap import (
     setup_task_manager_tasks,
 )
 from pix_erase.setup.config.asgi import ASGIConfig
+from pix_erase.setup.config.background_removal import BackgroundRemovalConfig
 from pix_erase.setup.config.cache import RedisConfig
 from pix_erase.setup.config.database import PostgresConfig, SQLAlchemyConfig
+from pix_erase.setup.config.derived_image_cache import DerivedImageCacheConfig
 from pix_erase.setup.config.http import HttpClientConfig
+from pix_erase.setup.config.image_comparison import ImageComparisonConfig
+from pix_erase.setup.config.image_renditions import ImageRenditionConfig
+from pix_erase.setup.config.image_search import ImageSearchConfig
 from pix_erase.setup.config.s3 import S3Config
+from pix_erase.setup.config.super_resolution import SuperResolutionConfig
 from pix_erase.setup.ioc import setup_providers
 
 if TYPE_CHECKING:
@@ -129,6 +135,12 @@ def create_fastapi_app() -> FastAPI:  # pragma: no cover
         S3Config: configs.s3,
         AsyncBroker: task_manager,
         HttpClientConfig: configs.http,
+        SuperResolutionConfig: configs.super_resolution,
+        BackgroundRemovalConfig: configs.background_removal,
+        DerivedImageCacheConfig: configs.derived_image_cache,
+        ImageRenditionConfig: configs.image_renditions,
+        ImageComparisonConfig: configs.image_comparison,
+        ImageSearchConfig: configs.image_search,
     }
 
     container: AsyncContainer = make_async_container(*setup_providers(), context=context)
@@ -1,3 +1,5 @@
+import asyncio
+
 from dishka import AsyncContainer, make_async_container
 from dishka.integrations.taskiq import setup_dishka
 from sqlalchemy.orm import clear_mappers
@@ -5,6 +7,10 @@ from taskiq import AsyncBroker, TaskiqEvents, TaskiqState
 
 from pix_erase.infrastructure.adapters.auth.jwt_token_processor import JwtAlgorithm, JwtSecret
 from pix_erase.infrastructure.adapters.common.password_hasher_bcrypt import PasswordPepper
+from pix_erase.infrastructure.adapters.image_converters.rembg_session_pool import preload_rembg_sessions
+from pix_erase.infrastructure.adapters.image_converters.super_resolution_registry import (
+    preload_super_resolution_models,
+)
 from pix_erase.infrastructure.auth.cookie_params import CookieParams
 from pix_erase.infrastructure.auth.session.timer_utc import AuthSessionRefreshThreshold, AuthSessionTtlMin
 from pix_erase.setup.bootstrap import (
@@ -14,12 +20,19 @@ from pix_erase.setup.bootstrap import (
     setup_task_manager_tasks,
 )
 from pix_erase.setup.config.asgi import ASGIConfig
+from pix_erase.setup.config.background_removal import BackgroundRemovalConfig
 from pix_erase.setup.config.cache import RedisConfig
 from pix_erase.setup.config.database import PostgresConfig, SQLAlchemyConfig
+from pix_erase.setup.config.derived_image_cache import DerivedImageCacheConfig
 from pix_erase.setup.config.http import HttpClientConfig
+from pix_erase.setup.config.image_comparison import ImageComparisonConfig
+from pix_erase.setup.config.image_processing import ImageProcessingConfig
+from pix_erase.setup.config.image_renditions import ImageRenditionConfig
+from pix_erase.setup.config.image_search import ImageSearchConfig
 from pix_erase.setup.config.s3 import S3Config
 from pix_erase.setup.config.settings import AppConfig
-from pix_erase.setup.ioc import setup_providers
+from pix_erase.setup.config.super_resolution import SuperResolutionConfig
+from pix_erase.setup.ioc import setup_worker_providers
 
 
 async def startup(state: TaskiqState) -> None:  # noqa: ARG001
@@ -58,9 +71,43 @@ def create_worker_taskiq_app() -> AsyncBroker:
         S3Config: configs.s3,
         AsyncBroker: task_manager,
         HttpClientConfig: configs.http,
+        SuperResolutionConfig: configs.super_resolution,
+        BackgroundRemovalConfig: configs.background_removal,
+        DerivedImageCacheConfig: configs.derived_image_cache,
+        ImageRenditionConfig: configs.image_renditions,
+        ImageComparisonConfig: configs.image_comparison,
+        ImageSearchConfig: configs.image_search,
+        ImageProcessingConfig: configs.image_processing,
     }
 
-    container: AsyncContainer = make_async_container(*setup_providers(), context=context)
+    container: AsyncContainer = make_async_container(
+        *setup_worker_providers(configs.image_processing),
+        context=context,
+    )
+
+    async def close_container(state: TaskiqState) -> None:  # noqa: ARG001
+        await container.close()
+
+    task_manager.on_event(TaskiqEvents.WORKER_SHUTDOWN)(close_container)
+
+    # With the pool enabled models are preloaded by every pool process instead
+    if not configs.image_processing.pool_enabled:
+
+        async def preload_models(state: TaskiqState) -> None:  # noqa: ARG001
+            await asyncio.to_thread(
+                preload_super_resolution_models,
+                scales=configs.super_resolution.preload_scales,
+                models_path=configs.super_resolution.models_path,
+                warm_up=configs.super_resolution.warm_up,
+            )
+            await asyncio.to_thread(
+                preload_rembg_sessions,
+                models=configs.background_removal.preload_models,
+                intra_op_threads=configs.background_removal.intra_op_threads,
+                inter_op_threads=configs.background_removal.inter_op_threads,
+            )
+
+        task_manager.on_event(TaskiqEvents.WORKER_STARTUP)(preload_models)
 
     setup_dishka(container, broker=task_manager)
 
@@ -1,3 +1,4 @@
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, Mock
 from uuid import uuid4
 
@@ -8,35 +9,69 @@ from pix_erase.application.commands.image.compare_images import (
     CompareImageCommandHandler,
 )
 from pix_erase.application.common.ports.scheduler.task_id import TaskID
+from pix_erase.application.common.query_models.image import ImageMetadataQueryModel
 from pix_erase.application.errors.image import ImageDoesntBelongToThisUserError, ImageNotFoundError
-from pix_erase.domain.image.entities.image import Image
+from pix_erase.domain.image.entities.image_comparison import ImageComparison
+from pix_erase.domain.image.values.comparison_id import comparison_id_for
 from pix_erase.domain.image.values.image_id import ImageID
 from pix_erase.domain.image.values.image_name import ImageName
 from pix_erase.domain.image.values.image_size import ImageSize
 
+UPDATED_AT = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def _metadata(name: str, updated_at: datetime = UPDATED_AT) -> ImageMetadataQueryModel:
+    return ImageMetadataQueryModel(
+        content_type="image/jpeg",
+        content_length=1,
+        width=ImageSize(1),
+        height=ImageSize(1),
+        filename=ImageName(name),
+        created_at=UPDATED_AT,
+        updated_at=updated_at,
+    )
+
+
+def _comparison(first_id: ImageID, second_id: ImageID, images_updated_at: datetime | None) -> ImageComparison:
+    return ImageComparison(
+        id=comparison_id_for(first_id, second_id),
+        first_image_id=first_id,
+        second_image_id=second_id,
+        scores={"SSIM": 0.5},
+        different_names=True,
+        different_width=False,
+        different_height=False,
+        images_updated_at=images_updated_at,
+    )
+
 
 @pytest.mark.asyncio
 async def test_compare_images_schedules_task(
     fake_current_user_service: Mock,
     fake_image_storage: Mock,
+    fake_comparison_gateway: Mock,
     fake_task_scheduler: Mock,
+    fake_image_catalog_gateway: Mock,
+    owned_images: set[ImageID],
 ) -> None:
     # Arrange
     first_id = ImageID(uuid4())
     second_id = ImageID(uuid4())
-    user = await fake_current_user_service.get_current_user()
-    user.images = [first_id, second_id]
+    owned_images.update([first_id, second_id])
 
-    fake_first = Image(id=first_id, name=ImageName("a.jpg"), data=b"d", width=ImageSize(1), height=ImageSize(1))
-    fake_second = Image(id=second_id, name=ImageName("b.jpg"), data=b"d", width=ImageSize(1), height=ImageSize(1))
-    fake_image_storage.read_by_id = AsyncMock(side_effect=[fake_first, fake_second])  # type: ignore[attr-defined]
+    fake_image_storage.read_metadata_by_id = AsyncMock(  # type: ignore[attr-defined]
+        side_effect=[_metadata("a.jpg"), _metadata("b.jpg")],
+    )
+    fake_comparison_gateway.read_by_id = AsyncMock(return_value=None)  # type: ignore[attr-defined]
     expected: TaskID = TaskID("compare_images:1")
     fake_task_scheduler.make_task_id.return_value = expected  # type: ignore[assignment]
     fake_task_scheduler.schedule = AsyncMock(return_value=None)  # type: ignore[attr-defined]
 
     sut = CompareImageCommandHandler(
         current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
         image_storage=fake_image_storage,
+        comparison_gateway=fake_comparison_gateway,
         scheduler=fake_task_scheduler,
     )
 
@@ -44,7 +79,98 @@ async def test_compare_images_schedules_task(
     result = await sut(CompareImageCommand(first_image=first_id, second_image=second_id))
 
     # Assert
-    assert result == expected
+    assert result.task_id == expected
+    assert result.comparison is None
+    fake_task_scheduler.schedule.assert_called_once()  # type: ignore[attr-defined]
+    fake_image_storage.read_by_id.assert_not_called()  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_compare_images_returns_stored_comparison(
+    fake_current_user_service: Mock,
+    fake_image_storage: Mock,
+    fake_comparison_gateway: Mock,
+    fake_task_scheduler: Mock,
+    fake_image_catalog_gateway: Mock,
+    owned_images: set[ImageID],
+) -> None:
+    # Arrange
+    first_id = ImageID(uuid4())
+    second_id = ImageID(uuid4())
+    owned_images.update([first_id, second_id])
+
+    fake_image_storage.read_metadata_by_id = AsyncMock(  # type: ignore[attr-defined]
+        side_effect=[_metadata("a.jpg"), _metadata("b.jpg")],
+    )
+    fake_comparison_gateway.read_by_id = AsyncMock(  # type: ignore[attr-defined]
+        return_value=_comparison(second_id, first_id, UPDATED_AT),
+    )
+
+    sut = CompareImageCommandHandler(
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+        image_storage=fake_image_storage,
+        comparison_gateway=fake_comparison_gateway,
+        scheduler=fake_task_scheduler,
+    )
+
+    # Act
+    result = await sut(CompareImageCommand(first_image=first_id, second_image=second_id))
+
+    # Assert
+    assert result.task_id is None
+    assert result.comparison is not None
+    assert result.comparison.scores == {"SSIM": 0.5}
+    fake_comparison_gateway.read_by_id.assert_awaited_once_with(  # type: ignore[attr-defined]
+        comparison_id_for(first_id, second_id),
+    )
+    fake_task_scheduler.schedule.assert_not_called()  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "images_updated_at",
+    [
+        pytest.param(None, id="unknown_versions"),
+        pytest.param(UPDATED_AT - timedelta(seconds=1), id="image_changed"),
+    ],
+)
+async def test_compare_images_recompares_stale_comparison(
+    fake_current_user_service: Mock,
+    fake_image_storage: Mock,
+    fake_comparison_gateway: Mock,
+    fake_task_scheduler: Mock,
+    images_updated_at: datetime | None,
+    fake_image_catalog_gateway: Mock,
+    owned_images: set[ImageID],
+) -> None:
+    # Arrange
+    first_id = ImageID(uuid4())
+    second_id = ImageID(uuid4())
+    owned_images.update([first_id, second_id])
+
+    fake_image_storage.read_metadata_by_id = AsyncMock(  # type: ignore[attr-defined]
+        side_effect=[_metadata("a.jpg"), _metadata("b.jpg")],
+    )
+    fake_comparison_gateway.read_by_id = AsyncMock(  # type: ignore[attr-defined]
+        return_value=_comparison(first_id, second_id, images_updated_at),
+    )
+    fake_task_scheduler.schedule = AsyncMock(return_value=None)  # type: ignore[attr-defined]
+
+    sut = CompareImageCommandHandler(
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+        image_storage=fake_image_storage,
+        comparison_gateway=fake_comparison_gateway,
+        scheduler=fake_task_scheduler,
+    )
+
+    # Act
+    result = await sut(CompareImageCommand(first_image=first_id, second_image=second_id))
+
+    # Assert
+    assert result.comparison is None
+    assert result.task_id is not None
     fake_task_scheduler.schedule.assert_called_once()  # type: ignore[attr-defined]
 
 
@@ -52,16 +178,20 @@ async def test_compare_images_schedules_task(
 async def test_compare_images_wrong_owner_first(
     fake_current_user_service: Mock,
     fake_image_storage: Mock,
+    fake_comparison_gateway: Mock,
     fake_task_scheduler: Mock,
+    fake_image_catalog_gateway: Mock,
+    owned_images: set[ImageID],
 ) -> None:
     first_id = ImageID(uuid4())
     second_id = ImageID(uuid4())
-    user = await fake_current_user_service.get_current_user()
-    user.images = [second_id]
+    owned_images.update([second_id])
 
     sut = CompareImageCommandHandler(
         current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
         image_storage=fake_image_storage,
+        comparison_gateway=fake_comparison_gateway,
         scheduler=fake_task_scheduler,
     )
     with pytest.raises(ImageDoesntBelongToThisUserError):
@@ -72,16 +202,20 @@ async def test_compare_images_wrong_owner_first(
 async def test_compare_images_wrong_owner_second(
     fake_current_user_service: Mock,
     fake_image_storage: Mock,
+    fake_comparison_gateway: Mock,
     fake_task_scheduler: Mock,
+    fake_image_catalog_gateway: Mock,
+    owned_images: set[ImageID],
 ) -> None:
     first_id = ImageID(uuid4())
     second_id = ImageID(uuid4())
-    user = await fake_current_user_service.get_current_user()
-    user.images = [first_id]
+    owned_images.update([first_id])
 
     sut = CompareImageCommandHandler(
         current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
         image_storage=fake_image_storage,
+        comparison_gateway=fake_comparison_gateway,
         scheduler=fake_task_scheduler,
     )
     with pytest.raises(ImageDoesntBelongToThisUserError):
@@ -92,17 +226,21 @@ async def test_compare_images_wrong_owner_second(
 async def test_compare_images_first_not_found(
     fake_current_user_service: Mock,
     fake_image_storage: Mock,
+    fake_comparison_gateway: Mock,
     fake_task_scheduler: Mock,
+    fake_image_catalog_gateway: Mock,
+    owned_images: set[ImageID],
 ) -> None:
     first_id = ImageID(uuid4())
     second_id = ImageID(uuid4())
-    user = await fake_current_user_service.get_current_user()
-    user.images = [first_id, second_id]
-    fake_image_storage.read_by_id = AsyncMock(return_value=None)  # type: ignore[attr-defined]
+    owned_images.update([first_id, second_id])
+    fake_image_storage.read_metadata_by_id = AsyncMock(return_value=None)  # type: ignore[attr-defined]
 
     sut = CompareImageCommandHandler(
         current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
         image_storage=fake_image_storage,
+        comparison_gateway=fake_comparison_gateway,
         scheduler=fake_task_scheduler,
     )
     with pytest.raises(ImageNotFoundError):
@@ -113,18 +251,23 @@ async def test_compare_images_first_not_found(
 async def test_compare_images_second_not_found(
     fake_current_user_service: Mock,
     fake_image_storage: Mock,
+    fake_comparison_gateway: Mock,
     fake_task_scheduler: Mock,
+    fake_image_catalog_gateway: Mock,
+    owned_images: set[ImageID],
 ) -> None:
     first_id = ImageID(uuid4())
     second_id = ImageID(uuid4())
-    user = await fake_current_user_service.get_current_user()
-    user.images = [first_id, second_id]
-    fake_first = Image(id=first_id, name=ImageName("a.jpg"), data=b"d", width=ImageSize(1), height=ImageSize(1))
-    fake_image_storage.read_by_id = AsyncMock(side_effect=[fake_first, None])  # type: ignore[attr-defined]
+    owned_images.update([first_id, second_id])
+    fake_image_storage.read_metadata_by_id = AsyncMock(  # type: ignore[attr-defined]
+        side_effect=[_metadata("a.jpg"), None],
+    )
 
     sut = CompareImageCommandHandler(
         current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
         image_storage=fake_image_storage,
+        comparison_gateway=fake_comparison_gateway,
         scheduler=fake_task_scheduler,
     )
     with pytest.raises(ImageNotFoundError):
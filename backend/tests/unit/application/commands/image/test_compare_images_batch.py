@@ -0,0 +1,134 @@
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from pix_erase.application.commands.image.compare_images_batch import (
+    MAX_ALL_PAIRS_IMAGES,
+    CompareImagesBatchCommand,
+    CompareImagesBatchCommandHandler,
+)
+from pix_erase.application.common.ports.scheduler.payloads.images import CompareImagesBatchPayload
+from pix_erase.application.common.ports.scheduler.task_id import TaskID
+from pix_erase.application.errors.image import BadImageComparisonBatchError, ImageDoesntBelongToThisUserError
+from pix_erase.domain.image.values.image_id import ImageID
+
+
+@pytest.mark.asyncio
+async def test_compare_images_batch_with_reference_schedules_task(
+    fake_current_user_service: Mock,
+    fake_task_scheduler: Mock,
+    fake_image_catalog_gateway: Mock,
+    owned_images: set[ImageID],
+) -> None:
+    # Arrange
+    reference_id = ImageID(uuid4())
+    candidate_ids = [ImageID(uuid4()), ImageID(uuid4())]
+    owned_images.update([reference_id, *candidate_ids])
+
+    expected: TaskID = TaskID("compare_images_batch:1")
+    fake_task_scheduler.make_task_id.return_value = expected  # type: ignore[assignment]
+    fake_task_scheduler.schedule = AsyncMock(return_value=None)  # type: ignore[attr-defined]
+
+    sut = CompareImagesBatchCommandHandler(
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+        scheduler=fake_task_scheduler,
+    )
+
+    # Act
+    result = await sut(
+        CompareImagesBatchCommand(
+            image_ids=[*candidate_ids, candidate_ids[0], reference_id],
+            reference_image=reference_id,
+        )
+    )
+
+    # Assert
+    assert result == expected
+    fake_task_scheduler.schedule.assert_called_once_with(  # type: ignore[attr-defined]
+        task_id=expected,
+        payload=CompareImagesBatchPayload(image_ids=candidate_ids, reference_image_id=reference_id),
+    )
+
+
+@pytest.mark.asyncio
+async def test_compare_images_batch_task_id_doesnt_depend_on_order(
+    fake_current_user_service: Mock,
+    fake_task_scheduler: Mock,
+    fake_image_catalog_gateway: Mock,
+    owned_images: set[ImageID],
+) -> None:
+    # Arrange
+    image_ids = [ImageID(uuid4()), ImageID(uuid4()), ImageID(uuid4())]
+    owned_images.update(image_ids)
+    fake_task_scheduler.schedule = AsyncMock(return_value=None)  # type: ignore[attr-defined]
+
+    sut = CompareImagesBatchCommandHandler(
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+        scheduler=fake_task_scheduler,
+    )
+
+    # Act
+    await sut(CompareImagesBatchCommand(image_ids=image_ids))
+    await sut(CompareImagesBatchCommand(image_ids=image_ids[::-1]))
+
+    # Assert
+    first, second = fake_task_scheduler.make_task_id.call_args_list  # type: ignore[attr-defined]
+    assert first.kwargs["value"] == second.kwargs["value"]
+
+
+@pytest.mark.asyncio
+async def test_compare_images_batch_wrong_owner(
+    fake_current_user_service: Mock,
+    fake_task_scheduler: Mock,
+    fake_image_catalog_gateway: Mock,
+    owned_images: set[ImageID],
+) -> None:
+    # Arrange
+    image_ids = [ImageID(uuid4()), ImageID(uuid4())]
+    owned_images.update(image_ids[:1])
+
+    sut = CompareImagesBatchCommandHandler(
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+        scheduler=fake_task_scheduler,
+    )
+
+    # Act & Assert
+    with pytest.raises(ImageDoesntBelongToThisUserError):
+        await sut(CompareImagesBatchCommand(image_ids=image_ids))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("images", "with_reference"),
+    [
+        pytest.param(1, False, id="single_image"),
+        pytest.param(MAX_ALL_PAIRS_IMAGES + 1, False, id="too_many_pairs"),
+        pytest.param(0, True, id="no_candidates"),
+    ],
+)
+async def test_compare_images_batch_rejects_bad_size(
+    fake_current_user_service: Mock,
+    fake_task_scheduler: Mock,
+    images: int,
+    with_reference: bool,
+    fake_image_catalog_gateway: Mock,
+) -> None:
+    # Arrange
+    image_ids = [ImageID(uuid4()) for _ in range(images)]
+    reference_id = ImageID(uuid4()) if with_reference else None
+
+    sut = CompareImagesBatchCommandHandler(
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+        scheduler=fake_task_scheduler,
+    )
+
+    # Act & Assert
+    with pytest.raises(BadImageComparisonBatchError):
+        await sut(CompareImagesBatchCommand(image_ids=image_ids, reference_image=reference_id))
+
+    fake_task_scheduler.schedule.assert_not_called()  # type: ignore[attr-defined]
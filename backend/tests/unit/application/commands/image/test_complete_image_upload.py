@@ -0,0 +1,157 @@
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from pix_erase.application.commands.image.complete_image_upload import (
+    CompleteImageUploadCommand,
+    CompleteImageUploadCommandHandler,
+)
+from pix_erase.application.common.ports.scheduler.payloads.images import StoreUploadedImagePayload
+from pix_erase.application.common.ports.scheduler.task_id import TaskID
+from pix_erase.application.errors.image import ImageDoesntBelongToThisUserError, ImageNotFoundError
+from pix_erase.domain.image.values.image_id import ImageID
+
+
+def _handler(
+    fake_current_user_service: Mock,
+    fake_image_storage: Mock,
+    fake_user_service: Mock,
+    fake_task_scheduler: Mock,
+    fake_transaction: Mock,
+    fake_image_catalog_gateway: Mock,
+) -> CompleteImageUploadCommandHandler:
+    return CompleteImageUploadCommandHandler(
+        current_user_service=fake_current_user_service,
+        image_storage=fake_image_storage,
+        user_service=fake_user_service,
+        scheduler=fake_task_scheduler,
+        transaction_manager=fake_transaction,
+        image_catalog_gateway=fake_image_catalog_gateway,
+    )
+
+
+@pytest.mark.asyncio
+async def test_complete_image_upload_schedules_task(
+    fake_current_user_service: Mock,
+    fake_image_storage: Mock,
+    fake_user_service: Mock,
+    fake_task_scheduler: Mock,
+    fake_transaction: Mock,
+    fake_image_catalog_gateway: Mock,
+) -> None:
+    # Arrange
+    image_id = ImageID(uuid4())
+    user = fake_current_user_service.get_current_user.return_value  # type: ignore[attr-defined]
+    fake_image_storage.read_upload_size = AsyncMock(return_value=1024)  # type: ignore[attr-defined]
+    expected: TaskID = TaskID("store_uploaded_image:1")
+    fake_task_scheduler.make_task_id.return_value = expected  # type: ignore[assignment]
+    fake_task_scheduler.schedule = AsyncMock(return_value=None)  # type: ignore[attr-defined]
+
+    sut = _handler(
+        fake_current_user_service,
+        fake_image_storage,
+        fake_user_service,
+        fake_task_scheduler,
+        fake_transaction,
+        fake_image_catalog_gateway,
+    )
+
+    # Act
+    result = await sut(CompleteImageUploadCommand(image_id=image_id, filename="photo.jpg"))
+
+    # Assert
+    assert result == expected
+    fake_user_service.add_image.assert_called_once_with(user=user, image_id=image_id)  # type: ignore[attr-defined]
+    fake_transaction.commit.assert_awaited_once()  # type: ignore[attr-defined]
+    fake_task_scheduler.schedule.assert_called_once_with(  # type: ignore[attr-defined]
+        task_id=expected,
+        payload=StoreUploadedImagePayload(image_id=image_id, filename="photo.jpg"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_complete_image_upload_twice_adds_image_once(
+    fake_current_user_service: Mock,
+    fake_image_storage: Mock,
+    fake_user_service: Mock,
+    fake_task_scheduler: Mock,
+    fake_transaction: Mock,
+    fake_image_catalog_gateway: Mock,
+    owned_images: set[ImageID],
+) -> None:
+    image_id = ImageID(uuid4())
+    owned_images.update([image_id])
+    fake_image_storage.read_upload_size = AsyncMock(return_value=1024)  # type: ignore[attr-defined]
+    fake_task_scheduler.schedule = AsyncMock(return_value=None)  # type: ignore[attr-defined]
+
+    sut = _handler(
+        fake_current_user_service,
+        fake_image_storage,
+        fake_user_service,
+        fake_task_scheduler,
+        fake_transaction,
+        fake_image_catalog_gateway,
+    )
+    await sut(CompleteImageUploadCommand(image_id=image_id, filename="photo.jpg"))
+
+    fake_user_service.add_image.assert_not_called()  # type: ignore[attr-defined]
+    fake_transaction.commit.assert_not_awaited()  # type: ignore[attr-defined]
+    fake_task_scheduler.schedule.assert_called_once()  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_complete_image_upload_nothing_uploaded(
+    fake_current_user_service: Mock,
+    fake_image_storage: Mock,
+    fake_user_service: Mock,
+    fake_task_scheduler: Mock,
+    fake_transaction: Mock,
+    fake_image_catalog_gateway: Mock,
+) -> None:
+    fake_image_storage.read_upload_size = AsyncMock(return_value=None)  # type: ignore[attr-defined]
+
+    sut = _handler(
+        fake_current_user_service,
+        fake_image_storage,
+        fake_user_service,
+        fake_task_scheduler,
+        fake_transaction,
+        fake_image_catalog_gateway,
+    )
+
+    with pytest.raises(ImageNotFoundError):
+        await sut(CompleteImageUploadCommand(image_id=uuid4(), filename="photo.jpg"))
+
+    fake_user_service.add_image.assert_not_called()  # type: ignore[attr-defined]
+    fake_task_scheduler.schedule.assert_not_called()  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_complete_image_upload_of_image_of_another_user(
+    fake_current_user_service: Mock,
+    fake_image_storage: Mock,
+    fake_user_service: Mock,
+    fake_task_scheduler: Mock,
+    fake_transaction: Mock,
+    fake_image_catalog_gateway: Mock,
+) -> None:
+    # the id is already in the catalogue of another user, adding it does nothing
+    fake_image_catalog_gateway.add.side_effect = None  # type: ignore[attr-defined]
+    fake_image_storage.read_upload_size = AsyncMock(return_value=1024)  # type: ignore[attr-defined]
+
+    sut = _handler(
+        fake_current_user_service,
+        fake_image_storage,
+        fake_user_service,
+        fake_task_scheduler,
+        fake_transaction,
+        fake_image_catalog_gateway,
+    )
+
+    with pytest.raises(ImageDoesntBelongToThisUserError):
+        await sut(CompleteImageUploadCommand(image_id=uuid4(), filename="photo.jpg"))
+
+    fake_user_service.add_image.assert_not_called()  # type: ignore[attr-defined]
+    fake_transaction.commit.assert_not_awaited()  # type: ignore[attr-defined]
+    fake_task_scheduler.schedule.assert_not_called()  # type: ignore[attr-defined]
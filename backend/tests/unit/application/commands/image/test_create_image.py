@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, call
 from uuid import uuid4
 
 import pytest
@@ -10,60 +10,79 @@ from pix_erase.application.commands.image.create_image import (
     CreateImageCommand,
     CreateImageCommandHandler,
 )
-from pix_erase.application.common.ports.image.extractor import ImageInfo
-from pix_erase.domain.image.entities.image import Image
+from pix_erase.application.common.ports.scheduler.payloads.images import (
+    GenerateImageRenditionsPayload,
+    IndexImagePayload,
+)
 from pix_erase.domain.image.values.image_id import ImageID
 from pix_erase.domain.image.values.image_name import ImageName
-from pix_erase.domain.image.values.image_size import ImageSize
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from pix_erase.application.common.views.image.create_image import CreateImageView
 
 
+async def _stream(data: bytes) -> AsyncIterator[bytes]:
+    yield data
+
+
 @pytest.mark.asyncio
 async def test_create_image_success(
     fake_current_user_service: Mock,
     fake_image_storage: Mock,
-    fake_image_extractor: Mock,
     fake_image_service: Mock,
     fake_user_service: Mock,
     fake_transaction: Mock,
-    fake_user_command_gateway: Mock,
+    fake_image_catalog_gateway: Mock,
+    fake_task_scheduler: Mock,
 ) -> None:
     # Arrange
-    data = b"image-bytes"
+    stream = _stream(b"image-bytes")
     filename = "test.jpg"
-    fake_image_extractor.extract = AsyncMock(
-        return_value=ImageInfo(  # type: ignore[attr-defined]
-            height=100,
-            width=200,
-        )
-    )
     new_id = ImageID(uuid4())
-    new_image = Image(id=new_id, name=ImageName(filename), height=ImageSize(100), width=ImageSize(200), data=data)
-    fake_image_service.create.return_value = new_image  # type: ignore[assignment]
-    fake_image_storage.add = AsyncMock()  # type: ignore[attr-defined]
-    fake_user_command_gateway.update = AsyncMock()  # type: ignore[attr-defined]
+    fake_image_service.next_image_id.return_value = new_id  # type: ignore[attr-defined]
+    fake_image_storage.add_stream = AsyncMock()  # type: ignore[attr-defined]
+    fake_task_scheduler.schedule = AsyncMock(return_value=None)  # type: ignore[attr-defined]
 
     sut = CreateImageCommandHandler(
         current_user_service=fake_current_user_service,
         image_storage=fake_image_storage,
-        image_extractor=fake_image_extractor,
         image_service=fake_image_service,
         user_service=fake_user_service,
         transaction_manager=fake_transaction,
-        user_command_gateway=fake_user_command_gateway,
+        image_catalog_gateway=fake_image_catalog_gateway,
+        scheduler=fake_task_scheduler,
     )
 
-    cmd = CreateImageCommand(data=data, filename=filename)
+    cmd = CreateImageCommand(stream=stream, filename=filename)
 
     # Act
     view: CreateImageView = await sut(cmd)
 
     # Assert
     assert view.image_id == new_id
-    fake_image_extractor.extract.assert_awaited()  # type: ignore[attr-defined]
-    fake_image_storage.add.assert_awaited()  # type: ignore[attr-defined]
-    fake_user_command_gateway.update.assert_awaited()  # type: ignore[attr-defined]
+    fake_image_storage.add_stream.assert_awaited_once_with(  # type: ignore[attr-defined]
+        image_id=new_id,
+        name=ImageName(filename),
+        stream=stream,
+    )
+    fake_user_service.add_image.assert_called_once_with(  # type: ignore[attr-defined]
+        user=fake_current_user_service.get_current_user.return_value,  # type: ignore[attr-defined]
+        image_id=new_id,
+    )
+    fake_image_catalog_gateway.add.assert_awaited_once_with(  # type: ignore[attr-defined]
+        image_id=new_id,
+        owner_id=fake_current_user_service.get_current_user.return_value.id,  # type: ignore[attr-defined]
+        metadata=fake_image_storage.read_metadata_by_id.return_value,  # type: ignore[attr-defined]
+    )
     fake_transaction.flush.assert_awaited()  # type: ignore[attr-defined]
     fake_transaction.commit.assert_awaited()  # type: ignore[attr-defined]
+    task_id = fake_task_scheduler.make_task_id.return_value  # type: ignore[attr-defined]
+    fake_task_scheduler.schedule.assert_has_calls(  # type: ignore[attr-defined]
+        [
+            call(task_id=task_id, payload=GenerateImageRenditionsPayload(image_id=new_id)),
+            call(task_id=task_id, payload=IndexImagePayload(image_id=new_id)),
+        ],
+        any_order=True,
+    )
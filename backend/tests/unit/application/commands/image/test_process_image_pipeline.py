@@ -0,0 +1,157 @@
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from pix_erase.application.commands.image.process_image_pipeline import (
+    ImagePipelineStep,
+    ProcessImagePipelineCommand,
+    ProcessImagePipelineCommandHandler,
+)
+from pix_erase.application.common.ports.scheduler.payloads.images import (
+    ImagePipelineStepPayload,
+    ProcessImagePipelinePayload,
+)
+from pix_erase.application.common.ports.scheduler.task_id import TaskID
+from pix_erase.application.common.query_models.image import ImageMetadataQueryModel
+from pix_erase.application.errors.image import (
+    BadImagePipelineError,
+    ImageDoesntBelongToThisUserError,
+    ImageNotFoundError,
+    UnknownBackgroundRemovalModelError,
+)
+from pix_erase.domain.image.errors.image import BadImageScaleError
+from pix_erase.domain.image.values.image_encoding import ImageEncoding
+from pix_erase.domain.image.values.image_id import ImageID
+from pix_erase.domain.image.values.image_scale import ImageScale
+
+
+@pytest.mark.asyncio
+async def test_process_image_pipeline_schedules_single_task(
+    fake_current_user_service: Mock,
+    fake_image_storage: Mock,
+    fake_task_scheduler: Mock,
+    fake_image_catalog_gateway: Mock,
+    owned_images: set[ImageID],
+) -> None:
+    # Arrange
+    image_id = ImageID(uuid4())
+    owned_images.update([image_id])
+
+    fake_image_storage.read_metadata_by_id = AsyncMock(return_value=Mock(spec=ImageMetadataQueryModel))  # type: ignore[attr-defined]
+    expected: TaskID = TaskID("process_image_pipeline:1")
+    fake_task_scheduler.make_task_id.return_value = expected  # type: ignore[assignment]
+    fake_task_scheduler.schedule = AsyncMock(return_value=None)  # type: ignore[attr-defined]
+
+    sut = ProcessImagePipelineCommandHandler(
+        image_storage=fake_image_storage,
+        task_scheduler=fake_task_scheduler,
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+    )
+
+    # Act
+    result = await sut(
+        ProcessImagePipelineCommand(
+            image_id=image_id,
+            operations=[
+                ImagePipelineStep(operation="rotate", angle=90),
+                ImagePipelineStep(operation="upscale", algorithm="NearestNeighbour", scale=2),
+                ImagePipelineStep(operation="compress", quality=80),
+            ],
+            output_format="WEBP",
+        )
+    )
+
+    # Assert
+    assert result == expected
+    fake_task_scheduler.schedule.assert_called_once_with(  # type: ignore[attr-defined]
+        task_id=expected,
+        payload=ProcessImagePipelinePayload(
+            image_id=image_id,
+            operations=[
+                ImagePipelineStepPayload(operation="rotate", angle=90),
+                ImagePipelineStepPayload(operation="upscale", algorithm="NearestNeighbour", scale=ImageScale(2)),
+                ImagePipelineStepPayload(operation="compress", quality=80),
+            ],
+            encoding=ImageEncoding(format="WEBP"),
+        ),
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("operations", "expected_error"),
+    [
+        pytest.param([], BadImagePipelineError, id="empty"),
+        pytest.param([ImagePipelineStep(operation="grayscale")] * 17, BadImagePipelineError, id="too_many"),
+        pytest.param([ImagePipelineStep(operation="rotate")], BadImagePipelineError, id="rotate_without_angle"),
+        pytest.param([ImagePipelineStep(operation="compress", quality=101)], BadImagePipelineError, id="bad_quality"),
+        pytest.param([ImagePipelineStep(operation="upscale", scale=2)], BadImagePipelineError, id="no_algorithm"),
+        pytest.param(
+            [ImagePipelineStep(operation="upscale", algorithm="AI", scale=5)], BadImageScaleError, id="bad_scale"
+        ),
+        pytest.param(
+            [ImagePipelineStep(operation="remove_background", model="sam")],
+            UnknownBackgroundRemovalModelError,
+            id="unknown_background_removal_model",
+        ),
+    ],
+)
+async def test_process_image_pipeline_bad_operations(
+    fake_current_user_service: Mock,
+    fake_image_storage: Mock,
+    fake_task_scheduler: Mock,
+    operations: list[ImagePipelineStep],
+    expected_error: type[Exception],
+    fake_image_catalog_gateway: Mock,
+) -> None:
+    sut = ProcessImagePipelineCommandHandler(
+        image_storage=fake_image_storage,
+        task_scheduler=fake_task_scheduler,
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+    )
+    with pytest.raises(expected_error):
+        await sut(ProcessImagePipelineCommand(image_id=uuid4(), operations=operations))
+
+
+@pytest.mark.asyncio
+async def test_process_image_pipeline_wrong_owner(
+    fake_current_user_service: Mock,
+    fake_image_storage: Mock,
+    fake_task_scheduler: Mock,
+    fake_image_catalog_gateway: Mock,
+) -> None:
+    image_id = ImageID(uuid4())
+
+    sut = ProcessImagePipelineCommandHandler(
+        image_storage=fake_image_storage,
+        task_scheduler=fake_task_scheduler,
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+    )
+    with pytest.raises(ImageDoesntBelongToThisUserError):
+        await sut(ProcessImagePipelineCommand(image_id=image_id, operations=[ImagePipelineStep(operation="grayscale")]))
+
+
+@pytest.mark.asyncio
+async def test_process_image_pipeline_not_found(
+    fake_current_user_service: Mock,
+    fake_image_storage: Mock,
+    fake_task_scheduler: Mock,
+    fake_image_catalog_gateway: Mock,
+    owned_images: set[ImageID],
+) -> None:
+    image_id = ImageID(uuid4())
+    owned_images.update([image_id])
+    fake_image_storage.read_metadata_by_id = AsyncMock(return_value=None)  # type: ignore[attr-defined]
+
+    sut = ProcessImagePipelineCommandHandler(
+        image_storage=fake_image_storage,
+        task_scheduler=fake_task_scheduler,
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+    )
+    with pytest.raises(ImageNotFoundError):
+        await sut(ProcessImagePipelineCommand(image_id=image_id, operations=[ImagePipelineStep(operation="grayscale")]))
@@ -0,0 +1,125 @@
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from pix_erase.application.commands.image.process_image_pipeline import ImagePipelineStep
+from pix_erase.application.commands.image.process_images_batch import (
+    MAX_BATCH_IMAGES,
+    ProcessImagesBatchCommand,
+    ProcessImagesBatchCommandHandler,
+)
+from pix_erase.application.common.ports.scheduler.task_id import TaskID
+from pix_erase.application.errors.image import (
+    BadImageBatchError,
+    BadImagePipelineError,
+    ImageDoesntBelongToThisUserError,
+)
+from pix_erase.domain.image.values.image_id import ImageID
+
+if TYPE_CHECKING:
+    from pix_erase.application.common.ports.scheduler.payloads.images import ProcessImagePipelinePayload
+
+OPERATIONS = [ImagePipelineStep(operation="grayscale"), ImagePipelineStep(operation="compress", quality=80)]
+
+
+@pytest.mark.asyncio
+async def test_process_images_batch_schedules_task_per_image(
+    fake_current_user_service: Mock,
+    fake_task_scheduler: Mock,
+    fake_image_catalog_gateway: Mock,
+    owned_images: set[ImageID],
+) -> None:
+    # Arrange
+    image_ids = [ImageID(uuid4()), ImageID(uuid4())]
+    owned_images.update(image_ids)
+    fake_task_scheduler.make_task_id.side_effect = lambda key, value: TaskID(f"{key}:{value}")  # type: ignore[attr-defined]
+    fake_task_scheduler.schedule_batch = AsyncMock(return_value=None)  # type: ignore[attr-defined]
+
+    sut = ProcessImagesBatchCommandHandler(
+        task_scheduler=fake_task_scheduler,
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+    )
+
+    # Act
+    batch_id = await sut(ProcessImagesBatchCommand(image_ids=[*image_ids, image_ids[0]], operations=OPERATIONS))
+
+    # Assert
+    assert batch_id.startswith("process_images_batch:")
+    fake_task_scheduler.schedule_batch.assert_awaited_once()  # type: ignore[attr-defined]
+    kwargs = fake_task_scheduler.schedule_batch.await_args.kwargs  # type: ignore[attr-defined]
+    payloads: dict[TaskID, ProcessImagePipelinePayload] = kwargs["payloads"]
+    assert kwargs["batch_id"] == batch_id
+    assert kwargs["owner_id"] == (await fake_current_user_service.get_current_user()).id
+    assert [payload.image_id for payload in payloads.values()] == image_ids
+    assert all(task_id.startswith("process_image_pipeline:") for task_id in payloads)
+    assert [step.operation for step in next(iter(payloads.values())).operations] == ["grayscale", "compress"]
+
+
+@pytest.mark.asyncio
+async def test_process_images_batch_wrong_owner(
+    fake_current_user_service: Mock,
+    fake_task_scheduler: Mock,
+    fake_image_catalog_gateway: Mock,
+    owned_images: set[ImageID],
+) -> None:
+    # Arrange
+    image_ids = [ImageID(uuid4()), ImageID(uuid4())]
+    owned_images.update(image_ids[:1])
+
+    sut = ProcessImagesBatchCommandHandler(
+        task_scheduler=fake_task_scheduler,
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+    )
+
+    # Act & Assert
+    with pytest.raises(ImageDoesntBelongToThisUserError):
+        await sut(ProcessImagesBatchCommand(image_ids=image_ids, operations=OPERATIONS))
+
+    fake_task_scheduler.schedule_batch.assert_not_called()  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("images", [0, MAX_BATCH_IMAGES + 1])
+async def test_process_images_batch_rejects_bad_size(
+    fake_current_user_service: Mock,
+    fake_task_scheduler: Mock,
+    images: int,
+    fake_image_catalog_gateway: Mock,
+) -> None:
+    # Arrange
+    sut = ProcessImagesBatchCommandHandler(
+        task_scheduler=fake_task_scheduler,
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+    )
+
+    # Act & Assert
+    with pytest.raises(BadImageBatchError):
+        await sut(ProcessImagesBatchCommand(image_ids=[ImageID(uuid4()) for _ in range(images)], operations=OPERATIONS))
+
+
+@pytest.mark.asyncio
+async def test_process_images_batch_rejects_bad_operations(
+    fake_current_user_service: Mock,
+    fake_task_scheduler: Mock,
+    fake_image_catalog_gateway: Mock,
+) -> None:
+    # Arrange
+    sut = ProcessImagesBatchCommandHandler(
+        task_scheduler=fake_task_scheduler,
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+    )
+
+    # Act & Assert
+    with pytest.raises(BadImagePipelineError):
+        await sut(
+            ProcessImagesBatchCommand(
+                image_ids=[ImageID(uuid4())],
+                operations=[ImagePipelineStep(operation="rotate")],
+            )
+        )
@@ -7,12 +7,17 @@ from pix_erase.application.commands.image.remove_background_image import (
     RemoveBackgroundImageCommand,
     RemoveBackgroundImageCommandHandler,
 )
+from pix_erase.application.common.ports.scheduler.payloads.images import RemoveImageBackgroundPayload
 from pix_erase.application.common.ports.scheduler.task_id import TaskID
-from pix_erase.application.errors.image import ImageDoesntBelongToThisUserError, ImageNotFoundError
-from pix_erase.domain.image.entities.image import Image
+from pix_erase.application.common.query_models.image import ImageMetadataQueryModel
+from pix_erase.application.errors.image import (
+    ImageDoesntBelongToThisUserError,
+    ImageNotFoundError,
+    UnknownBackgroundRemovalModelError,
+)
+from pix_erase.domain.image.errors.image import BadImageEncodingError
+from pix_erase.domain.image.values.image_encoding import ImageEncoding
 from pix_erase.domain.image.values.image_id import ImageID
-from pix_erase.domain.image.values.image_name import ImageName
-from pix_erase.domain.image.values.image_size import ImageSize
 
 
 @pytest.mark.asyncio
@@ -20,14 +25,14 @@ async def test_remove_background_schedules_task(
     fake_current_user_service: Mock,
     fake_image_storage: Mock,
     fake_task_scheduler: Mock,
+    fake_image_catalog_gateway: Mock,
+    owned_images: set[ImageID],
 ) -> None:
     # Arrange
     image_id = ImageID(uuid4())
-    user = await fake_current_user_service.get_current_user()
-    user.images = [image_id]
+    owned_images.update([image_id])
 
-    fake_image = Image(id=image_id, name=ImageName("a.jpg"), data=b"d", width=ImageSize(1), height=ImageSize(1))
-    fake_image_storage.read_by_id = AsyncMock(return_value=fake_image)  # type: ignore[attr-defined]
+    fake_image_storage.read_metadata_by_id = AsyncMock(return_value=Mock(spec=ImageMetadataQueryModel))  # type: ignore[attr-defined]
     expected: TaskID = TaskID("remove_background_image:1")
     fake_task_scheduler.make_task_id.return_value = expected  # type: ignore[assignment]
     fake_task_scheduler.schedule = AsyncMock(return_value=None)  # type: ignore[attr-defined]
@@ -36,6 +41,7 @@ async def test_remove_background_schedules_task(
         scheduler=fake_task_scheduler,
         image_storage=fake_image_storage,
         current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
     )
 
     # Act
@@ -46,20 +52,105 @@ async def test_remove_background_schedules_task(
     fake_task_scheduler.schedule.assert_called_once()  # type: ignore[attr-defined]
 
 
+@pytest.mark.asyncio
+async def test_remove_background_passes_chosen_model(
+    fake_current_user_service: Mock,
+    fake_image_storage: Mock,
+    fake_task_scheduler: Mock,
+    fake_image_catalog_gateway: Mock,
+    owned_images: set[ImageID],
+) -> None:
+    # Arrange
+    image_id = ImageID(uuid4())
+    owned_images.update([image_id])
+
+    fake_image_storage.read_metadata_by_id = AsyncMock(return_value=Mock(spec=ImageMetadataQueryModel))  # type: ignore[attr-defined]
+    expected: TaskID = TaskID("remove_background_image:1")
+    fake_task_scheduler.make_task_id.return_value = expected  # type: ignore[assignment]
+    fake_task_scheduler.schedule = AsyncMock(return_value=None)  # type: ignore[attr-defined]
+
+    sut = RemoveBackgroundImageCommandHandler(
+        scheduler=fake_task_scheduler,
+        image_storage=fake_image_storage,
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+    )
+
+    # Act
+    await sut(RemoveBackgroundImageCommand(image_id=image_id, model="u2netp", output_format="WEBP", output_quality=80))
+
+    # Assert
+    fake_task_scheduler.schedule.assert_called_once_with(  # type: ignore[attr-defined]
+        task_id=expected,
+        payload=RemoveImageBackgroundPayload(
+            image_id=image_id,
+            model="u2netp",
+            encoding=ImageEncoding(format="WEBP", quality=80),
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_remove_background_unknown_model(
+    fake_current_user_service: Mock,
+    fake_image_storage: Mock,
+    fake_task_scheduler: Mock,
+    fake_image_catalog_gateway: Mock,
+) -> None:
+    sut = RemoveBackgroundImageCommandHandler(
+        scheduler=fake_task_scheduler,
+        image_storage=fake_image_storage,
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+    )
+    with pytest.raises(UnknownBackgroundRemovalModelError):
+        await sut(RemoveBackgroundImageCommand(image_id=uuid4(), model="sam"))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("output_format", "output_quality"),
+    [
+        pytest.param("GIF", None, id="unsupported_format"),
+        pytest.param(None, 101, id="quality_too_high"),
+    ],
+)
+async def test_remove_background_bad_encoding(
+    fake_current_user_service: Mock,
+    fake_image_storage: Mock,
+    fake_task_scheduler: Mock,
+    output_format: str | None,
+    output_quality: int | None,
+    fake_image_catalog_gateway: Mock,
+) -> None:
+    sut = RemoveBackgroundImageCommandHandler(
+        scheduler=fake_task_scheduler,
+        image_storage=fake_image_storage,
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+    )
+    with pytest.raises(BadImageEncodingError):
+        await sut(
+            RemoveBackgroundImageCommand(image_id=uuid4(), output_format=output_format, output_quality=output_quality)
+        )
+
+    fake_task_scheduler.schedule.assert_not_called()  # type: ignore[attr-defined]
+
+
 @pytest.mark.asyncio
 async def test_remove_background_wrong_owner(
     fake_current_user_service: Mock,
     fake_image_storage: Mock,
     fake_task_scheduler: Mock,
+    fake_image_catalog_gateway: Mock,
 ) -> None:
     image_id = ImageID(uuid4())
-    user = await fake_current_user_service.get_current_user()
-    user.images = []
 
     sut = RemoveBackgroundImageCommandHandler(
         scheduler=fake_task_scheduler,
         image_storage=fake_image_storage,
         current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
     )
     with pytest.raises(ImageDoesntBelongToThisUserError):
         await sut(RemoveBackgroundImageCommand(image_id=image_id))
@@ -70,16 +161,18 @@ async def test_remove_background_not_found(
     fake_current_user_service: Mock,
     fake_image_storage: Mock,
     fake_task_scheduler: Mock,
+    fake_image_catalog_gateway: Mock,
+    owned_images: set[ImageID],
 ) -> None:
     image_id = ImageID(uuid4())
-    user = await fake_current_user_service.get_current_user()
-    user.images = [image_id]
-    fake_image_storage.read_by_id = AsyncMock(return_value=None)  # type: ignore[attr-defined]
+    owned_images.update([image_id])
+    fake_image_storage.read_metadata_by_id = AsyncMock(return_value=None)  # type: ignore[attr-defined]
 
     sut = RemoveBackgroundImageCommandHandler(
         scheduler=fake_task_scheduler,
         image_storage=fake_image_storage,
         current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
     )
     with pytest.raises(ImageNotFoundError):
         await sut(RemoveBackgroundImageCommand(image_id=image_id))
@@ -0,0 +1,63 @@
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from pix_erase.application.commands.image.request_image_upload import (
+    RequestImageUploadCommand,
+    RequestImageUploadCommandHandler,
+)
+from pix_erase.application.common.query_models.image import PresignedUrlQueryModel
+from pix_erase.application.errors.image import DirectImageAccessDisabledError
+from pix_erase.domain.image.values.image_id import ImageID
+
+
+@pytest.mark.asyncio
+async def test_request_image_upload_returns_link(
+    fake_current_user_service: Mock,
+    fake_image_service: Mock,
+    fake_image_url_signer: Mock,
+) -> None:
+    # Arrange
+    new_id = ImageID(uuid4())
+    link = PresignedUrlQueryModel(
+        url="https://s3.example/uploads/1?X-Amz-Signature=1",
+        expires_at=datetime(2025, 5, 1, tzinfo=UTC),
+    )
+    fake_image_service.next_image_id.return_value = new_id  # type: ignore[attr-defined]
+    fake_image_url_signer.is_enabled.return_value = True  # type: ignore[attr-defined]
+    fake_image_url_signer.sign_upload = AsyncMock(return_value=link)  # type: ignore[attr-defined]
+
+    sut = RequestImageUploadCommandHandler(
+        current_user_service=fake_current_user_service,
+        image_service=fake_image_service,
+        image_url_signer=fake_image_url_signer,
+    )
+
+    # Act
+    view = await sut(RequestImageUploadCommand())
+
+    # Assert
+    assert view.image_id == new_id
+    assert view.url == link.url
+    assert view.expires_at == link.expires_at
+    fake_image_url_signer.sign_upload.assert_awaited_once_with(new_id)  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_request_image_upload_disabled(
+    fake_current_user_service: Mock,
+    fake_image_service: Mock,
+    fake_image_url_signer: Mock,
+) -> None:
+    sut = RequestImageUploadCommandHandler(
+        current_user_service=fake_current_user_service,
+        image_service=fake_image_service,
+        image_url_signer=fake_image_url_signer,
+    )
+
+    with pytest.raises(DirectImageAccessDisabledError):
+        await sut(RequestImageUploadCommand())
+
+    fake_image_url_signer.sign_upload.assert_not_called()  # type: ignore[attr-defined]
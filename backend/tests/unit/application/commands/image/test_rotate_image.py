@@ -8,11 +8,9 @@ from pix_erase.application.commands.image.rotate_image import (
     RotateImageCommandHandler,
 )
 from pix_erase.application.common.ports.scheduler.task_id import TaskID
+from pix_erase.application.common.query_models.image import ImageMetadataQueryModel
 from pix_erase.application.errors.image import ImageDoesntBelongToThisUserError, ImageNotFoundError
-from pix_erase.domain.image.entities.image import Image
 from pix_erase.domain.image.values.image_id import ImageID
-from pix_erase.domain.image.values.image_name import ImageName
-from pix_erase.domain.image.values.image_size import ImageSize
 
 
 @pytest.mark.asyncio
@@ -20,14 +18,14 @@ async def test_rotate_image_schedules_task(
     fake_current_user_service: Mock,
     fake_image_storage: Mock,
     fake_task_scheduler: Mock,
+    fake_image_catalog_gateway: Mock,
+    owned_images: set[ImageID],
 ) -> None:
     # Arrange
     image_id = ImageID(uuid4())
-    user = await fake_current_user_service.get_current_user()
-    user.images = [image_id]
+    owned_images.update([image_id])
 
-    fake_image = Image(id=image_id, name=ImageName("a.jpg"), data=b"d", width=ImageSize(1), height=ImageSize(1))
-    fake_image_storage.read_by_id = AsyncMock(return_value=fake_image)  # type: ignore[attr-defined]
+    fake_image_storage.read_metadata_by_id = AsyncMock(return_value=Mock(spec=ImageMetadataQueryModel))  # type: ignore[attr-defined]
     expected: TaskID = TaskID("rotate_image:1")
     fake_task_scheduler.make_task_id.return_value = expected  # type: ignore[assignment]
     fake_task_scheduler.schedule = AsyncMock(return_value=None)  # type: ignore[attr-defined]
@@ -36,6 +34,7 @@ async def test_rotate_image_schedules_task(
         image_storage=fake_image_storage,
         task_scheduler=fake_task_scheduler,
         current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
     )
 
     # Act
@@ -51,15 +50,15 @@ async def test_rotate_image_wrong_owner(
     fake_current_user_service: Mock,
     fake_image_storage: Mock,
     fake_task_scheduler: Mock,
+    fake_image_catalog_gateway: Mock,
 ) -> None:
     image_id = ImageID(uuid4())
-    user = await fake_current_user_service.get_current_user()
-    user.images = []
 
     sut = RotateImageCommandHandler(
         image_storage=fake_image_storage,
         task_scheduler=fake_task_scheduler,
         current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
     )
     with pytest.raises(ImageDoesntBelongToThisUserError):
         await sut(RotateImageCommand(image_id=image_id, angle=90))
@@ -70,16 +69,18 @@ async def test_rotate_image_not_found(
     fake_current_user_service: Mock,
     fake_image_storage: Mock,
     fake_task_scheduler: Mock,
+    fake_image_catalog_gateway: Mock,
+    owned_images: set[ImageID],
 ) -> None:
     image_id = ImageID(uuid4())
-    user = await fake_current_user_service.get_current_user()
-    user.images = [image_id]
-    fake_image_storage.read_by_id = AsyncMock(return_value=None)  # type: ignore[attr-defined]
+    owned_images.update([image_id])
+    fake_image_storage.read_metadata_by_id = AsyncMock(return_value=None)  # type: ignore[attr-defined]
 
     sut = RotateImageCommandHandler(
         image_storage=fake_image_storage,
         task_scheduler=fake_task_scheduler,
         current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
     )
     with pytest.raises(ImageNotFoundError):
         await sut(RotateImageCommand(image_id=image_id, angle=90))
@@ -1,18 +1,27 @@
+from collections.abc import Collection
 from typing import cast
 from unittest.mock import AsyncMock, Mock, create_autospec
 
 import pytest
 
 from pix_erase.application.common.ports.event_bus import EventBus
+from pix_erase.application.common.ports.image.catalog_gateway import ImageCatalogGateway
+from pix_erase.application.common.ports.image.comparison_gateway import ImageComparisonGateway
 from pix_erase.application.common.ports.image.extractor import ImageInfoExtractor
+from pix_erase.application.common.ports.image.perceptual_hash_gateway import ImagePerceptualHashGateway
+from pix_erase.application.common.ports.image.rendition_storage import ImageRenditionStorage
+from pix_erase.application.common.ports.image.similarity_index import ImageSimilarityIndex
 from pix_erase.application.common.ports.image.storage import ImageStorage
+from pix_erase.application.common.ports.image.url_signer import ImageUrlSigner
 from pix_erase.application.common.ports.scheduler.task_scheduler import TaskScheduler
 from pix_erase.application.common.ports.transaction_manager import TransactionManager
 from pix_erase.application.common.ports.user.command_gateway import UserCommandGateway
 from pix_erase.application.common.ports.user.query_gateway import UserQueryGateway
+from pix_erase.application.common.query_models.image import ImageMetadataQueryModel
 from pix_erase.application.common.services.auth_session import AuthSessionService
 from pix_erase.application.common.services.current_user import CurrentUserService
 from pix_erase.domain.image.services.image_service import ImageService
+from pix_erase.domain.image.values.image_id import ImageID
 from pix_erase.domain.internet_protocol.services import InternetProtocolService
 from pix_erase.domain.internet_protocol.services.internet_domain_service import InternetDomainService
 from pix_erase.domain.user.ports.id_generator import UserIdGenerator
@@ -20,6 +29,7 @@ from pix_erase.domain.user.ports.password_hasher import PasswordHasher
 from pix_erase.domain.user.services.access_service import AccessService
 from pix_erase.domain.user.services.user_service import UserService
 from pix_erase.domain.user.values.hashed_password import HashedPassword
+from pix_erase.domain.user.values.user_id import UserID
 from tests.unit.factories.user_entity import create_user
 from tests.unit.factories.value_objects import create_user_id
 
@@ -111,6 +121,61 @@ def fake_image_storage() -> ImageStorage:
     return cast("ImageStorage", create_autospec(ImageStorage))
 
 
+@pytest.fixture
+def fake_image_rendition_storage() -> ImageRenditionStorage:
+    return cast("ImageRenditionStorage", create_autospec(ImageRenditionStorage))
+
+
+@pytest.fixture
+def fake_perceptual_hash_gateway() -> ImagePerceptualHashGateway:
+    return cast("ImagePerceptualHashGateway", create_autospec(ImagePerceptualHashGateway))
+
+
+@pytest.fixture
+def fake_similarity_index() -> ImageSimilarityIndex:
+    return cast("ImageSimilarityIndex", create_autospec(ImageSimilarityIndex))
+
+
+@pytest.fixture
+def fake_image_url_signer() -> ImageUrlSigner:
+    fake = create_autospec(ImageUrlSigner)
+    fake.is_enabled.return_value = False
+    return cast("ImageUrlSigner", fake)
+
+
+@pytest.fixture
+def fake_comparison_gateway() -> ImageComparisonGateway:
+    return cast("ImageComparisonGateway", create_autospec(ImageComparisonGateway))
+
+
+@pytest.fixture
+def owned_images() -> set[ImageID]:
+    """Images of the current user in ``fake_image_catalog_gateway``."""
+    return set()
+
+
+@pytest.fixture
+def fake_image_catalog_gateway(owned_images: set[ImageID]) -> ImageCatalogGateway:
+    async def add(image_id: ImageID, owner_id: UserID, metadata: ImageMetadataQueryModel | None = None) -> None:
+        owned_images.add(image_id)
+
+    async def is_owned_by(image_id: ImageID, owner_id: UserID) -> bool:
+        return image_id in owned_images
+
+    async def read_owned_ids(owner_id: UserID, image_ids: Collection[ImageID]) -> set[ImageID]:
+        return {image_id for image_id in image_ids if image_id in owned_images}
+
+    async def read_ids_by_owner(owner_id: UserID) -> set[ImageID]:
+        return set(owned_images)
+
+    fake = create_autospec(ImageCatalogGateway)
+    fake.add.side_effect = add
+    fake.is_owned_by.side_effect = is_owned_by
+    fake.read_owned_ids.side_effect = read_owned_ids
+    fake.read_ids_by_owner.side_effect = read_ids_by_owner
+    return cast("ImageCatalogGateway", fake)
+
+
 @pytest.fixture
 def fake_task_scheduler() -> TaskScheduler:
     return cast("TaskScheduler", create_autospec(TaskScheduler))
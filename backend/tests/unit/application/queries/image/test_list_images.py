@@ -0,0 +1,109 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from pix_erase.application.common.query_models.image import ImageCatalogQueryModel
+from pix_erase.application.common.query_params.image_cursor import ImageCatalogCursor
+from pix_erase.application.errors.query_params import PaginationError
+from pix_erase.application.queries.images.list_images import (
+    MAX_LIMIT,
+    ListImagesQuery,
+    ListImagesQueryHandler,
+)
+from pix_erase.domain.image.values.image_id import ImageID
+from pix_erase.domain.image.values.image_name import ImageName
+from pix_erase.domain.image.values.image_size import ImageSize
+from pix_erase.domain.user.values.user_id import UserID
+
+PAGE_SIZE = 2
+
+
+def _catalog_image(created_at: datetime) -> ImageCatalogQueryModel:
+    return ImageCatalogQueryModel(
+        image_id=ImageID(uuid4()),
+        owner_id=UserID(uuid4()),
+        filename=ImageName("photo.png"),
+        width=ImageSize(40),
+        height=ImageSize(30),
+        content_type="image/png",
+        size=1024,
+        created_at=created_at,
+        updated_at=created_at,
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_images_returns_cursor_of_next_page(
+    fake_current_user_service: Mock,
+    fake_image_catalog_gateway: Mock,
+) -> None:
+    # Arrange
+    now = datetime(2026, 1, 1, tzinfo=UTC)
+    images = [_catalog_image(now - timedelta(minutes=minutes)) for minutes in range(PAGE_SIZE + 1)]
+    fake_image_catalog_gateway.read_page_by_owner = AsyncMock(return_value=images)  # type: ignore[attr-defined]
+    current_user = await fake_current_user_service.get_current_user()
+
+    sut = ListImagesQueryHandler(
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+    )
+
+    # Act
+    view = await sut(ListImagesQuery(limit=PAGE_SIZE))
+
+    # Assert
+    assert [item.image_id for item in view.images] == [image.image_id for image in images[:PAGE_SIZE]]
+    assert view.images[0].filename == "photo.png"
+    assert view.next_cursor is not None
+    assert ImageCatalogCursor.decode(view.next_cursor) == ImageCatalogCursor(
+        created_at=images[PAGE_SIZE - 1].created_at,
+        image_id=images[PAGE_SIZE - 1].image_id,
+    )
+    fake_image_catalog_gateway.read_page_by_owner.assert_awaited_once_with(  # type: ignore[attr-defined]
+        current_user.id,
+        limit=PAGE_SIZE + 1,
+        after=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_images_last_page_has_no_cursor(
+    fake_current_user_service: Mock,
+    fake_image_catalog_gateway: Mock,
+) -> None:
+    # Arrange
+    last = ImageCatalogCursor(created_at=datetime(2026, 1, 1, tzinfo=UTC), image_id=ImageID(uuid4()))
+    images = [_catalog_image(last.created_at - timedelta(minutes=1))]
+    fake_image_catalog_gateway.read_page_by_owner = AsyncMock(return_value=images)  # type: ignore[attr-defined]
+
+    sut = ListImagesQueryHandler(
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+    )
+
+    # Act
+    view = await sut(ListImagesQuery(limit=MAX_LIMIT * 10, cursor=last.encode()))
+
+    # Assert
+    assert len(view.images) == 1
+    assert view.next_cursor is None
+    _, kwargs = fake_image_catalog_gateway.read_page_by_owner.call_args  # type: ignore[attr-defined]
+    assert kwargs == {"limit": MAX_LIMIT + 1, "after": last}
+
+
+@pytest.mark.asyncio
+async def test_list_images_bad_cursor(
+    fake_current_user_service: Mock,
+    fake_image_catalog_gateway: Mock,
+) -> None:
+    sut = ListImagesQueryHandler(
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+    )
+
+    with pytest.raises(PaginationError):
+        await sut(ListImagesQuery(cursor="not-a-cursor"))
+
+    fake_image_catalog_gateway.read_page_by_owner.assert_not_called()  # type: ignore[attr-defined]
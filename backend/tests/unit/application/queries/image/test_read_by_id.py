@@ -1,23 +1,44 @@
 from collections.abc import AsyncGenerator
-from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from datetime import UTC, datetime, timedelta
+from typing import Any
 from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
 
+from pix_erase.application.common.ports.image.catalog_gateway import ImageCatalogGateway
+from pix_erase.application.common.ports.image.rendition_storage import ImageRenditionStorage
 from pix_erase.application.common.ports.image.storage import ImageStorage
-from pix_erase.application.common.query_models.image import ImageStreamQueryModel
+from pix_erase.application.common.ports.image.url_signer import ImageUrlSigner
+from pix_erase.application.common.query_models.image import (
+    ImageByteRange,
+    ImageMetadataQueryModel,
+    ImageStreamQueryModel,
+    PresignedUrlQueryModel,
+)
 from pix_erase.application.common.services.current_user import CurrentUserService
-from pix_erase.application.errors.image import ImageDoesntBelongToThisUserError, ImageNotFoundError
-from pix_erase.application.queries.images.read_by_id import ReadImageByIDQuery, ReadImageByIDQueryHandler
+from pix_erase.application.common.views.image.read_image import (
+    ContentRangeView,
+    ImageLinkView,
+    ImageNotModifiedView,
+    ReadImageByIDView,
+)
+from pix_erase.application.errors.image import (
+    ImageDoesntBelongToThisUserError,
+    ImageNotFoundError,
+    ImageRangeNotSatisfiableError,
+)
+from pix_erase.application.queries.images.read_by_id import (
+    ReadImageByIDQuery,
+    ReadImageByIDQueryHandler,
+    RequestedByteRange,
+)
 from pix_erase.domain.image.values.image_id import ImageID
 from pix_erase.domain.image.values.image_name import ImageName
 from pix_erase.domain.image.values.image_size import ImageSize
 from pix_erase.domain.user.values.user_role import UserRole
 
-if TYPE_CHECKING:
-    from pix_erase.application.common.views.image.read_image import ReadImageByIDView
+UPDATED_AT = datetime(2025, 5, 1, 12, 30, 15, 123456, tzinfo=UTC)
 
 
 async def _bytes_stream(chunks: list[bytes]) -> AsyncGenerator[bytes, None]:
@@ -29,11 +50,14 @@ async def _bytes_stream(chunks: list[bytes]) -> AsyncGenerator[bytes, None]:
 async def test_read_image_by_id_success(
     fake_current_user_service: CurrentUserService,
     fake_image_storage: ImageStorage,
+    fake_image_url_signer: ImageUrlSigner,
+    fake_image_rendition_storage: ImageRenditionStorage,
+    fake_image_catalog_gateway: ImageCatalogGateway,
+    owned_images: set[ImageID],
 ) -> None:
     # Arrange
     image_id = ImageID(uuid4())
-    current_user = await fake_current_user_service.get_current_user()
-    current_user.images = [image_id]
+    owned_images.update([image_id])
 
     chunks = [
         b"abc",
@@ -54,7 +78,13 @@ async def test_read_image_by_id_success(
 
     fake_image_storage.stream_by_id = AsyncMock(return_value=stream_model)  # type: ignore[attr-defined]
 
-    sut = ReadImageByIDQueryHandler(image_storage=fake_image_storage, current_user_service=fake_current_user_service)
+    sut = ReadImageByIDQueryHandler(
+        image_storage=fake_image_storage,
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+        image_url_signer=fake_image_url_signer,
+        image_rendition_storage=fake_image_rendition_storage,
+    )
     query = ReadImageByIDQuery(image_id=image_id)
 
     # Act
@@ -79,13 +109,21 @@ async def test_read_image_by_id_success(
 async def test_read_image_by_id_forbidden_when_not_owner(
     fake_current_user_service: CurrentUserService,
     fake_image_storage: ImageStorage,
+    fake_image_url_signer: ImageUrlSigner,
+    fake_image_rendition_storage: ImageRenditionStorage,
+    fake_image_catalog_gateway: ImageCatalogGateway,
 ) -> None:
     image_id = ImageID(uuid4())
     current_user = await fake_current_user_service.get_current_user()
-    current_user.images = []  # not owner and not admin
     current_user.role = UserRole.USER
 
-    sut = ReadImageByIDQueryHandler(image_storage=fake_image_storage, current_user_service=fake_current_user_service)
+    sut = ReadImageByIDQueryHandler(
+        image_storage=fake_image_storage,
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+        image_url_signer=fake_image_url_signer,
+        image_rendition_storage=fake_image_rendition_storage,
+    )
 
     with pytest.raises(ImageDoesntBelongToThisUserError):
         await sut(ReadImageByIDQuery(image_id=image_id))
@@ -95,10 +133,12 @@ async def test_read_image_by_id_forbidden_when_not_owner(
 async def test_read_image_by_id_admin_bypass_ownership(
     fake_current_user_service: CurrentUserService,
     fake_image_storage: ImageStorage,
+    fake_image_url_signer: ImageUrlSigner,
+    fake_image_rendition_storage: ImageRenditionStorage,
+    fake_image_catalog_gateway: ImageCatalogGateway,
 ) -> None:
     image_id = ImageID(uuid4())
     current_user = await fake_current_user_service.get_current_user()
-    current_user.images = []  # no ownership but admin
     current_user.role = UserRole.ADMIN
 
     # minimal stream
@@ -115,7 +155,13 @@ async def test_read_image_by_id_admin_bypass_ownership(
     )
     fake_image_storage.stream_by_id = AsyncMock(return_value=stream_model)  # type: ignore[attr-defined]
 
-    sut = ReadImageByIDQueryHandler(image_storage=fake_image_storage, current_user_service=fake_current_user_service)
+    sut = ReadImageByIDQueryHandler(
+        image_storage=fake_image_storage,
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+        image_url_signer=fake_image_url_signer,
+        image_rendition_storage=fake_image_rendition_storage,
+    )
     view = await sut(ReadImageByIDQuery(image_id=image_id))
     assert view.name == "x.png"
 
@@ -124,13 +170,392 @@ async def test_read_image_by_id_admin_bypass_ownership(
 async def test_read_image_by_id_not_found(
     fake_current_user_service: CurrentUserService,
     fake_image_storage: ImageStorage,
+    fake_image_url_signer: ImageUrlSigner,
+    fake_image_rendition_storage: ImageRenditionStorage,
+    fake_image_catalog_gateway: ImageCatalogGateway,
+    owned_images: set[ImageID],
 ) -> None:
     image_id = ImageID(uuid4())
-    current_user = await fake_current_user_service.get_current_user()
-    current_user.images = [image_id]
+    owned_images.update([image_id])
     fake_image_storage.stream_by_id = AsyncMock(return_value=None)  # type: ignore[attr-defined]
 
-    sut = ReadImageByIDQueryHandler(image_storage=fake_image_storage, current_user_service=fake_current_user_service)
+    sut = ReadImageByIDQueryHandler(
+        image_storage=fake_image_storage,
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+        image_url_signer=fake_image_url_signer,
+        image_rendition_storage=fake_image_rendition_storage,
+    )
+
+    with pytest.raises(ImageNotFoundError):
+        await sut(ReadImageByIDQuery(image_id=image_id))
+
+
+def _metadata(etag: str | None = '"etag123"', size: int = 100) -> ImageMetadataQueryModel:
+    return ImageMetadataQueryModel(
+        content_type="image/png",
+        content_length=size,
+        width=ImageSize(10),
+        height=ImageSize(10),
+        filename=ImageName("x.png"),
+        etag=etag,
+        created_at=UPDATED_AT,
+        updated_at=UPDATED_AT,
+    )
+
+
+def _stream(byte_range: ImageByteRange | None) -> ImageStreamQueryModel:
+    return ImageStreamQueryModel(
+        stream=_bytes_stream([b"x"]),
+        content_type="image/png",
+        content_length=100 if byte_range is None else byte_range.size,
+        width=ImageSize(10),
+        height=ImageSize(10),
+        filename=ImageName("x.png"),
+        etag='"etag123"',
+        created_at=UPDATED_AT,
+        updated_at=UPDATED_AT,
+        byte_range=byte_range,
+    )
+
+
+@pytest.mark.parametrize(
+    "query_kwargs",
+    [
+        pytest.param({"if_none_match": ('"etag123"',)}, id="same_etag"),
+        pytest.param({"if_none_match": ('W/"etag123"', '"other"')}, id="weak_etag_in_list"),
+        pytest.param({"if_none_match": ("*",)}, id="any_etag"),
+        pytest.param({"if_modified_since": UPDATED_AT.replace(microsecond=0)}, id="not_modified_since"),
+    ],
+)
+async def test_read_image_by_id_not_modified_reads_only_metadata(
+    fake_current_user_service: CurrentUserService,
+    fake_image_storage: ImageStorage,
+    fake_image_url_signer: ImageUrlSigner,
+    fake_image_rendition_storage: ImageRenditionStorage,
+    query_kwargs: dict[str, Any],
+    fake_image_catalog_gateway: ImageCatalogGateway,
+    owned_images: set[ImageID],
+) -> None:
+    image_id = ImageID(uuid4())
+    owned_images.update([image_id])
+    fake_image_storage.read_metadata_by_id = AsyncMock(return_value=_metadata())  # type: ignore[method-assign]
+    fake_image_storage.stream_by_id = AsyncMock()  # type: ignore[method-assign]
+
+    sut = ReadImageByIDQueryHandler(
+        image_storage=fake_image_storage,
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+        image_url_signer=fake_image_url_signer,
+        image_rendition_storage=fake_image_rendition_storage,
+    )
+    view = await sut(ReadImageByIDQuery(image_id=image_id, **query_kwargs))
+
+    assert view == ImageNotModifiedView(etag='"etag123"', updated_at=UPDATED_AT)
+    fake_image_storage.stream_by_id.assert_not_awaited()
+
+
+@pytest.mark.parametrize(
+    "query_kwargs",
+    [
+        pytest.param({"if_none_match": ('"other"',)}, id="other_etag"),
+        # If-None-Match wins over If-Modified-Since
+        pytest.param(
+            {"if_none_match": ('"other"',), "if_modified_since": UPDATED_AT + timedelta(days=1)},
+            id="other_etag_and_later_date",
+        ),
+        pytest.param({"if_modified_since": UPDATED_AT - timedelta(days=1)}, id="modified_since"),
+    ],
+)
+async def test_read_image_by_id_modified_streams_image(
+    fake_current_user_service: CurrentUserService,
+    fake_image_storage: ImageStorage,
+    fake_image_url_signer: ImageUrlSigner,
+    fake_image_rendition_storage: ImageRenditionStorage,
+    query_kwargs: dict[str, Any],
+    fake_image_catalog_gateway: ImageCatalogGateway,
+    owned_images: set[ImageID],
+) -> None:
+    image_id = ImageID(uuid4())
+    owned_images.update([image_id])
+    fake_image_storage.read_metadata_by_id = AsyncMock(return_value=_metadata())  # type: ignore[method-assign]
+    fake_image_storage.stream_by_id = AsyncMock(return_value=_stream(None))  # type: ignore[method-assign]
+
+    sut = ReadImageByIDQueryHandler(
+        image_storage=fake_image_storage,
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+        image_url_signer=fake_image_url_signer,
+        image_rendition_storage=fake_image_rendition_storage,
+    )
+    view = await sut(ReadImageByIDQuery(image_id=image_id, **query_kwargs))
+
+    assert isinstance(view, ReadImageByIDView)
+    assert view.content_range is None
+    fake_image_storage.stream_by_id.assert_awaited_once_with(image_id, None)
+
+
+@pytest.mark.parametrize(
+    ("requested", "expected"),
+    [
+        pytest.param(RequestedByteRange(start=10, end=19), ImageByteRange(start=10, end=19), id="closed"),
+        pytest.param(RequestedByteRange(start=90), ImageByteRange(start=90, end=99), id="open"),
+        pytest.param(RequestedByteRange(start=90, end=500), ImageByteRange(start=90, end=99), id="beyond_end"),
+        pytest.param(RequestedByteRange(end=30), ImageByteRange(start=70, end=99), id="suffix"),
+        pytest.param(RequestedByteRange(end=500), ImageByteRange(start=0, end=99), id="suffix_longer_than_image"),
+    ],
+)
+async def test_read_image_by_id_range(
+    fake_current_user_service: CurrentUserService,
+    fake_image_storage: ImageStorage,
+    fake_image_url_signer: ImageUrlSigner,
+    fake_image_rendition_storage: ImageRenditionStorage,
+    requested: RequestedByteRange,
+    expected: ImageByteRange,
+    fake_image_catalog_gateway: ImageCatalogGateway,
+    owned_images: set[ImageID],
+) -> None:
+    image_id = ImageID(uuid4())
+    owned_images.update([image_id])
+    fake_image_storage.read_metadata_by_id = AsyncMock(return_value=_metadata())  # type: ignore[method-assign]
+    fake_image_storage.stream_by_id = AsyncMock(return_value=_stream(expected))  # type: ignore[method-assign]
+
+    sut = ReadImageByIDQueryHandler(
+        image_storage=fake_image_storage,
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+        image_url_signer=fake_image_url_signer,
+        image_rendition_storage=fake_image_rendition_storage,
+    )
+    view = await sut(ReadImageByIDQuery(image_id=image_id, byte_range=requested))
+
+    fake_image_storage.stream_by_id.assert_awaited_once_with(image_id, expected)
+    assert isinstance(view, ReadImageByIDView)
+    assert view.content_length == expected.size
+    assert view.content_range == ContentRangeView(start=expected.start, end=expected.end, total_size=100)
+
+
+@pytest.mark.parametrize(
+    "requested",
+    [
+        pytest.param(RequestedByteRange(start=100), id="starts_at_end"),
+        pytest.param(RequestedByteRange(end=0), id="empty_suffix"),
+        pytest.param(RequestedByteRange(start=-1, end=10), id="negative_start"),
+    ],
+)
+async def test_read_image_by_id_range_not_satisfiable(
+    fake_current_user_service: CurrentUserService,
+    fake_image_storage: ImageStorage,
+    fake_image_url_signer: ImageUrlSigner,
+    fake_image_rendition_storage: ImageRenditionStorage,
+    requested: RequestedByteRange,
+    fake_image_catalog_gateway: ImageCatalogGateway,
+    owned_images: set[ImageID],
+) -> None:
+    image_id = ImageID(uuid4())
+    owned_images.update([image_id])
+    fake_image_storage.read_metadata_by_id = AsyncMock(return_value=_metadata())  # type: ignore[method-assign]
+
+    sut = ReadImageByIDQueryHandler(
+        image_storage=fake_image_storage,
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+        image_url_signer=fake_image_url_signer,
+        image_rendition_storage=fake_image_rendition_storage,
+    )
+
+    with pytest.raises(ImageRangeNotSatisfiableError):
+        await sut(ReadImageByIDQuery(image_id=image_id, byte_range=requested))
+
+
+@pytest.mark.parametrize(
+    ("if_range", "expected"),
+    [
+        pytest.param('"etag123"', ImageByteRange(start=50, end=99), id="same_etag"),
+        pytest.param(UPDATED_AT.replace(microsecond=0), ImageByteRange(start=50, end=99), id="same_date"),
+        pytest.param('"other"', None, id="changed_etag"),
+        pytest.param('W/"etag123"', None, id="weak_etag"),
+        pytest.param(UPDATED_AT - timedelta(days=1), None, id="changed_date"),
+    ],
+)
+async def test_read_image_by_id_resumes_only_same_image(
+    fake_current_user_service: CurrentUserService,
+    fake_image_storage: ImageStorage,
+    fake_image_url_signer: ImageUrlSigner,
+    fake_image_rendition_storage: ImageRenditionStorage,
+    if_range: str | datetime,
+    expected: ImageByteRange | None,
+    fake_image_catalog_gateway: ImageCatalogGateway,
+    owned_images: set[ImageID],
+) -> None:
+    image_id = ImageID(uuid4())
+    owned_images.update([image_id])
+    fake_image_storage.read_metadata_by_id = AsyncMock(return_value=_metadata())  # type: ignore[method-assign]
+    fake_image_storage.stream_by_id = AsyncMock(return_value=_stream(expected))  # type: ignore[method-assign]
+
+    sut = ReadImageByIDQueryHandler(
+        image_storage=fake_image_storage,
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+        image_url_signer=fake_image_url_signer,
+        image_rendition_storage=fake_image_rendition_storage,
+    )
+    await sut(ReadImageByIDQuery(image_id=image_id, byte_range=RequestedByteRange(start=50), if_range=if_range))
+
+    fake_image_storage.stream_by_id.assert_awaited_once_with(image_id, expected)
+
+
+async def test_read_image_by_id_conditional_not_found(
+    fake_current_user_service: CurrentUserService,
+    fake_image_storage: ImageStorage,
+    fake_image_url_signer: ImageUrlSigner,
+    fake_image_rendition_storage: ImageRenditionStorage,
+    fake_image_catalog_gateway: ImageCatalogGateway,
+    owned_images: set[ImageID],
+) -> None:
+    image_id = ImageID(uuid4())
+    owned_images.update([image_id])
+    fake_image_storage.read_metadata_by_id = AsyncMock(return_value=None)  # type: ignore[method-assign]
+
+    sut = ReadImageByIDQueryHandler(
+        image_storage=fake_image_storage,
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+        image_url_signer=fake_image_url_signer,
+        image_rendition_storage=fake_image_rendition_storage,
+    )
+
+    with pytest.raises(ImageNotFoundError):
+        await sut(ReadImageByIDQuery(image_id=image_id, if_none_match=('"etag123"',)))
+
+
+async def test_read_image_by_id_returns_link_when_direct_access_enabled(
+    fake_current_user_service: CurrentUserService,
+    fake_image_storage: ImageStorage,
+    fake_image_url_signer: ImageUrlSigner,
+    fake_image_rendition_storage: ImageRenditionStorage,
+    fake_image_catalog_gateway: ImageCatalogGateway,
+    owned_images: set[ImageID],
+) -> None:
+    image_id = ImageID(uuid4())
+    owned_images.update([image_id])
+    link = PresignedUrlQueryModel(url="https://s3.example/blobs/abc?X-Amz-Signature=1", expires_at=UPDATED_AT)
+    fake_image_url_signer.is_enabled.return_value = True  # type: ignore[attr-defined]
+    fake_image_url_signer.sign_download = AsyncMock(return_value=link)  # type: ignore[method-assign]
+
+    sut = ReadImageByIDQueryHandler(
+        image_storage=fake_image_storage,
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+        image_url_signer=fake_image_url_signer,
+        image_rendition_storage=fake_image_rendition_storage,
+    )
+    view = await sut(ReadImageByIDQuery(image_id=image_id, byte_range=RequestedByteRange(start=50)))
+
+    assert view == ImageLinkView(url=link.url, expires_at=link.expires_at)
+    fake_image_storage.stream_by_id.assert_not_called()  # type: ignore[attr-defined]
+
+
+async def test_read_image_by_id_link_not_found(
+    fake_current_user_service: CurrentUserService,
+    fake_image_storage: ImageStorage,
+    fake_image_url_signer: ImageUrlSigner,
+    fake_image_rendition_storage: ImageRenditionStorage,
+    fake_image_catalog_gateway: ImageCatalogGateway,
+    owned_images: set[ImageID],
+) -> None:
+    image_id = ImageID(uuid4())
+    owned_images.update([image_id])
+    fake_image_url_signer.is_enabled.return_value = True  # type: ignore[attr-defined]
+    fake_image_url_signer.sign_download = AsyncMock(return_value=None)  # type: ignore[method-assign]
+
+    sut = ReadImageByIDQueryHandler(
+        image_storage=fake_image_storage,
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+        image_url_signer=fake_image_url_signer,
+        image_rendition_storage=fake_image_rendition_storage,
+    )
 
     with pytest.raises(ImageNotFoundError):
         await sut(ReadImageByIDQuery(image_id=image_id))
+
+
+async def test_read_image_by_id_returns_rendition_for_size(
+    fake_current_user_service: CurrentUserService,
+    fake_image_storage: ImageStorage,
+    fake_image_url_signer: ImageUrlSigner,
+    fake_image_rendition_storage: ImageRenditionStorage,
+    fake_image_catalog_gateway: ImageCatalogGateway,
+    owned_images: set[ImageID],
+) -> None:
+    image_id = ImageID(uuid4())
+    owned_images.update([image_id])
+    fake_image_rendition_storage.stream_by_id = AsyncMock(return_value=_stream(None))  # type: ignore[method-assign]
+
+    sut = ReadImageByIDQueryHandler(
+        image_storage=fake_image_storage,
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+        image_url_signer=fake_image_url_signer,
+        image_rendition_storage=fake_image_rendition_storage,
+    )
+    view = await sut(ReadImageByIDQuery(image_id=image_id, size=128, byte_range=RequestedByteRange(start=50)))
+
+    assert isinstance(view, ReadImageByIDView)
+    assert view.content_range is None
+    fake_image_rendition_storage.stream_by_id.assert_awaited_once_with(image_id, 128)
+    fake_image_storage.stream_by_id.assert_not_called()  # type: ignore[attr-defined]
+
+
+async def test_read_image_by_id_rendition_not_modified(
+    fake_current_user_service: CurrentUserService,
+    fake_image_storage: ImageStorage,
+    fake_image_url_signer: ImageUrlSigner,
+    fake_image_rendition_storage: ImageRenditionStorage,
+    fake_image_catalog_gateway: ImageCatalogGateway,
+    owned_images: set[ImageID],
+) -> None:
+    image_id = ImageID(uuid4())
+    owned_images.update([image_id])
+    fake_image_rendition_storage.read_metadata_by_id = AsyncMock(  # type: ignore[method-assign]
+        return_value=_metadata(etag='"rendition"'),
+    )
+
+    sut = ReadImageByIDQueryHandler(
+        image_storage=fake_image_storage,
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+        image_url_signer=fake_image_url_signer,
+        image_rendition_storage=fake_image_rendition_storage,
+    )
+    view = await sut(ReadImageByIDQuery(image_id=image_id, size=128, if_none_match=('"rendition"',)))
+
+    assert view == ImageNotModifiedView(etag='"rendition"', updated_at=UPDATED_AT)
+    fake_image_rendition_storage.stream_by_id.assert_not_called()  # type: ignore[attr-defined]
+
+
+async def test_read_image_by_id_without_rendition_reads_original(
+    fake_current_user_service: CurrentUserService,
+    fake_image_storage: ImageStorage,
+    fake_image_url_signer: ImageUrlSigner,
+    fake_image_rendition_storage: ImageRenditionStorage,
+    fake_image_catalog_gateway: ImageCatalogGateway,
+    owned_images: set[ImageID],
+) -> None:
+    image_id = ImageID(uuid4())
+    owned_images.update([image_id])
+    fake_image_rendition_storage.stream_by_id = AsyncMock(return_value=None)  # type: ignore[method-assign]
+    fake_image_storage.stream_by_id = AsyncMock(return_value=_stream(None))  # type: ignore[method-assign]
+
+    sut = ReadImageByIDQueryHandler(
+        image_storage=fake_image_storage,
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+        image_url_signer=fake_image_url_signer,
+        image_rendition_storage=fake_image_rendition_storage,
+    )
+    view = await sut(ReadImageByIDQuery(image_id=image_id, size=4096))
+
+    assert isinstance(view, ReadImageByIDView)
+    fake_image_storage.stream_by_id.assert_awaited_once_with(image_id, None)
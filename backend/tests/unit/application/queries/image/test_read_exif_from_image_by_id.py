@@ -1,6 +1,5 @@
-from collections.abc import AsyncGenerator
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock, call
 from uuid import uuid4
 
 import pytest
@@ -19,7 +18,7 @@ from pix_erase.application.common.ports.image.extractor import (
     WhiteBalance,
 )
 from pix_erase.application.common.ports.image.storage import ImageStorage
-from pix_erase.application.common.query_models.image import ImageStreamQueryModel
+from pix_erase.application.common.query_models.image import ImageRangeQueryModel
 from pix_erase.application.common.services.current_user import CurrentUserService
 from pix_erase.application.errors.image import ImageDoesntBelongToThisUserError, ImageNotFoundError
 from pix_erase.application.queries.images.read_exif_from_image_by_id import (
@@ -27,38 +26,24 @@ from pix_erase.application.queries.images.read_exif_from_image_by_id import (
     ReadExifFromImageByIDQueryHandler,
 )
 from pix_erase.domain.image.values.image_id import ImageID
-from pix_erase.domain.image.values.image_name import ImageName
-from pix_erase.domain.image.values.image_size import ImageSize
 from pix_erase.domain.user.values.user_role import UserRole
 
 
-async def _single_chunk_stream() -> AsyncGenerator[bytes, None]:
-    yield b"payload"
-
-
 @pytest.mark.asyncio
 async def test_read_exif_success(
     fake_current_user_service: CurrentUserService,
     fake_image_storage: ImageStorage,
     fake_image_extractor: ImageInfoExtractor,
+    fake_image_catalog_gateway: Mock,
+    owned_images: set[ImageID],
 ) -> None:
     # Arrange
     image_id = ImageID(uuid4())
-    current_user = await fake_current_user_service.get_current_user()
-    current_user.images = [image_id]
-
-    stream_model = ImageStreamQueryModel(
-        stream=_single_chunk_stream(),
-        content_type="image/jpeg",
-        content_length=7,
-        width=ImageSize(100),
-        height=ImageSize(50),
-        filename=ImageName("exif.jpg"),
-        etag=None,
-        created_at=datetime.now(UTC),
-        updated_at=datetime.now(UTC),
+    owned_images.update([image_id])
+
+    fake_image_storage.read_range = AsyncMock(  # type: ignore[method-assign]
+        return_value=ImageRangeQueryModel(data=b"payload", total_size=7),
     )
-    fake_image_storage.stream_by_id = AsyncMock(return_value=stream_model)  # type: ignore[attr-defined]
 
     image_info = ImageInfo(
         width=100,
@@ -85,6 +70,7 @@ async def test_read_exif_success(
 
     sut = ReadExifFromImageByIDQueryHandler(
         current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
         image_storage=fake_image_storage,
         image_extractor=fake_image_extractor,
     )
@@ -107,14 +93,15 @@ async def test_read_exif_forbidden_when_not_owner(
     fake_current_user_service: CurrentUserService,
     fake_image_storage: ImageStorage,
     fake_image_extractor: ImageInfoExtractor,
+    fake_image_catalog_gateway: Mock,
 ) -> None:
     image_id = ImageID(uuid4())
     current_user = await fake_current_user_service.get_current_user()
-    current_user.images = []
     current_user.role = UserRole.USER
 
     sut = ReadExifFromImageByIDQueryHandler(
         current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
         image_storage=fake_image_storage,
         image_extractor=fake_image_extractor,
     )
@@ -128,18 +115,62 @@ async def test_read_exif_not_found(
     fake_current_user_service: CurrentUserService,
     fake_image_storage: ImageStorage,
     fake_image_extractor: ImageInfoExtractor,
+    fake_image_catalog_gateway: Mock,
+    owned_images: set[ImageID],
 ) -> None:
     image_id = ImageID(uuid4())
-    current_user = await fake_current_user_service.get_current_user()
-    current_user.images = [image_id]
+    owned_images.update([image_id])
 
-    fake_image_storage.stream_by_id = AsyncMock(return_value=None)  # type: ignore[attr-defined]
+    fake_image_storage.read_range = AsyncMock(return_value=None)  # type: ignore[method-assign]
 
     sut = ReadExifFromImageByIDQueryHandler(
         current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
         image_storage=fake_image_storage,
         image_extractor=fake_image_extractor,
     )
 
     with pytest.raises(ImageNotFoundError):
         await sut(ReadExifFromImageByIDQuery(image_id=image_id))
+
+
+@pytest.mark.asyncio
+async def test_read_exif_reads_more_when_metadata_goes_beyond_prefix(
+    fake_current_user_service: CurrentUserService,
+    fake_image_storage: ImageStorage,
+    fake_image_extractor: ImageInfoExtractor,
+    fake_image_catalog_gateway: Mock,
+    owned_images: set[ImageID],
+) -> None:
+    # Arrange
+    image_id = ImageID(uuid4())
+    owned_images.update([image_id])
+
+    prefix_size = 64 * 1024
+    fake_image_storage.read_range = AsyncMock(  # type: ignore[method-assign]
+        side_effect=[
+            ImageRangeQueryModel(data=b"a" * prefix_size, total_size=10 * prefix_size),
+            ImageRangeQueryModel(data=b"b" * prefix_size, total_size=10 * prefix_size),
+        ],
+    )
+    fake_image_extractor.metadata_size = Mock(return_value=prefix_size + 100)  # type: ignore[method-assign]
+    fake_image_extractor.extract = AsyncMock(return_value=ImageInfo(width=1, height=1))  # type: ignore[method-assign]
+
+    sut = ReadExifFromImageByIDQueryHandler(
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+        image_storage=fake_image_storage,
+        image_extractor=fake_image_extractor,
+    )
+
+    # Act
+    await sut(ReadExifFromImageByIDQuery(image_id=image_id))
+
+    # Assert
+    assert fake_image_storage.read_range.await_args_list == [  # type: ignore[attr-defined]
+        call(image_id, offset=0, size=prefix_size),
+        call(image_id, offset=prefix_size, size=prefix_size),
+    ]
+    fake_image_extractor.extract.assert_awaited_once_with(  # type: ignore[attr-defined]
+        data=b"a" * prefix_size + b"b" * prefix_size,
+    )
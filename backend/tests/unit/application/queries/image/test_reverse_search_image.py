@@ -1,10 +1,139 @@
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from pix_erase.application.common.ports.image.catalog_gateway import ImageCatalogGateway
+from pix_erase.application.common.ports.image.perceptual_hash_gateway import ImagePerceptualHashGateway
+from pix_erase.application.common.ports.image.perceptual_hasher import PerceptualHashes
+from pix_erase.application.common.ports.image.similarity_index import ImageSimilarityIndex
+from pix_erase.application.common.query_models.image import SimilarImageQueryModel
+from pix_erase.application.common.services.current_user import CurrentUserService
+from pix_erase.application.errors.image import ImageDoesntBelongToThisUserError, ImageNotIndexedError
 from pix_erase.application.queries.images.reverse_search_image import (
     ReverseImageSearchQuery,
     ReverseImageSearchQueryHandler,
 )
+from pix_erase.domain.image.values.image_id import ImageID
+from pix_erase.domain.user.values.user_role import UserRole
+
+HASHES = PerceptualHashes(phash=0xFF, dhash=0xF0, ahash=0x0F)
+
+
+@pytest.mark.asyncio
+async def test_reverse_image_search_success(
+    fake_current_user_service: CurrentUserService,
+    fake_perceptual_hash_gateway: ImagePerceptualHashGateway,
+    fake_similarity_index: ImageSimilarityIndex,
+    fake_image_catalog_gateway: ImageCatalogGateway,
+    owned_images: set[ImageID],
+) -> None:
+    # Arrange
+    image_id = ImageID(uuid4())
+    similar_id = ImageID(uuid4())
+    owned_images.update([image_id, similar_id])
+
+    fake_perceptual_hash_gateway.read_by_id = AsyncMock(return_value=HASHES)  # type: ignore[method-assign]
+    fake_similarity_index.search = AsyncMock(  # type: ignore[method-assign]
+        return_value=[
+            SimilarImageQueryModel(image_id=image_id, phash_distance=0, dhash_distance=0, ahash_distance=0),
+            SimilarImageQueryModel(image_id=similar_id, phash_distance=2, dhash_distance=1, ahash_distance=3),
+        ],
+    )
+
+    sut = ReverseImageSearchQueryHandler(
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+        perceptual_hash_gateway=fake_perceptual_hash_gateway,
+        similarity_index=fake_similarity_index,
+    )
+
+    # Act
+    view = await sut(ReverseImageSearchQuery(image_id=image_id, max_distance=8, limit=5))
+
+    # Assert
+    assert [image.image_id for image in view.images] == [similar_id]
+    assert view.images[0].distance == 6
+    fake_similarity_index.search.assert_awaited_once_with(
+        HASHES,
+        max_distance=8,
+        limit=6,
+        among={image_id, similar_id},
+    )
+
+
+@pytest.mark.asyncio
+async def test_reverse_image_search_admin_searches_all_images(
+    fake_current_user_service: CurrentUserService,
+    fake_perceptual_hash_gateway: ImagePerceptualHashGateway,
+    fake_similarity_index: ImageSimilarityIndex,
+    fake_image_catalog_gateway: ImageCatalogGateway,
+) -> None:
+    # Arrange
+    image_id = ImageID(uuid4())
+    current_user = await fake_current_user_service.get_current_user()
+    current_user.role = UserRole.ADMIN
+
+    fake_perceptual_hash_gateway.read_by_id = AsyncMock(return_value=HASHES)  # type: ignore[method-assign]
+    fake_similarity_index.search = AsyncMock(return_value=[])  # type: ignore[method-assign]
+
+    sut = ReverseImageSearchQueryHandler(
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+        perceptual_hash_gateway=fake_perceptual_hash_gateway,
+        similarity_index=fake_similarity_index,
+    )
+
+    # Act
+    view = await sut(ReverseImageSearchQuery(image_id=image_id))
+
+    # Assert
+    assert view.images == []
+    assert fake_similarity_index.search.await_args is not None
+    assert fake_similarity_index.search.await_args.kwargs["among"] is None
+
+
+@pytest.mark.asyncio
+async def test_reverse_image_search_not_owner(
+    fake_current_user_service: CurrentUserService,
+    fake_perceptual_hash_gateway: ImagePerceptualHashGateway,
+    fake_similarity_index: ImageSimilarityIndex,
+    fake_image_catalog_gateway: ImageCatalogGateway,
+) -> None:
+    # Arrange
+    sut = ReverseImageSearchQueryHandler(
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+        perceptual_hash_gateway=fake_perceptual_hash_gateway,
+        similarity_index=fake_similarity_index,
+    )
+
+    # Act & Assert
+    with pytest.raises(ImageDoesntBelongToThisUserError):
+        await sut(ReverseImageSearchQuery(image_id=uuid4()))
+
+
+@pytest.mark.asyncio
+async def test_reverse_image_search_not_indexed(
+    fake_current_user_service: CurrentUserService,
+    fake_perceptual_hash_gateway: ImagePerceptualHashGateway,
+    fake_similarity_index: ImageSimilarityIndex,
+    fake_image_catalog_gateway: ImageCatalogGateway,
+    owned_images: set[ImageID],
+) -> None:
+    # Arrange
+    image_id = ImageID(uuid4())
+    owned_images.update([image_id])
+
+    fake_perceptual_hash_gateway.read_by_id = AsyncMock(return_value=None)  # type: ignore[method-assign]
 
+    sut = ReverseImageSearchQueryHandler(
+        current_user_service=fake_current_user_service,
+        image_catalog_gateway=fake_image_catalog_gateway,
+        perceptual_hash_gateway=fake_perceptual_hash_gateway,
+        similarity_index=fake_similarity_index,
+    )
 
-def test_reverse_image_search_placeholder() -> None:
-    # Handler is not implemented yet; keep placeholder to signal coverage intent.
-    assert ReverseImageSearchQuery is not None
-    assert ReverseImageSearchQueryHandler is not None
+    # Act & Assert
+    with pytest.raises(ImageNotIndexedError):
+        await sut(ReverseImageSearchQuery(image_id=image_id))
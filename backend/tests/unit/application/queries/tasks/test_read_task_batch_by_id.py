@@ -0,0 +1,122 @@
+from typing import cast
+from unittest.mock import AsyncMock
+
+import pytest
+
+from pix_erase.application.common.ports.scheduler.task_id import (
+    TaskBatchID,
+    TaskBatchInfo,
+    TaskID,
+    TaskInfo,
+    TaskInfoStatus,
+)
+from pix_erase.application.common.ports.scheduler.task_scheduler import TaskScheduler
+from pix_erase.application.common.services.current_user import CurrentUserService
+from pix_erase.application.errors.task import TaskBatchDoesntBelongToThisUserError, TaskNotFoundError
+from pix_erase.application.queries.tasks.read_task_batch_by_id import (
+    ReadTaskBatchByIDQuery,
+    ReadTaskBatchByIDQueryHandler,
+)
+from pix_erase.domain.user.values.user_id import UserID
+from pix_erase.domain.user.values.user_role import UserRole
+from tests.unit.factories.user_entity import create_user
+from tests.unit.factories.value_objects import create_user_id
+
+BATCH_ID = TaskBatchID("process_images_batch:abc-123")
+
+
+def _batch(*statuses: TaskInfoStatus, owner_id: UserID) -> TaskBatchInfo:
+    return TaskBatchInfo(
+        batch_id=BATCH_ID,
+        owner_id=owner_id,
+        tasks=[
+            TaskInfo(task_id=TaskID(f"process_image_pipeline:{index}"), status=status, description="")
+            for index, status in enumerate(statuses)
+        ],
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("statuses", "expected"),
+    [
+        pytest.param([TaskInfoStatus.SUCCESS, TaskInfoStatus.SUCCESS], TaskInfoStatus.SUCCESS, id="success"),
+        pytest.param([TaskInfoStatus.SUCCESS, TaskInfoStatus.FAILURE], TaskInfoStatus.FAILURE, id="failure"),
+        pytest.param([TaskInfoStatus.FAILURE, TaskInfoStatus.QUEUED], TaskInfoStatus.PROCESSING, id="queued"),
+        pytest.param([TaskInfoStatus.SUCCESS, TaskInfoStatus.RETRYING], TaskInfoStatus.PROCESSING, id="retrying"),
+    ],
+)
+async def test_read_task_batch_by_id_aggregates_status(
+    fake_task_scheduler: TaskScheduler,
+    fake_current_user_service: CurrentUserService,
+    statuses: list[TaskInfoStatus],
+    expected: TaskInfoStatus,
+) -> None:
+    # Arrange
+    current_user = await fake_current_user_service.get_current_user()
+    fake_task_scheduler.read_batch_info = AsyncMock(  # type: ignore[method-assign]
+        return_value=_batch(*statuses, owner_id=current_user.id),
+    )
+
+    sut = ReadTaskBatchByIDQueryHandler(scheduler=fake_task_scheduler, current_user_service=fake_current_user_service)
+
+    # Act
+    view = await sut(ReadTaskBatchByIDQuery(batch_id=BATCH_ID))
+
+    # Assert
+    assert view.status == expected
+    assert view.total == len(statuses)
+    assert view.succeeded + view.failed + view.in_progress == view.total
+    assert [task.status for task in view.tasks] == statuses
+
+
+@pytest.mark.asyncio
+async def test_read_task_batch_by_id_not_found(
+    fake_task_scheduler: TaskScheduler,
+    fake_current_user_service: CurrentUserService,
+) -> None:
+    # Arrange
+    fake_task_scheduler.read_batch_info = AsyncMock(return_value=None)  # type: ignore[method-assign]
+
+    sut = ReadTaskBatchByIDQueryHandler(scheduler=fake_task_scheduler, current_user_service=fake_current_user_service)
+
+    # Act / Assert
+    with pytest.raises(TaskNotFoundError):
+        await sut(ReadTaskBatchByIDQuery(batch_id=BATCH_ID))
+
+
+@pytest.mark.asyncio
+async def test_read_task_batch_by_id_of_another_user(
+    fake_task_scheduler: TaskScheduler,
+    fake_current_user_service: CurrentUserService,
+) -> None:
+    # Arrange
+    fake_task_scheduler.read_batch_info = AsyncMock(  # type: ignore[method-assign]
+        return_value=_batch(TaskInfoStatus.SUCCESS, owner_id=create_user_id()),
+    )
+
+    sut = ReadTaskBatchByIDQueryHandler(scheduler=fake_task_scheduler, current_user_service=fake_current_user_service)
+
+    # Act / Assert
+    with pytest.raises(TaskBatchDoesntBelongToThisUserError):
+        await sut(ReadTaskBatchByIDQuery(batch_id=BATCH_ID))
+
+
+@pytest.mark.asyncio
+async def test_admin_reads_task_batch_of_another_user(
+    fake_task_scheduler: TaskScheduler,
+    fake_current_user_service: CurrentUserService,
+) -> None:
+    # Arrange
+    cast("AsyncMock", fake_current_user_service.get_current_user).return_value = create_user(role=UserRole.ADMIN)
+    fake_task_scheduler.read_batch_info = AsyncMock(  # type: ignore[method-assign]
+        return_value=_batch(TaskInfoStatus.SUCCESS, owner_id=create_user_id()),
+    )
+
+    sut = ReadTaskBatchByIDQueryHandler(scheduler=fake_task_scheduler, current_user_service=fake_current_user_service)
+
+    # Act
+    view = await sut(ReadTaskBatchByIDQuery(batch_id=BATCH_ID))
+
+    # Assert
+    assert view.status == TaskInfoStatus.SUCCESS
@@ -2,7 +2,6 @@ from uuid import uuid4
 
 import pytest
 
-from pix_erase.domain.image.values.image_id import ImageID
 from pix_erase.domain.user.entities.user import SerializedUser, User
 from pix_erase.domain.user.values.user_role import UserRole
 from tests.unit.factories.user_entity import create_user
@@ -36,7 +35,6 @@ def test_creates_user_with_defaults() -> None:
     assert sut.hashed_password == password_hash
     assert sut.role == UserRole.USER
     assert sut.is_active is True
-    assert sut.images == []
 
 
 def test_creates_user_with_explicit_values() -> None:
@@ -47,7 +45,6 @@ def test_creates_user_with_explicit_values() -> None:
     password_hash = create_password_hash(b"custom_hash")
     role = UserRole.ADMIN
     is_active = False
-    images = [ImageID(uuid4()), ImageID(uuid4())]
 
     # Act
     sut = User(
@@ -57,7 +54,6 @@ def test_creates_user_with_explicit_values() -> None:
         hashed_password=password_hash,
         role=role,
         is_active=is_active,
-        images=images,
     )
 
     # Assert
@@ -67,7 +63,6 @@ def test_creates_user_with_explicit_values() -> None:
     assert sut.hashed_password == password_hash
     assert sut.role == role
     assert sut.is_active == is_active
-    assert sut.images == images
 
 
 @pytest.mark.parametrize(
@@ -138,22 +133,6 @@ def test_user_can_be_mutated_except_id() -> None:
     assert sut.is_active == new_is_active
 
 
-def test_user_images_can_be_modified() -> None:
-    # Arrange
-    sut = create_user()
-    image_id1 = ImageID(uuid4())
-    image_id2 = ImageID(uuid4())
-
-    # Act
-    sut.images.append(image_id1)
-    sut.images.append(image_id2)
-
-    # Assert
-    assert len(sut.images) == 2
-    assert image_id1 in sut.images
-    assert image_id2 in sut.images
-
-
 def test_user_serialize() -> None:
     # Arrange
     user_id = create_user_id()
@@ -162,7 +141,6 @@ def test_user_serialize() -> None:
     password_hash = create_password_hash(b"hash123")
     role = UserRole.ADMIN
     is_active = False
-    images = [ImageID(uuid4()), ImageID(uuid4())]
 
     sut = User(
         id=user_id,
@@ -171,7 +149,6 @@ def test_user_serialize() -> None:
         hashed_password=password_hash,
         role=role,
         is_active=is_active,
-        images=images,
     )
 
     # Act
@@ -185,7 +162,6 @@ def test_user_serialize() -> None:
     assert result["role"] == role
     assert result["is_active"] == is_active
     assert result["password"] == password_hash.value
-    assert result["images"] == [str(img_id) for img_id in images]
 
 
 def test_user_deserialize() -> None:
@@ -196,7 +172,6 @@ def test_user_deserialize() -> None:
     password_hash = b"hash456"
     role = UserRole.USER
     is_active = True
-    images = [str(uuid4()), str(uuid4())]
 
     serialized_data: SerializedUser = {
         "id": str(user_id),
@@ -204,7 +179,6 @@ def test_user_deserialize() -> None:
         "name": username,
         "role": role,
         "is_active": is_active,
-        "images": images,
         "password": password_hash,
     }
 
@@ -218,8 +192,6 @@ def test_user_deserialize() -> None:
     assert sut.role == role
     assert sut.is_active == is_active
     assert sut.hashed_password.value == password_hash
-    assert len(sut.images) == len(images)
-    assert all(str(img_id) in images for img_id in sut.images)
 
 
 def test_user_serialize_deserialize_roundtrip() -> None:
@@ -230,9 +202,6 @@ def test_user_serialize_deserialize_roundtrip() -> None:
         role=UserRole.ADMIN,
         is_active=False,
     )
-    image_id1 = ImageID(uuid4())
-    image_id2 = ImageID(uuid4())
-    original.images.extend([image_id1, image_id2])
 
     # Act
     serialized = original.serialize()
@@ -245,8 +214,6 @@ def test_user_serialize_deserialize_roundtrip() -> None:
     assert deserialized.role == original.role
     assert deserialized.is_active == original.is_active
     assert deserialized.hashed_password == original.hashed_password
-    assert len(deserialized.images) == len(original.images)
-    assert all(img_id in deserialized.images for img_id in original.images)
 
 
 def test_user_can_be_used_in_set() -> None:
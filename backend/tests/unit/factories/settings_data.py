@@ -198,6 +198,9 @@ class S3SettingsData(TypedDict):
     MINIO_ROOT_USER: str
     MINIO_ROOT_PASSWORD: str
     MINIO_IMAGES_BUCKET: str
+    S3_MULTIPART_PART_SIZE_MB: int
+    S3_PRESIGNED_URLS_ENABLED: bool
+    S3_PRESIGNED_URL_EXPIRES_SECONDS: int
 
 
 def create_s3_settings_data(
@@ -206,6 +209,9 @@ def create_s3_settings_data(
     aws_access_key_id: str = "minioadmin",
     aws_secret_access_key: str = "minioadmin",  # noqa: S107
     images_bucket_name: str = "images",
+    multipart_part_size_mb: int = 8,
+    presigned_urls_enabled: bool = False,  # noqa: FBT002
+    presigned_url_expires_seconds: int = 300,
 ) -> S3SettingsData:
     return S3SettingsData(
         MINIO_HOST=host,
@@ -213,6 +219,9 @@ def create_s3_settings_data(
         MINIO_ROOT_USER=aws_access_key_id,
         MINIO_ROOT_PASSWORD=aws_secret_access_key,
         MINIO_IMAGES_BUCKET=images_bucket_name,
+        S3_MULTIPART_PART_SIZE_MB=multipart_part_size_mb,
+        S3_PRESIGNED_URLS_ENABLED=presigned_urls_enabled,
+        S3_PRESIGNED_URL_EXPIRES_SECONDS=presigned_url_expires_seconds,
     )
 
 
@@ -331,3 +340,150 @@ def create_taskiq_worker_settings_data(
         PROMETHEUS_WORKER_SERVER_HOST=prometheus_server_address,
         PROMETHEUS_WORKER_SERVER_PORT=prometheus_server_port,
     )
+
+
+class ImageProcessingSettingsData(TypedDict):
+    IMAGE_PROCESSING_POOL_ENABLED: bool
+    IMAGE_PROCESSING_POOL_SIZE: int | None
+    IMAGE_PROCESSING_THREADS_PER_PROCESS: int
+    IMAGE_PROCESSING_MAX_TASKS_PER_CHILD: int | None
+
+
+def create_image_processing_settings_data(
+    pool_enabled: bool | None = None,
+    pool_size: int | None = None,
+    threads_per_process: int = 1,
+    max_tasks_per_child: int | None = None,
+) -> ImageProcessingSettingsData:
+    if pool_enabled is None:
+        pool_enabled = True
+
+    return ImageProcessingSettingsData(
+        IMAGE_PROCESSING_POOL_ENABLED=pool_enabled,
+        IMAGE_PROCESSING_POOL_SIZE=pool_size,
+        IMAGE_PROCESSING_THREADS_PER_PROCESS=threads_per_process,
+        IMAGE_PROCESSING_MAX_TASKS_PER_CHILD=max_tasks_per_child,
+    )
+
+
+class SuperResolutionSettingsData(TypedDict):
+    SUPER_RESOLUTION_MODELS_PATH: str | None
+    SUPER_RESOLUTION_PRELOAD_SCALES: str | tuple[int, ...]
+    SUPER_RESOLUTION_WARM_UP: bool
+    SUPER_RESOLUTION_TILE_SIZE: int
+    SUPER_RESOLUTION_TILE_OVERLAP: int
+    SUPER_RESOLUTION_TILE_WORKERS: int
+    SUPER_RESOLUTION_JOB_MEMORY_LIMIT_MB: int
+
+
+def create_super_resolution_settings_data(
+    models_path: str | None = None,
+    preload_scales: str | tuple[int, ...] = (),
+    warm_up: bool = False,  # noqa: FBT002
+    tile_size: int = 192,
+    tile_overlap: int = 12,
+    tile_workers: int = 2,
+    job_memory_limit_mb: int = 2048,
+) -> SuperResolutionSettingsData:
+    return SuperResolutionSettingsData(
+        SUPER_RESOLUTION_MODELS_PATH=models_path,
+        SUPER_RESOLUTION_PRELOAD_SCALES=preload_scales,
+        SUPER_RESOLUTION_WARM_UP=warm_up,
+        SUPER_RESOLUTION_TILE_SIZE=tile_size,
+        SUPER_RESOLUTION_TILE_OVERLAP=tile_overlap,
+        SUPER_RESOLUTION_TILE_WORKERS=tile_workers,
+        SUPER_RESOLUTION_JOB_MEMORY_LIMIT_MB=job_memory_limit_mb,
+    )
+
+
+class BackgroundRemovalSettingsData(TypedDict):
+    BACKGROUND_REMOVAL_DEFAULT_MODEL: str
+    BACKGROUND_REMOVAL_PRELOAD_MODELS: str | tuple[str, ...]
+    BACKGROUND_REMOVAL_INTRA_OP_THREADS: int | None
+    BACKGROUND_REMOVAL_INTER_OP_THREADS: int | None
+
+
+def create_background_removal_settings_data(
+    default_model: str = "u2net",
+    preload_models: str | tuple[str, ...] = (),
+    intra_op_threads: int | None = None,
+    inter_op_threads: int | None = None,
+) -> BackgroundRemovalSettingsData:
+    return BackgroundRemovalSettingsData(
+        BACKGROUND_REMOVAL_DEFAULT_MODEL=default_model,
+        BACKGROUND_REMOVAL_PRELOAD_MODELS=preload_models,
+        BACKGROUND_REMOVAL_INTRA_OP_THREADS=intra_op_threads,
+        BACKGROUND_REMOVAL_INTER_OP_THREADS=inter_op_threads,
+    )
+
+
+class DerivedImageCacheSettingsData(TypedDict):
+    DERIVED_IMAGE_CACHE_ENABLED: bool
+    DERIVED_IMAGE_CACHE_MAX_SIZE_MB: int
+
+
+def create_derived_image_cache_settings_data(
+    enabled: bool = True,  # noqa: FBT002
+    max_size_mb: int = 2048,
+) -> DerivedImageCacheSettingsData:
+    return DerivedImageCacheSettingsData(
+        DERIVED_IMAGE_CACHE_ENABLED=enabled,
+        DERIVED_IMAGE_CACHE_MAX_SIZE_MB=max_size_mb,
+    )
+
+
+class ImageRenditionSettingsData(TypedDict):
+    IMAGE_RENDITIONS_ENABLED: bool
+    IMAGE_RENDITION_SIZES: str | tuple[int, ...]
+    IMAGE_RENDITION_QUALITY: int
+
+
+def create_image_rendition_settings_data(
+    enabled: bool = True,  # noqa: FBT002
+    sizes: str | tuple[int, ...] = "128,512,1024",
+    quality: int = 80,
+) -> ImageRenditionSettingsData:
+    return ImageRenditionSettingsData(
+        IMAGE_RENDITIONS_ENABLED=enabled,
+        IMAGE_RENDITION_SIZES=sizes,
+        IMAGE_RENDITION_QUALITY=quality,
+    )
+
+
+class ImageComparisonSettingsData(TypedDict):
+    IMAGE_COMPARISON_MAX_SIDE: int
+    IMAGE_COMPARISON_MULTISCALE_SSIM: bool
+    IMAGE_COMPARISON_FEATURE_SIDE: int
+    IMAGE_COMPARISON_FEATURE_CACHE_TTL_SECONDS: int
+
+
+def create_image_comparison_settings_data(
+    max_side: int = 1024,
+    multiscale_ssim: bool = False,  # noqa: FBT002
+    feature_side: int = 128,
+    feature_cache_ttl_seconds: int = 86_400,
+) -> ImageComparisonSettingsData:
+    return ImageComparisonSettingsData(
+        IMAGE_COMPARISON_MAX_SIDE=max_side,
+        IMAGE_COMPARISON_MULTISCALE_SSIM=multiscale_ssim,
+        IMAGE_COMPARISON_FEATURE_SIDE=feature_side,
+        IMAGE_COMPARISON_FEATURE_CACHE_TTL_SECONDS=feature_cache_ttl_seconds,
+    )
+
+
+class ImageSearchSettingsData(TypedDict):
+    IMAGE_SEARCH_REFRESH_INTERVAL_SECONDS: float
+    IMAGE_SEARCH_REBUILD_INTERVAL_SECONDS: int
+    IMAGE_SEARCH_BATCH_SIZE: int
+
+
+def create_image_search_settings_data(
+    refresh_interval_seconds: float = 1.0,
+    rebuild_interval_seconds: int = 3600,
+    batch_size: int = 10_000,
+) -> ImageSearchSettingsData:
+    return ImageSearchSettingsData(
+        IMAGE_SEARCH_REFRESH_INTERVAL_SECONDS=refresh_interval_seconds,
+        IMAGE_SEARCH_REBUILD_INTERVAL_SECONDS=rebuild_interval_seconds,
+        IMAGE_SEARCH_BATCH_SIZE=batch_size,
+    )
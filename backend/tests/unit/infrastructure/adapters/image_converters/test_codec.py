@@ -0,0 +1,191 @@
+import cv2
+import numpy as np
+import pytest
+
+from pix_erase.domain.image.errors.image import BadImageEncodingError
+from pix_erase.domain.image.values.image_encoding import ImageEncoding
+from pix_erase.infrastructure.adapters.image_converters.codec import (
+    BGRA_CHANNELS,
+    content_type_for,
+    decode_image,
+    detect_format,
+    reencode,
+    to_bgr,
+)
+from pix_erase.infrastructure.adapters.image_converters.cv2_image_color_to_gray_converter import (
+    Cv2ImageColorToCrayScaleConverter,
+)
+from pix_erase.infrastructure.adapters.image_converters.cv2_image_compress_converter import Cv2ImageCompressConverter
+from pix_erase.infrastructure.adapters.image_converters.cv2_image_rotation_converter import Cv2ImageRotationConverter
+from pix_erase.infrastructure.errors.image_converters import ImageDecodingError
+
+
+def _encode(extension: str, img: np.ndarray) -> bytes:
+    success, buffer = cv2.imencode(extension, img)
+    assert success
+    return buffer.tobytes()
+
+
+@pytest.fixture
+def img() -> np.ndarray:
+    return np.random.default_rng(42).integers(0, 256, (16, 24, 3), dtype=np.uint8)
+
+
+@pytest.fixture
+def rgba_png(img: np.ndarray) -> bytes:
+    transparent = cv2.cvtColor(img, cv2.COLOR_BGR2BGRA)
+    transparent[:, :, 3] = np.arange(transparent.shape[1], dtype=np.uint8) * 10
+    return _encode(".png", transparent)
+
+
+@pytest.mark.parametrize(
+    ("extension", "expected_format", "expected_content_type"),
+    [
+        pytest.param(".jpg", "JPEG", "image/jpeg", id="jpeg"),
+        pytest.param(".png", "PNG", "image/png", id="png"),
+        pytest.param(".webp", "WEBP", "image/webp", id="webp"),
+    ],
+)
+def test_detect_format(img: np.ndarray, extension: str, expected_format: str, expected_content_type: str) -> None:
+    data = _encode(extension, img)
+
+    assert detect_format(data) == expected_format
+    assert content_type_for(data) == expected_content_type
+
+
+def test_detect_format_unknown() -> None:
+    assert detect_format(b"not an image") == "UNKNOWN"
+    assert content_type_for(b"not an image") == "application/octet-stream"
+
+
+@pytest.mark.parametrize("extension", [".jpg", ".png", ".webp"])
+def test_reencode_keeps_source_format(img: np.ndarray, extension: str) -> None:
+    data = _encode(extension, img)
+
+    assert detect_format(reencode(data, decode_image(data))) == detect_format(data)
+
+
+def test_reencode_png_is_lossless(img: np.ndarray) -> None:
+    data = _encode(".png", img)
+
+    np.testing.assert_array_equal(decode_image(reencode(data, decode_image(data))), img)
+
+
+def test_reencode_image_with_alpha_falls_back_to_png(img: np.ndarray) -> None:
+    data = _encode(".jpg", img)
+    transparent = cv2.cvtColor(decode_image(data), cv2.COLOR_BGR2BGRA)
+
+    assert detect_format(reencode(data, transparent)) == "PNG"
+
+
+def test_reencode_image_with_alpha_to_requested_jpeg(img: np.ndarray) -> None:
+    data = _encode(".png", img)
+    transparent = cv2.cvtColor(img, cv2.COLOR_BGR2BGRA)
+
+    assert detect_format(reencode(data, transparent, ImageEncoding(format="JPEG"))) == "JPEG"
+
+
+def test_reencode_to_requested_format(img: np.ndarray) -> None:
+    data = _encode(".jpg", img)
+
+    assert detect_format(reencode(data, decode_image(data), ImageEncoding(format="WEBP"))) == "WEBP"
+
+
+def test_reencode_quality_changes_size(img: np.ndarray) -> None:
+    data = _encode(".jpg", img)
+    decoded = decode_image(data)
+
+    low = reencode(data, decoded, ImageEncoding(quality=10))
+    high = reencode(data, decoded, ImageEncoding(quality=100))
+
+    assert len(low) < len(high)
+
+
+def test_decode_image_keeps_alpha_and_depth(rgba_png: bytes) -> None:
+    deep = np.full((4, 6, 4), 40000, dtype=np.uint16)
+
+    assert decode_image(rgba_png).shape == (16, 24, BGRA_CHANNELS)
+    assert decode_image(_encode(".png", deep)).dtype == np.uint16
+
+
+def test_rotate_keeps_alpha(rgba_png: bytes) -> None:
+    rotated = decode_image(Cv2ImageRotationConverter().convert(rgba_png, angle=90))
+
+    assert rotated.shape == (16, 24, BGRA_CHANNELS)
+    assert rotated[:, :, 3].min() < rotated[:, :, 3].max()
+
+
+def _photo(channels: int = 3) -> np.ndarray:
+    """Smooth image with some noise, close to what compression is used for."""
+    y, x = np.mgrid[0:96, 0:128]
+    noise = np.random.default_rng(1).integers(0, 12, (96, 128, channels))
+    return (((x + y)[:, :, np.newaxis] + noise) % 256).astype(np.uint8)
+
+
+def test_compress_transparent_png_keeps_alpha() -> None:
+    transparent = _photo(channels=4)
+    transparent[:, :, 3] = np.linspace(0, 255, 128, dtype=np.uint8)
+    data = _encode(".png", transparent)
+
+    result = Cv2ImageCompressConverter().convert(data, quality=50)
+    compressed = decode_image(result)
+
+    assert detect_format(result) == "WEBP"
+    assert compressed.shape == (96, 128, BGRA_CHANNELS)
+    np.testing.assert_allclose(compressed[:, :, 3], transparent[:, :, 3], atol=2)
+
+
+def test_compress_png_makes_it_smaller() -> None:
+    data = _encode(".png", _photo())
+
+    low = Cv2ImageCompressConverter().convert(data, quality=10)
+    high = Cv2ImageCompressConverter().convert(data, quality=90)
+
+    assert detect_format(low) == detect_format(high) == "JPEG"
+    assert len(low) < len(high) < len(data)
+
+
+def test_compress_never_grows_image(img: np.ndarray) -> None:
+    data = _encode(".jpg", img)
+
+    assert len(Cv2ImageCompressConverter().convert(data, quality=100)) <= len(data)
+
+
+def test_compress_to_requested_format(img: np.ndarray) -> None:
+    data = _encode(".png", img)
+
+    assert detect_format(Cv2ImageCompressConverter().convert(data, encoding=ImageEncoding(format="PNG"))) == "PNG"
+
+
+def test_grayscale_keeps_alpha(rgba_png: bytes) -> None:
+    gray = decode_image(Cv2ImageColorToCrayScaleConverter().convert(rgba_png))
+
+    assert gray.shape == (16, 24, BGRA_CHANNELS)
+    np.testing.assert_array_equal(gray[:, :, 3], decode_image(rgba_png)[:, :, 3])
+    np.testing.assert_array_equal(gray[:, :, 0], gray[:, :, 2])
+
+
+def test_to_bgr_converts_to_8bit_bgr() -> None:
+    bgr = to_bgr(np.full((4, 6, 4), 65535, dtype=np.uint16))
+
+    assert bgr.shape == (4, 6, 3)
+    assert bgr.dtype == np.uint8
+    assert bgr.max() == 255
+
+
+def test_decode_image_fails_on_garbage() -> None:
+    with pytest.raises(ImageDecodingError):
+        decode_image(b"not an image")
+
+
+@pytest.mark.parametrize(
+    ("image_format", "quality"),
+    [
+        pytest.param("GIF", None, id="unsupported_format"),
+        pytest.param(None, -1, id="quality_too_low"),
+        pytest.param(None, 101, id="quality_too_high"),
+    ],
+)
+def test_image_encoding_validation(image_format: str | None, quality: int | None) -> None:
+    with pytest.raises(BadImageEncodingError):
+        ImageEncoding(format=image_format, quality=quality)
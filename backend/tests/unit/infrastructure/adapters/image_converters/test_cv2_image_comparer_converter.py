@@ -0,0 +1,225 @@
+import math
+
+import cv2
+import numpy as np
+import pytest
+
+from pix_erase.infrastructure.adapters.image_converters import cv2_image_comparer_converter
+from pix_erase.infrastructure.adapters.image_converters.cv2_image_comparer_converter import (
+    Cv2ImageComparerConverter,
+    _decode_flag,
+)
+from pix_erase.infrastructure.adapters.image_converters.image_header import ImageHeader
+from pix_erase.infrastructure.errors.image_converters import ImageDecodingError
+from pix_erase.setup.config.image_comparison import ImageComparisonConfig
+from tests.unit.factories.settings_data import create_image_comparison_settings_data
+
+
+def _encode(extension: str, img: np.ndarray) -> bytes:
+    success, buffer = cv2.imencode(extension, img)
+    assert success
+    return buffer.tobytes()
+
+
+def _converter(
+    max_side: int = 1024,
+    multiscale_ssim: bool = False,  # noqa: FBT002
+    feature_side: int = 128,
+) -> Cv2ImageComparerConverter:
+    data = create_image_comparison_settings_data(
+        max_side=max_side,
+        multiscale_ssim=multiscale_ssim,
+        feature_side=feature_side,
+    )
+    return Cv2ImageComparerConverter(ImageComparisonConfig.model_validate(data))
+
+
+def _reference_ssim(img1: np.ndarray, img2: np.ndarray) -> float:
+    x = cv2.cvtColor(img1, cv2.COLOR_BGR2GRAY).astype(np.float64)
+    y = cv2.cvtColor(img2, cv2.COLOR_BGR2GRAY).astype(np.float64)
+    c1, c2 = (0.01 * 255) ** 2, (0.03 * 255) ** 2
+
+    mu_x = cv2.GaussianBlur(x, (11, 11), 1.5)
+    mu_y = cv2.GaussianBlur(y, (11, 11), 1.5)
+    sigma_x = cv2.GaussianBlur(x * x, (11, 11), 1.5) - mu_x**2
+    sigma_y = cv2.GaussianBlur(y * y, (11, 11), 1.5) - mu_y**2
+    sigma_xy = cv2.GaussianBlur(x * y, (11, 11), 1.5) - mu_x * mu_y
+
+    ssim_map = ((2 * mu_x * mu_y + c1) * (2 * sigma_xy + c2)) / ((mu_x**2 + mu_y**2 + c1) * (sigma_x + sigma_y + c2))
+    return float(ssim_map.mean())
+
+
+@pytest.fixture
+def img() -> np.ndarray:
+    rng = np.random.default_rng(42)
+    smooth = cv2.resize(rng.integers(0, 256, (12, 16, 3), dtype=np.uint8), (320, 240), interpolation=cv2.INTER_CUBIC)
+    return cv2.add(smooth, rng.integers(0, 32, smooth.shape, dtype=np.uint8))
+
+
+def test_identical_images(img: np.ndarray) -> None:
+    data = _encode(".png", img)
+
+    scores = _converter().compare_by_histograms(data, data)
+
+    assert scores["MSE"] == 0
+    assert math.isinf(scores["PSNR"])
+    assert scores["SSIM"] == pytest.approx(1.0, abs=1e-4)
+    assert scores["CORREL"] == pytest.approx(1.0)
+    assert scores["BHATTACHARYYA"] == pytest.approx(0.0, abs=1e-6)
+    assert "MS_SSIM" not in scores
+
+
+def test_scores_match_reference(img: np.ndarray) -> None:
+    noisy = cv2.add(img, np.random.default_rng(7).integers(0, 64, img.shape, dtype=np.uint8))
+    mse = float(np.mean((img.astype(np.float64) - noisy.astype(np.float64)) ** 2))
+
+    scores = _converter().compare_by_histograms(_encode(".png", img), _encode(".png", noisy))
+
+    assert scores["MSE"] == pytest.approx(mse)
+    assert scores["PSNR"] == pytest.approx(20 * math.log10(255 / math.sqrt(mse)))
+    assert scores["SSIM"] == pytest.approx(_reference_ssim(img, noisy), abs=1e-3)
+    assert scores["SSIM"] < 1
+
+
+def test_images_are_compared_at_working_size(img: np.ndarray) -> None:
+    large = cv2.resize(img, (640, 480), interpolation=cv2.INTER_CUBIC)
+
+    scores = _converter(max_side=320).compare_by_histograms(_encode(".png", large), _encode(".png", img))
+
+    assert scores["SSIM"] > 0.9
+
+
+def test_images_of_different_sizes_are_compared(img: np.ndarray) -> None:
+    scores = _converter().compare_by_histograms(_encode(".png", img), _encode(".png", img[:200, :300]))
+
+    assert -1 <= scores["SSIM"] <= 1
+
+
+@pytest.mark.parametrize(
+    ("width", "height", "image_format", "expected"),
+    [
+        pytest.param(4000, 3000, "JPEG", cv2.IMREAD_REDUCED_COLOR_2, id="large_jpeg"),
+        pytest.param(8192, 6144, "JPEG", cv2.IMREAD_REDUCED_COLOR_8, id="huge_jpeg"),
+        pytest.param(3000, 4000, "JPEG", cv2.IMREAD_REDUCED_COLOR_2, id="rotated_jpeg"),
+        pytest.param(1500, 1000, "JPEG", cv2.IMREAD_COLOR, id="small_jpeg"),
+        pytest.param(8192, 6144, "PNG", cv2.IMREAD_COLOR, id="png"),
+    ],
+)
+def test_decode_flag(width: int, height: int, image_format: str, expected: int) -> None:
+    header = ImageHeader(format=image_format, width=width, height=height, channels=3)  # type: ignore[arg-type]
+
+    assert _decode_flag(header, 1024, 768) == expected
+
+
+def test_decode_flag_of_grayscale() -> None:
+    header = ImageHeader(format="JPEG", width=4096, height=4096, channels=3)
+
+    assert _decode_flag(header, 128, 128, grayscale=True) == cv2.IMREAD_REDUCED_GRAYSCALE_8
+
+
+def test_multiscale_ssim(img: np.ndarray) -> None:
+    data = _encode(".png", img)
+    blurred = _encode(".png", cv2.GaussianBlur(img, (7, 7), 3))
+    converter = _converter(multiscale_ssim=True)
+
+    same = converter.compare_by_histograms(data, data)
+    different = converter.compare_by_histograms(data, blurred)
+
+    assert same["MS_SSIM"] == pytest.approx(1.0, abs=1e-4)
+    assert 0 < different["MS_SSIM"] < 1
+
+
+def test_multiscale_ssim_of_tiny_images(img: np.ndarray) -> None:
+    data = _encode(".png", img[:16, :16])
+
+    scores = _converter(multiscale_ssim=True).compare_by_histograms(data, data)
+
+    assert scores["MS_SSIM"] == pytest.approx(1.0, abs=1e-4)
+
+
+@pytest.mark.parametrize(
+    ("first", "second"),
+    [
+        pytest.param(b"not an image", None, id="first"),
+        pytest.param(None, b"not an image", id="second"),
+    ],
+)
+def test_compare_fails_on_garbage(img: np.ndarray, first: bytes | None, second: bytes | None) -> None:
+    data = _encode(".png", img)
+
+    with pytest.raises(ImageDecodingError):
+        _converter().compare_by_histograms(first or data, second or data)
+
+
+def test_compare_features_of_identical_images(img: np.ndarray) -> None:
+    converter = _converter()
+    features = converter.extract_features(_encode(".png", img))
+
+    [scores] = converter.compare_features(features, [features])
+
+    assert scores["MSE"] == 0
+    assert scores["SSIM"] == pytest.approx(1.0, abs=1e-4)
+    assert scores["CORREL"] == pytest.approx(1.0)
+
+
+def test_compare_features_match_pairwise_scores(img: np.ndarray) -> None:
+    rng = np.random.default_rng(7)
+    candidates = [cv2.add(img, rng.integers(0, level, img.shape, dtype=np.uint8)) for level in (16, 64, 128)]
+    converter = _converter(feature_side=64)
+    size = (64, 64)
+
+    def gray_of(image: np.ndarray) -> np.ndarray:
+        decoded = cv2.imdecode(np.frombuffer(_encode(".png", image), np.uint8), cv2.IMREAD_GRAYSCALE)
+        return cv2.resize(decoded, size, interpolation=cv2.INTER_AREA)
+
+    reference_gray = gray_of(img)
+    reference_hist = cv2.normalize(cv2.calcHist([reference_gray], [0], None, [256], [0, 256]), None).flatten()
+
+    batch = converter.compare_features(
+        converter.extract_features(_encode(".png", img)),
+        [converter.extract_features(_encode(".png", candidate)) for candidate in candidates],
+    )
+
+    for candidate, scores in zip(candidates, batch, strict=True):
+        gray = gray_of(candidate)
+        hist = cv2.normalize(cv2.calcHist([gray], [0], None, [256], [0, 256]), None).flatten()
+        mse = float(np.mean((reference_gray.astype(np.float64) - gray.astype(np.float64)) ** 2))
+
+        assert scores["MSE"] == pytest.approx(mse)
+        assert scores["CORREL"] == pytest.approx(cv2.compareHist(reference_hist, hist, cv2.HISTCMP_CORREL), abs=1e-5)
+        assert scores["CHISQR"] == pytest.approx(cv2.compareHist(reference_hist, hist, cv2.HISTCMP_CHISQR), rel=1e-4)
+        assert scores["SSIM"] == pytest.approx(
+            _reference_ssim(cv2.cvtColor(reference_gray, cv2.COLOR_GRAY2BGR), cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)),
+            abs=1e-3,
+        )
+
+
+def test_compare_features_fails_on_different_sides(img: np.ndarray) -> None:
+    data = _encode(".png", img)
+
+    with pytest.raises(ValueError, match="size"):
+        _converter().compare_features(
+            _converter(feature_side=128).extract_features(data),
+            [_converter(feature_side=64).extract_features(data)],
+        )
+
+
+def test_compare_features_pairwise_matches_one_to_many(img: np.ndarray, monkeypatch: pytest.MonkeyPatch) -> None:
+    # small chunks, so images are compared across chunk boundaries
+    monkeypatch.setattr(cv2_image_comparer_converter, "CANDIDATES_PER_CHUNK", 2)
+    rng = np.random.default_rng(3)
+    converter = _converter(feature_side=32)
+    features = [
+        converter.extract_features(_encode(".png", cv2.add(img, rng.integers(0, level, img.shape, dtype=np.uint8))))
+        for level in (1, 16, 32, 64, 96, 128)
+    ]
+
+    pairwise = converter.compare_features_pairwise(features)
+
+    assert [len(scores) for scores in pairwise] == [5, 4, 3, 2, 1, 0]
+
+    for index, scores in enumerate(pairwise):
+        expected = converter.compare_features(features[index], features[index + 1 :])
+
+        for actual_scores, expected_scores in zip(scores, expected, strict=True):
+            assert actual_scores == pytest.approx(expected_scores)
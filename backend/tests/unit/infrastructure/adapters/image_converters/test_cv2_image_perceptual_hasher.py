@@ -0,0 +1,83 @@
+import cv2
+import numpy as np
+import pytest
+
+from pix_erase.infrastructure.adapters.image_converters.cv2_image_perceptual_hasher import (
+    Cv2ImagePerceptualHasher,
+    _decode_flag,
+)
+from pix_erase.infrastructure.adapters.image_converters.image_header import ImageHeader
+from pix_erase.infrastructure.errors.image_converters import ImageDecodingError
+
+HASH_BITS = 64
+
+
+def _encode(extension: str, img: np.ndarray) -> bytes:
+    success, buffer = cv2.imencode(extension, img)
+    assert success
+    return buffer.tobytes()
+
+
+def _image(seed: int, width: int = 640, height: int = 480) -> np.ndarray:
+    noise = np.random.default_rng(seed).integers(0, 256, (12, 16, 3), dtype=np.uint8)
+    return cv2.resize(noise, (width, height), interpolation=cv2.INTER_CUBIC)
+
+
+def _distance(first: int, second: int) -> int:
+    return (first ^ second).bit_count()
+
+
+def test_hashes_fit_into_64_bits() -> None:
+    # Act
+    hashes = Cv2ImagePerceptualHasher().compute(_encode(".png", _image(seed=1)))
+
+    # Assert
+    assert all(0 <= value < 1 << HASH_BITS for value in (hashes.phash, hashes.dhash, hashes.ahash))
+
+
+def test_resized_recompressed_copy_is_close() -> None:
+    # Arrange
+    hasher = Cv2ImagePerceptualHasher()
+    original = _image(seed=1, width=2048, height=1536)
+    copy = cv2.resize(original, (800, 600), interpolation=cv2.INTER_AREA)
+
+    # Act
+    original_hashes = hasher.compute(_encode(".jpg", original))
+    copy_hashes = hasher.compute(_encode(".png", copy))
+
+    # Assert
+    assert _distance(original_hashes.phash, copy_hashes.phash) <= 6
+    assert _distance(original_hashes.dhash, copy_hashes.dhash) <= 6
+
+
+def test_different_image_is_far() -> None:
+    # Arrange
+    hasher = Cv2ImagePerceptualHasher()
+
+    # Act
+    first = hasher.compute(_encode(".png", _image(seed=1)))
+    second = hasher.compute(_encode(".png", _image(seed=2)))
+
+    # Assert
+    assert _distance(first.phash, second.phash) > 12
+
+
+@pytest.mark.parametrize(
+    ("header", "flag"),
+    [
+        (None, cv2.IMREAD_GRAYSCALE),
+        (ImageHeader(format="PNG", width=4000, height=3000, channels=3), cv2.IMREAD_GRAYSCALE),
+        (ImageHeader(format="JPEG", width=4000, height=3000, channels=3), cv2.IMREAD_REDUCED_GRAYSCALE_8),
+        (ImageHeader(format="JPEG", width=800, height=600, channels=3), cv2.IMREAD_REDUCED_GRAYSCALE_4),
+        (ImageHeader(format="JPEG", width=200, height=100, channels=3), cv2.IMREAD_GRAYSCALE),
+    ],
+)
+def test_decode_flag(header: ImageHeader | None, flag: int) -> None:
+    # Act & Assert
+    assert _decode_flag(header) == flag
+
+
+def test_compute_rejects_broken_image() -> None:
+    # Act & Assert
+    with pytest.raises(ImageDecodingError):
+        Cv2ImagePerceptualHasher().compute(b"not an image")
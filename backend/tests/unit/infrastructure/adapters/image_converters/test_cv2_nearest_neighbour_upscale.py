@@ -0,0 +1,65 @@
+import math
+
+import numpy as np
+import pytest
+
+from pix_erase.domain.image.values.image_scale import ImageScale
+from pix_erase.infrastructure.adapters.image_converters.cv2_image_nearest_neighbour_upscale_converter import (
+    upscale_nearest_neighbour,
+)
+
+
+def _per_pixel_upscale(img: np.ndarray, scale: int) -> np.ndarray:
+    """Reference: the original per-pixel implementation of the converter."""
+    height, width = img.shape[:2]
+    resized_height: int = height * scale
+    resized_width: int = width * scale
+    resized: np.ndarray = np.zeros((resized_height, resized_width, 3), np.uint8)
+
+    ratio_for_col: float = height / resized_height
+    ratio_for_row: float = width / resized_width
+
+    for x in range(resized_width):
+        for y in range(resized_height):
+            resized[y, x] = img[math.ceil((y + 1) * ratio_for_col) - 1, math.ceil((x + 1) * ratio_for_row) - 1]
+
+    return resized
+
+
+@pytest.mark.parametrize("scale", [2, 3, 4])
+@pytest.mark.parametrize(
+    ("height", "width"),
+    [
+        pytest.param(1, 1, id="single_pixel"),
+        pytest.param(7, 13, id="odd"),
+        pytest.param(97, 61, id="prime"),
+        pytest.param(120, 160, id="regular"),
+    ],
+)
+@pytest.mark.parametrize("tile_size_bytes", [1, 4096, 16 * 1024 * 1024])
+def test_upscale_nearest_neighbour_matches_per_pixel_implementation(
+    height: int,
+    width: int,
+    scale: int,
+    tile_size_bytes: int,
+) -> None:
+    # Arrange
+    img: np.ndarray = np.random.default_rng(height * width).integers(0, 256, (height, width, 3), dtype=np.uint8)
+
+    # Act
+    result: np.ndarray = upscale_nearest_neighbour(img, ImageScale(scale), tile_size_bytes=tile_size_bytes)
+
+    # Assert
+    assert np.array_equal(result, _per_pixel_upscale(img, scale))
+
+
+def test_upscale_nearest_neighbour_keeps_channels() -> None:
+    # Arrange
+    img: np.ndarray = np.arange(2 * 3 * 4, dtype=np.uint8).reshape(2, 3, 4)
+
+    # Act
+    result: np.ndarray = upscale_nearest_neighbour(img, ImageScale(2))
+
+    # Assert
+    assert result.shape == (4, 6, 4)
+    assert np.array_equal(result[::2, ::2], img)
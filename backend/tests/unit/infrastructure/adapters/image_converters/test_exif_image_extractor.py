@@ -0,0 +1,43 @@
+import cv2
+import numpy as np
+import pytest
+
+from pix_erase.infrastructure.adapters.image_converters import exif_image_extractor
+from pix_erase.infrastructure.adapters.image_converters.exif_image_extractor import ExifImageInfoExtractor
+from pix_erase.infrastructure.errors.image_converters import ImageDecodingError
+
+
+@pytest.fixture
+def img() -> np.ndarray:
+    return np.random.default_rng(42).integers(0, 256, (16, 24, 3), dtype=np.uint8)
+
+
+def _encode(extension: str, img: np.ndarray) -> bytes:
+    success, buffer = cv2.imencode(extension, img)
+    assert success
+    return buffer.tobytes()
+
+
+async def test_extract_reads_size_from_header_without_decoding(
+    img: np.ndarray,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def fail(data: bytes) -> np.ndarray:
+        raise AssertionError
+
+    monkeypatch.setattr(exif_image_extractor, "decode_image", fail)
+
+    info = await ExifImageInfoExtractor().extract(_encode(".jpg", img))
+
+    assert (info.width, info.height, info.format, info.is_animated) == (24, 16, "JPEG", False)
+
+
+async def test_extract_decodes_image_with_unknown_header(img: np.ndarray) -> None:
+    info = await ExifImageInfoExtractor().extract(_encode(".ppm", img))
+
+    assert (info.width, info.height, info.format) == (24, 16, "UNKNOWN")
+
+
+async def test_extract_fails_on_garbage() -> None:
+    with pytest.raises(ImageDecodingError):
+        await ExifImageInfoExtractor().extract(b"not an image")
@@ -0,0 +1,191 @@
+import struct
+import zlib
+
+import cv2
+import numpy as np
+import pytest
+
+from pix_erase.infrastructure.adapters.image_converters.image_header import (
+    ImageHeader,
+    metadata_size,
+    probe_image_header,
+)
+
+WIDTH, HEIGHT = 24, 16
+
+
+@pytest.fixture
+def img() -> np.ndarray:
+    return np.random.default_rng(42).integers(0, 256, (HEIGHT, WIDTH, 3), dtype=np.uint8)
+
+
+def _encode(extension: str, img: np.ndarray, params: list[int] | None = None) -> bytes:
+    success, buffer = cv2.imencode(extension, img, params or [])
+    assert success
+    return buffer.tobytes()
+
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", zlib.crc32(chunk_type + data))
+
+
+def _gif(frames: int) -> bytes:
+    # logical screen without global color table, one-pixel frames with empty data
+    screen = b"GIF89a" + struct.pack("<HHBBB", WIDTH, HEIGHT, 0, 0, 0)
+    graphic_control = b"\x21\xf9\x04\x00\x00\x00\x00\x00"
+    frame = graphic_control + b"\x2c" + struct.pack("<HHHHB", 0, 0, 1, 1, 0) + b"\x02\x02\x4c\x01\x00"
+    return screen + frame * frames + b"\x3b"
+
+
+@pytest.mark.parametrize(
+    ("extension", "params", "image_format"),
+    [
+        pytest.param(".jpg", [], "JPEG", id="jpeg"),
+        pytest.param(".jpg", [cv2.IMWRITE_JPEG_PROGRESSIVE, 1], "JPEG", id="progressive_jpeg"),
+        pytest.param(".png", [], "PNG", id="png"),
+        pytest.param(".webp", [cv2.IMWRITE_WEBP_QUALITY, 90], "WEBP", id="lossy_webp"),
+        pytest.param(".webp", [cv2.IMWRITE_WEBP_QUALITY, 101], "WEBP", id="lossless_webp"),
+        pytest.param(".bmp", [], "BMP", id="bmp"),
+        pytest.param(".tiff", [], "TIFF", id="tiff"),
+    ],
+)
+def test_probe_color_image(img: np.ndarray, extension: str, params: list[int], image_format: str) -> None:
+    assert probe_image_header(_encode(extension, img, params)) == ImageHeader(
+        format=image_format,  # type: ignore[arg-type]
+        width=WIDTH,
+        height=HEIGHT,
+        channels=3,
+    )
+
+
+@pytest.mark.parametrize(
+    ("extension", "channels"),
+    [
+        pytest.param(".png", 1, id="grayscale_png"),
+        pytest.param(".jpg", 1, id="grayscale_jpeg"),
+        pytest.param(".tiff", 1, id="grayscale_tiff"),
+    ],
+)
+def test_probe_grayscale_image(img: np.ndarray, extension: str, channels: int) -> None:
+    header = probe_image_header(_encode(extension, cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)))
+
+    assert header is not None
+    assert header.channels == channels
+
+
+@pytest.mark.parametrize(
+    ("extension", "params"),
+    [
+        pytest.param(".png", [], id="png"),
+        pytest.param(".webp", [cv2.IMWRITE_WEBP_QUALITY, 101], id="webp"),
+    ],
+)
+def test_probe_transparent_image(img: np.ndarray, extension: str, params: list[int]) -> None:
+    transparent = cv2.cvtColor(img, cv2.COLOR_BGR2BGRA)
+    transparent[0, 0, 3] = 0
+
+    header = probe_image_header(_encode(extension, transparent, params))
+
+    assert header is not None
+    assert header.channels == 4
+
+
+def test_probe_jpeg_with_exif_before_frame(img: np.ndarray) -> None:
+    data = _encode(".jpg", img)
+    app1 = b"\xff\xe1" + struct.pack(">H", 2 + 1000) + b"Exif\x00\x00" + b"\x00" * 994
+
+    header = probe_image_header(data[:2] + app1 + data[2:])
+
+    assert header is not None
+    assert (header.width, header.height) == (WIDTH, HEIGHT)
+
+
+@pytest.mark.parametrize(
+    ("frames", "is_animated"),
+    [
+        pytest.param(1, False, id="still"),
+        pytest.param(3, True, id="animated"),
+    ],
+)
+def test_probe_gif(frames: int, is_animated: bool) -> None:
+    assert probe_image_header(_gif(frames)) == ImageHeader(
+        format="GIF",
+        width=WIDTH,
+        height=HEIGHT,
+        channels=3,
+        is_animated=is_animated,
+    )
+
+
+def test_probe_animated_png(img: np.ndarray) -> None:
+    data = _encode(".png", img)
+    # acTL goes right after IHDR: signature (8) + IHDR chunk (25)
+    animation_control = _png_chunk(b"acTL", struct.pack(">II", 2, 0))
+
+    header = probe_image_header(data[:33] + animation_control + data[33:])
+
+    assert header is not None
+    assert header.is_animated
+
+
+def test_probe_animated_webp() -> None:
+    flags = 0x02 | 0x10
+    vp8x = bytes([flags, 0, 0, 0]) + (WIDTH - 1).to_bytes(3, "little") + (HEIGHT - 1).to_bytes(3, "little")
+    data = b"RIFF" + struct.pack("<I", 4 + 8 + len(vp8x)) + b"WEBP" + b"VP8X" + struct.pack("<I", len(vp8x)) + vp8x
+
+    assert probe_image_header(data) == ImageHeader(
+        format="WEBP",
+        width=WIDTH,
+        height=HEIGHT,
+        channels=4,
+        is_animated=True,
+    )
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param(b"\x89PNG\r\n\x1a\n\x00\x00", id="truncated_png"),
+        pytest.param(b"\xff\xd8\xff\xe0\x00\x10JFIF", id="jpeg_without_frame"),
+        pytest.param(b"RIFF\x00\x00\x00\x00WAVEfmt ", id="riff_but_not_webp"),
+        pytest.param(b"not an image", id="unknown"),
+        pytest.param(b"", id="empty"),
+    ],
+)
+def test_probe_without_header(data: bytes) -> None:
+    assert probe_image_header(data) is None
+
+
+def test_metadata_size_of_jpeg_covers_exif_and_frame(img: np.ndarray) -> None:
+    data = _encode(".jpg", img)
+    app1 = b"\xff\xe1" + struct.pack(">H", 2 + 1000) + b"Exif\x00\x00" + b"\x00" * 994
+    image = data[:2] + app1 + data[2:]
+
+    size = 100
+    while (required := metadata_size(image[:size])) is not None and required > size:
+        size = required
+
+    assert required == size
+    assert size < len(image)
+    assert probe_image_header(image[:size]) == probe_image_header(image)
+
+
+def test_metadata_size_of_png_ends_before_pixels(img: np.ndarray) -> None:
+    data = _encode(".png", img)
+
+    size = metadata_size(data)
+
+    assert size is not None
+    assert size < len(data)
+    assert data[size - 4 : size] == b"IDAT"
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param(_gif(3), id="gif"),
+        pytest.param(b"not an image", id="unknown"),
+    ],
+)
+def test_metadata_size_needs_whole_image(data: bytes) -> None:
+    assert metadata_size(data) is None
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+from prometheus_client import REGISTRY
+
+from pix_erase.infrastructure.adapters.image_converters import rembg_session_pool
+from pix_erase.infrastructure.adapters.image_converters.rembg_session_pool import (
+    RembgSessionPool,
+    call_with_rembg_timings,
+    observe_rembg_timings,
+)
+
+MODEL = "u2netp"
+
+
+def _observed(metric: str) -> float:
+    return REGISTRY.get_sample_value(f"{metric}_count", {"model": MODEL}) or 0.0
+
+
+@pytest.fixture
+def session_pool(monkeypatch: pytest.MonkeyPatch) -> RembgSessionPool:
+    pool = RembgSessionPool(intra_op_threads=None, inter_op_threads=None)
+    monkeypatch.setattr(pool, "_new_session", lambda _: object())
+    monkeypatch.setattr(rembg_session_pool, "remove", lambda **kwargs: kwargs["data"])
+    monkeypatch.setattr(rembg_session_pool, "_pool", pool)
+    return pool
+
+
+def _remove(pool: RembgSessionPool) -> np.ndarray:
+    return pool.remove(np.zeros((2, 2, 3), dtype=np.uint8), MODEL)
+
+
+def test_timings_are_observed_in_process(session_pool: RembgSessionPool) -> None:
+    inferences = _observed("background_removal_inference_seconds")
+    loads = _observed("background_removal_session_load_seconds")
+
+    _remove(session_pool)
+
+    assert _observed("background_removal_inference_seconds") == inferences + 1
+    assert _observed("background_removal_session_load_seconds") == loads + 1
+    assert session_pool.drain_timings() == []
+
+
+def test_pool_process_returns_timings_with_result(
+    session_pool: RembgSessionPool,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(rembg_session_pool, "_collect_timings", True)
+    inferences = _observed("background_removal_inference_seconds")
+
+    result, timings = call_with_rembg_timings(_remove, pool=session_pool)
+
+    assert result.shape == (2, 2, 3)
+    assert [(timing.metric, timing.model) for timing in timings] == [("session_load", MODEL), ("inference", MODEL)]
+    assert _observed("background_removal_inference_seconds") == inferences
+
+    observe_rembg_timings(timings)
+
+    assert _observed("background_removal_inference_seconds") == inferences + 1
+    assert session_pool.drain_timings() == []
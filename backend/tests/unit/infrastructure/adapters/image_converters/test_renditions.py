@@ -0,0 +1,52 @@
+import cv2
+import numpy as np
+import pytest
+
+from pix_erase.infrastructure.adapters.image_converters.codec import detect_format
+from pix_erase.infrastructure.adapters.image_converters.renditions import render_renditions
+
+
+def _encode(extension: str, img: np.ndarray) -> bytes:
+    success, buffer = cv2.imencode(extension, img)
+    assert success
+    return buffer.tobytes()
+
+
+@pytest.fixture
+def img() -> np.ndarray:
+    return np.random.default_rng(42).integers(0, 256, (300, 400, 3), dtype=np.uint8)
+
+
+def test_renditions_fit_into_their_sizes(img: np.ndarray) -> None:
+    renditions = render_renditions(_encode(".jpg", img), sizes=[64, 200], quality=80)
+
+    assert [(r.size, r.width, r.height) for r in renditions] == [(200, 200, 150), (64, 64, 48)]
+    for rendition in renditions:
+        assert detect_format(rendition.data) == "WEBP"
+        decoded = cv2.imdecode(np.frombuffer(rendition.data, np.uint8), cv2.IMREAD_COLOR)
+        assert decoded.shape[:2] == (rendition.height, rendition.width)
+
+
+def test_small_image_is_not_enlarged(img: np.ndarray) -> None:
+    [rendition] = render_renditions(_encode(".png", img), sizes=[1024], quality=80)
+
+    assert (rendition.width, rendition.height) == (400, 300)
+
+
+def test_rendition_keeps_transparency(img: np.ndarray) -> None:
+    transparent = cv2.cvtColor(img, cv2.COLOR_BGR2BGRA)
+    transparent[:, :, 3] = 0
+
+    [rendition] = render_renditions(_encode(".png", transparent), sizes=[64], quality=80)
+
+    decoded = cv2.imdecode(np.frombuffer(rendition.data, np.uint8), cv2.IMREAD_UNCHANGED)
+    assert decoded.shape[2] == 4
+    assert int(decoded[:, :, 3].max()) == 0
+
+
+def test_rendition_of_sixteen_bit_grayscale_image() -> None:
+    gray = np.full((40, 80), 65535, dtype=np.uint16)
+
+    [rendition] = render_renditions(_encode(".png", gray), sizes=[20], quality=80)
+
+    assert (rendition.width, rendition.height) == (20, 10)
@@ -0,0 +1,87 @@
+from itertools import pairwise
+
+import numpy as np
+import pytest
+
+from pix_erase.infrastructure.adapters.image_converters.super_resolution_tiling import (
+    BYTES_IN_MEGABYTE,
+    MIN_TILE_SIZE,
+    TilingPlan,
+    estimate_tile_memory_bytes,
+    plan_tiling,
+    split_axis,
+    upsample_tiled,
+)
+
+
+def _repeat_upsample(scale: int):  # noqa: ANN202
+    def upsample(img: np.ndarray) -> np.ndarray:
+        return np.repeat(np.repeat(img, scale, axis=0), scale, axis=1)
+
+    return upsample
+
+
+@pytest.mark.parametrize(
+    ("size", "tile_size", "overlap"),
+    [
+        pytest.param(100, 100, 8, id="single_tile"),
+        pytest.param(101, 32, 4, id="uneven"),
+        pytest.param(1000, 192, 12, id="big"),
+    ],
+)
+def test_split_axis_covers_axis_with_overlap(size: int, tile_size: int, overlap: int) -> None:
+    tiles = split_axis(size, tile_size, overlap)
+
+    assert tiles[0][0] == 0
+    assert tiles[-1][1] == size
+    assert all(stop - start == min(tile_size, size) for start, stop in tiles)
+    assert all(previous[1] - current[0] >= overlap for previous, current in pairwise(tiles))
+
+
+@pytest.mark.parametrize("scale", [2, 3, 4])
+def test_upsample_tiled_matches_whole_image_upsample(scale: int) -> None:
+    # Arrange
+    img = np.random.default_rng(0).integers(0, 256, size=(77, 90, 3), dtype=np.uint8)
+    upsample = _repeat_upsample(scale)
+    plan = TilingPlan(tile_size=32, overlap=6, concurrency=3)
+
+    # Act
+    result = upsample_tiled(img, upsample, scale, plan)
+
+    # Assert
+    np.testing.assert_array_equal(result, upsample(img))
+
+
+def test_upsample_tiled_blends_seams() -> None:
+    # Arrange: every tile is shifted by its own brightness, as a model without context would do
+    img = np.full((64, 64, 3), 100, dtype=np.uint8)
+    calls = iter(range(100))
+
+    def biased_upsample(tile: np.ndarray) -> np.ndarray:
+        return _repeat_upsample(2)(tile) + np.uint8(next(calls) * 10)
+
+    # Act
+    result = upsample_tiled(img, biased_upsample, 2, TilingPlan(tile_size=40, overlap=16, concurrency=1))
+
+    # Assert: across the horizontal seam the brightness changes by small steps instead of a jump
+    steps = np.abs(np.diff(result[0, :, 0].astype(np.int16)))
+    assert steps.max() <= 1
+
+
+def test_plan_tiling_fits_memory_limit() -> None:
+    plan = plan_tiling(4, tile_size=512, overlap=12, workers=8, memory_limit_mb=1024)
+
+    assert plan.tile_size < 512
+    assert plan.concurrency * estimate_tile_memory_bytes(plan.tile_size, 4) <= 1024 * BYTES_IN_MEGABYTE
+
+
+def test_plan_tiling_keeps_minimal_tile_for_tiny_limit() -> None:
+    plan = plan_tiling(4, tile_size=192, overlap=12, workers=4, memory_limit_mb=1)
+
+    assert plan == TilingPlan(tile_size=MIN_TILE_SIZE, overlap=12, concurrency=1)
+
+
+def test_plan_tiling_is_bounded_by_workers() -> None:
+    plan = plan_tiling(2, tile_size=64, overlap=8, workers=2, memory_limit_mb=4096)
+
+    assert plan == TilingPlan(tile_size=64, overlap=8, concurrency=2)
@@ -0,0 +1,345 @@
+import hashlib
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import cv2
+import numpy as np
+import pytest
+from tenacity import stop_after_attempt
+
+from pix_erase.application.common.query_models.image import ImageByteRange
+from pix_erase.domain.image.entities.image import Image
+from pix_erase.domain.image.values.image_id import ImageID
+from pix_erase.domain.image.values.image_name import ImageName
+from pix_erase.domain.image.values.image_size import ImageSize
+from pix_erase.infrastructure.adapters.persistence.aiobotocore_file_storage import AiobotocoreS3ImageStorage
+from pix_erase.infrastructure.errors.file_storage import FileStorageError
+from pix_erase.infrastructure.errors.image_converters import ImageDecodingError
+from tests.unit.infrastructure.fakes import FAKE_BUCKET, FakeRedis, FakeS3Client
+
+PART_SIZE = 1024
+
+
+@pytest.fixture
+def storage(fake_s3_client: FakeS3Client, fake_redis: FakeRedis) -> AiobotocoreS3ImageStorage:
+    return AiobotocoreS3ImageStorage(
+        client=fake_s3_client,
+        s3_config=Mock(images_bucket_name=FAKE_BUCKET, multipart_part_size=PART_SIZE),
+        redis=fake_redis,
+    )
+
+
+def _image(data: bytes) -> Image:
+    return Image(id=ImageID(uuid4()), name=ImageName("a.png"), data=data, width=ImageSize(1), height=ImageSize(1))
+
+
+def _png(width: int, height: int) -> bytes:
+    img = np.random.default_rng(42).integers(0, 256, (height, width, 3), dtype=np.uint8)
+    _, buffer = cv2.imencode(".png", img)
+    return buffer.tobytes()
+
+
+async def _chunks(data: bytes, size: int = 100) -> AsyncIterator[bytes]:
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+async def test_same_content_is_stored_once(storage: AiobotocoreS3ImageStorage, fake_s3_client: FakeS3Client) -> None:
+    first, second = _image(b"\x89PNG\r\n\x1a\nsame"), _image(b"\x89PNG\r\n\x1a\nsame")
+
+    await storage.add(first)
+    await storage.add(second)
+
+    assert fake_s3_client.uploads == 1
+    assert len(fake_s3_client.keys("blobs/")) == 1
+    assert len(fake_s3_client.keys("blob-refs/")) == 2
+    assert (await storage.read_by_id(first.id)).data == (await storage.read_by_id(second.id)).data == first.data
+
+
+async def test_blob_is_written_outside_of_lock(
+    storage: AiobotocoreS3ImageStorage,
+    fake_s3_client: FakeS3Client,
+    fake_redis: FakeRedis,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    locks_during_writes: list[set[str]] = []
+    upload_fileobj, copy_object = fake_s3_client.upload_fileobj, fake_s3_client.copy_object
+
+    async def locked_upload(*args: object, **kwargs: object) -> None:
+        locks_during_writes.append(set(fake_redis.held_locks))
+        await upload_fileobj(*args, **kwargs)
+
+    async def locked_copy(*args: object, **kwargs: object) -> None:
+        locks_during_writes.append(set(fake_redis.held_locks))
+        await copy_object(*args, **kwargs)
+
+    monkeypatch.setattr(fake_s3_client, "upload_fileobj", locked_upload)
+    monkeypatch.setattr(fake_s3_client, "copy_object", locked_copy)
+
+    await storage.add(_image(b"content"))
+    await storage.add_stream(ImageID(uuid4()), ImageName("b.png"), _chunks(_png(4, 4)))
+
+    assert locks_during_writes == [set(), set()]
+    assert len(fake_s3_client.keys("blob-refs/")) == 2
+
+
+def _fail_image_writes(fake_s3_client: FakeS3Client, monkeypatch: pytest.MonkeyPatch) -> None:
+    put_object = fake_s3_client.put_object
+
+    async def failing_image_put(*, Key: str, **kwargs: object) -> None:  # noqa: N803
+        if Key.startswith("images/"):
+            msg = "connection reset"
+            raise OSError(msg)
+        await put_object(Key=Key, **kwargs)
+
+    monkeypatch.setattr(fake_s3_client, "put_object", failing_image_put)
+
+
+async def test_failed_upload_drops_blob_reference(
+    storage: AiobotocoreS3ImageStorage,
+    fake_s3_client: FakeS3Client,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(fake_s3_client, "upload_fileobj", AsyncMock(side_effect=OSError("connection reset")))
+    add_once = AiobotocoreS3ImageStorage.add.retry_with(stop=stop_after_attempt(1), reraise=True)  # type: ignore[attr-defined]
+
+    with pytest.raises(FileStorageError):
+        await add_once(storage, _image(b"content"))
+
+    assert fake_s3_client.keys("blob-refs/") == []
+
+
+async def test_failed_streamed_image_drops_blob_reference_and_keeps_shared_blob(
+    storage: AiobotocoreS3ImageStorage,
+    fake_s3_client: FakeS3Client,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    data = _png(4, 4)
+    stored = _image(data)
+    await storage.add(stored)
+    _fail_image_writes(fake_s3_client, monkeypatch)
+
+    with pytest.raises(OSError, match="connection reset"):
+        await storage.add_stream(ImageID(uuid4()), ImageName("b.png"), _chunks(data))
+
+    assert fake_s3_client.keys("blob-refs/") == [f"blob-refs/{hashlib.sha256(data).hexdigest()}/{stored.id}"]
+    assert (await storage.read_by_id(stored.id)).data == data
+
+
+async def test_failed_update_keeps_reference_of_same_content(
+    storage: AiobotocoreS3ImageStorage,
+    fake_s3_client: FakeS3Client,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    image = _image(b"content")
+    await storage.add(image)
+    _fail_image_writes(fake_s3_client, monkeypatch)
+    update_once = AiobotocoreS3ImageStorage.update.retry_with(stop=stop_after_attempt(1), reraise=True)  # type: ignore[attr-defined]
+
+    with pytest.raises(FileStorageError):
+        await update_once(storage, image)
+
+    assert len(fake_s3_client.keys("blob-refs/")) == 1
+    assert len(fake_s3_client.keys("blobs/")) == 1
+
+
+async def test_blob_is_deleted_with_last_reference(
+    storage: AiobotocoreS3ImageStorage,
+    fake_s3_client: FakeS3Client,
+) -> None:
+    first, second = _image(b"same"), _image(b"same")
+    await storage.add(first)
+    await storage.add(second)
+
+    await storage.delete_by_id(first.id)
+
+    assert await storage.read_by_id(first.id) is None
+    assert (await storage.read_by_id(second.id)).data == b"same"
+
+    await storage.delete_by_id(second.id)
+
+    assert fake_s3_client.objects == {}
+
+
+async def test_update_moves_image_to_new_blob(storage: AiobotocoreS3ImageStorage, fake_s3_client: FakeS3Client) -> None:
+    first, second = _image(b"same"), _image(b"same")
+    await storage.add(first)
+    await storage.add(second)
+
+    first.data = b"changed"
+    await storage.update(first)
+
+    assert (await storage.read_by_id(first.id)).data == b"changed"
+    assert (await storage.read_by_id(second.id)).data == b"same"
+    assert len(fake_s3_client.keys("blobs/")) == 2
+
+    second.data = b"changed"
+    await storage.update(second)
+
+    assert fake_s3_client.keys("blobs/") == [f"blobs/{hashlib.sha256(b'changed').hexdigest()}"]
+
+
+async def test_reads_images_stored_before_content_addressing(
+    storage: AiobotocoreS3ImageStorage,
+    fake_s3_client: FakeS3Client,
+) -> None:
+    image = _image(b"legacy")
+    fake_s3_client.objects[f"images/{image.id}"] = (
+        b"legacy",
+        {
+            "original_filename": "a.png",
+            "width": "1",
+            "height": "1",
+            "created_at": image.created_at.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+            "updated_at": image.updated_at.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+        },
+        None,
+    )
+
+    assert (await storage.read_by_id(image.id)).data == b"legacy"
+
+    await storage.delete_by_id(image.id)
+
+    assert fake_s3_client.objects == {}
+
+
+async def test_streamed_image_is_uploaded_by_parts(
+    storage: AiobotocoreS3ImageStorage,
+    fake_s3_client: FakeS3Client,
+) -> None:
+    data = _png(width=40, height=30)
+    image_id = ImageID(uuid4())
+
+    await storage.add_stream(image_id, ImageName("a.png"), _chunks(data))
+
+    image = await storage.read_by_id(image_id)
+    assert image.data == data
+    assert (image.width.value, image.height.value) == (40, 30)
+    assert fake_s3_client.uploaded_part_sizes[:-1] == [PART_SIZE] * (len(data) // PART_SIZE)
+    assert sum(fake_s3_client.uploaded_part_sizes) == len(data)
+    assert fake_s3_client.keys("uploads/") == []
+    assert fake_s3_client.multipart_uploads == {}
+
+
+async def test_streamed_image_reuses_stored_blob(
+    storage: AiobotocoreS3ImageStorage,
+    fake_s3_client: FakeS3Client,
+) -> None:
+    data = _png(width=4, height=3)
+    await storage.add(_image(data))
+
+    await storage.add_stream(ImageID(uuid4()), ImageName("b.png"), _chunks(data))
+
+    assert fake_s3_client.uploads == 1
+    assert len(fake_s3_client.keys("blobs/")) == 1
+    assert len(fake_s3_client.keys("blob-refs/")) == 2
+    assert fake_s3_client.keys("uploads/") == []
+
+
+async def test_streamed_file_that_is_not_image_is_rejected(
+    storage: AiobotocoreS3ImageStorage,
+    fake_s3_client: FakeS3Client,
+) -> None:
+    with pytest.raises(ImageDecodingError):
+        await storage.add_stream(ImageID(uuid4()), ImageName("a.png"), _chunks(b"not an image" * 200))
+
+    assert fake_s3_client.objects == {}
+    assert fake_s3_client.multipart_uploads == {}
+
+
+async def test_read_range_returns_part_of_image(storage: AiobotocoreS3ImageStorage) -> None:
+    data = _png(40, 30)
+    image = _image(data)
+    await storage.add(image)
+
+    image_range = await storage.read_range(image.id, offset=10, size=20)
+
+    assert image_range is not None
+    assert image_range.data == data[10:30]
+    assert image_range.total_size == len(data)
+
+
+async def test_read_range_beyond_image_is_empty(storage: AiobotocoreS3ImageStorage) -> None:
+    data = _png(40, 30)
+    image = _image(data)
+    await storage.add(image)
+
+    image_range = await storage.read_range(image.id, offset=len(data), size=20)
+
+    assert image_range is not None
+    assert image_range.data == b""
+
+
+async def test_read_range_of_missing_image(storage: AiobotocoreS3ImageStorage) -> None:
+    assert await storage.read_range(ImageID(uuid4()), offset=0, size=20) is None
+
+
+async def test_read_metadata_uses_only_head_requests(
+    storage: AiobotocoreS3ImageStorage,
+    fake_s3_client: FakeS3Client,
+) -> None:
+    data = _png(40, 30)
+    image = _image(data)
+    await storage.add(image)
+    fake_s3_client.gets = 0
+
+    metadata = await storage.read_metadata_by_id(image.id)
+
+    assert metadata is not None
+    assert metadata.content_length == len(data)
+    assert metadata.etag == f'"{hashlib.sha256(data).hexdigest()}"'
+    assert fake_s3_client.gets == 0
+
+
+async def test_read_metadata_of_missing_image(storage: AiobotocoreS3ImageStorage) -> None:
+    assert await storage.read_metadata_by_id(ImageID(uuid4())) is None
+
+
+async def test_stream_range_of_image(storage: AiobotocoreS3ImageStorage) -> None:
+    data = _png(40, 30)
+    image = _image(data)
+    await storage.add(image)
+    metadata = await storage.read_metadata_by_id(image.id)
+
+    stream = await storage.stream_by_id(image.id, ImageByteRange(start=5, end=24))
+
+    assert stream is not None
+    assert stream.content_length == 20
+    assert stream.byte_range == ImageByteRange(start=5, end=24)
+    assert b"".join([chunk async for chunk in stream.stream]) == data[5:25]
+    assert metadata is not None
+    assert stream.etag == metadata.etag
+
+
+async def test_uploaded_image_is_moved_into_blob(
+    storage: AiobotocoreS3ImageStorage,
+    fake_s3_client: FakeS3Client,
+) -> None:
+    data = _png(40, 30)
+    image_id = ImageID(uuid4())
+    await fake_s3_client.put_object(Bucket=FAKE_BUCKET, Key=f"uploads/{image_id}", Body=data)
+
+    assert await storage.read_upload_size(image_id) == len(data)
+
+    await storage.add_uploaded(image_id, ImageName("a.png"))
+
+    stored = await storage.read_by_id(image_id)
+    assert stored is not None
+    assert stored.data == data
+    assert (stored.width.value, stored.height.value) == (40, 30)
+    assert fake_s3_client.keys("uploads/") == []
+    assert await storage.read_upload_size(image_id) is None
+
+
+async def test_uploaded_file_that_is_not_image_is_rejected(
+    storage: AiobotocoreS3ImageStorage,
+    fake_s3_client: FakeS3Client,
+) -> None:
+    image_id = ImageID(uuid4())
+    await fake_s3_client.put_object(Bucket=FAKE_BUCKET, Key=f"uploads/{image_id}", Body=b"not an image" * 200)
+
+    with pytest.raises(ImageDecodingError):
+        await storage.add_uploaded(image_id, ImageName("a.png"))
+
+    assert fake_s3_client.objects == {}
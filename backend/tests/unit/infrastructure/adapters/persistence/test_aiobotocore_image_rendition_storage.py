@@ -0,0 +1,151 @@
+from collections.abc import AsyncIterator
+from unittest.mock import Mock
+from uuid import uuid4
+
+import cv2
+import numpy as np
+import pytest
+
+from pix_erase.domain.image.entities.image import Image
+from pix_erase.domain.image.values.image_id import ImageID
+from pix_erase.domain.image.values.image_name import ImageName
+from pix_erase.domain.image.values.image_size import ImageSize
+from pix_erase.infrastructure.adapters.persistence.aiobotocore_file_storage import AiobotocoreS3ImageStorage
+from pix_erase.infrastructure.adapters.persistence.aiobotocore_image_rendition_storage import (
+    AiobotocoreS3ImageRenditionStorage,
+)
+from tests.unit.infrastructure.fakes import FAKE_BUCKET, FakeRedis, FakeS3Client
+
+
+@pytest.fixture
+def storage(fake_s3_client: FakeS3Client, fake_redis: FakeRedis) -> AiobotocoreS3ImageStorage:
+    return AiobotocoreS3ImageStorage(
+        client=fake_s3_client,
+        s3_config=Mock(images_bucket_name=FAKE_BUCKET, multipart_part_size=1024),
+        redis=fake_redis,
+    )
+
+
+@pytest.fixture
+def renditions(fake_s3_client: FakeS3Client) -> AiobotocoreS3ImageRenditionStorage:
+    return AiobotocoreS3ImageRenditionStorage(
+        client=fake_s3_client,
+        s3_config=Mock(images_bucket_name=FAKE_BUCKET),
+        config=Mock(enabled=True, sizes=(32, 64), quality=80),
+    )
+
+
+def _png(width: int, height: int, seed: int = 42) -> bytes:
+    img = np.random.default_rng(seed).integers(0, 256, (height, width, 3), dtype=np.uint8)
+    _, buffer = cv2.imencode(".png", img)
+    return buffer.tobytes()
+
+
+async def _chunks(data: bytes) -> AsyncIterator[bytes]:
+    yield data
+
+
+async def _stored_image(storage: AiobotocoreS3ImageStorage, data: bytes) -> Image:
+    image_id = ImageID(uuid4())
+    await storage.add_stream(image_id, ImageName("photo.png"), _chunks(data))
+    return Image(id=image_id, name=ImageName("photo.png"), data=data, width=ImageSize(1), height=ImageSize(1))
+
+
+async def test_renditions_are_stored_once_per_content(
+    storage: AiobotocoreS3ImageStorage,
+    renditions: AiobotocoreS3ImageRenditionStorage,
+    fake_s3_client: FakeS3Client,
+) -> None:
+    data = _png(200, 100)
+    first, second = await _stored_image(storage, data), await _stored_image(storage, data)
+
+    await renditions.add(first)
+    stored = {key: fake_s3_client.objects[key][0] for key in fake_s3_client.keys("renditions/")}
+    await renditions.add(second)
+
+    assert len(stored) == 2
+    assert {key: fake_s3_client.objects[key][0] for key in fake_s3_client.keys("renditions/")} == stored
+
+
+@pytest.mark.parametrize(
+    ("size", "expected"),
+    [
+        pytest.param(10, (32, 16), id="smallest"),
+        pytest.param(32, (32, 16), id="exact"),
+        pytest.param(33, (64, 32), id="next_larger"),
+    ],
+)
+async def test_read_fitting_rendition(
+    storage: AiobotocoreS3ImageStorage,
+    renditions: AiobotocoreS3ImageRenditionStorage,
+    size: int,
+    expected: tuple[int, int],
+) -> None:
+    image = await _stored_image(storage, _png(200, 100))
+    await renditions.add(image)
+
+    metadata = await renditions.read_metadata_by_id(image.id, size)
+    stream = await renditions.stream_by_id(image.id, size)
+
+    assert metadata is not None
+    assert stream is not None
+    assert (metadata.width.value, metadata.height.value) == expected
+    assert metadata.content_type == "image/webp"
+    assert metadata.filename == ImageName("photo.webp")
+    assert b"".join([chunk async for chunk in stream.stream])[8:12] == b"WEBP"
+    assert stream.etag == metadata.etag
+
+
+async def test_size_above_renditions_reads_original(
+    storage: AiobotocoreS3ImageStorage,
+    renditions: AiobotocoreS3ImageRenditionStorage,
+) -> None:
+    image = await _stored_image(storage, _png(200, 100))
+    await renditions.add(image)
+
+    assert await renditions.stream_by_id(image.id, 65) is None
+
+
+async def test_updated_image_has_no_renditions_of_old_content(
+    storage: AiobotocoreS3ImageStorage,
+    renditions: AiobotocoreS3ImageRenditionStorage,
+    fake_s3_client: FakeS3Client,
+) -> None:
+    image = await _stored_image(storage, _png(200, 100))
+    await renditions.add(image)
+
+    image.data = _png(200, 100, seed=7)
+    await storage.update(image)
+
+    assert await renditions.stream_by_id(image.id, 32) is None
+    assert fake_s3_client.keys("renditions/") == []
+
+    await renditions.add(image)
+
+    assert await renditions.stream_by_id(image.id, 32) is not None
+
+
+async def test_renditions_of_replaced_content_are_skipped(
+    storage: AiobotocoreS3ImageStorage,
+    renditions: AiobotocoreS3ImageRenditionStorage,
+    fake_s3_client: FakeS3Client,
+) -> None:
+    image = await _stored_image(storage, _png(200, 100))
+    stale = Image(id=image.id, name=image.name, data=_png(200, 100, seed=7), width=image.width, height=image.height)
+
+    await renditions.add(stale)
+
+    assert fake_s3_client.keys("renditions/") == []
+
+
+async def test_renditions_are_deleted_with_blob(
+    storage: AiobotocoreS3ImageStorage,
+    renditions: AiobotocoreS3ImageRenditionStorage,
+    fake_s3_client: FakeS3Client,
+) -> None:
+    image = await _stored_image(storage, _png(200, 100))
+    await renditions.add(image)
+
+    await storage.delete_by_id(image.id)
+
+    assert fake_s3_client.keys("renditions/") == []
@@ -0,0 +1,72 @@
+from collections.abc import AsyncIterator
+from unittest.mock import Mock
+from uuid import uuid4
+
+import cv2
+import numpy as np
+import pytest
+
+from pix_erase.domain.image.values.image_id import ImageID
+from pix_erase.domain.image.values.image_name import ImageName
+from pix_erase.infrastructure.adapters.persistence.aiobotocore_file_storage import AiobotocoreS3ImageStorage
+from pix_erase.infrastructure.adapters.persistence.aiobotocore_image_url_signer import AiobotocoreS3ImageUrlSigner
+from tests.unit.infrastructure.fakes import FAKE_BUCKET, FakeRedis, FakeS3Client
+
+EXPIRES_IN = 300
+
+
+@pytest.fixture
+def signer(fake_s3_client: FakeS3Client) -> AiobotocoreS3ImageUrlSigner:
+    return AiobotocoreS3ImageUrlSigner(
+        client=fake_s3_client,
+        s3_config=Mock(
+            images_bucket_name=FAKE_BUCKET,
+            presigned_urls_enabled=True,
+            presigned_url_expires_seconds=EXPIRES_IN,
+        ),
+    )
+
+
+async def _chunks(data: bytes) -> AsyncIterator[bytes]:
+    yield data
+
+
+def _png() -> bytes:
+    _, buffer = cv2.imencode(".png", np.zeros((3, 4, 3), dtype=np.uint8))
+    return buffer.tobytes()
+
+
+async def test_download_link_points_to_blob(
+    signer: AiobotocoreS3ImageUrlSigner,
+    fake_s3_client: FakeS3Client,
+    fake_redis: FakeRedis,
+) -> None:
+    storage = AiobotocoreS3ImageStorage(
+        client=fake_s3_client,
+        s3_config=Mock(images_bucket_name=FAKE_BUCKET, multipart_part_size=1024),
+        redis=fake_redis,
+    )
+    image_id = ImageID(uuid4())
+    await storage.add_stream(image_id, ImageName("a.png"), _chunks(_png()))
+    [blob] = fake_s3_client.keys("blobs/")
+    fake_s3_client.gets = 0
+
+    link = await signer.sign_download(image_id)
+
+    assert link is not None
+    assert link.url.startswith(f"https://s3.local/{FAKE_BUCKET}/{blob}?method=get_object&expires={EXPIRES_IN}")
+    assert 'filename="a.png"' in link.url
+    assert fake_s3_client.gets == 0
+
+
+async def test_download_link_of_missing_image(signer: AiobotocoreS3ImageUrlSigner) -> None:
+    assert await signer.sign_download(ImageID(uuid4())) is None
+
+
+async def test_upload_link_points_to_upload_key(signer: AiobotocoreS3ImageUrlSigner) -> None:
+    image_id = ImageID(uuid4())
+
+    link = await signer.sign_upload(image_id)
+
+    assert link.url.startswith(f"https://s3.local/{FAKE_BUCKET}/uploads/{image_id}?method=put_object")
+    assert signer.is_enabled()
@@ -0,0 +1,88 @@
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, Mock, create_autospec
+from uuid import uuid4
+
+import pytest
+
+from pix_erase.application.common.ports.image.storage import ImageStorage
+from pix_erase.application.common.query_models.image import ImageMetadataQueryModel
+from pix_erase.domain.image.entities.image import Image
+from pix_erase.domain.image.values.image_id import ImageID
+from pix_erase.domain.image.values.image_name import ImageName
+from pix_erase.domain.image.values.image_size import ImageSize
+from pix_erase.infrastructure.adapters.persistence.cached_image_storage import CachedImageStorage
+from pix_erase.infrastructure.cache.redis_cache_store import RedisCacheStore
+from tests.unit.infrastructure.fakes import FakeRedis
+
+IMAGE_ID = ImageID(uuid4())
+METADATA = ImageMetadataQueryModel(
+    content_type="image/png",
+    content_length=1024,
+    width=ImageSize(40),
+    height=ImageSize(30),
+    filename=ImageName("a.png"),
+    etag='"abc"',
+    created_at=datetime(2026, 1, 1, tzinfo=UTC),
+    updated_at=datetime(2026, 1, 2, tzinfo=UTC),
+)
+
+
+@pytest.fixture
+def image_storage() -> Mock:
+    image_storage = create_autospec(ImageStorage, instance=True)
+    image_storage.read_metadata_by_id = AsyncMock(return_value=METADATA)
+    return image_storage
+
+
+@pytest.fixture
+def storage(image_storage: Mock, fake_redis: FakeRedis) -> CachedImageStorage:
+    return CachedImageStorage(image_storage=image_storage, cache_store=RedisCacheStore(fake_redis))  # type: ignore[arg-type]
+
+
+async def test_metadata_is_read_from_storage_once(storage: CachedImageStorage, image_storage: Mock) -> None:
+    first = await storage.read_metadata_by_id(IMAGE_ID)
+    second = await storage.read_metadata_by_id(IMAGE_ID)
+
+    assert first == METADATA
+    assert second == METADATA
+    image_storage.read_metadata_by_id.assert_awaited_once_with(IMAGE_ID)
+
+
+async def test_missing_image_is_not_cached(storage: CachedImageStorage, image_storage: Mock) -> None:
+    image_storage.read_metadata_by_id.return_value = None
+
+    assert await storage.read_metadata_by_id(IMAGE_ID) is None
+    assert await storage.read_metadata_by_id(IMAGE_ID) is None
+    assert image_storage.read_metadata_by_id.await_count == 2
+
+
+async def test_update_drops_cached_metadata(storage: CachedImageStorage, image_storage: Mock) -> None:
+    image = Image(id=IMAGE_ID, name=ImageName("a.png"), data=b"data", width=ImageSize(1), height=ImageSize(1))
+    await storage.read_metadata_by_id(IMAGE_ID)
+
+    await storage.update(image)
+    await storage.read_metadata_by_id(IMAGE_ID)
+
+    image_storage.update.assert_awaited_once_with(image)
+    assert image_storage.read_metadata_by_id.await_count == 2
+
+
+async def test_delete_drops_cached_metadata(storage: CachedImageStorage, image_storage: Mock) -> None:
+    await storage.read_metadata_by_id(IMAGE_ID)
+
+    await storage.delete_by_id(IMAGE_ID)
+    await storage.read_metadata_by_id(IMAGE_ID)
+
+    image_storage.delete_by_id.assert_awaited_once_with(IMAGE_ID)
+    assert image_storage.read_metadata_by_id.await_count == 2
+
+
+async def test_broken_cache_falls_back_to_storage(image_storage: Mock, fake_redis: FakeRedis) -> None:
+    fake_redis.get = AsyncMock(side_effect=ConnectionError)  # type: ignore[method-assign]
+    fake_redis.delete = AsyncMock(side_effect=ConnectionError)  # type: ignore[method-assign]
+    storage = CachedImageStorage(image_storage=image_storage, cache_store=RedisCacheStore(fake_redis))  # type: ignore[arg-type]
+
+    await storage.delete_by_id(IMAGE_ID)
+
+    assert await storage.read_metadata_by_id(IMAGE_ID) == METADATA
+    image_storage.delete_by_id.assert_awaited_once_with(IMAGE_ID)
@@ -0,0 +1,97 @@
+import random
+from uuid import uuid4
+
+import pytest
+
+from pix_erase.application.common.ports.image.perceptual_hasher import PerceptualHashes
+from pix_erase.domain.image.values.image_id import ImageID
+from pix_erase.infrastructure.adapters.persistence.perceptual_hash_tree import PerceptualHashTree
+from pix_erase.infrastructure.persistence.models.image_perceptual_hashes import from_bigint, to_bigint
+
+
+def _hashes(phash: int) -> PerceptualHashes:
+    return PerceptualHashes(phash=phash, dhash=0, ahash=0)
+
+
+def _brute_force(entries: dict[ImageID, int], phash: int, max_distance: int) -> set[ImageID]:
+    return {image_id for image_id, value in entries.items() if (value ^ phash).bit_count() <= max_distance}
+
+
+def test_search_matches_brute_force() -> None:
+    # Arrange
+    rng = random.Random(7)  # noqa: S311
+    base = rng.getrandbits(64)
+    tree = PerceptualHashTree()
+    entries: dict[ImageID, int] = {}
+
+    for _ in range(500):
+        # every hash is a few flipped bits away from the base, so searches find many of them
+        phash = base ^ sum(1 << rng.randrange(64) for _ in range(rng.randrange(12)))
+        image_id = ImageID(uuid4())
+        entries[image_id] = phash
+        tree.put(image_id, _hashes(phash))
+
+    # Act
+    found = {match.image_id for match in tree.search(base, max_distance=5)}
+
+    # Assert
+    assert found == _brute_force(entries, base, max_distance=5)
+    assert len(tree) == len(entries)
+
+
+def test_search_reports_distance() -> None:
+    # Arrange
+    tree = PerceptualHashTree()
+    image_id = ImageID(uuid4())
+    tree.put(image_id, _hashes(0b1011))
+
+    # Act
+    matches = tree.search(0b0001, max_distance=2)
+
+    # Assert
+    assert [(match.image_id, match.phash_distance) for match in matches] == [(image_id, 2)]
+
+
+def test_put_moves_changed_image() -> None:
+    # Arrange
+    tree = PerceptualHashTree()
+    image_id = ImageID(uuid4())
+    tree.put(image_id, _hashes(0))
+
+    # Act
+    tree.put(image_id, _hashes((1 << 64) - 1))
+
+    # Assert
+    assert tree.search(0, max_distance=0) == []
+    assert [match.image_id for match in tree.search((1 << 64) - 1, max_distance=0)] == [image_id]
+    assert len(tree) == 1
+
+
+def test_discard_and_compaction_keep_other_images() -> None:
+    # Arrange
+    tree = PerceptualHashTree()
+    image_ids = [ImageID(uuid4()) for _ in range(100)]
+
+    for index, image_id in enumerate(image_ids):
+        tree.put(image_id, _hashes(index))
+
+    # Act
+    for image_id in image_ids[:80]:
+        tree.discard(image_id)
+
+    tree.discard(ImageID(uuid4()))
+
+    # Assert
+    found = {match.image_id for match in tree.search(0, max_distance=64)}
+    assert found == set(image_ids[80:])
+    assert len(tree) == 20
+
+
+@pytest.mark.parametrize("value", [0, 1, (1 << 63) - 1, 1 << 63, (1 << 64) - 1])
+def test_bigint_roundtrip(value: int) -> None:
+    # Act
+    stored = to_bigint(value)
+
+    # Assert
+    assert -(1 << 63) <= stored < 1 << 63
+    assert from_bigint(stored) == value
@@ -0,0 +1,105 @@
+from dataclasses import dataclass, field
+from unittest.mock import AsyncMock, Mock, create_autospec
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pix_erase.application.common.ports.transaction_manager import TransactionManager
+from pix_erase.application.common.ports.user.command_gateway import UserCommandGateway
+from pix_erase.infrastructure.adapters.persistence.cached_user_command_gateway import CachedUserCommandGateway
+from pix_erase.infrastructure.adapters.persistence.user_cache_transaction_manager import UserCacheTransactionManager
+from pix_erase.infrastructure.cache.user_cache import UserCache
+from tests.unit.factories.user_entity import create_user
+
+
+@dataclass
+class FlushedSession:
+    """What ``before_flush`` listeners read from the session."""
+
+    new: list[object] = field(default_factory=list)
+    dirty: list[object] = field(default_factory=list)
+    deleted: list[object] = field(default_factory=list)
+    modified: list[object] = field(default_factory=list)
+
+    def is_modified(self, instance: object) -> bool:
+        return instance in self.modified
+
+
+@pytest.fixture
+def user_cache() -> Mock:
+    return create_autospec(UserCache, instance=True)
+
+
+@pytest.fixture
+def session() -> AsyncSession:
+    return AsyncSession()
+
+
+def _transaction_manager(session: AsyncSession, user_cache: Mock) -> tuple[UserCacheTransactionManager, Mock]:
+    transaction_manager = create_autospec(TransactionManager, instance=True)
+    return UserCacheTransactionManager(transaction_manager, session, user_cache), transaction_manager
+
+
+def _flush(session: AsyncSession, flushed: FlushedSession) -> None:
+    session.sync_session.dispatch.before_flush(flushed, None, None)
+
+
+def _marked(user_cache: Mock) -> set[object]:
+    return {user_id for call in user_cache.mark_changed.call_args_list for user_id in call.args[0]}
+
+
+async def test_flushed_users_are_dropped_after_commit(session: AsyncSession, user_cache: Mock) -> None:
+    # Arrange
+    sut, transaction_manager = _transaction_manager(session, user_cache)
+    added, changed, unchanged, deleted = create_user(), create_user(), create_user(), create_user()
+
+    # Act
+    _flush(
+        session,
+        FlushedSession(new=[added, object()], dirty=[changed, unchanged], deleted=[deleted], modified=[changed]),
+    )
+    await sut.commit()
+
+    # Assert
+    assert _marked(user_cache) == {added.id, changed.id, deleted.id}
+    transaction_manager.commit.assert_awaited_once()
+    user_cache.invalidate_changed.assert_awaited_once()
+
+
+async def test_failed_commit_drops_nothing(session: AsyncSession, user_cache: Mock) -> None:
+    sut, transaction_manager = _transaction_manager(session, user_cache)
+    transaction_manager.commit.side_effect = RuntimeError
+
+    with pytest.raises(RuntimeError):
+        await sut.commit()
+
+    user_cache.forget_changed.assert_called_once()
+    user_cache.invalidate_changed.assert_not_called()
+
+
+async def test_rollback_drops_nothing(session: AsyncSession, user_cache: Mock) -> None:
+    sut, transaction_manager = _transaction_manager(session, user_cache)
+
+    await sut.rollback()
+
+    user_cache.forget_changed.assert_called_once()
+    transaction_manager.rollback.assert_awaited_once()
+
+
+async def test_statements_of_command_gateway_mark_users(user_cache: Mock) -> None:
+    # Arrange
+    user_command_gateway = create_autospec(UserCommandGateway, instance=True)
+    user_command_gateway.read_by_id = AsyncMock(return_value=None)
+    sut = CachedUserCommandGateway(user_command_gateway, user_cache)
+    updated = create_user()
+    deleted = create_user()
+
+    # Act
+    await sut.read_by_id(updated.id)
+    await sut.update(updated)
+    await sut.delete_by_id(deleted.id)
+
+    # Assert
+    assert _marked(user_cache) == {updated.id, deleted.id}
+    user_command_gateway.update.assert_awaited_once_with(updated)
+    user_command_gateway.delete_by_id.assert_awaited_once_with(deleted.id)
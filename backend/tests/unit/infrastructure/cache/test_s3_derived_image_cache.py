@@ -0,0 +1,101 @@
+from unittest.mock import Mock
+
+from prometheus_client import REGISTRY
+
+from pix_erase.domain.image.values.image_encoding import ImageEncoding
+from pix_erase.domain.image.values.image_size import ImageSize
+from pix_erase.infrastructure.cache.derived_image_cache import DerivedImage, DerivedImageKey
+from pix_erase.infrastructure.cache.s3_derived_image_cache import (
+    BYTES_IN_MEGABYTE,
+    S3DerivedImageCache,
+)
+from pix_erase.setup.config.derived_image_cache import DerivedImageCacheConfig
+from tests.unit.infrastructure.fakes import FAKE_BUCKET, FakeRedis, FakeS3Client
+
+
+def _cache(fake_s3_client: FakeS3Client, fake_redis: FakeRedis, *, max_size_mb: int = 1) -> S3DerivedImageCache:
+    return S3DerivedImageCache(
+        client=fake_s3_client,
+        redis=fake_redis,
+        s3_config=Mock(images_bucket_name=FAKE_BUCKET),
+        config=DerivedImageCacheConfig(DERIVED_IMAGE_CACHE_MAX_SIZE_MB=max_size_mb),
+    )
+
+
+def _hits(operation: str) -> float:
+    return (
+        REGISTRY.get_sample_value("derived_image_cache_lookups_total", {"operation": operation, "result": "hit"}) or 0
+    )
+
+
+def _derived(data: bytes) -> DerivedImage:
+    return DerivedImage(data=data, width=ImageSize(2), height=ImageSize(3))
+
+
+def test_key_depends_on_source_operation_and_params() -> None:
+    png = ImageEncoding(format="PNG")
+    key = DerivedImageKey.for_source(b"source", "rotate", {"angle": 90, "encoding": png})
+
+    assert key.digest == DerivedImageKey.for_source(b"source", "rotate", {"encoding": png, "angle": 90}).digest
+    assert key.digest != DerivedImageKey.for_source(b"other", "rotate", {"angle": 90, "encoding": png}).digest
+    assert key.digest != DerivedImageKey.for_source(b"source", "compress", {"angle": 90, "encoding": png}).digest
+    assert key.digest != DerivedImageKey.for_source(b"source", "rotate", {"angle": 180, "encoding": png}).digest
+    assert (
+        key.digest != DerivedImageKey.for_source(b"source", "rotate", {"angle": 90, "encoding": ImageEncoding()}).digest
+    )
+
+
+async def test_returns_stored_result(fake_s3_client: FakeS3Client, fake_redis: FakeRedis) -> None:
+    cache = _cache(fake_s3_client, fake_redis)
+    key = DerivedImageKey.for_source(b"source", "grayscale", {})
+    hits_before = _hits("grayscale")
+
+    assert await cache.get(key) is None
+
+    await cache.set(key, _derived(b"result"))
+
+    assert await cache.get(key) == _derived(b"result")
+    assert _hits("grayscale") == hits_before + 1
+
+
+async def test_evicts_least_recently_used_results(fake_s3_client: FakeS3Client, fake_redis: FakeRedis) -> None:
+    cache = _cache(fake_s3_client, fake_redis, max_size_mb=1)
+    half_megabyte = b"x" * (BYTES_IN_MEGABYTE // 2)
+    first, second, third = (DerivedImageKey.for_source(source, "grayscale", {}) for source in (b"1", b"2", b"3"))
+
+    await cache.set(first, _derived(half_megabyte))
+    await cache.set(second, _derived(half_megabyte))
+    await cache.get(first)
+    await cache.set(third, _derived(half_megabyte))
+
+    assert await cache.get(first) is not None
+    assert await cache.get(second) is None
+    assert await cache.get(third) is not None
+    assert len(fake_s3_client.keys("derived/")) == 2
+    assert fake_redis.values["derived_images:total_bytes"] == BYTES_IN_MEGABYTE
+
+
+async def test_result_missing_in_s3_is_a_miss(fake_s3_client: FakeS3Client, fake_redis: FakeRedis) -> None:
+    cache = _cache(fake_s3_client, fake_redis)
+    key = DerivedImageKey.for_source(b"source", "grayscale", {})
+    await cache.set(key, _derived(b"result"))
+
+    fake_s3_client.objects.clear()
+
+    assert await cache.get(key) is None
+    assert fake_redis.values["derived_images:total_bytes"] == 0
+
+
+async def test_disabled_cache_does_nothing(fake_s3_client: FakeS3Client, fake_redis: FakeRedis) -> None:
+    cache = S3DerivedImageCache(
+        client=fake_s3_client,
+        redis=fake_redis,
+        s3_config=Mock(images_bucket_name=FAKE_BUCKET),
+        config=DerivedImageCacheConfig(DERIVED_IMAGE_CACHE_ENABLED=False),
+    )
+    key = DerivedImageKey.for_source(b"source", "grayscale", {})
+
+    await cache.set(key, _derived(b"result"))
+
+    assert await cache.get(key) is None
+    assert fake_s3_client.objects == {}
@@ -0,0 +1,99 @@
+from unittest.mock import AsyncMock
+
+from prometheus_client import REGISTRY
+
+from pix_erase.application.common.query_params.pagination import Pagination
+from pix_erase.application.common.query_params.sorting import SortingOrder
+from pix_erase.application.common.query_params.user_filters import UserListParams, UserListSorting, UserQueryFilters
+from pix_erase.infrastructure.cache.redis_cache_store import RedisCacheStore
+from pix_erase.infrastructure.cache.user_cache import UserCache, list_key, user_key
+from tests.unit.factories.user_entity import create_user
+from tests.unit.factories.value_objects import create_user_id
+from tests.unit.infrastructure.fakes import FakeRedis
+
+
+def _params(offset: int = 0) -> UserListParams:
+    return UserListParams(
+        pagination=Pagination(offset=offset, limit=10),
+        sorting=UserListSorting(sorting_field=UserQueryFilters.name, sorting_order=SortingOrder.ASC),
+    )
+
+
+def _lookups(kind: str, result: str) -> float:
+    return REGISTRY.get_sample_value("user_cache_lookups_total", {"kind": kind, "result": result}) or 0
+
+
+def test_keys_dont_depend_on_process() -> None:
+    user_id = create_user_id()
+
+    assert user_key(user_id) == f"users:v1:user:{user_id}"
+    assert list_key("1", _params()) == list_key("1", _params())
+    assert list_key("1", _params()) != list_key("1", _params(offset=10))
+    assert list_key("1", _params()) != list_key("2", _params())
+
+
+async def test_stored_user_is_read(fake_redis: FakeRedis) -> None:
+    # Arrange
+    user_cache = UserCache(RedisCacheStore(fake_redis))  # type: ignore[arg-type]
+    user = create_user()
+    misses_before, hits_before = _lookups("user", "miss"), _lookups("user", "hit")
+
+    # Act
+    missed = await user_cache.read_user(user.id)
+    await user_cache.store_user(user)
+    cached = await user_cache.read_user(user.id)
+
+    # Assert
+    assert missed is None
+    assert cached is not None
+    assert cached.serialize() == user.serialize()
+    assert _lookups("user", "miss") - misses_before == 1
+    assert _lookups("user", "hit") - hits_before == 1
+
+
+async def test_committed_changes_drop_user_and_lists(fake_redis: FakeRedis) -> None:
+    # Arrange
+    user_cache = UserCache(RedisCacheStore(fake_redis))  # type: ignore[arg-type]
+    user = create_user()
+    await user_cache.store_user(user)
+    await user_cache.store_list(_params(), [user])
+
+    # Act
+    user_cache.mark_changed([user.id])
+    await user_cache.invalidate_changed()
+
+    # Assert
+    assert await user_cache.read_user(user.id) is None
+    assert await user_cache.read_list(_params()) is None
+
+
+async def test_forgotten_changes_drop_nothing(fake_redis: FakeRedis) -> None:
+    user_cache = UserCache(RedisCacheStore(fake_redis))  # type: ignore[arg-type]
+    user = create_user()
+    await user_cache.store_user(user)
+
+    user_cache.mark_changed([user.id])
+    user_cache.forget_changed()
+    await user_cache.invalidate_changed()
+
+    assert await user_cache.read_user(user.id) is not None
+
+
+async def test_lists_are_shared_between_caches(fake_redis: FakeRedis) -> None:
+    users = [create_user(), create_user()]
+    await UserCache(RedisCacheStore(fake_redis)).store_list(_params(), users)  # type: ignore[arg-type]
+
+    cached = await UserCache(RedisCacheStore(fake_redis)).read_list(_params())  # type: ignore[arg-type]
+
+    assert cached is not None
+    assert [user.id for user in cached] == [user.id for user in users]
+
+
+async def test_broken_cache_is_a_miss(fake_redis: FakeRedis) -> None:
+    fake_redis.get = AsyncMock(side_effect=ConnectionError)  # type: ignore[method-assign]
+    user_cache = UserCache(RedisCacheStore(fake_redis))  # type: ignore[arg-type]
+    errors_before = _lookups("user", "error")
+
+    assert await user_cache.read_user(create_user_id()) is None
+    assert await user_cache.read_list(_params()) is None
+    assert _lookups("user", "error") - errors_before == 1
@@ -0,0 +1,70 @@
+import pytest
+
+from pix_erase.domain.user.entities.user import User
+from pix_erase.domain.user.values.user_role import UserRole
+from pix_erase.infrastructure.cache.user_codec import (
+    USER_CODEC_VERSION,
+    UserCodecError,
+    decode_user,
+    decode_users,
+    encode_user,
+    encode_users,
+)
+from tests.unit.factories.user_entity import create_user
+from tests.unit.factories.value_objects import create_password_hash, create_username
+
+
+def _assert_same(first: User, second: User) -> None:
+    assert first.serialize() == second.serialize()
+
+
+def test_user_roundtrip() -> None:
+    # Arrange
+    user = create_user(
+        username=create_username("alice.smith"),
+        password_hash=create_password_hash(b"$2b$12$\x00\xff"),
+        role=UserRole.ADMIN,
+        is_active=False,
+    )
+
+    # Act
+    decoded = decode_user(encode_user(user))
+
+    # Assert
+    _assert_same(decoded, user)
+
+
+def test_users_roundtrip() -> None:
+    # Arrange
+    users = [create_user(), create_user(role=UserRole.SUPER_ADMIN), create_user(is_active=False)]
+
+    # Act
+    decoded = decode_users(encode_users(users))
+
+    # Assert
+    assert len(decoded) == len(users)
+    for decoded_user, user in zip(decoded, users, strict=True):
+        _assert_same(decoded_user, user)
+
+
+def test_empty_users_roundtrip() -> None:
+    assert decode_users(encode_users([])) == []
+
+
+def test_user_is_smaller_than_json() -> None:
+    user = create_user()
+
+    assert len(encode_user(user)) < len(str(user.serialize()).encode())
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param(bytes([USER_CODEC_VERSION + 1]) + encode_user(create_user())[1:], id="other_version"),
+        pytest.param(encode_user(create_user())[:-1], id="truncated"),
+        pytest.param(b"", id="empty"),
+    ],
+)
+def test_bad_user_isnt_decoded(data: bytes) -> None:
+    with pytest.raises(UserCodecError):
+        decode_user(data)
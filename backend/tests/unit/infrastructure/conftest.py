@@ -0,0 +1,13 @@
+import pytest
+
+from tests.unit.infrastructure.fakes import FakeRedis, FakeS3Client
+
+
+@pytest.fixture
+def fake_s3_client() -> FakeS3Client:
+    return FakeS3Client()
+
+
+@pytest.fixture
+def fake_redis() -> FakeRedis:
+    return FakeRedis()
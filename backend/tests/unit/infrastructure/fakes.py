@@ -0,0 +1,267 @@
+import hashlib
+from collections.abc import AsyncIterator, Callable, Coroutine
+from contextlib import asynccontextmanager
+from typing import Any, BinaryIO
+
+from botocore.exceptions import ClientError
+
+FAKE_BUCKET = "images"
+
+
+class FakeBody:
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+
+    async def read(self, size: int = -1) -> bytes:
+        if size < 0:
+            data, self._data = self._data, b""
+            return data
+
+        data, self._data = self._data[:size], self._data[size:]
+        return data
+
+
+class FakeS3Client:
+    def __init__(self) -> None:
+        self.objects: dict[str, tuple[bytes, dict[str, str], str | None]] = {}
+        self.uploads: int = 0
+        self.multipart_uploads: dict[str, tuple[str, str | None, dict[int, bytes]]] = {}
+        self.uploaded_part_sizes: list[int] = []
+        self.gets: int = 0
+        self.heads: int = 0
+
+    async def put_object(
+        self,
+        Bucket: str,  # noqa: N803, ARG002
+        Key: str,  # noqa: N803
+        Body: bytes,  # noqa: N803
+        Metadata: dict[str, str] | None = None,  # noqa: N803
+        ContentType: str | None = None,  # noqa: N803
+    ) -> None:
+        self.objects[Key] = (Body, Metadata or {}, ContentType)
+
+    async def upload_fileobj(self, fileobj: BinaryIO, bucket: str, key: str, ExtraArgs: dict[str, Any]) -> None:  # noqa: N803, ARG002
+        self.uploads += 1
+        self.objects[key] = (fileobj.read(), ExtraArgs.get("Metadata", {}), ExtraArgs.get("ContentType"))
+
+    async def create_multipart_upload(self, Bucket: str, Key: str, ContentType: str) -> dict[str, Any]:  # noqa: N803, ARG002
+        upload_id = f"upload-{len(self.multipart_uploads)}"
+        self.multipart_uploads[upload_id] = (Key, ContentType, {})
+        return {"UploadId": upload_id}
+
+    async def upload_part(
+        self,
+        Bucket: str,  # noqa: N803, ARG002
+        Key: str,  # noqa: N803, ARG002
+        UploadId: str,  # noqa: N803
+        PartNumber: int,  # noqa: N803
+        Body: bytes,  # noqa: N803
+    ) -> dict[str, Any]:
+        self.multipart_uploads[UploadId][2][PartNumber] = Body
+        self.uploaded_part_sizes.append(len(Body))
+        return {"ETag": hashlib.md5(Body).hexdigest()}  # noqa: S324
+
+    async def complete_multipart_upload(
+        self,
+        Bucket: str,  # noqa: N803, ARG002
+        Key: str,  # noqa: N803
+        UploadId: str,  # noqa: N803
+        MultipartUpload: dict[str, list[dict[str, Any]]],  # noqa: N803
+    ) -> None:
+        _, content_type, parts = self.multipart_uploads.pop(UploadId)
+        numbers = [part["PartNumber"] for part in MultipartUpload["Parts"]]
+        self.objects[Key] = (b"".join(parts[number] for number in numbers), {}, content_type)
+
+    async def abort_multipart_upload(self, Bucket: str, Key: str, UploadId: str) -> None:  # noqa: N803, ARG002
+        self.multipart_uploads.pop(UploadId, None)
+
+    async def copy_object(self, Bucket: str, Key: str, CopySource: dict[str, str]) -> None:  # noqa: N803
+        self.objects[Key] = self._get(Bucket, CopySource["Key"])
+
+    async def get_object(self, Bucket: str, Key: str, Range: str | None = None) -> dict[str, Any]:  # noqa: N803
+        self.gets += 1
+        data, metadata, content_type = self._get(Bucket, Key)
+        response: dict[str, Any] = {
+            "Metadata": metadata,
+            "ContentType": content_type,
+            "ETag": hashlib.md5(data).hexdigest(),  # noqa: S324
+        }
+
+        if Range is not None:
+            start, end = (int(bound) for bound in Range.removeprefix("bytes=").split("-"))
+
+            if start >= len(data):
+                raise ClientError({"Error": {"Code": "InvalidRange"}}, "GetObject")
+
+            end = min(end, len(data) - 1)
+            response["ContentRange"] = f"bytes {start}-{end}/{len(data)}"
+            data = data[start : end + 1]
+
+        return response | {"Body": FakeBody(data), "ContentLength": len(data)}
+
+    async def head_object(self, Bucket: str, Key: str) -> dict[str, Any]:  # noqa: N803
+        self.heads += 1
+        data, metadata, content_type = self._get(Bucket, Key)
+        return {
+            "Metadata": metadata,
+            "ContentLength": len(data),
+            "ContentType": content_type,
+            "ETag": hashlib.md5(data).hexdigest(),  # noqa: S324
+        }
+
+    async def delete_object(self, Bucket: str, Key: str) -> None:  # noqa: N803, ARG002
+        self.objects.pop(Key, None)
+
+    async def list_objects_v2(self, Bucket: str, Prefix: str, MaxKeys: int) -> dict[str, Any]:  # noqa: N803, ARG002
+        keys = [key for key in self.objects if key.startswith(Prefix)][:MaxKeys]
+        return {"KeyCount": len(keys), "Contents": [{"Key": key} for key in keys]}
+
+    async def generate_presigned_url(self, ClientMethod: str, Params: dict[str, str], ExpiresIn: int) -> str:  # noqa: N803
+        query = "&".join(f"{name}={value}" for name, value in Params.items() if name not in ("Bucket", "Key"))
+        return f"https://s3.local/{Params['Bucket']}/{Params['Key']}?method={ClientMethod}&expires={ExpiresIn}&{query}"
+
+    def keys(self, prefix: str) -> list[str]:
+        return [key for key in self.objects if key.startswith(prefix)]
+
+    def _get(self, bucket: str, key: str) -> tuple[bytes, dict[str, str], str | None]:
+        if key not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+
+        assert bucket == FAKE_BUCKET
+        return self.objects[key]
+
+
+class FakeRedis:
+    """In-memory subset of redis commands used by the adapters."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, int] = {}
+        self.hashes: dict[str, dict[str, bytes]] = {}
+        self.sorted_sets: dict[str, dict[str, float]] = {}
+        self.lists: dict[str, list[bytes]] = {}
+        self.ttls: dict[str, int] = {}
+        self.strings: dict[str, bytes] = {}
+        self.held_locks: set[str] = set()
+
+    @asynccontextmanager
+    async def lock(self, name: str, **kwargs: int) -> AsyncIterator[None]:  # noqa: ARG002
+        self.held_locks.add(name)
+        try:
+            yield
+        finally:
+            self.held_locks.discard(name)
+
+    async def get(self, name: str) -> bytes | None:
+        if name in self.strings:
+            return self.strings[name]
+        return str(self.values[name]).encode() if name in self.values else None
+
+    async def set(self, name: str, value: bytes, ex: int | None = None) -> bool:
+        self.strings[name] = value
+        if ex is not None:
+            self.ttls[name] = ex
+        return True
+
+    async def incrby(self, name: str, amount: int) -> int:
+        self.values[name] = self.values.get(name, 0) + amount
+        return self.values[name]
+
+    async def decrby(self, name: str, amount: int) -> int:
+        return await self.incrby(name, -amount)
+
+    async def hset(
+        self,
+        name: str,
+        key: str | None = None,
+        value: str | None = None,
+        mapping: dict[str, str] | None = None,
+    ) -> int:
+        items = dict(mapping or {})
+
+        if key is not None and value is not None:
+            items[key] = value
+
+        fields = self.hashes.setdefault(name, {})
+        created = sum(field not in fields for field in items)
+        fields.update({field: item.encode() for field, item in items.items()})
+        return created
+
+    async def hgetall(self, name: str) -> dict[bytes, bytes]:
+        return {field.encode(): item for field, item in self.hashes.get(name, {}).items()}
+
+    async def rpush(self, name: str, *values: str) -> int:
+        self.lists.setdefault(name, []).extend(value.encode() for value in values)
+        return len(self.lists[name])
+
+    async def lrange(self, name: str, start: int, end: int) -> list[bytes]:
+        items = self.lists.get(name, [])
+        return items[start:] if end == -1 else items[start : end + 1]
+
+    async def delete(self, *names: str) -> int:
+        deleted: int = 0
+        for name in names:
+            popped: list[Any] = [store.pop(name, None) for store in (self.lists, self.hashes, self.strings)]
+            deleted += any(value is not None for value in popped)
+        return deleted
+
+    async def expire(self, name: str, time: int) -> bool:
+        self.ttls[name] = time
+        return True
+
+    def pipeline(self, *, transaction: bool = True) -> "FakePipeline":  # noqa: ARG002
+        return FakePipeline(self)
+
+    async def hget(self, name: str, key: str) -> bytes | None:
+        return self.hashes.get(name, {}).get(key)
+
+    async def hdel(self, name: str, key: str) -> int:
+        return int(self.hashes.get(name, {}).pop(key, None) is not None)
+
+    async def zadd(self, name: str, mapping: dict[str, float], *, xx: bool = False, ch: bool = False) -> int:
+        members = self.sorted_sets.setdefault(name, {})
+        changed = 0
+
+        for member, score in mapping.items():
+            if xx and member not in members:
+                continue
+            changed += int(member not in members or (ch and members[member] != score))
+            members[member] = score
+
+        return changed
+
+    async def zrem(self, name: str, member: str) -> int:
+        return int(self.sorted_sets.get(name, {}).pop(member, None) is not None)
+
+    async def zpopmin(self, name: str) -> list[tuple[bytes, float]]:
+        members = self.sorted_sets.get(name, {})
+
+        if not members:
+            return []
+
+        member = min(members, key=members.__getitem__)
+        return [(member.encode(), members.pop(member))]
+
+
+class FakePipeline:
+    """Queues commands of :class:`FakeRedis` and runs them on ``execute``."""
+
+    def __init__(self, redis: FakeRedis) -> None:
+        self._redis = redis
+        self._commands: list[Coroutine[Any, Any, Any]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        for command in self._commands:
+            command.close()
+
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        def queue(*args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+            self._commands.append(getattr(self._redis, name)(*args, **kwargs))
+
+        return queue
+
+    async def execute(self) -> list[Any]:
+        commands, self._commands = self._commands, []
+        return [await command for command in commands]
@@ -0,0 +1,94 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from prometheus_client import REGISTRY
+
+from pix_erase.infrastructure.http.provider import SHARED_POOL_NAME, get_httpx_client
+from pix_erase.setup.config.http import HttpClientConfig
+from tests.unit.factories.settings_data import create_http_client_settings_data
+
+HOST = "127.0.0.1"
+RESPONSE = b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok"
+
+
+class KeepAliveServer:
+    """Answers every request with ``ok`` and keeps connections open, counts accepted connections."""
+
+    def __init__(self) -> None:
+        self.connections = 0
+        self.port = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while await reader.readuntil(b"\r\n\r\n"):
+                writer.write(RESPONSE)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+@asynccontextmanager
+async def _server() -> AsyncIterator[KeepAliveServer]:
+    keep_alive_server = KeepAliveServer()
+    asyncio_server = await asyncio.start_server(keep_alive_server.handle, HOST, 0)
+    keep_alive_server.port = asyncio_server.sockets[0].getsockname()[1]
+    async with asyncio_server:
+        yield keep_alive_server
+
+
+def _requests(pool: str, connection: str) -> float:
+    return REGISTRY.get_sample_value("http_client_pool_requests_total", {"pool": pool, "connection": connection}) or 0
+
+
+async def test_repeated_requests_reuse_connection() -> None:
+    async with _server() as server:
+        # Arrange
+        config = HttpClientConfig.model_validate(
+            {**create_http_client_settings_data(), "DEFAULT_HTTP_DEDICATED_POOL_HOSTS": ""},
+        )
+        reused_before = _requests(SHARED_POOL_NAME, "reused")
+
+        # Act
+        async for client in get_httpx_client(config):
+            for _ in range(3):
+                await client.get(f"http://{HOST}:{server.port}/")
+
+        # Assert
+        assert server.connections == 1
+        assert _requests(SHARED_POOL_NAME, "reused") - reused_before == 2
+
+
+async def test_dedicated_host_has_own_pool() -> None:
+    async with _server() as server:
+        # Arrange
+        config = HttpClientConfig.model_validate(
+            {**create_http_client_settings_data(), "DEFAULT_HTTP_DEDICATED_POOL_HOSTS": f"{HOST}, example.com"},
+        )
+        new_before = _requests(HOST, "new")
+        shared_before = _requests(SHARED_POOL_NAME, "new") + _requests(SHARED_POOL_NAME, "reused")
+
+        # Act
+        async for client in get_httpx_client(config):
+            await client.get(f"http://{HOST}:{server.port}/")
+
+        # Assert
+        assert config.dedicated_pool_hosts == [HOST, "example.com"]
+        assert _requests(HOST, "new") - new_before == 1
+        assert _requests(SHARED_POOL_NAME, "new") + _requests(SHARED_POOL_NAME, "reused") == shared_before
+
+
+async def test_pool_reports_idle_connections() -> None:
+    async with _server() as server:
+        config = HttpClientConfig.model_validate(
+            {**create_http_client_settings_data(), "DEFAULT_HTTP_DEDICATED_POOL_HOSTS": HOST},
+        )
+
+        async for client in get_httpx_client(config):
+            await client.get(f"http://{HOST}:{server.port}/")
+
+            assert REGISTRY.get_sample_value("http_client_pool_connections", {"pool": HOST, "state": "idle"}) == 1
+            assert REGISTRY.get_sample_value("http_client_pool_connections", {"pool": HOST, "state": "active"}) == 0
@@ -0,0 +1,121 @@
+from typing import TYPE_CHECKING, Any, cast
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from taskiq.depends.progress_tracker import TaskProgress, TaskState
+
+from pix_erase.application.common.ports.scheduler.payloads.images import IndexImagePayload
+from pix_erase.application.common.ports.scheduler.task_id import TaskBatchID, TaskID, TaskInfoStatus
+from pix_erase.domain.image.values.image_id import ImageID
+from pix_erase.infrastructure.scheduler.task_iq_task_scheduler import TaskIQTaskScheduler
+from tests.unit.factories.value_objects import create_user_id
+from tests.unit.infrastructure.fakes import FakeRedis
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+    from taskiq import AsyncBroker, ScheduleSource
+
+BATCH_ID = TaskBatchID("process_images_batch:1")
+FIRST = TaskID("index_image:1")
+SECOND = TaskID("index_image:2")
+THIRD = TaskID("index_image:3")
+OWNER_ID = create_user_id()
+
+
+class FakeBroker:
+    def __init__(self) -> None:
+        self.kiq = AsyncMock()
+        self.progress: dict[str, TaskProgress[Any]] = {}
+        self.result_backend = Mock(get_progress=AsyncMock(side_effect=self.progress.get))
+
+        task = Mock()
+        task.kicker.return_value.with_task_id.return_value.kiq = self.kiq
+        self.tasks = {"index_image": task}
+
+    def get_all_tasks(self) -> dict[str, Any]:
+        return self.tasks
+
+
+@pytest.fixture
+def broker() -> FakeBroker:
+    return FakeBroker()
+
+
+@pytest.fixture
+def redis() -> FakeRedis:
+    return FakeRedis()
+
+
+@pytest.fixture
+def scheduler(broker: FakeBroker, redis: FakeRedis) -> TaskIQTaskScheduler:
+    return TaskIQTaskScheduler(
+        broker=cast("AsyncBroker", broker),
+        schedule_source=cast("ScheduleSource", Mock()),
+        redis=cast("Redis", redis),
+    )
+
+
+def _payload() -> IndexImagePayload:
+    return IndexImagePayload(image_id=ImageID(uuid4()))
+
+
+@pytest.mark.asyncio
+async def test_schedule_batch_sends_every_task(scheduler: TaskIQTaskScheduler, broker: FakeBroker) -> None:
+    # Act
+    await scheduler.schedule_batch(BATCH_ID, {FIRST: _payload(), SECOND: _payload()}, OWNER_ID)
+
+    # Assert
+    assert broker.kiq.await_count == 2
+    batch = await scheduler.read_batch_info(BATCH_ID)
+    assert batch is not None
+    assert batch.owner_id == OWNER_ID
+    assert [task.task_id for task in batch.tasks] == [FIRST, SECOND]
+    assert {task.status for task in batch.tasks} == {TaskInfoStatus.QUEUED}
+
+
+@pytest.mark.asyncio
+async def test_read_batch_info_keeps_finished_tasks(scheduler: TaskIQTaskScheduler, broker: FakeBroker) -> None:
+    # Arrange
+    await scheduler.schedule_batch(BATCH_ID, {FIRST: _payload(), SECOND: _payload(), THIRD: _payload()}, OWNER_ID)
+    broker.progress[FIRST] = TaskProgress(state=TaskState.SUCCESS, meta="done")
+    broker.progress[SECOND] = TaskProgress(state=TaskState.STARTED, meta="working")
+    await scheduler.read_batch_info(BATCH_ID)
+
+    # results of finished tasks expire before the batch
+    broker.progress.clear()
+
+    # Act
+    batch = await scheduler.read_batch_info(BATCH_ID)
+
+    # Assert
+    assert batch is not None
+    assert [(task.status, task.description) for task in batch.tasks] == [
+        (TaskInfoStatus.SUCCESS, "done"),
+        (TaskInfoStatus.QUEUED, "Waiting for a worker"),
+        (TaskInfoStatus.QUEUED, "Waiting for a worker"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_read_batch_info_of_unknown_batch(scheduler: TaskIQTaskScheduler) -> None:
+    assert await scheduler.read_batch_info(BATCH_ID) is None
+
+
+@pytest.mark.asyncio
+async def test_schedule_batch_fails_on_unknown_task(scheduler: TaskIQTaskScheduler, broker: FakeBroker) -> None:
+    with pytest.raises(ValueError, match="No task registered"):
+        await scheduler.schedule_batch(BATCH_ID, {TaskID("unknown:1"): _payload()}, OWNER_ID)
+
+    broker.kiq.assert_not_awaited()
+    assert await scheduler.read_batch_info(BATCH_ID) is None
+
+
+@pytest.mark.asyncio
+async def test_read_batch_info_without_owner(scheduler: TaskIQTaskScheduler, redis: FakeRedis) -> None:
+    # Arrange
+    await scheduler.schedule_batch(BATCH_ID, {FIRST: _payload()}, OWNER_ID)
+    await redis.delete(f"task_batch:{BATCH_ID}:owner")
+
+    # Act / Assert
+    assert await scheduler.read_batch_info(BATCH_ID) is None
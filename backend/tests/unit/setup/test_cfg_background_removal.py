@@ -0,0 +1,56 @@
+import pytest
+from pydantic import ValidationError
+
+from pix_erase.setup.config.background_removal import BackgroundRemovalConfig
+from tests.unit.factories.settings_data import create_background_removal_settings_data
+
+
+@pytest.mark.parametrize(
+    ("preload_models", "expected"),
+    [
+        pytest.param("", (), id="empty_env"),
+        pytest.param("u2netp", ("u2netp",), id="single_env"),
+        pytest.param("u2net, silueta", ("u2net", "silueta"), id="comma_separated_env"),
+        pytest.param(("silueta",), ("silueta",), id="tuple"),
+    ],
+)
+def test_background_removal_preload_models_accepts_correct_value(
+    preload_models: str | tuple[str, ...],
+    expected: tuple[str, ...],
+) -> None:
+    # Arrange
+    data = create_background_removal_settings_data(preload_models=preload_models)
+
+    # Act
+    config = BackgroundRemovalConfig.model_validate(data)
+
+    # Assert
+    assert config.preload_models == expected
+
+
+@pytest.mark.parametrize(
+    ("default_model", "preload_models", "intra_op_threads", "inter_op_threads"),
+    [
+        pytest.param("sam", (), None, None, id="unknown_default_model"),
+        pytest.param("u2net", "u2net,isnet", None, None, id="unknown_preload_model"),
+        pytest.param("u2net", (), 0, None, id="no_intra_op_threads"),
+        pytest.param("u2net", (), None, 0, id="no_inter_op_threads"),
+    ],
+)
+def test_background_removal_rejects_incorrect_value(
+    default_model: str,
+    preload_models: str | tuple[str, ...],
+    intra_op_threads: int | None,
+    inter_op_threads: int | None,
+) -> None:
+    # Arrange
+    data = create_background_removal_settings_data(
+        default_model=default_model,
+        preload_models=preload_models,
+        intra_op_threads=intra_op_threads,
+        inter_op_threads=inter_op_threads,
+    )
+
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        BackgroundRemovalConfig.model_validate(data)
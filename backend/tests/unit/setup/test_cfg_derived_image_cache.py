@@ -0,0 +1,34 @@
+import pytest
+from pydantic import ValidationError
+
+from pix_erase.setup.config.derived_image_cache import DerivedImageCacheConfig
+from tests.unit.factories.settings_data import create_derived_image_cache_settings_data
+
+
+@pytest.mark.parametrize(
+    ("enabled", "max_size_mb"),
+    [
+        pytest.param(True, 1, id="min_size"),
+        pytest.param(False, 2048, id="disabled"),
+    ],
+)
+def test_derived_image_cache_accepts_correct_value(enabled: bool, max_size_mb: int) -> None:
+    # Arrange
+    data = create_derived_image_cache_settings_data(enabled=enabled, max_size_mb=max_size_mb)
+
+    # Act
+    config = DerivedImageCacheConfig.model_validate(data)
+
+    # Assert
+    assert config.enabled is enabled
+    assert config.max_size_mb == max_size_mb
+
+
+@pytest.mark.parametrize("max_size_mb", [0, -1])
+def test_derived_image_cache_rejects_incorrect_size(max_size_mb: int) -> None:
+    # Arrange
+    data = create_derived_image_cache_settings_data(max_size_mb=max_size_mb)
+
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        DerivedImageCacheConfig.model_validate(data)
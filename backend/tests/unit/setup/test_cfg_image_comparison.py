@@ -0,0 +1,59 @@
+import pytest
+from pydantic import ValidationError
+
+from pix_erase.setup.config.image_comparison import ImageComparisonConfig
+from tests.unit.factories.settings_data import create_image_comparison_settings_data
+
+
+@pytest.mark.parametrize("max_side", [64, 1024, 4096])
+def test_image_comparison_accepts_correct_value(max_side: int) -> None:
+    # Arrange
+    data = create_image_comparison_settings_data(max_side=max_side)
+
+    # Act
+    config = ImageComparisonConfig.model_validate(data)
+
+    # Assert
+    assert config.working_max_side == max_side
+
+
+@pytest.mark.parametrize("max_side", [0, 63, -1])
+def test_image_comparison_rejects_incorrect_value(max_side: int) -> None:
+    # Arrange
+    data = create_image_comparison_settings_data(max_side=max_side)
+
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        ImageComparisonConfig.model_validate(data)
+
+
+@pytest.mark.parametrize("feature_side", [32, 128, 512])
+def test_image_comparison_accepts_correct_feature_side(feature_side: int) -> None:
+    # Arrange
+    data = create_image_comparison_settings_data(feature_side=feature_side)
+
+    # Act
+    config = ImageComparisonConfig.model_validate(data)
+
+    # Assert
+    assert config.feature_side == feature_side
+
+
+@pytest.mark.parametrize("feature_side", [0, 31, 513])
+def test_image_comparison_rejects_incorrect_feature_side(feature_side: int) -> None:
+    # Arrange
+    data = create_image_comparison_settings_data(feature_side=feature_side)
+
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        ImageComparisonConfig.model_validate(data)
+
+
+@pytest.mark.parametrize("feature_cache_ttl_seconds", [0, -1])
+def test_image_comparison_rejects_incorrect_feature_cache_ttl(feature_cache_ttl_seconds: int) -> None:
+    # Arrange
+    data = create_image_comparison_settings_data(feature_cache_ttl_seconds=feature_cache_ttl_seconds)
+
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        ImageComparisonConfig.model_validate(data)
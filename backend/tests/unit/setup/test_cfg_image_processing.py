@@ -0,0 +1,96 @@
+import pytest
+from pydantic import ValidationError
+
+from pix_erase.setup.config.image_processing import (
+    MAX_TASKS_PER_CHILD_MIN,
+    POOL_SIZE_MIN,
+    THREADS_PER_PROCESS_MIN,
+    ImageProcessingConfig,
+)
+from tests.unit.factories.settings_data import create_image_processing_settings_data
+
+
+@pytest.mark.parametrize(
+    "pool_size",
+    [
+        pytest.param(None, id="derived_from_cpu"),
+        pytest.param(POOL_SIZE_MIN, id="lower_bound"),
+        pytest.param(16, id="large"),
+    ],
+)
+def test_image_processing_pool_size_accepts_correct_value(pool_size: int | None) -> None:
+    # Arrange
+    data = create_image_processing_settings_data(pool_size=pool_size)
+
+    # Act & Assert
+    ImageProcessingConfig.model_validate(data)
+
+
+@pytest.mark.parametrize(
+    "pool_size",
+    [
+        pytest.param(POOL_SIZE_MIN - 1, id="too_small"),
+        pytest.param(-1, id="negative"),
+    ],
+)
+def test_image_processing_pool_size_rejects_incorrect_value(pool_size: int) -> None:
+    # Arrange
+    data = create_image_processing_settings_data(pool_size=pool_size)
+
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        ImageProcessingConfig.model_validate(data)
+
+
+@pytest.mark.parametrize(
+    "threads_per_process",
+    [
+        pytest.param(THREADS_PER_PROCESS_MIN - 1, id="too_small"),
+        pytest.param(-1, id="negative"),
+    ],
+)
+def test_image_processing_threads_per_process_rejects_incorrect_value(threads_per_process: int) -> None:
+    # Arrange
+    data = create_image_processing_settings_data(threads_per_process=threads_per_process)
+
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        ImageProcessingConfig.model_validate(data)
+
+
+@pytest.mark.parametrize(
+    "max_tasks_per_child",
+    [
+        pytest.param(MAX_TASKS_PER_CHILD_MIN - 1, id="too_small"),
+        pytest.param(-1, id="negative"),
+    ],
+)
+def test_image_processing_max_tasks_per_child_rejects_incorrect_value(max_tasks_per_child: int) -> None:
+    # Arrange
+    data = create_image_processing_settings_data(max_tasks_per_child=max_tasks_per_child)
+
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        ImageProcessingConfig.model_validate(data)
+
+
+def test_image_processing_workers_prefers_explicit_pool_size() -> None:
+    # Arrange
+    data = create_image_processing_settings_data(pool_size=3, threads_per_process=4)
+
+    # Act
+    config = ImageProcessingConfig.model_validate(data)
+
+    # Assert
+    assert config.workers == 3
+
+
+def test_image_processing_workers_never_below_one_process() -> None:
+    # Arrange
+    data = create_image_processing_settings_data(threads_per_process=10_000)
+
+    # Act
+    config = ImageProcessingConfig.model_validate(data)
+
+    # Assert
+    assert config.workers == POOL_SIZE_MIN
@@ -0,0 +1,43 @@
+import pytest
+from pydantic import ValidationError
+
+from pix_erase.setup.config.image_renditions import ImageRenditionConfig
+from tests.unit.factories.settings_data import create_image_rendition_settings_data
+
+
+@pytest.mark.parametrize(
+    ("sizes", "expected"),
+    [
+        pytest.param("128,512,1024", (128, 512, 1024), id="comma_separated_env"),
+        pytest.param("1024, 128,128", (128, 1024), id="unsorted_env_with_duplicates"),
+        pytest.param((256,), (256,), id="tuple"),
+    ],
+)
+def test_image_renditions_sizes_accepts_correct_value(sizes: str | tuple[int, ...], expected: tuple[int, ...]) -> None:
+    # Arrange
+    data = create_image_rendition_settings_data(sizes=sizes)
+
+    # Act
+    config = ImageRenditionConfig.model_validate(data)
+
+    # Assert
+    assert config.sizes == expected
+
+
+@pytest.mark.parametrize(
+    ("sizes", "quality"),
+    [
+        pytest.param("", 80, id="no_sizes"),
+        pytest.param("8,128", 80, id="too_small_size"),
+        pytest.param("128,big", 80, id="not_a_number"),
+        pytest.param("128", 0, id="quality_too_low"),
+        pytest.param("128", 101, id="quality_too_high"),
+    ],
+)
+def test_image_renditions_rejects_incorrect_value(sizes: str, quality: int) -> None:
+    # Arrange
+    data = create_image_rendition_settings_data(sizes=sizes, quality=quality)
+
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        ImageRenditionConfig.model_validate(data)
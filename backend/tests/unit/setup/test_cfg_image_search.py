@@ -0,0 +1,32 @@
+import pytest
+from pydantic import ValidationError
+
+from pix_erase.setup.config.image_search import ImageSearchConfig
+from tests.unit.factories.settings_data import create_image_search_settings_data
+
+
+def test_image_search_accepts_correct_values() -> None:
+    # Arrange
+    data = create_image_search_settings_data(refresh_interval_seconds=0, rebuild_interval_seconds=60, batch_size=100)
+
+    # Act
+    config = ImageSearchConfig.model_validate(data)
+
+    # Assert
+    assert config.refresh_interval_seconds == 0
+    assert config.rebuild_interval_seconds == 60
+    assert config.batch_size == 100
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        create_image_search_settings_data(refresh_interval_seconds=-1),
+        create_image_search_settings_data(rebuild_interval_seconds=59),
+        create_image_search_settings_data(batch_size=99),
+    ],
+)
+def test_image_search_rejects_incorrect_values(data: dict[str, float]) -> None:
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        ImageSearchConfig.model_validate(data)
@@ -2,7 +2,17 @@ import pytest
 from pydantic import ValidationError
 
 from pix_erase.setup.config.database import PORT_MAX, PORT_MIN
-from pix_erase.setup.config.s3 import S3Config
+from pix_erase.setup.config.s3 import (
+    MAX_ATTEMPTS_MAX,
+    MAX_ATTEMPTS_MIN,
+    MAX_POOL_CONNECTIONS_MAX,
+    MAX_POOL_CONNECTIONS_MIN,
+    MULTIPART_PART_SIZE_MAX_MB,
+    MULTIPART_PART_SIZE_MIN_MB,
+    PRESIGNED_URL_EXPIRES_MAX_SECONDS,
+    PRESIGNED_URL_EXPIRES_MIN_SECONDS,
+    S3Config,
+)
 from tests.unit.factories.settings_data import create_s3_settings_data
 
 
@@ -38,3 +48,85 @@ def test_s3_port_rejects_incorrect_value(port: int) -> None:
     # Act & Assert
     with pytest.raises(ValidationError):
         S3Config.model_validate(data)
+
+
+@pytest.mark.parametrize(
+    "part_size_mb",
+    [
+        pytest.param(MULTIPART_PART_SIZE_MIN_MB, id="lower_bound"),
+        pytest.param(MULTIPART_PART_SIZE_MAX_MB, id="upper_bound"),
+    ],
+)
+def test_s3_multipart_part_size_accepts_correct_value(part_size_mb: int) -> None:
+    # Arrange
+    data = create_s3_settings_data(multipart_part_size_mb=part_size_mb)
+
+    # Act
+    config = S3Config.model_validate(data)
+
+    # Assert
+    assert config.multipart_part_size == part_size_mb * 1024 * 1024
+
+
+@pytest.mark.parametrize(
+    "part_size_mb",
+    [
+        pytest.param(MULTIPART_PART_SIZE_MIN_MB - 1, id="smaller_than_s3_allows"),
+        pytest.param(MULTIPART_PART_SIZE_MAX_MB + 1, id="bigger_than_s3_allows"),
+    ],
+)
+def test_s3_multipart_part_size_rejects_incorrect_value(part_size_mb: int) -> None:
+    # Arrange
+    data = create_s3_settings_data(multipart_part_size_mb=part_size_mb)
+
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        S3Config.model_validate(data)
+
+
+@pytest.mark.parametrize(
+    "expires_seconds",
+    [
+        pytest.param(PRESIGNED_URL_EXPIRES_MIN_SECONDS - 1, id="expired_at_once"),
+        pytest.param(PRESIGNED_URL_EXPIRES_MAX_SECONDS + 1, id="longer_than_s3_allows"),
+    ],
+)
+def test_s3_presigned_url_expiration_rejects_incorrect_value(expires_seconds: int) -> None:
+    # Arrange
+    data = create_s3_settings_data(presigned_url_expires_seconds=expires_seconds)
+
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        S3Config.model_validate(data)
+
+
+@pytest.mark.parametrize(
+    "max_pool_connections",
+    [
+        pytest.param(MAX_POOL_CONNECTIONS_MIN - 1, id="no_connections"),
+        pytest.param(MAX_POOL_CONNECTIONS_MAX + 1, id="too_many"),
+    ],
+)
+def test_s3_max_pool_connections_rejects_incorrect_value(max_pool_connections: int) -> None:
+    # Arrange
+    data = {**create_s3_settings_data(), "S3_MAX_POOL_CONNECTIONS": max_pool_connections}
+
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        S3Config.model_validate(data)
+
+
+@pytest.mark.parametrize(
+    "max_attempts",
+    [
+        pytest.param(MAX_ATTEMPTS_MIN - 1, id="no_attempts"),
+        pytest.param(MAX_ATTEMPTS_MAX + 1, id="too_many"),
+    ],
+)
+def test_s3_max_attempts_rejects_incorrect_value(max_attempts: int) -> None:
+    # Arrange
+    data = {**create_s3_settings_data(), "S3_MAX_ATTEMPTS": max_attempts}
+
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        S3Config.model_validate(data)
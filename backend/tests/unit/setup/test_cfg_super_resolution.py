@@ -0,0 +1,74 @@
+import pytest
+from pydantic import ValidationError
+
+from pix_erase.setup.config.super_resolution import SuperResolutionConfig
+from tests.unit.factories.settings_data import create_super_resolution_settings_data
+
+
+@pytest.mark.parametrize(
+    ("preload_scales", "expected"),
+    [
+        pytest.param("", (), id="empty_env"),
+        pytest.param("2", (2,), id="single_env"),
+        pytest.param("2, 3,4", (2, 3, 4), id="comma_separated_env"),
+        pytest.param((4, 2), (4, 2), id="tuple"),
+    ],
+)
+def test_super_resolution_preload_scales_accepts_correct_value(
+    preload_scales: str | tuple[int, ...],
+    expected: tuple[int, ...],
+) -> None:
+    # Arrange
+    data = create_super_resolution_settings_data(preload_scales=preload_scales)
+
+    # Act
+    config = SuperResolutionConfig.model_validate(data)
+
+    # Assert
+    assert config.preload_scales == expected
+
+
+@pytest.mark.parametrize(
+    "preload_scales",
+    [
+        pytest.param("1", id="too_small"),
+        pytest.param("2,8", id="too_big"),
+        pytest.param("x2", id="not_a_number"),
+    ],
+)
+def test_super_resolution_preload_scales_rejects_incorrect_value(preload_scales: str) -> None:
+    # Arrange
+    data = create_super_resolution_settings_data(preload_scales=preload_scales)
+
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        SuperResolutionConfig.model_validate(data)
+
+
+@pytest.mark.parametrize(
+    ("tile_size", "tile_overlap", "tile_workers", "job_memory_limit_mb"),
+    [
+        pytest.param(31, 4, 2, 2048, id="tile_too_small"),
+        pytest.param(64, 32, 2, 2048, id="overlap_too_big"),
+        pytest.param(64, -1, 2, 2048, id="negative_overlap"),
+        pytest.param(64, 8, 0, 2048, id="no_workers"),
+        pytest.param(64, 8, 2, 63, id="memory_limit_too_small"),
+    ],
+)
+def test_super_resolution_tiling_rejects_incorrect_value(
+    tile_size: int,
+    tile_overlap: int,
+    tile_workers: int,
+    job_memory_limit_mb: int,
+) -> None:
+    # Arrange
+    data = create_super_resolution_settings_data(
+        tile_size=tile_size,
+        tile_overlap=tile_overlap,
+        tile_workers=tile_workers,
+        job_memory_limit_mb=job_memory_limit_mb,
+    )
+
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        SuperResolutionConfig.model_validate(data)
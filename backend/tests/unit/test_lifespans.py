@@ -1,7 +1,9 @@
 from unittest import mock
 
-from pix_erase.infrastructure.persistence.provider import get_engine
+from pix_erase.infrastructure.persistence.provider import get_engine, get_s3_client
+from pix_erase.setup.config.s3 import S3Config
 from pix_erase.web import lifespan
+from tests.unit.factories.settings_data import create_s3_settings_data
 
 
 @mock.patch("pix_erase.infrastructure.persistence.provider.create_async_engine")
@@ -16,6 +18,21 @@ async def test_engine(fake_create_async_engine: mock.Mock) -> None:
     fake_create_async_engine.return_value.dispose.assert_called_once()
 
 
+async def test_s3_client() -> None:
+    fake_session = mock.MagicMock()
+    s3_config = S3Config.model_validate(
+        {**create_s3_settings_data(), "S3_MAX_POOL_CONNECTIONS": 7, "S3_MAX_ATTEMPTS": 2},
+    )
+
+    async for _ in get_s3_client(fake_session, s3_config):
+        pass
+
+    config = fake_session.client.call_args.kwargs["config"]
+    assert config.max_pool_connections == 7
+    assert config.retries == {"total_max_attempts": 2, "mode": "standard"}
+    fake_session.client.return_value.__aexit__.assert_called_once()
+
+
 async def test_lifespan() -> None:
     fake_app = mock.Mock()
     fake_app.state.dishka_container.close = mock.AsyncMock()